@@ -0,0 +1,132 @@
+"""Benchmark: stdlib JSON provider vs. FastJSONProvider on get_reports payloads
+
+Usage:
+    python benchmarks/json_provider.py [--sizes 1000 10000] [--repeat 5]
+
+Creates a temporary SQLite database, imports synthetic reports and measures
+for each payload size:
+  - serialize: building the response from prebuilt ``to_dict()`` payloads
+  - endpoint:  a full ``GET /api/reports`` request through the test client
+
+The stdlib baseline writes datetimes as ISO 8601 like the API did before
+orjson; the run stops if the two providers produce different JSON.
+"""
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def build_app(database_path):
+    os.environ['DATABASE_URL'] = f'sqlite:///{database_path}'
+    from src.main import app, create_default_users
+    from src import db
+    from src.models.customer import Customer
+    with app.app_context():
+        db.create_all()
+        create_default_users()
+        db.session.add(Customer(company_name='Benchmark GmbH'))
+        db.session.commit()
+    return app
+
+def login(client):
+    response = client.post('/api/auth/login', json={'username': 'admin', 'password': 'admin123'})
+    if response.status_code != 200:
+        raise RuntimeError(f'Login failed ({response.status_code}): {response.get_data(as_text=True)[:200]}')
+    return {'Authorization': f"Bearer {response.get_json()['access_token']}"}
+
+def iso_json_provider(app):
+    """Stdlib provider writing datetimes as ISO 8601, like the API before orjson"""
+    from datetime import date
+    from flask.json.provider import DefaultJSONProvider
+
+    class IsoJSONProvider(DefaultJSONProvider):
+        @staticmethod
+        def default(o):
+            if isinstance(o, date):
+                return o.isoformat()
+            return DefaultJSONProvider.default(o)
+
+    return IsoJSONProvider(app)
+
+def synthetic_rows(count, seed=42):
+    rng = random.Random(seed)
+    for row_number in range(1, count + 1):
+        thickness = rng.choice([17, 20, 23, 25, 30])
+        yield row_number, {
+            'customer_id': 1,
+            'user_id': 1,
+            'author': 'Benchmark',
+            'title': f'Prüfbericht {row_number}',
+            'production_site': 'Werk Nord',
+            'film_type': 'Stretchfolie',
+            'film_thickness': thickness,
+            'max_prestretch': 300,
+            'film_consumption_per_pallet': rng.uniform(200, 600),
+            'pallets_per_year': rng.randint(1000, 100000),
+            'roll_core_weight': 1.2,
+            'windings_top': 3, 'windings_middle': 2, 'windings_bottom': 3,
+            'prestretch_actual': rng.uniform(100, 250),
+            **{f'holding_force_{side}_{kind}': rng.uniform(20, 60)
+               for side in ('long_top', 'long_bottom', 'short_top', 'short_bottom')
+               for kind in ('target', 'actual')},
+            'alternatives': [
+                {'film_thickness': thickness - 6, 'prestretch': 280, 'pallet_stability': 'Gut'},
+                {'film_thickness': thickness - 3, 'prestretch': 250, 'pallet_stability': 'Sehr gut'},
+            ],
+            'conclusion_text': 'Die Alternative reduziert den Folienverbrauch deutlich. ' * 3,
+        }
+
+def timed(func, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        app = build_app(os.path.join(directory, 'benchmark.db'))
+        from src.models.report import Report
+        from src.utils.json_provider import FastJSONProvider, orjson
+        from src.utils.report_import import import_reports
+
+        providers = {'stdlib': iso_json_provider(app), 'fast': FastJSONProvider(app)}
+        if orjson is None:
+            print('orjson is not installed: "fast" falls back to the stdlib')
+
+        imported = 0
+        print(f"{'reports':>8} {'provider':>8} {'serialize ms':>13} {'endpoint ms':>12} {'bytes':>11}")
+        for size in sorted(args.sizes):
+            with app.app_context():
+                import_reports(synthetic_rows(size - imported, seed=size))
+                imported = size
+                payload = [report.to_dict() for report in Report.query.order_by(Report.created_at.desc()).all()]
+                # Like for like: both providers must produce the same document
+                documents = [json.loads(provider.response(payload).get_data()) for provider in providers.values()]
+                if any(document != documents[0] for document in documents[1:]):
+                    raise SystemExit(f'Providers produce different JSON for {size} reports')
+
+            for name, provider in providers.items():
+                app.json = provider
+                with app.app_context():
+                    serialize = timed(lambda: provider.response(payload).get_data(), args.repeat)
+                    body = provider.response(payload).get_data()
+                client = app.test_client()
+                headers = login(client)
+                endpoint = timed(lambda: client.get('/api/api/reports', headers=headers).get_data(), args.repeat)
+                print(f'{size:>8} {name:>8} {serialize:>13.1f} {endpoint:>12.1f} {len(body):>11}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,283 @@
+"""Load-test driver: replays a realistic request mix against a running server
+
+Usage:
+    python benchmarks/loadtest/run.py --manifest loadtest-manifest.json \\
+        [--base-url http://127.0.0.1:5000] [--concurrency 1 8 32] [--duration 60] \\
+        [--output baseline.json] [--compare previous.json] [--start-server]
+
+Each concurrency level runs for ``--duration`` seconds after a ``--warmup``
+phase that is not measured. Every client thread logs in once with the
+credentials from the manifest written by ``seed.py`` and then sends requests
+back to back, picking the operation by weight (see ``OPERATIONS``).
+
+The result is a JSON baseline with throughput, p50/p95/p99/max latency and
+status codes per endpoint and level. With ``--compare`` the latencies are
+printed next to an earlier baseline. ``--start-server`` starts gunicorn with
+``gunicorn.conf.py`` against the database from ``DATABASE_URL`` and stops it
+afterwards.
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from datetime import datetime, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# (name, weight) - list returns every report, so it is rare, just like in the UI
+OPERATIONS = (
+    ('list', 1),
+    ('search', 20),
+    ('detail', 40),
+    ('update', 15),
+    ('statistics', 20),
+    ('pdf', 4),
+)
+PERCENTILES = (50, 95, 99)
+REQUEST_TIMEOUT = 120
+
+class Client:
+    """One simulated user with its own token and random stream"""
+
+    def __init__(self, base_url, manifest, rng):
+        self.base_url = base_url.rstrip('/')
+        self.manifest = manifest
+        self.rng = rng
+        self.token = None
+        self.first_report, self.last_report = manifest['report_ids']
+        self.first_customer, self.last_customer = manifest['customer_ids']
+
+    def _open(self, method, path, body=None, headers=None):
+        data = json.dumps(body).encode('utf-8') if body is not None else None
+        request = urllib.request.Request(self.base_url + path, data=data, method=method)
+        request.add_header('Accept', 'application/json')
+        request.add_header('Accept-Encoding', 'gzip')
+        if data is not None:
+            request.add_header('Content-Type', 'application/json')
+        if self.token:
+            request.add_header('Authorization', f'Bearer {self.token}')
+        for name, value in (headers or {}).items():
+            request.add_header(name, value)
+        try:
+            with urllib.request.urlopen(request, timeout=REQUEST_TIMEOUT) as response:
+                payload = response.read()
+                return response.status, payload
+        except urllib.error.HTTPError as e:
+            return e.code, e.read()
+
+    def login(self):
+        status, payload = self._open('POST', '/api/auth/login', {
+            'username': self.manifest['username'],
+            'password': self.manifest['password']
+        })
+        if status != 200:
+            raise RuntimeError(f'Login failed ({status}): {payload[:200]!r}')
+        self.token = json.loads(payload)['access_token']
+
+    def _report_id(self):
+        return self.rng.randint(self.first_report, self.last_report)
+
+    def request(self, operation):
+        if operation == 'list':
+            return self._open('GET', '/api/api/reports')
+        if operation == 'search':
+            term = self.rng.choice(self.manifest['search_terms'])
+            customer_id = self.rng.randint(self.first_customer, self.last_customer)
+            return self._open('GET', f'/api/api/reports/search?q={urllib.parse.quote(term)}&customer_id={customer_id}')
+        if operation == 'detail':
+            return self._open('GET', f'/api/api/reports/{self._report_id()}')
+        if operation == 'update':
+            return self._open('PATCH', f'/api/api/reports/{self._report_id()}', {
+                'conclusion_text': f'Lasttest {self.rng.random():.6f}'
+            }, {'Prefer': 'return=minimal'})
+        if operation == 'statistics':
+            return self._open('GET', '/api/api/reports/statistics')
+        if operation == 'pdf':
+            return self._open('GET', f'/api/api/reports/{self._report_id()}/pdf')
+        raise ValueError(operation)
+
+    def timed(self, operation):
+        started = time.perf_counter()
+        status, _ = self.request(operation)
+        if status == 401:  # access token expired during a long run
+            self.login()
+            started = time.perf_counter()
+            status, _ = self.request(operation)
+        return status, time.perf_counter() - started
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(p / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+def summarize(samples, seconds):
+    endpoints = {}
+    for operation, entries in sorted(samples.items()):
+        latencies = sorted(latency for _, latency in entries)
+        statuses = {}
+        for status, _ in entries:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        errors = sum(count for status, count in statuses.items() if not status.startswith('2'))
+        endpoints[operation] = {
+            'requests': len(entries),
+            'throughput_rps': round(len(entries) / seconds, 2),
+            'errors': errors,
+            'statuses': statuses,
+            **{f'p{p}_ms': round(percentile(latencies, p) * 1000, 1) for p in PERCENTILES},
+            'max_ms': round(latencies[-1] * 1000, 1)
+        }
+    total = sum(len(entries) for entries in samples.values())
+    return {
+        'requests': total,
+        'throughput_rps': round(total / seconds, 2),
+        'errors': sum(endpoint['errors'] for endpoint in endpoints.values()),
+        'endpoints': endpoints
+    }
+
+def run_level(args, manifest, concurrency):
+    names = [name for name, weight in OPERATIONS if weight]
+    weights = [weight for _, weight in OPERATIONS if weight]
+
+    clients = [Client(args.base_url, manifest, random.Random(args.seed * 1000 + concurrency * 100 + i))
+               for i in range(concurrency)]
+    for client in clients:
+        client.login()
+
+    samples = {name: [] for name in names}
+    lock = threading.Lock()
+    measure_from = time.monotonic() + args.warmup
+    stop_at = measure_from + args.duration
+
+    def worker(client):
+        local = []
+        while True:
+            now = time.monotonic()
+            if now >= stop_at:
+                break
+            operation = client.rng.choices(names, weights)[0]
+            status, latency = client.timed(operation)
+            if now >= measure_from:  # counted by start time, slow requests included
+                local.append((operation, status, latency))
+        with lock:
+            for operation, status, latency in local:
+                samples[operation].append((status, latency))
+
+    threads = [threading.Thread(target=worker, args=(client,), daemon=True) for client in clients]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    return {'concurrency': concurrency, 'duration': args.duration,
+            **summarize({name: entries for name, entries in samples.items() if entries}, args.duration)}
+
+def print_level(level, previous=None):
+    print(f'\nconcurrency {level["concurrency"]}: {level["throughput_rps"]} req/s, '
+          f'{level["requests"]} requests, {level["errors"]} errors')
+    header = f'  {"endpoint":<12}{"req/s":>9}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}{"max ms":>10}{"errors":>8}'
+    if previous:
+        header += f'{"p95 before":>12}{"change":>9}'
+    print(header)
+    for name, endpoint in level['endpoints'].items():
+        line = (f'  {name:<12}{endpoint["throughput_rps"]:>9.1f}{endpoint["p50_ms"]:>10.1f}'
+                f'{endpoint["p95_ms"]:>10.1f}{endpoint["p99_ms"]:>10.1f}{endpoint["max_ms"]:>10.1f}'
+                f'{endpoint["errors"]:>8}')
+        before = (previous or {}).get('endpoints', {}).get(name)
+        if before:
+            change = (endpoint['p95_ms'] - before['p95_ms']) / before['p95_ms'] * 100 if before['p95_ms'] else 0
+            line += f'{before["p95_ms"]:>12.1f}{change:>+8.0f}%'
+        print(line)
+
+def wait_for_server(base_url, timeout=60):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(base_url.rstrip('/') + '/', timeout=2):
+                return
+        except urllib.error.HTTPError:
+            return  # the server answers
+        except OSError:
+            time.sleep(0.5)
+    raise RuntimeError(f'Server at {base_url} did not start within {timeout} s')
+
+def start_server(base_url):
+    host_port = base_url.split('://', 1)[-1].rstrip('/')
+    env = dict(os.environ, GUNICORN_BIND=host_port)
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'src.main:app'],
+        cwd=ROOT, env=env
+    )
+    try:
+        wait_for_server(base_url)
+    except RuntimeError:
+        process.terminate()
+        raise
+    return process
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--base-url', default='http://127.0.0.1:5000')
+    parser.add_argument('--manifest', default='loadtest-manifest.json')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--duration', type=float, default=60, help='measured seconds per level')
+    parser.add_argument('--warmup', type=float, default=5, help='unmeasured seconds before each level')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default='loadtest-baseline.json')
+    parser.add_argument('--compare', help='earlier baseline to compare against')
+    parser.add_argument('--start-server', action='store_true', help='start gunicorn for the run')
+    args = parser.parse_args()
+
+    with open(args.manifest, encoding='utf-8') as f:
+        manifest = json.load(f)
+    if not manifest.get('report_ids'):
+        raise SystemExit('The manifest has no reports, run seed.py first')
+
+    previous = {}
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = {level['concurrency']: level for level in json.load(f)['levels']}
+
+    server = start_server(args.base_url) if args.start_server else None
+    try:
+        levels = []
+        for concurrency in args.concurrency:
+            level = run_level(args, manifest, concurrency)
+            levels.append(level)
+            print_level(level, previous.get(concurrency))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=30)
+
+    baseline = {
+        'meta': {
+            'created_at': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+            'base_url': args.base_url,
+            'reports': manifest.get('reports'),
+            'operations': dict(OPERATIONS),
+            'duration': args.duration,
+            'warmup': args.warmup,
+            'seed': args.seed,
+            'python': platform.python_version(),
+            'host': platform.node(),
+            'cpus': os.cpu_count()
+        },
+        'levels': levels
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2)
+    print(f'\nBaseline written to {args.output}')
+
+if __name__ == '__main__':
+    main()
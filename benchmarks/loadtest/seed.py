@@ -0,0 +1,178 @@
+"""Seed a database with load-test data at scale
+
+Usage:
+    DATABASE_URL=sqlite:////tmp/loadtest.db python benchmarks/loadtest/seed.py \\
+        --users 50 --customers 2000 --reports 100000 [--manifest loadtest-manifest.json]
+
+Creates users (all with the password given by ``--password``), customers and
+reports with realistic alternatives, images, winding schemes and holding
+forces. Reports go through the regular bulk import
+(``src.utils.report_import``), so calculations, the statistics rollup and the
+change log are filled exactly as in production.
+
+Writes a manifest with the credentials and id ranges that ``run.py`` needs.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+FILM_TYPES = ['Stretchfolie', 'Vorgereckte Folie', 'Hochleistungsfolie', 'Nano-Stretchfolie']
+SUPPLIERS = ['Folienwerk Nord', 'StretchTec', 'PackPro', 'Polyfilm AG']
+ROBOTS = [('Lantech', 'Q-300'), ('Robopac', 'Robot S7'), ('Octopus', 'Compact'), ('Aetna', 'Ergo')]
+PALLET_TYPES = ['Europalette', 'Industriepalette', 'Düsseldorfer Palette']
+CONTENTS = ['Getränke', 'Baustoffe', 'Fensterprofile', 'Lebensmittel', 'Chemikalien', 'Papier']
+CITIES = ['Hamburg', 'München', 'Köln', 'Stuttgart', 'Leipzig', 'Bremen', 'Dortmund', 'Mannheim']
+STABILITY = ['Gut', 'Sehr gut', 'Ausreichend']
+STATUS_WEIGHTS = (('draft', 5), ('completed', 4), ('archived', 1))
+HOLDING_FORCE_SIDES = ('long_top', 'long_bottom', 'short_top', 'short_bottom')
+
+def seed_users(count, password):
+    from src import db
+    from src.models.user import User
+    from werkzeug.security import generate_password_hash
+
+    password_hash = generate_password_hash(password)  # einmal hashen, für alle Benutzer gleich
+    existing = {username for (username,) in db.session.query(User.username).filter(User.username.like('loadtest%'))}
+    rows = [{
+        'username': f'loadtest{i}',
+        'email': f'loadtest{i}@example.com',
+        'password_hash': password_hash,
+        'first_name': 'Lasttest',
+        'last_name': f'Test {i}',
+        'role': 'Admin' if i == 0 else ('Manager' if i % 10 == 0 else 'Auditor'),
+        'is_active': True
+    } for i in range(count) if f'loadtest{i}' not in existing]
+    if rows:
+        db.session.execute(User.__table__.insert(), rows)
+        db.session.commit()
+    return [user_id for (user_id,) in
+            db.session.query(User.id).filter(User.username.like('loadtest%')).order_by(User.id)]
+
+def seed_customers(count, rng):
+    from src import db
+    from src.models.customer import Customer
+
+    rows = [{
+        'company_name': f'Lasttest Kunde {i} GmbH',
+        'contact_person': f'Ansprechpartner {i}',
+        'email': f'kunde{i}@example.com',
+        'phone': f'+49 {rng.randint(100, 999)} {rng.randint(100000, 999999)}',
+        'city': rng.choice(CITIES),
+        'postal_code': f'{rng.randint(10000, 99999)}',
+        'street': f'Industriestraße {rng.randint(1, 200)}'
+    } for i in range(count)]
+    for start in range(0, len(rows), 1000):
+        db.session.execute(Customer.__table__.insert(), rows[start:start + 1000])
+    db.session.commit()
+    return [customer_id for (customer_id,) in
+            db.session.query(Customer.id).filter(Customer.company_name.like('Lasttest Kunde %')).order_by(Customer.id)]
+
+def synthetic_report(rng, row_number, customer_ids, user_ids):
+    thickness = rng.choice([15, 17, 20, 23, 25, 30])
+    robot_manufacturer, robot_model = rng.choice(ROBOTS)
+    windings = [rng.randint(1, 4) for _ in range(3)]
+    data = {
+        'customer_id': rng.choice(customer_ids),
+        'user_id': rng.choice(user_ids),
+        'author': f'Prüfer {rng.randint(1, 40)}',
+        'title': f'Prüfbericht {rng.choice(CONTENTS)} {row_number}',
+        'status': rng.choices([s for s, _ in STATUS_WEIGHTS], [w for _, w in STATUS_WEIGHTS])[0],
+        'production_site': f'Werk {rng.choice(CITIES)}',
+        'robot_manufacturer': robot_manufacturer,
+        'robot_model': robot_model,
+        'film_type': rng.choice(FILM_TYPES),
+        'film_supplier': rng.choice(SUPPLIERS),
+        'film_thickness': thickness,
+        'max_prestretch': rng.choice([200, 250, 300]),
+        'film_consumption_per_pallet': round(rng.uniform(150, 650), 1),
+        'pallets_per_year': rng.randint(1000, 150000),
+        'roll_core_weight': rng.choice([0.8, 1.0, 1.2, 1.5]),
+        'pallet_type': rng.choice(PALLET_TYPES),
+        'pallet_dimensions': '1200 x 800 x 1500 mm',
+        'pallet_content': rng.choice(CONTENTS),
+        'gross_weight': round(rng.uniform(200, 1200), 0),
+        'windings_top': windings[0],
+        'windings_middle': windings[1],
+        'windings_bottom': windings[2],
+        'prestretch_actual': round(rng.uniform(80, 280), 0),
+        'eu_directive_compliant': rng.random() < 0.7,
+        'certificate_required': rng.random() < 0.3,
+        'alternatives': [{
+            'film_thickness': thickness - step,
+            'prestretch': rng.choice([250, 280, 300]),
+            'pallet_stability': rng.choice(STABILITY),
+            'supplier': rng.choice(SUPPLIERS)
+        } for step in rng.sample([3, 5, 6, 8], rng.randint(1, 3))],
+        'images': [{
+            'filename': f'loadtest/palette_{row_number}_{i}.jpg',
+            'description': f'Palette {i + 1} nach dem Wickeln'
+        } for i in range(rng.randint(0, 4))],
+        'conclusion_text': 'Die Alternative reduziert den Folienverbrauch bei gleicher Ladungssicherung. ' * rng.randint(1, 4),
+        'recommendations_text': 'Vordehnung erhöhen und Wickelschema im Kopfbereich anpassen.',
+        'training_required': rng.random() < 0.4,
+        'follow_up_required': rng.random() < 0.5
+    }
+    for side in HOLDING_FORCE_SIDES:
+        target = round(rng.uniform(25, 60), 1)
+        data[f'holding_force_{side}_target'] = target
+        data[f'holding_force_{side}_actual'] = round(target * rng.uniform(0.75, 1.3), 1)
+    return data
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--users', type=int, default=50)
+    parser.add_argument('--customers', type=int, default=2000)
+    parser.add_argument('--reports', type=int, default=100000)
+    parser.add_argument('--chunk-size', type=int, default=1000)
+    parser.add_argument('--password', default='loadtest')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--manifest', default='loadtest-manifest.json')
+    args = parser.parse_args()
+
+    from src.main import app
+    from src import db
+    from src.utils.report_import import import_reports
+
+    rng = random.Random(args.seed)
+    with app.app_context():
+        db.create_all()
+
+        started = time.perf_counter()
+        user_ids = seed_users(max(args.users, 1), args.password)
+        customer_ids = seed_customers(args.customers, rng) if args.customers else []
+        if not customer_ids:
+            raise SystemExit('At least one customer is required')
+        print(f'{len(user_ids)} users, {len(customer_ids)} customers in {time.perf_counter() - started:.1f} s')
+
+        started = time.perf_counter()
+        imported = []
+        for start in range(0, args.reports, args.chunk_size * 10):
+            count = min(args.chunk_size * 10, args.reports - start)
+            rows = ((start + i + 1, synthetic_report(rng, start + i + 1, customer_ids, user_ids)) for i in range(count))
+            result = import_reports(rows, chunk_size=args.chunk_size)
+            if result.errors:
+                raise SystemExit(f'Import failed: {result.errors[:3]}')
+            imported.extend(result.imported_ids)
+            elapsed = time.perf_counter() - started
+            print(f'  {len(imported)} reports ({len(imported) / elapsed:.0f}/s)')
+
+    manifest = {
+        'username': 'loadtest0',
+        'password': args.password,
+        'report_ids': [min(imported), max(imported)] if imported else None,
+        'customer_ids': [min(customer_ids), max(customer_ids)],
+        'search_terms': CONTENTS,
+        'reports': len(imported),
+        'seed': args.seed
+    }
+    with open(args.manifest, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    print(f'Manifest written to {args.manifest}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,46 @@
+"""Gunicorn-Konfiguration
+
+    gunicorn -c gunicorn.conf.py src.main:app
+    gunicorn -c gunicorn.conf.py -k uvicorn.workers.UvicornWorker src.asgi:application
+
+Setzt ``PROMETHEUS_MULTIPROC_DIR`` vor dem Laden der App, damit alle Worker ihre
+Metriken in ein gemeinsames Verzeichnis schreiben (``GET /metrics`` fasst sie
+zusammen). Das Verzeichnis wird beim Start geleert; Messwerte beendeter Worker
+werden für Gauges aussortiert.
+
+Mit ``STATIC_PRECOMPRESS=1`` (Standard) erzeugt der Master vor dem Start der
+Worker fehlende oder veraltete ``.br``/``.gz``-Varianten der statischen Dateien.
+"""
+import os
+import shutil
+import tempfile
+
+# PORT setzen Plattformen wie Heroku (Procfile)
+bind = os.environ.get('GUNICORN_BIND') or f"0.0.0.0:{os.environ.get('PORT') or 5000}"
+workers = int(os.environ.get('WEB_CONCURRENCY', 2))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))  # PDF-Erstellung kann dauern
+
+multiproc_dir = os.environ.setdefault(
+    'PROMETHEUS_MULTIPROC_DIR', os.path.join(tempfile.gettempdir(), 'haral-prometheus')
+)
+static_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'static')
+
+def on_starting(server):
+    shutil.rmtree(multiproc_dir, ignore_errors=True)
+    os.makedirs(multiproc_dir, exist_ok=True)
+
+    if os.environ.get('STATIC_PRECOMPRESS', '1') != '0':
+        from src.utils.compression import precompress_static
+        try:
+            written = precompress_static(static_folder)
+        except OSError as e:
+            server.log.warning('Static precompression skipped: %s', e)
+        else:
+            server.log.info('Precompressed %d static files', written)
+
+def child_exit(server, worker):
+    try:
+        from prometheus_client import multiprocess
+    except ImportError:
+        return
+    multiprocess.mark_process_dead(worker.pid)
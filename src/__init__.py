@@ -2,12 +2,19 @@ from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
 from flask_cors import CORS
 import os
+from src.utils.db_profile import RoutingSession, configure_database, install_engine_events
+from src.utils.json_provider import FastJSONProvider
+from src.utils.compression import init_compression
+from src.utils.metrics import init_metrics
+from src.utils.sql_profiler import init_sql_profiler
+from src.utils.tracing import init_tracing
 
 # Initialize extensions
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={'class_': RoutingSession})
 
 def create_app():
     app = Flask(__name__)
+    app.json = FastJSONProvider(app)
     
     # Configuration
     if os.environ.get('DATABASE_URL'):
@@ -15,18 +22,50 @@ def create_app():
         database_url = os.environ.get('DATABASE_URL')
         if database_url.startswith('postgres://'):
             database_url = database_url.replace('postgres://', 'postgresql://', 1)
-        app.config['SQLALCHEMY_DATABASE_URI'] = database_url
     else:
         # Development
-        app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///haral_reports.db'
+        database_url = 'sqlite:///haral_reports.db'
+    
+    # URI plus pool/PRAGMA tuning and optional read replica
+    configure_database(app, database_url)
     
     app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
     app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key-change-in-production')
     app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+    app.config['AUDIT_NUMBER_BLOCK_SIZE'] = int(os.environ.get('AUDIT_NUMBER_BLOCK_SIZE', 20))
+    app.config['CALCULATION_FACTORS_TTL'] = int(os.environ.get('CALCULATION_FACTORS_TTL', 60))
+    app.config['CHANGES_SAFETY_WINDOW'] = int(os.environ.get('CHANGES_SAFETY_WINDOW', 60))
+    app.config['PDF_RENDER_CONCURRENCY'] = int(os.environ.get('PDF_RENDER_CONCURRENCY', 2))
+    app.config['PDF_RENDER_QUEUE'] = int(os.environ.get('PDF_RENDER_QUEUE', 8))
+    app.config['PDF_RENDER_TIMEOUT'] = float(os.environ.get('PDF_RENDER_TIMEOUT', 20))
+    app.config['PDF_RENDER_LOCK_DIR'] = os.environ.get('PDF_RENDER_LOCK_DIR')
+    app.config['RENDER_EXECUTOR'] = os.environ.get('RENDER_EXECUTOR', 'inline')  # inline, thread, process
+    app.config['RENDER_WORKERS'] = int(os.environ.get('RENDER_WORKERS', 2))
+    app.config['RENDER_MAX_TASKS_PER_CHILD'] = int(os.environ.get('RENDER_MAX_TASKS_PER_CHILD', 50))
+    app.config['ASGI_THREADS'] = int(os.environ.get('ASGI_THREADS', 20))
+    app.config['SQL_PROFILER'] = os.environ.get('SQL_PROFILER', '0') == '1'
+    app.config['SQL_SLOW_QUERY_MS'] = float(os.environ.get('SQL_SLOW_QUERY_MS', 100))
+    app.config['SQL_N_PLUS_ONE_THRESHOLD'] = int(os.environ.get('SQL_N_PLUS_ONE_THRESHOLD', 5))
+    app.config['SQL_SLOW_QUERY_LOG'] = os.environ.get('SQL_SLOW_QUERY_LOG')
+    app.config['PROFILING_ENABLED'] = os.environ.get('PROFILING_ENABLED', '1') != '0'
+    app.config['TRACE_SAMPLE_RATE'] = float(os.environ.get('TRACE_SAMPLE_RATE', 0.0))
+    app.config['TRACE_EXPORT_FILE'] = os.environ.get('TRACE_EXPORT_FILE')
+    app.config['TRACE_OTLP_ENDPOINT'] = os.environ.get('TRACE_OTLP_ENDPOINT')
+    app.config['TRACE_SERVICE_NAME'] = os.environ.get('TRACE_SERVICE_NAME', 'haral-pruefbericht-generator')
+    app.config['COMPRESSION_MIN_SIZE'] = int(os.environ.get('COMPRESSION_MIN_SIZE', 1024))
+    app.config['AUTH_TOKEN_TTL'] = int(os.environ.get('AUTH_TOKEN_TTL', 15 * 60))
+    app.config['AUTH_REFRESH_TTL'] = int(os.environ.get('AUTH_REFRESH_TTL', 14 * 24 * 3600))
+    app.config['AUTH_REVOCATION_TTL'] = int(os.environ.get('AUTH_REVOCATION_TTL', 30))
     
     # Initialize extensions with app
     db.init_app(app)
+    with app.app_context():
+        install_engine_events(db)
+        init_tracing(app, db)
+        init_metrics(app, db)
+        init_sql_profiler(app, db)
     CORS(app, supports_credentials=True)
+    init_compression(app)
     
     return app
 
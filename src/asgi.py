@@ -0,0 +1,19 @@
+"""ASGI-Einstiegspunkt
+
+    uvicorn src.asgi:application --host 0.0.0.0 --port 5000 --workers 2
+    gunicorn -k uvicorn.workers.UvicornWorker -w 2 -b 0.0.0.0:5000 src.asgi:application
+
+Die Flask-App läuft in einem begrenzten Thread-Pool (``ASGI_THREADS`` Threads
+pro Prozess), sodass wartende Datenbankzugriffe andere Anfragen nicht
+blockieren. PDFs werden standardmäßig in eigenen Prozessen erstellt
+(``RENDER_EXECUTOR=process``, siehe ``src.utils.render_executor``).
+"""
+import os
+
+# Vor dem Anlegen der App setzen, damit ``create_app`` den Wert übernimmt
+os.environ.setdefault('RENDER_EXECUTOR', 'process')
+
+from a2wsgi import WSGIMiddleware
+from src.main import app
+
+application = WSGIMiddleware(app, workers=app.config['ASGI_THREADS'])
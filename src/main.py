@@ -3,15 +3,29 @@ import sys
 # DON'T CHANGE THIS !!!
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-from flask import Flask, send_from_directory
+import click
+from flask import Flask
 from flask_cors import CORS
 from src import create_app, db
 from src.models.user import User
 from src.models.customer import Customer
 from src.models.report import Report
+from src.models.report_alternative import ReportAlternative
+from src.models.sequence import NumberSequence
+from src.models import report_statistics
+from src.models.change_log import ChangeLogEntry
+from src.models.calculation_factors import CalculationFactors
+from src.models.revoked_token import RevokedToken
 from src.routes.user import user_bp
 from src.routes.customer import customer_bp
 from src.routes.report import report_bp
+from src.routes.analytics import analytics_bp
+from src.routes.calculation_factors import factors_bp
+from src.routes.profiling import profiling_bp
+from src.utils.migrations import run_migrations
+from src.utils import recalculation, report_import
+from src.utils.compression import precompress_static
+from src.utils.static_files import StaticManifest
 
 # Create app using factory pattern
 app = create_app()
@@ -20,21 +34,22 @@ app = create_app()
 app.register_blueprint(user_bp, url_prefix='/api')
 app.register_blueprint(customer_bp, url_prefix='/api')
 app.register_blueprint(report_bp, url_prefix='/api')
+app.register_blueprint(analytics_bp, url_prefix='/api')
+app.register_blueprint(factors_bp, url_prefix='/api')
+app.register_blueprint(profiling_bp, url_prefix='/api')
+
+# Manifest of static files; index.html is kept in memory
+static_manifest = StaticManifest(app.static_folder)
 
 @app.route('/')
 def serve_index():
     """Serve the main application"""
-    return send_from_directory(app.static_folder, 'index.html')
+    return static_manifest.index_response()
 
 @app.route('/<path:path>')
 def serve_static_or_spa(path):
     """Serve static files or SPA routes"""
-    try:
-        # Try to serve static file first
-        return send_from_directory(app.static_folder, path)
-    except:
-        # If file doesn't exist, serve index.html for SPA routing
-        return send_from_directory(app.static_folder, 'index.html')
+    return static_manifest.serve(path)
 
 def create_default_users():
     """Create default users if they don't exist"""
@@ -95,10 +110,94 @@ def create_sample_customer():
         print(f"Error creating sample customer: {e}")
         db.session.rollback()
 
+@app.cli.command('migrate-db')
+def migrate_db_command():
+    """Create missing tables and apply pending schema migrations"""
+    db.create_all()
+    with db.engine.begin() as connection:
+        applied = run_migrations(connection)
+    
+    if applied:
+        print("Applied migrations: " + ", ".join(applied))
+    else:
+        print("Database schema is up to date")
+
+@app.cli.command('precompress-static')
+def precompress_static_command():
+    """Write .br/.gz variants of the static assets"""
+    written = precompress_static(app.static_folder)
+    print(f"Precompressed {written} static files")
+
+@app.cli.command('prune-static')
+@click.option('--dry-run', is_flag=True, help='Only list the bundles that would be removed')
+def prune_static_command(dry_run):
+    """Remove hashed bundles that index.html no longer references"""
+    try:
+        removed = static_manifest.prune_unreferenced(dry_run=dry_run)
+    except ValueError as e:
+        raise click.ClickException(str(e))
+
+    for path in removed:
+        print(("Would remove " if dry_run else "Removed ") + path)
+    print(f"{len(removed)} unreferenced bundles" + (" found" if dry_run else " removed"))
+
+@app.cli.command('rebuild-statistics')
+def rebuild_statistics_command():
+    """Rebuild the report statistics rollup and report any drift"""
+    with db.engine.begin() as connection:
+        stored = connection.execute(
+            report_statistics.ReportStatistics.__table__.select()
+        ).mappings().first()
+        counters = report_statistics.rebuild(connection)
+    
+    drift = {
+        column: (stored[column] if stored else None, value)
+        for column, value in counters.items()
+        if not stored or abs((stored[column] or 0) - value) > 1e-6
+    }
+    if drift:
+        print("Statistics rollup was inconsistent:")
+        for column, (old, new) in drift.items():
+            print(f"  {column}: {old} -> {new}")
+    else:
+        print("Statistics rollup is consistent")
+
+@app.cli.command('import-reports')
+@click.argument('path', type=click.Path(exists=True, dir_okay=False))
+@click.option('--format', 'import_format', type=click.Choice(['csv', 'ndjson']),
+              help='Input format (default: derived from the file extension)')
+@click.option('--chunk-size', default=report_import.DEFAULT_CHUNK_SIZE, show_default=True)
+def import_reports_command(path, import_format, chunk_size):
+    """Bulk import reports from a CSV or NDJSON file"""
+    if not import_format:
+        import_format = 'csv' if path.lower().endswith('.csv') else 'ndjson'
+    
+    with open(path, encoding='utf-8-sig', newline='') as stream:
+        result = report_import.import_reports(
+            report_import.parse_rows(stream, import_format),
+            chunk_size=max(chunk_size, 1)
+        )
+    
+    print(f"Imported {len(result.imported_ids)} reports, {len(result.errors)} failed")
+    for error in result.errors:
+        print(f"  row {error['row']}: {error['error']}")
+
+@app.cli.command('recalculate-reports')
+@click.option('--chunk-size', default=recalculation.DEFAULT_CHUNK_SIZE, show_default=True)
+def recalculate_reports_command(chunk_size):
+    """Recalculate derived report values with the current calculation factors"""
+    def progress(updated, skipped):
+        print(f"  {updated} updated, {skipped} skipped")
+    
+    updated, skipped = recalculation.recalculate_reports(max(chunk_size, 1), progress)
+    print(f"Recalculated {updated} reports ({skipped} skipped due to concurrent changes)")
+
 if __name__ == '__main__':
     with app.app_context():
         # Create database tables
         db.create_all()
+        with db.engine.begin() as connection:
+            run_migrations(connection)
         
         # Create default users and sample data
         create_default_users()
@@ -0,0 +1,103 @@
+import threading
+import time
+from datetime import datetime
+from flask import current_app
+from sqlalchemy import select
+from src import db
+from src.utils import calculations
+from src.utils.metrics import record_cache
+
+DEFAULT_CACHE_TTL = 60  # Sekunden
+
+class CalculationFactors(db.Model):
+    """Versionierte Preise und Faktoren für die Berechnungen (neueste Zeile gilt)"""
+    __tablename__ = 'calculation_factors'
+
+    id = db.Column(db.Integer, primary_key=True)  # = Version
+    foil_cost_per_kg = db.Column(db.Float, nullable=False)  # in €
+    roll_core_cost_per_kg = db.Column(db.Float, nullable=False)  # in €
+    co2_per_kg_film = db.Column(db.Float, nullable=False)  # in kg CO2
+    cost_reduction_factor = db.Column(db.Float, nullable=False)
+    stability_factor = db.Column(db.Float, nullable=False)
+    note = db.Column(db.String(200))
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id'))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+
+    FACTOR_FIELDS = calculations.Factors._fields[1:]
+
+    def as_factors(self):
+        return calculations.Factors(self.id, *(getattr(self, field) for field in self.FACTOR_FIELDS))
+
+    @classmethod
+    def from_dict(cls, data, base=calculations.DEFAULT_FACTORS):
+        """Neue Version; nicht angegebene Faktoren werden von ``base`` übernommen"""
+        values = {}
+        for field in cls.FACTOR_FIELDS:
+            value = float(data[field]) if data.get(field) is not None else getattr(base, field)
+            if value < 0:
+                raise ValueError(f'{field} darf nicht negativ sein')
+            values[field] = value
+        return cls(note=data.get('note'), **values)
+
+    def to_dict(self):
+        data = {field: getattr(self, field) for field in self.FACTOR_FIELDS}
+        data.update({
+            'version': self.id,
+            'note': self.note,
+            'created_by': self.created_by,
+            'created_at': self.created_at
+        })
+        return data
+
+    def __repr__(self):
+        return f'<CalculationFactors v{self.id}>'
+
+class FactorCache:
+    """Prozesslokaler Cache der aktuellen Faktoren
+
+    Änderungen im selben Prozess invalidieren sofort; andere Prozesse sehen
+    eine neue Version spätestens nach ``CALCULATION_FACTORS_TTL`` Sekunden.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._factors = None
+        self._expires_at = 0
+
+    def get(self):
+        factors = self._factors
+        if factors is not None and time.monotonic() < self._expires_at:
+            record_cache('calculation_factors', True)
+            return factors
+        with self._lock:
+            if self._factors is None or time.monotonic() >= self._expires_at:
+                record_cache('calculation_factors', False)
+                self._factors = self._load()
+                ttl = current_app.config.get('CALCULATION_FACTORS_TTL', DEFAULT_CACHE_TTL)
+                self._expires_at = time.monotonic() + ttl
+            return self._factors
+
+    def invalidate(self):
+        with self._lock:
+            self._factors = None
+            self._expires_at = 0
+
+    @staticmethod
+    def _load():
+        # Immer von der primären Datenbank lesen, damit eine neue Version sofort gilt
+        with db.engine.connect() as connection:
+            row = connection.execute(
+                select(CalculationFactors.__table__).order_by(CalculationFactors.id.desc()).limit(1)
+            ).mappings().first()
+        if row is None:
+            return calculations.DEFAULT_FACTORS
+        return calculations.Factors(row['id'], *(row[field] for field in CalculationFactors.FACTOR_FIELDS))
+
+factor_cache = FactorCache()
+
+def current_factors():
+    """Aktuell gültige Faktoren (gecacht)"""
+    return factor_cache.get()
+
+def invalidate_factors():
+    factor_cache.invalidate()
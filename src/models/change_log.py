@@ -0,0 +1,51 @@
+from datetime import datetime
+from sqlalchemy import event
+from src import db
+from src.models.customer import Customer
+from src.models.report import Report
+
+ACTION_UPSERT = 'upsert'
+ACTION_DELETE = 'delete'
+
+class ChangeLogEntry(db.Model):
+    """Fortlaufendes Änderungsprotokoll für die Delta-Synchronisation (id = Cursor)"""
+    __tablename__ = 'change_log'
+    
+    id = db.Column(db.BigInteger().with_variant(db.Integer, 'sqlite'), primary_key=True)
+    entity = db.Column(db.String(20), nullable=False)  # report, customer
+    entity_id = db.Column(db.Integer, nullable=False)
+    action = db.Column(db.String(10), nullable=False)  # upsert, delete
+    changed_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    
+    __table_args__ = (
+        db.Index('ix_change_log_entity', 'entity', 'entity_id'),
+    )
+    
+    def __repr__(self):
+        return f'<ChangeLogEntry {self.id}: {self.action} {self.entity} {self.entity_id}>'
+
+def record_changes(connection, entity, entity_ids, action=ACTION_UPSERT):
+    """Protokolliert Änderungen mehrerer Objekte mit einem executemany (für Massenoperationen)"""
+    if not entity_ids:
+        return
+    now = datetime.utcnow()
+    connection.execute(ChangeLogEntry.__table__.insert(), [
+        {'entity': entity, 'entity_id': entity_id, 'action': action, 'changed_at': now}
+        for entity_id in entity_ids
+    ])
+
+def _listen(model, entity):
+    @event.listens_for(model, 'after_insert')
+    def _inserted(mapper, connection, target):
+        record_changes(connection, entity, [target.id])
+    
+    @event.listens_for(model, 'after_update')
+    def _updated(mapper, connection, target):
+        record_changes(connection, entity, [target.id])
+    
+    @event.listens_for(model, 'after_delete')
+    def _deleted(mapper, connection, target):
+        record_changes(connection, entity, [target.id], ACTION_DELETE)
+
+_listen(Report, 'report')
+_listen(Customer, 'customer')
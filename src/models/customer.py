@@ -29,8 +29,8 @@ class Customer(db.Model):
             'email': self.email,
             'notes': self.notes,
             'logo_path': self.logo_path,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
     
     @classmethod
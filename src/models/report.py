@@ -1,6 +1,14 @@
 from datetime import datetime
 import json
+from sqlalchemy.dialects.postgresql import JSONB
 from src import db
+from src.models.report_alternative import ReportAlternative
+from src.models.calculation_factors import current_factors
+from src.utils import calculations
+from src.utils.tracing import traced
+
+# Native JSON-Spalte (JSONB auf PostgreSQL, damit JSON-Abfragen indiziert werden können)
+JSONList = db.JSON(none_as_null=True).with_variant(JSONB(none_as_null=True), 'postgresql')
 
 class Report(db.Model):
     __tablename__ = 'reports'
@@ -61,7 +69,7 @@ class Report(db.Model):
     certificate_required = db.Column(db.Boolean, default=False)
     
     # Alternativen (JSON-Feld für bis zu 3 Alternativen)
-    alternatives = db.Column(db.Text)  # JSON: [{"film_thickness": 17, "prestretch": 38, "pallet_stability": "Gut"}, ...]
+    alternatives = db.Column(JSONList)  # JSON: [{"film_thickness": 17, "prestretch": 38, "pallet_stability": "Gut"}, ...]
     
     # Empfehlung
     recommended_alternative = db.Column(db.String(50))
@@ -77,7 +85,7 @@ class Report(db.Model):
     follow_up_required = db.Column(db.Boolean, default=False)
     
     # Bilddokumentation (JSON-Feld)
-    images = db.Column(db.Text)  # JSON: [{"filename": "img1.jpg", "description": "..."}, ...]
+    images = db.Column(JSONList)  # JSON: [{"filename": "img1.jpg", "description": "..."}, ...]
     
     # Quintessenz (automatisch berechnet)
     material_savings = db.Column(db.Float, default=0)  # in %
@@ -89,15 +97,32 @@ class Report(db.Model):
     total_material_consumption = db.Column(db.Float)  # in kg/Jahr
     annual_costs = db.Column(db.Float)  # in €
     co2_emissions = db.Column(db.Float)  # in kg/Jahr
+    factor_version = db.Column(db.Integer)  # Version der Faktortabelle der letzten Berechnung
     
     # Status und Metadaten
     status = db.Column(db.String(20), nullable=False, default='draft')  # draft, completed, archived
+    version = db.Column(db.Integer, nullable=False, default=1)  # optimistische Sperre
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     
+    __mapper_args__ = {'version_id_col': version}
+    
+    # Eingabefelder der berechneten Werte (für Teilaktualisierungen)
+    CONSUMPTION_INPUTS = frozenset(['film_consumption_per_pallet', 'pallets_per_year', 'roll_core_weight'])
+    CONSUMPTION_OUTPUTS = ('total_material_consumption', 'annual_costs', 'co2_emissions')
+    QUINTESSENZ_INPUTS = frozenset(['alternatives', 'film_thickness'])
+    QUINTESSENZ_OUTPUTS = ('material_savings', 'cost_reduction', 'co2_reduction', 'stability_increase')
+    
     # Relationships
     customer = db.relationship('Customer', backref='reports')
     user = db.relationship('User', backref='reports')
+    alternative_rows = db.relationship(
+        'ReportAlternative',
+        # Ohne passive_deletes: Alternativen werden auch ohne aktive
+        # Fremdschlüsselprüfung (SQLite-Standard) mit dem Bericht gelöscht
+        cascade='all, delete-orphan',
+        order_by='ReportAlternative.position'
+    )
     
     def __init__(self, **kwargs):
         super(Report, self).__init__(**kwargs)
@@ -107,80 +132,109 @@ class Report(db.Model):
     @staticmethod
     def generate_audit_number():
         """Generiert eine eindeutige Auftragsnummer"""
-        import time
-        import random
-        timestamp = str(int(time.time()))[-5:]
-        random_num = str(random.randint(100, 999))
-        return timestamp + random_num
+        from src.utils.audit_numbers import next_audit_number
+        return next_audit_number()
+    
+    def _get_json_list(self, field):
+        """Gibt ein JSON-Feld als Python-Liste zurück"""
+        value = getattr(self, field)
+        if isinstance(value, str):
+            # Altbestand aus einer noch nicht migrierten Text-Spalte: nur einmal pro Wert parsen
+            cache = self.__dict__.setdefault('_json_cache', {})
+            cached = cache.get(field)
+            if cached is None or cached[0] is not value:
+                try:
+                    parsed = json.loads(value)
+                except json.JSONDecodeError:
+                    parsed = []
+                cached = cache[field] = (value, parsed if isinstance(parsed, list) else [])
+            return cached[1]
+        return value or []
+    
+    def _set_json_list(self, field, values):
+        """Setzt ein JSON-Feld und verwirft den Parse-Cache"""
+        self.__dict__.get('_json_cache', {}).pop(field, None)
+        setattr(self, field, list(values) if values else None)
     
     def set_alternatives(self, alternatives_list):
-        """Setzt die Alternativen als JSON"""
-        self.alternatives = json.dumps(alternatives_list) if alternatives_list else None
+        """Setzt die Alternativen als JSON und synchronisiert die normalisierten Zeilen"""
+        self._set_json_list('alternatives', alternatives_list)
+        # Das Laden der bisherigen Zeilen soll keinen vorzeitigen Flush auslösen
+        with db.session.no_autoflush:
+            self.alternative_rows = [
+                ReportAlternative.from_dict(alternative, position)
+                for position, alternative in enumerate(alternatives_list or [])
+                if isinstance(alternative, dict)
+            ]
     
     def get_alternatives(self):
         """Gibt die Alternativen als Python-Liste zurück"""
-        if self.alternatives:
-            try:
-                return json.loads(self.alternatives)
-            except json.JSONDecodeError:
-                return []
-        return []
+        return self._get_json_list('alternatives')
     
     def set_images(self, images_list):
         """Setzt die Bilder als JSON"""
-        self.images = json.dumps(images_list) if images_list else None
+        self._set_json_list('images', images_list)
     
     def get_images(self):
         """Gibt die Bilder als Python-Liste zurück"""
-        if self.images:
-            try:
-                return json.loads(self.images)
-            except json.JSONDecodeError:
-                return []
-        return []
+        return self._get_json_list('images')
     
-    def calculate_holding_force_deviations(self):
-        """Berechnet die Abweichungen der Haltekräfte"""
-        deviations = {}
+    @classmethod
+    def from_dict(cls, data):
+        """Erstellt einen Bericht aus Eingabedaten (Typkonvertierung über das Feldschema)"""
+        from src.utils.report_schema import REPORT_SCHEMA
+        return cls.from_values(REPORT_SCHEMA.load(data))
+    
+    @classmethod
+    def from_values(cls, values):
+        """Erstellt einen Bericht aus bereits konvertierten Spaltenwerten"""
+        values = dict(values)
+        alternatives = values.pop('alternatives', None)
+        images = values.pop('images', None)
+        report = cls(**values)
         
-        # Lange Seite oben
-        if self.holding_force_long_top_target and self.holding_force_long_top_target > 0:
-            deviation = ((self.holding_force_long_top_actual or 0) - self.holding_force_long_top_target) / self.holding_force_long_top_target * 100
-            deviations['long_top'] = round(deviation, 1)
+        # Alternativen setzen
+        if alternatives:
+            report.set_alternatives(alternatives)
         
-        # Lange Seite unten
-        if self.holding_force_long_bottom_target and self.holding_force_long_bottom_target > 0:
-            deviation = ((self.holding_force_long_bottom_actual or 0) - self.holding_force_long_bottom_target) / self.holding_force_long_bottom_target * 100
-            deviations['long_bottom'] = round(deviation, 1)
+        # Bilder setzen
+        if images:
+            report.set_images(images)
         
-        # Kurze Seite oben
-        if self.holding_force_short_top_target and self.holding_force_short_top_target > 0:
-            deviation = ((self.holding_force_short_top_actual or 0) - self.holding_force_short_top_target) / self.holding_force_short_top_target * 100
-            deviations['short_top'] = round(deviation, 1)
+        return report
+    
+    def calculate_holding_force_deviations(self):
+        """Berechnet die Abweichungen der Haltekräfte"""
+        deviations = {}
         
-        # Kurze Seite unten
-        if self.holding_force_short_bottom_target and self.holding_force_short_bottom_target > 0:
-            deviation = ((self.holding_force_short_bottom_actual or 0) - self.holding_force_short_bottom_target) / self.holding_force_short_bottom_target * 100
-            deviations['short_bottom'] = round(deviation, 1)
+        # Lange/kurze Seite jeweils oben und unten
+        for side in calculations.HOLDING_FORCE_SIDES:
+            target = getattr(self, f'holding_force_{side}_target')
+            if target and target > 0:
+                actual = getattr(self, f'holding_force_{side}_actual') or 0
+                deviations[side] = round(calculations.holding_force_deviation(actual, target), 1)
         
         return deviations
     
-    def calculate_consumption_and_costs(self):
+    def calculate_consumption_and_costs(self, factors=None):
         """Berechnet Verbrauch und Kosten"""
         if self.film_consumption_per_pallet and self.pallets_per_year:
+            factors = factors or current_factors()
+            
             # Gesamtmaterialverbrauch in kg/Jahr
-            self.total_material_consumption = (self.film_consumption_per_pallet * self.pallets_per_year) / 1000
+            self.total_material_consumption = calculations.annual_material_consumption(
+                self.film_consumption_per_pallet, self.pallets_per_year
+            )
             
-            # Vereinfachte Kostenberechnung (€2.50 pro kg Folie + Rollenkern-Kosten)
-            foil_cost_per_kg = 2.50
-            roll_core_cost_per_year = (self.roll_core_weight or 0) * 0.50 * (self.pallets_per_year or 0) / 1000
-            self.annual_costs = (self.total_material_consumption * foil_cost_per_kg) + roll_core_cost_per_year
+            # Kosten für Folie und Rollenkern
+            self.annual_costs = calculations.annual_costs(
+                self.total_material_consumption, self.roll_core_weight or 0, self.pallets_per_year or 0, factors
+            )
             
-            # CO2-Emissionen (3.02 kg CO2 pro kg Folie)
-            co2_factor = 3.02
-            self.co2_emissions = self.total_material_consumption * co2_factor
+            # CO2-Emissionen
+            self.co2_emissions = calculations.co2_emissions(self.total_material_consumption, factors)
     
-    def calculate_quintessenz(self):
+    def calculate_quintessenz(self, factors=None):
         """Berechnet die Quintessenz basierend auf der besten Alternative"""
         alternatives = self.get_alternatives()
         if not alternatives or not self.film_thickness:
@@ -197,23 +251,55 @@ class Report(db.Model):
                 # Materialeinsparung
                 self.material_savings = round(((current_thickness - new_thickness) / current_thickness) * 100, 1)
                 
-                # Kostenreduzierung (vereinfacht: 40% der Materialeinsparung)
-                self.cost_reduction = round(self.material_savings * 0.4, 1)
+                factors = factors or current_factors()
+                
+                # Kostenreduzierung (Anteil der Materialeinsparung laut Faktortabelle)
+                self.cost_reduction = float(calculations.round_quintessenz(calculations.cost_reduction(self.material_savings, factors)))
                 
                 # CO2-Reduktion (entspricht der Materialeinsparung)
                 self.co2_reduction = self.material_savings
                 
-                # Stabilitätssteigerung (vereinfacht: 20% der Materialeinsparung in kg)
-                self.stability_increase = round(self.material_savings * 0.2, 1)
+                # Stabilitätssteigerung (Anteil der Materialeinsparung in kg)
+                self.stability_increase = float(calculations.round_quintessenz(calculations.stability_increase(self.material_savings, factors)))
     
+    @traced('report.update_calculations')
     def update_calculations(self):
         """Aktualisiert alle Berechnungen"""
-        self.calculate_consumption_and_costs()
-        self.calculate_quintessenz()
+        factors = current_factors()
+        self.calculate_consumption_and_costs(factors)
+        self.calculate_quintessenz(factors)
+        self.factor_version = factors.version
+    
+    @traced('report.update_calculations_for')
+    def update_calculations_for(self, changed_fields):
+        """Aktualisiert nur die Berechnungen, die von den geänderten Feldern abhängen
+
+        Wurde der Bericht mit einer älteren Faktorversion berechnet, wird alles neu
+        berechnet, damit ``factor_version`` für alle berechneten Werte stimmt.
+        """
+        consumption = bool(self.CONSUMPTION_INPUTS.intersection(changed_fields))
+        quintessenz = bool(self.QUINTESSENZ_INPUTS.intersection(changed_fields))
+        if not (consumption or quintessenz):
+            return []
+
+        factors = current_factors()
+        if self.factor_version != factors.version:
+            consumption = quintessenz = True
+
+        recalculated = []
+        if consumption:
+            self.calculate_consumption_and_costs(factors)
+            recalculated.extend(self.CONSUMPTION_OUTPUTS)
+        if quintessenz:
+            self.calculate_quintessenz(factors)
+            recalculated.extend(self.QUINTESSENZ_OUTPUTS)
+        self.factor_version = factors.version
+        recalculated.append('factor_version')
+        return recalculated
     
-    def to_dict(self):
+    def to_dict(self, include_relations=True):
         """Konvertiert das Report-Objekt zu einem Dictionary"""
-        return {
+        data = {
             'id': self.id,
             'customer_id': self.customer_id,
             'user_id': self.user_id,
@@ -269,18 +355,25 @@ class Report(db.Model):
             'total_material_consumption': self.total_material_consumption,
             'annual_costs': self.annual_costs,
             'co2_emissions': self.co2_emissions,
+            'factor_version': self.factor_version,
             'status': self.status,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'customer': self.customer.to_dict() if self.customer else None,
-            'user': {
+            'version': self.version,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'holding_force_deviations': self.calculate_holding_force_deviations()
+        }
+        
+        # Verknüpfte Objekte (für Exporte abschaltbar, um Zusatzabfragen zu vermeiden)
+        if include_relations:
+            data['customer'] = self.customer.to_dict() if self.customer else None
+            data['user'] = {
                 'id': self.user.id,
                 'first_name': self.user.first_name,
                 'last_name': self.user.last_name,
                 'email': self.user.email
-            } if self.user else None,
-            'holding_force_deviations': self.calculate_holding_force_deviations()
-        }
+            } if self.user else None
+        
+        return data
     
     def __repr__(self):
         return f'<Report {self.audit_number}: {self.title}>'
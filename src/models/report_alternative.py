@@ -0,0 +1,47 @@
+from src import db
+
+class ReportAlternative(db.Model):
+    """Normalisierte Alternative eines Berichts (typisierte Spalten für SQL-Auswertungen)"""
+    __tablename__ = 'report_alternatives'
+
+    id = db.Column(db.Integer, primary_key=True)
+    report_id = db.Column(db.Integer, db.ForeignKey('reports.id', ondelete='CASCADE'), nullable=False, index=True)
+    position = db.Column(db.Integer, nullable=False, default=0)  # Reihenfolge wie im JSON-Feld
+
+    film_thickness = db.Column(db.Float, index=True)  # in μm
+    prestretch = db.Column(db.Float)  # in %
+    pallet_stability = db.Column(db.String(50))
+
+    @staticmethod
+    def _to_float(value):
+        if value is None or value == '':
+            return None
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def row_values(cls, data, position):
+        """Spaltenwerte aus einem Alternative-Dictionary (auch für Massen-Inserts)"""
+        stability = data.get('pallet_stability')
+        return {
+            'position': position,
+            'film_thickness': cls._to_float(data.get('film_thickness')),
+            'prestretch': cls._to_float(data.get('prestretch')),
+            'pallet_stability': str(stability)[:50] if stability not in (None, '') else None
+        }
+
+    @classmethod
+    def from_dict(cls, data, position):
+        return cls(**cls.row_values(data, position))
+
+    def to_dict(self):
+        return {
+            'film_thickness': self.film_thickness,
+            'prestretch': self.prestretch,
+            'pallet_stability': self.pallet_stability
+        }
+
+    def __repr__(self):
+        return f'<ReportAlternative {self.report_id}#{self.position}: {self.film_thickness} μm>'
@@ -0,0 +1,173 @@
+from datetime import datetime
+from sqlalchemy import case, event, func, inspect, select
+from src import db
+from src.models.report import Report
+
+REPORT_STATUSES = ('draft', 'completed', 'archived')
+SAVINGS_FIELDS = ('material_savings', 'cost_reduction', 'co2_reduction')
+ROLLUP_ID = 1
+
+class ReportStatistics(db.Model):
+    """Inkrementell gepflegte Rollup-Zeile für die Berichtsstatistiken"""
+    __tablename__ = 'report_statistics'
+
+    id = db.Column(db.Integer, primary_key=True)  # immer ROLLUP_ID
+
+    # Anzahl Berichte je Status
+    total_reports = db.Column(db.Integer, nullable=False, default=0)
+    draft_reports = db.Column(db.Integer, nullable=False, default=0)
+    completed_reports = db.Column(db.Integer, nullable=False, default=0)
+    archived_reports = db.Column(db.Integer, nullable=False, default=0)
+
+    # Summen und Anzahl der positiven Einsparungen (für Durchschnittswerte)
+    material_savings_sum = db.Column(db.Float, nullable=False, default=0)
+    material_savings_count = db.Column(db.Integer, nullable=False, default=0)
+    cost_reduction_sum = db.Column(db.Float, nullable=False, default=0)
+    cost_reduction_count = db.Column(db.Integer, nullable=False, default=0)
+    co2_reduction_sum = db.Column(db.Float, nullable=False, default=0)
+    co2_reduction_count = db.Column(db.Integer, nullable=False, default=0)
+
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def average(self, field):
+        """Durchschnitt der positiven Werte eines Einsparungsfeldes"""
+        count = getattr(self, f'{field}_count') or 0
+        if not count:
+            return 0
+        return (getattr(self, f'{field}_sum') or 0) / count
+
+    def to_dict(self):
+        return {
+            'total_reports': self.total_reports,
+            'draft_reports': self.draft_reports,
+            'completed_reports': self.completed_reports,
+            'archived_reports': self.archived_reports,
+            'average_savings': {
+                field: round(self.average(field), 1) for field in SAVINGS_FIELDS
+            }
+        }
+
+    def __repr__(self):
+        return f'<ReportStatistics total={self.total_reports}>'
+
+def counter_columns():
+    """Alle Zählerspalten der Rollup-Tabelle"""
+    columns = ['total_reports'] + [f'{status}_reports' for status in REPORT_STATUSES]
+    for field in SAVINGS_FIELDS:
+        columns.extend([f'{field}_sum', f'{field}_count'])
+    return columns
+
+def aggregate_statement(*criteria):
+    """Eine gruppierte Aggregatabfrage über alle (oder die gefilterten) Berichte"""
+    columns = [Report.status, func.count(Report.id)]
+    for field in SAVINGS_FIELDS:
+        column = getattr(Report, field)
+        columns.append(func.sum(case((column > 0, column))))
+        columns.append(func.count(case((column > 0, 1))))
+    stmt = select(*columns).group_by(Report.status)
+    if criteria:
+        stmt = stmt.where(*criteria)
+    return stmt
+
+def aggregate_counters(connection, *criteria):
+    """Führt die Aggregatabfrage aus und liefert die Zählerwerte als Dictionary"""
+    counters = dict.fromkeys(counter_columns(), 0)
+    for row in connection.execute(aggregate_statement(*criteria)):
+        status, count = row[0], row[1]
+        counters['total_reports'] += count
+        if status in REPORT_STATUSES:
+            counters[f'{status}_reports'] += count
+        for i, field in enumerate(SAVINGS_FIELDS):
+            counters[f'{field}_sum'] += row[2 + 2 * i] or 0
+            counters[f'{field}_count'] += row[3 + 2 * i] or 0
+    return counters
+
+def rebuild(connection):
+    """Baut die Rollup-Zeile vollständig aus der Berichtstabelle neu auf"""
+    table = ReportStatistics.__table__
+    counters = aggregate_counters(connection)
+    values = dict(counters, updated_at=datetime.utcnow())
+    result = connection.execute(table.update().where(table.c.id == ROLLUP_ID).values(values))
+    if result.rowcount == 0:
+        connection.execute(table.insert().values(id=ROLLUP_ID, **values))
+    return counters
+
+def apply_delta(connection, delta):
+    """Addiert die Differenzen atomar auf die Rollup-Zeile"""
+    delta = {column: value for column, value in delta.items() if value}
+    if not delta:
+        return
+    table = ReportStatistics.__table__
+    values = {column: table.c[column] + value for column, value in delta.items()}
+    values['updated_at'] = datetime.utcnow()
+    result = connection.execute(table.update().where(table.c.id == ROLLUP_ID).values(values))
+    if result.rowcount == 0:
+        # Noch keine Rollup-Zeile: der Neuaufbau enthält die aktuelle Änderung bereits
+        rebuild(connection)
+
+def apply_aggregate(connection, *criteria, sign=1):
+    """Addiert (oder subtrahiert) die Aggregate einer Berichtsmenge, z.B. nach Massenoperationen"""
+    counters = aggregate_counters(connection, *criteria)
+    apply_delta(connection, {column: sign * value for column, value in counters.items()})
+
+def contribution(status, material_savings=None, cost_reduction=None, co2_reduction=None, sign=1):
+    """Beitrag eines einzelnen Berichts zu den Zählern"""
+    delta = {'total_reports': sign}
+    if status in REPORT_STATUSES:
+        delta[f'{status}_reports'] = sign
+    for field, value in zip(SAVINGS_FIELDS, (material_savings, cost_reduction, co2_reduction)):
+        if value is not None and value > 0:
+            delta[f'{field}_sum'] = sign * value
+            delta[f'{field}_count'] = sign
+    return delta
+
+def merge_deltas(*deltas):
+    merged = {}
+    for delta in deltas:
+        for column, value in delta.items():
+            merged[column] = merged.get(column, 0) + value
+    return merged
+
+def get_statistics():
+    """Liest die Rollup-Zeile (konstante Zeit); legt sie beim ersten Zugriff an"""
+    statistics = db.session.get(ReportStatistics, ROLLUP_ID)
+    if statistics is None:
+        # Immer auf der primären Datenbank schreiben (die Session liest ggf. vom Replikat)
+        with db.engine.begin() as connection:
+            counters = rebuild(connection)
+        # Ergebnis des Neuaufbaus direkt verwenden; das Replikat hängt evtl. noch hinterher
+        statistics = ReportStatistics(id=ROLLUP_ID, **counters)
+    return statistics
+
+def _tracked_values(report, previous=False):
+    """Status und Einsparungen eines Berichts, wahlweise vor der aktuellen Änderung"""
+    if not previous:
+        return tuple(getattr(report, field) for field in ('status',) + SAVINGS_FIELDS)
+    state = inspect(report)
+    values = []
+    for field in ('status',) + SAVINGS_FIELDS:
+        history = state.attrs[field].history
+        if history.deleted:
+            values.append(history.deleted[0])
+        else:
+            values.append(getattr(report, field))
+    return tuple(values)
+
+@event.listens_for(Report, 'after_insert')
+def _report_inserted(mapper, connection, report):
+    apply_delta(connection, contribution(*_tracked_values(report)))
+
+@event.listens_for(Report, 'after_update')
+def _report_updated(mapper, connection, report):
+    old_values = _tracked_values(report, previous=True)
+    new_values = _tracked_values(report)
+    if old_values == new_values:
+        return
+    apply_delta(connection, merge_deltas(
+        contribution(*old_values, sign=-1),
+        contribution(*new_values)
+    ))
+
+@event.listens_for(Report, 'after_delete')
+def _report_deleted(mapper, connection, report):
+    apply_delta(connection, contribution(*_tracked_values(report, previous=True), sign=-1))
@@ -0,0 +1,21 @@
+from datetime import datetime
+from src import db
+
+class RevokedToken(db.Model):
+    """Gesperrte Tokens
+
+    Mit ``jti`` ist genau ein Token gesperrt (Logout, verbrauchter Refresh-Token).
+    Ohne ``jti`` gelten alle Tokens des Benutzers als gesperrt, die vor
+    ``revoked_at`` ausgestellt wurden (Rolle, Status oder Passwort geändert).
+    Einträge werden nach ``expires_at`` nicht mehr gebraucht und aufgeräumt.
+    """
+    __tablename__ = 'revoked_tokens'
+
+    id = db.Column(db.Integer, primary_key=True)
+    jti = db.Column(db.String(64), unique=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), index=True)
+    revoked_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    expires_at = db.Column(db.DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f'<RevokedToken {self.jti or self.user_id}>'
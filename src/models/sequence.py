@@ -0,0 +1,13 @@
+from datetime import datetime
+from src import db
+
+class NumberSequence(db.Model):
+    """Datenbankgestützte Nummernkreise (z.B. für Auftragsnummern)"""
+    __tablename__ = 'number_sequences'
+    
+    name = db.Column(db.String(50), primary_key=True)
+    next_value = db.Column(db.BigInteger, nullable=False)  # erster noch nicht vergebener Wert
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    def __repr__(self):
+        return f'<NumberSequence {self.name}: {self.next_value}>'
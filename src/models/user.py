@@ -53,9 +53,9 @@ class User(db.Model):
             'phone': self.phone,
             'role': self.role,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'last_login': self.last_login.isoformat() if self.last_login else None
+            'created_at': self.created_at,
+            'updated_at': self.updated_at,
+            'last_login': self.last_login
         }
         
         if include_sensitive:
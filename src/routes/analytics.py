@@ -0,0 +1,32 @@
+from flask import Blueprint, request, jsonify
+from src.utils import analytics
+from src.utils.auth import require_login
+from src.utils.db_profile import read_only
+
+analytics_bp = Blueprint('analytics', __name__)
+analytics_bp.before_request(require_login)
+
+def _filters():
+    return analytics.report_filters(
+        status=request.args.get('status'),
+        customer_id=request.args.get('customer_id', type=int)
+    )
+
+@analytics_bp.route('/analytics/holding-force-deviations', methods=['GET'])
+@read_only
+def get_holding_force_deviations():
+    """Verteilung der Haltekraft-Abweichungen über alle Berichte"""
+    try:
+        bins = min(max(request.args.get('bins', 20, type=int), 1), 200)
+        return jsonify(analytics.holding_force_deviation_distribution(*_filters(), bins=bins))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@analytics_bp.route('/analytics/consumption', methods=['GET'])
+@read_only
+def get_consumption():
+    """Jährlicher Folienverbrauch, Kosten und CO2 je Kunde"""
+    try:
+        return jsonify(analytics.consumption_by_customer(*_filters()))
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
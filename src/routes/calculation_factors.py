@@ -0,0 +1,87 @@
+from flask import Blueprint, current_app, request, jsonify
+from src import db
+from src.models.calculation_factors import CalculationFactors, current_factors, invalidate_factors
+from src.utils.auth import current_identity, require_login
+from src.utils.recalculation import count_pending, recalculation_job
+
+factors_bp = Blueprint('calculation_factors', __name__)
+factors_bp.before_request(require_login)
+
+def _require_manager():
+    """Gibt eine Fehlerantwort zurück, wenn der angemeldete Benutzer keine Faktoren ändern darf"""
+    identity = current_identity()
+    if identity is None:
+        return jsonify({'error': 'Nicht angemeldet'}), 401
+    
+    if (identity.role or '').lower() not in ['admin', 'manager']:
+        return jsonify({'error': 'Keine Berechtigung'}), 403
+    return None
+
+def _recalculation_status():
+    with db.engine.connect() as connection:
+        pending = count_pending(connection, current_factors())
+    return dict(recalculation_job.state, pending=pending)
+
+@factors_bp.route('/calculation-factors', methods=['GET'])
+def get_calculation_factors():
+    """Aktuelle Faktoren und Versionshistorie abrufen"""
+    try:
+        history = CalculationFactors.query.order_by(CalculationFactors.id.desc()).all()
+        return jsonify({
+            'current': current_factors()._asdict(),
+            'history': [factors.to_dict() for factors in history]
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@factors_bp.route('/calculation-factors', methods=['POST'])
+def create_calculation_factors():
+    """Neue Faktorversion anlegen und die Neuberechnung im Hintergrund starten"""
+    try:
+        error = _require_manager()
+        if error:
+            return error
+        
+        data = request.get_json() or {}
+        factors = CalculationFactors.from_dict(data, base=current_factors())
+        factors.created_by = current_identity().user_id
+        
+        db.session.add(factors)
+        db.session.commit()
+        
+        invalidate_factors()
+        recalculation_job.start(current_app._get_current_object())
+        
+        return jsonify({
+            'factors': factors.to_dict(),
+            'recalculation': _recalculation_status()
+        }), 201
+        
+    except ValueError as e:
+        db.session.rollback()
+        return jsonify({'error': f'Ungültiger Wert: {str(e)}'}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@factors_bp.route('/calculation-factors/recalculation', methods=['GET'])
+def get_recalculation_status():
+    """Fortschritt der Neuberechnung und Anzahl noch offener Berichte"""
+    try:
+        return jsonify(_recalculation_status())
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@factors_bp.route('/calculation-factors/recalculation', methods=['POST'])
+def start_recalculation():
+    """Neuberechnung offener Berichte manuell starten"""
+    try:
+        error = _require_manager()
+        if error:
+            return error
+        
+        started = recalculation_job.start(current_app._get_current_object())
+        return jsonify(dict(_recalculation_status(), started=started)), 202
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -3,10 +3,14 @@ from flask import Blueprint, request, jsonify, current_app, send_file
 from werkzeug.utils import secure_filename
 from ..models.customer import Customer
 from .. import db
+from ..utils.db_profile import read_only
+from ..utils.auth import require_login
 
 customer_bp = Blueprint('customer', __name__)
+customer_bp.before_request(require_login)
 
 @customer_bp.route('/customers', methods=['GET'])
+@read_only
 def get_customers():
     """Get all customers"""
     try:
@@ -16,6 +20,7 @@ def get_customers():
         return jsonify({'error': str(e)}), 500
 
 @customer_bp.route('/customers/<int:customer_id>', methods=['GET'])
+@read_only
 def get_customer(customer_id):
     """Get customer by ID"""
     try:
@@ -0,0 +1,130 @@
+import base64
+import os
+from flask import Blueprint, Response, current_app, request, jsonify
+from src import db
+from src.models.report import Report
+from src.models.user import User
+from src.utils.auth import current_identity, issue_token, require_login
+from src.utils.enhanced_pdf_generator import generate_enhanced_report_pdf
+from src.utils.profiling import DEFAULT_TOP, SORT_KEYS, ProfilerBusy, profile_call
+from src.utils.render_limiter import RenderBusy, render_limiter
+
+profiling_bp = Blueprint('profiling', __name__)
+profiling_bp.before_request(require_login)
+
+SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+OUTPUT_FORMATS = ('json', 'pstats', 'text')
+
+@profiling_bp.before_request
+def require_admin():
+    """Profiling nur für Administratoren (abschaltbar mit ``PROFILING_ENABLED=0``)"""
+    if not current_app.config.get('PROFILING_ENABLED', True):
+        return jsonify({'error': 'Profiling ist deaktiviert'}), 404
+    identity = current_identity()
+    if identity is not None and (identity.role or '').lower() != 'admin':
+        return jsonify({'error': 'Keine Berechtigung'}), 403
+    return None
+
+def _options():
+    sort = request.args.get('sort', 'cumulative')
+    output = request.args.get('format', 'json')
+    if sort not in SORT_KEYS:
+        raise ValueError(f'sort muss einer der Werte {", ".join(SORT_KEYS)} sein')
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f'format muss einer der Werte {", ".join(OUTPUT_FORMATS)} sein')
+    return sort, request.args.get('top', DEFAULT_TOP, type=int), output
+
+def _profile_response(result, output, filename, **details):
+    """Ergebnis als JSON, als pstats-Datei (snakeviz) oder als pstats-Text"""
+    if output == 'pstats':
+        return Response(result.pstats_dump, mimetype='application/octet-stream', headers={
+            'Content-Disposition': f'attachment; filename={filename}.pstats'
+        })
+    if output == 'text':
+        return Response(result.text, mimetype='text/plain')
+    return jsonify({
+        **details,
+        'error': result.error,
+        'wall_ms': result.wall_ms,
+        'peak_memory_bytes': result.peak_memory_bytes,
+        'functions': result.functions,
+        'allocations': result.allocations,
+        'pstats': base64.b64encode(result.pstats_dump).decode('ascii')
+    })
+
+@profiling_bp.route('/profiling/reports/<int:report_id>/pdf', methods=['POST'])
+def profile_report_pdf(report_id):
+    """PDF eines Berichts im Serverprozess rendern und dabei profilieren"""
+    try:
+        sort, top, output = _options()
+        report = Report.query.get_or_404(report_id)
+
+        # Immer im Anfrage-Thread rendern, damit der Profiler den Renderer sieht
+        with render_limiter.slot():
+            result = profile_call(lambda: generate_enhanced_report_pdf(report), sort=sort, top=top)
+
+        pdf_bytes = None
+        if result.value and os.path.exists(result.value):
+            pdf_bytes = os.path.getsize(result.value)
+            os.remove(result.value)
+
+        return _profile_response(result, output, f'report_{report_id}_pdf',
+                                 report_id=report_id, pdf_bytes=pdf_bytes)
+
+    except RenderBusy as e:
+        response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 503
+    except ProfilerBusy as e:
+        return jsonify({'error': str(e)}), 409
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@profiling_bp.route('/profiling/request', methods=['POST'])
+def profile_request():
+    """API-Aufruf im Serverprozess wiederholen und dabei profilieren
+
+    Body: ``{"method": "GET", "path": "/api/api/reports", "query": {...}, "json": {...}}``.
+    Schreibende Methoden nur mit ``"allow_writes": true`` - sie ändern echte Daten.
+    """
+    try:
+        sort, top, output = _options()
+        data = request.get_json(silent=True) or {}
+        method = str(data.get('method', 'GET')).upper()
+        path = data.get('path') or ''
+
+        if not path.startswith('/api/') or path.startswith('/api/profiling/'):
+            return jsonify({'error': 'path muss ein API-Pfad (/api/...) außerhalb von /api/profiling sein'}), 400
+        if method not in SAFE_METHODS and not data.get('allow_writes'):
+            return jsonify({'error': f'{method} ändert Daten; zum Profilieren "allow_writes": true setzen'}), 400
+
+        # Wiederholung mit einem frischen Token des aufrufenden Administrators
+        user = db.session.get(User, current_identity().user_id)
+        headers = {'Authorization': f'Bearer {issue_token(user)}'}
+        client = current_app.test_client()
+
+        def replay():
+            # Eigener App-Kontext: frisches ``g`` und eigene Session, sonst
+            # überschreibt die Wiederholung Metriken, Trace und Request-ID dieser Anfrage
+            with current_app.app_context():
+                response = client.open(path, method=method, query_string=data.get('query'),
+                                       json=data.get('json'), headers=headers, buffered=True)
+                response.get_data()
+            return response
+
+        result = profile_call(replay, sort=sort, top=top)
+        response = result.value
+
+        return _profile_response(result, output, 'request',
+                                 method=method, path=path,
+                                 status=response.status_code if response is not None else None,
+                                 response_bytes=len(response.get_data()) if response is not None else None)
+
+    except ProfilerBusy as e:
+        return jsonify({'error': str(e)}), 409
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
@@ -1,30 +1,150 @@
-from flask import Blueprint, request, jsonify, send_file
+from flask import Blueprint, Response, current_app, request, jsonify, send_file, stream_with_context
 from src import db
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.exc import StaleDataError
 from src.models.report import Report
+from src.models.report_alternative import ReportAlternative
+from src.models.report_statistics import get_statistics
 from src.models.customer import Customer
+from src.models.change_log import ACTION_DELETE, ChangeLogEntry
 from src.models.user import User
-from src.utils.enhanced_pdf_generator import generate_enhanced_report_pdf
+from src.utils import report_bulk, report_export, report_import, scenarios
+from src.utils.auth import require_login
+from src.utils.db_profile import read_only
+from src.utils.render_executor import render_executor
+from src.utils.render_limiter import RenderBusy, render_limiter
+from src.utils.report_schema import REPORT_SCHEMA, ValidationError
+from src.utils.tracing import span
+import io
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 import json
 
 report_bp = Blueprint('report', __name__)
+report_bp.before_request(require_login)
+
+# Beziehungen, die to_dict() liest, gesammelt laden statt pro Bericht einzeln (N+1)
+LIST_LOAD_OPTIONS = (selectinload(Report.customer), selectinload(Report.user))
+
+def validation_error(e):
+    """400-Antwort mit allen fehlerhaften Feldern"""
+    return jsonify({'error': str(e), 'fields': e.errors}), 400
 
 @report_bp.route('/api/reports', methods=['GET'])
+@read_only
 def get_reports():
     """Alle Berichte abrufen"""
     try:
-        reports = Report.query.order_by(Report.created_at.desc()).all()
-        return jsonify([report.to_dict() for report in reports])
+        reports = Report.query.options(*LIST_LOAD_OPTIONS).order_by(Report.created_at.desc()).all()
+        with span('report.to_dict', reports=len(reports)):
+            data = [report.to_dict() for report in reports]
+        return jsonify(data)
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@report_bp.route('/api/reports/export', methods=['GET'])
+@read_only
+def export_reports():
+    """Berichte als NDJSON oder CSV streamen"""
+    try:
+        export_format = request.args.get('format', 'ndjson')
+        if export_format not in ('csv', 'ndjson'):
+            return jsonify({'error': 'Ungültiges Format (csv oder ndjson)'}), 400
+        
+        since = request.args.get('since')
+        if since:
+            since = datetime.fromisoformat(since)
+        
+        query = report_export.export_query(
+            since=since,
+            status=request.args.get('status'),
+            customer_id=request.args.get('customer_id', type=int)
+        )
+        
+        if export_format == 'csv':
+            body, mimetype, extension = report_export.iter_csv(query), 'text/csv', 'csv'
+        else:
+            body, mimetype, extension = report_export.iter_ndjson(query), 'application/x-ndjson', 'ndjson'
+        
+        return Response(
+            stream_with_context(body),
+            mimetype=mimetype,
+            headers={'Content-Disposition': f'attachment; filename=berichte.{extension}'}
+        )
+        
+    except ValueError as e:
+        return jsonify({'error': f'Ungültiger Wert: {str(e)}'}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@report_bp.route('/api/reports/changes', methods=['GET'])
+def get_report_changes():
+    """Seit einem Cursor geänderte oder gelöschte Berichte und Kunden abrufen
+    
+    IDs werden beim Einfügen vergeben, nicht beim Commit: Eine noch offene
+    Transaktion kann eine kleinere ID halten als bereits sichtbare Einträge.
+    Der Cursor rückt deshalb nur über Einträge vor, die älter als
+    ``CHANGES_SAFETY_WINDOW`` Sekunden sind; jüngere Einträge werden geliefert,
+    beim nächsten Abruf aber erneut (Upserts und Löschungen sind idempotent).
+    Das Fenster muss länger sein als die längste schreibende Transaktion.
+    Gelesen wird immer von der primären Datenbank, damit keine
+    Replikationsverzögerung hinzukommt.
+    """
+    try:
+        since = request.args.get('since', 0, type=int)
+        limit = min(max(request.args.get('limit', 1000, type=int), 1), 5000)
+        
+        entries = ChangeLogEntry.query.filter(ChangeLogEntry.id > since).order_by(
+            ChangeLogEntry.id
+        ).limit(limit + 1).all()
+        has_more = len(entries) > limit
+        entries = entries[:limit]
+        
+        # Cursor nur bis vor den ersten Eintrag im Sicherheitsfenster vorrücken
+        horizon = datetime.utcnow() - timedelta(seconds=current_app.config.get('CHANGES_SAFETY_WINDOW', 60))
+        cursor = since
+        for entry in entries:
+            if entry.changed_at >= horizon:
+                break
+            cursor = entry.id
+        
+        # Pro Objekt zählt nur die letzte Änderung
+        latest = {}
+        for entry in entries:
+            latest[(entry.entity, entry.entity_id)] = entry.action
+        
+        def changed_ids(entity, action):
+            return [entity_id for (kind, entity_id), last_action in latest.items()
+                    if kind == entity and (last_action == ACTION_DELETE) == (action == ACTION_DELETE)]
+        
+        report_ids = changed_ids('report', 'upsert')
+        customer_ids = changed_ids('customer', 'upsert')
+        reports = Report.query.filter(Report.id.in_(report_ids)).all() if report_ids else []
+        customers = Customer.query.filter(Customer.id.in_(customer_ids)).all() if customer_ids else []
+        
+        return jsonify({
+            'cursor': cursor,
+            'has_more': has_more and cursor > since,
+            'reports': [report.to_dict(include_relations=False) for report in reports],
+            'customers': [customer.to_dict() for customer in customers],
+            'deleted': {
+                'reports': changed_ids('report', ACTION_DELETE),
+                'customers': changed_ids('customer', ACTION_DELETE)
+            }
+        })
+        
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @report_bp.route('/api/reports/<int:report_id>', methods=['GET'])
+@read_only
 def get_report(report_id):
     """Einzelnen Bericht abrufen"""
     try:
         report = Report.query.get_or_404(report_id)
-        return jsonify(report.to_dict())
+        with span('report.to_dict', reports=1):
+            data = report.to_dict()
+        return jsonify(data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -34,101 +154,20 @@ def create_report():
     try:
         data = request.get_json()
         
-        # Validierung der Pflichtfelder
-        required_fields = ['customer_id', 'user_id', 'author']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({'error': f'Feld {field} ist erforderlich'}), 400
+        # Validierung und Typkonvertierung aller Felder
+        values = REPORT_SCHEMA.load(data)
         
         # Prüfen ob Kunde und User existieren
-        customer = Customer.query.get(data['customer_id'])
+        customer = Customer.query.get(values['customer_id'])
         if not customer:
             return jsonify({'error': 'Kunde nicht gefunden'}), 404
             
-        user = User.query.get(data['user_id'])
+        user = User.query.get(values['user_id'])
         if not user:
             return jsonify({'error': 'Benutzer nicht gefunden'}), 404
         
         # Neuen Bericht erstellen
-        report = Report(
-            customer_id=data['customer_id'],
-            user_id=data['user_id'],
-            title=data.get('title', 'PRÜFBERICHT AUDIT'),
-            audit_number=data.get('audit_number') or Report.generate_audit_number(),
-            author=data['author'],
-            phone=data.get('phone'),
-            email=data.get('email'),
-            
-            # Ausgangssituation
-            production_site=data.get('production_site'),
-            robot_manufacturer=data.get('robot_manufacturer'),
-            robot_model=data.get('robot_model'),
-            film_type=data.get('film_type'),
-            film_thickness=float(data['film_thickness']) if data.get('film_thickness') else None,
-            film_supplier=data.get('film_supplier'),
-            max_prestretch=float(data['max_prestretch']) if data.get('max_prestretch') else None,
-            film_consumption_per_pallet=float(data['film_consumption_per_pallet']) if data.get('film_consumption_per_pallet') else None,
-            pallets_per_year=int(data['pallets_per_year']) if data.get('pallets_per_year') else None,
-            roll_core_weight=float(data['roll_core_weight']) if data.get('roll_core_weight') else None,
-            
-            # Testpalette
-            pallet_type=data.get('pallet_type'),
-            pallet_dimensions=data.get('pallet_dimensions'),
-            pallet_content=data.get('pallet_content'),
-            gross_weight=float(data['gross_weight']) if data.get('gross_weight') else None,
-            
-            # Wickelschema
-            windings_top=int(data['windings_top']) if data.get('windings_top') else None,
-            windings_middle=int(data['windings_middle']) if data.get('windings_middle') else None,
-            windings_bottom=int(data['windings_bottom']) if data.get('windings_bottom') else None,
-            prestretch_actual=float(data['prestretch_actual']) if data.get('prestretch_actual') else None,
-            
-            # Haltekräfte SOLL
-            holding_force_long_top_target=float(data['holding_force_long_top_target']) if data.get('holding_force_long_top_target') else None,
-            holding_force_long_bottom_target=float(data['holding_force_long_bottom_target']) if data.get('holding_force_long_bottom_target') else None,
-            holding_force_short_top_target=float(data['holding_force_short_top_target']) if data.get('holding_force_short_top_target') else None,
-            holding_force_short_bottom_target=float(data['holding_force_short_bottom_target']) if data.get('holding_force_short_bottom_target') else None,
-            
-            # Haltekräfte IST
-            holding_force_long_top_actual=float(data['holding_force_long_top_actual']) if data.get('holding_force_long_top_actual') else None,
-            holding_force_long_bottom_actual=float(data['holding_force_long_bottom_actual']) if data.get('holding_force_long_bottom_actual') else None,
-            holding_force_short_top_actual=float(data['holding_force_short_top_actual']) if data.get('holding_force_short_top_actual') else None,
-            holding_force_short_bottom_actual=float(data['holding_force_short_bottom_actual']) if data.get('holding_force_short_bottom_actual') else None,
-            
-            # Bewertung
-            holding_force_rating=data.get('holding_force_rating'),
-            eu_directive_compliant=bool(data.get('eu_directive_compliant', False)),
-            certificate_required=bool(data.get('certificate_required', False)),
-            
-            # Empfehlung
-            recommended_alternative=data.get('recommended_alternative'),
-            quality_improvement=bool(data.get('quality_improvement', False)),
-            holding_force_increase=bool(data.get('holding_force_increase', False)),
-            
-            # Fazit
-            conclusion_text=data.get('conclusion_text'),
-            recommendations_text=data.get('recommendations_text'),
-            next_steps_text=data.get('next_steps_text'),
-            implementation_timeframe=data.get('implementation_timeframe'),
-            training_required=bool(data.get('training_required', False)),
-            follow_up_required=bool(data.get('follow_up_required', False)),
-            
-            # Quintessenz
-            material_savings=float(data['material_savings']) if data.get('material_savings') else 0,
-            cost_reduction=float(data['cost_reduction']) if data.get('cost_reduction') else 0,
-            co2_reduction=float(data['co2_reduction']) if data.get('co2_reduction') else 0,
-            stability_increase=float(data['stability_increase']) if data.get('stability_increase') else 0,
-            
-            status=data.get('status', 'draft')
-        )
-        
-        # Alternativen setzen
-        if data.get('alternatives'):
-            report.set_alternatives(data['alternatives'])
-        
-        # Bilder setzen
-        if data.get('images'):
-            report.set_images(data['images'])
+        report = Report.from_values(values)
         
         # Berechnungen durchführen
         report.update_calculations()
@@ -138,12 +177,37 @@ def create_report():
         
         return jsonify(report.to_dict()), 201
         
+    except ValidationError as e:
+        return validation_error(e)
     except ValueError as e:
         return jsonify({'error': f'Ungültiger Wert: {str(e)}'}), 400
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+@report_bp.route('/api/reports/import', methods=['POST'])
+def import_reports():
+    """Berichte als CSV oder NDJSON importieren"""
+    try:
+        import_format = request.args.get('format')
+        if not import_format:
+            import_format = 'csv' if request.mimetype == 'text/csv' else 'ndjson'
+        if import_format not in ('csv', 'ndjson'):
+            return jsonify({'error': 'Ungültiges Format (csv oder ndjson)'}), 400
+        
+        chunk_size = request.args.get('chunk_size', report_import.DEFAULT_CHUNK_SIZE, type=int)
+        stream = io.TextIOWrapper(request.stream, encoding='utf-8-sig', newline='')
+        result = report_import.import_reports(
+            report_import.parse_rows(stream, import_format),
+            chunk_size=max(chunk_size, 1)
+        )
+        
+        return jsonify(result.to_dict()), 201 if result.imported_ids else 200
+        
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
 @report_bp.route('/api/reports/<int:report_id>', methods=['PUT'])
 def update_report(report_id):
     """Bericht aktualisieren"""
@@ -151,69 +215,8 @@ def update_report(report_id):
         report = Report.query.get_or_404(report_id)
         data = request.get_json()
         
-        # Aktualisierbare Felder
-        updatable_fields = [
-            'title', 'author', 'phone', 'email',
-            'production_site', 'robot_manufacturer', 'robot_model',
-            'film_type', 'film_thickness', 'film_supplier', 'max_prestretch',
-            'film_consumption_per_pallet', 'pallets_per_year', 'roll_core_weight',
-            'pallet_type', 'pallet_dimensions', 'pallet_content', 'gross_weight',
-            'windings_top', 'windings_middle', 'windings_bottom', 'prestretch_actual',
-            'holding_force_long_top_target', 'holding_force_long_bottom_target',
-            'holding_force_short_top_target', 'holding_force_short_bottom_target',
-            'holding_force_long_top_actual', 'holding_force_long_bottom_actual',
-            'holding_force_short_top_actual', 'holding_force_short_bottom_actual',
-            'holding_force_rating', 'eu_directive_compliant', 'certificate_required',
-            'recommended_alternative', 'quality_improvement', 'holding_force_increase',
-            'conclusion_text', 'recommendations_text', 'next_steps_text',
-            'implementation_timeframe', 'training_required', 'follow_up_required',
-            'material_savings', 'cost_reduction', 'co2_reduction', 'stability_increase',
-            'status'
-        ]
-        
-        # Felder aktualisieren
-        for field in updatable_fields:
-            if field in data:
-                value = data[field]
-                
-                # Typkonvertierung für numerische Felder
-                numeric_fields = [
-                    'film_thickness', 'max_prestretch', 'film_consumption_per_pallet',
-                    'pallets_per_year', 'roll_core_weight', 'gross_weight',
-                    'prestretch_actual', 'holding_force_long_top_target',
-                    'holding_force_long_bottom_target', 'holding_force_short_top_target',
-                    'holding_force_short_bottom_target', 'holding_force_long_top_actual',
-                    'holding_force_long_bottom_actual', 'holding_force_short_top_actual',
-                    'holding_force_short_bottom_actual', 'material_savings',
-                    'cost_reduction', 'co2_reduction', 'stability_increase'
-                ]
-                
-                integer_fields = [
-                    'pallets_per_year', 'windings_top', 'windings_middle', 'windings_bottom'
-                ]
-                
-                boolean_fields = [
-                    'eu_directive_compliant', 'certificate_required',
-                    'quality_improvement', 'holding_force_increase',
-                    'training_required', 'follow_up_required'
-                ]
-                
-                if field in boolean_fields:
-                    value = bool(value)
-                elif field in integer_fields and value is not None:
-                    value = int(value) if value != '' else None
-                elif field in numeric_fields and value is not None:
-                    value = float(value) if value != '' else None
-                
-                setattr(report, field, value)
-        
-        # Alternativen aktualisieren
-        if 'alternatives' in data:
-            report.set_alternatives(data['alternatives'])
-        
-        # Bilder aktualisieren
-        if 'images' in data:
-            report.set_images(data['images'])
+        # Felder, Alternativen und Bilder aktualisieren
+        REPORT_SCHEMA.apply(report, REPORT_SCHEMA.load(data, partial=True))
         
         # Berechnungen aktualisieren
         report.update_calculations()
@@ -223,6 +226,72 @@ def update_report(report_id):
         
         return jsonify(report.to_dict())
         
+    except StaleDataError:
+        db.session.rollback()
+        return jsonify({'error': 'Bericht wurde zwischenzeitlich geändert'}), 409
+    except ValidationError as e:
+        return validation_error(e)
+    except ValueError as e:
+        return jsonify({'error': f'Ungültiger Wert: {str(e)}'}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+def _expected_version(data):
+    """Erwartete Version aus If-Match-Header oder Feld 'version' (None = keine Prüfung)"""
+    if_match = request.headers.get('If-Match')
+    if if_match and if_match != '*':
+        return int(if_match.strip().removeprefix('W/').strip('"')), 412
+    if data.get('version') is not None:
+        return int(data['version']), 409
+    return None, None
+
+@report_bp.route('/api/reports/<int:report_id>', methods=['PATCH'])
+def patch_report(report_id):
+    """Bericht teilweise aktualisieren (JSON Merge Patch, RFC 7396)"""
+    try:
+        report = Report.query.get_or_404(report_id)
+        data = request.get_json(force=True, silent=True)
+        if not isinstance(data, dict):
+            return jsonify({'error': 'JSON-Objekt erwartet'}), 400
+        
+        unknown = REPORT_SCHEMA.unknown_fields(data, allowed=('version',))
+        if unknown:
+            return jsonify({'error': f'Feld {unknown[0]} kann nicht geändert werden'}), 400
+        
+        expected_version, conflict_status = _expected_version(data)
+        if expected_version is not None and expected_version != report.version:
+            return jsonify({'error': 'Bericht wurde zwischenzeitlich geändert', 'version': report.version}), conflict_status
+        
+        # Nur übermittelte Felder übernehmen (null löscht den Wert)
+        changed_fields = REPORT_SCHEMA.apply(report, REPORT_SCHEMA.load(data, partial=True))
+        
+        # Nur abhängige Berechnungen aktualisieren
+        recalculated = report.update_calculations_for(changed_fields)
+        if changed_fields:
+            report.updated_at = datetime.utcnow()
+        
+        db.session.commit()
+        
+        if 'return=minimal' in request.headers.get('Prefer', ''):
+            body = {
+                'id': report.id,
+                'version': report.version,
+                'updated_at': report.updated_at
+            }
+            body.update({field: getattr(report, field) for field in recalculated})
+        else:
+            body = report.to_dict()
+        
+        response = jsonify(body)
+        response.headers['ETag'] = f'"{report.version}"'
+        return response
+        
+    except StaleDataError:
+        db.session.rollback()
+        return jsonify({'error': 'Bericht wurde zwischenzeitlich geändert'}), 409
+    except ValidationError as e:
+        return validation_error(e)
     except ValueError as e:
         return jsonify({'error': f'Ungültiger Wert: {str(e)}'}), 400
     except Exception as e:
@@ -247,6 +316,9 @@ def update_report_status(report_id):
         
         return jsonify({'message': f'Status auf {new_status} aktualisiert'})
         
+    except StaleDataError:
+        db.session.rollback()
+        return jsonify({'error': 'Bericht wurde zwischenzeitlich geändert'}), 409
     except Exception as e:
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
@@ -267,13 +339,15 @@ def delete_report(report_id):
         return jsonify({'error': str(e)}), 500
 
 @report_bp.route('/api/reports/<int:report_id>/pdf', methods=['GET'])
+@read_only
 def generate_report_pdf(report_id):
     """PDF-Bericht generieren"""
     try:
         report = Report.query.get_or_404(report_id)
         
-        # PDF generieren
-        pdf_path = generate_enhanced_report_pdf(report)
+        # PDF generieren (begrenzte Anzahl gleichzeitig über alle Worker)
+        with render_limiter.slot():
+            pdf_path = render_executor.render_pdf(report)
         
         if not os.path.exists(pdf_path):
             return jsonify({'error': 'PDF konnte nicht generiert werden'}), 500
@@ -286,47 +360,125 @@ def generate_report_pdf(report_id):
             mimetype='application/pdf'
         )
         
+    except RenderBusy as e:
+        response = jsonify({'error': str(e), 'retry_after': e.retry_after})
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response, 503
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@report_bp.route('/api/reports/<int:report_id>/scenarios', methods=['POST'])
+@read_only
+def evaluate_report_scenarios(report_id):
+    """Raster aus Foliendicke × Vordehnung × Wickelschema bewerten (Pareto-optimale Szenarien)"""
+    try:
+        report = Report.query.get_or_404(report_id)
+        data = request.get_json(silent=True) or {}
+        
+        min_holding_force = data.get('min_holding_force')
+        result = scenarios.evaluate(
+            report,
+            film_thickness=data.get('film_thickness'),
+            prestretch=data.get('prestretch'),
+            windings=data.get('windings'),
+            only_feasible=bool(data.get('only_feasible', False)),
+            min_holding_force=float(min_holding_force) if min_holding_force is not None else None
+        )
+        return jsonify(result)
+        
+    except ValueError as e:
+        return jsonify({'error': f'Ungültiger Wert: {str(e)}'}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @report_bp.route('/api/reports/statistics', methods=['GET'])
+@read_only
 def get_report_statistics():
     """Berichtsstatistiken abrufen"""
     try:
-        total_reports = Report.query.count()
-        draft_reports = Report.query.filter_by(status='draft').count()
-        completed_reports = Report.query.filter_by(status='completed').count()
-        archived_reports = Report.query.filter_by(status='archived').count()
+        # Rollup-Zeile wird bei jeder Änderung inkrementell gepflegt (konstante Lesezeit)
+        return jsonify(get_statistics().to_dict())
         
-        # Durchschnittliche Einsparungen
-        avg_material_savings = db.session.query(db.func.avg(Report.material_savings)).filter(
-            Report.material_savings > 0
-        ).scalar() or 0
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@report_bp.route('/api/reports/alternatives/savings', methods=['GET'])
+@read_only
+def get_alternative_savings():
+    """Durchschnittliche Einsparungen je Wechsel der Foliendicke (IST -> Alternative)"""
+    try:
+        from_thickness = request.args.get('from_thickness', type=float)
+        to_thickness = request.args.get('to_thickness', type=float)
+        status = request.args.get('status')
+        customer_id = request.args.get('customer_id', type=int)
+        
+        current_thickness = Report.film_thickness
+        savings = (current_thickness - ReportAlternative.film_thickness) / current_thickness * 100
+        
+        query = db.session.query(
+            current_thickness.label('from_thickness'),
+            ReportAlternative.film_thickness.label('to_thickness'),
+            db.func.count(ReportAlternative.id).label('count'),
+            db.func.avg(savings).label('average_material_savings'),
+            db.func.avg(Report.total_material_consumption * savings / 100).label('average_annual_savings_kg'),
+            db.func.avg(ReportAlternative.prestretch).label('average_prestretch')
+        ).join(ReportAlternative, ReportAlternative.report_id == Report.id).filter(
+            current_thickness > 0,
+            ReportAlternative.film_thickness.isnot(None)
+        )
         
-        avg_cost_reduction = db.session.query(db.func.avg(Report.cost_reduction)).filter(
-            Report.cost_reduction > 0
-        ).scalar() or 0
+        if from_thickness is not None:
+            query = query.filter(current_thickness == from_thickness)
+        if to_thickness is not None:
+            query = query.filter(ReportAlternative.film_thickness == to_thickness)
+        if status:
+            query = query.filter(Report.status == status)
+        if customer_id:
+            query = query.filter(Report.customer_id == customer_id)
         
-        avg_co2_reduction = db.session.query(db.func.avg(Report.co2_reduction)).filter(
-            Report.co2_reduction > 0
-        ).scalar() or 0
+        rows = query.group_by(current_thickness, ReportAlternative.film_thickness).order_by(
+            current_thickness, ReportAlternative.film_thickness
+        ).all()
         
-        return jsonify({
-            'total_reports': total_reports,
-            'draft_reports': draft_reports,
-            'completed_reports': completed_reports,
-            'archived_reports': archived_reports,
-            'average_savings': {
-                'material_savings': round(avg_material_savings, 1),
-                'cost_reduction': round(avg_cost_reduction, 1),
-                'co2_reduction': round(avg_co2_reduction, 1)
-            }
-        })
+        return jsonify([{
+            'from_thickness': row.from_thickness,
+            'to_thickness': row.to_thickness,
+            'count': row.count,
+            'average_material_savings': round(row.average_material_savings or 0, 1),
+            'average_annual_savings_kg': round(row.average_annual_savings_kg or 0, 1),
+            'average_prestretch': round(row.average_prestretch, 1) if row.average_prestretch is not None else None
+        } for row in rows])
+        
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@report_bp.route('/api/reports/alternatives/stability', methods=['GET'])
+@read_only
+def get_alternative_stability():
+    """Verteilung der Palettenstabilität je Foliendicke der Alternativen"""
+    try:
+        rows = db.session.query(
+            ReportAlternative.film_thickness,
+            ReportAlternative.pallet_stability,
+            db.func.count(ReportAlternative.id)
+        ).filter(
+            ReportAlternative.film_thickness.isnot(None)
+        ).group_by(
+            ReportAlternative.film_thickness, ReportAlternative.pallet_stability
+        ).order_by(ReportAlternative.film_thickness).all()
+        
+        result = {}
+        for film_thickness, pallet_stability, count in rows:
+            entry = result.setdefault(film_thickness, {'film_thickness': film_thickness, 'pallet_stability': {}})
+            entry['pallet_stability'][pallet_stability or 'unbekannt'] = count
+        
+        return jsonify(list(result.values()))
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @report_bp.route('/api/reports/search', methods=['GET'])
+@read_only
 def search_reports():
     """Berichte suchen"""
     try:
@@ -334,7 +486,7 @@ def search_reports():
         status = request.args.get('status')
         customer_id = request.args.get('customer_id')
         
-        reports_query = Report.query
+        reports_query = Report.query.options(*LIST_LOAD_OPTIONS)
         
         if query:
             reports_query = reports_query.filter(
@@ -353,7 +505,9 @@ def search_reports():
         
         reports = reports_query.order_by(Report.created_at.desc()).all()
         
-        return jsonify([report.to_dict() for report in reports])
+        with span('report.to_dict', reports=len(reports)):
+            data = [report.to_dict() for report in reports]
+        return jsonify(data)
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -364,56 +518,11 @@ def duplicate_report(report_id):
     try:
         original_report = Report.query.get_or_404(report_id)
         
-        # Neuen Bericht basierend auf dem Original erstellen
-        new_report = Report(
-            customer_id=original_report.customer_id,
-            user_id=original_report.user_id,
-            title=f"{original_report.title} (Kopie)",
-            author=original_report.author,
-            phone=original_report.phone,
-            email=original_report.email,
-            production_site=original_report.production_site,
-            robot_manufacturer=original_report.robot_manufacturer,
-            robot_model=original_report.robot_model,
-            film_type=original_report.film_type,
-            film_thickness=original_report.film_thickness,
-            film_supplier=original_report.film_supplier,
-            max_prestretch=original_report.max_prestretch,
-            film_consumption_per_pallet=original_report.film_consumption_per_pallet,
-            pallets_per_year=original_report.pallets_per_year,
-            roll_core_weight=original_report.roll_core_weight,
-            pallet_type=original_report.pallet_type,
-            pallet_dimensions=original_report.pallet_dimensions,
-            pallet_content=original_report.pallet_content,
-            gross_weight=original_report.gross_weight,
-            windings_top=original_report.windings_top,
-            windings_middle=original_report.windings_middle,
-            windings_bottom=original_report.windings_bottom,
-            prestretch_actual=original_report.prestretch_actual,
-            holding_force_long_top_target=original_report.holding_force_long_top_target,
-            holding_force_long_bottom_target=original_report.holding_force_long_bottom_target,
-            holding_force_short_top_target=original_report.holding_force_short_top_target,
-            holding_force_short_bottom_target=original_report.holding_force_short_bottom_target,
-            holding_force_long_top_actual=original_report.holding_force_long_top_actual,
-            holding_force_long_bottom_actual=original_report.holding_force_long_bottom_actual,
-            holding_force_short_top_actual=original_report.holding_force_short_top_actual,
-            holding_force_short_bottom_actual=original_report.holding_force_short_bottom_actual,
-            holding_force_rating=original_report.holding_force_rating,
-            eu_directive_compliant=original_report.eu_directive_compliant,
-            certificate_required=original_report.certificate_required,
-            alternatives=original_report.alternatives,
-            recommended_alternative=original_report.recommended_alternative,
-            quality_improvement=original_report.quality_improvement,
-            holding_force_increase=original_report.holding_force_increase,
-            conclusion_text=original_report.conclusion_text,
-            recommendations_text=original_report.recommendations_text,
-            next_steps_text=original_report.next_steps_text,
-            implementation_timeframe=original_report.implementation_timeframe,
-            training_required=original_report.training_required,
-            follow_up_required=original_report.follow_up_required,
-            images=original_report.images,
-            status='draft'  # Neue Berichte sind immer Entwürfe
-        )
+        # Neuen Bericht basierend auf dem Original erstellen (ohne Auftragsnummer)
+        values = REPORT_SCHEMA.copy_values(original_report, exclude=('audit_number',) + Report.QUINTESSENZ_OUTPUTS)
+        values['title'] = f"{original_report.title} (Kopie)"
+        values['status'] = 'draft'  # Neue Berichte sind immer Entwürfe
+        new_report = Report.from_values(values)
         
         # Berechnungen durchführen
         new_report.update_calculations()
@@ -427,3 +536,70 @@ def duplicate_report(report_id):
         db.session.rollback()
         return jsonify({'error': str(e)}), 500
 
+
+def _id_list(value):
+    """Liste von Bericht-IDs aus dem Request-Body"""
+    if not isinstance(value, list) or not value:
+        raise ValueError('ids muss eine nicht-leere Liste sein')
+    return [int(report_id) for report_id in value]
+
+@report_bp.route('/api/reports/bulk/duplicate', methods=['POST'])
+def bulk_duplicate_reports():
+    """Mehrere Berichte serverseitig duplizieren (INSERT … SELECT)"""
+    try:
+        data = request.get_json() or {}
+        report_ids = _id_list(data.get('ids'))
+        
+        pairs = report_bulk.duplicate_reports(db.session.connection(), report_ids)
+        db.session.commit()
+        
+        return jsonify({
+            'duplicated': len(pairs),
+            'ids': [new_id for _, new_id in pairs],
+            'mapping': [{'source_id': source_id, 'id': new_id} for source_id, new_id in pairs]
+        }), 201
+        
+    except (TypeError, ValueError) as e:
+        db.session.rollback()
+        return jsonify({'error': f'Ungültiger Wert: {str(e)}'}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
+
+@report_bp.route('/api/reports/bulk/status', methods=['POST'])
+def bulk_update_report_status():
+    """Status mehrerer Berichte mit einem UPDATE ändern (per IDs und/oder Filter)"""
+    try:
+        data = request.get_json() or {}
+        
+        new_status = data.get('status')
+        if new_status not in ['draft', 'completed', 'archived']:
+            return jsonify({'error': 'Ungültiger Status'}), 400
+        
+        filters = data.get('filter') or {}
+        if 'ids' not in data and not filters:
+            return jsonify({'error': 'ids oder filter ist erforderlich'}), 400
+        
+        criteria = report_bulk.status_criteria(
+            report_ids=_id_list(data['ids']) if 'ids' in data else None,
+            status=filters.get('status'),
+            customer_id=filters.get('customer_id'),
+            created_from=datetime.fromisoformat(filters['created_from']) if filters.get('created_from') else None,
+            created_to=datetime.fromisoformat(filters['created_to']) if filters.get('created_to') else None
+        )
+        
+        ids = report_bulk.transition_status(db.session.connection(), new_status, *criteria)
+        db.session.commit()
+        
+        return jsonify({
+            'message': f'Status von {len(ids)} Berichten auf {new_status} aktualisiert',
+            'updated': len(ids),
+            'ids': ids
+        })
+        
+    except (TypeError, ValueError) as e:
+        db.session.rollback()
+        return jsonify({'error': f'Ungültiger Wert: {str(e)}'}), 400
+    except Exception as e:
+        db.session.rollback()
+        return jsonify({'error': str(e)}), 500
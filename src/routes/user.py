@@ -1,6 +1,8 @@
 from flask import Blueprint, request, jsonify, session
 from src import db
 from src.models.user import User
+from src.utils.auth import (REFRESH, TokenError, bearer_token, current_identity, issue_tokens,
+                            revoke_token, revoke_user_tokens, role_required, start_session, verify_token)
 from datetime import datetime
 
 user_bp = Blueprint('user', __name__)
@@ -26,13 +28,13 @@ def login():
         user.update_last_login()
         db.session.commit()
         
-        # Store user in session
-        session['user_id'] = user.id
-        session['username'] = user.username
+        # Store signed tokens in the session; API clients use the returned pair
+        start_session(user)
         
         return jsonify({
             'message': 'Login successful',
-            'user': user.to_dict()
+            'user': user.to_dict(),
+            **issue_tokens(user)
         })
         
     except Exception as e:
@@ -42,11 +44,49 @@ def login():
 def logout():
     """User logout"""
     try:
+        data = request.get_json(silent=True) or {}
+        for token in (bearer_token(), session.get('access_token')):
+            if token:
+                revoke_token(token)
+        for token in (data.get('refresh_token'), session.get('refresh_token')):
+            if token:
+                revoke_token(token, REFRESH)
+        
         session.clear()
         return jsonify({'message': 'Logout successful'})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@user_bp.route('/auth/refresh', methods=['POST'])
+def refresh():
+    """Exchange a refresh token for a new token pair"""
+    try:
+        data = request.get_json(silent=True) or {}
+        from_session = not data.get('refresh_token')
+        token = session.get('refresh_token') if from_session else data['refresh_token']
+        if not token:
+            return jsonify({'error': 'Refresh token is required'}), 400
+        
+        try:
+            identity = verify_token(token, REFRESH)
+        except TokenError as e:
+            return jsonify({'error': str(e)}), 401
+        
+        # Role and active flag are re-read here, not on every request
+        user = User.query.get(identity.user_id)
+        if not user or not user.is_active:
+            return jsonify({'error': 'Account is deactivated'}), 401
+        
+        # Refresh tokens are single use
+        revoke_token(token, REFRESH)
+        if from_session:
+            start_session(user)
+            return jsonify({'message': 'Session refreshed', 'user': user.to_dict()})
+        
+        return jsonify({'user': user.to_dict(), **issue_tokens(user)})
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
 @user_bp.route('/auth/register', methods=['POST'])
 def register():
     """Register new user"""
@@ -82,10 +122,11 @@ def register():
 def get_current_user():
     """Get current logged in user"""
     try:
-        if 'user_id' not in session:
+        identity = current_identity()
+        if identity is None:
             return jsonify({'error': 'Not authenticated'}), 401
         
-        user = User.query.get(session['user_id'])
+        user = User.query.get(identity.user_id)
         if not user:
             session.clear()
             return jsonify({'error': 'User not found'}), 404
@@ -96,16 +137,10 @@ def get_current_user():
         return jsonify({'error': str(e)}), 500
 
 @user_bp.route('/users', methods=['GET'])
+@role_required('Admin', 'Manager')
 def get_users():
     """Get all users (admin only)"""
     try:
-        if 'user_id' not in session:
-            return jsonify({'error': 'Not authenticated'}), 401
-        
-        current_user = User.query.get(session['user_id'])
-        if not current_user or current_user.role not in ['Admin', 'Manager']:
-            return jsonify({'error': 'Insufficient permissions'}), 403
-        
         users = User.query.all()
         return jsonify([user.to_dict() for user in users])
         
@@ -116,15 +151,12 @@ def get_users():
 def update_user(user_id):
     """Update user"""
     try:
-        if 'user_id' not in session:
+        current_user = current_identity()
+        if current_user is None:
             return jsonify({'error': 'Not authenticated'}), 401
         
-        current_user = User.query.get(session['user_id'])
-        if not current_user:
-            return jsonify({'error': 'User not found'}), 404
-        
         # Users can update their own profile, admins can update all
-        if current_user.id != user_id and current_user.role != 'Admin':
+        if current_user.user_id != user_id and current_user.role != 'Admin':
             return jsonify({'error': 'Insufficient permissions'}), 403
         
         user = User.query.get_or_404(user_id)
@@ -143,12 +175,19 @@ def update_user(user_id):
                 setattr(user, field, data[field])
         
         # Handle password change
-        if 'password' in data and data['password']:
+        password_changed = 'password' in data and bool(data['password'])
+        if password_changed:
             user.set_password(data['password'])
         
         user.updated_at = datetime.utcnow()
         db.session.commit()
         
+        # Tokens carry role and active flag: invalidate the ones already issued
+        if password_changed or any(field in data for field in ('role', 'is_active') if field in allowed_fields):
+            revoke_user_tokens(user.id)
+            if user.id == current_user.user_id and user.is_active:
+                start_session(user)
+        
         return jsonify(user.to_dict())
         
     except Exception as e:
@@ -1,203 +0,0 @@
-function Ob(a,r){for(var u=0;u<r.length;u++){const c=r[u];if(typeof c!="string"&&!Array.isArray(c)){for(const f in c)if(f!=="default"&&!(f in a)){const d=Object.getOwnPropertyDescriptor(c,f);d&&Object.defineProperty(a,f,d.get?d:{enumerable:!0,get:()=>c[f]})}}}return Object.freeze(Object.defineProperty(a,Symbol.toStringTag,{value:"Module"}))}(function(){const r=document.createElement("link").relList;if(r&&r.supports&&r.supports("modulepreload"))return;for(const f of document.querySelectorAll('link[rel="modulepreload"]'))c(f);new MutationObserver(f=>{for(const d of f)if(d.type==="childList")for(const m of d.addedNodes)m.tagName==="LINK"&&m.rel==="modulepreload"&&c(m)}).observe(document,{childList:!0,subtree:!0});function u(f){const d={};return f.integrity&&(d.integrity=f.integrity),f.referrerPolicy&&(d.referrerPolicy=f.referrerPolicy),f.crossOrigin==="use-credentials"?d.credentials="include":f.crossOrigin==="anonymous"?d.credentials="omit":d.credentials="same-origin",d}function c(f){if(f.ep)return;f.ep=!0;const d=u(f);fetch(f.href,d)}})();function Hv(a){return a&&a.__esModule&&Object.prototype.hasOwnProperty.call(a,"default")?a.default:a}var $u={exports:{}},Bi={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Zm;function Mb(){if(Zm)return Bi;Zm=1;var a=Symbol.for("react.transitional.element"),r=Symbol.for("react.fragment");function u(c,f,d){var m=null;if(d!==void 0&&(m=""+d),f.key!==void 0&&(m=""+f.key),"key"in f){d={};for(var g in f)g!=="key"&&(d[g]=f[g])}else d=f;return f=d.ref,{$$typeof:a,type:c,key:m,ref:f!==void 0?f:null,props:d}}return Bi.Fragment=r,Bi.jsx=u,Bi.jsxs=u,Bi}var Fm;function Db(){return Fm||(Fm=1,$u.exports=Mb()),$u.exports}var s=Db(),Wu={exports:{}},pe={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Jm;function zb(){if(Jm)return pe;Jm=1;var a=Symbol.for("react.transitional.element"),r=Symbol.for("react.portal"),u=Symbol.for("react.fragment"),c=Symbol.for("react.strict_mode"),f=Symbol.for("react.profiler"),d=Symbol.for("react.consumer"),m=Symbol.for("react.context"),g=Symbol.for("react.forward_ref"),y=Symbol.for("react.suspense"),v=Symbol.for("react.memo"),b=Symbol.for("react.lazy"),_=Symbol.iterator;function A(T){return T===null||typeof T!="object"?null:(T=_&&T[_]||T["@@iterator"],typeof T=="function"?T:null)}var C={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},w=Object.assign,x={};function N(T,V,P){this.props=T,this.context=V,this.refs=x,this.updater=P||C}N.prototype.isReactComponent={},N.prototype.setState=function(T,V){if(typeof T!="object"&&typeof T!="function"&&T!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,T,V,"setState")},N.prototype.forceUpdate=function(T){this.updater.enqueueForceUpdate(this,T,"forceUpdate")};function z(){}z.prototype=N.prototype;function U(T,V,P){this.props=T,this.context=V,this.refs=x,this.updater=P||C}var B=U.prototype=new z;B.constructor=U,w(B,N.prototype),B.isPureReactComponent=!0;var X=Array.isArray,G={H:null,A:null,T:null,S:null,V:null},W=Object.prototype.hasOwnProperty;function J(T,V,P,F,I,he){return P=he.ref,{$$typeof:a,type:T,key:V,ref:P!==void 0?P:null,props:he}}function Q(T,V){return J(T.type,V,void 0,void 0,void 0,T.props)}function ce(T){return typeof T=="object"&&T!==null&&T.$$typeof===a}function me(T){var V={"=":"=0",":":"=2"};return"$"+T.replace(/[=:]/g,function(P){return V[P]})}var ve=/\/+/g;function fe(T,V){return typeof T=="object"&&T!==null&&T.key!=null?me(""+T.key):V.toString(36)}function ge(){}function ye(T){switch(T.status){case"fulfilled":return T.value;case"rejected":throw T.reason;default:switch(typeof T.status=="string"?T.then(ge,ge):(T.status="pending",T.then(function(V){T.status==="pending"&&(T.status="fulfilled",T.value=V)},function(V){T.status==="pending"&&(T.status="rejected",T.reason=V)})),T.status){case"fulfilled":return T.value;case"rejected":throw T.reason}}throw T}function re(T,V,P,F,I){var he=typeof T;(he==="undefined"||he==="boolean")&&(T=null);var ie=!1;if(T===null)ie=!0;else switch(he){case"bigint":case"string":case"number":ie=!0;break;case"object":switch(T.$$typeof){case a:case r:ie=!0;break;case b:return ie=T._init,re(ie(T._payload),V,P,F,I)}}if(ie)return I=I(T),ie=F===""?"."+fe(T,0):F,X(I)?(P="",ie!=null&&(P=ie.replace(ve,"$&/")+"/"),re(I,V,P,"",function(ze){return ze})):I!=null&&(ce(I)&&(I=Q(I,P+(I.key==null||T&&T.key===I.key?"":(""+I.key).replace(ve,"$&/")+"/")+ie)),V.push(I)),1;ie=0;var $=F===""?".":F+":";if(X(T))for(var oe=0;oe<T.length;oe++)F=T[oe],he=$+fe(F,oe),ie+=re(F,V,P,he,I);else if(oe=A(T),typeof oe=="function")for(T=oe.call(T),oe=0;!(F=T.next()).done;)F=F.value,he=$+fe(F,oe++),ie+=re(F,V,P,he,I);else if(he==="object"){if(typeof T.then=="function")return re(ye(T),V,P,F,I);throw V=String(T),Error("Objects are not valid as a React child (found: "+(V==="[object Object]"?"object with keys {"+Object.keys(T).join(", ")+"}":V)+"). If you meant to render a collection of children, use an array instead.")}return ie}function O(T,V,P){if(T==null)return T;var F=[],I=0;return re(T,F,"","",function(he){return V.call(P,he,I++)}),F}function Z(T){if(T._status===-1){var V=T._result;V=V(),V.then(function(P){(T._status===0||T._status===-1)&&(T._status=1,T._result=P)},function(P){(T._status===0||T._status===-1)&&(T._status=2,T._result=P)}),T._status===-1&&(T._status=0,T._result=V)}if(T._status===1)return T._result.default;throw T._result}var L=typeof reportError=="function"?reportError:function(T){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var V=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof T=="object"&&T!==null&&typeof T.message=="string"?String(T.message):String(T),error:T});if(!window.dispatchEvent(V))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",T);return}console.error(T)};function le(){}return pe.Children={map:O,forEach:function(T,V,P){O(T,function(){V.apply(this,arguments)},P)},count:function(T){var V=0;return O(T,function(){V++}),V},toArray:function(T){return O(T,function(V){return V})||[]},only:function(T){if(!ce(T))throw Error("React.Children.only expected to receive a single React element child.");return T}},pe.Component=N,pe.Fragment=u,pe.Profiler=f,pe.PureComponent=U,pe.StrictMode=c,pe.Suspense=y,pe.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=G,pe.__COMPILER_RUNTIME={__proto__:null,c:function(T){return G.H.useMemoCache(T)}},pe.cache=function(T){return function(){return T.apply(null,arguments)}},pe.cloneElement=function(T,V,P){if(T==null)throw Error("The argument must be a React element, but you passed "+T+".");var F=w({},T.props),I=T.key,he=void 0;if(V!=null)for(ie in V.ref!==void 0&&(he=void 0),V.key!==void 0&&(I=""+V.key),V)!W.call(V,ie)||ie==="key"||ie==="__self"||ie==="__source"||ie==="ref"&&V.ref===void 0||(F[ie]=V[ie]);var ie=arguments.length-2;if(ie===1)F.children=P;else if(1<ie){for(var $=Array(ie),oe=0;oe<ie;oe++)$[oe]=arguments[oe+2];F.children=$}return J(T.type,I,void 0,void 0,he,F)},pe.createContext=function(T){return T={$$typeof:m,_currentValue:T,_currentValue2:T,_threadCount:0,Provider:null,Consumer:null},T.Provider=T,T.Consumer={$$typeof:d,_context:T},T},pe.createElement=function(T,V,P){var F,I={},he=null;if(V!=null)for(F in V.key!==void 0&&(he=""+V.key),V)W.call(V,F)&&F!=="key"&&F!=="__self"&&F!=="__source"&&(I[F]=V[F]);var ie=arguments.length-2;if(ie===1)I.children=P;else if(1<ie){for(var $=Array(ie),oe=0;oe<ie;oe++)$[oe]=arguments[oe+2];I.children=$}if(T&&T.defaultProps)for(F in ie=T.defaultProps,ie)I[F]===void 0&&(I[F]=ie[F]);return J(T,he,void 0,void 0,null,I)},pe.createRef=function(){return{current:null}},pe.forwardRef=function(T){return{$$typeof:g,render:T}},pe.isValidElement=ce,pe.lazy=function(T){return{$$typeof:b,_payload:{_status:-1,_result:T},_init:Z}},pe.memo=function(T,V){return{$$typeof:v,type:T,compare:V===void 0?null:V}},pe.startTransition=function(T){var V=G.T,P={};G.T=P;try{var F=T(),I=G.S;I!==null&&I(P,F),typeof F=="object"&&F!==null&&typeof F.then=="function"&&F.then(le,L)}catch(he){L(he)}finally{G.T=V}},pe.unstable_useCacheRefresh=function(){return G.H.useCacheRefresh()},pe.use=function(T){return G.H.use(T)},pe.useActionState=function(T,V,P){return G.H.useActionState(T,V,P)},pe.useCallback=function(T,V){return G.H.useCallback(T,V)},pe.useContext=function(T){return G.H.useContext(T)},pe.useDebugValue=function(){},pe.useDeferredValue=function(T,V){return G.H.useDeferredValue(T,V)},pe.useEffect=function(T,V,P){var F=G.H;if(typeof P=="function")throw Error("useEffect CRUD overload is not enabled in this build of React.");return F.useEffect(T,V)},pe.useId=function(){return G.H.useId()},pe.useImperativeHandle=function(T,V,P){return G.H.useImperativeHandle(T,V,P)},pe.useInsertionEffect=function(T,V){return G.H.useInsertionEffect(T,V)},pe.useLayoutEffect=function(T,V){return G.H.useLayoutEffect(T,V)},pe.useMemo=function(T,V){return G.H.useMemo(T,V)},pe.useOptimistic=function(T,V){return G.H.useOptimistic(T,V)},pe.useReducer=function(T,V,P){return G.H.useReducer(T,V,P)},pe.useRef=function(T){return G.H.useRef(T)},pe.useState=function(T){return G.H.useState(T)},pe.useSyncExternalStore=function(T,V,P){return G.H.useSyncExternalStore(T,V,P)},pe.useTransition=function(){return G.H.useTransition()},pe.version="19.1.0",pe}var Pm;function Ds(){return Pm||(Pm=1,Wu.exports=zb()),Wu.exports}var S=Ds();const ll=Hv(S),Lv=Ob({__proto__:null,default:ll},[S]);var Iu={exports:{}},Hi={},es={exports:{}},ts={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var $m;function kb(){return $m||($m=1,function(a){function r(O,Z){var L=O.length;O.push(Z);e:for(;0<L;){var le=L-1>>>1,T=O[le];if(0<f(T,Z))O[le]=Z,O[L]=T,L=le;else break e}}function u(O){return O.length===0?null:O[0]}function c(O){if(O.length===0)return null;var Z=O[0],L=O.pop();if(L!==Z){O[0]=L;e:for(var le=0,T=O.length,V=T>>>1;le<V;){var P=2*(le+1)-1,F=O[P],I=P+1,he=O[I];if(0>f(F,L))I<T&&0>f(he,F)?(O[le]=he,O[I]=L,le=I):(O[le]=F,O[P]=L,le=P);else if(I<T&&0>f(he,L))O[le]=he,O[I]=L,le=I;else break e}}return Z}function f(O,Z){var L=O.sortIndex-Z.sortIndex;return L!==0?L:O.id-Z.id}if(a.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var d=performance;a.unstable_now=function(){return d.now()}}else{var m=Date,g=m.now();a.unstable_now=function(){return m.now()-g}}var y=[],v=[],b=1,_=null,A=3,C=!1,w=!1,x=!1,N=!1,z=typeof setTimeout=="function"?setTimeout:null,U=typeof clearTimeout=="function"?clearTimeout:null,B=typeof setImmediate<"u"?setImmediate:null;function X(O){for(var Z=u(v);Z!==null;){if(Z.callback===null)c(v);else if(Z.startTime<=O)c(v),Z.sortIndex=Z.expirationTime,r(y,Z);else break;Z=u(v)}}function G(O){if(x=!1,X(O),!w)if(u(y)!==null)w=!0,W||(W=!0,fe());else{var Z=u(v);Z!==null&&re(G,Z.startTime-O)}}var W=!1,J=-1,Q=5,ce=-1;function me(){return N?!0:!(a.unstable_now()-ce<Q)}function ve(){if(N=!1,W){var O=a.unstable_now();ce=O;var Z=!0;try{e:{w=!1,x&&(x=!1,U(J),J=-1),C=!0;var L=A;try{t:{for(X(O),_=u(y);_!==null&&!(_.expirationTime>O&&me());){var le=_.callback;if(typeof le=="function"){_.callback=null,A=_.priorityLevel;var T=le(_.expirationTime<=O);if(O=a.unstable_now(),typeof T=="function"){_.callback=T,X(O),Z=!0;break t}_===u(y)&&c(y),X(O)}else c(y);_=u(y)}if(_!==null)Z=!0;else{var V=u(v);V!==null&&re(G,V.startTime-O),Z=!1}}break e}finally{_=null,A=L,C=!1}Z=void 0}}finally{Z?fe():W=!1}}}var fe;if(typeof B=="function")fe=function(){B(ve)};else if(typeof MessageChannel<"u"){var ge=new MessageChannel,ye=ge.port2;ge.port1.onmessage=ve,fe=function(){ye.postMessage(null)}}else fe=function(){z(ve,0)};function re(O,Z){J=z(function(){O(a.unstable_now())},Z)}a.unstable_IdlePriority=5,a.unstable_ImmediatePriority=1,a.unstable_LowPriority=4,a.unstable_NormalPriority=3,a.unstable_Profiling=null,a.unstable_UserBlockingPriority=2,a.unstable_cancelCallback=function(O){O.callback=null},a.unstable_forceFrameRate=function(O){0>O||125<O?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):Q=0<O?Math.floor(1e3/O):5},a.unstable_getCurrentPriorityLevel=function(){return A},a.unstable_next=function(O){switch(A){case 1:case 2:case 3:var Z=3;break;default:Z=A}var L=A;A=Z;try{return O()}finally{A=L}},a.unstable_requestPaint=function(){N=!0},a.unstable_runWithPriority=function(O,Z){switch(O){case 1:case 2:case 3:case 4:case 5:break;default:O=3}var L=A;A=O;try{return Z()}finally{A=L}},a.unstable_scheduleCallback=function(O,Z,L){var le=a.unstable_now();switch(typeof L=="object"&&L!==null?(L=L.delay,L=typeof L=="number"&&0<L?le+L:le):L=le,O){case 1:var T=-1;break;case 2:T=250;break;case 5:T=1073741823;break;case 4:T=1e4;break;default:T=5e3}return T=L+T,O={id:b++,callback:Z,priorityLevel:O,startTime:L,expirationTime:T,sortIndex:-1},L>le?(O.sortIndex=L,r(v,O),u(y)===null&&O===u(v)&&(x?(U(J),J=-1):x=!0,re(G,L-le))):(O.sortIndex=T,r(y,O),w||C||(w=!0,W||(W=!0,fe()))),O},a.unstable_shouldYield=me,a.unstable_wrapCallback=function(O){var Z=A;return function(){var L=A;A=Z;try{return O.apply(this,arguments)}finally{A=L}}}}(ts)),ts}var Wm;function Ub(){return Wm||(Wm=1,es.exports=kb()),es.exports}var ns={exports:{}},ht={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Im;function Bb(){if(Im)return ht;Im=1;var a=Ds();function r(y){var v="https://react.dev/errors/"+y;if(1<arguments.length){v+="?args[]="+encodeURIComponent(arguments[1]);for(var b=2;b<arguments.length;b++)v+="&args[]="+encodeURIComponent(arguments[b])}return"Minified React error #"+y+"; visit "+v+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function u(){}var c={d:{f:u,r:function(){throw Error(r(522))},D:u,C:u,L:u,m:u,X:u,S:u,M:u},p:0,findDOMNode:null},f=Symbol.for("react.portal");function d(y,v,b){var _=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:f,key:_==null?null:""+_,children:y,containerInfo:v,implementation:b}}var m=a.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function g(y,v){if(y==="font")return"";if(typeof v=="string")return v==="use-credentials"?v:""}return ht.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=c,ht.createPortal=function(y,v){var b=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!v||v.nodeType!==1&&v.nodeType!==9&&v.nodeType!==11)throw Error(r(299));return d(y,v,null,b)},ht.flushSync=function(y){var v=m.T,b=c.p;try{if(m.T=null,c.p=2,y)return y()}finally{m.T=v,c.p=b,c.d.f()}},ht.preconnect=function(y,v){typeof y=="string"&&(v?(v=v.crossOrigin,v=typeof v=="string"?v==="use-credentials"?v:"":void 0):v=null,c.d.C(y,v))},ht.prefetchDNS=function(y){typeof y=="string"&&c.d.D(y)},ht.preinit=function(y,v){if(typeof y=="string"&&v&&typeof v.as=="string"){var b=v.as,_=g(b,v.crossOrigin),A=typeof v.integrity=="string"?v.integrity:void 0,C=typeof v.fetchPriority=="string"?v.fetchPriority:void 0;b==="style"?c.d.S(y,typeof v.precedence=="string"?v.precedence:void 0,{crossOrigin:_,integrity:A,fetchPriority:C}):b==="script"&&c.d.X(y,{crossOrigin:_,integrity:A,fetchPriority:C,nonce:typeof v.nonce=="string"?v.nonce:void 0})}},ht.preinitModule=function(y,v){if(typeof y=="string")if(typeof v=="object"&&v!==null){if(v.as==null||v.as==="script"){var b=g(v.as,v.crossOrigin);c.d.M(y,{crossOrigin:b,integrity:typeof v.integrity=="string"?v.integrity:void 0,nonce:typeof v.nonce=="string"?v.nonce:void 0})}}else v==null&&c.d.M(y)},ht.preload=function(y,v){if(typeof y=="string"&&typeof v=="object"&&v!==null&&typeof v.as=="string"){var b=v.as,_=g(b,v.crossOrigin);c.d.L(y,b,{crossOrigin:_,integrity:typeof v.integrity=="string"?v.integrity:void 0,nonce:typeof v.nonce=="string"?v.nonce:void 0,type:typeof v.type=="string"?v.type:void 0,fetchPriority:typeof v.fetchPriority=="string"?v.fetchPriority:void 0,referrerPolicy:typeof v.referrerPolicy=="string"?v.referrerPolicy:void 0,imageSrcSet:typeof v.imageSrcSet=="string"?v.imageSrcSet:void 0,imageSizes:typeof v.imageSizes=="string"?v.imageSizes:void 0,media:typeof v.media=="string"?v.media:void 0})}},ht.preloadModule=function(y,v){if(typeof y=="string")if(v){var b=g(v.as,v.crossOrigin);c.d.m(y,{as:typeof v.as=="string"&&v.as!=="script"?v.as:void 0,crossOrigin:b,integrity:typeof v.integrity=="string"?v.integrity:void 0})}else c.d.m(y)},ht.requestFormReset=function(y){c.d.r(y)},ht.unstable_batchedUpdates=function(y,v){return y(v)},ht.useFormState=function(y,v,b){return m.H.useFormState(y,v,b)},ht.useFormStatus=function(){return m.H.useHostTransitionStatus()},ht.version="19.1.0",ht}var ev;function qv(){if(ev)return ns.exports;ev=1;function a(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(a)}catch(r){console.error(r)}}return a(),ns.exports=Bb(),ns.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var tv;function Hb(){if(tv)return Hi;tv=1;var a=Ub(),r=Ds(),u=qv();function c(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var n=2;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function f(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function d(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,(t.flags&4098)!==0&&(n=t.return),e=t.return;while(e)}return t.tag===3?n:null}function m(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function g(e){if(d(e)!==e)throw Error(c(188))}function y(e){var t=e.alternate;if(!t){if(t=d(e),t===null)throw Error(c(188));return t!==e?null:e}for(var n=e,l=t;;){var i=n.return;if(i===null)break;var o=i.alternate;if(o===null){if(l=i.return,l!==null){n=l;continue}break}if(i.child===o.child){for(o=i.child;o;){if(o===n)return g(i),e;if(o===l)return g(i),t;o=o.sibling}throw Error(c(188))}if(n.return!==l.return)n=i,l=o;else{for(var h=!1,p=i.child;p;){if(p===n){h=!0,n=i,l=o;break}if(p===l){h=!0,l=i,n=o;break}p=p.sibling}if(!h){for(p=o.child;p;){if(p===n){h=!0,n=o,l=i;break}if(p===l){h=!0,l=o,n=i;break}p=p.sibling}if(!h)throw Error(c(189))}}if(n.alternate!==l)throw Error(c(190))}if(n.tag!==3)throw Error(c(188));return n.stateNode.current===n?e:t}function v(e){var t=e.tag;if(t===5||t===26||t===27||t===6)return e;for(e=e.child;e!==null;){if(t=v(e),t!==null)return t;e=e.sibling}return null}var b=Object.assign,_=Symbol.for("react.element"),A=Symbol.for("react.transitional.element"),C=Symbol.for("react.portal"),w=Symbol.for("react.fragment"),x=Symbol.for("react.strict_mode"),N=Symbol.for("react.profiler"),z=Symbol.for("react.provider"),U=Symbol.for("react.consumer"),B=Symbol.for("react.context"),X=Symbol.for("react.forward_ref"),G=Symbol.for("react.suspense"),W=Symbol.for("react.suspense_list"),J=Symbol.for("react.memo"),Q=Symbol.for("react.lazy"),ce=Symbol.for("react.activity"),me=Symbol.for("react.memo_cache_sentinel"),ve=Symbol.iterator;function fe(e){return e===null||typeof e!="object"?null:(e=ve&&e[ve]||e["@@iterator"],typeof e=="function"?e:null)}var ge=Symbol.for("react.client.reference");function ye(e){if(e==null)return null;if(typeof e=="function")return e.$$typeof===ge?null:e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case w:return"Fragment";case N:return"Profiler";case x:return"StrictMode";case G:return"Suspense";case W:return"SuspenseList";case ce:return"Activity"}if(typeof e=="object")switch(e.$$typeof){case C:return"Portal";case B:return(e.displayName||"Context")+".Provider";case U:return(e._context.displayName||"Context")+".Consumer";case X:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case J:return t=e.displayName||null,t!==null?t:ye(e.type)||"Memo";case Q:t=e._payload,e=e._init;try{return ye(e(t))}catch{}}return null}var re=Array.isArray,O=r.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,Z=u.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,L={pending:!1,data:null,method:null,action:null},le=[],T=-1;function V(e){return{current:e}}function P(e){0>T||(e.current=le[T],le[T]=null,T--)}function F(e,t){T++,le[T]=e.current,e.current=t}var I=V(null),he=V(null),ie=V(null),$=V(null);function oe(e,t){switch(F(ie,t),F(he,e),F(I,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?Sm(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)t=Sm(t),e=wm(t,e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}P(I),F(I,e)}function ze(){P(I),P(he),P(ie)}function Ne(e){e.memoizedState!==null&&F($,e);var t=I.current,n=wm(t,e.type);t!==n&&(F(he,e),F(I,n))}function we(e){he.current===e&&(P(I),P(he)),$.current===e&&(P($),Mi._currentValue=L)}var _e=Object.prototype.hasOwnProperty,rt=a.unstable_scheduleCallback,pt=a.unstable_cancelCallback,dl=a.unstable_shouldYield,hl=a.unstable_requestPaint,st=a.unstable_now,Lo=a.unstable_getCurrentPriorityLevel,ml=a.unstable_ImmediatePriority,tf=a.unstable_UserBlockingPriority,Zi=a.unstable_NormalPriority,dy=a.unstable_LowPriority,nf=a.unstable_IdlePriority,hy=a.log,my=a.unstable_setDisableYieldValue,qa=null,_t=null;function Mn(e){if(typeof hy=="function"&&my(e),_t&&typeof _t.setStrictMode=="function")try{_t.setStrictMode(qa,e)}catch{}}var Et=Math.clz32?Math.clz32:py,vy=Math.log,gy=Math.LN2;function py(e){return e>>>=0,e===0?32:31-(vy(e)/gy|0)|0}var Fi=256,Ji=4194304;function vl(e){var t=e&42;if(t!==0)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194048;case 4194304:case 8388608:case 16777216:case 33554432:return e&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function Pi(e,t,n){var l=e.pendingLanes;if(l===0)return 0;var i=0,o=e.suspendedLanes,h=e.pingedLanes;e=e.warmLanes;var p=l&134217727;return p!==0?(l=p&~o,l!==0?i=vl(l):(h&=p,h!==0?i=vl(h):n||(n=p&~e,n!==0&&(i=vl(n))))):(p=l&~o,p!==0?i=vl(p):h!==0?i=vl(h):n||(n=l&~e,n!==0&&(i=vl(n)))),i===0?0:t!==0&&t!==i&&(t&o)===0&&(o=i&-i,n=t&-t,o>=n||o===32&&(n&4194048)!==0)?t:i}function Ga(e,t){return(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)===0}function yy(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function lf(){var e=Fi;return Fi<<=1,(Fi&4194048)===0&&(Fi=256),e}function af(){var e=Ji;return Ji<<=1,(Ji&62914560)===0&&(Ji=4194304),e}function qo(e){for(var t=[],n=0;31>n;n++)t.push(e);return t}function Va(e,t){e.pendingLanes|=t,t!==268435456&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function by(e,t,n,l,i,o){var h=e.pendingLanes;e.pendingLanes=n,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=n,e.entangledLanes&=n,e.errorRecoveryDisabledLanes&=n,e.shellSuspendCounter=0;var p=e.entanglements,E=e.expirationTimes,D=e.hiddenUpdates;for(n=h&~n;0<n;){var q=31-Et(n),K=1<<q;p[q]=0,E[q]=-1;var k=D[q];if(k!==null)for(D[q]=null,q=0;q<k.length;q++){var H=k[q];H!==null&&(H.lane&=-536870913)}n&=~K}l!==0&&rf(e,l,0),o!==0&&i===0&&e.tag!==0&&(e.suspendedLanes|=o&~(h&~t))}function rf(e,t,n){e.pendingLanes|=t,e.suspendedLanes&=~t;var l=31-Et(t);e.entangledLanes|=t,e.entanglements[l]=e.entanglements[l]|1073741824|n&4194090}function of(e,t){var n=e.entangledLanes|=t;for(e=e.entanglements;n;){var l=31-Et(n),i=1<<l;i&t|e[l]&t&&(e[l]|=t),n&=~i}}function Go(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function Vo(e){return e&=-e,2<e?8<e?(e&134217727)!==0?32:268435456:8:2}function cf(){var e=Z.p;return e!==0?e:(e=window.event,e===void 0?32:Gm(e.type))}function xy(e,t){var n=Z.p;try{return Z.p=e,t()}finally{Z.p=n}}var Dn=Math.random().toString(36).slice(2),ft="__reactFiber$"+Dn,yt="__reactProps$"+Dn,Ll="__reactContainer$"+Dn,Yo="__reactEvents$"+Dn,Sy="__reactListeners$"+Dn,wy="__reactHandles$"+Dn,uf="__reactResources$"+Dn,Ya="__reactMarker$"+Dn;function Xo(e){delete e[ft],delete e[yt],delete e[Yo],delete e[Sy],delete e[wy]}function ql(e){var t=e[ft];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Ll]||n[ft]){if(n=t.alternate,t.child!==null||n!==null&&n.child!==null)for(e=Tm(e);e!==null;){if(n=e[ft])return n;e=Tm(e)}return t}e=n,n=e.parentNode}return null}function Gl(e){if(e=e[ft]||e[Ll]){var t=e.tag;if(t===5||t===6||t===13||t===26||t===27||t===3)return e}return null}function Xa(e){var t=e.tag;if(t===5||t===26||t===27||t===6)return e.stateNode;throw Error(c(33))}function Vl(e){var t=e[uf];return t||(t=e[uf]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function tt(e){e[Ya]=!0}var sf=new Set,ff={};function gl(e,t){Yl(e,t),Yl(e+"Capture",t)}function Yl(e,t){for(ff[e]=t,e=0;e<t.length;e++)sf.add(t[e])}var _y=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),df={},hf={};function Ey(e){return _e.call(hf,e)?!0:_e.call(df,e)?!1:_y.test(e)?hf[e]=!0:(df[e]=!0,!1)}function $i(e,t,n){if(Ey(t))if(n===null)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":e.removeAttribute(t);return;case"boolean":var l=t.toLowerCase().slice(0,5);if(l!=="data-"&&l!=="aria-"){e.removeAttribute(t);return}}e.setAttribute(t,""+n)}}function Wi(e,t,n){if(n===null)e.removeAttribute(t);else{switch(typeof n){case"undefined":case"function":case"symbol":case"boolean":e.removeAttribute(t);return}e.setAttribute(t,""+n)}}function hn(e,t,n,l){if(l===null)e.removeAttribute(n);else{switch(typeof l){case"undefined":case"function":case"symbol":case"boolean":e.removeAttribute(n);return}e.setAttributeNS(t,n,""+l)}}var Ko,mf;function Xl(e){if(Ko===void 0)try{throw Error()}catch(n){var t=n.stack.trim().match(/\n( *(at )?)/);Ko=t&&t[1]||"",mf=-1<n.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<n.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+Ko+e+mf}var Qo=!1;function Zo(e,t){if(!e||Qo)return"";Qo=!0;var n=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var l={DetermineComponentFrameRoot:function(){try{if(t){var K=function(){throw Error()};if(Object.defineProperty(K.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(K,[])}catch(H){var k=H}Reflect.construct(e,[],K)}else{try{K.call()}catch(H){k=H}e.call(K.prototype)}}else{try{throw Error()}catch(H){k=H}(K=e())&&typeof K.catch=="function"&&K.catch(function(){})}}catch(H){if(H&&k&&typeof H.stack=="string")return[H.stack,k.stack]}return[null,null]}};l.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var i=Object.getOwnPropertyDescriptor(l.DetermineComponentFrameRoot,"name");i&&i.configurable&&Object.defineProperty(l.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var o=l.DetermineComponentFrameRoot(),h=o[0],p=o[1];if(h&&p){var E=h.split(`
-`),D=p.split(`
-`);for(i=l=0;l<E.length&&!E[l].includes("DetermineComponentFrameRoot");)l++;for(;i<D.length&&!D[i].includes("DetermineComponentFrameRoot");)i++;if(l===E.length||i===D.length)for(l=E.length-1,i=D.length-1;1<=l&&0<=i&&E[l]!==D[i];)i--;for(;1<=l&&0<=i;l--,i--)if(E[l]!==D[i]){if(l!==1||i!==1)do if(l--,i--,0>i||E[l]!==D[i]){var q=`
-`+E[l].replace(" at new "," at ");return e.displayName&&q.includes("<anonymous>")&&(q=q.replace("<anonymous>",e.displayName)),q}while(1<=l&&0<=i);break}}}finally{Qo=!1,Error.prepareStackTrace=n}return(n=e?e.displayName||e.name:"")?Xl(n):""}function Ay(e){switch(e.tag){case 26:case 27:case 5:return Xl(e.type);case 16:return Xl("Lazy");case 13:return Xl("Suspense");case 19:return Xl("SuspenseList");case 0:case 15:return Zo(e.type,!1);case 11:return Zo(e.type.render,!1);case 1:return Zo(e.type,!0);case 31:return Xl("Activity");default:return""}}function vf(e){try{var t="";do t+=Ay(e),e=e.return;while(e);return t}catch(n){return`
-Error generating stack: `+n.message+`
-`+n.stack}}function qt(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function gf(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function Ty(e){var t=gf(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),l=""+e[t];if(!e.hasOwnProperty(t)&&typeof n<"u"&&typeof n.get=="function"&&typeof n.set=="function"){var i=n.get,o=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(h){l=""+h,o.call(this,h)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return l},setValue:function(h){l=""+h},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function Ii(e){e._valueTracker||(e._valueTracker=Ty(e))}function pf(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),l="";return e&&(l=gf(e)?e.checked?"true":"false":e.value),e=l,e!==n?(t.setValue(e),!0):!1}function er(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}var jy=/[\n"\\]/g;function Gt(e){return e.replace(jy,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function Fo(e,t,n,l,i,o,h,p){e.name="",h!=null&&typeof h!="function"&&typeof h!="symbol"&&typeof h!="boolean"?e.type=h:e.removeAttribute("type"),t!=null?h==="number"?(t===0&&e.value===""||e.value!=t)&&(e.value=""+qt(t)):e.value!==""+qt(t)&&(e.value=""+qt(t)):h!=="submit"&&h!=="reset"||e.removeAttribute("value"),t!=null?Jo(e,h,qt(t)):n!=null?Jo(e,h,qt(n)):l!=null&&e.removeAttribute("value"),i==null&&o!=null&&(e.defaultChecked=!!o),i!=null&&(e.checked=i&&typeof i!="function"&&typeof i!="symbol"),p!=null&&typeof p!="function"&&typeof p!="symbol"&&typeof p!="boolean"?e.name=""+qt(p):e.removeAttribute("name")}function yf(e,t,n,l,i,o,h,p){if(o!=null&&typeof o!="function"&&typeof o!="symbol"&&typeof o!="boolean"&&(e.type=o),t!=null||n!=null){if(!(o!=="submit"&&o!=="reset"||t!=null))return;n=n!=null?""+qt(n):"",t=t!=null?""+qt(t):n,p||t===e.value||(e.value=t),e.defaultValue=t}l=l??i,l=typeof l!="function"&&typeof l!="symbol"&&!!l,e.checked=p?e.checked:!!l,e.defaultChecked=!!l,h!=null&&typeof h!="function"&&typeof h!="symbol"&&typeof h!="boolean"&&(e.name=h)}function Jo(e,t,n){t==="number"&&er(e.ownerDocument)===e||e.defaultValue===""+n||(e.defaultValue=""+n)}function Kl(e,t,n,l){if(e=e.options,t){t={};for(var i=0;i<n.length;i++)t["$"+n[i]]=!0;for(n=0;n<e.length;n++)i=t.hasOwnProperty("$"+e[n].value),e[n].selected!==i&&(e[n].selected=i),i&&l&&(e[n].defaultSelected=!0)}else{for(n=""+qt(n),t=null,i=0;i<e.length;i++){if(e[i].value===n){e[i].selected=!0,l&&(e[i].defaultSelected=!0);return}t!==null||e[i].disabled||(t=e[i])}t!==null&&(t.selected=!0)}}function bf(e,t,n){if(t!=null&&(t=""+qt(t),t!==e.value&&(e.value=t),n==null)){e.defaultValue!==t&&(e.defaultValue=t);return}e.defaultValue=n!=null?""+qt(n):""}function xf(e,t,n,l){if(t==null){if(l!=null){if(n!=null)throw Error(c(92));if(re(l)){if(1<l.length)throw Error(c(93));l=l[0]}n=l}n==null&&(n=""),t=n}n=qt(t),e.defaultValue=n,l=e.textContent,l===n&&l!==""&&l!==null&&(e.value=l)}function Ql(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&n.nodeType===3){n.nodeValue=t;return}}e.textContent=t}var Ny=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function Sf(e,t,n){var l=t.indexOf("--")===0;n==null||typeof n=="boolean"||n===""?l?e.setProperty(t,""):t==="float"?e.cssFloat="":e[t]="":l?e.setProperty(t,n):typeof n!="number"||n===0||Ny.has(t)?t==="float"?e.cssFloat=n:e[t]=(""+n).trim():e[t]=n+"px"}function wf(e,t,n){if(t!=null&&typeof t!="object")throw Error(c(62));if(e=e.style,n!=null){for(var l in n)!n.hasOwnProperty(l)||t!=null&&t.hasOwnProperty(l)||(l.indexOf("--")===0?e.setProperty(l,""):l==="float"?e.cssFloat="":e[l]="");for(var i in t)l=t[i],t.hasOwnProperty(i)&&n[i]!==l&&Sf(e,i,l)}else for(var o in t)t.hasOwnProperty(o)&&Sf(e,o,t[o])}function Po(e){if(e.indexOf("-")===-1)return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var Cy=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),Ry=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function tr(e){return Ry.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var $o=null;function Wo(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var Zl=null,Fl=null;function _f(e){var t=Gl(e);if(t&&(e=t.stateNode)){var n=e[yt]||null;e:switch(e=t.stateNode,t.type){case"input":if(Fo(e,n.value,n.defaultValue,n.defaultValue,n.checked,n.defaultChecked,n.type,n.name),t=n.name,n.type==="radio"&&t!=null){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll('input[name="'+Gt(""+t)+'"][type="radio"]'),t=0;t<n.length;t++){var l=n[t];if(l!==e&&l.form===e.form){var i=l[yt]||null;if(!i)throw Error(c(90));Fo(l,i.value,i.defaultValue,i.defaultValue,i.checked,i.defaultChecked,i.type,i.name)}}for(t=0;t<n.length;t++)l=n[t],l.form===e.form&&pf(l)}break e;case"textarea":bf(e,n.value,n.defaultValue);break e;case"select":t=n.value,t!=null&&Kl(e,!!n.multiple,t,!1)}}}var Io=!1;function Ef(e,t,n){if(Io)return e(t,n);Io=!0;try{var l=e(t);return l}finally{if(Io=!1,(Zl!==null||Fl!==null)&&(qr(),Zl&&(t=Zl,e=Fl,Fl=Zl=null,_f(t),e)))for(t=0;t<e.length;t++)_f(e[t])}}function Ka(e,t){var n=e.stateNode;if(n===null)return null;var l=n[yt]||null;if(l===null)return null;n=l[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(l=!l.disabled)||(e=e.type,l=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!l;break e;default:e=!1}if(e)return null;if(n&&typeof n!="function")throw Error(c(231,t,typeof n));return n}var mn=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),ec=!1;if(mn)try{var Qa={};Object.defineProperty(Qa,"passive",{get:function(){ec=!0}}),window.addEventListener("test",Qa,Qa),window.removeEventListener("test",Qa,Qa)}catch{ec=!1}var zn=null,tc=null,nr=null;function Af(){if(nr)return nr;var e,t=tc,n=t.length,l,i="value"in zn?zn.value:zn.textContent,o=i.length;for(e=0;e<n&&t[e]===i[e];e++);var h=n-e;for(l=1;l<=h&&t[n-l]===i[o-l];l++);return nr=i.slice(e,1<l?1-l:void 0)}function lr(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function ar(){return!0}function Tf(){return!1}function bt(e){function t(n,l,i,o,h){this._reactName=n,this._targetInst=i,this.type=l,this.nativeEvent=o,this.target=h,this.currentTarget=null;for(var p in e)e.hasOwnProperty(p)&&(n=e[p],this[p]=n?n(o):o[p]);return this.isDefaultPrevented=(o.defaultPrevented!=null?o.defaultPrevented:o.returnValue===!1)?ar:Tf,this.isPropagationStopped=Tf,this}return b(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var n=this.nativeEvent;n&&(n.preventDefault?n.preventDefault():typeof n.returnValue!="unknown"&&(n.returnValue=!1),this.isDefaultPrevented=ar)},stopPropagation:function(){var n=this.nativeEvent;n&&(n.stopPropagation?n.stopPropagation():typeof n.cancelBubble!="unknown"&&(n.cancelBubble=!0),this.isPropagationStopped=ar)},persist:function(){},isPersistent:ar}),t}var pl={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},ir=bt(pl),Za=b({},pl,{view:0,detail:0}),Oy=bt(Za),nc,lc,Fa,rr=b({},Za,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:ic,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==Fa&&(Fa&&e.type==="mousemove"?(nc=e.screenX-Fa.screenX,lc=e.screenY-Fa.screenY):lc=nc=0,Fa=e),nc)},movementY:function(e){return"movementY"in e?e.movementY:lc}}),jf=bt(rr),My=b({},rr,{dataTransfer:0}),Dy=bt(My),zy=b({},Za,{relatedTarget:0}),ac=bt(zy),ky=b({},pl,{animationName:0,elapsedTime:0,pseudoElement:0}),Uy=bt(ky),By=b({},pl,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Hy=bt(By),Ly=b({},pl,{data:0}),Nf=bt(Ly),qy={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Gy={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},Vy={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Yy(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=Vy[e])?!!t[e]:!1}function ic(){return Yy}var Xy=b({},Za,{key:function(e){if(e.key){var t=qy[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=lr(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?Gy[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:ic,charCode:function(e){return e.type==="keypress"?lr(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?lr(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),Ky=bt(Xy),Qy=b({},rr,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),Cf=bt(Qy),Zy=b({},Za,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:ic}),Fy=bt(Zy),Jy=b({},pl,{propertyName:0,elapsedTime:0,pseudoElement:0}),Py=bt(Jy),$y=b({},rr,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Wy=bt($y),Iy=b({},pl,{newState:0,oldState:0}),e0=bt(Iy),t0=[9,13,27,32],rc=mn&&"CompositionEvent"in window,Ja=null;mn&&"documentMode"in document&&(Ja=document.documentMode);var n0=mn&&"TextEvent"in window&&!Ja,Rf=mn&&(!rc||Ja&&8<Ja&&11>=Ja),Of=" ",Mf=!1;function Df(e,t){switch(e){case"keyup":return t0.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function zf(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var Jl=!1;function l0(e,t){switch(e){case"compositionend":return zf(t);case"keypress":return t.which!==32?null:(Mf=!0,Of);case"textInput":return e=t.data,e===Of&&Mf?null:e;default:return null}}function a0(e,t){if(Jl)return e==="compositionend"||!rc&&Df(e,t)?(e=Af(),nr=tc=zn=null,Jl=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return Rf&&t.locale!=="ko"?null:t.data;default:return null}}var i0={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function kf(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!i0[e.type]:t==="textarea"}function Uf(e,t,n,l){Zl?Fl?Fl.push(l):Fl=[l]:Zl=l,t=Qr(t,"onChange"),0<t.length&&(n=new ir("onChange","change",null,n,l),e.push({event:n,listeners:t}))}var Pa=null,$a=null;function r0(e){gm(e,0)}function or(e){var t=Xa(e);if(pf(t))return e}function Bf(e,t){if(e==="change")return t}var Hf=!1;if(mn){var oc;if(mn){var cc="oninput"in document;if(!cc){var Lf=document.createElement("div");Lf.setAttribute("oninput","return;"),cc=typeof Lf.oninput=="function"}oc=cc}else oc=!1;Hf=oc&&(!document.documentMode||9<document.documentMode)}function qf(){Pa&&(Pa.detachEvent("onpropertychange",Gf),$a=Pa=null)}function Gf(e){if(e.propertyName==="value"&&or($a)){var t=[];Uf(t,$a,e,Wo(e)),Ef(r0,t)}}function o0(e,t,n){e==="focusin"?(qf(),Pa=t,$a=n,Pa.attachEvent("onpropertychange",Gf)):e==="focusout"&&qf()}function c0(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return or($a)}function u0(e,t){if(e==="click")return or(t)}function s0(e,t){if(e==="input"||e==="change")return or(t)}function f0(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var At=typeof Object.is=="function"?Object.is:f0;function Wa(e,t){if(At(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var n=Object.keys(e),l=Object.keys(t);if(n.length!==l.length)return!1;for(l=0;l<n.length;l++){var i=n[l];if(!_e.call(t,i)||!At(e[i],t[i]))return!1}return!0}function Vf(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Yf(e,t){var n=Vf(e);e=0;for(var l;n;){if(n.nodeType===3){if(l=e+n.textContent.length,e<=t&&l>=t)return{node:n,offset:t-e};e=l}e:{for(;n;){if(n.nextSibling){n=n.nextSibling;break e}n=n.parentNode}n=void 0}n=Vf(n)}}function Xf(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?Xf(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Kf(e){e=e!=null&&e.ownerDocument!=null&&e.ownerDocument.defaultView!=null?e.ownerDocument.defaultView:window;for(var t=er(e.document);t instanceof e.HTMLIFrameElement;){try{var n=typeof t.contentWindow.location.href=="string"}catch{n=!1}if(n)e=t.contentWindow;else break;t=er(e.document)}return t}function uc(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}var d0=mn&&"documentMode"in document&&11>=document.documentMode,Pl=null,sc=null,Ia=null,fc=!1;function Qf(e,t,n){var l=n.window===n?n.document:n.nodeType===9?n:n.ownerDocument;fc||Pl==null||Pl!==er(l)||(l=Pl,"selectionStart"in l&&uc(l)?l={start:l.selectionStart,end:l.selectionEnd}:(l=(l.ownerDocument&&l.ownerDocument.defaultView||window).getSelection(),l={anchorNode:l.anchorNode,anchorOffset:l.anchorOffset,focusNode:l.focusNode,focusOffset:l.focusOffset}),Ia&&Wa(Ia,l)||(Ia=l,l=Qr(sc,"onSelect"),0<l.length&&(t=new ir("onSelect","select",null,t,n),e.push({event:t,listeners:l}),t.target=Pl)))}function yl(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var $l={animationend:yl("Animation","AnimationEnd"),animationiteration:yl("Animation","AnimationIteration"),animationstart:yl("Animation","AnimationStart"),transitionrun:yl("Transition","TransitionRun"),transitionstart:yl("Transition","TransitionStart"),transitioncancel:yl("Transition","TransitionCancel"),transitionend:yl("Transition","TransitionEnd")},dc={},Zf={};mn&&(Zf=document.createElement("div").style,"AnimationEvent"in window||(delete $l.animationend.animation,delete $l.animationiteration.animation,delete $l.animationstart.animation),"TransitionEvent"in window||delete $l.transitionend.transition);function bl(e){if(dc[e])return dc[e];if(!$l[e])return e;var t=$l[e],n;for(n in t)if(t.hasOwnProperty(n)&&n in Zf)return dc[e]=t[n];return e}var Ff=bl("animationend"),Jf=bl("animationiteration"),Pf=bl("animationstart"),h0=bl("transitionrun"),m0=bl("transitionstart"),v0=bl("transitioncancel"),$f=bl("transitionend"),Wf=new Map,hc="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");hc.push("scrollEnd");function Jt(e,t){Wf.set(e,t),gl(t,[e])}var If=new WeakMap;function Vt(e,t){if(typeof e=="object"&&e!==null){var n=If.get(e);return n!==void 0?n:(t={value:e,source:t,stack:vf(t)},If.set(e,t),t)}return{value:e,source:t,stack:vf(t)}}var Yt=[],Wl=0,mc=0;function cr(){for(var e=Wl,t=mc=Wl=0;t<e;){var n=Yt[t];Yt[t++]=null;var l=Yt[t];Yt[t++]=null;var i=Yt[t];Yt[t++]=null;var o=Yt[t];if(Yt[t++]=null,l!==null&&i!==null){var h=l.pending;h===null?i.next=i:(i.next=h.next,h.next=i),l.pending=i}o!==0&&ed(n,i,o)}}function ur(e,t,n,l){Yt[Wl++]=e,Yt[Wl++]=t,Yt[Wl++]=n,Yt[Wl++]=l,mc|=l,e.lanes|=l,e=e.alternate,e!==null&&(e.lanes|=l)}function vc(e,t,n,l){return ur(e,t,n,l),sr(e)}function Il(e,t){return ur(e,null,null,t),sr(e)}function ed(e,t,n){e.lanes|=n;var l=e.alternate;l!==null&&(l.lanes|=n);for(var i=!1,o=e.return;o!==null;)o.childLanes|=n,l=o.alternate,l!==null&&(l.childLanes|=n),o.tag===22&&(e=o.stateNode,e===null||e._visibility&1||(i=!0)),e=o,o=o.return;return e.tag===3?(o=e.stateNode,i&&t!==null&&(i=31-Et(n),e=o.hiddenUpdates,l=e[i],l===null?e[i]=[t]:l.push(t),t.lane=n|536870912),o):null}function sr(e){if(50<Ei)throw Ei=0,Su=null,Error(c(185));for(var t=e.return;t!==null;)e=t,t=e.return;return e.tag===3?e.stateNode:null}var ea={};function g0(e,t,n,l){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=l,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function Tt(e,t,n,l){return new g0(e,t,n,l)}function gc(e){return e=e.prototype,!(!e||!e.isReactComponent)}function vn(e,t){var n=e.alternate;return n===null?(n=Tt(e.tag,t,e.key,e.mode),n.elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.type=e.type,n.flags=0,n.subtreeFlags=0,n.deletions=null),n.flags=e.flags&65011712,n.childLanes=e.childLanes,n.lanes=e.lanes,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n.refCleanup=e.refCleanup,n}function td(e,t){e.flags&=65011714;var n=e.alternate;return n===null?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=n.childLanes,e.lanes=n.lanes,e.child=n.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=n.memoizedProps,e.memoizedState=n.memoizedState,e.updateQueue=n.updateQueue,e.type=n.type,t=n.dependencies,e.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function fr(e,t,n,l,i,o){var h=0;if(l=e,typeof e=="function")gc(e)&&(h=1);else if(typeof e=="string")h=yb(e,n,I.current)?26:e==="html"||e==="head"||e==="body"?27:5;else e:switch(e){case ce:return e=Tt(31,n,t,i),e.elementType=ce,e.lanes=o,e;case w:return xl(n.children,i,o,t);case x:h=8,i|=24;break;case N:return e=Tt(12,n,t,i|2),e.elementType=N,e.lanes=o,e;case G:return e=Tt(13,n,t,i),e.elementType=G,e.lanes=o,e;case W:return e=Tt(19,n,t,i),e.elementType=W,e.lanes=o,e;default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case z:case B:h=10;break e;case U:h=9;break e;case X:h=11;break e;case J:h=14;break e;case Q:h=16,l=null;break e}h=29,n=Error(c(130,e===null?"null":typeof e,"")),l=null}return t=Tt(h,n,t,i),t.elementType=e,t.type=l,t.lanes=o,t}function xl(e,t,n,l){return e=Tt(7,e,l,t),e.lanes=n,e}function pc(e,t,n){return e=Tt(6,e,null,t),e.lanes=n,e}function yc(e,t,n){return t=Tt(4,e.children!==null?e.children:[],e.key,t),t.lanes=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var ta=[],na=0,dr=null,hr=0,Xt=[],Kt=0,Sl=null,gn=1,pn="";function wl(e,t){ta[na++]=hr,ta[na++]=dr,dr=e,hr=t}function nd(e,t,n){Xt[Kt++]=gn,Xt[Kt++]=pn,Xt[Kt++]=Sl,Sl=e;var l=gn;e=pn;var i=32-Et(l)-1;l&=~(1<<i),n+=1;var o=32-Et(t)+i;if(30<o){var h=i-i%5;o=(l&(1<<h)-1).toString(32),l>>=h,i-=h,gn=1<<32-Et(t)+i|n<<i|l,pn=o+e}else gn=1<<o|n<<i|l,pn=e}function bc(e){e.return!==null&&(wl(e,1),nd(e,1,0))}function xc(e){for(;e===dr;)dr=ta[--na],ta[na]=null,hr=ta[--na],ta[na]=null;for(;e===Sl;)Sl=Xt[--Kt],Xt[Kt]=null,pn=Xt[--Kt],Xt[Kt]=null,gn=Xt[--Kt],Xt[Kt]=null}var gt=null,Qe=null,De=!1,_l=null,nn=!1,Sc=Error(c(519));function El(e){var t=Error(c(418,""));throw ni(Vt(t,e)),Sc}function ld(e){var t=e.stateNode,n=e.type,l=e.memoizedProps;switch(t[ft]=e,t[yt]=l,n){case"dialog":Ae("cancel",t),Ae("close",t);break;case"iframe":case"object":case"embed":Ae("load",t);break;case"video":case"audio":for(n=0;n<Ti.length;n++)Ae(Ti[n],t);break;case"source":Ae("error",t);break;case"img":case"image":case"link":Ae("error",t),Ae("load",t);break;case"details":Ae("toggle",t);break;case"input":Ae("invalid",t),yf(t,l.value,l.defaultValue,l.checked,l.defaultChecked,l.type,l.name,!0),Ii(t);break;case"select":Ae("invalid",t);break;case"textarea":Ae("invalid",t),xf(t,l.value,l.defaultValue,l.children),Ii(t)}n=l.children,typeof n!="string"&&typeof n!="number"&&typeof n!="bigint"||t.textContent===""+n||l.suppressHydrationWarning===!0||xm(t.textContent,n)?(l.popover!=null&&(Ae("beforetoggle",t),Ae("toggle",t)),l.onScroll!=null&&Ae("scroll",t),l.onScrollEnd!=null&&Ae("scrollend",t),l.onClick!=null&&(t.onclick=Zr),t=!0):t=!1,t||El(e)}function ad(e){for(gt=e.return;gt;)switch(gt.tag){case 5:case 13:nn=!1;return;case 27:case 3:nn=!0;return;default:gt=gt.return}}function ei(e){if(e!==gt)return!1;if(!De)return ad(e),De=!0,!1;var t=e.tag,n;if((n=t!==3&&t!==27)&&((n=t===5)&&(n=e.type,n=!(n!=="form"&&n!=="button")||Bu(e.type,e.memoizedProps)),n=!n),n&&Qe&&El(e),ad(e),t===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(c(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8)if(n=e.data,n==="/$"){if(t===0){Qe=$t(e.nextSibling);break e}t--}else n!=="$"&&n!=="$!"&&n!=="$?"||t++;e=e.nextSibling}Qe=null}}else t===27?(t=Qe,Pn(e.type)?(e=Gu,Gu=null,Qe=e):Qe=t):Qe=gt?$t(e.stateNode.nextSibling):null;return!0}function ti(){Qe=gt=null,De=!1}function id(){var e=_l;return e!==null&&(wt===null?wt=e:wt.push.apply(wt,e),_l=null),e}function ni(e){_l===null?_l=[e]:_l.push(e)}var wc=V(null),Al=null,yn=null;function kn(e,t,n){F(wc,t._currentValue),t._currentValue=n}function bn(e){e._currentValue=wc.current,P(wc)}function _c(e,t,n){for(;e!==null;){var l=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,l!==null&&(l.childLanes|=t)):l!==null&&(l.childLanes&t)!==t&&(l.childLanes|=t),e===n)break;e=e.return}}function Ec(e,t,n,l){var i=e.child;for(i!==null&&(i.return=e);i!==null;){var o=i.dependencies;if(o!==null){var h=i.child;o=o.firstContext;e:for(;o!==null;){var p=o;o=i;for(var E=0;E<t.length;E++)if(p.context===t[E]){o.lanes|=n,p=o.alternate,p!==null&&(p.lanes|=n),_c(o.return,n,e),l||(h=null);break e}o=p.next}}else if(i.tag===18){if(h=i.return,h===null)throw Error(c(341));h.lanes|=n,o=h.alternate,o!==null&&(o.lanes|=n),_c(h,n,e),h=null}else h=i.child;if(h!==null)h.return=i;else for(h=i;h!==null;){if(h===e){h=null;break}if(i=h.sibling,i!==null){i.return=h.return,h=i;break}h=h.return}i=h}}function li(e,t,n,l){e=null;for(var i=t,o=!1;i!==null;){if(!o){if((i.flags&524288)!==0)o=!0;else if((i.flags&262144)!==0)break}if(i.tag===10){var h=i.alternate;if(h===null)throw Error(c(387));if(h=h.memoizedProps,h!==null){var p=i.type;At(i.pendingProps.value,h.value)||(e!==null?e.push(p):e=[p])}}else if(i===$.current){if(h=i.alternate,h===null)throw Error(c(387));h.memoizedState.memoizedState!==i.memoizedState.memoizedState&&(e!==null?e.push(Mi):e=[Mi])}i=i.return}e!==null&&Ec(t,e,n,l),t.flags|=262144}function mr(e){for(e=e.firstContext;e!==null;){if(!At(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function Tl(e){Al=e,yn=null,e=e.dependencies,e!==null&&(e.firstContext=null)}function dt(e){return rd(Al,e)}function vr(e,t){return Al===null&&Tl(e),rd(e,t)}function rd(e,t){var n=t._currentValue;if(t={context:t,memoizedValue:n,next:null},yn===null){if(e===null)throw Error(c(308));yn=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else yn=yn.next=t;return n}var p0=typeof AbortController<"u"?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(n,l){e.push(l)}};this.abort=function(){t.aborted=!0,e.forEach(function(n){return n()})}},y0=a.unstable_scheduleCallback,b0=a.unstable_NormalPriority,We={$$typeof:B,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function Ac(){return{controller:new p0,data:new Map,refCount:0}}function ai(e){e.refCount--,e.refCount===0&&y0(b0,function(){e.controller.abort()})}var ii=null,Tc=0,la=0,aa=null;function x0(e,t){if(ii===null){var n=ii=[];Tc=0,la=Nu(),aa={status:"pending",value:void 0,then:function(l){n.push(l)}}}return Tc++,t.then(od,od),t}function od(){if(--Tc===0&&ii!==null){aa!==null&&(aa.status="fulfilled");var e=ii;ii=null,la=0,aa=null;for(var t=0;t<e.length;t++)(0,e[t])()}}function S0(e,t){var n=[],l={status:"pending",value:null,reason:null,then:function(i){n.push(i)}};return e.then(function(){l.status="fulfilled",l.value=t;for(var i=0;i<n.length;i++)(0,n[i])(t)},function(i){for(l.status="rejected",l.reason=i,i=0;i<n.length;i++)(0,n[i])(void 0)}),l}var cd=O.S;O.S=function(e,t){typeof t=="object"&&t!==null&&typeof t.then=="function"&&x0(e,t),cd!==null&&cd(e,t)};var jl=V(null);function jc(){var e=jl.current;return e!==null?e:Ve.pooledCache}function gr(e,t){t===null?F(jl,jl.current):F(jl,t.pool)}function ud(){var e=jc();return e===null?null:{parent:We._currentValue,pool:e}}var ri=Error(c(460)),sd=Error(c(474)),pr=Error(c(542)),Nc={then:function(){}};function fd(e){return e=e.status,e==="fulfilled"||e==="rejected"}function yr(){}function dd(e,t,n){switch(n=e[n],n===void 0?e.push(t):n!==t&&(t.then(yr,yr),t=n),t.status){case"fulfilled":return t.value;case"rejected":throw e=t.reason,md(e),e;default:if(typeof t.status=="string")t.then(yr,yr);else{if(e=Ve,e!==null&&100<e.shellSuspendCounter)throw Error(c(482));e=t,e.status="pending",e.then(function(l){if(t.status==="pending"){var i=t;i.status="fulfilled",i.value=l}},function(l){if(t.status==="pending"){var i=t;i.status="rejected",i.reason=l}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw e=t.reason,md(e),e}throw oi=t,ri}}var oi=null;function hd(){if(oi===null)throw Error(c(459));var e=oi;return oi=null,e}function md(e){if(e===ri||e===pr)throw Error(c(483))}var Un=!1;function Cc(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Rc(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function Bn(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function Hn(e,t,n){var l=e.updateQueue;if(l===null)return null;if(l=l.shared,(ke&2)!==0){var i=l.pending;return i===null?t.next=t:(t.next=i.next,i.next=t),l.pending=t,t=sr(e),ed(e,null,n),t}return ur(e,l,t,n),sr(e)}function ci(e,t,n){if(t=t.updateQueue,t!==null&&(t=t.shared,(n&4194048)!==0)){var l=t.lanes;l&=e.pendingLanes,n|=l,t.lanes=n,of(e,n)}}function Oc(e,t){var n=e.updateQueue,l=e.alternate;if(l!==null&&(l=l.updateQueue,n===l)){var i=null,o=null;if(n=n.firstBaseUpdate,n!==null){do{var h={lane:n.lane,tag:n.tag,payload:n.payload,callback:null,next:null};o===null?i=o=h:o=o.next=h,n=n.next}while(n!==null);o===null?i=o=t:o=o.next=t}else i=o=t;n={baseState:l.baseState,firstBaseUpdate:i,lastBaseUpdate:o,shared:l.shared,callbacks:l.callbacks},e.updateQueue=n;return}e=n.lastBaseUpdate,e===null?n.firstBaseUpdate=t:e.next=t,n.lastBaseUpdate=t}var Mc=!1;function ui(){if(Mc){var e=aa;if(e!==null)throw e}}function si(e,t,n,l){Mc=!1;var i=e.updateQueue;Un=!1;var o=i.firstBaseUpdate,h=i.lastBaseUpdate,p=i.shared.pending;if(p!==null){i.shared.pending=null;var E=p,D=E.next;E.next=null,h===null?o=D:h.next=D,h=E;var q=e.alternate;q!==null&&(q=q.updateQueue,p=q.lastBaseUpdate,p!==h&&(p===null?q.firstBaseUpdate=D:p.next=D,q.lastBaseUpdate=E))}if(o!==null){var K=i.baseState;h=0,q=D=E=null,p=o;do{var k=p.lane&-536870913,H=k!==p.lane;if(H?(Re&k)===k:(l&k)===k){k!==0&&k===la&&(Mc=!0),q!==null&&(q=q.next={lane:0,tag:p.tag,payload:p.payload,callback:null,next:null});e:{var de=e,ue=p;k=t;var Le=n;switch(ue.tag){case 1:if(de=ue.payload,typeof de=="function"){K=de.call(Le,K,k);break e}K=de;break e;case 3:de.flags=de.flags&-65537|128;case 0:if(de=ue.payload,k=typeof de=="function"?de.call(Le,K,k):de,k==null)break e;K=b({},K,k);break e;case 2:Un=!0}}k=p.callback,k!==null&&(e.flags|=64,H&&(e.flags|=8192),H=i.callbacks,H===null?i.callbacks=[k]:H.push(k))}else H={lane:k,tag:p.tag,payload:p.payload,callback:p.callback,next:null},q===null?(D=q=H,E=K):q=q.next=H,h|=k;if(p=p.next,p===null){if(p=i.shared.pending,p===null)break;H=p,p=H.next,H.next=null,i.lastBaseUpdate=H,i.shared.pending=null}}while(!0);q===null&&(E=K),i.baseState=E,i.firstBaseUpdate=D,i.lastBaseUpdate=q,o===null&&(i.shared.lanes=0),Qn|=h,e.lanes=h,e.memoizedState=K}}function vd(e,t){if(typeof e!="function")throw Error(c(191,e));e.call(t)}function gd(e,t){var n=e.callbacks;if(n!==null)for(e.callbacks=null,e=0;e<n.length;e++)vd(n[e],t)}var ia=V(null),br=V(0);function pd(e,t){e=Tn,F(br,e),F(ia,t),Tn=e|t.baseLanes}function Dc(){F(br,Tn),F(ia,ia.current)}function zc(){Tn=br.current,P(ia),P(br)}var Ln=0,be=null,Be=null,Pe=null,xr=!1,ra=!1,Nl=!1,Sr=0,fi=0,oa=null,w0=0;function Fe(){throw Error(c(321))}function kc(e,t){if(t===null)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!At(e[n],t[n]))return!1;return!0}function Uc(e,t,n,l,i,o){return Ln=o,be=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,O.H=e===null||e.memoizedState===null?eh:th,Nl=!1,o=n(l,i),Nl=!1,ra&&(o=bd(t,n,l,i)),yd(e),o}function yd(e){O.H=jr;var t=Be!==null&&Be.next!==null;if(Ln=0,Pe=Be=be=null,xr=!1,fi=0,oa=null,t)throw Error(c(300));e===null||nt||(e=e.dependencies,e!==null&&mr(e)&&(nt=!0))}function bd(e,t,n,l){be=e;var i=0;do{if(ra&&(oa=null),fi=0,ra=!1,25<=i)throw Error(c(301));if(i+=1,Pe=Be=null,e.updateQueue!=null){var o=e.updateQueue;o.lastEffect=null,o.events=null,o.stores=null,o.memoCache!=null&&(o.memoCache.index=0)}O.H=C0,o=t(n,l)}while(ra);return o}function _0(){var e=O.H,t=e.useState()[0];return t=typeof t.then=="function"?di(t):t,e=e.useState()[0],(Be!==null?Be.memoizedState:null)!==e&&(be.flags|=1024),t}function Bc(){var e=Sr!==0;return Sr=0,e}function Hc(e,t,n){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~n}function Lc(e){if(xr){for(e=e.memoizedState;e!==null;){var t=e.queue;t!==null&&(t.pending=null),e=e.next}xr=!1}Ln=0,Pe=Be=be=null,ra=!1,fi=Sr=0,oa=null}function xt(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return Pe===null?be.memoizedState=Pe=e:Pe=Pe.next=e,Pe}function $e(){if(Be===null){var e=be.alternate;e=e!==null?e.memoizedState:null}else e=Be.next;var t=Pe===null?be.memoizedState:Pe.next;if(t!==null)Pe=t,Be=e;else{if(e===null)throw be.alternate===null?Error(c(467)):Error(c(310));Be=e,e={memoizedState:Be.memoizedState,baseState:Be.baseState,baseQueue:Be.baseQueue,queue:Be.queue,next:null},Pe===null?be.memoizedState=Pe=e:Pe=Pe.next=e}return Pe}function qc(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function di(e){var t=fi;return fi+=1,oa===null&&(oa=[]),e=dd(oa,e,t),t=be,(Pe===null?t.memoizedState:Pe.next)===null&&(t=t.alternate,O.H=t===null||t.memoizedState===null?eh:th),e}function wr(e){if(e!==null&&typeof e=="object"){if(typeof e.then=="function")return di(e);if(e.$$typeof===B)return dt(e)}throw Error(c(438,String(e)))}function Gc(e){var t=null,n=be.updateQueue;if(n!==null&&(t=n.memoCache),t==null){var l=be.alternate;l!==null&&(l=l.updateQueue,l!==null&&(l=l.memoCache,l!=null&&(t={data:l.data.map(function(i){return i.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),n===null&&(n=qc(),be.updateQueue=n),n.memoCache=t,n=t.data[t.index],n===void 0)for(n=t.data[t.index]=Array(e),l=0;l<e;l++)n[l]=me;return t.index++,n}function xn(e,t){return typeof t=="function"?t(e):t}function _r(e){var t=$e();return Vc(t,Be,e)}function Vc(e,t,n){var l=e.queue;if(l===null)throw Error(c(311));l.lastRenderedReducer=n;var i=e.baseQueue,o=l.pending;if(o!==null){if(i!==null){var h=i.next;i.next=o.next,o.next=h}t.baseQueue=i=o,l.pending=null}if(o=e.baseState,i===null)e.memoizedState=o;else{t=i.next;var p=h=null,E=null,D=t,q=!1;do{var K=D.lane&-536870913;if(K!==D.lane?(Re&K)===K:(Ln&K)===K){var k=D.revertLane;if(k===0)E!==null&&(E=E.next={lane:0,revertLane:0,action:D.action,hasEagerState:D.hasEagerState,eagerState:D.eagerState,next:null}),K===la&&(q=!0);else if((Ln&k)===k){D=D.next,k===la&&(q=!0);continue}else K={lane:0,revertLane:D.revertLane,action:D.action,hasEagerState:D.hasEagerState,eagerState:D.eagerState,next:null},E===null?(p=E=K,h=o):E=E.next=K,be.lanes|=k,Qn|=k;K=D.action,Nl&&n(o,K),o=D.hasEagerState?D.eagerState:n(o,K)}else k={lane:K,revertLane:D.revertLane,action:D.action,hasEagerState:D.hasEagerState,eagerState:D.eagerState,next:null},E===null?(p=E=k,h=o):E=E.next=k,be.lanes|=K,Qn|=K;D=D.next}while(D!==null&&D!==t);if(E===null?h=o:E.next=p,!At(o,e.memoizedState)&&(nt=!0,q&&(n=aa,n!==null)))throw n;e.memoizedState=o,e.baseState=h,e.baseQueue=E,l.lastRenderedState=o}return i===null&&(l.lanes=0),[e.memoizedState,l.dispatch]}function Yc(e){var t=$e(),n=t.queue;if(n===null)throw Error(c(311));n.lastRenderedReducer=e;var l=n.dispatch,i=n.pending,o=t.memoizedState;if(i!==null){n.pending=null;var h=i=i.next;do o=e(o,h.action),h=h.next;while(h!==i);At(o,t.memoizedState)||(nt=!0),t.memoizedState=o,t.baseQueue===null&&(t.baseState=o),n.lastRenderedState=o}return[o,l]}function xd(e,t,n){var l=be,i=$e(),o=De;if(o){if(n===void 0)throw Error(c(407));n=n()}else n=t();var h=!At((Be||i).memoizedState,n);h&&(i.memoizedState=n,nt=!0),i=i.queue;var p=_d.bind(null,l,i,e);if(hi(2048,8,p,[e]),i.getSnapshot!==t||h||Pe!==null&&Pe.memoizedState.tag&1){if(l.flags|=2048,ca(9,Er(),wd.bind(null,l,i,n,t),null),Ve===null)throw Error(c(349));o||(Ln&124)!==0||Sd(l,t,n)}return n}function Sd(e,t,n){e.flags|=16384,e={getSnapshot:t,value:n},t=be.updateQueue,t===null?(t=qc(),be.updateQueue=t,t.stores=[e]):(n=t.stores,n===null?t.stores=[e]:n.push(e))}function wd(e,t,n,l){t.value=n,t.getSnapshot=l,Ed(t)&&Ad(e)}function _d(e,t,n){return n(function(){Ed(t)&&Ad(e)})}function Ed(e){var t=e.getSnapshot;e=e.value;try{var n=t();return!At(e,n)}catch{return!0}}function Ad(e){var t=Il(e,2);t!==null&&Ot(t,e,2)}function Xc(e){var t=xt();if(typeof e=="function"){var n=e;if(e=n(),Nl){Mn(!0);try{n()}finally{Mn(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:xn,lastRenderedState:e},t}function Td(e,t,n,l){return e.baseState=n,Vc(e,Be,typeof l=="function"?l:xn)}function E0(e,t,n,l,i){if(Tr(e))throw Error(c(485));if(e=t.action,e!==null){var o={payload:i,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(h){o.listeners.push(h)}};O.T!==null?n(!0):o.isTransition=!1,l(o),n=t.pending,n===null?(o.next=t.pending=o,jd(t,o)):(o.next=n.next,t.pending=n.next=o)}}function jd(e,t){var n=t.action,l=t.payload,i=e.state;if(t.isTransition){var o=O.T,h={};O.T=h;try{var p=n(i,l),E=O.S;E!==null&&E(h,p),Nd(e,t,p)}catch(D){Kc(e,t,D)}finally{O.T=o}}else try{o=n(i,l),Nd(e,t,o)}catch(D){Kc(e,t,D)}}function Nd(e,t,n){n!==null&&typeof n=="object"&&typeof n.then=="function"?n.then(function(l){Cd(e,t,l)},function(l){return Kc(e,t,l)}):Cd(e,t,n)}function Cd(e,t,n){t.status="fulfilled",t.value=n,Rd(t),e.state=n,t=e.pending,t!==null&&(n=t.next,n===t?e.pending=null:(n=n.next,t.next=n,jd(e,n)))}function Kc(e,t,n){var l=e.pending;if(e.pending=null,l!==null){l=l.next;do t.status="rejected",t.reason=n,Rd(t),t=t.next;while(t!==l)}e.action=null}function Rd(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function Od(e,t){return t}function Md(e,t){if(De){var n=Ve.formState;if(n!==null){e:{var l=be;if(De){if(Qe){t:{for(var i=Qe,o=nn;i.nodeType!==8;){if(!o){i=null;break t}if(i=$t(i.nextSibling),i===null){i=null;break t}}o=i.data,i=o==="F!"||o==="F"?i:null}if(i){Qe=$t(i.nextSibling),l=i.data==="F!";break e}}El(l)}l=!1}l&&(t=n[0])}}return n=xt(),n.memoizedState=n.baseState=t,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Od,lastRenderedState:t},n.queue=l,n=$d.bind(null,be,l),l.dispatch=n,l=Xc(!1),o=Pc.bind(null,be,!1,l.queue),l=xt(),i={state:t,dispatch:null,action:e,pending:null},l.queue=i,n=E0.bind(null,be,i,o,n),i.dispatch=n,l.memoizedState=e,[t,n,!1]}function Dd(e){var t=$e();return zd(t,Be,e)}function zd(e,t,n){if(t=Vc(e,t,Od)[0],e=_r(xn)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var l=di(t)}catch(h){throw h===ri?pr:h}else l=t;t=$e();var i=t.queue,o=i.dispatch;return n!==t.memoizedState&&(be.flags|=2048,ca(9,Er(),A0.bind(null,i,n),null)),[l,o,e]}function A0(e,t){e.action=t}function kd(e){var t=$e(),n=Be;if(n!==null)return zd(t,n,e);$e(),t=t.memoizedState,n=$e();var l=n.queue.dispatch;return n.memoizedState=e,[t,l,!1]}function ca(e,t,n,l){return e={tag:e,create:n,deps:l,inst:t,next:null},t=be.updateQueue,t===null&&(t=qc(),be.updateQueue=t),n=t.lastEffect,n===null?t.lastEffect=e.next=e:(l=n.next,n.next=e,e.next=l,t.lastEffect=e),e}function Er(){return{destroy:void 0,resource:void 0}}function Ud(){return $e().memoizedState}function Ar(e,t,n,l){var i=xt();l=l===void 0?null:l,be.flags|=e,i.memoizedState=ca(1|t,Er(),n,l)}function hi(e,t,n,l){var i=$e();l=l===void 0?null:l;var o=i.memoizedState.inst;Be!==null&&l!==null&&kc(l,Be.memoizedState.deps)?i.memoizedState=ca(t,o,n,l):(be.flags|=e,i.memoizedState=ca(1|t,o,n,l))}function Bd(e,t){Ar(8390656,8,e,t)}function Hd(e,t){hi(2048,8,e,t)}function Ld(e,t){return hi(4,2,e,t)}function qd(e,t){return hi(4,4,e,t)}function Gd(e,t){if(typeof t=="function"){e=e();var n=t(e);return function(){typeof n=="function"?n():t(null)}}if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Vd(e,t,n){n=n!=null?n.concat([e]):null,hi(4,4,Gd.bind(null,t,e),n)}function Qc(){}function Yd(e,t){var n=$e();t=t===void 0?null:t;var l=n.memoizedState;return t!==null&&kc(t,l[1])?l[0]:(n.memoizedState=[e,t],e)}function Xd(e,t){var n=$e();t=t===void 0?null:t;var l=n.memoizedState;if(t!==null&&kc(t,l[1]))return l[0];if(l=e(),Nl){Mn(!0);try{e()}finally{Mn(!1)}}return n.memoizedState=[l,t],l}function Zc(e,t,n){return n===void 0||(Ln&1073741824)!==0?e.memoizedState=t:(e.memoizedState=n,e=Zh(),be.lanes|=e,Qn|=e,n)}function Kd(e,t,n,l){return At(n,t)?n:ia.current!==null?(e=Zc(e,n,l),At(e,t)||(nt=!0),e):(Ln&42)===0?(nt=!0,e.memoizedState=n):(e=Zh(),be.lanes|=e,Qn|=e,t)}function Qd(e,t,n,l,i){var o=Z.p;Z.p=o!==0&&8>o?o:8;var h=O.T,p={};O.T=p,Pc(e,!1,t,n);try{var E=i(),D=O.S;if(D!==null&&D(p,E),E!==null&&typeof E=="object"&&typeof E.then=="function"){var q=S0(E,l);mi(e,t,q,Rt(e))}else mi(e,t,l,Rt(e))}catch(K){mi(e,t,{then:function(){},status:"rejected",reason:K},Rt())}finally{Z.p=o,O.T=h}}function T0(){}function Fc(e,t,n,l){if(e.tag!==5)throw Error(c(476));var i=Zd(e).queue;Qd(e,i,t,L,n===null?T0:function(){return Fd(e),n(l)})}function Zd(e){var t=e.memoizedState;if(t!==null)return t;t={memoizedState:L,baseState:L,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:xn,lastRenderedState:L},next:null};var n={};return t.next={memoizedState:n,baseState:n,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:xn,lastRenderedState:n},next:null},e.memoizedState=t,e=e.alternate,e!==null&&(e.memoizedState=t),t}function Fd(e){var t=Zd(e).next.queue;mi(e,t,{},Rt())}function Jc(){return dt(Mi)}function Jd(){return $e().memoizedState}function Pd(){return $e().memoizedState}function j0(e){for(var t=e.return;t!==null;){switch(t.tag){case 24:case 3:var n=Rt();e=Bn(n);var l=Hn(t,e,n);l!==null&&(Ot(l,t,n),ci(l,t,n)),t={cache:Ac()},e.payload=t;return}t=t.return}}function N0(e,t,n){var l=Rt();n={lane:l,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null},Tr(e)?Wd(t,n):(n=vc(e,t,n,l),n!==null&&(Ot(n,e,l),Id(n,t,l)))}function $d(e,t,n){var l=Rt();mi(e,t,n,l)}function mi(e,t,n,l){var i={lane:l,revertLane:0,action:n,hasEagerState:!1,eagerState:null,next:null};if(Tr(e))Wd(t,i);else{var o=e.alternate;if(e.lanes===0&&(o===null||o.lanes===0)&&(o=t.lastRenderedReducer,o!==null))try{var h=t.lastRenderedState,p=o(h,n);if(i.hasEagerState=!0,i.eagerState=p,At(p,h))return ur(e,t,i,0),Ve===null&&cr(),!1}catch{}finally{}if(n=vc(e,t,i,l),n!==null)return Ot(n,e,l),Id(n,t,l),!0}return!1}function Pc(e,t,n,l){if(l={lane:2,revertLane:Nu(),action:l,hasEagerState:!1,eagerState:null,next:null},Tr(e)){if(t)throw Error(c(479))}else t=vc(e,n,l,2),t!==null&&Ot(t,e,2)}function Tr(e){var t=e.alternate;return e===be||t!==null&&t===be}function Wd(e,t){ra=xr=!0;var n=e.pending;n===null?t.next=t:(t.next=n.next,n.next=t),e.pending=t}function Id(e,t,n){if((n&4194048)!==0){var l=t.lanes;l&=e.pendingLanes,n|=l,t.lanes=n,of(e,n)}}var jr={readContext:dt,use:wr,useCallback:Fe,useContext:Fe,useEffect:Fe,useImperativeHandle:Fe,useLayoutEffect:Fe,useInsertionEffect:Fe,useMemo:Fe,useReducer:Fe,useRef:Fe,useState:Fe,useDebugValue:Fe,useDeferredValue:Fe,useTransition:Fe,useSyncExternalStore:Fe,useId:Fe,useHostTransitionStatus:Fe,useFormState:Fe,useActionState:Fe,useOptimistic:Fe,useMemoCache:Fe,useCacheRefresh:Fe},eh={readContext:dt,use:wr,useCallback:function(e,t){return xt().memoizedState=[e,t===void 0?null:t],e},useContext:dt,useEffect:Bd,useImperativeHandle:function(e,t,n){n=n!=null?n.concat([e]):null,Ar(4194308,4,Gd.bind(null,t,e),n)},useLayoutEffect:function(e,t){return Ar(4194308,4,e,t)},useInsertionEffect:function(e,t){Ar(4,2,e,t)},useMemo:function(e,t){var n=xt();t=t===void 0?null:t;var l=e();if(Nl){Mn(!0);try{e()}finally{Mn(!1)}}return n.memoizedState=[l,t],l},useReducer:function(e,t,n){var l=xt();if(n!==void 0){var i=n(t);if(Nl){Mn(!0);try{n(t)}finally{Mn(!1)}}}else i=t;return l.memoizedState=l.baseState=i,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:i},l.queue=e,e=e.dispatch=N0.bind(null,be,e),[l.memoizedState,e]},useRef:function(e){var t=xt();return e={current:e},t.memoizedState=e},useState:function(e){e=Xc(e);var t=e.queue,n=$d.bind(null,be,t);return t.dispatch=n,[e.memoizedState,n]},useDebugValue:Qc,useDeferredValue:function(e,t){var n=xt();return Zc(n,e,t)},useTransition:function(){var e=Xc(!1);return e=Qd.bind(null,be,e.queue,!0,!1),xt().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,n){var l=be,i=xt();if(De){if(n===void 0)throw Error(c(407));n=n()}else{if(n=t(),Ve===null)throw Error(c(349));(Re&124)!==0||Sd(l,t,n)}i.memoizedState=n;var o={value:n,getSnapshot:t};return i.queue=o,Bd(_d.bind(null,l,o,e),[e]),l.flags|=2048,ca(9,Er(),wd.bind(null,l,o,n,t),null),n},useId:function(){var e=xt(),t=Ve.identifierPrefix;if(De){var n=pn,l=gn;n=(l&~(1<<32-Et(l)-1)).toString(32)+n,t="«"+t+"R"+n,n=Sr++,0<n&&(t+="H"+n.toString(32)),t+="»"}else n=w0++,t="«"+t+"r"+n.toString(32)+"»";return e.memoizedState=t},useHostTransitionStatus:Jc,useFormState:Md,useActionState:Md,useOptimistic:function(e){var t=xt();t.memoizedState=t.baseState=e;var n={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=n,t=Pc.bind(null,be,!0,n),n.dispatch=t,[e,t]},useMemoCache:Gc,useCacheRefresh:function(){return xt().memoizedState=j0.bind(null,be)}},th={readContext:dt,use:wr,useCallback:Yd,useContext:dt,useEffect:Hd,useImperativeHandle:Vd,useInsertionEffect:Ld,useLayoutEffect:qd,useMemo:Xd,useReducer:_r,useRef:Ud,useState:function(){return _r(xn)},useDebugValue:Qc,useDeferredValue:function(e,t){var n=$e();return Kd(n,Be.memoizedState,e,t)},useTransition:function(){var e=_r(xn)[0],t=$e().memoizedState;return[typeof e=="boolean"?e:di(e),t]},useSyncExternalStore:xd,useId:Jd,useHostTransitionStatus:Jc,useFormState:Dd,useActionState:Dd,useOptimistic:function(e,t){var n=$e();return Td(n,Be,e,t)},useMemoCache:Gc,useCacheRefresh:Pd},C0={readContext:dt,use:wr,useCallback:Yd,useContext:dt,useEffect:Hd,useImperativeHandle:Vd,useInsertionEffect:Ld,useLayoutEffect:qd,useMemo:Xd,useReducer:Yc,useRef:Ud,useState:function(){return Yc(xn)},useDebugValue:Qc,useDeferredValue:function(e,t){var n=$e();return Be===null?Zc(n,e,t):Kd(n,Be.memoizedState,e,t)},useTransition:function(){var e=Yc(xn)[0],t=$e().memoizedState;return[typeof e=="boolean"?e:di(e),t]},useSyncExternalStore:xd,useId:Jd,useHostTransitionStatus:Jc,useFormState:kd,useActionState:kd,useOptimistic:function(e,t){var n=$e();return Be!==null?Td(n,Be,e,t):(n.baseState=e,[e,n.queue.dispatch])},useMemoCache:Gc,useCacheRefresh:Pd},ua=null,vi=0;function Nr(e){var t=vi;return vi+=1,ua===null&&(ua=[]),dd(ua,e,t)}function gi(e,t){t=t.props.ref,e.ref=t!==void 0?t:null}function Cr(e,t){throw t.$$typeof===_?Error(c(525)):(e=Object.prototype.toString.call(t),Error(c(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e)))}function nh(e){var t=e._init;return t(e._payload)}function lh(e){function t(R,j){if(e){var M=R.deletions;M===null?(R.deletions=[j],R.flags|=16):M.push(j)}}function n(R,j){if(!e)return null;for(;j!==null;)t(R,j),j=j.sibling;return null}function l(R){for(var j=new Map;R!==null;)R.key!==null?j.set(R.key,R):j.set(R.index,R),R=R.sibling;return j}function i(R,j){return R=vn(R,j),R.index=0,R.sibling=null,R}function o(R,j,M){return R.index=M,e?(M=R.alternate,M!==null?(M=M.index,M<j?(R.flags|=67108866,j):M):(R.flags|=67108866,j)):(R.flags|=1048576,j)}function h(R){return e&&R.alternate===null&&(R.flags|=67108866),R}function p(R,j,M,Y){return j===null||j.tag!==6?(j=pc(M,R.mode,Y),j.return=R,j):(j=i(j,M),j.return=R,j)}function E(R,j,M,Y){var ee=M.type;return ee===w?q(R,j,M.props.children,Y,M.key):j!==null&&(j.elementType===ee||typeof ee=="object"&&ee!==null&&ee.$$typeof===Q&&nh(ee)===j.type)?(j=i(j,M.props),gi(j,M),j.return=R,j):(j=fr(M.type,M.key,M.props,null,R.mode,Y),gi(j,M),j.return=R,j)}function D(R,j,M,Y){return j===null||j.tag!==4||j.stateNode.containerInfo!==M.containerInfo||j.stateNode.implementation!==M.implementation?(j=yc(M,R.mode,Y),j.return=R,j):(j=i(j,M.children||[]),j.return=R,j)}function q(R,j,M,Y,ee){return j===null||j.tag!==7?(j=xl(M,R.mode,Y,ee),j.return=R,j):(j=i(j,M),j.return=R,j)}function K(R,j,M){if(typeof j=="string"&&j!==""||typeof j=="number"||typeof j=="bigint")return j=pc(""+j,R.mode,M),j.return=R,j;if(typeof j=="object"&&j!==null){switch(j.$$typeof){case A:return M=fr(j.type,j.key,j.props,null,R.mode,M),gi(M,j),M.return=R,M;case C:return j=yc(j,R.mode,M),j.return=R,j;case Q:var Y=j._init;return j=Y(j._payload),K(R,j,M)}if(re(j)||fe(j))return j=xl(j,R.mode,M,null),j.return=R,j;if(typeof j.then=="function")return K(R,Nr(j),M);if(j.$$typeof===B)return K(R,vr(R,j),M);Cr(R,j)}return null}function k(R,j,M,Y){var ee=j!==null?j.key:null;if(typeof M=="string"&&M!==""||typeof M=="number"||typeof M=="bigint")return ee!==null?null:p(R,j,""+M,Y);if(typeof M=="object"&&M!==null){switch(M.$$typeof){case A:return M.key===ee?E(R,j,M,Y):null;case C:return M.key===ee?D(R,j,M,Y):null;case Q:return ee=M._init,M=ee(M._payload),k(R,j,M,Y)}if(re(M)||fe(M))return ee!==null?null:q(R,j,M,Y,null);if(typeof M.then=="function")return k(R,j,Nr(M),Y);if(M.$$typeof===B)return k(R,j,vr(R,M),Y);Cr(R,M)}return null}function H(R,j,M,Y,ee){if(typeof Y=="string"&&Y!==""||typeof Y=="number"||typeof Y=="bigint")return R=R.get(M)||null,p(j,R,""+Y,ee);if(typeof Y=="object"&&Y!==null){switch(Y.$$typeof){case A:return R=R.get(Y.key===null?M:Y.key)||null,E(j,R,Y,ee);case C:return R=R.get(Y.key===null?M:Y.key)||null,D(j,R,Y,ee);case Q:var Se=Y._init;return Y=Se(Y._payload),H(R,j,M,Y,ee)}if(re(Y)||fe(Y))return R=R.get(M)||null,q(j,R,Y,ee,null);if(typeof Y.then=="function")return H(R,j,M,Nr(Y),ee);if(Y.$$typeof===B)return H(R,j,M,vr(j,Y),ee);Cr(j,Y)}return null}function de(R,j,M,Y){for(var ee=null,Se=null,ae=j,se=j=0,at=null;ae!==null&&se<M.length;se++){ae.index>se?(at=ae,ae=null):at=ae.sibling;var Me=k(R,ae,M[se],Y);if(Me===null){ae===null&&(ae=at);break}e&&ae&&Me.alternate===null&&t(R,ae),j=o(Me,j,se),Se===null?ee=Me:Se.sibling=Me,Se=Me,ae=at}if(se===M.length)return n(R,ae),De&&wl(R,se),ee;if(ae===null){for(;se<M.length;se++)ae=K(R,M[se],Y),ae!==null&&(j=o(ae,j,se),Se===null?ee=ae:Se.sibling=ae,Se=ae);return De&&wl(R,se),ee}for(ae=l(ae);se<M.length;se++)at=H(ae,R,se,M[se],Y),at!==null&&(e&&at.alternate!==null&&ae.delete(at.key===null?se:at.key),j=o(at,j,se),Se===null?ee=at:Se.sibling=at,Se=at);return e&&ae.forEach(function(tl){return t(R,tl)}),De&&wl(R,se),ee}function ue(R,j,M,Y){if(M==null)throw Error(c(151));for(var ee=null,Se=null,ae=j,se=j=0,at=null,Me=M.next();ae!==null&&!Me.done;se++,Me=M.next()){ae.index>se?(at=ae,ae=null):at=ae.sibling;var tl=k(R,ae,Me.value,Y);if(tl===null){ae===null&&(ae=at);break}e&&ae&&tl.alternate===null&&t(R,ae),j=o(tl,j,se),Se===null?ee=tl:Se.sibling=tl,Se=tl,ae=at}if(Me.done)return n(R,ae),De&&wl(R,se),ee;if(ae===null){for(;!Me.done;se++,Me=M.next())Me=K(R,Me.value,Y),Me!==null&&(j=o(Me,j,se),Se===null?ee=Me:Se.sibling=Me,Se=Me);return De&&wl(R,se),ee}for(ae=l(ae);!Me.done;se++,Me=M.next())Me=H(ae,R,se,Me.value,Y),Me!==null&&(e&&Me.alternate!==null&&ae.delete(Me.key===null?se:Me.key),j=o(Me,j,se),Se===null?ee=Me:Se.sibling=Me,Se=Me);return e&&ae.forEach(function(Rb){return t(R,Rb)}),De&&wl(R,se),ee}function Le(R,j,M,Y){if(typeof M=="object"&&M!==null&&M.type===w&&M.key===null&&(M=M.props.children),typeof M=="object"&&M!==null){switch(M.$$typeof){case A:e:{for(var ee=M.key;j!==null;){if(j.key===ee){if(ee=M.type,ee===w){if(j.tag===7){n(R,j.sibling),Y=i(j,M.props.children),Y.return=R,R=Y;break e}}else if(j.elementType===ee||typeof ee=="object"&&ee!==null&&ee.$$typeof===Q&&nh(ee)===j.type){n(R,j.sibling),Y=i(j,M.props),gi(Y,M),Y.return=R,R=Y;break e}n(R,j);break}else t(R,j);j=j.sibling}M.type===w?(Y=xl(M.props.children,R.mode,Y,M.key),Y.return=R,R=Y):(Y=fr(M.type,M.key,M.props,null,R.mode,Y),gi(Y,M),Y.return=R,R=Y)}return h(R);case C:e:{for(ee=M.key;j!==null;){if(j.key===ee)if(j.tag===4&&j.stateNode.containerInfo===M.containerInfo&&j.stateNode.implementation===M.implementation){n(R,j.sibling),Y=i(j,M.children||[]),Y.return=R,R=Y;break e}else{n(R,j);break}else t(R,j);j=j.sibling}Y=yc(M,R.mode,Y),Y.return=R,R=Y}return h(R);case Q:return ee=M._init,M=ee(M._payload),Le(R,j,M,Y)}if(re(M))return de(R,j,M,Y);if(fe(M)){if(ee=fe(M),typeof ee!="function")throw Error(c(150));return M=ee.call(M),ue(R,j,M,Y)}if(typeof M.then=="function")return Le(R,j,Nr(M),Y);if(M.$$typeof===B)return Le(R,j,vr(R,M),Y);Cr(R,M)}return typeof M=="string"&&M!==""||typeof M=="number"||typeof M=="bigint"?(M=""+M,j!==null&&j.tag===6?(n(R,j.sibling),Y=i(j,M),Y.return=R,R=Y):(n(R,j),Y=pc(M,R.mode,Y),Y.return=R,R=Y),h(R)):n(R,j)}return function(R,j,M,Y){try{vi=0;var ee=Le(R,j,M,Y);return ua=null,ee}catch(ae){if(ae===ri||ae===pr)throw ae;var Se=Tt(29,ae,null,R.mode);return Se.lanes=Y,Se.return=R,Se}finally{}}}var sa=lh(!0),ah=lh(!1),Qt=V(null),ln=null;function qn(e){var t=e.alternate;F(Ie,Ie.current&1),F(Qt,e),ln===null&&(t===null||ia.current!==null||t.memoizedState!==null)&&(ln=e)}function ih(e){if(e.tag===22){if(F(Ie,Ie.current),F(Qt,e),ln===null){var t=e.alternate;t!==null&&t.memoizedState!==null&&(ln=e)}}else Gn()}function Gn(){F(Ie,Ie.current),F(Qt,Qt.current)}function Sn(e){P(Qt),ln===e&&(ln=null),P(Ie)}var Ie=V(0);function Rr(e){for(var t=e;t!==null;){if(t.tag===13){var n=t.memoizedState;if(n!==null&&(n=n.dehydrated,n===null||n.data==="$?"||qu(n)))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function $c(e,t,n,l){t=e.memoizedState,n=n(l,t),n=n==null?t:b({},t,n),e.memoizedState=n,e.lanes===0&&(e.updateQueue.baseState=n)}var Wc={enqueueSetState:function(e,t,n){e=e._reactInternals;var l=Rt(),i=Bn(l);i.payload=t,n!=null&&(i.callback=n),t=Hn(e,i,l),t!==null&&(Ot(t,e,l),ci(t,e,l))},enqueueReplaceState:function(e,t,n){e=e._reactInternals;var l=Rt(),i=Bn(l);i.tag=1,i.payload=t,n!=null&&(i.callback=n),t=Hn(e,i,l),t!==null&&(Ot(t,e,l),ci(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var n=Rt(),l=Bn(n);l.tag=2,t!=null&&(l.callback=t),t=Hn(e,l,n),t!==null&&(Ot(t,e,n),ci(t,e,n))}};function rh(e,t,n,l,i,o,h){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(l,o,h):t.prototype&&t.prototype.isPureReactComponent?!Wa(n,l)||!Wa(i,o):!0}function oh(e,t,n,l){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(n,l),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(n,l),t.state!==e&&Wc.enqueueReplaceState(t,t.state,null)}function Cl(e,t){var n=t;if("ref"in t){n={};for(var l in t)l!=="ref"&&(n[l]=t[l])}if(e=e.defaultProps){n===t&&(n=b({},n));for(var i in e)n[i]===void 0&&(n[i]=e[i])}return n}var Or=typeof reportError=="function"?reportError:function(e){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof e=="object"&&e!==null&&typeof e.message=="string"?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",e);return}console.error(e)};function ch(e){Or(e)}function uh(e){console.error(e)}function sh(e){Or(e)}function Mr(e,t){try{var n=e.onUncaughtError;n(t.value,{componentStack:t.stack})}catch(l){setTimeout(function(){throw l})}}function fh(e,t,n){try{var l=e.onCaughtError;l(n.value,{componentStack:n.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(i){setTimeout(function(){throw i})}}function Ic(e,t,n){return n=Bn(n),n.tag=3,n.payload={element:null},n.callback=function(){Mr(e,t)},n}function dh(e){return e=Bn(e),e.tag=3,e}function hh(e,t,n,l){var i=n.type.getDerivedStateFromError;if(typeof i=="function"){var o=l.value;e.payload=function(){return i(o)},e.callback=function(){fh(t,n,l)}}var h=n.stateNode;h!==null&&typeof h.componentDidCatch=="function"&&(e.callback=function(){fh(t,n,l),typeof i!="function"&&(Zn===null?Zn=new Set([this]):Zn.add(this));var p=l.stack;this.componentDidCatch(l.value,{componentStack:p!==null?p:""})})}function R0(e,t,n,l,i){if(n.flags|=32768,l!==null&&typeof l=="object"&&typeof l.then=="function"){if(t=n.alternate,t!==null&&li(t,n,i,!0),n=Qt.current,n!==null){switch(n.tag){case 13:return ln===null?_u():n.alternate===null&&Ze===0&&(Ze=3),n.flags&=-257,n.flags|=65536,n.lanes=i,l===Nc?n.flags|=16384:(t=n.updateQueue,t===null?n.updateQueue=new Set([l]):t.add(l),Au(e,l,i)),!1;case 22:return n.flags|=65536,l===Nc?n.flags|=16384:(t=n.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([l])},n.updateQueue=t):(n=t.retryQueue,n===null?t.retryQueue=new Set([l]):n.add(l)),Au(e,l,i)),!1}throw Error(c(435,n.tag))}return Au(e,l,i),_u(),!1}if(De)return t=Qt.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=i,l!==Sc&&(e=Error(c(422),{cause:l}),ni(Vt(e,n)))):(l!==Sc&&(t=Error(c(423),{cause:l}),ni(Vt(t,n))),e=e.current.alternate,e.flags|=65536,i&=-i,e.lanes|=i,l=Vt(l,n),i=Ic(e.stateNode,l,i),Oc(e,i),Ze!==4&&(Ze=2)),!1;var o=Error(c(520),{cause:l});if(o=Vt(o,n),_i===null?_i=[o]:_i.push(o),Ze!==4&&(Ze=2),t===null)return!0;l=Vt(l,n),n=t;do{switch(n.tag){case 3:return n.flags|=65536,e=i&-i,n.lanes|=e,e=Ic(n.stateNode,l,e),Oc(n,e),!1;case 1:if(t=n.type,o=n.stateNode,(n.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||o!==null&&typeof o.componentDidCatch=="function"&&(Zn===null||!Zn.has(o))))return n.flags|=65536,i&=-i,n.lanes|=i,i=dh(i),hh(i,e,n,l),Oc(n,i),!1}n=n.return}while(n!==null);return!1}var mh=Error(c(461)),nt=!1;function ot(e,t,n,l){t.child=e===null?ah(t,null,n,l):sa(t,e.child,n,l)}function vh(e,t,n,l,i){n=n.render;var o=t.ref;if("ref"in l){var h={};for(var p in l)p!=="ref"&&(h[p]=l[p])}else h=l;return Tl(t),l=Uc(e,t,n,h,o,i),p=Bc(),e!==null&&!nt?(Hc(e,t,i),wn(e,t,i)):(De&&p&&bc(t),t.flags|=1,ot(e,t,l,i),t.child)}function gh(e,t,n,l,i){if(e===null){var o=n.type;return typeof o=="function"&&!gc(o)&&o.defaultProps===void 0&&n.compare===null?(t.tag=15,t.type=o,ph(e,t,o,l,i)):(e=fr(n.type,null,l,t,t.mode,i),e.ref=t.ref,e.return=t,t.child=e)}if(o=e.child,!ou(e,i)){var h=o.memoizedProps;if(n=n.compare,n=n!==null?n:Wa,n(h,l)&&e.ref===t.ref)return wn(e,t,i)}return t.flags|=1,e=vn(o,l),e.ref=t.ref,e.return=t,t.child=e}function ph(e,t,n,l,i){if(e!==null){var o=e.memoizedProps;if(Wa(o,l)&&e.ref===t.ref)if(nt=!1,t.pendingProps=l=o,ou(e,i))(e.flags&131072)!==0&&(nt=!0);else return t.lanes=e.lanes,wn(e,t,i)}return eu(e,t,n,l,i)}function yh(e,t,n){var l=t.pendingProps,i=l.children,o=e!==null?e.memoizedState:null;if(l.mode==="hidden"){if((t.flags&128)!==0){if(l=o!==null?o.baseLanes|n:n,e!==null){for(i=t.child=e.child,o=0;i!==null;)o=o|i.lanes|i.childLanes,i=i.sibling;t.childLanes=o&~l}else t.childLanes=0,t.child=null;return bh(e,t,l,n)}if((n&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},e!==null&&gr(t,o!==null?o.cachePool:null),o!==null?pd(t,o):Dc(),ih(t);else return t.lanes=t.childLanes=536870912,bh(e,t,o!==null?o.baseLanes|n:n,n)}else o!==null?(gr(t,o.cachePool),pd(t,o),Gn(),t.memoizedState=null):(e!==null&&gr(t,null),Dc(),Gn());return ot(e,t,i,n),t.child}function bh(e,t,n,l){var i=jc();return i=i===null?null:{parent:We._currentValue,pool:i},t.memoizedState={baseLanes:n,cachePool:i},e!==null&&gr(t,null),Dc(),ih(t),e!==null&&li(e,t,l,!0),null}function Dr(e,t){var n=t.ref;if(n===null)e!==null&&e.ref!==null&&(t.flags|=4194816);else{if(typeof n!="function"&&typeof n!="object")throw Error(c(284));(e===null||e.ref!==n)&&(t.flags|=4194816)}}function eu(e,t,n,l,i){return Tl(t),n=Uc(e,t,n,l,void 0,i),l=Bc(),e!==null&&!nt?(Hc(e,t,i),wn(e,t,i)):(De&&l&&bc(t),t.flags|=1,ot(e,t,n,i),t.child)}function xh(e,t,n,l,i,o){return Tl(t),t.updateQueue=null,n=bd(t,l,n,i),yd(e),l=Bc(),e!==null&&!nt?(Hc(e,t,o),wn(e,t,o)):(De&&l&&bc(t),t.flags|=1,ot(e,t,n,o),t.child)}function Sh(e,t,n,l,i){if(Tl(t),t.stateNode===null){var o=ea,h=n.contextType;typeof h=="object"&&h!==null&&(o=dt(h)),o=new n(l,o),t.memoizedState=o.state!==null&&o.state!==void 0?o.state:null,o.updater=Wc,t.stateNode=o,o._reactInternals=t,o=t.stateNode,o.props=l,o.state=t.memoizedState,o.refs={},Cc(t),h=n.contextType,o.context=typeof h=="object"&&h!==null?dt(h):ea,o.state=t.memoizedState,h=n.getDerivedStateFromProps,typeof h=="function"&&($c(t,n,h,l),o.state=t.memoizedState),typeof n.getDerivedStateFromProps=="function"||typeof o.getSnapshotBeforeUpdate=="function"||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(h=o.state,typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount(),h!==o.state&&Wc.enqueueReplaceState(o,o.state,null),si(t,l,o,i),ui(),o.state=t.memoizedState),typeof o.componentDidMount=="function"&&(t.flags|=4194308),l=!0}else if(e===null){o=t.stateNode;var p=t.memoizedProps,E=Cl(n,p);o.props=E;var D=o.context,q=n.contextType;h=ea,typeof q=="object"&&q!==null&&(h=dt(q));var K=n.getDerivedStateFromProps;q=typeof K=="function"||typeof o.getSnapshotBeforeUpdate=="function",p=t.pendingProps!==p,q||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(p||D!==h)&&oh(t,o,l,h),Un=!1;var k=t.memoizedState;o.state=k,si(t,l,o,i),ui(),D=t.memoizedState,p||k!==D||Un?(typeof K=="function"&&($c(t,n,K,l),D=t.memoizedState),(E=Un||rh(t,n,E,l,k,D,h))?(q||typeof o.UNSAFE_componentWillMount!="function"&&typeof o.componentWillMount!="function"||(typeof o.componentWillMount=="function"&&o.componentWillMount(),typeof o.UNSAFE_componentWillMount=="function"&&o.UNSAFE_componentWillMount()),typeof o.componentDidMount=="function"&&(t.flags|=4194308)):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=l,t.memoizedState=D),o.props=l,o.state=D,o.context=h,l=E):(typeof o.componentDidMount=="function"&&(t.flags|=4194308),l=!1)}else{o=t.stateNode,Rc(e,t),h=t.memoizedProps,q=Cl(n,h),o.props=q,K=t.pendingProps,k=o.context,D=n.contextType,E=ea,typeof D=="object"&&D!==null&&(E=dt(D)),p=n.getDerivedStateFromProps,(D=typeof p=="function"||typeof o.getSnapshotBeforeUpdate=="function")||typeof o.UNSAFE_componentWillReceiveProps!="function"&&typeof o.componentWillReceiveProps!="function"||(h!==K||k!==E)&&oh(t,o,l,E),Un=!1,k=t.memoizedState,o.state=k,si(t,l,o,i),ui();var H=t.memoizedState;h!==K||k!==H||Un||e!==null&&e.dependencies!==null&&mr(e.dependencies)?(typeof p=="function"&&($c(t,n,p,l),H=t.memoizedState),(q=Un||rh(t,n,q,l,k,H,E)||e!==null&&e.dependencies!==null&&mr(e.dependencies))?(D||typeof o.UNSAFE_componentWillUpdate!="function"&&typeof o.componentWillUpdate!="function"||(typeof o.componentWillUpdate=="function"&&o.componentWillUpdate(l,H,E),typeof o.UNSAFE_componentWillUpdate=="function"&&o.UNSAFE_componentWillUpdate(l,H,E)),typeof o.componentDidUpdate=="function"&&(t.flags|=4),typeof o.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof o.componentDidUpdate!="function"||h===e.memoizedProps&&k===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||h===e.memoizedProps&&k===e.memoizedState||(t.flags|=1024),t.memoizedProps=l,t.memoizedState=H),o.props=l,o.state=H,o.context=E,l=q):(typeof o.componentDidUpdate!="function"||h===e.memoizedProps&&k===e.memoizedState||(t.flags|=4),typeof o.getSnapshotBeforeUpdate!="function"||h===e.memoizedProps&&k===e.memoizedState||(t.flags|=1024),l=!1)}return o=l,Dr(e,t),l=(t.flags&128)!==0,o||l?(o=t.stateNode,n=l&&typeof n.getDerivedStateFromError!="function"?null:o.render(),t.flags|=1,e!==null&&l?(t.child=sa(t,e.child,null,i),t.child=sa(t,null,n,i)):ot(e,t,n,i),t.memoizedState=o.state,e=t.child):e=wn(e,t,i),e}function wh(e,t,n,l){return ti(),t.flags|=256,ot(e,t,n,l),t.child}var tu={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function nu(e){return{baseLanes:e,cachePool:ud()}}function lu(e,t,n){return e=e!==null?e.childLanes&~n:0,t&&(e|=Zt),e}function _h(e,t,n){var l=t.pendingProps,i=!1,o=(t.flags&128)!==0,h;if((h=o)||(h=e!==null&&e.memoizedState===null?!1:(Ie.current&2)!==0),h&&(i=!0,t.flags&=-129),h=(t.flags&32)!==0,t.flags&=-33,e===null){if(De){if(i?qn(t):Gn(),De){var p=Qe,E;if(E=p){e:{for(E=p,p=nn;E.nodeType!==8;){if(!p){p=null;break e}if(E=$t(E.nextSibling),E===null){p=null;break e}}p=E}p!==null?(t.memoizedState={dehydrated:p,treeContext:Sl!==null?{id:gn,overflow:pn}:null,retryLane:536870912,hydrationErrors:null},E=Tt(18,null,null,0),E.stateNode=p,E.return=t,t.child=E,gt=t,Qe=null,E=!0):E=!1}E||El(t)}if(p=t.memoizedState,p!==null&&(p=p.dehydrated,p!==null))return qu(p)?t.lanes=32:t.lanes=536870912,null;Sn(t)}return p=l.children,l=l.fallback,i?(Gn(),i=t.mode,p=zr({mode:"hidden",children:p},i),l=xl(l,i,n,null),p.return=t,l.return=t,p.sibling=l,t.child=p,i=t.child,i.memoizedState=nu(n),i.childLanes=lu(e,h,n),t.memoizedState=tu,l):(qn(t),au(t,p))}if(E=e.memoizedState,E!==null&&(p=E.dehydrated,p!==null)){if(o)t.flags&256?(qn(t),t.flags&=-257,t=iu(e,t,n)):t.memoizedState!==null?(Gn(),t.child=e.child,t.flags|=128,t=null):(Gn(),i=l.fallback,p=t.mode,l=zr({mode:"visible",children:l.children},p),i=xl(i,p,n,null),i.flags|=2,l.return=t,i.return=t,l.sibling=i,t.child=l,sa(t,e.child,null,n),l=t.child,l.memoizedState=nu(n),l.childLanes=lu(e,h,n),t.memoizedState=tu,t=i);else if(qn(t),qu(p)){if(h=p.nextSibling&&p.nextSibling.dataset,h)var D=h.dgst;h=D,l=Error(c(419)),l.stack="",l.digest=h,ni({value:l,source:null,stack:null}),t=iu(e,t,n)}else if(nt||li(e,t,n,!1),h=(n&e.childLanes)!==0,nt||h){if(h=Ve,h!==null&&(l=n&-n,l=(l&42)!==0?1:Go(l),l=(l&(h.suspendedLanes|n))!==0?0:l,l!==0&&l!==E.retryLane))throw E.retryLane=l,Il(e,l),Ot(h,e,l),mh;p.data==="$?"||_u(),t=iu(e,t,n)}else p.data==="$?"?(t.flags|=192,t.child=e.child,t=null):(e=E.treeContext,Qe=$t(p.nextSibling),gt=t,De=!0,_l=null,nn=!1,e!==null&&(Xt[Kt++]=gn,Xt[Kt++]=pn,Xt[Kt++]=Sl,gn=e.id,pn=e.overflow,Sl=t),t=au(t,l.children),t.flags|=4096);return t}return i?(Gn(),i=l.fallback,p=t.mode,E=e.child,D=E.sibling,l=vn(E,{mode:"hidden",children:l.children}),l.subtreeFlags=E.subtreeFlags&65011712,D!==null?i=vn(D,i):(i=xl(i,p,n,null),i.flags|=2),i.return=t,l.return=t,l.sibling=i,t.child=l,l=i,i=t.child,p=e.child.memoizedState,p===null?p=nu(n):(E=p.cachePool,E!==null?(D=We._currentValue,E=E.parent!==D?{parent:D,pool:D}:E):E=ud(),p={baseLanes:p.baseLanes|n,cachePool:E}),i.memoizedState=p,i.childLanes=lu(e,h,n),t.memoizedState=tu,l):(qn(t),n=e.child,e=n.sibling,n=vn(n,{mode:"visible",children:l.children}),n.return=t,n.sibling=null,e!==null&&(h=t.deletions,h===null?(t.deletions=[e],t.flags|=16):h.push(e)),t.child=n,t.memoizedState=null,n)}function au(e,t){return t=zr({mode:"visible",children:t},e.mode),t.return=e,e.child=t}function zr(e,t){return e=Tt(22,e,null,t),e.lanes=0,e.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},e}function iu(e,t,n){return sa(t,e.child,null,n),e=au(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Eh(e,t,n){e.lanes|=t;var l=e.alternate;l!==null&&(l.lanes|=t),_c(e.return,t,n)}function ru(e,t,n,l,i){var o=e.memoizedState;o===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:l,tail:n,tailMode:i}:(o.isBackwards=t,o.rendering=null,o.renderingStartTime=0,o.last=l,o.tail=n,o.tailMode=i)}function Ah(e,t,n){var l=t.pendingProps,i=l.revealOrder,o=l.tail;if(ot(e,t,l.children,n),l=Ie.current,(l&2)!==0)l=l&1|2,t.flags|=128;else{if(e!==null&&(e.flags&128)!==0)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Eh(e,n,t);else if(e.tag===19)Eh(e,n,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}l&=1}switch(F(Ie,l),i){case"forwards":for(n=t.child,i=null;n!==null;)e=n.alternate,e!==null&&Rr(e)===null&&(i=n),n=n.sibling;n=i,n===null?(i=t.child,t.child=null):(i=n.sibling,n.sibling=null),ru(t,!1,i,n,o);break;case"backwards":for(n=null,i=t.child,t.child=null;i!==null;){if(e=i.alternate,e!==null&&Rr(e)===null){t.child=i;break}e=i.sibling,i.sibling=n,n=i,i=e}ru(t,!0,n,null,o);break;case"together":ru(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function wn(e,t,n){if(e!==null&&(t.dependencies=e.dependencies),Qn|=t.lanes,(n&t.childLanes)===0)if(e!==null){if(li(e,t,n,!1),(n&t.childLanes)===0)return null}else return null;if(e!==null&&t.child!==e.child)throw Error(c(153));if(t.child!==null){for(e=t.child,n=vn(e,e.pendingProps),t.child=n,n.return=t;e.sibling!==null;)e=e.sibling,n=n.sibling=vn(e,e.pendingProps),n.return=t;n.sibling=null}return t.child}function ou(e,t){return(e.lanes&t)!==0?!0:(e=e.dependencies,!!(e!==null&&mr(e)))}function O0(e,t,n){switch(t.tag){case 3:oe(t,t.stateNode.containerInfo),kn(t,We,e.memoizedState.cache),ti();break;case 27:case 5:Ne(t);break;case 4:oe(t,t.stateNode.containerInfo);break;case 10:kn(t,t.type,t.memoizedProps.value);break;case 13:var l=t.memoizedState;if(l!==null)return l.dehydrated!==null?(qn(t),t.flags|=128,null):(n&t.child.childLanes)!==0?_h(e,t,n):(qn(t),e=wn(e,t,n),e!==null?e.sibling:null);qn(t);break;case 19:var i=(e.flags&128)!==0;if(l=(n&t.childLanes)!==0,l||(li(e,t,n,!1),l=(n&t.childLanes)!==0),i){if(l)return Ah(e,t,n);t.flags|=128}if(i=t.memoizedState,i!==null&&(i.rendering=null,i.tail=null,i.lastEffect=null),F(Ie,Ie.current),l)break;return null;case 22:case 23:return t.lanes=0,yh(e,t,n);case 24:kn(t,We,e.memoizedState.cache)}return wn(e,t,n)}function Th(e,t,n){if(e!==null)if(e.memoizedProps!==t.pendingProps)nt=!0;else{if(!ou(e,n)&&(t.flags&128)===0)return nt=!1,O0(e,t,n);nt=(e.flags&131072)!==0}else nt=!1,De&&(t.flags&1048576)!==0&&nd(t,hr,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var l=t.elementType,i=l._init;if(l=i(l._payload),t.type=l,typeof l=="function")gc(l)?(e=Cl(l,e),t.tag=1,t=Sh(null,t,l,e,n)):(t.tag=0,t=eu(null,t,l,e,n));else{if(l!=null){if(i=l.$$typeof,i===X){t.tag=11,t=vh(null,t,l,e,n);break e}else if(i===J){t.tag=14,t=gh(null,t,l,e,n);break e}}throw t=ye(l)||l,Error(c(306,t,""))}}return t;case 0:return eu(e,t,t.type,t.pendingProps,n);case 1:return l=t.type,i=Cl(l,t.pendingProps),Sh(e,t,l,i,n);case 3:e:{if(oe(t,t.stateNode.containerInfo),e===null)throw Error(c(387));l=t.pendingProps;var o=t.memoizedState;i=o.element,Rc(e,t),si(t,l,null,n);var h=t.memoizedState;if(l=h.cache,kn(t,We,l),l!==o.cache&&Ec(t,[We],n,!0),ui(),l=h.element,o.isDehydrated)if(o={element:l,isDehydrated:!1,cache:h.cache},t.updateQueue.baseState=o,t.memoizedState=o,t.flags&256){t=wh(e,t,l,n);break e}else if(l!==i){i=Vt(Error(c(424)),t),ni(i),t=wh(e,t,l,n);break e}else{switch(e=t.stateNode.containerInfo,e.nodeType){case 9:e=e.body;break;default:e=e.nodeName==="HTML"?e.ownerDocument.body:e}for(Qe=$t(e.firstChild),gt=t,De=!0,_l=null,nn=!0,n=ah(t,null,l,n),t.child=n;n;)n.flags=n.flags&-3|4096,n=n.sibling}else{if(ti(),l===i){t=wn(e,t,n);break e}ot(e,t,l,n)}t=t.child}return t;case 26:return Dr(e,t),e===null?(n=Rm(t.type,null,t.pendingProps,null))?t.memoizedState=n:De||(n=t.type,e=t.pendingProps,l=Fr(ie.current).createElement(n),l[ft]=t,l[yt]=e,ut(l,n,e),tt(l),t.stateNode=l):t.memoizedState=Rm(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return Ne(t),e===null&&De&&(l=t.stateNode=jm(t.type,t.pendingProps,ie.current),gt=t,nn=!0,i=Qe,Pn(t.type)?(Gu=i,Qe=$t(l.firstChild)):Qe=i),ot(e,t,t.pendingProps.children,n),Dr(e,t),e===null&&(t.flags|=4194304),t.child;case 5:return e===null&&De&&((i=l=Qe)&&(l=ib(l,t.type,t.pendingProps,nn),l!==null?(t.stateNode=l,gt=t,Qe=$t(l.firstChild),nn=!1,i=!0):i=!1),i||El(t)),Ne(t),i=t.type,o=t.pendingProps,h=e!==null?e.memoizedProps:null,l=o.children,Bu(i,o)?l=null:h!==null&&Bu(i,h)&&(t.flags|=32),t.memoizedState!==null&&(i=Uc(e,t,_0,null,null,n),Mi._currentValue=i),Dr(e,t),ot(e,t,l,n),t.child;case 6:return e===null&&De&&((e=n=Qe)&&(n=rb(n,t.pendingProps,nn),n!==null?(t.stateNode=n,gt=t,Qe=null,e=!0):e=!1),e||El(t)),null;case 13:return _h(e,t,n);case 4:return oe(t,t.stateNode.containerInfo),l=t.pendingProps,e===null?t.child=sa(t,null,l,n):ot(e,t,l,n),t.child;case 11:return vh(e,t,t.type,t.pendingProps,n);case 7:return ot(e,t,t.pendingProps,n),t.child;case 8:return ot(e,t,t.pendingProps.children,n),t.child;case 12:return ot(e,t,t.pendingProps.children,n),t.child;case 10:return l=t.pendingProps,kn(t,t.type,l.value),ot(e,t,l.children,n),t.child;case 9:return i=t.type._context,l=t.pendingProps.children,Tl(t),i=dt(i),l=l(i),t.flags|=1,ot(e,t,l,n),t.child;case 14:return gh(e,t,t.type,t.pendingProps,n);case 15:return ph(e,t,t.type,t.pendingProps,n);case 19:return Ah(e,t,n);case 31:return l=t.pendingProps,n=t.mode,l={mode:l.mode,children:l.children},e===null?(n=zr(l,n),n.ref=t.ref,t.child=n,n.return=t,t=n):(n=vn(e.child,l),n.ref=t.ref,t.child=n,n.return=t,t=n),t;case 22:return yh(e,t,n);case 24:return Tl(t),l=dt(We),e===null?(i=jc(),i===null&&(i=Ve,o=Ac(),i.pooledCache=o,o.refCount++,o!==null&&(i.pooledCacheLanes|=n),i=o),t.memoizedState={parent:l,cache:i},Cc(t),kn(t,We,i)):((e.lanes&n)!==0&&(Rc(e,t),si(t,null,null,n),ui()),i=e.memoizedState,o=t.memoizedState,i.parent!==l?(i={parent:l,cache:l},t.memoizedState=i,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=i),kn(t,We,l)):(l=o.cache,kn(t,We,l),l!==i.cache&&Ec(t,[We],n,!0))),ot(e,t,t.pendingProps.children,n),t.child;case 29:throw t.pendingProps}throw Error(c(156,t.tag))}function _n(e){e.flags|=4}function jh(e,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)e.flags&=-16777217;else if(e.flags|=16777216,!km(t)){if(t=Qt.current,t!==null&&((Re&4194048)===Re?ln!==null:(Re&62914560)!==Re&&(Re&536870912)===0||t!==ln))throw oi=Nc,sd;e.flags|=8192}}function kr(e,t){t!==null&&(e.flags|=4),e.flags&16384&&(t=e.tag!==22?af():536870912,e.lanes|=t,ma|=t)}function pi(e,t){if(!De)switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;t!==null;)t.alternate!==null&&(n=t),t=t.sibling;n===null?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var l=null;n!==null;)n.alternate!==null&&(l=n),n=n.sibling;l===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:l.sibling=null}}function Ke(e){var t=e.alternate!==null&&e.alternate.child===e.child,n=0,l=0;if(t)for(var i=e.child;i!==null;)n|=i.lanes|i.childLanes,l|=i.subtreeFlags&65011712,l|=i.flags&65011712,i.return=e,i=i.sibling;else for(i=e.child;i!==null;)n|=i.lanes|i.childLanes,l|=i.subtreeFlags,l|=i.flags,i.return=e,i=i.sibling;return e.subtreeFlags|=l,e.childLanes=n,t}function M0(e,t,n){var l=t.pendingProps;switch(xc(t),t.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Ke(t),null;case 1:return Ke(t),null;case 3:return n=t.stateNode,l=null,e!==null&&(l=e.memoizedState.cache),t.memoizedState.cache!==l&&(t.flags|=2048),bn(We),ze(),n.pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),(e===null||e.child===null)&&(ei(t)?_n(t):e===null||e.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,id())),Ke(t),null;case 26:return n=t.memoizedState,e===null?(_n(t),n!==null?(Ke(t),jh(t,n)):(Ke(t),t.flags&=-16777217)):n?n!==e.memoizedState?(_n(t),Ke(t),jh(t,n)):(Ke(t),t.flags&=-16777217):(e.memoizedProps!==l&&_n(t),Ke(t),t.flags&=-16777217),null;case 27:we(t),n=ie.current;var i=t.type;if(e!==null&&t.stateNode!=null)e.memoizedProps!==l&&_n(t);else{if(!l){if(t.stateNode===null)throw Error(c(166));return Ke(t),null}e=I.current,ei(t)?ld(t):(e=jm(i,l,n),t.stateNode=e,_n(t))}return Ke(t),null;case 5:if(we(t),n=t.type,e!==null&&t.stateNode!=null)e.memoizedProps!==l&&_n(t);else{if(!l){if(t.stateNode===null)throw Error(c(166));return Ke(t),null}if(e=I.current,ei(t))ld(t);else{switch(i=Fr(ie.current),e){case 1:e=i.createElementNS("http://www.w3.org/2000/svg",n);break;case 2:e=i.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;default:switch(n){case"svg":e=i.createElementNS("http://www.w3.org/2000/svg",n);break;case"math":e=i.createElementNS("http://www.w3.org/1998/Math/MathML",n);break;case"script":e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e=typeof l.is=="string"?i.createElement("select",{is:l.is}):i.createElement("select"),l.multiple?e.multiple=!0:l.size&&(e.size=l.size);break;default:e=typeof l.is=="string"?i.createElement(n,{is:l.is}):i.createElement(n)}}e[ft]=t,e[yt]=l;e:for(i=t.child;i!==null;){if(i.tag===5||i.tag===6)e.appendChild(i.stateNode);else if(i.tag!==4&&i.tag!==27&&i.child!==null){i.child.return=i,i=i.child;continue}if(i===t)break e;for(;i.sibling===null;){if(i.return===null||i.return===t)break e;i=i.return}i.sibling.return=i.return,i=i.sibling}t.stateNode=e;e:switch(ut(e,n,l),n){case"button":case"input":case"select":case"textarea":e=!!l.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&_n(t)}}return Ke(t),t.flags&=-16777217,null;case 6:if(e&&t.stateNode!=null)e.memoizedProps!==l&&_n(t);else{if(typeof l!="string"&&t.stateNode===null)throw Error(c(166));if(e=ie.current,ei(t)){if(e=t.stateNode,n=t.memoizedProps,l=null,i=gt,i!==null)switch(i.tag){case 27:case 5:l=i.memoizedProps}e[ft]=t,e=!!(e.nodeValue===n||l!==null&&l.suppressHydrationWarning===!0||xm(e.nodeValue,n)),e||El(t)}else e=Fr(e).createTextNode(l),e[ft]=t,t.stateNode=e}return Ke(t),null;case 13:if(l=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(i=ei(t),l!==null&&l.dehydrated!==null){if(e===null){if(!i)throw Error(c(318));if(i=t.memoizedState,i=i!==null?i.dehydrated:null,!i)throw Error(c(317));i[ft]=t}else ti(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;Ke(t),i=!1}else i=id(),e!==null&&e.memoizedState!==null&&(e.memoizedState.hydrationErrors=i),i=!0;if(!i)return t.flags&256?(Sn(t),t):(Sn(t),null)}if(Sn(t),(t.flags&128)!==0)return t.lanes=n,t;if(n=l!==null,e=e!==null&&e.memoizedState!==null,n){l=t.child,i=null,l.alternate!==null&&l.alternate.memoizedState!==null&&l.alternate.memoizedState.cachePool!==null&&(i=l.alternate.memoizedState.cachePool.pool);var o=null;l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(o=l.memoizedState.cachePool.pool),o!==i&&(l.flags|=2048)}return n!==e&&n&&(t.child.flags|=8192),kr(t,t.updateQueue),Ke(t),null;case 4:return ze(),e===null&&Mu(t.stateNode.containerInfo),Ke(t),null;case 10:return bn(t.type),Ke(t),null;case 19:if(P(Ie),i=t.memoizedState,i===null)return Ke(t),null;if(l=(t.flags&128)!==0,o=i.rendering,o===null)if(l)pi(i,!1);else{if(Ze!==0||e!==null&&(e.flags&128)!==0)for(e=t.child;e!==null;){if(o=Rr(e),o!==null){for(t.flags|=128,pi(i,!1),e=o.updateQueue,t.updateQueue=e,kr(t,e),t.subtreeFlags=0,e=n,n=t.child;n!==null;)td(n,e),n=n.sibling;return F(Ie,Ie.current&1|2),t.child}e=e.sibling}i.tail!==null&&st()>Hr&&(t.flags|=128,l=!0,pi(i,!1),t.lanes=4194304)}else{if(!l)if(e=Rr(o),e!==null){if(t.flags|=128,l=!0,e=e.updateQueue,t.updateQueue=e,kr(t,e),pi(i,!0),i.tail===null&&i.tailMode==="hidden"&&!o.alternate&&!De)return Ke(t),null}else 2*st()-i.renderingStartTime>Hr&&n!==536870912&&(t.flags|=128,l=!0,pi(i,!1),t.lanes=4194304);i.isBackwards?(o.sibling=t.child,t.child=o):(e=i.last,e!==null?e.sibling=o:t.child=o,i.last=o)}return i.tail!==null?(t=i.tail,i.rendering=t,i.tail=t.sibling,i.renderingStartTime=st(),t.sibling=null,e=Ie.current,F(Ie,l?e&1|2:e&1),t):(Ke(t),null);case 22:case 23:return Sn(t),zc(),l=t.memoizedState!==null,e!==null?e.memoizedState!==null!==l&&(t.flags|=8192):l&&(t.flags|=8192),l?(n&536870912)!==0&&(t.flags&128)===0&&(Ke(t),t.subtreeFlags&6&&(t.flags|=8192)):Ke(t),n=t.updateQueue,n!==null&&kr(t,n.retryQueue),n=null,e!==null&&e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(n=e.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==n&&(t.flags|=2048),e!==null&&P(jl),null;case 24:return n=null,e!==null&&(n=e.memoizedState.cache),t.memoizedState.cache!==n&&(t.flags|=2048),bn(We),Ke(t),null;case 25:return null;case 30:return null}throw Error(c(156,t.tag))}function D0(e,t){switch(xc(t),t.tag){case 1:return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return bn(We),ze(),e=t.flags,(e&65536)!==0&&(e&128)===0?(t.flags=e&-65537|128,t):null;case 26:case 27:case 5:return we(t),null;case 13:if(Sn(t),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(c(340));ti()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return P(Ie),null;case 4:return ze(),null;case 10:return bn(t.type),null;case 22:case 23:return Sn(t),zc(),e!==null&&P(jl),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 24:return bn(We),null;case 25:return null;default:return null}}function Nh(e,t){switch(xc(t),t.tag){case 3:bn(We),ze();break;case 26:case 27:case 5:we(t);break;case 4:ze();break;case 13:Sn(t);break;case 19:P(Ie);break;case 10:bn(t.type);break;case 22:case 23:Sn(t),zc(),e!==null&&P(jl);break;case 24:bn(We)}}function yi(e,t){try{var n=t.updateQueue,l=n!==null?n.lastEffect:null;if(l!==null){var i=l.next;n=i;do{if((n.tag&e)===e){l=void 0;var o=n.create,h=n.inst;l=o(),h.destroy=l}n=n.next}while(n!==i)}}catch(p){qe(t,t.return,p)}}function Vn(e,t,n){try{var l=t.updateQueue,i=l!==null?l.lastEffect:null;if(i!==null){var o=i.next;l=o;do{if((l.tag&e)===e){var h=l.inst,p=h.destroy;if(p!==void 0){h.destroy=void 0,i=t;var E=n,D=p;try{D()}catch(q){qe(i,E,q)}}}l=l.next}while(l!==o)}}catch(q){qe(t,t.return,q)}}function Ch(e){var t=e.updateQueue;if(t!==null){var n=e.stateNode;try{gd(t,n)}catch(l){qe(e,e.return,l)}}}function Rh(e,t,n){n.props=Cl(e.type,e.memoizedProps),n.state=e.memoizedState;try{n.componentWillUnmount()}catch(l){qe(e,t,l)}}function bi(e,t){try{var n=e.ref;if(n!==null){switch(e.tag){case 26:case 27:case 5:var l=e.stateNode;break;case 30:l=e.stateNode;break;default:l=e.stateNode}typeof n=="function"?e.refCleanup=n(l):n.current=l}}catch(i){qe(e,t,i)}}function an(e,t){var n=e.ref,l=e.refCleanup;if(n!==null)if(typeof l=="function")try{l()}catch(i){qe(e,t,i)}finally{e.refCleanup=null,e=e.alternate,e!=null&&(e.refCleanup=null)}else if(typeof n=="function")try{n(null)}catch(i){qe(e,t,i)}else n.current=null}function Oh(e){var t=e.type,n=e.memoizedProps,l=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":n.autoFocus&&l.focus();break e;case"img":n.src?l.src=n.src:n.srcSet&&(l.srcset=n.srcSet)}}catch(i){qe(e,e.return,i)}}function cu(e,t,n){try{var l=e.stateNode;eb(l,e.type,n,t),l[yt]=t}catch(i){qe(e,e.return,i)}}function Mh(e){return e.tag===5||e.tag===3||e.tag===26||e.tag===27&&Pn(e.type)||e.tag===4}function uu(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Mh(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.tag===27&&Pn(e.type)||e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function su(e,t,n){var l=e.tag;if(l===5||l===6)e=e.stateNode,t?(n.nodeType===9?n.body:n.nodeName==="HTML"?n.ownerDocument.body:n).insertBefore(e,t):(t=n.nodeType===9?n.body:n.nodeName==="HTML"?n.ownerDocument.body:n,t.appendChild(e),n=n._reactRootContainer,n!=null||t.onclick!==null||(t.onclick=Zr));else if(l!==4&&(l===27&&Pn(e.type)&&(n=e.stateNode,t=null),e=e.child,e!==null))for(su(e,t,n),e=e.sibling;e!==null;)su(e,t,n),e=e.sibling}function Ur(e,t,n){var l=e.tag;if(l===5||l===6)e=e.stateNode,t?n.insertBefore(e,t):n.appendChild(e);else if(l!==4&&(l===27&&Pn(e.type)&&(n=e.stateNode),e=e.child,e!==null))for(Ur(e,t,n),e=e.sibling;e!==null;)Ur(e,t,n),e=e.sibling}function Dh(e){var t=e.stateNode,n=e.memoizedProps;try{for(var l=e.type,i=t.attributes;i.length;)t.removeAttributeNode(i[0]);ut(t,l,n),t[ft]=e,t[yt]=n}catch(o){qe(e,e.return,o)}}var En=!1,Je=!1,fu=!1,zh=typeof WeakSet=="function"?WeakSet:Set,lt=null;function z0(e,t){if(e=e.containerInfo,ku=eo,e=Kf(e),uc(e)){if("selectionStart"in e)var n={start:e.selectionStart,end:e.selectionEnd};else e:{n=(n=e.ownerDocument)&&n.defaultView||window;var l=n.getSelection&&n.getSelection();if(l&&l.rangeCount!==0){n=l.anchorNode;var i=l.anchorOffset,o=l.focusNode;l=l.focusOffset;try{n.nodeType,o.nodeType}catch{n=null;break e}var h=0,p=-1,E=-1,D=0,q=0,K=e,k=null;t:for(;;){for(var H;K!==n||i!==0&&K.nodeType!==3||(p=h+i),K!==o||l!==0&&K.nodeType!==3||(E=h+l),K.nodeType===3&&(h+=K.nodeValue.length),(H=K.firstChild)!==null;)k=K,K=H;for(;;){if(K===e)break t;if(k===n&&++D===i&&(p=h),k===o&&++q===l&&(E=h),(H=K.nextSibling)!==null)break;K=k,k=K.parentNode}K=H}n=p===-1||E===-1?null:{start:p,end:E}}else n=null}n=n||{start:0,end:0}}else n=null;for(Uu={focusedElem:e,selectionRange:n},eo=!1,lt=t;lt!==null;)if(t=lt,e=t.child,(t.subtreeFlags&1024)!==0&&e!==null)e.return=t,lt=e;else for(;lt!==null;){switch(t=lt,o=t.alternate,e=t.flags,t.tag){case 0:break;case 11:case 15:break;case 1:if((e&1024)!==0&&o!==null){e=void 0,n=t,i=o.memoizedProps,o=o.memoizedState,l=n.stateNode;try{var de=Cl(n.type,i,n.elementType===n.type);e=l.getSnapshotBeforeUpdate(de,o),l.__reactInternalSnapshotBeforeUpdate=e}catch(ue){qe(n,n.return,ue)}}break;case 3:if((e&1024)!==0){if(e=t.stateNode.containerInfo,n=e.nodeType,n===9)Lu(e);else if(n===1)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":Lu(e);break;default:e.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((e&1024)!==0)throw Error(c(163))}if(e=t.sibling,e!==null){e.return=t.return,lt=e;break}lt=t.return}}function kh(e,t,n){var l=n.flags;switch(n.tag){case 0:case 11:case 15:Yn(e,n),l&4&&yi(5,n);break;case 1:if(Yn(e,n),l&4)if(e=n.stateNode,t===null)try{e.componentDidMount()}catch(h){qe(n,n.return,h)}else{var i=Cl(n.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(i,t,e.__reactInternalSnapshotBeforeUpdate)}catch(h){qe(n,n.return,h)}}l&64&&Ch(n),l&512&&bi(n,n.return);break;case 3:if(Yn(e,n),l&64&&(e=n.updateQueue,e!==null)){if(t=null,n.child!==null)switch(n.child.tag){case 27:case 5:t=n.child.stateNode;break;case 1:t=n.child.stateNode}try{gd(e,t)}catch(h){qe(n,n.return,h)}}break;case 27:t===null&&l&4&&Dh(n);case 26:case 5:Yn(e,n),t===null&&l&4&&Oh(n),l&512&&bi(n,n.return);break;case 12:Yn(e,n);break;case 13:Yn(e,n),l&4&&Hh(e,n),l&64&&(e=n.memoizedState,e!==null&&(e=e.dehydrated,e!==null&&(n=Y0.bind(null,n),ob(e,n))));break;case 22:if(l=n.memoizedState!==null||En,!l){t=t!==null&&t.memoizedState!==null||Je,i=En;var o=Je;En=l,(Je=t)&&!o?Xn(e,n,(n.subtreeFlags&8772)!==0):Yn(e,n),En=i,Je=o}break;case 30:break;default:Yn(e,n)}}function Uh(e){var t=e.alternate;t!==null&&(e.alternate=null,Uh(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&Xo(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var Xe=null,St=!1;function An(e,t,n){for(n=n.child;n!==null;)Bh(e,t,n),n=n.sibling}function Bh(e,t,n){if(_t&&typeof _t.onCommitFiberUnmount=="function")try{_t.onCommitFiberUnmount(qa,n)}catch{}switch(n.tag){case 26:Je||an(n,t),An(e,t,n),n.memoizedState?n.memoizedState.count--:n.stateNode&&(n=n.stateNode,n.parentNode.removeChild(n));break;case 27:Je||an(n,t);var l=Xe,i=St;Pn(n.type)&&(Xe=n.stateNode,St=!1),An(e,t,n),Ni(n.stateNode),Xe=l,St=i;break;case 5:Je||an(n,t);case 6:if(l=Xe,i=St,Xe=null,An(e,t,n),Xe=l,St=i,Xe!==null)if(St)try{(Xe.nodeType===9?Xe.body:Xe.nodeName==="HTML"?Xe.ownerDocument.body:Xe).removeChild(n.stateNode)}catch(o){qe(n,t,o)}else try{Xe.removeChild(n.stateNode)}catch(o){qe(n,t,o)}break;case 18:Xe!==null&&(St?(e=Xe,Am(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,n.stateNode),Ui(e)):Am(Xe,n.stateNode));break;case 4:l=Xe,i=St,Xe=n.stateNode.containerInfo,St=!0,An(e,t,n),Xe=l,St=i;break;case 0:case 11:case 14:case 15:Je||Vn(2,n,t),Je||Vn(4,n,t),An(e,t,n);break;case 1:Je||(an(n,t),l=n.stateNode,typeof l.componentWillUnmount=="function"&&Rh(n,t,l)),An(e,t,n);break;case 21:An(e,t,n);break;case 22:Je=(l=Je)||n.memoizedState!==null,An(e,t,n),Je=l;break;default:An(e,t,n)}}function Hh(e,t){if(t.memoizedState===null&&(e=t.alternate,e!==null&&(e=e.memoizedState,e!==null&&(e=e.dehydrated,e!==null))))try{Ui(e)}catch(n){qe(t,t.return,n)}}function k0(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return t===null&&(t=e.stateNode=new zh),t;case 22:return e=e.stateNode,t=e._retryCache,t===null&&(t=e._retryCache=new zh),t;default:throw Error(c(435,e.tag))}}function du(e,t){var n=k0(e);t.forEach(function(l){var i=X0.bind(null,e,l);n.has(l)||(n.add(l),l.then(i,i))})}function jt(e,t){var n=t.deletions;if(n!==null)for(var l=0;l<n.length;l++){var i=n[l],o=e,h=t,p=h;e:for(;p!==null;){switch(p.tag){case 27:if(Pn(p.type)){Xe=p.stateNode,St=!1;break e}break;case 5:Xe=p.stateNode,St=!1;break e;case 3:case 4:Xe=p.stateNode.containerInfo,St=!0;break e}p=p.return}if(Xe===null)throw Error(c(160));Bh(o,h,i),Xe=null,St=!1,o=i.alternate,o!==null&&(o.return=null),i.return=null}if(t.subtreeFlags&13878)for(t=t.child;t!==null;)Lh(t,e),t=t.sibling}var Pt=null;function Lh(e,t){var n=e.alternate,l=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:jt(t,e),Nt(e),l&4&&(Vn(3,e,e.return),yi(3,e),Vn(5,e,e.return));break;case 1:jt(t,e),Nt(e),l&512&&(Je||n===null||an(n,n.return)),l&64&&En&&(e=e.updateQueue,e!==null&&(l=e.callbacks,l!==null&&(n=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=n===null?l:n.concat(l))));break;case 26:var i=Pt;if(jt(t,e),Nt(e),l&512&&(Je||n===null||an(n,n.return)),l&4){var o=n!==null?n.memoizedState:null;if(l=e.memoizedState,n===null)if(l===null)if(e.stateNode===null){e:{l=e.type,n=e.memoizedProps,i=i.ownerDocument||i;t:switch(l){case"title":o=i.getElementsByTagName("title")[0],(!o||o[Ya]||o[ft]||o.namespaceURI==="http://www.w3.org/2000/svg"||o.hasAttribute("itemprop"))&&(o=i.createElement(l),i.head.insertBefore(o,i.querySelector("head > title"))),ut(o,l,n),o[ft]=e,tt(o),l=o;break e;case"link":var h=Dm("link","href",i).get(l+(n.href||""));if(h){for(var p=0;p<h.length;p++)if(o=h[p],o.getAttribute("href")===(n.href==null||n.href===""?null:n.href)&&o.getAttribute("rel")===(n.rel==null?null:n.rel)&&o.getAttribute("title")===(n.title==null?null:n.title)&&o.getAttribute("crossorigin")===(n.crossOrigin==null?null:n.crossOrigin)){h.splice(p,1);break t}}o=i.createElement(l),ut(o,l,n),i.head.appendChild(o);break;case"meta":if(h=Dm("meta","content",i).get(l+(n.content||""))){for(p=0;p<h.length;p++)if(o=h[p],o.getAttribute("content")===(n.content==null?null:""+n.content)&&o.getAttribute("name")===(n.name==null?null:n.name)&&o.getAttribute("property")===(n.property==null?null:n.property)&&o.getAttribute("http-equiv")===(n.httpEquiv==null?null:n.httpEquiv)&&o.getAttribute("charset")===(n.charSet==null?null:n.charSet)){h.splice(p,1);break t}}o=i.createElement(l),ut(o,l,n),i.head.appendChild(o);break;default:throw Error(c(468,l))}o[ft]=e,tt(o),l=o}e.stateNode=l}else zm(i,e.type,e.stateNode);else e.stateNode=Mm(i,l,e.memoizedProps);else o!==l?(o===null?n.stateNode!==null&&(n=n.stateNode,n.parentNode.removeChild(n)):o.count--,l===null?zm(i,e.type,e.stateNode):Mm(i,l,e.memoizedProps)):l===null&&e.stateNode!==null&&cu(e,e.memoizedProps,n.memoizedProps)}break;case 27:jt(t,e),Nt(e),l&512&&(Je||n===null||an(n,n.return)),n!==null&&l&4&&cu(e,e.memoizedProps,n.memoizedProps);break;case 5:if(jt(t,e),Nt(e),l&512&&(Je||n===null||an(n,n.return)),e.flags&32){i=e.stateNode;try{Ql(i,"")}catch(H){qe(e,e.return,H)}}l&4&&e.stateNode!=null&&(i=e.memoizedProps,cu(e,i,n!==null?n.memoizedProps:i)),l&1024&&(fu=!0);break;case 6:if(jt(t,e),Nt(e),l&4){if(e.stateNode===null)throw Error(c(162));l=e.memoizedProps,n=e.stateNode;try{n.nodeValue=l}catch(H){qe(e,e.return,H)}}break;case 3:if($r=null,i=Pt,Pt=Jr(t.containerInfo),jt(t,e),Pt=i,Nt(e),l&4&&n!==null&&n.memoizedState.isDehydrated)try{Ui(t.containerInfo)}catch(H){qe(e,e.return,H)}fu&&(fu=!1,qh(e));break;case 4:l=Pt,Pt=Jr(e.stateNode.containerInfo),jt(t,e),Nt(e),Pt=l;break;case 12:jt(t,e),Nt(e);break;case 13:jt(t,e),Nt(e),e.child.flags&8192&&e.memoizedState!==null!=(n!==null&&n.memoizedState!==null)&&(yu=st()),l&4&&(l=e.updateQueue,l!==null&&(e.updateQueue=null,du(e,l)));break;case 22:i=e.memoizedState!==null;var E=n!==null&&n.memoizedState!==null,D=En,q=Je;if(En=D||i,Je=q||E,jt(t,e),Je=q,En=D,Nt(e),l&8192)e:for(t=e.stateNode,t._visibility=i?t._visibility&-2:t._visibility|1,i&&(n===null||E||En||Je||Rl(e)),n=null,t=e;;){if(t.tag===5||t.tag===26){if(n===null){E=n=t;try{if(o=E.stateNode,i)h=o.style,typeof h.setProperty=="function"?h.setProperty("display","none","important"):h.display="none";else{p=E.stateNode;var K=E.memoizedProps.style,k=K!=null&&K.hasOwnProperty("display")?K.display:null;p.style.display=k==null||typeof k=="boolean"?"":(""+k).trim()}}catch(H){qe(E,E.return,H)}}}else if(t.tag===6){if(n===null){E=t;try{E.stateNode.nodeValue=i?"":E.memoizedProps}catch(H){qe(E,E.return,H)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===e)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;t.sibling===null;){if(t.return===null||t.return===e)break e;n===t&&(n=null),t=t.return}n===t&&(n=null),t.sibling.return=t.return,t=t.sibling}l&4&&(l=e.updateQueue,l!==null&&(n=l.retryQueue,n!==null&&(l.retryQueue=null,du(e,n))));break;case 19:jt(t,e),Nt(e),l&4&&(l=e.updateQueue,l!==null&&(e.updateQueue=null,du(e,l)));break;case 30:break;case 21:break;default:jt(t,e),Nt(e)}}function Nt(e){var t=e.flags;if(t&2){try{for(var n,l=e.return;l!==null;){if(Mh(l)){n=l;break}l=l.return}if(n==null)throw Error(c(160));switch(n.tag){case 27:var i=n.stateNode,o=uu(e);Ur(e,o,i);break;case 5:var h=n.stateNode;n.flags&32&&(Ql(h,""),n.flags&=-33);var p=uu(e);Ur(e,p,h);break;case 3:case 4:var E=n.stateNode.containerInfo,D=uu(e);su(e,D,E);break;default:throw Error(c(161))}}catch(q){qe(e,e.return,q)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function qh(e){if(e.subtreeFlags&1024)for(e=e.child;e!==null;){var t=e;qh(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),e=e.sibling}}function Yn(e,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)kh(e,t.alternate,t),t=t.sibling}function Rl(e){for(e=e.child;e!==null;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:Vn(4,t,t.return),Rl(t);break;case 1:an(t,t.return);var n=t.stateNode;typeof n.componentWillUnmount=="function"&&Rh(t,t.return,n),Rl(t);break;case 27:Ni(t.stateNode);case 26:case 5:an(t,t.return),Rl(t);break;case 22:t.memoizedState===null&&Rl(t);break;case 30:Rl(t);break;default:Rl(t)}e=e.sibling}}function Xn(e,t,n){for(n=n&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var l=t.alternate,i=e,o=t,h=o.flags;switch(o.tag){case 0:case 11:case 15:Xn(i,o,n),yi(4,o);break;case 1:if(Xn(i,o,n),l=o,i=l.stateNode,typeof i.componentDidMount=="function")try{i.componentDidMount()}catch(D){qe(l,l.return,D)}if(l=o,i=l.updateQueue,i!==null){var p=l.stateNode;try{var E=i.shared.hiddenCallbacks;if(E!==null)for(i.shared.hiddenCallbacks=null,i=0;i<E.length;i++)vd(E[i],p)}catch(D){qe(l,l.return,D)}}n&&h&64&&Ch(o),bi(o,o.return);break;case 27:Dh(o);case 26:case 5:Xn(i,o,n),n&&l===null&&h&4&&Oh(o),bi(o,o.return);break;case 12:Xn(i,o,n);break;case 13:Xn(i,o,n),n&&h&4&&Hh(i,o);break;case 22:o.memoizedState===null&&Xn(i,o,n),bi(o,o.return);break;case 30:break;default:Xn(i,o,n)}t=t.sibling}}function hu(e,t){var n=null;e!==null&&e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(n=e.memoizedState.cachePool.pool),e=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),e!==n&&(e!=null&&e.refCount++,n!=null&&ai(n))}function mu(e,t){e=null,t.alternate!==null&&(e=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==e&&(t.refCount++,e!=null&&ai(e))}function rn(e,t,n,l){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)Gh(e,t,n,l),t=t.sibling}function Gh(e,t,n,l){var i=t.flags;switch(t.tag){case 0:case 11:case 15:rn(e,t,n,l),i&2048&&yi(9,t);break;case 1:rn(e,t,n,l);break;case 3:rn(e,t,n,l),i&2048&&(e=null,t.alternate!==null&&(e=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==e&&(t.refCount++,e!=null&&ai(e)));break;case 12:if(i&2048){rn(e,t,n,l),e=t.stateNode;try{var o=t.memoizedProps,h=o.id,p=o.onPostCommit;typeof p=="function"&&p(h,t.alternate===null?"mount":"update",e.passiveEffectDuration,-0)}catch(E){qe(t,t.return,E)}}else rn(e,t,n,l);break;case 13:rn(e,t,n,l);break;case 23:break;case 22:o=t.stateNode,h=t.alternate,t.memoizedState!==null?o._visibility&2?rn(e,t,n,l):xi(e,t):o._visibility&2?rn(e,t,n,l):(o._visibility|=2,fa(e,t,n,l,(t.subtreeFlags&10256)!==0)),i&2048&&hu(h,t);break;case 24:rn(e,t,n,l),i&2048&&mu(t.alternate,t);break;default:rn(e,t,n,l)}}function fa(e,t,n,l,i){for(i=i&&(t.subtreeFlags&10256)!==0,t=t.child;t!==null;){var o=e,h=t,p=n,E=l,D=h.flags;switch(h.tag){case 0:case 11:case 15:fa(o,h,p,E,i),yi(8,h);break;case 23:break;case 22:var q=h.stateNode;h.memoizedState!==null?q._visibility&2?fa(o,h,p,E,i):xi(o,h):(q._visibility|=2,fa(o,h,p,E,i)),i&&D&2048&&hu(h.alternate,h);break;case 24:fa(o,h,p,E,i),i&&D&2048&&mu(h.alternate,h);break;default:fa(o,h,p,E,i)}t=t.sibling}}function xi(e,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var n=e,l=t,i=l.flags;switch(l.tag){case 22:xi(n,l),i&2048&&hu(l.alternate,l);break;case 24:xi(n,l),i&2048&&mu(l.alternate,l);break;default:xi(n,l)}t=t.sibling}}var Si=8192;function da(e){if(e.subtreeFlags&Si)for(e=e.child;e!==null;)Vh(e),e=e.sibling}function Vh(e){switch(e.tag){case 26:da(e),e.flags&Si&&e.memoizedState!==null&&xb(Pt,e.memoizedState,e.memoizedProps);break;case 5:da(e);break;case 3:case 4:var t=Pt;Pt=Jr(e.stateNode.containerInfo),da(e),Pt=t;break;case 22:e.memoizedState===null&&(t=e.alternate,t!==null&&t.memoizedState!==null?(t=Si,Si=16777216,da(e),Si=t):da(e));break;default:da(e)}}function Yh(e){var t=e.alternate;if(t!==null&&(e=t.child,e!==null)){t.child=null;do t=e.sibling,e.sibling=null,e=t;while(e!==null)}}function wi(e){var t=e.deletions;if((e.flags&16)!==0){if(t!==null)for(var n=0;n<t.length;n++){var l=t[n];lt=l,Kh(l,e)}Yh(e)}if(e.subtreeFlags&10256)for(e=e.child;e!==null;)Xh(e),e=e.sibling}function Xh(e){switch(e.tag){case 0:case 11:case 15:wi(e),e.flags&2048&&Vn(9,e,e.return);break;case 3:wi(e);break;case 12:wi(e);break;case 22:var t=e.stateNode;e.memoizedState!==null&&t._visibility&2&&(e.return===null||e.return.tag!==13)?(t._visibility&=-3,Br(e)):wi(e);break;default:wi(e)}}function Br(e){var t=e.deletions;if((e.flags&16)!==0){if(t!==null)for(var n=0;n<t.length;n++){var l=t[n];lt=l,Kh(l,e)}Yh(e)}for(e=e.child;e!==null;){switch(t=e,t.tag){case 0:case 11:case 15:Vn(8,t,t.return),Br(t);break;case 22:n=t.stateNode,n._visibility&2&&(n._visibility&=-3,Br(t));break;default:Br(t)}e=e.sibling}}function Kh(e,t){for(;lt!==null;){var n=lt;switch(n.tag){case 0:case 11:case 15:Vn(8,n,t);break;case 23:case 22:if(n.memoizedState!==null&&n.memoizedState.cachePool!==null){var l=n.memoizedState.cachePool.pool;l!=null&&l.refCount++}break;case 24:ai(n.memoizedState.cache)}if(l=n.child,l!==null)l.return=n,lt=l;else e:for(n=e;lt!==null;){l=lt;var i=l.sibling,o=l.return;if(Uh(l),l===n){lt=null;break e}if(i!==null){i.return=o,lt=i;break e}lt=o}}}var U0={getCacheForType:function(e){var t=dt(We),n=t.data.get(e);return n===void 0&&(n=e(),t.data.set(e,n)),n}},B0=typeof WeakMap=="function"?WeakMap:Map,ke=0,Ve=null,Ee=null,Re=0,Ue=0,Ct=null,Kn=!1,ha=!1,vu=!1,Tn=0,Ze=0,Qn=0,Ol=0,gu=0,Zt=0,ma=0,_i=null,wt=null,pu=!1,yu=0,Hr=1/0,Lr=null,Zn=null,ct=0,Fn=null,va=null,ga=0,bu=0,xu=null,Qh=null,Ei=0,Su=null;function Rt(){if((ke&2)!==0&&Re!==0)return Re&-Re;if(O.T!==null){var e=la;return e!==0?e:Nu()}return cf()}function Zh(){Zt===0&&(Zt=(Re&536870912)===0||De?lf():536870912);var e=Qt.current;return e!==null&&(e.flags|=32),Zt}function Ot(e,t,n){(e===Ve&&(Ue===2||Ue===9)||e.cancelPendingCommit!==null)&&(pa(e,0),Jn(e,Re,Zt,!1)),Va(e,n),((ke&2)===0||e!==Ve)&&(e===Ve&&((ke&2)===0&&(Ol|=n),Ze===4&&Jn(e,Re,Zt,!1)),on(e))}function Fh(e,t,n){if((ke&6)!==0)throw Error(c(327));var l=!n&&(t&124)===0&&(t&e.expiredLanes)===0||Ga(e,t),i=l?q0(e,t):Eu(e,t,!0),o=l;do{if(i===0){ha&&!l&&Jn(e,t,0,!1);break}else{if(n=e.current.alternate,o&&!H0(n)){i=Eu(e,t,!1),o=!1;continue}if(i===2){if(o=t,e.errorRecoveryDisabledLanes&o)var h=0;else h=e.pendingLanes&-536870913,h=h!==0?h:h&536870912?536870912:0;if(h!==0){t=h;e:{var p=e;i=_i;var E=p.current.memoizedState.isDehydrated;if(E&&(pa(p,h).flags|=256),h=Eu(p,h,!1),h!==2){if(vu&&!E){p.errorRecoveryDisabledLanes|=o,Ol|=o,i=4;break e}o=wt,wt=i,o!==null&&(wt===null?wt=o:wt.push.apply(wt,o))}i=h}if(o=!1,i!==2)continue}}if(i===1){pa(e,0),Jn(e,t,0,!0);break}e:{switch(l=e,o=i,o){case 0:case 1:throw Error(c(345));case 4:if((t&4194048)!==t)break;case 6:Jn(l,t,Zt,!Kn);break e;case 2:wt=null;break;case 3:case 5:break;default:throw Error(c(329))}if((t&62914560)===t&&(i=yu+300-st(),10<i)){if(Jn(l,t,Zt,!Kn),Pi(l,0,!0)!==0)break e;l.timeoutHandle=_m(Jh.bind(null,l,n,wt,Lr,pu,t,Zt,Ol,ma,Kn,o,2,-0,0),i);break e}Jh(l,n,wt,Lr,pu,t,Zt,Ol,ma,Kn,o,0,-0,0)}}break}while(!0);on(e)}function Jh(e,t,n,l,i,o,h,p,E,D,q,K,k,H){if(e.timeoutHandle=-1,K=t.subtreeFlags,(K&8192||(K&16785408)===16785408)&&(Oi={stylesheets:null,count:0,unsuspend:bb},Vh(t),K=Sb(),K!==null)){e.cancelPendingCommit=K(nm.bind(null,e,t,o,n,l,i,h,p,E,q,1,k,H)),Jn(e,o,h,!D);return}nm(e,t,o,n,l,i,h,p,E)}function H0(e){for(var t=e;;){var n=t.tag;if((n===0||n===11||n===15)&&t.flags&16384&&(n=t.updateQueue,n!==null&&(n=n.stores,n!==null)))for(var l=0;l<n.length;l++){var i=n[l],o=i.getSnapshot;i=i.value;try{if(!At(o(),i))return!1}catch{return!1}}if(n=t.child,t.subtreeFlags&16384&&n!==null)n.return=t,t=n;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Jn(e,t,n,l){t&=~gu,t&=~Ol,e.suspendedLanes|=t,e.pingedLanes&=~t,l&&(e.warmLanes|=t),l=e.expirationTimes;for(var i=t;0<i;){var o=31-Et(i),h=1<<o;l[o]=-1,i&=~h}n!==0&&rf(e,n,t)}function qr(){return(ke&6)===0?(Ai(0),!1):!0}function wu(){if(Ee!==null){if(Ue===0)var e=Ee.return;else e=Ee,yn=Al=null,Lc(e),ua=null,vi=0,e=Ee;for(;e!==null;)Nh(e.alternate,e),e=e.return;Ee=null}}function pa(e,t){var n=e.timeoutHandle;n!==-1&&(e.timeoutHandle=-1,nb(n)),n=e.cancelPendingCommit,n!==null&&(e.cancelPendingCommit=null,n()),wu(),Ve=e,Ee=n=vn(e.current,null),Re=t,Ue=0,Ct=null,Kn=!1,ha=Ga(e,t),vu=!1,ma=Zt=gu=Ol=Qn=Ze=0,wt=_i=null,pu=!1,(t&8)!==0&&(t|=t&32);var l=e.entangledLanes;if(l!==0)for(e=e.entanglements,l&=t;0<l;){var i=31-Et(l),o=1<<i;t|=e[i],l&=~o}return Tn=t,cr(),n}function Ph(e,t){be=null,O.H=jr,t===ri||t===pr?(t=hd(),Ue=3):t===sd?(t=hd(),Ue=4):Ue=t===mh?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,Ct=t,Ee===null&&(Ze=1,Mr(e,Vt(t,e.current)))}function $h(){var e=O.H;return O.H=jr,e===null?jr:e}function Wh(){var e=O.A;return O.A=U0,e}function _u(){Ze=4,Kn||(Re&4194048)!==Re&&Qt.current!==null||(ha=!0),(Qn&134217727)===0&&(Ol&134217727)===0||Ve===null||Jn(Ve,Re,Zt,!1)}function Eu(e,t,n){var l=ke;ke|=2;var i=$h(),o=Wh();(Ve!==e||Re!==t)&&(Lr=null,pa(e,t)),t=!1;var h=Ze;e:do try{if(Ue!==0&&Ee!==null){var p=Ee,E=Ct;switch(Ue){case 8:wu(),h=6;break e;case 3:case 2:case 9:case 6:Qt.current===null&&(t=!0);var D=Ue;if(Ue=0,Ct=null,ya(e,p,E,D),n&&ha){h=0;break e}break;default:D=Ue,Ue=0,Ct=null,ya(e,p,E,D)}}L0(),h=Ze;break}catch(q){Ph(e,q)}while(!0);return t&&e.shellSuspendCounter++,yn=Al=null,ke=l,O.H=i,O.A=o,Ee===null&&(Ve=null,Re=0,cr()),h}function L0(){for(;Ee!==null;)Ih(Ee)}function q0(e,t){var n=ke;ke|=2;var l=$h(),i=Wh();Ve!==e||Re!==t?(Lr=null,Hr=st()+500,pa(e,t)):ha=Ga(e,t);e:do try{if(Ue!==0&&Ee!==null){t=Ee;var o=Ct;t:switch(Ue){case 1:Ue=0,Ct=null,ya(e,t,o,1);break;case 2:case 9:if(fd(o)){Ue=0,Ct=null,em(t);break}t=function(){Ue!==2&&Ue!==9||Ve!==e||(Ue=7),on(e)},o.then(t,t);break e;case 3:Ue=7;break e;case 4:Ue=5;break e;case 7:fd(o)?(Ue=0,Ct=null,em(t)):(Ue=0,Ct=null,ya(e,t,o,7));break;case 5:var h=null;switch(Ee.tag){case 26:h=Ee.memoizedState;case 5:case 27:var p=Ee;if(!h||km(h)){Ue=0,Ct=null;var E=p.sibling;if(E!==null)Ee=E;else{var D=p.return;D!==null?(Ee=D,Gr(D)):Ee=null}break t}}Ue=0,Ct=null,ya(e,t,o,5);break;case 6:Ue=0,Ct=null,ya(e,t,o,6);break;case 8:wu(),Ze=6;break e;default:throw Error(c(462))}}G0();break}catch(q){Ph(e,q)}while(!0);return yn=Al=null,O.H=l,O.A=i,ke=n,Ee!==null?0:(Ve=null,Re=0,cr(),Ze)}function G0(){for(;Ee!==null&&!dl();)Ih(Ee)}function Ih(e){var t=Th(e.alternate,e,Tn);e.memoizedProps=e.pendingProps,t===null?Gr(e):Ee=t}function em(e){var t=e,n=t.alternate;switch(t.tag){case 15:case 0:t=xh(n,t,t.pendingProps,t.type,void 0,Re);break;case 11:t=xh(n,t,t.pendingProps,t.type.render,t.ref,Re);break;case 5:Lc(t);default:Nh(n,t),t=Ee=td(t,Tn),t=Th(n,t,Tn)}e.memoizedProps=e.pendingProps,t===null?Gr(e):Ee=t}function ya(e,t,n,l){yn=Al=null,Lc(t),ua=null,vi=0;var i=t.return;try{if(R0(e,i,t,n,Re)){Ze=1,Mr(e,Vt(n,e.current)),Ee=null;return}}catch(o){if(i!==null)throw Ee=i,o;Ze=1,Mr(e,Vt(n,e.current)),Ee=null;return}t.flags&32768?(De||l===1?e=!0:ha||(Re&536870912)!==0?e=!1:(Kn=e=!0,(l===2||l===9||l===3||l===6)&&(l=Qt.current,l!==null&&l.tag===13&&(l.flags|=16384))),tm(t,e)):Gr(t)}function Gr(e){var t=e;do{if((t.flags&32768)!==0){tm(t,Kn);return}e=t.return;var n=M0(t.alternate,t,Tn);if(n!==null){Ee=n;return}if(t=t.sibling,t!==null){Ee=t;return}Ee=t=e}while(t!==null);Ze===0&&(Ze=5)}function tm(e,t){do{var n=D0(e.alternate,e);if(n!==null){n.flags&=32767,Ee=n;return}if(n=e.return,n!==null&&(n.flags|=32768,n.subtreeFlags=0,n.deletions=null),!t&&(e=e.sibling,e!==null)){Ee=e;return}Ee=e=n}while(e!==null);Ze=6,Ee=null}function nm(e,t,n,l,i,o,h,p,E){e.cancelPendingCommit=null;do Vr();while(ct!==0);if((ke&6)!==0)throw Error(c(327));if(t!==null){if(t===e.current)throw Error(c(177));if(o=t.lanes|t.childLanes,o|=mc,by(e,n,o,h,p,E),e===Ve&&(Ee=Ve=null,Re=0),va=t,Fn=e,ga=n,bu=o,xu=i,Qh=l,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(e.callbackNode=null,e.callbackPriority=0,K0(Zi,function(){return om(),null})):(e.callbackNode=null,e.callbackPriority=0),l=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||l){l=O.T,O.T=null,i=Z.p,Z.p=2,h=ke,ke|=4;try{z0(e,t,n)}finally{ke=h,Z.p=i,O.T=l}}ct=1,lm(),am(),im()}}function lm(){if(ct===1){ct=0;var e=Fn,t=va,n=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||n){n=O.T,O.T=null;var l=Z.p;Z.p=2;var i=ke;ke|=4;try{Lh(t,e);var o=Uu,h=Kf(e.containerInfo),p=o.focusedElem,E=o.selectionRange;if(h!==p&&p&&p.ownerDocument&&Xf(p.ownerDocument.documentElement,p)){if(E!==null&&uc(p)){var D=E.start,q=E.end;if(q===void 0&&(q=D),"selectionStart"in p)p.selectionStart=D,p.selectionEnd=Math.min(q,p.value.length);else{var K=p.ownerDocument||document,k=K&&K.defaultView||window;if(k.getSelection){var H=k.getSelection(),de=p.textContent.length,ue=Math.min(E.start,de),Le=E.end===void 0?ue:Math.min(E.end,de);!H.extend&&ue>Le&&(h=Le,Le=ue,ue=h);var R=Yf(p,ue),j=Yf(p,Le);if(R&&j&&(H.rangeCount!==1||H.anchorNode!==R.node||H.anchorOffset!==R.offset||H.focusNode!==j.node||H.focusOffset!==j.offset)){var M=K.createRange();M.setStart(R.node,R.offset),H.removeAllRanges(),ue>Le?(H.addRange(M),H.extend(j.node,j.offset)):(M.setEnd(j.node,j.offset),H.addRange(M))}}}}for(K=[],H=p;H=H.parentNode;)H.nodeType===1&&K.push({element:H,left:H.scrollLeft,top:H.scrollTop});for(typeof p.focus=="function"&&p.focus(),p=0;p<K.length;p++){var Y=K[p];Y.element.scrollLeft=Y.left,Y.element.scrollTop=Y.top}}eo=!!ku,Uu=ku=null}finally{ke=i,Z.p=l,O.T=n}}e.current=t,ct=2}}function am(){if(ct===2){ct=0;var e=Fn,t=va,n=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||n){n=O.T,O.T=null;var l=Z.p;Z.p=2;var i=ke;ke|=4;try{kh(e,t.alternate,t)}finally{ke=i,Z.p=l,O.T=n}}ct=3}}function im(){if(ct===4||ct===3){ct=0,hl();var e=Fn,t=va,n=ga,l=Qh;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?ct=5:(ct=0,va=Fn=null,rm(e,e.pendingLanes));var i=e.pendingLanes;if(i===0&&(Zn=null),Vo(n),t=t.stateNode,_t&&typeof _t.onCommitFiberRoot=="function")try{_t.onCommitFiberRoot(qa,t,void 0,(t.current.flags&128)===128)}catch{}if(l!==null){t=O.T,i=Z.p,Z.p=2,O.T=null;try{for(var o=e.onRecoverableError,h=0;h<l.length;h++){var p=l[h];o(p.value,{componentStack:p.stack})}}finally{O.T=t,Z.p=i}}(ga&3)!==0&&Vr(),on(e),i=e.pendingLanes,(n&4194090)!==0&&(i&42)!==0?e===Su?Ei++:(Ei=0,Su=e):Ei=0,Ai(0)}}function rm(e,t){(e.pooledCacheLanes&=t)===0&&(t=e.pooledCache,t!=null&&(e.pooledCache=null,ai(t)))}function Vr(e){return lm(),am(),im(),om()}function om(){if(ct!==5)return!1;var e=Fn,t=bu;bu=0;var n=Vo(ga),l=O.T,i=Z.p;try{Z.p=32>n?32:n,O.T=null,n=xu,xu=null;var o=Fn,h=ga;if(ct=0,va=Fn=null,ga=0,(ke&6)!==0)throw Error(c(331));var p=ke;if(ke|=4,Xh(o.current),Gh(o,o.current,h,n),ke=p,Ai(0,!1),_t&&typeof _t.onPostCommitFiberRoot=="function")try{_t.onPostCommitFiberRoot(qa,o)}catch{}return!0}finally{Z.p=i,O.T=l,rm(e,t)}}function cm(e,t,n){t=Vt(n,t),t=Ic(e.stateNode,t,2),e=Hn(e,t,2),e!==null&&(Va(e,2),on(e))}function qe(e,t,n){if(e.tag===3)cm(e,e,n);else for(;t!==null;){if(t.tag===3){cm(t,e,n);break}else if(t.tag===1){var l=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof l.componentDidCatch=="function"&&(Zn===null||!Zn.has(l))){e=Vt(n,e),n=dh(2),l=Hn(t,n,2),l!==null&&(hh(n,l,t,e),Va(l,2),on(l));break}}t=t.return}}function Au(e,t,n){var l=e.pingCache;if(l===null){l=e.pingCache=new B0;var i=new Set;l.set(t,i)}else i=l.get(t),i===void 0&&(i=new Set,l.set(t,i));i.has(n)||(vu=!0,i.add(n),e=V0.bind(null,e,t,n),t.then(e,e))}function V0(e,t,n){var l=e.pingCache;l!==null&&l.delete(t),e.pingedLanes|=e.suspendedLanes&n,e.warmLanes&=~n,Ve===e&&(Re&n)===n&&(Ze===4||Ze===3&&(Re&62914560)===Re&&300>st()-yu?(ke&2)===0&&pa(e,0):gu|=n,ma===Re&&(ma=0)),on(e)}function um(e,t){t===0&&(t=af()),e=Il(e,t),e!==null&&(Va(e,t),on(e))}function Y0(e){var t=e.memoizedState,n=0;t!==null&&(n=t.retryLane),um(e,n)}function X0(e,t){var n=0;switch(e.tag){case 13:var l=e.stateNode,i=e.memoizedState;i!==null&&(n=i.retryLane);break;case 19:l=e.stateNode;break;case 22:l=e.stateNode._retryCache;break;default:throw Error(c(314))}l!==null&&l.delete(t),um(e,n)}function K0(e,t){return rt(e,t)}var Yr=null,ba=null,Tu=!1,Xr=!1,ju=!1,Ml=0;function on(e){e!==ba&&e.next===null&&(ba===null?Yr=ba=e:ba=ba.next=e),Xr=!0,Tu||(Tu=!0,Z0())}function Ai(e,t){if(!ju&&Xr){ju=!0;do for(var n=!1,l=Yr;l!==null;){if(e!==0){var i=l.pendingLanes;if(i===0)var o=0;else{var h=l.suspendedLanes,p=l.pingedLanes;o=(1<<31-Et(42|e)+1)-1,o&=i&~(h&~p),o=o&201326741?o&201326741|1:o?o|2:0}o!==0&&(n=!0,hm(l,o))}else o=Re,o=Pi(l,l===Ve?o:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),(o&3)===0||Ga(l,o)||(n=!0,hm(l,o));l=l.next}while(n);ju=!1}}function Q0(){sm()}function sm(){Xr=Tu=!1;var e=0;Ml!==0&&(tb()&&(e=Ml),Ml=0);for(var t=st(),n=null,l=Yr;l!==null;){var i=l.next,o=fm(l,t);o===0?(l.next=null,n===null?Yr=i:n.next=i,i===null&&(ba=n)):(n=l,(e!==0||(o&3)!==0)&&(Xr=!0)),l=i}Ai(e)}function fm(e,t){for(var n=e.suspendedLanes,l=e.pingedLanes,i=e.expirationTimes,o=e.pendingLanes&-62914561;0<o;){var h=31-Et(o),p=1<<h,E=i[h];E===-1?((p&n)===0||(p&l)!==0)&&(i[h]=yy(p,t)):E<=t&&(e.expiredLanes|=p),o&=~p}if(t=Ve,n=Re,n=Pi(e,e===t?n:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),l=e.callbackNode,n===0||e===t&&(Ue===2||Ue===9)||e.cancelPendingCommit!==null)return l!==null&&l!==null&&pt(l),e.callbackNode=null,e.callbackPriority=0;if((n&3)===0||Ga(e,n)){if(t=n&-n,t===e.callbackPriority)return t;switch(l!==null&&pt(l),Vo(n)){case 2:case 8:n=tf;break;case 32:n=Zi;break;case 268435456:n=nf;break;default:n=Zi}return l=dm.bind(null,e),n=rt(n,l),e.callbackPriority=t,e.callbackNode=n,t}return l!==null&&l!==null&&pt(l),e.callbackPriority=2,e.callbackNode=null,2}function dm(e,t){if(ct!==0&&ct!==5)return e.callbackNode=null,e.callbackPriority=0,null;var n=e.callbackNode;if(Vr()&&e.callbackNode!==n)return null;var l=Re;return l=Pi(e,e===Ve?l:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),l===0?null:(Fh(e,l,t),fm(e,st()),e.callbackNode!=null&&e.callbackNode===n?dm.bind(null,e):null)}function hm(e,t){if(Vr())return null;Fh(e,t,!0)}function Z0(){lb(function(){(ke&6)!==0?rt(ml,Q0):sm()})}function Nu(){return Ml===0&&(Ml=lf()),Ml}function mm(e){return e==null||typeof e=="symbol"||typeof e=="boolean"?null:typeof e=="function"?e:tr(""+e)}function vm(e,t){var n=t.ownerDocument.createElement("input");return n.name=t.name,n.value=t.value,e.id&&n.setAttribute("form",e.id),t.parentNode.insertBefore(n,t),e=new FormData(e),n.parentNode.removeChild(n),e}function F0(e,t,n,l,i){if(t==="submit"&&n&&n.stateNode===i){var o=mm((i[yt]||null).action),h=l.submitter;h&&(t=(t=h[yt]||null)?mm(t.formAction):h.getAttribute("formAction"),t!==null&&(o=t,h=null));var p=new ir("action","action",null,l,i);e.push({event:p,listeners:[{instance:null,listener:function(){if(l.defaultPrevented){if(Ml!==0){var E=h?vm(i,h):new FormData(i);Fc(n,{pending:!0,data:E,method:i.method,action:o},null,E)}}else typeof o=="function"&&(p.preventDefault(),E=h?vm(i,h):new FormData(i),Fc(n,{pending:!0,data:E,method:i.method,action:o},o,E))},currentTarget:i}]})}}for(var Cu=0;Cu<hc.length;Cu++){var Ru=hc[Cu],J0=Ru.toLowerCase(),P0=Ru[0].toUpperCase()+Ru.slice(1);Jt(J0,"on"+P0)}Jt(Ff,"onAnimationEnd"),Jt(Jf,"onAnimationIteration"),Jt(Pf,"onAnimationStart"),Jt("dblclick","onDoubleClick"),Jt("focusin","onFocus"),Jt("focusout","onBlur"),Jt(h0,"onTransitionRun"),Jt(m0,"onTransitionStart"),Jt(v0,"onTransitionCancel"),Jt($f,"onTransitionEnd"),Yl("onMouseEnter",["mouseout","mouseover"]),Yl("onMouseLeave",["mouseout","mouseover"]),Yl("onPointerEnter",["pointerout","pointerover"]),Yl("onPointerLeave",["pointerout","pointerover"]),gl("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),gl("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),gl("onBeforeInput",["compositionend","keypress","textInput","paste"]),gl("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),gl("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),gl("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Ti="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),$0=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Ti));function gm(e,t){t=(t&4)!==0;for(var n=0;n<e.length;n++){var l=e[n],i=l.event;l=l.listeners;e:{var o=void 0;if(t)for(var h=l.length-1;0<=h;h--){var p=l[h],E=p.instance,D=p.currentTarget;if(p=p.listener,E!==o&&i.isPropagationStopped())break e;o=p,i.currentTarget=D;try{o(i)}catch(q){Or(q)}i.currentTarget=null,o=E}else for(h=0;h<l.length;h++){if(p=l[h],E=p.instance,D=p.currentTarget,p=p.listener,E!==o&&i.isPropagationStopped())break e;o=p,i.currentTarget=D;try{o(i)}catch(q){Or(q)}i.currentTarget=null,o=E}}}}function Ae(e,t){var n=t[Yo];n===void 0&&(n=t[Yo]=new Set);var l=e+"__bubble";n.has(l)||(pm(t,e,2,!1),n.add(l))}function Ou(e,t,n){var l=0;t&&(l|=4),pm(n,e,l,t)}var Kr="_reactListening"+Math.random().toString(36).slice(2);function Mu(e){if(!e[Kr]){e[Kr]=!0,sf.forEach(function(n){n!=="selectionchange"&&($0.has(n)||Ou(n,!1,e),Ou(n,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[Kr]||(t[Kr]=!0,Ou("selectionchange",!1,t))}}function pm(e,t,n,l){switch(Gm(t)){case 2:var i=Eb;break;case 8:i=Ab;break;default:i=Qu}n=i.bind(null,t,n,e),i=void 0,!ec||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(i=!0),l?i!==void 0?e.addEventListener(t,n,{capture:!0,passive:i}):e.addEventListener(t,n,!0):i!==void 0?e.addEventListener(t,n,{passive:i}):e.addEventListener(t,n,!1)}function Du(e,t,n,l,i){var o=l;if((t&1)===0&&(t&2)===0&&l!==null)e:for(;;){if(l===null)return;var h=l.tag;if(h===3||h===4){var p=l.stateNode.containerInfo;if(p===i)break;if(h===4)for(h=l.return;h!==null;){var E=h.tag;if((E===3||E===4)&&h.stateNode.containerInfo===i)return;h=h.return}for(;p!==null;){if(h=ql(p),h===null)return;if(E=h.tag,E===5||E===6||E===26||E===27){l=o=h;continue e}p=p.parentNode}}l=l.return}Ef(function(){var D=o,q=Wo(n),K=[];e:{var k=Wf.get(e);if(k!==void 0){var H=ir,de=e;switch(e){case"keypress":if(lr(n)===0)break e;case"keydown":case"keyup":H=Ky;break;case"focusin":de="focus",H=ac;break;case"focusout":de="blur",H=ac;break;case"beforeblur":case"afterblur":H=ac;break;case"click":if(n.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":H=jf;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":H=Dy;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":H=Fy;break;case Ff:case Jf:case Pf:H=Uy;break;case $f:H=Py;break;case"scroll":case"scrollend":H=Oy;break;case"wheel":H=Wy;break;case"copy":case"cut":case"paste":H=Hy;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":H=Cf;break;case"toggle":case"beforetoggle":H=e0}var ue=(t&4)!==0,Le=!ue&&(e==="scroll"||e==="scrollend"),R=ue?k!==null?k+"Capture":null:k;ue=[];for(var j=D,M;j!==null;){var Y=j;if(M=Y.stateNode,Y=Y.tag,Y!==5&&Y!==26&&Y!==27||M===null||R===null||(Y=Ka(j,R),Y!=null&&ue.push(ji(j,Y,M))),Le)break;j=j.return}0<ue.length&&(k=new H(k,de,null,n,q),K.push({event:k,listeners:ue}))}}if((t&7)===0){e:{if(k=e==="mouseover"||e==="pointerover",H=e==="mouseout"||e==="pointerout",k&&n!==$o&&(de=n.relatedTarget||n.fromElement)&&(ql(de)||de[Ll]))break e;if((H||k)&&(k=q.window===q?q:(k=q.ownerDocument)?k.defaultView||k.parentWindow:window,H?(de=n.relatedTarget||n.toElement,H=D,de=de?ql(de):null,de!==null&&(Le=d(de),ue=de.tag,de!==Le||ue!==5&&ue!==27&&ue!==6)&&(de=null)):(H=null,de=D),H!==de)){if(ue=jf,Y="onMouseLeave",R="onMouseEnter",j="mouse",(e==="pointerout"||e==="pointerover")&&(ue=Cf,Y="onPointerLeave",R="onPointerEnter",j="pointer"),Le=H==null?k:Xa(H),M=de==null?k:Xa(de),k=new ue(Y,j+"leave",H,n,q),k.target=Le,k.relatedTarget=M,Y=null,ql(q)===D&&(ue=new ue(R,j+"enter",de,n,q),ue.target=M,ue.relatedTarget=Le,Y=ue),Le=Y,H&&de)t:{for(ue=H,R=de,j=0,M=ue;M;M=xa(M))j++;for(M=0,Y=R;Y;Y=xa(Y))M++;for(;0<j-M;)ue=xa(ue),j--;for(;0<M-j;)R=xa(R),M--;for(;j--;){if(ue===R||R!==null&&ue===R.alternate)break t;ue=xa(ue),R=xa(R)}ue=null}else ue=null;H!==null&&ym(K,k,H,ue,!1),de!==null&&Le!==null&&ym(K,Le,de,ue,!0)}}e:{if(k=D?Xa(D):window,H=k.nodeName&&k.nodeName.toLowerCase(),H==="select"||H==="input"&&k.type==="file")var ee=Bf;else if(kf(k))if(Hf)ee=s0;else{ee=c0;var Se=o0}else H=k.nodeName,!H||H.toLowerCase()!=="input"||k.type!=="checkbox"&&k.type!=="radio"?D&&Po(D.elementType)&&(ee=Bf):ee=u0;if(ee&&(ee=ee(e,D))){Uf(K,ee,n,q);break e}Se&&Se(e,k,D),e==="focusout"&&D&&k.type==="number"&&D.memoizedProps.value!=null&&Jo(k,"number",k.value)}switch(Se=D?Xa(D):window,e){case"focusin":(kf(Se)||Se.contentEditable==="true")&&(Pl=Se,sc=D,Ia=null);break;case"focusout":Ia=sc=Pl=null;break;case"mousedown":fc=!0;break;case"contextmenu":case"mouseup":case"dragend":fc=!1,Qf(K,n,q);break;case"selectionchange":if(d0)break;case"keydown":case"keyup":Qf(K,n,q)}var ae;if(rc)e:{switch(e){case"compositionstart":var se="onCompositionStart";break e;case"compositionend":se="onCompositionEnd";break e;case"compositionupdate":se="onCompositionUpdate";break e}se=void 0}else Jl?Df(e,n)&&(se="onCompositionEnd"):e==="keydown"&&n.keyCode===229&&(se="onCompositionStart");se&&(Rf&&n.locale!=="ko"&&(Jl||se!=="onCompositionStart"?se==="onCompositionEnd"&&Jl&&(ae=Af()):(zn=q,tc="value"in zn?zn.value:zn.textContent,Jl=!0)),Se=Qr(D,se),0<Se.length&&(se=new Nf(se,e,null,n,q),K.push({event:se,listeners:Se}),ae?se.data=ae:(ae=zf(n),ae!==null&&(se.data=ae)))),(ae=n0?l0(e,n):a0(e,n))&&(se=Qr(D,"onBeforeInput"),0<se.length&&(Se=new Nf("onBeforeInput","beforeinput",null,n,q),K.push({event:Se,listeners:se}),Se.data=ae)),F0(K,e,D,n,q)}gm(K,t)})}function ji(e,t,n){return{instance:e,listener:t,currentTarget:n}}function Qr(e,t){for(var n=t+"Capture",l=[];e!==null;){var i=e,o=i.stateNode;if(i=i.tag,i!==5&&i!==26&&i!==27||o===null||(i=Ka(e,n),i!=null&&l.unshift(ji(e,i,o)),i=Ka(e,t),i!=null&&l.push(ji(e,i,o))),e.tag===3)return l;e=e.return}return[]}function xa(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5&&e.tag!==27);return e||null}function ym(e,t,n,l,i){for(var o=t._reactName,h=[];n!==null&&n!==l;){var p=n,E=p.alternate,D=p.stateNode;if(p=p.tag,E!==null&&E===l)break;p!==5&&p!==26&&p!==27||D===null||(E=D,i?(D=Ka(n,o),D!=null&&h.unshift(ji(n,D,E))):i||(D=Ka(n,o),D!=null&&h.push(ji(n,D,E)))),n=n.return}h.length!==0&&e.push({event:t,listeners:h})}var W0=/\r\n?/g,I0=/\u0000|\uFFFD/g;function bm(e){return(typeof e=="string"?e:""+e).replace(W0,`
-`).replace(I0,"")}function xm(e,t){return t=bm(t),bm(e)===t}function Zr(){}function He(e,t,n,l,i,o){switch(n){case"children":typeof l=="string"?t==="body"||t==="textarea"&&l===""||Ql(e,l):(typeof l=="number"||typeof l=="bigint")&&t!=="body"&&Ql(e,""+l);break;case"className":Wi(e,"class",l);break;case"tabIndex":Wi(e,"tabindex",l);break;case"dir":case"role":case"viewBox":case"width":case"height":Wi(e,n,l);break;case"style":wf(e,l,o);break;case"data":if(t!=="object"){Wi(e,"data",l);break}case"src":case"href":if(l===""&&(t!=="a"||n!=="href")){e.removeAttribute(n);break}if(l==null||typeof l=="function"||typeof l=="symbol"||typeof l=="boolean"){e.removeAttribute(n);break}l=tr(""+l),e.setAttribute(n,l);break;case"action":case"formAction":if(typeof l=="function"){e.setAttribute(n,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof o=="function"&&(n==="formAction"?(t!=="input"&&He(e,t,"name",i.name,i,null),He(e,t,"formEncType",i.formEncType,i,null),He(e,t,"formMethod",i.formMethod,i,null),He(e,t,"formTarget",i.formTarget,i,null)):(He(e,t,"encType",i.encType,i,null),He(e,t,"method",i.method,i,null),He(e,t,"target",i.target,i,null)));if(l==null||typeof l=="symbol"||typeof l=="boolean"){e.removeAttribute(n);break}l=tr(""+l),e.setAttribute(n,l);break;case"onClick":l!=null&&(e.onclick=Zr);break;case"onScroll":l!=null&&Ae("scroll",e);break;case"onScrollEnd":l!=null&&Ae("scrollend",e);break;case"dangerouslySetInnerHTML":if(l!=null){if(typeof l!="object"||!("__html"in l))throw Error(c(61));if(n=l.__html,n!=null){if(i.children!=null)throw Error(c(60));e.innerHTML=n}}break;case"multiple":e.multiple=l&&typeof l!="function"&&typeof l!="symbol";break;case"muted":e.muted=l&&typeof l!="function"&&typeof l!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(l==null||typeof l=="function"||typeof l=="boolean"||typeof l=="symbol"){e.removeAttribute("xlink:href");break}n=tr(""+l),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",n);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":l!=null&&typeof l!="function"&&typeof l!="symbol"?e.setAttribute(n,""+l):e.removeAttribute(n);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":l&&typeof l!="function"&&typeof l!="symbol"?e.setAttribute(n,""):e.removeAttribute(n);break;case"capture":case"download":l===!0?e.setAttribute(n,""):l!==!1&&l!=null&&typeof l!="function"&&typeof l!="symbol"?e.setAttribute(n,l):e.removeAttribute(n);break;case"cols":case"rows":case"size":case"span":l!=null&&typeof l!="function"&&typeof l!="symbol"&&!isNaN(l)&&1<=l?e.setAttribute(n,l):e.removeAttribute(n);break;case"rowSpan":case"start":l==null||typeof l=="function"||typeof l=="symbol"||isNaN(l)?e.removeAttribute(n):e.setAttribute(n,l);break;case"popover":Ae("beforetoggle",e),Ae("toggle",e),$i(e,"popover",l);break;case"xlinkActuate":hn(e,"http://www.w3.org/1999/xlink","xlink:actuate",l);break;case"xlinkArcrole":hn(e,"http://www.w3.org/1999/xlink","xlink:arcrole",l);break;case"xlinkRole":hn(e,"http://www.w3.org/1999/xlink","xlink:role",l);break;case"xlinkShow":hn(e,"http://www.w3.org/1999/xlink","xlink:show",l);break;case"xlinkTitle":hn(e,"http://www.w3.org/1999/xlink","xlink:title",l);break;case"xlinkType":hn(e,"http://www.w3.org/1999/xlink","xlink:type",l);break;case"xmlBase":hn(e,"http://www.w3.org/XML/1998/namespace","xml:base",l);break;case"xmlLang":hn(e,"http://www.w3.org/XML/1998/namespace","xml:lang",l);break;case"xmlSpace":hn(e,"http://www.w3.org/XML/1998/namespace","xml:space",l);break;case"is":$i(e,"is",l);break;case"innerText":case"textContent":break;default:(!(2<n.length)||n[0]!=="o"&&n[0]!=="O"||n[1]!=="n"&&n[1]!=="N")&&(n=Cy.get(n)||n,$i(e,n,l))}}function zu(e,t,n,l,i,o){switch(n){case"style":wf(e,l,o);break;case"dangerouslySetInnerHTML":if(l!=null){if(typeof l!="object"||!("__html"in l))throw Error(c(61));if(n=l.__html,n!=null){if(i.children!=null)throw Error(c(60));e.innerHTML=n}}break;case"children":typeof l=="string"?Ql(e,l):(typeof l=="number"||typeof l=="bigint")&&Ql(e,""+l);break;case"onScroll":l!=null&&Ae("scroll",e);break;case"onScrollEnd":l!=null&&Ae("scrollend",e);break;case"onClick":l!=null&&(e.onclick=Zr);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!ff.hasOwnProperty(n))e:{if(n[0]==="o"&&n[1]==="n"&&(i=n.endsWith("Capture"),t=n.slice(2,i?n.length-7:void 0),o=e[yt]||null,o=o!=null?o[n]:null,typeof o=="function"&&e.removeEventListener(t,o,i),typeof l=="function")){typeof o!="function"&&o!==null&&(n in e?e[n]=null:e.hasAttribute(n)&&e.removeAttribute(n)),e.addEventListener(t,l,i);break e}n in e?e[n]=l:l===!0?e.setAttribute(n,""):$i(e,n,l)}}}function ut(e,t,n){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":Ae("error",e),Ae("load",e);var l=!1,i=!1,o;for(o in n)if(n.hasOwnProperty(o)){var h=n[o];if(h!=null)switch(o){case"src":l=!0;break;case"srcSet":i=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(c(137,t));default:He(e,t,o,h,n,null)}}i&&He(e,t,"srcSet",n.srcSet,n,null),l&&He(e,t,"src",n.src,n,null);return;case"input":Ae("invalid",e);var p=o=h=i=null,E=null,D=null;for(l in n)if(n.hasOwnProperty(l)){var q=n[l];if(q!=null)switch(l){case"name":i=q;break;case"type":h=q;break;case"checked":E=q;break;case"defaultChecked":D=q;break;case"value":o=q;break;case"defaultValue":p=q;break;case"children":case"dangerouslySetInnerHTML":if(q!=null)throw Error(c(137,t));break;default:He(e,t,l,q,n,null)}}yf(e,o,p,E,D,h,i,!1),Ii(e);return;case"select":Ae("invalid",e),l=h=o=null;for(i in n)if(n.hasOwnProperty(i)&&(p=n[i],p!=null))switch(i){case"value":o=p;break;case"defaultValue":h=p;break;case"multiple":l=p;default:He(e,t,i,p,n,null)}t=o,n=h,e.multiple=!!l,t!=null?Kl(e,!!l,t,!1):n!=null&&Kl(e,!!l,n,!0);return;case"textarea":Ae("invalid",e),o=i=l=null;for(h in n)if(n.hasOwnProperty(h)&&(p=n[h],p!=null))switch(h){case"value":l=p;break;case"defaultValue":i=p;break;case"children":o=p;break;case"dangerouslySetInnerHTML":if(p!=null)throw Error(c(91));break;default:He(e,t,h,p,n,null)}xf(e,l,i,o),Ii(e);return;case"option":for(E in n)if(n.hasOwnProperty(E)&&(l=n[E],l!=null))switch(E){case"selected":e.selected=l&&typeof l!="function"&&typeof l!="symbol";break;default:He(e,t,E,l,n,null)}return;case"dialog":Ae("beforetoggle",e),Ae("toggle",e),Ae("cancel",e),Ae("close",e);break;case"iframe":case"object":Ae("load",e);break;case"video":case"audio":for(l=0;l<Ti.length;l++)Ae(Ti[l],e);break;case"image":Ae("error",e),Ae("load",e);break;case"details":Ae("toggle",e);break;case"embed":case"source":case"link":Ae("error",e),Ae("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(D in n)if(n.hasOwnProperty(D)&&(l=n[D],l!=null))switch(D){case"children":case"dangerouslySetInnerHTML":throw Error(c(137,t));default:He(e,t,D,l,n,null)}return;default:if(Po(t)){for(q in n)n.hasOwnProperty(q)&&(l=n[q],l!==void 0&&zu(e,t,q,l,n,void 0));return}}for(p in n)n.hasOwnProperty(p)&&(l=n[p],l!=null&&He(e,t,p,l,n,null))}function eb(e,t,n,l){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var i=null,o=null,h=null,p=null,E=null,D=null,q=null;for(H in n){var K=n[H];if(n.hasOwnProperty(H)&&K!=null)switch(H){case"checked":break;case"value":break;case"defaultValue":E=K;default:l.hasOwnProperty(H)||He(e,t,H,null,l,K)}}for(var k in l){var H=l[k];if(K=n[k],l.hasOwnProperty(k)&&(H!=null||K!=null))switch(k){case"type":o=H;break;case"name":i=H;break;case"checked":D=H;break;case"defaultChecked":q=H;break;case"value":h=H;break;case"defaultValue":p=H;break;case"children":case"dangerouslySetInnerHTML":if(H!=null)throw Error(c(137,t));break;default:H!==K&&He(e,t,k,H,l,K)}}Fo(e,h,p,E,D,q,o,i);return;case"select":H=h=p=k=null;for(o in n)if(E=n[o],n.hasOwnProperty(o)&&E!=null)switch(o){case"value":break;case"multiple":H=E;default:l.hasOwnProperty(o)||He(e,t,o,null,l,E)}for(i in l)if(o=l[i],E=n[i],l.hasOwnProperty(i)&&(o!=null||E!=null))switch(i){case"value":k=o;break;case"defaultValue":p=o;break;case"multiple":h=o;default:o!==E&&He(e,t,i,o,l,E)}t=p,n=h,l=H,k!=null?Kl(e,!!n,k,!1):!!l!=!!n&&(t!=null?Kl(e,!!n,t,!0):Kl(e,!!n,n?[]:"",!1));return;case"textarea":H=k=null;for(p in n)if(i=n[p],n.hasOwnProperty(p)&&i!=null&&!l.hasOwnProperty(p))switch(p){case"value":break;case"children":break;default:He(e,t,p,null,l,i)}for(h in l)if(i=l[h],o=n[h],l.hasOwnProperty(h)&&(i!=null||o!=null))switch(h){case"value":k=i;break;case"defaultValue":H=i;break;case"children":break;case"dangerouslySetInnerHTML":if(i!=null)throw Error(c(91));break;default:i!==o&&He(e,t,h,i,l,o)}bf(e,k,H);return;case"option":for(var de in n)if(k=n[de],n.hasOwnProperty(de)&&k!=null&&!l.hasOwnProperty(de))switch(de){case"selected":e.selected=!1;break;default:He(e,t,de,null,l,k)}for(E in l)if(k=l[E],H=n[E],l.hasOwnProperty(E)&&k!==H&&(k!=null||H!=null))switch(E){case"selected":e.selected=k&&typeof k!="function"&&typeof k!="symbol";break;default:He(e,t,E,k,l,H)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var ue in n)k=n[ue],n.hasOwnProperty(ue)&&k!=null&&!l.hasOwnProperty(ue)&&He(e,t,ue,null,l,k);for(D in l)if(k=l[D],H=n[D],l.hasOwnProperty(D)&&k!==H&&(k!=null||H!=null))switch(D){case"children":case"dangerouslySetInnerHTML":if(k!=null)throw Error(c(137,t));break;default:He(e,t,D,k,l,H)}return;default:if(Po(t)){for(var Le in n)k=n[Le],n.hasOwnProperty(Le)&&k!==void 0&&!l.hasOwnProperty(Le)&&zu(e,t,Le,void 0,l,k);for(q in l)k=l[q],H=n[q],!l.hasOwnProperty(q)||k===H||k===void 0&&H===void 0||zu(e,t,q,k,l,H);return}}for(var R in n)k=n[R],n.hasOwnProperty(R)&&k!=null&&!l.hasOwnProperty(R)&&He(e,t,R,null,l,k);for(K in l)k=l[K],H=n[K],!l.hasOwnProperty(K)||k===H||k==null&&H==null||He(e,t,K,k,l,H)}var ku=null,Uu=null;function Fr(e){return e.nodeType===9?e:e.ownerDocument}function Sm(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function wm(e,t){if(e===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return e===1&&t==="foreignObject"?0:e}function Bu(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Hu=null;function tb(){var e=window.event;return e&&e.type==="popstate"?e===Hu?!1:(Hu=e,!0):(Hu=null,!1)}var _m=typeof setTimeout=="function"?setTimeout:void 0,nb=typeof clearTimeout=="function"?clearTimeout:void 0,Em=typeof Promise=="function"?Promise:void 0,lb=typeof queueMicrotask=="function"?queueMicrotask:typeof Em<"u"?function(e){return Em.resolve(null).then(e).catch(ab)}:_m;function ab(e){setTimeout(function(){throw e})}function Pn(e){return e==="head"}function Am(e,t){var n=t,l=0,i=0;do{var o=n.nextSibling;if(e.removeChild(n),o&&o.nodeType===8)if(n=o.data,n==="/$"){if(0<l&&8>l){n=l;var h=e.ownerDocument;if(n&1&&Ni(h.documentElement),n&2&&Ni(h.body),n&4)for(n=h.head,Ni(n),h=n.firstChild;h;){var p=h.nextSibling,E=h.nodeName;h[Ya]||E==="SCRIPT"||E==="STYLE"||E==="LINK"&&h.rel.toLowerCase()==="stylesheet"||n.removeChild(h),h=p}}if(i===0){e.removeChild(o),Ui(t);return}i--}else n==="$"||n==="$?"||n==="$!"?i++:l=n.charCodeAt(0)-48;else l=0;n=o}while(n);Ui(t)}function Lu(e){var t=e.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var n=t;switch(t=t.nextSibling,n.nodeName){case"HTML":case"HEAD":case"BODY":Lu(n),Xo(n);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(n.rel.toLowerCase()==="stylesheet")continue}e.removeChild(n)}}function ib(e,t,n,l){for(;e.nodeType===1;){var i=n;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!l&&(e.nodeName!=="INPUT"||e.type!=="hidden"))break}else if(l){if(!e[Ya])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if(o=e.getAttribute("rel"),o==="stylesheet"&&e.hasAttribute("data-precedence"))break;if(o!==i.rel||e.getAttribute("href")!==(i.href==null||i.href===""?null:i.href)||e.getAttribute("crossorigin")!==(i.crossOrigin==null?null:i.crossOrigin)||e.getAttribute("title")!==(i.title==null?null:i.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(o=e.getAttribute("src"),(o!==(i.src==null?null:i.src)||e.getAttribute("type")!==(i.type==null?null:i.type)||e.getAttribute("crossorigin")!==(i.crossOrigin==null?null:i.crossOrigin))&&o&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else if(t==="input"&&e.type==="hidden"){var o=i.name==null?null:""+i.name;if(i.type==="hidden"&&e.getAttribute("name")===o)return e}else return e;if(e=$t(e.nextSibling),e===null)break}return null}function rb(e,t,n){if(t==="")return null;for(;e.nodeType!==3;)if((e.nodeType!==1||e.nodeName!=="INPUT"||e.type!=="hidden")&&!n||(e=$t(e.nextSibling),e===null))return null;return e}function qu(e){return e.data==="$!"||e.data==="$?"&&e.ownerDocument.readyState==="complete"}function ob(e,t){var n=e.ownerDocument;if(e.data!=="$?"||n.readyState==="complete")t();else{var l=function(){t(),n.removeEventListener("DOMContentLoaded",l)};n.addEventListener("DOMContentLoaded",l),e._reactRetry=l}}function $t(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?"||t==="F!"||t==="F")break;if(t==="/$")return null}}return e}var Gu=null;function Tm(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var n=e.data;if(n==="$"||n==="$!"||n==="$?"){if(t===0)return e;t--}else n==="/$"&&t++}e=e.previousSibling}return null}function jm(e,t,n){switch(t=Fr(n),e){case"html":if(e=t.documentElement,!e)throw Error(c(452));return e;case"head":if(e=t.head,!e)throw Error(c(453));return e;case"body":if(e=t.body,!e)throw Error(c(454));return e;default:throw Error(c(451))}}function Ni(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);Xo(e)}var Ft=new Map,Nm=new Set;function Jr(e){return typeof e.getRootNode=="function"?e.getRootNode():e.nodeType===9?e:e.ownerDocument}var jn=Z.d;Z.d={f:cb,r:ub,D:sb,C:fb,L:db,m:hb,X:vb,S:mb,M:gb};function cb(){var e=jn.f(),t=qr();return e||t}function ub(e){var t=Gl(e);t!==null&&t.tag===5&&t.type==="form"?Fd(t):jn.r(e)}var Sa=typeof document>"u"?null:document;function Cm(e,t,n){var l=Sa;if(l&&typeof t=="string"&&t){var i=Gt(t);i='link[rel="'+e+'"][href="'+i+'"]',typeof n=="string"&&(i+='[crossorigin="'+n+'"]'),Nm.has(i)||(Nm.add(i),e={rel:e,crossOrigin:n,href:t},l.querySelector(i)===null&&(t=l.createElement("link"),ut(t,"link",e),tt(t),l.head.appendChild(t)))}}function sb(e){jn.D(e),Cm("dns-prefetch",e,null)}function fb(e,t){jn.C(e,t),Cm("preconnect",e,t)}function db(e,t,n){jn.L(e,t,n);var l=Sa;if(l&&e&&t){var i='link[rel="preload"][as="'+Gt(t)+'"]';t==="image"&&n&&n.imageSrcSet?(i+='[imagesrcset="'+Gt(n.imageSrcSet)+'"]',typeof n.imageSizes=="string"&&(i+='[imagesizes="'+Gt(n.imageSizes)+'"]')):i+='[href="'+Gt(e)+'"]';var o=i;switch(t){case"style":o=wa(e);break;case"script":o=_a(e)}Ft.has(o)||(e=b({rel:"preload",href:t==="image"&&n&&n.imageSrcSet?void 0:e,as:t},n),Ft.set(o,e),l.querySelector(i)!==null||t==="style"&&l.querySelector(Ci(o))||t==="script"&&l.querySelector(Ri(o))||(t=l.createElement("link"),ut(t,"link",e),tt(t),l.head.appendChild(t)))}}function hb(e,t){jn.m(e,t);var n=Sa;if(n&&e){var l=t&&typeof t.as=="string"?t.as:"script",i='link[rel="modulepreload"][as="'+Gt(l)+'"][href="'+Gt(e)+'"]',o=i;switch(l){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":o=_a(e)}if(!Ft.has(o)&&(e=b({rel:"modulepreload",href:e},t),Ft.set(o,e),n.querySelector(i)===null)){switch(l){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(n.querySelector(Ri(o)))return}l=n.createElement("link"),ut(l,"link",e),tt(l),n.head.appendChild(l)}}}function mb(e,t,n){jn.S(e,t,n);var l=Sa;if(l&&e){var i=Vl(l).hoistableStyles,o=wa(e);t=t||"default";var h=i.get(o);if(!h){var p={loading:0,preload:null};if(h=l.querySelector(Ci(o)))p.loading=5;else{e=b({rel:"stylesheet",href:e,"data-precedence":t},n),(n=Ft.get(o))&&Vu(e,n);var E=h=l.createElement("link");tt(E),ut(E,"link",e),E._p=new Promise(function(D,q){E.onload=D,E.onerror=q}),E.addEventListener("load",function(){p.loading|=1}),E.addEventListener("error",function(){p.loading|=2}),p.loading|=4,Pr(h,t,l)}h={type:"stylesheet",instance:h,count:1,state:p},i.set(o,h)}}}function vb(e,t){jn.X(e,t);var n=Sa;if(n&&e){var l=Vl(n).hoistableScripts,i=_a(e),o=l.get(i);o||(o=n.querySelector(Ri(i)),o||(e=b({src:e,async:!0},t),(t=Ft.get(i))&&Yu(e,t),o=n.createElement("script"),tt(o),ut(o,"link",e),n.head.appendChild(o)),o={type:"script",instance:o,count:1,state:null},l.set(i,o))}}function gb(e,t){jn.M(e,t);var n=Sa;if(n&&e){var l=Vl(n).hoistableScripts,i=_a(e),o=l.get(i);o||(o=n.querySelector(Ri(i)),o||(e=b({src:e,async:!0,type:"module"},t),(t=Ft.get(i))&&Yu(e,t),o=n.createElement("script"),tt(o),ut(o,"link",e),n.head.appendChild(o)),o={type:"script",instance:o,count:1,state:null},l.set(i,o))}}function Rm(e,t,n,l){var i=(i=ie.current)?Jr(i):null;if(!i)throw Error(c(446));switch(e){case"meta":case"title":return null;case"style":return typeof n.precedence=="string"&&typeof n.href=="string"?(t=wa(n.href),n=Vl(i).hoistableStyles,l=n.get(t),l||(l={type:"style",instance:null,count:0,state:null},n.set(t,l)),l):{type:"void",instance:null,count:0,state:null};case"link":if(n.rel==="stylesheet"&&typeof n.href=="string"&&typeof n.precedence=="string"){e=wa(n.href);var o=Vl(i).hoistableStyles,h=o.get(e);if(h||(i=i.ownerDocument||i,h={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},o.set(e,h),(o=i.querySelector(Ci(e)))&&!o._p&&(h.instance=o,h.state.loading=5),Ft.has(e)||(n={rel:"preload",as:"style",href:n.href,crossOrigin:n.crossOrigin,integrity:n.integrity,media:n.media,hrefLang:n.hrefLang,referrerPolicy:n.referrerPolicy},Ft.set(e,n),o||pb(i,e,n,h.state))),t&&l===null)throw Error(c(528,""));return h}if(t&&l!==null)throw Error(c(529,""));return null;case"script":return t=n.async,n=n.src,typeof n=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=_a(n),n=Vl(i).hoistableScripts,l=n.get(t),l||(l={type:"script",instance:null,count:0,state:null},n.set(t,l)),l):{type:"void",instance:null,count:0,state:null};default:throw Error(c(444,e))}}function wa(e){return'href="'+Gt(e)+'"'}function Ci(e){return'link[rel="stylesheet"]['+e+"]"}function Om(e){return b({},e,{"data-precedence":e.precedence,precedence:null})}function pb(e,t,n,l){e.querySelector('link[rel="preload"][as="style"]['+t+"]")?l.loading=1:(t=e.createElement("link"),l.preload=t,t.addEventListener("load",function(){return l.loading|=1}),t.addEventListener("error",function(){return l.loading|=2}),ut(t,"link",n),tt(t),e.head.appendChild(t))}function _a(e){return'[src="'+Gt(e)+'"]'}function Ri(e){return"script[async]"+e}function Mm(e,t,n){if(t.count++,t.instance===null)switch(t.type){case"style":var l=e.querySelector('style[data-href~="'+Gt(n.href)+'"]');if(l)return t.instance=l,tt(l),l;var i=b({},n,{"data-href":n.href,"data-precedence":n.precedence,href:null,precedence:null});return l=(e.ownerDocument||e).createElement("style"),tt(l),ut(l,"style",i),Pr(l,n.precedence,e),t.instance=l;case"stylesheet":i=wa(n.href);var o=e.querySelector(Ci(i));if(o)return t.state.loading|=4,t.instance=o,tt(o),o;l=Om(n),(i=Ft.get(i))&&Vu(l,i),o=(e.ownerDocument||e).createElement("link"),tt(o);var h=o;return h._p=new Promise(function(p,E){h.onload=p,h.onerror=E}),ut(o,"link",l),t.state.loading|=4,Pr(o,n.precedence,e),t.instance=o;case"script":return o=_a(n.src),(i=e.querySelector(Ri(o)))?(t.instance=i,tt(i),i):(l=n,(i=Ft.get(o))&&(l=b({},n),Yu(l,i)),e=e.ownerDocument||e,i=e.createElement("script"),tt(i),ut(i,"link",l),e.head.appendChild(i),t.instance=i);case"void":return null;default:throw Error(c(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(l=t.instance,t.state.loading|=4,Pr(l,n.precedence,e));return t.instance}function Pr(e,t,n){for(var l=n.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),i=l.length?l[l.length-1]:null,o=i,h=0;h<l.length;h++){var p=l[h];if(p.dataset.precedence===t)o=p;else if(o!==i)break}o?o.parentNode.insertBefore(e,o.nextSibling):(t=n.nodeType===9?n.head:n,t.insertBefore(e,t.firstChild))}function Vu(e,t){e.crossOrigin==null&&(e.crossOrigin=t.crossOrigin),e.referrerPolicy==null&&(e.referrerPolicy=t.referrerPolicy),e.title==null&&(e.title=t.title)}function Yu(e,t){e.crossOrigin==null&&(e.crossOrigin=t.crossOrigin),e.referrerPolicy==null&&(e.referrerPolicy=t.referrerPolicy),e.integrity==null&&(e.integrity=t.integrity)}var $r=null;function Dm(e,t,n){if($r===null){var l=new Map,i=$r=new Map;i.set(n,l)}else i=$r,l=i.get(n),l||(l=new Map,i.set(n,l));if(l.has(e))return l;for(l.set(e,null),n=n.getElementsByTagName(e),i=0;i<n.length;i++){var o=n[i];if(!(o[Ya]||o[ft]||e==="link"&&o.getAttribute("rel")==="stylesheet")&&o.namespaceURI!=="http://www.w3.org/2000/svg"){var h=o.getAttribute(t)||"";h=e+h;var p=l.get(h);p?p.push(o):l.set(h,[o])}}return l}function zm(e,t,n){e=e.ownerDocument||e,e.head.insertBefore(n,t==="title"?e.querySelector("head > title"):null)}function yb(e,t,n){if(n===1||t.itemProp!=null)return!1;switch(e){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return e=t.disabled,typeof t.precedence=="string"&&e==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function km(e){return!(e.type==="stylesheet"&&(e.state.loading&3)===0)}var Oi=null;function bb(){}function xb(e,t,n){if(Oi===null)throw Error(c(475));var l=Oi;if(t.type==="stylesheet"&&(typeof n.media!="string"||matchMedia(n.media).matches!==!1)&&(t.state.loading&4)===0){if(t.instance===null){var i=wa(n.href),o=e.querySelector(Ci(i));if(o){e=o._p,e!==null&&typeof e=="object"&&typeof e.then=="function"&&(l.count++,l=Wr.bind(l),e.then(l,l)),t.state.loading|=4,t.instance=o,tt(o);return}o=e.ownerDocument||e,n=Om(n),(i=Ft.get(i))&&Vu(n,i),o=o.createElement("link"),tt(o);var h=o;h._p=new Promise(function(p,E){h.onload=p,h.onerror=E}),ut(o,"link",n),t.instance=o}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(t,e),(e=t.state.preload)&&(t.state.loading&3)===0&&(l.count++,t=Wr.bind(l),e.addEventListener("load",t),e.addEventListener("error",t))}}function Sb(){if(Oi===null)throw Error(c(475));var e=Oi;return e.stylesheets&&e.count===0&&Xu(e,e.stylesheets),0<e.count?function(t){var n=setTimeout(function(){if(e.stylesheets&&Xu(e,e.stylesheets),e.unsuspend){var l=e.unsuspend;e.unsuspend=null,l()}},6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(n)}}:null}function Wr(){if(this.count--,this.count===0){if(this.stylesheets)Xu(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}}var Ir=null;function Xu(e,t){e.stylesheets=null,e.unsuspend!==null&&(e.count++,Ir=new Map,t.forEach(wb,e),Ir=null,Wr.call(e))}function wb(e,t){if(!(t.state.loading&4)){var n=Ir.get(e);if(n)var l=n.get(null);else{n=new Map,Ir.set(e,n);for(var i=e.querySelectorAll("link[data-precedence],style[data-precedence]"),o=0;o<i.length;o++){var h=i[o];(h.nodeName==="LINK"||h.getAttribute("media")!=="not all")&&(n.set(h.dataset.precedence,h),l=h)}l&&n.set(null,l)}i=t.instance,h=i.getAttribute("data-precedence"),o=n.get(h)||l,o===l&&n.set(null,i),n.set(h,i),this.count++,l=Wr.bind(this),i.addEventListener("load",l),i.addEventListener("error",l),o?o.parentNode.insertBefore(i,o.nextSibling):(e=e.nodeType===9?e.head:e,e.insertBefore(i,e.firstChild)),t.state.loading|=4}}var Mi={$$typeof:B,Provider:null,Consumer:null,_currentValue:L,_currentValue2:L,_threadCount:0};function _b(e,t,n,l,i,o,h,p){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=qo(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=qo(0),this.hiddenUpdates=qo(null),this.identifierPrefix=l,this.onUncaughtError=i,this.onCaughtError=o,this.onRecoverableError=h,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=p,this.incompleteTransitions=new Map}function Um(e,t,n,l,i,o,h,p,E,D,q,K){return e=new _b(e,t,n,h,p,E,D,K),t=1,o===!0&&(t|=24),o=Tt(3,null,null,t),e.current=o,o.stateNode=e,t=Ac(),t.refCount++,e.pooledCache=t,t.refCount++,o.memoizedState={element:l,isDehydrated:n,cache:t},Cc(o),e}function Bm(e){return e?(e=ea,e):ea}function Hm(e,t,n,l,i,o){i=Bm(i),l.context===null?l.context=i:l.pendingContext=i,l=Bn(t),l.payload={element:n},o=o===void 0?null:o,o!==null&&(l.callback=o),n=Hn(e,l,t),n!==null&&(Ot(n,e,t),ci(n,e,t))}function Lm(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var n=e.retryLane;e.retryLane=n!==0&&n<t?n:t}}function Ku(e,t){Lm(e,t),(e=e.alternate)&&Lm(e,t)}function qm(e){if(e.tag===13){var t=Il(e,67108864);t!==null&&Ot(t,e,67108864),Ku(e,67108864)}}var eo=!0;function Eb(e,t,n,l){var i=O.T;O.T=null;var o=Z.p;try{Z.p=2,Qu(e,t,n,l)}finally{Z.p=o,O.T=i}}function Ab(e,t,n,l){var i=O.T;O.T=null;var o=Z.p;try{Z.p=8,Qu(e,t,n,l)}finally{Z.p=o,O.T=i}}function Qu(e,t,n,l){if(eo){var i=Zu(l);if(i===null)Du(e,t,l,to,n),Vm(e,l);else if(jb(i,e,t,n,l))l.stopPropagation();else if(Vm(e,l),t&4&&-1<Tb.indexOf(e)){for(;i!==null;){var o=Gl(i);if(o!==null)switch(o.tag){case 3:if(o=o.stateNode,o.current.memoizedState.isDehydrated){var h=vl(o.pendingLanes);if(h!==0){var p=o;for(p.pendingLanes|=2,p.entangledLanes|=2;h;){var E=1<<31-Et(h);p.entanglements[1]|=E,h&=~E}on(o),(ke&6)===0&&(Hr=st()+500,Ai(0))}}break;case 13:p=Il(o,2),p!==null&&Ot(p,o,2),qr(),Ku(o,2)}if(o=Zu(l),o===null&&Du(e,t,l,to,n),o===i)break;i=o}i!==null&&l.stopPropagation()}else Du(e,t,l,null,n)}}function Zu(e){return e=Wo(e),Fu(e)}var to=null;function Fu(e){if(to=null,e=ql(e),e!==null){var t=d(e);if(t===null)e=null;else{var n=t.tag;if(n===13){if(e=m(t),e!==null)return e;e=null}else if(n===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return to=e,null}function Gm(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Lo()){case ml:return 2;case tf:return 8;case Zi:case dy:return 32;case nf:return 268435456;default:return 32}default:return 32}}var Ju=!1,$n=null,Wn=null,In=null,Di=new Map,zi=new Map,el=[],Tb="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Vm(e,t){switch(e){case"focusin":case"focusout":$n=null;break;case"dragenter":case"dragleave":Wn=null;break;case"mouseover":case"mouseout":In=null;break;case"pointerover":case"pointerout":Di.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":zi.delete(t.pointerId)}}function ki(e,t,n,l,i,o){return e===null||e.nativeEvent!==o?(e={blockedOn:t,domEventName:n,eventSystemFlags:l,nativeEvent:o,targetContainers:[i]},t!==null&&(t=Gl(t),t!==null&&qm(t)),e):(e.eventSystemFlags|=l,t=e.targetContainers,i!==null&&t.indexOf(i)===-1&&t.push(i),e)}function jb(e,t,n,l,i){switch(t){case"focusin":return $n=ki($n,e,t,n,l,i),!0;case"dragenter":return Wn=ki(Wn,e,t,n,l,i),!0;case"mouseover":return In=ki(In,e,t,n,l,i),!0;case"pointerover":var o=i.pointerId;return Di.set(o,ki(Di.get(o)||null,e,t,n,l,i)),!0;case"gotpointercapture":return o=i.pointerId,zi.set(o,ki(zi.get(o)||null,e,t,n,l,i)),!0}return!1}function Ym(e){var t=ql(e.target);if(t!==null){var n=d(t);if(n!==null){if(t=n.tag,t===13){if(t=m(n),t!==null){e.blockedOn=t,xy(e.priority,function(){if(n.tag===13){var l=Rt();l=Go(l);var i=Il(n,l);i!==null&&Ot(i,n,l),Ku(n,l)}});return}}else if(t===3&&n.stateNode.current.memoizedState.isDehydrated){e.blockedOn=n.tag===3?n.stateNode.containerInfo:null;return}}}e.blockedOn=null}function no(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var n=Zu(e.nativeEvent);if(n===null){n=e.nativeEvent;var l=new n.constructor(n.type,n);$o=l,n.target.dispatchEvent(l),$o=null}else return t=Gl(n),t!==null&&qm(t),e.blockedOn=n,!1;t.shift()}return!0}function Xm(e,t,n){no(e)&&n.delete(t)}function Nb(){Ju=!1,$n!==null&&no($n)&&($n=null),Wn!==null&&no(Wn)&&(Wn=null),In!==null&&no(In)&&(In=null),Di.forEach(Xm),zi.forEach(Xm)}function lo(e,t){e.blockedOn===t&&(e.blockedOn=null,Ju||(Ju=!0,a.unstable_scheduleCallback(a.unstable_NormalPriority,Nb)))}var ao=null;function Km(e){ao!==e&&(ao=e,a.unstable_scheduleCallback(a.unstable_NormalPriority,function(){ao===e&&(ao=null);for(var t=0;t<e.length;t+=3){var n=e[t],l=e[t+1],i=e[t+2];if(typeof l!="function"){if(Fu(l||n)===null)continue;break}var o=Gl(n);o!==null&&(e.splice(t,3),t-=3,Fc(o,{pending:!0,data:i,method:n.method,action:l},l,i))}}))}function Ui(e){function t(E){return lo(E,e)}$n!==null&&lo($n,e),Wn!==null&&lo(Wn,e),In!==null&&lo(In,e),Di.forEach(t),zi.forEach(t);for(var n=0;n<el.length;n++){var l=el[n];l.blockedOn===e&&(l.blockedOn=null)}for(;0<el.length&&(n=el[0],n.blockedOn===null);)Ym(n),n.blockedOn===null&&el.shift();if(n=(e.ownerDocument||e).$$reactFormReplay,n!=null)for(l=0;l<n.length;l+=3){var i=n[l],o=n[l+1],h=i[yt]||null;if(typeof o=="function")h||Km(n);else if(h){var p=null;if(o&&o.hasAttribute("formAction")){if(i=o,h=o[yt]||null)p=h.formAction;else if(Fu(i)!==null)continue}else p=h.action;typeof p=="function"?n[l+1]=p:(n.splice(l,3),l-=3),Km(n)}}}function Pu(e){this._internalRoot=e}io.prototype.render=Pu.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(c(409));var n=t.current,l=Rt();Hm(n,l,e,t,null,null)},io.prototype.unmount=Pu.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Hm(e.current,2,null,e,null,null),qr(),t[Ll]=null}};function io(e){this._internalRoot=e}io.prototype.unstable_scheduleHydration=function(e){if(e){var t=cf();e={blockedOn:null,target:e,priority:t};for(var n=0;n<el.length&&t!==0&&t<el[n].priority;n++);el.splice(n,0,e),n===0&&Ym(e)}};var Qm=r.version;if(Qm!=="19.1.0")throw Error(c(527,Qm,"19.1.0"));Z.findDOMNode=function(e){var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(c(188)):(e=Object.keys(e).join(","),Error(c(268,e)));return e=y(t),e=e!==null?v(e):null,e=e===null?null:e.stateNode,e};var Cb={bundleType:0,version:"19.1.0",rendererPackageName:"react-dom",currentDispatcherRef:O,reconcilerVersion:"19.1.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var ro=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!ro.isDisabled&&ro.supportsFiber)try{qa=ro.inject(Cb),_t=ro}catch{}}return Hi.createRoot=function(e,t){if(!f(e))throw Error(c(299));var n=!1,l="",i=ch,o=uh,h=sh,p=null;return t!=null&&(t.unstable_strictMode===!0&&(n=!0),t.identifierPrefix!==void 0&&(l=t.identifierPrefix),t.onUncaughtError!==void 0&&(i=t.onUncaughtError),t.onCaughtError!==void 0&&(o=t.onCaughtError),t.onRecoverableError!==void 0&&(h=t.onRecoverableError),t.unstable_transitionCallbacks!==void 0&&(p=t.unstable_transitionCallbacks)),t=Um(e,1,!1,null,null,n,l,i,o,h,p,null),e[Ll]=t.current,Mu(e),new Pu(t)},Hi.hydrateRoot=function(e,t,n){if(!f(e))throw Error(c(299));var l=!1,i="",o=ch,h=uh,p=sh,E=null,D=null;return n!=null&&(n.unstable_strictMode===!0&&(l=!0),n.identifierPrefix!==void 0&&(i=n.identifierPrefix),n.onUncaughtError!==void 0&&(o=n.onUncaughtError),n.onCaughtError!==void 0&&(h=n.onCaughtError),n.onRecoverableError!==void 0&&(p=n.onRecoverableError),n.unstable_transitionCallbacks!==void 0&&(E=n.unstable_transitionCallbacks),n.formState!==void 0&&(D=n.formState)),t=Um(e,1,!0,t,n??null,l,i,o,h,p,E,D),t.context=Bm(null),n=t.current,l=Rt(),l=Go(l),i=Bn(l),i.callback=null,Hn(n,i,l),n=l,t.current.lanes=n,Va(t,n),on(t),e[Ll]=t.current,Mu(e),new io(t)},Hi.version="19.1.0",Hi}var nv;function Lb(){if(nv)return Iu.exports;nv=1;function a(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(a)}catch(r){console.error(r)}}return a(),Iu.exports=Hb(),Iu.exports}var qb=Lb(),Xi=qv();const Gb=Hv(Xi);function lv(a,r){if(typeof a=="function")return a(r);a!=null&&(a.current=r)}function Vb(...a){return r=>{let u=!1;const c=a.map(f=>{const d=lv(f,r);return!u&&typeof d=="function"&&(u=!0),d});if(u)return()=>{for(let f=0;f<c.length;f++){const d=c[f];typeof d=="function"?d():lv(a[f],null)}}}}function Ye(...a){return S.useCallback(Vb(...a),a)}function Oa(a){const r=Yb(a),u=S.forwardRef((c,f)=>{const{children:d,...m}=c,g=S.Children.toArray(d),y=g.find(Kb);if(y){const v=y.props.children,b=g.map(_=>_===y?S.Children.count(v)>1?S.Children.only(null):S.isValidElement(v)?v.props.children:null:_);return s.jsx(r,{...m,ref:f,children:S.isValidElement(v)?S.cloneElement(v,void 0,b):null})}return s.jsx(r,{...m,ref:f,children:d})});return u.displayName=`${a}.Slot`,u}var Gv=Oa("Slot");function Yb(a){const r=S.forwardRef((u,c)=>{const{children:f,...d}=u,m=S.isValidElement(f)?Zb(f):void 0,g=Ye(m,c);if(S.isValidElement(f)){const y=Qb(d,f.props);return f.type!==S.Fragment&&(y.ref=g),S.cloneElement(f,y)}return S.Children.count(f)>1?S.Children.only(null):null});return r.displayName=`${a}.SlotClone`,r}var Xb=Symbol("radix.slottable");function Kb(a){return S.isValidElement(a)&&typeof a.type=="function"&&"__radixId"in a.type&&a.type.__radixId===Xb}function Qb(a,r){const u={...r};for(const c in r){const f=a[c],d=r[c];/^on[A-Z]/.test(c)?f&&d?u[c]=(...g)=>{const y=d(...g);return f(...g),y}:f&&(u[c]=f):c==="style"?u[c]={...f,...d}:c==="className"&&(u[c]=[f,d].filter(Boolean).join(" "))}return{...a,...u}}function Zb(a){var c,f;let r=(c=Object.getOwnPropertyDescriptor(a.props,"ref"))==null?void 0:c.get,u=r&&"isReactWarning"in r&&r.isReactWarning;return u?a.ref:(r=(f=Object.getOwnPropertyDescriptor(a,"ref"))==null?void 0:f.get,u=r&&"isReactWarning"in r&&r.isReactWarning,u?a.props.ref:a.props.ref||a.ref)}function Vv(a){var r,u,c="";if(typeof a=="string"||typeof a=="number")c+=a;else if(typeof a=="object")if(Array.isArray(a)){var f=a.length;for(r=0;r<f;r++)a[r]&&(u=Vv(a[r]))&&(c&&(c+=" "),c+=u)}else for(u in a)a[u]&&(c&&(c+=" "),c+=u);return c}function Yv(){for(var a,r,u=0,c="",f=arguments.length;u<f;u++)(a=arguments[u])&&(r=Vv(a))&&(c&&(c+=" "),c+=r);return c}const av=a=>typeof a=="boolean"?`${a}`:a===0?"0":a,iv=Yv,Xv=(a,r)=>u=>{var c;if((r==null?void 0:r.variants)==null)return iv(a,u==null?void 0:u.class,u==null?void 0:u.className);const{variants:f,defaultVariants:d}=r,m=Object.keys(f).map(v=>{const b=u==null?void 0:u[v],_=d==null?void 0:d[v];if(b===null)return null;const A=av(b)||av(_);return f[v][A]}),g=u&&Object.entries(u).reduce((v,b)=>{let[_,A]=b;return A===void 0||(v[_]=A),v},{}),y=r==null||(c=r.compoundVariants)===null||c===void 0?void 0:c.reduce((v,b)=>{let{class:_,className:A,...C}=b;return Object.entries(C).every(w=>{let[x,N]=w;return Array.isArray(N)?N.includes({...d,...g}[x]):{...d,...g}[x]===N})?[...v,_,A]:v},[]);return iv(a,m,y,u==null?void 0:u.class,u==null?void 0:u.className)},zs="-",Fb=a=>{const r=Pb(a),{conflictingClassGroups:u,conflictingClassGroupModifiers:c}=a;return{getClassGroupId:m=>{const g=m.split(zs);return g[0]===""&&g.length!==1&&g.shift(),Kv(g,r)||Jb(m)},getConflictingClassGroupIds:(m,g)=>{const y=u[m]||[];return g&&c[m]?[...y,...c[m]]:y}}},Kv=(a,r)=>{var m;if(a.length===0)return r.classGroupId;const u=a[0],c=r.nextPart.get(u),f=c?Kv(a.slice(1),c):void 0;if(f)return f;if(r.validators.length===0)return;const d=a.join(zs);return(m=r.validators.find(({validator:g})=>g(d)))==null?void 0:m.classGroupId},rv=/^\[(.+)\]$/,Jb=a=>{if(rv.test(a)){const r=rv.exec(a)[1],u=r==null?void 0:r.substring(0,r.indexOf(":"));if(u)return"arbitrary.."+u}},Pb=a=>{const{theme:r,classGroups:u}=a,c={nextPart:new Map,validators:[]};for(const f in u)ps(u[f],c,f,r);return c},ps=(a,r,u,c)=>{a.forEach(f=>{if(typeof f=="string"){const d=f===""?r:ov(r,f);d.classGroupId=u;return}if(typeof f=="function"){if($b(f)){ps(f(c),r,u,c);return}r.validators.push({validator:f,classGroupId:u});return}Object.entries(f).forEach(([d,m])=>{ps(m,ov(r,d),u,c)})})},ov=(a,r)=>{let u=a;return r.split(zs).forEach(c=>{u.nextPart.has(c)||u.nextPart.set(c,{nextPart:new Map,validators:[]}),u=u.nextPart.get(c)}),u},$b=a=>a.isThemeGetter,Wb=a=>{if(a<1)return{get:()=>{},set:()=>{}};let r=0,u=new Map,c=new Map;const f=(d,m)=>{u.set(d,m),r++,r>a&&(r=0,c=u,u=new Map)};return{get(d){let m=u.get(d);if(m!==void 0)return m;if((m=c.get(d))!==void 0)return f(d,m),m},set(d,m){u.has(d)?u.set(d,m):f(d,m)}}},ys="!",bs=":",Ib=bs.length,ex=a=>{const{prefix:r,experimentalParseClassName:u}=a;let c=f=>{const d=[];let m=0,g=0,y=0,v;for(let w=0;w<f.length;w++){let x=f[w];if(m===0&&g===0){if(x===bs){d.push(f.slice(y,w)),y=w+Ib;continue}if(x==="/"){v=w;continue}}x==="["?m++:x==="]"?m--:x==="("?g++:x===")"&&g--}const b=d.length===0?f:f.substring(y),_=tx(b),A=_!==b,C=v&&v>y?v-y:void 0;return{modifiers:d,hasImportantModifier:A,baseClassName:_,maybePostfixModifierPosition:C}};if(r){const f=r+bs,d=c;c=m=>m.startsWith(f)?d(m.substring(f.length)):{isExternal:!0,modifiers:[],hasImportantModifier:!1,baseClassName:m,maybePostfixModifierPosition:void 0}}if(u){const f=c;c=d=>u({className:d,parseClassName:f})}return c},tx=a=>a.endsWith(ys)?a.substring(0,a.length-1):a.startsWith(ys)?a.substring(1):a,nx=a=>{const r=Object.fromEntries(a.orderSensitiveModifiers.map(c=>[c,!0]));return c=>{if(c.length<=1)return c;const f=[];let d=[];return c.forEach(m=>{m[0]==="["||r[m]?(f.push(...d.sort(),m),d=[]):d.push(m)}),f.push(...d.sort()),f}},lx=a=>({cache:Wb(a.cacheSize),parseClassName:ex(a),sortModifiers:nx(a),...Fb(a)}),ax=/\s+/,ix=(a,r)=>{const{parseClassName:u,getClassGroupId:c,getConflictingClassGroupIds:f,sortModifiers:d}=r,m=[],g=a.trim().split(ax);let y="";for(let v=g.length-1;v>=0;v-=1){const b=g[v],{isExternal:_,modifiers:A,hasImportantModifier:C,baseClassName:w,maybePostfixModifierPosition:x}=u(b);if(_){y=b+(y.length>0?" "+y:y);continue}let N=!!x,z=c(N?w.substring(0,x):w);if(!z){if(!N){y=b+(y.length>0?" "+y:y);continue}if(z=c(w),!z){y=b+(y.length>0?" "+y:y);continue}N=!1}const U=d(A).join(":"),B=C?U+ys:U,X=B+z;if(m.includes(X))continue;m.push(X);const G=f(z,N);for(let W=0;W<G.length;++W){const J=G[W];m.push(B+J)}y=b+(y.length>0?" "+y:y)}return y};function rx(){let a=0,r,u,c="";for(;a<arguments.length;)(r=arguments[a++])&&(u=Qv(r))&&(c&&(c+=" "),c+=u);return c}const Qv=a=>{if(typeof a=="string")return a;let r,u="";for(let c=0;c<a.length;c++)a[c]&&(r=Qv(a[c]))&&(u&&(u+=" "),u+=r);return u};function ox(a,...r){let u,c,f,d=m;function m(y){const v=r.reduce((b,_)=>_(b),a());return u=lx(v),c=u.cache.get,f=u.cache.set,d=g,g(y)}function g(y){const v=c(y);if(v)return v;const b=ix(y,u);return f(y,b),b}return function(){return d(rx.apply(null,arguments))}}const et=a=>{const r=u=>u[a]||[];return r.isThemeGetter=!0,r},Zv=/^\[(?:(\w[\w-]*):)?(.+)\]$/i,Fv=/^\((?:(\w[\w-]*):)?(.+)\)$/i,cx=/^\d+\/\d+$/,ux=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,sx=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,fx=/^(rgba?|hsla?|hwb|(ok)?(lab|lch))\(.+\)$/,dx=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,hx=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,Ea=a=>cx.test(a),xe=a=>!!a&&!Number.isNaN(Number(a)),nl=a=>!!a&&Number.isInteger(Number(a)),ls=a=>a.endsWith("%")&&xe(a.slice(0,-1)),Nn=a=>ux.test(a),mx=()=>!0,vx=a=>sx.test(a)&&!fx.test(a),Jv=()=>!1,gx=a=>dx.test(a),px=a=>hx.test(a),yx=a=>!te(a)&&!ne(a),bx=a=>za(a,Wv,Jv),te=a=>Zv.test(a),Dl=a=>za(a,Iv,vx),as=a=>za(a,Ex,xe),cv=a=>za(a,Pv,Jv),xx=a=>za(a,$v,px),oo=a=>za(a,eg,gx),ne=a=>Fv.test(a),Li=a=>ka(a,Iv),Sx=a=>ka(a,Ax),uv=a=>ka(a,Pv),wx=a=>ka(a,Wv),_x=a=>ka(a,$v),co=a=>ka(a,eg,!0),za=(a,r,u)=>{const c=Zv.exec(a);return c?c[1]?r(c[1]):u(c[2]):!1},ka=(a,r,u=!1)=>{const c=Fv.exec(a);return c?c[1]?r(c[1]):u:!1},Pv=a=>a==="position"||a==="percentage",$v=a=>a==="image"||a==="url",Wv=a=>a==="length"||a==="size"||a==="bg-size",Iv=a=>a==="length",Ex=a=>a==="number",Ax=a=>a==="family-name",eg=a=>a==="shadow",Tx=()=>{const a=et("color"),r=et("font"),u=et("text"),c=et("font-weight"),f=et("tracking"),d=et("leading"),m=et("breakpoint"),g=et("container"),y=et("spacing"),v=et("radius"),b=et("shadow"),_=et("inset-shadow"),A=et("text-shadow"),C=et("drop-shadow"),w=et("blur"),x=et("perspective"),N=et("aspect"),z=et("ease"),U=et("animate"),B=()=>["auto","avoid","all","avoid-page","page","left","right","column"],X=()=>["center","top","bottom","left","right","top-left","left-top","top-right","right-top","bottom-right","right-bottom","bottom-left","left-bottom"],G=()=>[...X(),ne,te],W=()=>["auto","hidden","clip","visible","scroll"],J=()=>["auto","contain","none"],Q=()=>[ne,te,y],ce=()=>[Ea,"full","auto",...Q()],me=()=>[nl,"none","subgrid",ne,te],ve=()=>["auto",{span:["full",nl,ne,te]},nl,ne,te],fe=()=>[nl,"auto",ne,te],ge=()=>["auto","min","max","fr",ne,te],ye=()=>["start","end","center","between","around","evenly","stretch","baseline","center-safe","end-safe"],re=()=>["start","end","center","stretch","center-safe","end-safe"],O=()=>["auto",...Q()],Z=()=>[Ea,"auto","full","dvw","dvh","lvw","lvh","svw","svh","min","max","fit",...Q()],L=()=>[a,ne,te],le=()=>[...X(),uv,cv,{position:[ne,te]}],T=()=>["no-repeat",{repeat:["","x","y","space","round"]}],V=()=>["auto","cover","contain",wx,bx,{size:[ne,te]}],P=()=>[ls,Li,Dl],F=()=>["","none","full",v,ne,te],I=()=>["",xe,Li,Dl],he=()=>["solid","dashed","dotted","double"],ie=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],$=()=>[xe,ls,uv,cv],oe=()=>["","none",w,ne,te],ze=()=>["none",xe,ne,te],Ne=()=>["none",xe,ne,te],we=()=>[xe,ne,te],_e=()=>[Ea,"full",...Q()];return{cacheSize:500,theme:{animate:["spin","ping","pulse","bounce"],aspect:["video"],blur:[Nn],breakpoint:[Nn],color:[mx],container:[Nn],"drop-shadow":[Nn],ease:["in","out","in-out"],font:[yx],"font-weight":["thin","extralight","light","normal","medium","semibold","bold","extrabold","black"],"inset-shadow":[Nn],leading:["none","tight","snug","normal","relaxed","loose"],perspective:["dramatic","near","normal","midrange","distant","none"],radius:[Nn],shadow:[Nn],spacing:["px",xe],text:[Nn],"text-shadow":[Nn],tracking:["tighter","tight","normal","wide","wider","widest"]},classGroups:{aspect:[{aspect:["auto","square",Ea,te,ne,N]}],container:["container"],columns:[{columns:[xe,te,ne,g]}],"break-after":[{"break-after":B()}],"break-before":[{"break-before":B()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],sr:["sr-only","not-sr-only"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:G()}],overflow:[{overflow:W()}],"overflow-x":[{"overflow-x":W()}],"overflow-y":[{"overflow-y":W()}],overscroll:[{overscroll:J()}],"overscroll-x":[{"overscroll-x":J()}],"overscroll-y":[{"overscroll-y":J()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:ce()}],"inset-x":[{"inset-x":ce()}],"inset-y":[{"inset-y":ce()}],start:[{start:ce()}],end:[{end:ce()}],top:[{top:ce()}],right:[{right:ce()}],bottom:[{bottom:ce()}],left:[{left:ce()}],visibility:["visible","invisible","collapse"],z:[{z:[nl,"auto",ne,te]}],basis:[{basis:[Ea,"full","auto",g,...Q()]}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["nowrap","wrap","wrap-reverse"]}],flex:[{flex:[xe,Ea,"auto","initial","none",te]}],grow:[{grow:["",xe,ne,te]}],shrink:[{shrink:["",xe,ne,te]}],order:[{order:[nl,"first","last","none",ne,te]}],"grid-cols":[{"grid-cols":me()}],"col-start-end":[{col:ve()}],"col-start":[{"col-start":fe()}],"col-end":[{"col-end":fe()}],"grid-rows":[{"grid-rows":me()}],"row-start-end":[{row:ve()}],"row-start":[{"row-start":fe()}],"row-end":[{"row-end":fe()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":ge()}],"auto-rows":[{"auto-rows":ge()}],gap:[{gap:Q()}],"gap-x":[{"gap-x":Q()}],"gap-y":[{"gap-y":Q()}],"justify-content":[{justify:[...ye(),"normal"]}],"justify-items":[{"justify-items":[...re(),"normal"]}],"justify-self":[{"justify-self":["auto",...re()]}],"align-content":[{content:["normal",...ye()]}],"align-items":[{items:[...re(),{baseline:["","last"]}]}],"align-self":[{self:["auto",...re(),{baseline:["","last"]}]}],"place-content":[{"place-content":ye()}],"place-items":[{"place-items":[...re(),"baseline"]}],"place-self":[{"place-self":["auto",...re()]}],p:[{p:Q()}],px:[{px:Q()}],py:[{py:Q()}],ps:[{ps:Q()}],pe:[{pe:Q()}],pt:[{pt:Q()}],pr:[{pr:Q()}],pb:[{pb:Q()}],pl:[{pl:Q()}],m:[{m:O()}],mx:[{mx:O()}],my:[{my:O()}],ms:[{ms:O()}],me:[{me:O()}],mt:[{mt:O()}],mr:[{mr:O()}],mb:[{mb:O()}],ml:[{ml:O()}],"space-x":[{"space-x":Q()}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":Q()}],"space-y-reverse":["space-y-reverse"],size:[{size:Z()}],w:[{w:[g,"screen",...Z()]}],"min-w":[{"min-w":[g,"screen","none",...Z()]}],"max-w":[{"max-w":[g,"screen","none","prose",{screen:[m]},...Z()]}],h:[{h:["screen","lh",...Z()]}],"min-h":[{"min-h":["screen","lh","none",...Z()]}],"max-h":[{"max-h":["screen","lh",...Z()]}],"font-size":[{text:["base",u,Li,Dl]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:[c,ne,as]}],"font-stretch":[{"font-stretch":["ultra-condensed","extra-condensed","condensed","semi-condensed","normal","semi-expanded","expanded","extra-expanded","ultra-expanded",ls,te]}],"font-family":[{font:[Sx,te,r]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:[f,ne,te]}],"line-clamp":[{"line-clamp":[xe,"none",ne,as]}],leading:[{leading:[d,...Q()]}],"list-image":[{"list-image":["none",ne,te]}],"list-style-position":[{list:["inside","outside"]}],"list-style-type":[{list:["disc","decimal","none",ne,te]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"placeholder-color":[{placeholder:L()}],"text-color":[{text:L()}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[...he(),"wavy"]}],"text-decoration-thickness":[{decoration:[xe,"from-font","auto",ne,Dl]}],"text-decoration-color":[{decoration:L()}],"underline-offset":[{"underline-offset":[xe,"auto",ne,te]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:Q()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",ne,te]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],wrap:[{wrap:["break-word","anywhere","normal"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",ne,te]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:le()}],"bg-repeat":[{bg:T()}],"bg-size":[{bg:V()}],"bg-image":[{bg:["none",{linear:[{to:["t","tr","r","br","b","bl","l","tl"]},nl,ne,te],radial:["",ne,te],conic:[nl,ne,te]},_x,xx]}],"bg-color":[{bg:L()}],"gradient-from-pos":[{from:P()}],"gradient-via-pos":[{via:P()}],"gradient-to-pos":[{to:P()}],"gradient-from":[{from:L()}],"gradient-via":[{via:L()}],"gradient-to":[{to:L()}],rounded:[{rounded:F()}],"rounded-s":[{"rounded-s":F()}],"rounded-e":[{"rounded-e":F()}],"rounded-t":[{"rounded-t":F()}],"rounded-r":[{"rounded-r":F()}],"rounded-b":[{"rounded-b":F()}],"rounded-l":[{"rounded-l":F()}],"rounded-ss":[{"rounded-ss":F()}],"rounded-se":[{"rounded-se":F()}],"rounded-ee":[{"rounded-ee":F()}],"rounded-es":[{"rounded-es":F()}],"rounded-tl":[{"rounded-tl":F()}],"rounded-tr":[{"rounded-tr":F()}],"rounded-br":[{"rounded-br":F()}],"rounded-bl":[{"rounded-bl":F()}],"border-w":[{border:I()}],"border-w-x":[{"border-x":I()}],"border-w-y":[{"border-y":I()}],"border-w-s":[{"border-s":I()}],"border-w-e":[{"border-e":I()}],"border-w-t":[{"border-t":I()}],"border-w-r":[{"border-r":I()}],"border-w-b":[{"border-b":I()}],"border-w-l":[{"border-l":I()}],"divide-x":[{"divide-x":I()}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":I()}],"divide-y-reverse":["divide-y-reverse"],"border-style":[{border:[...he(),"hidden","none"]}],"divide-style":[{divide:[...he(),"hidden","none"]}],"border-color":[{border:L()}],"border-color-x":[{"border-x":L()}],"border-color-y":[{"border-y":L()}],"border-color-s":[{"border-s":L()}],"border-color-e":[{"border-e":L()}],"border-color-t":[{"border-t":L()}],"border-color-r":[{"border-r":L()}],"border-color-b":[{"border-b":L()}],"border-color-l":[{"border-l":L()}],"divide-color":[{divide:L()}],"outline-style":[{outline:[...he(),"none","hidden"]}],"outline-offset":[{"outline-offset":[xe,ne,te]}],"outline-w":[{outline:["",xe,Li,Dl]}],"outline-color":[{outline:L()}],shadow:[{shadow:["","none",b,co,oo]}],"shadow-color":[{shadow:L()}],"inset-shadow":[{"inset-shadow":["none",_,co,oo]}],"inset-shadow-color":[{"inset-shadow":L()}],"ring-w":[{ring:I()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:L()}],"ring-offset-w":[{"ring-offset":[xe,Dl]}],"ring-offset-color":[{"ring-offset":L()}],"inset-ring-w":[{"inset-ring":I()}],"inset-ring-color":[{"inset-ring":L()}],"text-shadow":[{"text-shadow":["none",A,co,oo]}],"text-shadow-color":[{"text-shadow":L()}],opacity:[{opacity:[xe,ne,te]}],"mix-blend":[{"mix-blend":[...ie(),"plus-darker","plus-lighter"]}],"bg-blend":[{"bg-blend":ie()}],"mask-clip":[{"mask-clip":["border","padding","content","fill","stroke","view"]},"mask-no-clip"],"mask-composite":[{mask:["add","subtract","intersect","exclude"]}],"mask-image-linear-pos":[{"mask-linear":[xe]}],"mask-image-linear-from-pos":[{"mask-linear-from":$()}],"mask-image-linear-to-pos":[{"mask-linear-to":$()}],"mask-image-linear-from-color":[{"mask-linear-from":L()}],"mask-image-linear-to-color":[{"mask-linear-to":L()}],"mask-image-t-from-pos":[{"mask-t-from":$()}],"mask-image-t-to-pos":[{"mask-t-to":$()}],"mask-image-t-from-color":[{"mask-t-from":L()}],"mask-image-t-to-color":[{"mask-t-to":L()}],"mask-image-r-from-pos":[{"mask-r-from":$()}],"mask-image-r-to-pos":[{"mask-r-to":$()}],"mask-image-r-from-color":[{"mask-r-from":L()}],"mask-image-r-to-color":[{"mask-r-to":L()}],"mask-image-b-from-pos":[{"mask-b-from":$()}],"mask-image-b-to-pos":[{"mask-b-to":$()}],"mask-image-b-from-color":[{"mask-b-from":L()}],"mask-image-b-to-color":[{"mask-b-to":L()}],"mask-image-l-from-pos":[{"mask-l-from":$()}],"mask-image-l-to-pos":[{"mask-l-to":$()}],"mask-image-l-from-color":[{"mask-l-from":L()}],"mask-image-l-to-color":[{"mask-l-to":L()}],"mask-image-x-from-pos":[{"mask-x-from":$()}],"mask-image-x-to-pos":[{"mask-x-to":$()}],"mask-image-x-from-color":[{"mask-x-from":L()}],"mask-image-x-to-color":[{"mask-x-to":L()}],"mask-image-y-from-pos":[{"mask-y-from":$()}],"mask-image-y-to-pos":[{"mask-y-to":$()}],"mask-image-y-from-color":[{"mask-y-from":L()}],"mask-image-y-to-color":[{"mask-y-to":L()}],"mask-image-radial":[{"mask-radial":[ne,te]}],"mask-image-radial-from-pos":[{"mask-radial-from":$()}],"mask-image-radial-to-pos":[{"mask-radial-to":$()}],"mask-image-radial-from-color":[{"mask-radial-from":L()}],"mask-image-radial-to-color":[{"mask-radial-to":L()}],"mask-image-radial-shape":[{"mask-radial":["circle","ellipse"]}],"mask-image-radial-size":[{"mask-radial":[{closest:["side","corner"],farthest:["side","corner"]}]}],"mask-image-radial-pos":[{"mask-radial-at":X()}],"mask-image-conic-pos":[{"mask-conic":[xe]}],"mask-image-conic-from-pos":[{"mask-conic-from":$()}],"mask-image-conic-to-pos":[{"mask-conic-to":$()}],"mask-image-conic-from-color":[{"mask-conic-from":L()}],"mask-image-conic-to-color":[{"mask-conic-to":L()}],"mask-mode":[{mask:["alpha","luminance","match"]}],"mask-origin":[{"mask-origin":["border","padding","content","fill","stroke","view"]}],"mask-position":[{mask:le()}],"mask-repeat":[{mask:T()}],"mask-size":[{mask:V()}],"mask-type":[{"mask-type":["alpha","luminance"]}],"mask-image":[{mask:["none",ne,te]}],filter:[{filter:["","none",ne,te]}],blur:[{blur:oe()}],brightness:[{brightness:[xe,ne,te]}],contrast:[{contrast:[xe,ne,te]}],"drop-shadow":[{"drop-shadow":["","none",C,co,oo]}],"drop-shadow-color":[{"drop-shadow":L()}],grayscale:[{grayscale:["",xe,ne,te]}],"hue-rotate":[{"hue-rotate":[xe,ne,te]}],invert:[{invert:["",xe,ne,te]}],saturate:[{saturate:[xe,ne,te]}],sepia:[{sepia:["",xe,ne,te]}],"backdrop-filter":[{"backdrop-filter":["","none",ne,te]}],"backdrop-blur":[{"backdrop-blur":oe()}],"backdrop-brightness":[{"backdrop-brightness":[xe,ne,te]}],"backdrop-contrast":[{"backdrop-contrast":[xe,ne,te]}],"backdrop-grayscale":[{"backdrop-grayscale":["",xe,ne,te]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[xe,ne,te]}],"backdrop-invert":[{"backdrop-invert":["",xe,ne,te]}],"backdrop-opacity":[{"backdrop-opacity":[xe,ne,te]}],"backdrop-saturate":[{"backdrop-saturate":[xe,ne,te]}],"backdrop-sepia":[{"backdrop-sepia":["",xe,ne,te]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":Q()}],"border-spacing-x":[{"border-spacing-x":Q()}],"border-spacing-y":[{"border-spacing-y":Q()}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["","all","colors","opacity","shadow","transform","none",ne,te]}],"transition-behavior":[{transition:["normal","discrete"]}],duration:[{duration:[xe,"initial",ne,te]}],ease:[{ease:["linear","initial",z,ne,te]}],delay:[{delay:[xe,ne,te]}],animate:[{animate:["none",U,ne,te]}],backface:[{backface:["hidden","visible"]}],perspective:[{perspective:[x,ne,te]}],"perspective-origin":[{"perspective-origin":G()}],rotate:[{rotate:ze()}],"rotate-x":[{"rotate-x":ze()}],"rotate-y":[{"rotate-y":ze()}],"rotate-z":[{"rotate-z":ze()}],scale:[{scale:Ne()}],"scale-x":[{"scale-x":Ne()}],"scale-y":[{"scale-y":Ne()}],"scale-z":[{"scale-z":Ne()}],"scale-3d":["scale-3d"],skew:[{skew:we()}],"skew-x":[{"skew-x":we()}],"skew-y":[{"skew-y":we()}],transform:[{transform:[ne,te,"","none","gpu","cpu"]}],"transform-origin":[{origin:G()}],"transform-style":[{transform:["3d","flat"]}],translate:[{translate:_e()}],"translate-x":[{"translate-x":_e()}],"translate-y":[{"translate-y":_e()}],"translate-z":[{"translate-z":_e()}],"translate-none":["translate-none"],accent:[{accent:L()}],appearance:[{appearance:["none","auto"]}],"caret-color":[{caret:L()}],"color-scheme":[{scheme:["normal","dark","light","light-dark","only-dark","only-light"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",ne,te]}],"field-sizing":[{"field-sizing":["fixed","content"]}],"pointer-events":[{"pointer-events":["auto","none"]}],resize:[{resize:["none","","y","x"]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":Q()}],"scroll-mx":[{"scroll-mx":Q()}],"scroll-my":[{"scroll-my":Q()}],"scroll-ms":[{"scroll-ms":Q()}],"scroll-me":[{"scroll-me":Q()}],"scroll-mt":[{"scroll-mt":Q()}],"scroll-mr":[{"scroll-mr":Q()}],"scroll-mb":[{"scroll-mb":Q()}],"scroll-ml":[{"scroll-ml":Q()}],"scroll-p":[{"scroll-p":Q()}],"scroll-px":[{"scroll-px":Q()}],"scroll-py":[{"scroll-py":Q()}],"scroll-ps":[{"scroll-ps":Q()}],"scroll-pe":[{"scroll-pe":Q()}],"scroll-pt":[{"scroll-pt":Q()}],"scroll-pr":[{"scroll-pr":Q()}],"scroll-pb":[{"scroll-pb":Q()}],"scroll-pl":[{"scroll-pl":Q()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",ne,te]}],fill:[{fill:["none",...L()]}],"stroke-w":[{stroke:[xe,Li,Dl,as]}],stroke:[{stroke:["none",...L()]}],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-x","border-w-y","border-w-s","border-w-e","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-x","border-color-y","border-color-s","border-color-e","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],translate:["translate-x","translate-y","translate-none"],"translate-none":["translate","translate-x","translate-y","translate-z"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]},orderSensitiveModifiers:["*","**","after","backdrop","before","details-content","file","first-letter","first-line","marker","placeholder","selection"]}},jx=ox(Tx);function Oe(...a){return jx(Yv(a))}const Nx=Xv("inline-flex items-center justify-center gap-2 whitespace-nowrap rounded-md text-sm font-medium transition-all disabled:pointer-events-none disabled:opacity-50 [&_svg]:pointer-events-none [&_svg:not([class*='size-'])]:size-4 shrink-0 [&_svg]:shrink-0 outline-none focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive",{variants:{variant:{default:"bg-primary text-primary-foreground shadow-xs hover:bg-primary/90",destructive:"bg-destructive text-white shadow-xs hover:bg-destructive/90 focus-visible:ring-destructive/20 dark:focus-visible:ring-destructive/40 dark:bg-destructive/60",outline:"border bg-background shadow-xs hover:bg-accent hover:text-accent-foreground dark:bg-input/30 dark:border-input dark:hover:bg-input/50",secondary:"bg-secondary text-secondary-foreground shadow-xs hover:bg-secondary/80",ghost:"hover:bg-accent hover:text-accent-foreground dark:hover:bg-accent/50",link:"text-primary underline-offset-4 hover:underline"},size:{default:"h-9 px-4 py-2 has-[>svg]:px-3",sm:"h-8 rounded-md gap-1.5 px-3 has-[>svg]:px-2.5",lg:"h-10 rounded-md px-6 has-[>svg]:px-4",icon:"size-9"}},defaultVariants:{variant:"default",size:"default"}});function mt({className:a,variant:r,size:u,asChild:c=!1,...f}){const d=c?Gv:"button";return s.jsx(d,{"data-slot":"button",className:Oe(Nx({variant:r,size:u,className:a})),...f})}function Mt({className:a,...r}){return s.jsx("div",{"data-slot":"card",className:Oe("bg-card text-card-foreground flex flex-col gap-6 rounded-xl border py-6 shadow-sm",a),...r})}function Dt({className:a,...r}){return s.jsx("div",{"data-slot":"card-header",className:Oe("@container/card-header grid auto-rows-min grid-rows-[auto_auto] items-start gap-1.5 px-6 has-data-[slot=card-action]:grid-cols-[1fr_auto] [.border-b]:pb-6",a),...r})}function zt({className:a,...r}){return s.jsx("div",{"data-slot":"card-title",className:Oe("leading-none font-semibold",a),...r})}function cn({className:a,...r}){return s.jsx("div",{"data-slot":"card-description",className:Oe("text-muted-foreground text-sm",a),...r})}function kt({className:a,...r}){return s.jsx("div",{"data-slot":"card-content",className:Oe("px-6",a),...r})}function je(a,r,{checkForDefaultPrevented:u=!0}={}){return function(f){if(a==null||a(f),u===!1||!f.defaultPrevented)return r==null?void 0:r(f)}}function Cx(a,r){const u=S.createContext(r),c=d=>{const{children:m,...g}=d,y=S.useMemo(()=>g,Object.values(g));return s.jsx(u.Provider,{value:y,children:m})};c.displayName=a+"Provider";function f(d){const m=S.useContext(u);if(m)return m;if(r!==void 0)return r;throw new Error(`\`${d}\` must be used within \`${a}\``)}return[c,f]}function Hl(a,r=[]){let u=[];function c(d,m){const g=S.createContext(m),y=u.length;u=[...u,m];const v=_=>{var z;const{scope:A,children:C,...w}=_,x=((z=A==null?void 0:A[a])==null?void 0:z[y])||g,N=S.useMemo(()=>w,Object.values(w));return s.jsx(x.Provider,{value:N,children:C})};v.displayName=d+"Provider";function b(_,A){var x;const C=((x=A==null?void 0:A[a])==null?void 0:x[y])||g,w=S.useContext(C);if(w)return w;if(m!==void 0)return m;throw new Error(`\`${_}\` must be used within \`${d}\``)}return[v,b]}const f=()=>{const d=u.map(m=>S.createContext(m));return function(g){const y=(g==null?void 0:g[a])||d;return S.useMemo(()=>({[`__scope${a}`]:{...g,[a]:y}}),[g,y])}};return f.scopeName=a,[c,Rx(f,...r)]}function Rx(...a){const r=a[0];if(a.length===1)return r;const u=()=>{const c=a.map(f=>({useScope:f(),scopeName:f.scopeName}));return function(d){const m=c.reduce((g,{useScope:y,scopeName:v})=>{const _=y(d)[`__scope${v}`];return{...g,..._}},{});return S.useMemo(()=>({[`__scope${r.scopeName}`]:m}),[m])}};return u.scopeName=r.scopeName,u}function tg(a){const r=a+"CollectionProvider",[u,c]=Hl(r),[f,d]=u(r,{collectionRef:{current:null},itemMap:new Map}),m=x=>{const{scope:N,children:z}=x,U=ll.useRef(null),B=ll.useRef(new Map).current;return s.jsx(f,{scope:N,itemMap:B,collectionRef:U,children:z})};m.displayName=r;const g=a+"CollectionSlot",y=Oa(g),v=ll.forwardRef((x,N)=>{const{scope:z,children:U}=x,B=d(g,z),X=Ye(N,B.collectionRef);return s.jsx(y,{ref:X,children:U})});v.displayName=g;const b=a+"CollectionItemSlot",_="data-radix-collection-item",A=Oa(b),C=ll.forwardRef((x,N)=>{const{scope:z,children:U,...B}=x,X=ll.useRef(null),G=Ye(N,X),W=d(b,z);return ll.useEffect(()=>(W.itemMap.set(X,{ref:X,...B}),()=>void W.itemMap.delete(X))),s.jsx(A,{[_]:"",ref:G,children:U})});C.displayName=b;function w(x){const N=d(a+"CollectionConsumer",x);return ll.useCallback(()=>{const U=N.collectionRef.current;if(!U)return[];const B=Array.from(U.querySelectorAll(`[${_}]`));return Array.from(N.itemMap.values()).sort((W,J)=>B.indexOf(W.ref.current)-B.indexOf(J.ref.current))},[N.collectionRef,N.itemMap])}return[{Provider:m,Slot:v,ItemSlot:C},w,c]}var vt=globalThis!=null&&globalThis.document?S.useLayoutEffect:()=>{},Ox=Lv[" useId ".trim().toString()]||(()=>{}),Mx=0;function il(a){const[r,u]=S.useState(Ox());return vt(()=>{u(c=>c??String(Mx++))},[a]),a||(r?`radix-${r}`:"")}var Dx=["a","button","div","form","h2","h3","img","input","label","li","nav","ol","p","select","span","svg","ul"],Te=Dx.reduce((a,r)=>{const u=Oa(`Primitive.${r}`),c=S.forwardRef((f,d)=>{const{asChild:m,...g}=f,y=m?u:r;return typeof window<"u"&&(window[Symbol.for("radix-ui")]=!0),s.jsx(y,{...g,ref:d})});return c.displayName=`Primitive.${r}`,{...a,[r]:c}},{});function zx(a,r){a&&Xi.flushSync(()=>a.dispatchEvent(r))}function ol(a){const r=S.useRef(a);return S.useEffect(()=>{r.current=a}),S.useMemo(()=>(...u)=>{var c;return(c=r.current)==null?void 0:c.call(r,...u)},[])}var kx=Lv[" useInsertionEffect ".trim().toString()]||vt;function Ma({prop:a,defaultProp:r,onChange:u=()=>{},caller:c}){const[f,d,m]=Ux({defaultProp:r,onChange:u}),g=a!==void 0,y=g?a:f;{const b=S.useRef(a!==void 0);S.useEffect(()=>{const _=b.current;_!==g&&console.warn(`${c} is changing from ${_?"controlled":"uncontrolled"} to ${g?"controlled":"uncontrolled"}. Components should not switch from controlled to uncontrolled (or vice versa). Decide between using a controlled or uncontrolled value for the lifetime of the component.`),b.current=g},[g,c])}const v=S.useCallback(b=>{var _;if(g){const A=Bx(b)?b(a):b;A!==a&&((_=m.current)==null||_.call(m,A))}else d(b)},[g,a,d,m]);return[y,v]}function Ux({defaultProp:a,onChange:r}){const[u,c]=S.useState(a),f=S.useRef(u),d=S.useRef(r);return kx(()=>{d.current=r},[r]),S.useEffect(()=>{var m;f.current!==u&&((m=d.current)==null||m.call(d,u),f.current=u)},[u,f]),[u,c,d]}function Bx(a){return typeof a=="function"}var Hx=S.createContext(void 0);function ks(a){const r=S.useContext(Hx);return a||r||"ltr"}var is="rovingFocusGroup.onEntryFocus",Lx={bubbles:!1,cancelable:!0},Ki="RovingFocusGroup",[xs,ng,qx]=tg(Ki),[Gx,lg]=Hl(Ki,[qx]),[Vx,Yx]=Gx(Ki),ag=S.forwardRef((a,r)=>s.jsx(xs.Provider,{scope:a.__scopeRovingFocusGroup,children:s.jsx(xs.Slot,{scope:a.__scopeRovingFocusGroup,children:s.jsx(Xx,{...a,ref:r})})}));ag.displayName=Ki;var Xx=S.forwardRef((a,r)=>{const{__scopeRovingFocusGroup:u,orientation:c,loop:f=!1,dir:d,currentTabStopId:m,defaultCurrentTabStopId:g,onCurrentTabStopIdChange:y,onEntryFocus:v,preventScrollOnEntryFocus:b=!1,..._}=a,A=S.useRef(null),C=Ye(r,A),w=ks(d),[x,N]=Ma({prop:m,defaultProp:g??null,onChange:y,caller:Ki}),[z,U]=S.useState(!1),B=ol(v),X=ng(u),G=S.useRef(!1),[W,J]=S.useState(0);return S.useEffect(()=>{const Q=A.current;if(Q)return Q.addEventListener(is,B),()=>Q.removeEventListener(is,B)},[B]),s.jsx(Vx,{scope:u,orientation:c,dir:w,loop:f,currentTabStopId:x,onItemFocus:S.useCallback(Q=>N(Q),[N]),onItemShiftTab:S.useCallback(()=>U(!0),[]),onFocusableItemAdd:S.useCallback(()=>J(Q=>Q+1),[]),onFocusableItemRemove:S.useCallback(()=>J(Q=>Q-1),[]),children:s.jsx(Te.div,{tabIndex:z||W===0?-1:0,"data-orientation":c,..._,ref:C,style:{outline:"none",...a.style},onMouseDown:je(a.onMouseDown,()=>{G.current=!0}),onFocus:je(a.onFocus,Q=>{const ce=!G.current;if(Q.target===Q.currentTarget&&ce&&!z){const me=new CustomEvent(is,Lx);if(Q.currentTarget.dispatchEvent(me),!me.defaultPrevented){const ve=X().filter(O=>O.focusable),fe=ve.find(O=>O.active),ge=ve.find(O=>O.id===x),re=[fe,ge,...ve].filter(Boolean).map(O=>O.ref.current);og(re,b)}}G.current=!1}),onBlur:je(a.onBlur,()=>U(!1))})})}),ig="RovingFocusGroupItem",rg=S.forwardRef((a,r)=>{const{__scopeRovingFocusGroup:u,focusable:c=!0,active:f=!1,tabStopId:d,children:m,...g}=a,y=il(),v=d||y,b=Yx(ig,u),_=b.currentTabStopId===v,A=ng(u),{onFocusableItemAdd:C,onFocusableItemRemove:w,currentTabStopId:x}=b;return S.useEffect(()=>{if(c)return C(),()=>w()},[c,C,w]),s.jsx(xs.ItemSlot,{scope:u,id:v,focusable:c,active:f,children:s.jsx(Te.span,{tabIndex:_?0:-1,"data-orientation":b.orientation,...g,ref:r,onMouseDown:je(a.onMouseDown,N=>{c?b.onItemFocus(v):N.preventDefault()}),onFocus:je(a.onFocus,()=>b.onItemFocus(v)),onKeyDown:je(a.onKeyDown,N=>{if(N.key==="Tab"&&N.shiftKey){b.onItemShiftTab();return}if(N.target!==N.currentTarget)return;const z=Zx(N,b.orientation,b.dir);if(z!==void 0){if(N.metaKey||N.ctrlKey||N.altKey||N.shiftKey)return;N.preventDefault();let B=A().filter(X=>X.focusable).map(X=>X.ref.current);if(z==="last")B.reverse();else if(z==="prev"||z==="next"){z==="prev"&&B.reverse();const X=B.indexOf(N.currentTarget);B=b.loop?Fx(B,X+1):B.slice(X+1)}setTimeout(()=>og(B))}}),children:typeof m=="function"?m({isCurrentTabStop:_,hasTabStop:x!=null}):m})})});rg.displayName=ig;var Kx={ArrowLeft:"prev",ArrowUp:"prev",ArrowRight:"next",ArrowDown:"next",PageUp:"first",Home:"first",PageDown:"last",End:"last"};function Qx(a,r){return r!=="rtl"?a:a==="ArrowLeft"?"ArrowRight":a==="ArrowRight"?"ArrowLeft":a}function Zx(a,r,u){const c=Qx(a.key,u);if(!(r==="vertical"&&["ArrowLeft","ArrowRight"].includes(c))&&!(r==="horizontal"&&["ArrowUp","ArrowDown"].includes(c)))return Kx[c]}function og(a,r=!1){const u=document.activeElement;for(const c of a)if(c===u||(c.focus({preventScroll:r}),document.activeElement!==u))return}function Fx(a,r){return a.map((u,c)=>a[(r+c)%a.length])}var Jx=ag,Px=rg;function $x(a,r){return S.useReducer((u,c)=>r[u][c]??u,a)}var Ua=a=>{const{present:r,children:u}=a,c=Wx(r),f=typeof u=="function"?u({present:c.isPresent}):S.Children.only(u),d=Ye(c.ref,Ix(f));return typeof u=="function"||c.isPresent?S.cloneElement(f,{ref:d}):null};Ua.displayName="Presence";function Wx(a){const[r,u]=S.useState(),c=S.useRef(null),f=S.useRef(a),d=S.useRef("none"),m=a?"mounted":"unmounted",[g,y]=$x(m,{mounted:{UNMOUNT:"unmounted",ANIMATION_OUT:"unmountSuspended"},unmountSuspended:{MOUNT:"mounted",ANIMATION_END:"unmounted"},unmounted:{MOUNT:"mounted"}});return S.useEffect(()=>{const v=uo(c.current);d.current=g==="mounted"?v:"none"},[g]),vt(()=>{const v=c.current,b=f.current;if(b!==a){const A=d.current,C=uo(v);a?y("MOUNT"):C==="none"||(v==null?void 0:v.display)==="none"?y("UNMOUNT"):y(b&&A!==C?"ANIMATION_OUT":"UNMOUNT"),f.current=a}},[a,y]),vt(()=>{if(r){let v;const b=r.ownerDocument.defaultView??window,_=C=>{const x=uo(c.current).includes(C.animationName);if(C.target===r&&x&&(y("ANIMATION_END"),!f.current)){const N=r.style.animationFillMode;r.style.animationFillMode="forwards",v=b.setTimeout(()=>{r.style.animationFillMode==="forwards"&&(r.style.animationFillMode=N)})}},A=C=>{C.target===r&&(d.current=uo(c.current))};return r.addEventListener("animationstart",A),r.addEventListener("animationcancel",_),r.addEventListener("animationend",_),()=>{b.clearTimeout(v),r.removeEventListener("animationstart",A),r.removeEventListener("animationcancel",_),r.removeEventListener("animationend",_)}}else y("ANIMATION_END")},[r,y]),{isPresent:["mounted","unmountSuspended"].includes(g),ref:S.useCallback(v=>{c.current=v?getComputedStyle(v):null,u(v)},[])}}function uo(a){return(a==null?void 0:a.animationName)||"none"}function Ix(a){var c,f;let r=(c=Object.getOwnPropertyDescriptor(a.props,"ref"))==null?void 0:c.get,u=r&&"isReactWarning"in r&&r.isReactWarning;return u?a.ref:(r=(f=Object.getOwnPropertyDescriptor(a,"ref"))==null?void 0:f.get,u=r&&"isReactWarning"in r&&r.isReactWarning,u?a.props.ref:a.props.ref||a.ref)}var Co="Tabs",[e1,b_]=Hl(Co,[lg]),cg=lg(),[t1,Us]=e1(Co),ug=S.forwardRef((a,r)=>{const{__scopeTabs:u,value:c,onValueChange:f,defaultValue:d,orientation:m="horizontal",dir:g,activationMode:y="automatic",...v}=a,b=ks(g),[_,A]=Ma({prop:c,onChange:f,defaultProp:d??"",caller:Co});return s.jsx(t1,{scope:u,baseId:il(),value:_,onValueChange:A,orientation:m,dir:b,activationMode:y,children:s.jsx(Te.div,{dir:b,"data-orientation":m,...v,ref:r})})});ug.displayName=Co;var sg="TabsList",fg=S.forwardRef((a,r)=>{const{__scopeTabs:u,loop:c=!0,...f}=a,d=Us(sg,u),m=cg(u);return s.jsx(Jx,{asChild:!0,...m,orientation:d.orientation,dir:d.dir,loop:c,children:s.jsx(Te.div,{role:"tablist","aria-orientation":d.orientation,...f,ref:r})})});fg.displayName=sg;var dg="TabsTrigger",hg=S.forwardRef((a,r)=>{const{__scopeTabs:u,value:c,disabled:f=!1,...d}=a,m=Us(dg,u),g=cg(u),y=gg(m.baseId,c),v=pg(m.baseId,c),b=c===m.value;return s.jsx(Px,{asChild:!0,...g,focusable:!f,active:b,children:s.jsx(Te.button,{type:"button",role:"tab","aria-selected":b,"aria-controls":v,"data-state":b?"active":"inactive","data-disabled":f?"":void 0,disabled:f,id:y,...d,ref:r,onMouseDown:je(a.onMouseDown,_=>{!f&&_.button===0&&_.ctrlKey===!1?m.onValueChange(c):_.preventDefault()}),onKeyDown:je(a.onKeyDown,_=>{[" ","Enter"].includes(_.key)&&m.onValueChange(c)}),onFocus:je(a.onFocus,()=>{const _=m.activationMode!=="manual";!b&&!f&&_&&m.onValueChange(c)})})})});hg.displayName=dg;var mg="TabsContent",vg=S.forwardRef((a,r)=>{const{__scopeTabs:u,value:c,forceMount:f,children:d,...m}=a,g=Us(mg,u),y=gg(g.baseId,c),v=pg(g.baseId,c),b=c===g.value,_=S.useRef(b);return S.useEffect(()=>{const A=requestAnimationFrame(()=>_.current=!1);return()=>cancelAnimationFrame(A)},[]),s.jsx(Ua,{present:f||b,children:({present:A})=>s.jsx(Te.div,{"data-state":b?"active":"inactive","data-orientation":g.orientation,role:"tabpanel","aria-labelledby":y,hidden:!A,id:v,tabIndex:0,...m,ref:r,style:{...a.style,animationDuration:_.current?"0s":void 0},children:A&&d})})});vg.displayName=mg;function gg(a,r){return`${a}-trigger-${r}`}function pg(a,r){return`${a}-content-${r}`}var n1=ug,l1=fg,a1=hg,i1=vg;function r1({className:a,...r}){return s.jsx(n1,{"data-slot":"tabs",className:Oe("flex flex-col gap-2",a),...r})}function o1({className:a,...r}){return s.jsx(l1,{"data-slot":"tabs-list",className:Oe("bg-muted text-muted-foreground inline-flex h-9 w-fit items-center justify-center rounded-lg p-[3px]",a),...r})}function so({className:a,...r}){return s.jsx(a1,{"data-slot":"tabs-trigger",className:Oe("data-[state=active]:bg-background dark:data-[state=active]:text-foreground focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:outline-ring dark:data-[state=active]:border-input dark:data-[state=active]:bg-input/30 text-foreground dark:text-muted-foreground inline-flex h-[calc(100%-1px)] flex-1 items-center justify-center gap-1.5 rounded-md border border-transparent px-2 py-1 text-sm font-medium whitespace-nowrap transition-[color,box-shadow] focus-visible:ring-[3px] focus-visible:outline-1 disabled:pointer-events-none disabled:opacity-50 data-[state=active]:shadow-sm [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4",a),...r})}function fo({className:a,...r}){return s.jsx(i1,{"data-slot":"tabs-content",className:Oe("flex-1 outline-none",a),...r})}/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const c1=a=>a.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),u1=a=>a.replace(/^([A-Z])|[\s-_]+(\w)/g,(r,u,c)=>c?c.toUpperCase():u.toLowerCase()),sv=a=>{const r=u1(a);return r.charAt(0).toUpperCase()+r.slice(1)},yg=(...a)=>a.filter((r,u,c)=>!!r&&r.trim()!==""&&c.indexOf(r)===u).join(" ").trim(),s1=a=>{for(const r in a)if(r.startsWith("aria-")||r==="role"||r==="title")return!0};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */var f1={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const d1=S.forwardRef(({color:a="currentColor",size:r=24,strokeWidth:u=2,absoluteStrokeWidth:c,className:f="",children:d,iconNode:m,...g},y)=>S.createElement("svg",{ref:y,...f1,width:r,height:r,stroke:a,strokeWidth:c?Number(u)*24/Number(r):u,className:yg("lucide",f),...!d&&!s1(g)&&{"aria-hidden":"true"},...g},[...m.map(([v,b])=>S.createElement(v,b)),...Array.isArray(d)?d:[d]]));/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const it=(a,r)=>{const u=S.forwardRef(({className:c,...f},d)=>S.createElement(d1,{ref:d,iconNode:r,className:yg(`lucide-${c1(sv(a))}`,`lucide-${a}`,c),...f}));return u.displayName=sv(a),u};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const h1=[["rect",{width:"16",height:"20",x:"4",y:"2",rx:"2",ry:"2",key:"76otgf"}],["path",{d:"M9 22v-4h6v4",key:"r93iot"}],["path",{d:"M8 6h.01",key:"1dz90k"}],["path",{d:"M16 6h.01",key:"1x0f13"}],["path",{d:"M12 6h.01",key:"1vi96p"}],["path",{d:"M12 10h.01",key:"1nrarc"}],["path",{d:"M12 14h.01",key:"1etili"}],["path",{d:"M16 10h.01",key:"1m94wz"}],["path",{d:"M16 14h.01",key:"1gbofw"}],["path",{d:"M8 10h.01",key:"19clt8"}],["path",{d:"M8 14h.01",key:"6423bh"}]],Ss=it("building",h1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const m1=[["path",{d:"M8 2v4",key:"1cmpym"}],["path",{d:"M16 2v4",key:"4m81vk"}],["rect",{width:"18",height:"18",x:"3",y:"4",rx:"2",key:"1hopcy"}],["path",{d:"M3 10h18",key:"8toen8"}]],v1=it("calendar",m1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const g1=[["path",{d:"M20 6 9 17l-5-5",key:"1gmf2c"}]],bg=it("check",g1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const p1=[["path",{d:"m6 9 6 6 6-6",key:"qrunsl"}]],xg=it("chevron-down",p1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const y1=[["path",{d:"m18 15-6-6-6 6",key:"153udz"}]],b1=it("chevron-up",y1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const x1=[["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["polyline",{points:"7 10 12 15 17 10",key:"2ggqvy"}],["line",{x1:"12",x2:"12",y1:"15",y2:"3",key:"1vk2je"}]],ws=it("download",x1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const S1=[["path",{d:"M2.062 12.348a1 1 0 0 1 0-.696 10.75 10.75 0 0 1 19.876 0 1 1 0 0 1 0 .696 10.75 10.75 0 0 1-19.876 0",key:"1nclc0"}],["circle",{cx:"12",cy:"12",r:"3",key:"1v7zrd"}]],w1=it("eye",S1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const _1=[["path",{d:"M15 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V7Z",key:"1rqfz7"}],["path",{d:"M14 2v4a2 2 0 0 0 2 2h4",key:"tnqrlb"}],["path",{d:"M10 9H8",key:"b1mrlr"}],["path",{d:"M16 13H8",key:"t4e002"}],["path",{d:"M16 17H8",key:"z1uh3a"}]],Na=it("file-text",_1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const E1=[["path",{d:"M20 10c0 4.993-5.539 10.193-7.399 11.799a1 1 0 0 1-1.202 0C9.539 20.193 4 14.993 4 10a8 8 0 0 1 16 0",key:"1r0f0z"}],["circle",{cx:"12",cy:"10",r:"3",key:"ilqhr7"}]],A1=it("map-pin",E1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const T1=[["path",{d:"M5 12h14",key:"1ays0h"}],["path",{d:"M12 5v14",key:"s699le"}]],So=it("plus",T1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const j1=[["path",{d:"M15.2 3a2 2 0 0 1 1.4.6l3.8 3.8a2 2 0 0 1 .6 1.4V19a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2V5a2 2 0 0 1 2-2z",key:"1c8476"}],["path",{d:"M17 21v-7a1 1 0 0 0-1-1H8a1 1 0 0 0-1 1v7",key:"1ydtos"}],["path",{d:"M7 3v4a1 1 0 0 0 1 1h7",key:"t51u73"}]],N1=it("save",j1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const C1=[["path",{d:"M12.22 2h-.44a2 2 0 0 0-2 2v.18a2 2 0 0 1-1 1.73l-.43.25a2 2 0 0 1-2 0l-.15-.08a2 2 0 0 0-2.73.73l-.22.38a2 2 0 0 0 .73 2.73l.15.1a2 2 0 0 1 1 1.72v.51a2 2 0 0 1-1 1.74l-.15.09a2 2 0 0 0-.73 2.73l.22.38a2 2 0 0 0 2.73.73l.15-.08a2 2 0 0 1 2 0l.43.25a2 2 0 0 1 1 1.73V20a2 2 0 0 0 2 2h.44a2 2 0 0 0 2-2v-.18a2 2 0 0 1 1-1.73l.43-.25a2 2 0 0 1 2 0l.15.08a2 2 0 0 0 2.73-.73l.22-.39a2 2 0 0 0-.73-2.73l-.15-.08a2 2 0 0 1-1-1.74v-.5a2 2 0 0 1 1-1.74l.15-.09a2 2 0 0 0 .73-2.73l-.22-.38a2 2 0 0 0-2.73-.73l-.15.08a2 2 0 0 1-2 0l-.43-.25a2 2 0 0 1-1-1.73V4a2 2 0 0 0-2-2z",key:"1qme2f"}],["circle",{cx:"12",cy:"12",r:"3",key:"1v7zrd"}]],R1=it("settings",C1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const O1=[["path",{d:"M12 3H5a2 2 0 0 0-2 2v14a2 2 0 0 0 2 2h14a2 2 0 0 0 2-2v-7",key:"1m0v6g"}],["path",{d:"M18.375 2.625a1 1 0 0 1 3 3l-9.013 9.014a2 2 0 0 1-.853.505l-2.873.84a.5.5 0 0 1-.62-.62l.84-2.873a2 2 0 0 1 .506-.852z",key:"ohrbg2"}]],M1=it("square-pen",O1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const D1=[["path",{d:"M3 6h18",key:"d0wm0j"}],["path",{d:"M19 6v14c0 1-1 2-2 2H7c-1 0-2-1-2-2V6",key:"4alrt4"}],["path",{d:"M8 6V4c0-1 1-2 2-2h4c1 0 2 1 2 2v2",key:"v07s0e"}],["line",{x1:"10",x2:"10",y1:"11",y2:"17",key:"1uufr5"}],["line",{x1:"14",x2:"14",y1:"11",y2:"17",key:"xtxkd"}]],Sg=it("trash-2",D1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const z1=[["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["polyline",{points:"17 8 12 3 7 8",key:"t8dd8p"}],["line",{x1:"12",x2:"12",y1:"3",y2:"15",key:"widbto"}]],k1=it("upload",z1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const U1=[["path",{d:"M19 21v-2a4 4 0 0 0-4-4H9a4 4 0 0 0-4 4v2",key:"975kel"}],["circle",{cx:"12",cy:"7",r:"4",key:"17ys0d"}]],wg=it("user",U1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const B1=[["path",{d:"M16 21v-2a4 4 0 0 0-4-4H6a4 4 0 0 0-4 4v2",key:"1yyitq"}],["path",{d:"M16 3.128a4 4 0 0 1 0 7.744",key:"16gr8j"}],["path",{d:"M22 21v-2a4 4 0 0 0-3-3.87",key:"kshegd"}],["circle",{cx:"9",cy:"7",r:"4",key:"nufk8"}]],rs=it("users",B1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const H1=[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]],L1=it("x",H1);function Ge({className:a,type:r,...u}){return s.jsx("input",{type:r,"data-slot":"input",className:Oe("file:text-foreground placeholder:text-muted-foreground selection:bg-primary selection:text-primary-foreground dark:bg-input/30 border-input flex h-9 w-full min-w-0 rounded-md border bg-transparent px-3 py-1 text-base shadow-xs transition-[color,box-shadow] outline-none file:inline-flex file:h-7 file:border-0 file:bg-transparent file:text-sm file:font-medium disabled:pointer-events-none disabled:cursor-not-allowed disabled:opacity-50 md:text-sm","focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px]","aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive",a),...u})}var q1="Label",_g=S.forwardRef((a,r)=>s.jsx(Te.label,{...a,ref:r,onMouseDown:u=>{var f;u.target.closest("button, input, select, textarea")||((f=a.onMouseDown)==null||f.call(a,u),!u.defaultPrevented&&u.detail>1&&u.preventDefault())}}));_g.displayName=q1;var G1=_g;function Ce({className:a,...r}){return s.jsx(G1,{"data-slot":"label",className:Oe("flex items-center gap-2 text-sm leading-none font-medium select-none group-data-[disabled=true]:pointer-events-none group-data-[disabled=true]:opacity-50 peer-disabled:cursor-not-allowed peer-disabled:opacity-50",a),...r})}function V1({className:a,...r}){return s.jsx("textarea",{"data-slot":"textarea",className:Oe("border-input placeholder:text-muted-foreground focus-visible:border-ring focus-visible:ring-ring/50 aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive dark:bg-input/30 flex field-sizing-content min-h-16 w-full rounded-md border bg-transparent px-3 py-2 text-base shadow-xs transition-[color,box-shadow] outline-none focus-visible:ring-[3px] disabled:cursor-not-allowed disabled:opacity-50 md:text-sm",a),...r})}function Y1(a,r=globalThis==null?void 0:globalThis.document){const u=ol(a);S.useEffect(()=>{const c=f=>{f.key==="Escape"&&u(f)};return r.addEventListener("keydown",c,{capture:!0}),()=>r.removeEventListener("keydown",c,{capture:!0})},[u,r])}var X1="DismissableLayer",_s="dismissableLayer.update",K1="dismissableLayer.pointerDownOutside",Q1="dismissableLayer.focusOutside",fv,Eg=S.createContext({layers:new Set,layersWithOutsidePointerEventsDisabled:new Set,branches:new Set}),Bs=S.forwardRef((a,r)=>{const{disableOutsidePointerEvents:u=!1,onEscapeKeyDown:c,onPointerDownOutside:f,onFocusOutside:d,onInteractOutside:m,onDismiss:g,...y}=a,v=S.useContext(Eg),[b,_]=S.useState(null),A=(b==null?void 0:b.ownerDocument)??(globalThis==null?void 0:globalThis.document),[,C]=S.useState({}),w=Ye(r,J=>_(J)),x=Array.from(v.layers),[N]=[...v.layersWithOutsidePointerEventsDisabled].slice(-1),z=x.indexOf(N),U=b?x.indexOf(b):-1,B=v.layersWithOutsidePointerEventsDisabled.size>0,X=U>=z,G=J1(J=>{const Q=J.target,ce=[...v.branches].some(me=>me.contains(Q));!X||ce||(f==null||f(J),m==null||m(J),J.defaultPrevented||g==null||g())},A),W=P1(J=>{const Q=J.target;[...v.branches].some(me=>me.contains(Q))||(d==null||d(J),m==null||m(J),J.defaultPrevented||g==null||g())},A);return Y1(J=>{U===v.layers.size-1&&(c==null||c(J),!J.defaultPrevented&&g&&(J.preventDefault(),g()))},A),S.useEffect(()=>{if(b)return u&&(v.layersWithOutsidePointerEventsDisabled.size===0&&(fv=A.body.style.pointerEvents,A.body.style.pointerEvents="none"),v.layersWithOutsidePointerEventsDisabled.add(b)),v.layers.add(b),dv(),()=>{u&&v.layersWithOutsidePointerEventsDisabled.size===1&&(A.body.style.pointerEvents=fv)}},[b,A,u,v]),S.useEffect(()=>()=>{b&&(v.layers.delete(b),v.layersWithOutsidePointerEventsDisabled.delete(b),dv())},[b,v]),S.useEffect(()=>{const J=()=>C({});return document.addEventListener(_s,J),()=>document.removeEventListener(_s,J)},[]),s.jsx(Te.div,{...y,ref:w,style:{pointerEvents:B?X?"auto":"none":void 0,...a.style},onFocusCapture:je(a.onFocusCapture,W.onFocusCapture),onBlurCapture:je(a.onBlurCapture,W.onBlurCapture),onPointerDownCapture:je(a.onPointerDownCapture,G.onPointerDownCapture)})});Bs.displayName=X1;var Z1="DismissableLayerBranch",F1=S.forwardRef((a,r)=>{const u=S.useContext(Eg),c=S.useRef(null),f=Ye(r,c);return S.useEffect(()=>{const d=c.current;if(d)return u.branches.add(d),()=>{u.branches.delete(d)}},[u.branches]),s.jsx(Te.div,{...a,ref:f})});F1.displayName=Z1;function J1(a,r=globalThis==null?void 0:globalThis.document){const u=ol(a),c=S.useRef(!1),f=S.useRef(()=>{});return S.useEffect(()=>{const d=g=>{if(g.target&&!c.current){let y=function(){Ag(K1,u,v,{discrete:!0})};const v={originalEvent:g};g.pointerType==="touch"?(r.removeEventListener("click",f.current),f.current=y,r.addEventListener("click",f.current,{once:!0})):y()}else r.removeEventListener("click",f.current);c.current=!1},m=window.setTimeout(()=>{r.addEventListener("pointerdown",d)},0);return()=>{window.clearTimeout(m),r.removeEventListener("pointerdown",d),r.removeEventListener("click",f.current)}},[r,u]),{onPointerDownCapture:()=>c.current=!0}}function P1(a,r=globalThis==null?void 0:globalThis.document){const u=ol(a),c=S.useRef(!1);return S.useEffect(()=>{const f=d=>{d.target&&!c.current&&Ag(Q1,u,{originalEvent:d},{discrete:!1})};return r.addEventListener("focusin",f),()=>r.removeEventListener("focusin",f)},[r,u]),{onFocusCapture:()=>c.current=!0,onBlurCapture:()=>c.current=!1}}function dv(){const a=new CustomEvent(_s);document.dispatchEvent(a)}function Ag(a,r,u,{discrete:c}){const f=u.originalEvent.target,d=new CustomEvent(a,{bubbles:!1,cancelable:!0,detail:u});r&&f.addEventListener(a,r,{once:!0}),c?zx(f,d):f.dispatchEvent(d)}var os="focusScope.autoFocusOnMount",cs="focusScope.autoFocusOnUnmount",hv={bubbles:!1,cancelable:!0},$1="FocusScope",Hs=S.forwardRef((a,r)=>{const{loop:u=!1,trapped:c=!1,onMountAutoFocus:f,onUnmountAutoFocus:d,...m}=a,[g,y]=S.useState(null),v=ol(f),b=ol(d),_=S.useRef(null),A=Ye(r,x=>y(x)),C=S.useRef({paused:!1,pause(){this.paused=!0},resume(){this.paused=!1}}).current;S.useEffect(()=>{if(c){let x=function(B){if(C.paused||!g)return;const X=B.target;g.contains(X)?_.current=X:al(_.current,{select:!0})},N=function(B){if(C.paused||!g)return;const X=B.relatedTarget;X!==null&&(g.contains(X)||al(_.current,{select:!0}))},z=function(B){if(document.activeElement===document.body)for(const G of B)G.removedNodes.length>0&&al(g)};document.addEventListener("focusin",x),document.addEventListener("focusout",N);const U=new MutationObserver(z);return g&&U.observe(g,{childList:!0,subtree:!0}),()=>{document.removeEventListener("focusin",x),document.removeEventListener("focusout",N),U.disconnect()}}},[c,g,C.paused]),S.useEffect(()=>{if(g){vv.add(C);const x=document.activeElement;if(!g.contains(x)){const z=new CustomEvent(os,hv);g.addEventListener(os,v),g.dispatchEvent(z),z.defaultPrevented||(W1(lS(Tg(g)),{select:!0}),document.activeElement===x&&al(g))}return()=>{g.removeEventListener(os,v),setTimeout(()=>{const z=new CustomEvent(cs,hv);g.addEventListener(cs,b),g.dispatchEvent(z),z.defaultPrevented||al(x??document.body,{select:!0}),g.removeEventListener(cs,b),vv.remove(C)},0)}}},[g,v,b,C]);const w=S.useCallback(x=>{if(!u&&!c||C.paused)return;const N=x.key==="Tab"&&!x.altKey&&!x.ctrlKey&&!x.metaKey,z=document.activeElement;if(N&&z){const U=x.currentTarget,[B,X]=I1(U);B&&X?!x.shiftKey&&z===X?(x.preventDefault(),u&&al(B,{select:!0})):x.shiftKey&&z===B&&(x.preventDefault(),u&&al(X,{select:!0})):z===U&&x.preventDefault()}},[u,c,C.paused]);return s.jsx(Te.div,{tabIndex:-1,...m,ref:A,onKeyDown:w})});Hs.displayName=$1;function W1(a,{select:r=!1}={}){const u=document.activeElement;for(const c of a)if(al(c,{select:r}),document.activeElement!==u)return}function I1(a){const r=Tg(a),u=mv(r,a),c=mv(r.reverse(),a);return[u,c]}function Tg(a){const r=[],u=document.createTreeWalker(a,NodeFilter.SHOW_ELEMENT,{acceptNode:c=>{const f=c.tagName==="INPUT"&&c.type==="hidden";return c.disabled||c.hidden||f?NodeFilter.FILTER_SKIP:c.tabIndex>=0?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP}});for(;u.nextNode();)r.push(u.currentNode);return r}function mv(a,r){for(const u of a)if(!eS(u,{upTo:r}))return u}function eS(a,{upTo:r}){if(getComputedStyle(a).visibility==="hidden")return!0;for(;a;){if(r!==void 0&&a===r)return!1;if(getComputedStyle(a).display==="none")return!0;a=a.parentElement}return!1}function tS(a){return a instanceof HTMLInputElement&&"select"in a}function al(a,{select:r=!1}={}){if(a&&a.focus){const u=document.activeElement;a.focus({preventScroll:!0}),a!==u&&tS(a)&&r&&a.select()}}var vv=nS();function nS(){let a=[];return{add(r){const u=a[0];r!==u&&(u==null||u.pause()),a=gv(a,r),a.unshift(r)},remove(r){var u;a=gv(a,r),(u=a[0])==null||u.resume()}}}function gv(a,r){const u=[...a],c=u.indexOf(r);return c!==-1&&u.splice(c,1),u}function lS(a){return a.filter(r=>r.tagName!=="A")}var aS="Portal",Ls=S.forwardRef((a,r)=>{var g;const{container:u,...c}=a,[f,d]=S.useState(!1);vt(()=>d(!0),[]);const m=u||f&&((g=globalThis==null?void 0:globalThis.document)==null?void 0:g.body);return m?Gb.createPortal(s.jsx(Te.div,{...c,ref:r}),m):null});Ls.displayName=aS;var us=0;function jg(){S.useEffect(()=>{const a=document.querySelectorAll("[data-radix-focus-guard]");return document.body.insertAdjacentElement("afterbegin",a[0]??pv()),document.body.insertAdjacentElement("beforeend",a[1]??pv()),us++,()=>{us===1&&document.querySelectorAll("[data-radix-focus-guard]").forEach(r=>r.remove()),us--}},[])}function pv(){const a=document.createElement("span");return a.setAttribute("data-radix-focus-guard",""),a.tabIndex=0,a.style.outline="none",a.style.opacity="0",a.style.position="fixed",a.style.pointerEvents="none",a}var un=function(){return un=Object.assign||function(r){for(var u,c=1,f=arguments.length;c<f;c++){u=arguments[c];for(var d in u)Object.prototype.hasOwnProperty.call(u,d)&&(r[d]=u[d])}return r},un.apply(this,arguments)};function Ng(a,r){var u={};for(var c in a)Object.prototype.hasOwnProperty.call(a,c)&&r.indexOf(c)<0&&(u[c]=a[c]);if(a!=null&&typeof Object.getOwnPropertySymbols=="function")for(var f=0,c=Object.getOwnPropertySymbols(a);f<c.length;f++)r.indexOf(c[f])<0&&Object.prototype.propertyIsEnumerable.call(a,c[f])&&(u[c[f]]=a[c[f]]);return u}function iS(a,r,u){if(u||arguments.length===2)for(var c=0,f=r.length,d;c<f;c++)(d||!(c in r))&&(d||(d=Array.prototype.slice.call(r,0,c)),d[c]=r[c]);return a.concat(d||Array.prototype.slice.call(r))}var yo="right-scroll-bar-position",bo="width-before-scroll-bar",rS="with-scroll-bars-hidden",oS="--removed-body-scroll-bar-size";function ss(a,r){return typeof a=="function"?a(r):a&&(a.current=r),a}function cS(a,r){var u=S.useState(function(){return{value:a,callback:r,facade:{get current(){return u.value},set current(c){var f=u.value;f!==c&&(u.value=c,u.callback(c,f))}}}})[0];return u.callback=r,u.facade}var uS=typeof window<"u"?S.useLayoutEffect:S.useEffect,yv=new WeakMap;function sS(a,r){var u=cS(null,function(c){return a.forEach(function(f){return ss(f,c)})});return uS(function(){var c=yv.get(u);if(c){var f=new Set(c),d=new Set(a),m=u.current;f.forEach(function(g){d.has(g)||ss(g,null)}),d.forEach(function(g){f.has(g)||ss(g,m)})}yv.set(u,a)},[a]),u}function fS(a){return a}function dS(a,r){r===void 0&&(r=fS);var u=[],c=!1,f={read:function(){if(c)throw new Error("Sidecar: could not `read` from an `assigned` medium. `read` could be used only with `useMedium`.");return u.length?u[u.length-1]:a},useMedium:function(d){var m=r(d,c);return u.push(m),function(){u=u.filter(function(g){return g!==m})}},assignSyncMedium:function(d){for(c=!0;u.length;){var m=u;u=[],m.forEach(d)}u={push:function(g){return d(g)},filter:function(){return u}}},assignMedium:function(d){c=!0;var m=[];if(u.length){var g=u;u=[],g.forEach(d),m=u}var y=function(){var b=m;m=[],b.forEach(d)},v=function(){return Promise.resolve().then(y)};v(),u={push:function(b){m.push(b),v()},filter:function(b){return m=m.filter(b),u}}}};return f}function hS(a){a===void 0&&(a={});var r=dS(null);return r.options=un({async:!0,ssr:!1},a),r}var Cg=function(a){var r=a.sideCar,u=Ng(a,["sideCar"]);if(!r)throw new Error("Sidecar: please provide `sideCar` property to import the right car");var c=r.read();if(!c)throw new Error("Sidecar medium not found");return S.createElement(c,un({},u))};Cg.isSideCarExport=!0;function mS(a,r){return a.useMedium(r),Cg}var Rg=hS(),fs=function(){},Ro=S.forwardRef(function(a,r){var u=S.useRef(null),c=S.useState({onScrollCapture:fs,onWheelCapture:fs,onTouchMoveCapture:fs}),f=c[0],d=c[1],m=a.forwardProps,g=a.children,y=a.className,v=a.removeScrollBar,b=a.enabled,_=a.shards,A=a.sideCar,C=a.noIsolation,w=a.inert,x=a.allowPinchZoom,N=a.as,z=N===void 0?"div":N,U=a.gapMode,B=Ng(a,["forwardProps","children","className","removeScrollBar","enabled","shards","sideCar","noIsolation","inert","allowPinchZoom","as","gapMode"]),X=A,G=sS([u,r]),W=un(un({},B),f);return S.createElement(S.Fragment,null,b&&S.createElement(X,{sideCar:Rg,removeScrollBar:v,shards:_,noIsolation:C,inert:w,setCallbacks:d,allowPinchZoom:!!x,lockRef:u,gapMode:U}),m?S.cloneElement(S.Children.only(g),un(un({},W),{ref:G})):S.createElement(z,un({},W,{className:y,ref:G}),g))});Ro.defaultProps={enabled:!0,removeScrollBar:!0,inert:!1};Ro.classNames={fullWidth:bo,zeroRight:yo};var vS=function(){if(typeof __webpack_nonce__<"u")return __webpack_nonce__};function gS(){if(!document)return null;var a=document.createElement("style");a.type="text/css";var r=vS();return r&&a.setAttribute("nonce",r),a}function pS(a,r){a.styleSheet?a.styleSheet.cssText=r:a.appendChild(document.createTextNode(r))}function yS(a){var r=document.head||document.getElementsByTagName("head")[0];r.appendChild(a)}var bS=function(){var a=0,r=null;return{add:function(u){a==0&&(r=gS())&&(pS(r,u),yS(r)),a++},remove:function(){a--,!a&&r&&(r.parentNode&&r.parentNode.removeChild(r),r=null)}}},xS=function(){var a=bS();return function(r,u){S.useEffect(function(){return a.add(r),function(){a.remove()}},[r&&u])}},Og=function(){var a=xS(),r=function(u){var c=u.styles,f=u.dynamic;return a(c,f),null};return r},SS={left:0,top:0,right:0,gap:0},ds=function(a){return parseInt(a||"",10)||0},wS=function(a){var r=window.getComputedStyle(document.body),u=r[a==="padding"?"paddingLeft":"marginLeft"],c=r[a==="padding"?"paddingTop":"marginTop"],f=r[a==="padding"?"paddingRight":"marginRight"];return[ds(u),ds(c),ds(f)]},_S=function(a){if(a===void 0&&(a="margin"),typeof window>"u")return SS;var r=wS(a),u=document.documentElement.clientWidth,c=window.innerWidth;return{left:r[0],top:r[1],right:r[2],gap:Math.max(0,c-u+r[2]-r[0])}},ES=Og(),Ca="data-scroll-locked",AS=function(a,r,u,c){var f=a.left,d=a.top,m=a.right,g=a.gap;return u===void 0&&(u="margin"),`
-  .`.concat(rS,` {
-   overflow: hidden `).concat(c,`;
-   padding-right: `).concat(g,"px ").concat(c,`;
-  }
-  body[`).concat(Ca,`] {
-    overflow: hidden `).concat(c,`;
-    overscroll-behavior: contain;
-    `).concat([r&&"position: relative ".concat(c,";"),u==="margin"&&`
-    padding-left: `.concat(f,`px;
-    padding-top: `).concat(d,`px;
-    padding-right: `).concat(m,`px;
-    margin-left:0;
-    margin-top:0;
-    margin-right: `).concat(g,"px ").concat(c,`;
-    `),u==="padding"&&"padding-right: ".concat(g,"px ").concat(c,";")].filter(Boolean).join(""),`
-  }
-  
-  .`).concat(yo,` {
-    right: `).concat(g,"px ").concat(c,`;
-  }
-  
-  .`).concat(bo,` {
-    margin-right: `).concat(g,"px ").concat(c,`;
-  }
-  
-  .`).concat(yo," .").concat(yo,` {
-    right: 0 `).concat(c,`;
-  }
-  
-  .`).concat(bo," .").concat(bo,` {
-    margin-right: 0 `).concat(c,`;
-  }
-  
-  body[`).concat(Ca,`] {
-    `).concat(oS,": ").concat(g,`px;
-  }
-`)},bv=function(){var a=parseInt(document.body.getAttribute(Ca)||"0",10);return isFinite(a)?a:0},TS=function(){S.useEffect(function(){return document.body.setAttribute(Ca,(bv()+1).toString()),function(){var a=bv()-1;a<=0?document.body.removeAttribute(Ca):document.body.setAttribute(Ca,a.toString())}},[])},jS=function(a){var r=a.noRelative,u=a.noImportant,c=a.gapMode,f=c===void 0?"margin":c;TS();var d=S.useMemo(function(){return _S(f)},[f]);return S.createElement(ES,{styles:AS(d,!r,f,u?"":"!important")})},Es=!1;if(typeof window<"u")try{var ho=Object.defineProperty({},"passive",{get:function(){return Es=!0,!0}});window.addEventListener("test",ho,ho),window.removeEventListener("test",ho,ho)}catch{Es=!1}var Aa=Es?{passive:!1}:!1,NS=function(a){return a.tagName==="TEXTAREA"},Mg=function(a,r){if(!(a instanceof Element))return!1;var u=window.getComputedStyle(a);return u[r]!=="hidden"&&!(u.overflowY===u.overflowX&&!NS(a)&&u[r]==="visible")},CS=function(a){return Mg(a,"overflowY")},RS=function(a){return Mg(a,"overflowX")},xv=function(a,r){var u=r.ownerDocument,c=r;do{typeof ShadowRoot<"u"&&c instanceof ShadowRoot&&(c=c.host);var f=Dg(a,c);if(f){var d=zg(a,c),m=d[1],g=d[2];if(m>g)return!0}c=c.parentNode}while(c&&c!==u.body);return!1},OS=function(a){var r=a.scrollTop,u=a.scrollHeight,c=a.clientHeight;return[r,u,c]},MS=function(a){var r=a.scrollLeft,u=a.scrollWidth,c=a.clientWidth;return[r,u,c]},Dg=function(a,r){return a==="v"?CS(r):RS(r)},zg=function(a,r){return a==="v"?OS(r):MS(r)},DS=function(a,r){return a==="h"&&r==="rtl"?-1:1},zS=function(a,r,u,c,f){var d=DS(a,window.getComputedStyle(r).direction),m=d*c,g=u.target,y=r.contains(g),v=!1,b=m>0,_=0,A=0;do{var C=zg(a,g),w=C[0],x=C[1],N=C[2],z=x-N-d*w;(w||z)&&Dg(a,g)&&(_+=z,A+=w),g instanceof ShadowRoot?g=g.host:g=g.parentNode}while(!y&&g!==document.body||y&&(r.contains(g)||r===g));return(b&&Math.abs(_)<1||!b&&Math.abs(A)<1)&&(v=!0),v},mo=function(a){return"changedTouches"in a?[a.changedTouches[0].clientX,a.changedTouches[0].clientY]:[0,0]},Sv=function(a){return[a.deltaX,a.deltaY]},wv=function(a){return a&&"current"in a?a.current:a},kS=function(a,r){return a[0]===r[0]&&a[1]===r[1]},US=function(a){return`
-  .block-interactivity-`.concat(a,` {pointer-events: none;}
-  .allow-interactivity-`).concat(a,` {pointer-events: all;}
-`)},BS=0,Ta=[];function HS(a){var r=S.useRef([]),u=S.useRef([0,0]),c=S.useRef(),f=S.useState(BS++)[0],d=S.useState(Og)[0],m=S.useRef(a);S.useEffect(function(){m.current=a},[a]),S.useEffect(function(){if(a.inert){document.body.classList.add("block-interactivity-".concat(f));var x=iS([a.lockRef.current],(a.shards||[]).map(wv),!0).filter(Boolean);return x.forEach(function(N){return N.classList.add("allow-interactivity-".concat(f))}),function(){document.body.classList.remove("block-interactivity-".concat(f)),x.forEach(function(N){return N.classList.remove("allow-interactivity-".concat(f))})}}},[a.inert,a.lockRef.current,a.shards]);var g=S.useCallback(function(x,N){if("touches"in x&&x.touches.length===2||x.type==="wheel"&&x.ctrlKey)return!m.current.allowPinchZoom;var z=mo(x),U=u.current,B="deltaX"in x?x.deltaX:U[0]-z[0],X="deltaY"in x?x.deltaY:U[1]-z[1],G,W=x.target,J=Math.abs(B)>Math.abs(X)?"h":"v";if("touches"in x&&J==="h"&&W.type==="range")return!1;var Q=xv(J,W);if(!Q)return!0;if(Q?G=J:(G=J==="v"?"h":"v",Q=xv(J,W)),!Q)return!1;if(!c.current&&"changedTouches"in x&&(B||X)&&(c.current=G),!G)return!0;var ce=c.current||G;return zS(ce,N,x,ce==="h"?B:X)},[]),y=S.useCallback(function(x){var N=x;if(!(!Ta.length||Ta[Ta.length-1]!==d)){var z="deltaY"in N?Sv(N):mo(N),U=r.current.filter(function(G){return G.name===N.type&&(G.target===N.target||N.target===G.shadowParent)&&kS(G.delta,z)})[0];if(U&&U.should){N.cancelable&&N.preventDefault();return}if(!U){var B=(m.current.shards||[]).map(wv).filter(Boolean).filter(function(G){return G.contains(N.target)}),X=B.length>0?g(N,B[0]):!m.current.noIsolation;X&&N.cancelable&&N.preventDefault()}}},[]),v=S.useCallback(function(x,N,z,U){var B={name:x,delta:N,target:z,should:U,shadowParent:LS(z)};r.current.push(B),setTimeout(function(){r.current=r.current.filter(function(X){return X!==B})},1)},[]),b=S.useCallback(function(x){u.current=mo(x),c.current=void 0},[]),_=S.useCallback(function(x){v(x.type,Sv(x),x.target,g(x,a.lockRef.current))},[]),A=S.useCallback(function(x){v(x.type,mo(x),x.target,g(x,a.lockRef.current))},[]);S.useEffect(function(){return Ta.push(d),a.setCallbacks({onScrollCapture:_,onWheelCapture:_,onTouchMoveCapture:A}),document.addEventListener("wheel",y,Aa),document.addEventListener("touchmove",y,Aa),document.addEventListener("touchstart",b,Aa),function(){Ta=Ta.filter(function(x){return x!==d}),document.removeEventListener("wheel",y,Aa),document.removeEventListener("touchmove",y,Aa),document.removeEventListener("touchstart",b,Aa)}},[]);var C=a.removeScrollBar,w=a.inert;return S.createElement(S.Fragment,null,w?S.createElement(d,{styles:US(f)}):null,C?S.createElement(jS,{gapMode:a.gapMode}):null)}function LS(a){for(var r=null;a!==null;)a instanceof ShadowRoot&&(r=a.host,a=a.host),a=a.parentNode;return r}const qS=mS(Rg,HS);var qs=S.forwardRef(function(a,r){return S.createElement(Ro,un({},a,{ref:r,sideCar:qS}))});qs.classNames=Ro.classNames;var GS=function(a){if(typeof document>"u")return null;var r=Array.isArray(a)?a[0]:a;return r.ownerDocument.body},ja=new WeakMap,vo=new WeakMap,go={},hs=0,kg=function(a){return a&&(a.host||kg(a.parentNode))},VS=function(a,r){return r.map(function(u){if(a.contains(u))return u;var c=kg(u);return c&&a.contains(c)?c:(console.error("aria-hidden",u,"in not contained inside",a,". Doing nothing"),null)}).filter(function(u){return!!u})},YS=function(a,r,u,c){var f=VS(r,Array.isArray(a)?a:[a]);go[u]||(go[u]=new WeakMap);var d=go[u],m=[],g=new Set,y=new Set(f),v=function(_){!_||g.has(_)||(g.add(_),v(_.parentNode))};f.forEach(v);var b=function(_){!_||y.has(_)||Array.prototype.forEach.call(_.children,function(A){if(g.has(A))b(A);else try{var C=A.getAttribute(c),w=C!==null&&C!=="false",x=(ja.get(A)||0)+1,N=(d.get(A)||0)+1;ja.set(A,x),d.set(A,N),m.push(A),x===1&&w&&vo.set(A,!0),N===1&&A.setAttribute(u,"true"),w||A.setAttribute(c,"true")}catch(z){console.error("aria-hidden: cannot operate on ",A,z)}})};return b(r),g.clear(),hs++,function(){m.forEach(function(_){var A=ja.get(_)-1,C=d.get(_)-1;ja.set(_,A),d.set(_,C),A||(vo.has(_)||_.removeAttribute(c),vo.delete(_)),C||_.removeAttribute(u)}),hs--,hs||(ja=new WeakMap,ja=new WeakMap,vo=new WeakMap,go={})}},Ug=function(a,r,u){u===void 0&&(u="data-aria-hidden");var c=Array.from(Array.isArray(a)?a:[a]),f=GS(a);return f?(c.push.apply(c,Array.from(f.querySelectorAll("[aria-live]"))),YS(c,f,u,"aria-hidden")):function(){return null}},Oo="Dialog",[Bg,x_]=Hl(Oo),[XS,tn]=Bg(Oo),Hg=a=>{const{__scopeDialog:r,children:u,open:c,defaultOpen:f,onOpenChange:d,modal:m=!0}=a,g=S.useRef(null),y=S.useRef(null),[v,b]=Ma({prop:c,defaultProp:f??!1,onChange:d,caller:Oo});return s.jsx(XS,{scope:r,triggerRef:g,contentRef:y,contentId:il(),titleId:il(),descriptionId:il(),open:v,onOpenChange:b,onOpenToggle:S.useCallback(()=>b(_=>!_),[b]),modal:m,children:u})};Hg.displayName=Oo;var Lg="DialogTrigger",qg=S.forwardRef((a,r)=>{const{__scopeDialog:u,...c}=a,f=tn(Lg,u),d=Ye(r,f.triggerRef);return s.jsx(Te.button,{type:"button","aria-haspopup":"dialog","aria-expanded":f.open,"aria-controls":f.contentId,"data-state":Ys(f.open),...c,ref:d,onClick:je(a.onClick,f.onOpenToggle)})});qg.displayName=Lg;var Gs="DialogPortal",[KS,Gg]=Bg(Gs,{forceMount:void 0}),Vg=a=>{const{__scopeDialog:r,forceMount:u,children:c,container:f}=a,d=tn(Gs,r);return s.jsx(KS,{scope:r,forceMount:u,children:S.Children.map(c,m=>s.jsx(Ua,{present:u||d.open,children:s.jsx(Ls,{asChild:!0,container:f,children:m})}))})};Vg.displayName=Gs;var wo="DialogOverlay",Yg=S.forwardRef((a,r)=>{const u=Gg(wo,a.__scopeDialog),{forceMount:c=u.forceMount,...f}=a,d=tn(wo,a.__scopeDialog);return d.modal?s.jsx(Ua,{present:c||d.open,children:s.jsx(ZS,{...f,ref:r})}):null});Yg.displayName=wo;var QS=Oa("DialogOverlay.RemoveScroll"),ZS=S.forwardRef((a,r)=>{const{__scopeDialog:u,...c}=a,f=tn(wo,u);return s.jsx(qs,{as:QS,allowPinchZoom:!0,shards:[f.contentRef],children:s.jsx(Te.div,{"data-state":Ys(f.open),...c,ref:r,style:{pointerEvents:"auto",...c.style}})})}),zl="DialogContent",Xg=S.forwardRef((a,r)=>{const u=Gg(zl,a.__scopeDialog),{forceMount:c=u.forceMount,...f}=a,d=tn(zl,a.__scopeDialog);return s.jsx(Ua,{present:c||d.open,children:d.modal?s.jsx(FS,{...f,ref:r}):s.jsx(JS,{...f,ref:r})})});Xg.displayName=zl;var FS=S.forwardRef((a,r)=>{const u=tn(zl,a.__scopeDialog),c=S.useRef(null),f=Ye(r,u.contentRef,c);return S.useEffect(()=>{const d=c.current;if(d)return Ug(d)},[]),s.jsx(Kg,{...a,ref:f,trapFocus:u.open,disableOutsidePointerEvents:!0,onCloseAutoFocus:je(a.onCloseAutoFocus,d=>{var m;d.preventDefault(),(m=u.triggerRef.current)==null||m.focus()}),onPointerDownOutside:je(a.onPointerDownOutside,d=>{const m=d.detail.originalEvent,g=m.button===0&&m.ctrlKey===!0;(m.button===2||g)&&d.preventDefault()}),onFocusOutside:je(a.onFocusOutside,d=>d.preventDefault())})}),JS=S.forwardRef((a,r)=>{const u=tn(zl,a.__scopeDialog),c=S.useRef(!1),f=S.useRef(!1);return s.jsx(Kg,{...a,ref:r,trapFocus:!1,disableOutsidePointerEvents:!1,onCloseAutoFocus:d=>{var m,g;(m=a.onCloseAutoFocus)==null||m.call(a,d),d.defaultPrevented||(c.current||(g=u.triggerRef.current)==null||g.focus(),d.preventDefault()),c.current=!1,f.current=!1},onInteractOutside:d=>{var y,v;(y=a.onInteractOutside)==null||y.call(a,d),d.defaultPrevented||(c.current=!0,d.detail.originalEvent.type==="pointerdown"&&(f.current=!0));const m=d.target;((v=u.triggerRef.current)==null?void 0:v.contains(m))&&d.preventDefault(),d.detail.originalEvent.type==="focusin"&&f.current&&d.preventDefault()}})}),Kg=S.forwardRef((a,r)=>{const{__scopeDialog:u,trapFocus:c,onOpenAutoFocus:f,onCloseAutoFocus:d,...m}=a,g=tn(zl,u),y=S.useRef(null),v=Ye(r,y);return jg(),s.jsxs(s.Fragment,{children:[s.jsx(Hs,{asChild:!0,loop:!0,trapped:c,onMountAutoFocus:f,onUnmountAutoFocus:d,children:s.jsx(Bs,{role:"dialog",id:g.contentId,"aria-describedby":g.descriptionId,"aria-labelledby":g.titleId,"data-state":Ys(g.open),...m,ref:v,onDismiss:()=>g.onOpenChange(!1)})}),s.jsxs(s.Fragment,{children:[s.jsx(PS,{titleId:g.titleId}),s.jsx(WS,{contentRef:y,descriptionId:g.descriptionId})]})]})}),Vs="DialogTitle",Qg=S.forwardRef((a,r)=>{const{__scopeDialog:u,...c}=a,f=tn(Vs,u);return s.jsx(Te.h2,{id:f.titleId,...c,ref:r})});Qg.displayName=Vs;var Zg="DialogDescription",Fg=S.forwardRef((a,r)=>{const{__scopeDialog:u,...c}=a,f=tn(Zg,u);return s.jsx(Te.p,{id:f.descriptionId,...c,ref:r})});Fg.displayName=Zg;var Jg="DialogClose",Pg=S.forwardRef((a,r)=>{const{__scopeDialog:u,...c}=a,f=tn(Jg,u);return s.jsx(Te.button,{type:"button",...c,ref:r,onClick:je(a.onClick,()=>f.onOpenChange(!1))})});Pg.displayName=Jg;function Ys(a){return a?"open":"closed"}var $g="DialogTitleWarning",[S_,Wg]=Cx($g,{contentName:zl,titleName:Vs,docsSlug:"dialog"}),PS=({titleId:a})=>{const r=Wg($g),u=`\`${r.contentName}\` requires a \`${r.titleName}\` for the component to be accessible for screen reader users.
-
-If you want to hide the \`${r.titleName}\`, you can wrap it with our VisuallyHidden component.
-
-For more information, see https://radix-ui.com/primitives/docs/components/${r.docsSlug}`;return S.useEffect(()=>{a&&(document.getElementById(a)||console.error(u))},[u,a]),null},$S="DialogDescriptionWarning",WS=({contentRef:a,descriptionId:r})=>{const c=`Warning: Missing \`Description\` or \`aria-describedby={undefined}\` for {${Wg($S).contentName}}.`;return S.useEffect(()=>{var d;const f=(d=a.current)==null?void 0:d.getAttribute("aria-describedby");r&&f&&(document.getElementById(r)||console.warn(c))},[c,a,r]),null},IS=Hg,e2=qg,t2=Vg,n2=Yg,l2=Xg,a2=Qg,i2=Fg,r2=Pg;function Ig({...a}){return s.jsx(IS,{"data-slot":"dialog",...a})}function o2({...a}){return s.jsx(e2,{"data-slot":"dialog-trigger",...a})}function c2({...a}){return s.jsx(t2,{"data-slot":"dialog-portal",...a})}function u2({className:a,...r}){return s.jsx(n2,{"data-slot":"dialog-overlay",className:Oe("data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 fixed inset-0 z-50 bg-black/50",a),...r})}function ep({className:a,children:r,...u}){return s.jsxs(c2,{"data-slot":"dialog-portal",children:[s.jsx(u2,{}),s.jsxs(l2,{"data-slot":"dialog-content",className:Oe("bg-background data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 fixed top-[50%] left-[50%] z-50 grid w-full max-w-[calc(100%-2rem)] translate-x-[-50%] translate-y-[-50%] gap-4 rounded-lg border p-6 shadow-lg duration-200 sm:max-w-lg",a),...u,children:[r,s.jsxs(r2,{className:"ring-offset-background focus:ring-ring data-[state=open]:bg-accent data-[state=open]:text-muted-foreground absolute top-4 right-4 rounded-xs opacity-70 transition-opacity hover:opacity-100 focus:ring-2 focus:ring-offset-2 focus:outline-hidden disabled:pointer-events-none [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4",children:[s.jsx(L1,{}),s.jsx("span",{className:"sr-only",children:"Close"})]})]})]})}function tp({className:a,...r}){return s.jsx("div",{"data-slot":"dialog-header",className:Oe("flex flex-col gap-2 text-center sm:text-left",a),...r})}function s2({className:a,...r}){return s.jsx("div",{"data-slot":"dialog-footer",className:Oe("flex flex-col-reverse gap-2 sm:flex-row sm:justify-end",a),...r})}function np({className:a,...r}){return s.jsx(a2,{"data-slot":"dialog-title",className:Oe("text-lg leading-none font-semibold",a),...r})}function lp({className:a,...r}){return s.jsx(i2,{"data-slot":"dialog-description",className:Oe("text-muted-foreground text-sm",a),...r})}function ap({className:a,...r}){return s.jsx("div",{"data-slot":"table-container",className:"relative w-full overflow-x-auto",children:s.jsx("table",{"data-slot":"table",className:Oe("w-full caption-bottom text-sm",a),...r})})}function ip({className:a,...r}){return s.jsx("thead",{"data-slot":"table-header",className:Oe("[&_tr]:border-b",a),...r})}function rp({className:a,...r}){return s.jsx("tbody",{"data-slot":"table-body",className:Oe("[&_tr:last-child]:border-0",a),...r})}function _o({className:a,...r}){return s.jsx("tr",{"data-slot":"table-row",className:Oe("hover:bg-muted/50 data-[state=selected]:bg-muted border-b transition-colors",a),...r})}function Ut({className:a,...r}){return s.jsx("th",{"data-slot":"table-head",className:Oe("text-foreground h-10 px-2 text-left align-middle font-medium whitespace-nowrap [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",a),...r})}function Bt({className:a,...r}){return s.jsx("td",{"data-slot":"table-cell",className:Oe("p-2 align-middle whitespace-nowrap [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",a),...r})}const f2=Xv("inline-flex items-center justify-center rounded-md border px-2 py-0.5 text-xs font-medium w-fit whitespace-nowrap shrink-0 [&>svg]:size-3 gap-1 [&>svg]:pointer-events-none focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive transition-[color,box-shadow] overflow-hidden",{variants:{variant:{default:"border-transparent bg-primary text-primary-foreground [a&]:hover:bg-primary/90",secondary:"border-transparent bg-secondary text-secondary-foreground [a&]:hover:bg-secondary/90",destructive:"border-transparent bg-destructive text-white [a&]:hover:bg-destructive/90 focus-visible:ring-destructive/20 dark:focus-visible:ring-destructive/40 dark:bg-destructive/60",outline:"text-foreground [a&]:hover:bg-accent [a&]:hover:text-accent-foreground"}},defaultVariants:{variant:"default"}});function qi({className:a,variant:r,asChild:u=!1,...c}){const f=u?Gv:"span";return s.jsx(f,{"data-slot":"badge",className:Oe(f2({variant:r}),a),...c})}const d2=({customers:a,onAddCustomer:r,onUpdateCustomer:u,onDeleteCustomer:c})=>{const[f,d]=S.useState(!1),[m,g]=S.useState(null),[y,v]=S.useState({company_name:"",contact_person:"",street:"",postal_code:"",city:"",phone:"",email:"",notes:""}),b=()=>{v({company_name:"",contact_person:"",street:"",postal_code:"",city:"",phone:"",email:"",notes:""}),g(null)},_=x=>{x.preventDefault(),m?u(m.id,y):r(y),b(),d(!1)},A=x=>{g(x),v({company_name:x.company_name||"",contact_person:x.contact_person||"",street:x.street||"",postal_code:x.postal_code||"",city:x.city||"",phone:x.phone||"",email:x.email||"",notes:x.notes||""}),d(!0)},C=x=>{window.confirm(`Möchten Sie den Kunden "${x.company_name}" wirklich löschen?`)&&c(x.id)},w=(x,N)=>{v(z=>({...z,[x]:N}))};return s.jsxs("div",{className:"space-y-6",children:[s.jsxs("div",{className:"flex justify-between items-center",children:[s.jsxs("div",{children:[s.jsx("h2",{className:"text-3xl font-bold tracking-tight",children:"Kundenverwaltung"}),s.jsx("p",{className:"text-muted-foreground",children:"Verwalten Sie Ihre Kunden und deren Informationen"})]}),s.jsxs(Ig,{open:f,onOpenChange:d,children:[s.jsx(o2,{asChild:!0,children:s.jsxs(mt,{onClick:b,className:"flex items-center gap-2",children:[s.jsx(So,{className:"h-4 w-4"}),"Neuer Kunde"]})}),s.jsxs(ep,{className:"sm:max-w-[600px]",children:[s.jsxs(tp,{children:[s.jsx(np,{children:m?"Kunde bearbeiten":"Neuer Kunde"}),s.jsx(lp,{children:m?"Bearbeiten Sie die Kundendaten.":"Fügen Sie einen neuen Kunden hinzu."})]}),s.jsxs("form",{onSubmit:_,className:"space-y-4",children:[s.jsxs("div",{className:"grid grid-cols-2 gap-4",children:[s.jsxs("div",{className:"col-span-2",children:[s.jsx(Ce,{htmlFor:"company_name",children:"Firmenname *"}),s.jsx(Ge,{id:"company_name",value:y.company_name,onChange:x=>w("company_name",x.target.value),placeholder:"z.B. IGM GmbH & Co. KG",required:!0})]}),s.jsxs("div",{className:"col-span-2",children:[s.jsx(Ce,{htmlFor:"contact_person",children:"Ansprechpartner"}),s.jsx(Ge,{id:"contact_person",value:y.contact_person,onChange:x=>w("contact_person",x.target.value),placeholder:"z.B. Marius Veith"})]}),s.jsxs("div",{className:"col-span-2",children:[s.jsx(Ce,{htmlFor:"street",children:"Straße"}),s.jsx(Ge,{id:"street",value:y.street,onChange:x=>w("street",x.target.value),placeholder:"z.B. Hinter Inghell"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"postal_code",children:"PLZ"}),s.jsx(Ge,{id:"postal_code",value:y.postal_code,onChange:x=>w("postal_code",x.target.value),placeholder:"z.B. 67744"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"city",children:"Ort"}),s.jsx(Ge,{id:"city",value:y.city,onChange:x=>w("city",x.target.value),placeholder:"z.B. Medard"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"phone",children:"Telefon"}),s.jsx(Ge,{id:"phone",value:y.phone,onChange:x=>w("phone",x.target.value),placeholder:"z.B. 0173 / 135 90 00"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"email",children:"E-Mail"}),s.jsx(Ge,{id:"email",type:"email",value:y.email,onChange:x=>w("email",x.target.value),placeholder:"z.B. info@kunde.de"})]}),s.jsxs("div",{className:"col-span-2",children:[s.jsx(Ce,{htmlFor:"notes",children:"Notizen"}),s.jsx(V1,{id:"notes",value:y.notes,onChange:x=>w("notes",x.target.value),placeholder:"Zusätzliche Informationen...",rows:3})]}),s.jsxs("div",{className:"col-span-2",children:[s.jsx(Ce,{htmlFor:"logo",children:"Firmenlogo"}),s.jsxs("div",{className:"mt-2 flex items-center gap-4",children:[s.jsxs(mt,{type:"button",variant:"outline",className:"flex items-center gap-2",children:[s.jsx(k1,{className:"h-4 w-4"}),"Logo hochladen"]}),s.jsx("span",{className:"text-sm text-muted-foreground",children:"PNG, JPG oder SVG (max. 5MB)"})]})]})]}),s.jsxs(s2,{children:[s.jsx(mt,{type:"button",variant:"outline",onClick:()=>d(!1),children:"Abbrechen"}),s.jsx(mt,{type:"submit",children:m?"Speichern":"Hinzufügen"})]})]})]})]})]}),s.jsxs(Mt,{children:[s.jsxs(Dt,{children:[s.jsxs(zt,{children:["Kunden (",a.length,")"]}),s.jsx(cn,{children:"Übersicht aller registrierten Kunden"})]}),s.jsx(kt,{children:a.length===0?s.jsxs("div",{className:"text-center py-8",children:[s.jsx(Ss,{className:"h-12 w-12 text-muted-foreground mx-auto mb-4"}),s.jsx("h3",{className:"text-lg font-semibold mb-2",children:"Keine Kunden vorhanden"}),s.jsx("p",{className:"text-muted-foreground mb-4",children:"Fügen Sie Ihren ersten Kunden hinzu, um zu beginnen."}),s.jsxs(mt,{onClick:()=>d(!0),children:[s.jsx(So,{className:"h-4 w-4 mr-2"}),"Ersten Kunden hinzufügen"]})]}):s.jsxs(ap,{children:[s.jsx(ip,{children:s.jsxs(_o,{children:[s.jsx(Ut,{children:"Firma"}),s.jsx(Ut,{children:"Ansprechpartner"}),s.jsx(Ut,{children:"Ort"}),s.jsx(Ut,{children:"Kontakt"}),s.jsx(Ut,{children:"Erstellt"}),s.jsx(Ut,{className:"text-right",children:"Aktionen"})]})}),s.jsx(rp,{children:a.map(x=>s.jsxs(_o,{children:[s.jsx(Bt,{className:"font-medium",children:s.jsxs("div",{className:"flex items-center gap-2",children:[s.jsx(Ss,{className:"h-4 w-4 text-muted-foreground"}),x.company_name]})}),s.jsx(Bt,{children:x.contact_person&&s.jsxs("div",{className:"flex items-center gap-2",children:[s.jsx(wg,{className:"h-4 w-4 text-muted-foreground"}),x.contact_person]})}),s.jsx(Bt,{children:(x.postal_code||x.city)&&s.jsxs("div",{className:"flex items-center gap-2",children:[s.jsx(A1,{className:"h-4 w-4 text-muted-foreground"}),x.postal_code," ",x.city]})}),s.jsx(Bt,{children:s.jsxs("div",{className:"space-y-1",children:[x.phone&&s.jsx("div",{className:"text-sm",children:x.phone}),x.email&&s.jsx("div",{className:"text-sm text-muted-foreground",children:x.email})]})}),s.jsx(Bt,{children:s.jsx(qi,{variant:"secondary",children:new Date(x.created_at).toLocaleDateString("de-DE")})}),s.jsx(Bt,{className:"text-right",children:s.jsxs("div",{className:"flex items-center justify-end gap-2",children:[s.jsx(mt,{variant:"outline",size:"sm",onClick:()=>A(x),children:s.jsx(M1,{className:"h-4 w-4"})}),s.jsx(mt,{variant:"outline",size:"sm",onClick:()=>C(x),className:"text-destructive hover:text-destructive",children:s.jsx(Sg,{className:"h-4 w-4"})})]})})]},x.id))})]})})]})]})};function _v(a,[r,u]){return Math.min(u,Math.max(r,a))}const h2=["top","right","bottom","left"],cl=Math.min,Ht=Math.max,Eo=Math.round,po=Math.floor,sn=a=>({x:a,y:a}),m2={left:"right",right:"left",bottom:"top",top:"bottom"},v2={start:"end",end:"start"};function As(a,r,u){return Ht(a,cl(r,u))}function Rn(a,r){return typeof a=="function"?a(r):a}function On(a){return a.split("-")[0]}function Ba(a){return a.split("-")[1]}function Xs(a){return a==="x"?"y":"x"}function Ks(a){return a==="y"?"height":"width"}function Cn(a){return["top","bottom"].includes(On(a))?"y":"x"}function Qs(a){return Xs(Cn(a))}function g2(a,r,u){u===void 0&&(u=!1);const c=Ba(a),f=Qs(a),d=Ks(f);let m=f==="x"?c===(u?"end":"start")?"right":"left":c==="start"?"bottom":"top";return r.reference[d]>r.floating[d]&&(m=Ao(m)),[m,Ao(m)]}function p2(a){const r=Ao(a);return[Ts(a),r,Ts(r)]}function Ts(a){return a.replace(/start|end/g,r=>v2[r])}function y2(a,r,u){const c=["left","right"],f=["right","left"],d=["top","bottom"],m=["bottom","top"];switch(a){case"top":case"bottom":return u?r?f:c:r?c:f;case"left":case"right":return r?d:m;default:return[]}}function b2(a,r,u,c){const f=Ba(a);let d=y2(On(a),u==="start",c);return f&&(d=d.map(m=>m+"-"+f),r&&(d=d.concat(d.map(Ts)))),d}function Ao(a){return a.replace(/left|right|bottom|top/g,r=>m2[r])}function x2(a){return{top:0,right:0,bottom:0,left:0,...a}}function op(a){return typeof a!="number"?x2(a):{top:a,right:a,bottom:a,left:a}}function To(a){const{x:r,y:u,width:c,height:f}=a;return{width:c,height:f,top:u,left:r,right:r+c,bottom:u+f,x:r,y:u}}function Ev(a,r,u){let{reference:c,floating:f}=a;const d=Cn(r),m=Qs(r),g=Ks(m),y=On(r),v=d==="y",b=c.x+c.width/2-f.width/2,_=c.y+c.height/2-f.height/2,A=c[g]/2-f[g]/2;let C;switch(y){case"top":C={x:b,y:c.y-f.height};break;case"bottom":C={x:b,y:c.y+c.height};break;case"right":C={x:c.x+c.width,y:_};break;case"left":C={x:c.x-f.width,y:_};break;default:C={x:c.x,y:c.y}}switch(Ba(r)){case"start":C[m]-=A*(u&&v?-1:1);break;case"end":C[m]+=A*(u&&v?-1:1);break}return C}const S2=async(a,r,u)=>{const{placement:c="bottom",strategy:f="absolute",middleware:d=[],platform:m}=u,g=d.filter(Boolean),y=await(m.isRTL==null?void 0:m.isRTL(r));let v=await m.getElementRects({reference:a,floating:r,strategy:f}),{x:b,y:_}=Ev(v,c,y),A=c,C={},w=0;for(let x=0;x<g.length;x++){const{name:N,fn:z}=g[x],{x:U,y:B,data:X,reset:G}=await z({x:b,y:_,initialPlacement:c,placement:A,strategy:f,middlewareData:C,rects:v,platform:m,elements:{reference:a,floating:r}});b=U??b,_=B??_,C={...C,[N]:{...C[N],...X}},G&&w<=50&&(w++,typeof G=="object"&&(G.placement&&(A=G.placement),G.rects&&(v=G.rects===!0?await m.getElementRects({reference:a,floating:r,strategy:f}):G.rects),{x:b,y:_}=Ev(v,A,y)),x=-1)}return{x:b,y:_,placement:A,strategy:f,middlewareData:C}};async function Vi(a,r){var u;r===void 0&&(r={});const{x:c,y:f,platform:d,rects:m,elements:g,strategy:y}=a,{boundary:v="clippingAncestors",rootBoundary:b="viewport",elementContext:_="floating",altBoundary:A=!1,padding:C=0}=Rn(r,a),w=op(C),N=g[A?_==="floating"?"reference":"floating":_],z=To(await d.getClippingRect({element:(u=await(d.isElement==null?void 0:d.isElement(N)))==null||u?N:N.contextElement||await(d.getDocumentElement==null?void 0:d.getDocumentElement(g.floating)),boundary:v,rootBoundary:b,strategy:y})),U=_==="floating"?{x:c,y:f,width:m.floating.width,height:m.floating.height}:m.reference,B=await(d.getOffsetParent==null?void 0:d.getOffsetParent(g.floating)),X=await(d.isElement==null?void 0:d.isElement(B))?await(d.getScale==null?void 0:d.getScale(B))||{x:1,y:1}:{x:1,y:1},G=To(d.convertOffsetParentRelativeRectToViewportRelativeRect?await d.convertOffsetParentRelativeRectToViewportRelativeRect({elements:g,rect:U,offsetParent:B,strategy:y}):U);return{top:(z.top-G.top+w.top)/X.y,bottom:(G.bottom-z.bottom+w.bottom)/X.y,left:(z.left-G.left+w.left)/X.x,right:(G.right-z.right+w.right)/X.x}}const w2=a=>({name:"arrow",options:a,async fn(r){const{x:u,y:c,placement:f,rects:d,platform:m,elements:g,middlewareData:y}=r,{element:v,padding:b=0}=Rn(a,r)||{};if(v==null)return{};const _=op(b),A={x:u,y:c},C=Qs(f),w=Ks(C),x=await m.getDimensions(v),N=C==="y",z=N?"top":"left",U=N?"bottom":"right",B=N?"clientHeight":"clientWidth",X=d.reference[w]+d.reference[C]-A[C]-d.floating[w],G=A[C]-d.reference[C],W=await(m.getOffsetParent==null?void 0:m.getOffsetParent(v));let J=W?W[B]:0;(!J||!await(m.isElement==null?void 0:m.isElement(W)))&&(J=g.floating[B]||d.floating[w]);const Q=X/2-G/2,ce=J/2-x[w]/2-1,me=cl(_[z],ce),ve=cl(_[U],ce),fe=me,ge=J-x[w]-ve,ye=J/2-x[w]/2+Q,re=As(fe,ye,ge),O=!y.arrow&&Ba(f)!=null&&ye!==re&&d.reference[w]/2-(ye<fe?me:ve)-x[w]/2<0,Z=O?ye<fe?ye-fe:ye-ge:0;return{[C]:A[C]+Z,data:{[C]:re,centerOffset:ye-re-Z,...O&&{alignmentOffset:Z}},reset:O}}}),_2=function(a){return a===void 0&&(a={}),{name:"flip",options:a,async fn(r){var u,c;const{placement:f,middlewareData:d,rects:m,initialPlacement:g,platform:y,elements:v}=r,{mainAxis:b=!0,crossAxis:_=!0,fallbackPlacements:A,fallbackStrategy:C="bestFit",fallbackAxisSideDirection:w="none",flipAlignment:x=!0,...N}=Rn(a,r);if((u=d.arrow)!=null&&u.alignmentOffset)return{};const z=On(f),U=Cn(g),B=On(g)===g,X=await(y.isRTL==null?void 0:y.isRTL(v.floating)),G=A||(B||!x?[Ao(g)]:p2(g)),W=w!=="none";!A&&W&&G.push(...b2(g,x,w,X));const J=[g,...G],Q=await Vi(r,N),ce=[];let me=((c=d.flip)==null?void 0:c.overflows)||[];if(b&&ce.push(Q[z]),_){const re=g2(f,m,X);ce.push(Q[re[0]],Q[re[1]])}if(me=[...me,{placement:f,overflows:ce}],!ce.every(re=>re<=0)){var ve,fe;const re=(((ve=d.flip)==null?void 0:ve.index)||0)+1,O=J[re];if(O){var ge;const L=_==="alignment"?U!==Cn(O):!1,le=((ge=me[0])==null?void 0:ge.overflows[0])>0;if(!L||le)return{data:{index:re,overflows:me},reset:{placement:O}}}let Z=(fe=me.filter(L=>L.overflows[0]<=0).sort((L,le)=>L.overflows[1]-le.overflows[1])[0])==null?void 0:fe.placement;if(!Z)switch(C){case"bestFit":{var ye;const L=(ye=me.filter(le=>{if(W){const T=Cn(le.placement);return T===U||T==="y"}return!0}).map(le=>[le.placement,le.overflows.filter(T=>T>0).reduce((T,V)=>T+V,0)]).sort((le,T)=>le[1]-T[1])[0])==null?void 0:ye[0];L&&(Z=L);break}case"initialPlacement":Z=g;break}if(f!==Z)return{reset:{placement:Z}}}return{}}}};function Av(a,r){return{top:a.top-r.height,right:a.right-r.width,bottom:a.bottom-r.height,left:a.left-r.width}}function Tv(a){return h2.some(r=>a[r]>=0)}const E2=function(a){return a===void 0&&(a={}),{name:"hide",options:a,async fn(r){const{rects:u}=r,{strategy:c="referenceHidden",...f}=Rn(a,r);switch(c){case"referenceHidden":{const d=await Vi(r,{...f,elementContext:"reference"}),m=Av(d,u.reference);return{data:{referenceHiddenOffsets:m,referenceHidden:Tv(m)}}}case"escaped":{const d=await Vi(r,{...f,altBoundary:!0}),m=Av(d,u.floating);return{data:{escapedOffsets:m,escaped:Tv(m)}}}default:return{}}}}};async function A2(a,r){const{placement:u,platform:c,elements:f}=a,d=await(c.isRTL==null?void 0:c.isRTL(f.floating)),m=On(u),g=Ba(u),y=Cn(u)==="y",v=["left","top"].includes(m)?-1:1,b=d&&y?-1:1,_=Rn(r,a);let{mainAxis:A,crossAxis:C,alignmentAxis:w}=typeof _=="number"?{mainAxis:_,crossAxis:0,alignmentAxis:null}:{mainAxis:_.mainAxis||0,crossAxis:_.crossAxis||0,alignmentAxis:_.alignmentAxis};return g&&typeof w=="number"&&(C=g==="end"?w*-1:w),y?{x:C*b,y:A*v}:{x:A*v,y:C*b}}const T2=function(a){return a===void 0&&(a=0),{name:"offset",options:a,async fn(r){var u,c;const{x:f,y:d,placement:m,middlewareData:g}=r,y=await A2(r,a);return m===((u=g.offset)==null?void 0:u.placement)&&(c=g.arrow)!=null&&c.alignmentOffset?{}:{x:f+y.x,y:d+y.y,data:{...y,placement:m}}}}},j2=function(a){return a===void 0&&(a={}),{name:"shift",options:a,async fn(r){const{x:u,y:c,placement:f}=r,{mainAxis:d=!0,crossAxis:m=!1,limiter:g={fn:N=>{let{x:z,y:U}=N;return{x:z,y:U}}},...y}=Rn(a,r),v={x:u,y:c},b=await Vi(r,y),_=Cn(On(f)),A=Xs(_);let C=v[A],w=v[_];if(d){const N=A==="y"?"top":"left",z=A==="y"?"bottom":"right",U=C+b[N],B=C-b[z];C=As(U,C,B)}if(m){const N=_==="y"?"top":"left",z=_==="y"?"bottom":"right",U=w+b[N],B=w-b[z];w=As(U,w,B)}const x=g.fn({...r,[A]:C,[_]:w});return{...x,data:{x:x.x-u,y:x.y-c,enabled:{[A]:d,[_]:m}}}}}},N2=function(a){return a===void 0&&(a={}),{options:a,fn(r){const{x:u,y:c,placement:f,rects:d,middlewareData:m}=r,{offset:g=0,mainAxis:y=!0,crossAxis:v=!0}=Rn(a,r),b={x:u,y:c},_=Cn(f),A=Xs(_);let C=b[A],w=b[_];const x=Rn(g,r),N=typeof x=="number"?{mainAxis:x,crossAxis:0}:{mainAxis:0,crossAxis:0,...x};if(y){const B=A==="y"?"height":"width",X=d.reference[A]-d.floating[B]+N.mainAxis,G=d.reference[A]+d.reference[B]-N.mainAxis;C<X?C=X:C>G&&(C=G)}if(v){var z,U;const B=A==="y"?"width":"height",X=["top","left"].includes(On(f)),G=d.reference[_]-d.floating[B]+(X&&((z=m.offset)==null?void 0:z[_])||0)+(X?0:N.crossAxis),W=d.reference[_]+d.reference[B]+(X?0:((U=m.offset)==null?void 0:U[_])||0)-(X?N.crossAxis:0);w<G?w=G:w>W&&(w=W)}return{[A]:C,[_]:w}}}},C2=function(a){return a===void 0&&(a={}),{name:"size",options:a,async fn(r){var u,c;const{placement:f,rects:d,platform:m,elements:g}=r,{apply:y=()=>{},...v}=Rn(a,r),b=await Vi(r,v),_=On(f),A=Ba(f),C=Cn(f)==="y",{width:w,height:x}=d.floating;let N,z;_==="top"||_==="bottom"?(N=_,z=A===(await(m.isRTL==null?void 0:m.isRTL(g.floating))?"start":"end")?"left":"right"):(z=_,N=A==="end"?"top":"bottom");const U=x-b.top-b.bottom,B=w-b.left-b.right,X=cl(x-b[N],U),G=cl(w-b[z],B),W=!r.middlewareData.shift;let J=X,Q=G;if((u=r.middlewareData.shift)!=null&&u.enabled.x&&(Q=B),(c=r.middlewareData.shift)!=null&&c.enabled.y&&(J=U),W&&!A){const me=Ht(b.left,0),ve=Ht(b.right,0),fe=Ht(b.top,0),ge=Ht(b.bottom,0);C?Q=w-2*(me!==0||ve!==0?me+ve:Ht(b.left,b.right)):J=x-2*(fe!==0||ge!==0?fe+ge:Ht(b.top,b.bottom))}await y({...r,availableWidth:Q,availableHeight:J});const ce=await m.getDimensions(g.floating);return w!==ce.width||x!==ce.height?{reset:{rects:!0}}:{}}}};function Mo(){return typeof window<"u"}function Ha(a){return cp(a)?(a.nodeName||"").toLowerCase():"#document"}function Lt(a){var r;return(a==null||(r=a.ownerDocument)==null?void 0:r.defaultView)||window}function dn(a){var r;return(r=(cp(a)?a.ownerDocument:a.document)||window.document)==null?void 0:r.documentElement}function cp(a){return Mo()?a instanceof Node||a instanceof Lt(a).Node:!1}function It(a){return Mo()?a instanceof Element||a instanceof Lt(a).Element:!1}function fn(a){return Mo()?a instanceof HTMLElement||a instanceof Lt(a).HTMLElement:!1}function jv(a){return!Mo()||typeof ShadowRoot>"u"?!1:a instanceof ShadowRoot||a instanceof Lt(a).ShadowRoot}function Qi(a){const{overflow:r,overflowX:u,overflowY:c,display:f}=en(a);return/auto|scroll|overlay|hidden|clip/.test(r+c+u)&&!["inline","contents"].includes(f)}function R2(a){return["table","td","th"].includes(Ha(a))}function Do(a){return[":popover-open",":modal"].some(r=>{try{return a.matches(r)}catch{return!1}})}function Zs(a){const r=Fs(),u=It(a)?en(a):a;return["transform","translate","scale","rotate","perspective"].some(c=>u[c]?u[c]!=="none":!1)||(u.containerType?u.containerType!=="normal":!1)||!r&&(u.backdropFilter?u.backdropFilter!=="none":!1)||!r&&(u.filter?u.filter!=="none":!1)||["transform","translate","scale","rotate","perspective","filter"].some(c=>(u.willChange||"").includes(c))||["paint","layout","strict","content"].some(c=>(u.contain||"").includes(c))}function O2(a){let r=ul(a);for(;fn(r)&&!Da(r);){if(Zs(r))return r;if(Do(r))return null;r=ul(r)}return null}function Fs(){return typeof CSS>"u"||!CSS.supports?!1:CSS.supports("-webkit-backdrop-filter","none")}function Da(a){return["html","body","#document"].includes(Ha(a))}function en(a){return Lt(a).getComputedStyle(a)}function zo(a){return It(a)?{scrollLeft:a.scrollLeft,scrollTop:a.scrollTop}:{scrollLeft:a.scrollX,scrollTop:a.scrollY}}function ul(a){if(Ha(a)==="html")return a;const r=a.assignedSlot||a.parentNode||jv(a)&&a.host||dn(a);return jv(r)?r.host:r}function up(a){const r=ul(a);return Da(r)?a.ownerDocument?a.ownerDocument.body:a.body:fn(r)&&Qi(r)?r:up(r)}function Yi(a,r,u){var c;r===void 0&&(r=[]),u===void 0&&(u=!0);const f=up(a),d=f===((c=a.ownerDocument)==null?void 0:c.body),m=Lt(f);if(d){const g=js(m);return r.concat(m,m.visualViewport||[],Qi(f)?f:[],g&&u?Yi(g):[])}return r.concat(f,Yi(f,[],u))}function js(a){return a.parent&&Object.getPrototypeOf(a.parent)?a.frameElement:null}function sp(a){const r=en(a);let u=parseFloat(r.width)||0,c=parseFloat(r.height)||0;const f=fn(a),d=f?a.offsetWidth:u,m=f?a.offsetHeight:c,g=Eo(u)!==d||Eo(c)!==m;return g&&(u=d,c=m),{width:u,height:c,$:g}}function Js(a){return It(a)?a:a.contextElement}function Ra(a){const r=Js(a);if(!fn(r))return sn(1);const u=r.getBoundingClientRect(),{width:c,height:f,$:d}=sp(r);let m=(d?Eo(u.width):u.width)/c,g=(d?Eo(u.height):u.height)/f;return(!m||!Number.isFinite(m))&&(m=1),(!g||!Number.isFinite(g))&&(g=1),{x:m,y:g}}const M2=sn(0);function fp(a){const r=Lt(a);return!Fs()||!r.visualViewport?M2:{x:r.visualViewport.offsetLeft,y:r.visualViewport.offsetTop}}function D2(a,r,u){return r===void 0&&(r=!1),!u||r&&u!==Lt(a)?!1:r}function kl(a,r,u,c){r===void 0&&(r=!1),u===void 0&&(u=!1);const f=a.getBoundingClientRect(),d=Js(a);let m=sn(1);r&&(c?It(c)&&(m=Ra(c)):m=Ra(a));const g=D2(d,u,c)?fp(d):sn(0);let y=(f.left+g.x)/m.x,v=(f.top+g.y)/m.y,b=f.width/m.x,_=f.height/m.y;if(d){const A=Lt(d),C=c&&It(c)?Lt(c):c;let w=A,x=js(w);for(;x&&c&&C!==w;){const N=Ra(x),z=x.getBoundingClientRect(),U=en(x),B=z.left+(x.clientLeft+parseFloat(U.paddingLeft))*N.x,X=z.top+(x.clientTop+parseFloat(U.paddingTop))*N.y;y*=N.x,v*=N.y,b*=N.x,_*=N.y,y+=B,v+=X,w=Lt(x),x=js(w)}}return To({width:b,height:_,x:y,y:v})}function Ps(a,r){const u=zo(a).scrollLeft;return r?r.left+u:kl(dn(a)).left+u}function dp(a,r,u){u===void 0&&(u=!1);const c=a.getBoundingClientRect(),f=c.left+r.scrollLeft-(u?0:Ps(a,c)),d=c.top+r.scrollTop;return{x:f,y:d}}function z2(a){let{elements:r,rect:u,offsetParent:c,strategy:f}=a;const d=f==="fixed",m=dn(c),g=r?Do(r.floating):!1;if(c===m||g&&d)return u;let y={scrollLeft:0,scrollTop:0},v=sn(1);const b=sn(0),_=fn(c);if((_||!_&&!d)&&((Ha(c)!=="body"||Qi(m))&&(y=zo(c)),fn(c))){const C=kl(c);v=Ra(c),b.x=C.x+c.clientLeft,b.y=C.y+c.clientTop}const A=m&&!_&&!d?dp(m,y,!0):sn(0);return{width:u.width*v.x,height:u.height*v.y,x:u.x*v.x-y.scrollLeft*v.x+b.x+A.x,y:u.y*v.y-y.scrollTop*v.y+b.y+A.y}}function k2(a){return Array.from(a.getClientRects())}function U2(a){const r=dn(a),u=zo(a),c=a.ownerDocument.body,f=Ht(r.scrollWidth,r.clientWidth,c.scrollWidth,c.clientWidth),d=Ht(r.scrollHeight,r.clientHeight,c.scrollHeight,c.clientHeight);let m=-u.scrollLeft+Ps(a);const g=-u.scrollTop;return en(c).direction==="rtl"&&(m+=Ht(r.clientWidth,c.clientWidth)-f),{width:f,height:d,x:m,y:g}}function B2(a,r){const u=Lt(a),c=dn(a),f=u.visualViewport;let d=c.clientWidth,m=c.clientHeight,g=0,y=0;if(f){d=f.width,m=f.height;const v=Fs();(!v||v&&r==="fixed")&&(g=f.offsetLeft,y=f.offsetTop)}return{width:d,height:m,x:g,y}}function H2(a,r){const u=kl(a,!0,r==="fixed"),c=u.top+a.clientTop,f=u.left+a.clientLeft,d=fn(a)?Ra(a):sn(1),m=a.clientWidth*d.x,g=a.clientHeight*d.y,y=f*d.x,v=c*d.y;return{width:m,height:g,x:y,y:v}}function Nv(a,r,u){let c;if(r==="viewport")c=B2(a,u);else if(r==="document")c=U2(dn(a));else if(It(r))c=H2(r,u);else{const f=fp(a);c={x:r.x-f.x,y:r.y-f.y,width:r.width,height:r.height}}return To(c)}function hp(a,r){const u=ul(a);return u===r||!It(u)||Da(u)?!1:en(u).position==="fixed"||hp(u,r)}function L2(a,r){const u=r.get(a);if(u)return u;let c=Yi(a,[],!1).filter(g=>It(g)&&Ha(g)!=="body"),f=null;const d=en(a).position==="fixed";let m=d?ul(a):a;for(;It(m)&&!Da(m);){const g=en(m),y=Zs(m);!y&&g.position==="fixed"&&(f=null),(d?!y&&!f:!y&&g.position==="static"&&!!f&&["absolute","fixed"].includes(f.position)||Qi(m)&&!y&&hp(a,m))?c=c.filter(b=>b!==m):f=g,m=ul(m)}return r.set(a,c),c}function q2(a){let{element:r,boundary:u,rootBoundary:c,strategy:f}=a;const m=[...u==="clippingAncestors"?Do(r)?[]:L2(r,this._c):[].concat(u),c],g=m[0],y=m.reduce((v,b)=>{const _=Nv(r,b,f);return v.top=Ht(_.top,v.top),v.right=cl(_.right,v.right),v.bottom=cl(_.bottom,v.bottom),v.left=Ht(_.left,v.left),v},Nv(r,g,f));return{width:y.right-y.left,height:y.bottom-y.top,x:y.left,y:y.top}}function G2(a){const{width:r,height:u}=sp(a);return{width:r,height:u}}function V2(a,r,u){const c=fn(r),f=dn(r),d=u==="fixed",m=kl(a,!0,d,r);let g={scrollLeft:0,scrollTop:0};const y=sn(0);function v(){y.x=Ps(f)}if(c||!c&&!d)if((Ha(r)!=="body"||Qi(f))&&(g=zo(r)),c){const C=kl(r,!0,d,r);y.x=C.x+r.clientLeft,y.y=C.y+r.clientTop}else f&&v();d&&!c&&f&&v();const b=f&&!c&&!d?dp(f,g):sn(0),_=m.left+g.scrollLeft-y.x-b.x,A=m.top+g.scrollTop-y.y-b.y;return{x:_,y:A,width:m.width,height:m.height}}function ms(a){return en(a).position==="static"}function Cv(a,r){if(!fn(a)||en(a).position==="fixed")return null;if(r)return r(a);let u=a.offsetParent;return dn(a)===u&&(u=u.ownerDocument.body),u}function mp(a,r){const u=Lt(a);if(Do(a))return u;if(!fn(a)){let f=ul(a);for(;f&&!Da(f);){if(It(f)&&!ms(f))return f;f=ul(f)}return u}let c=Cv(a,r);for(;c&&R2(c)&&ms(c);)c=Cv(c,r);return c&&Da(c)&&ms(c)&&!Zs(c)?u:c||O2(a)||u}const Y2=async function(a){const r=this.getOffsetParent||mp,u=this.getDimensions,c=await u(a.floating);return{reference:V2(a.reference,await r(a.floating),a.strategy),floating:{x:0,y:0,width:c.width,height:c.height}}};function X2(a){return en(a).direction==="rtl"}const K2={convertOffsetParentRelativeRectToViewportRelativeRect:z2,getDocumentElement:dn,getClippingRect:q2,getOffsetParent:mp,getElementRects:Y2,getClientRects:k2,getDimensions:G2,getScale:Ra,isElement:It,isRTL:X2};function vp(a,r){return a.x===r.x&&a.y===r.y&&a.width===r.width&&a.height===r.height}function Q2(a,r){let u=null,c;const f=dn(a);function d(){var g;clearTimeout(c),(g=u)==null||g.disconnect(),u=null}function m(g,y){g===void 0&&(g=!1),y===void 0&&(y=1),d();const v=a.getBoundingClientRect(),{left:b,top:_,width:A,height:C}=v;if(g||r(),!A||!C)return;const w=po(_),x=po(f.clientWidth-(b+A)),N=po(f.clientHeight-(_+C)),z=po(b),B={rootMargin:-w+"px "+-x+"px "+-N+"px "+-z+"px",threshold:Ht(0,cl(1,y))||1};let X=!0;function G(W){const J=W[0].intersectionRatio;if(J!==y){if(!X)return m();J?m(!1,J):c=setTimeout(()=>{m(!1,1e-7)},1e3)}J===1&&!vp(v,a.getBoundingClientRect())&&m(),X=!1}try{u=new IntersectionObserver(G,{...B,root:f.ownerDocument})}catch{u=new IntersectionObserver(G,B)}u.observe(a)}return m(!0),d}function Z2(a,r,u,c){c===void 0&&(c={});const{ancestorScroll:f=!0,ancestorResize:d=!0,elementResize:m=typeof ResizeObserver=="function",layoutShift:g=typeof IntersectionObserver=="function",animationFrame:y=!1}=c,v=Js(a),b=f||d?[...v?Yi(v):[],...Yi(r)]:[];b.forEach(z=>{f&&z.addEventListener("scroll",u,{passive:!0}),d&&z.addEventListener("resize",u)});const _=v&&g?Q2(v,u):null;let A=-1,C=null;m&&(C=new ResizeObserver(z=>{let[U]=z;U&&U.target===v&&C&&(C.unobserve(r),cancelAnimationFrame(A),A=requestAnimationFrame(()=>{var B;(B=C)==null||B.observe(r)})),u()}),v&&!y&&C.observe(v),C.observe(r));let w,x=y?kl(a):null;y&&N();function N(){const z=kl(a);x&&!vp(x,z)&&u(),x=z,w=requestAnimationFrame(N)}return u(),()=>{var z;b.forEach(U=>{f&&U.removeEventListener("scroll",u),d&&U.removeEventListener("resize",u)}),_==null||_(),(z=C)==null||z.disconnect(),C=null,y&&cancelAnimationFrame(w)}}const F2=T2,J2=j2,P2=_2,$2=C2,W2=E2,Rv=w2,I2=N2,ew=(a,r,u)=>{const c=new Map,f={platform:K2,...u},d={...f.platform,_c:c};return S2(a,r,{...f,platform:d})};var xo=typeof document<"u"?S.useLayoutEffect:S.useEffect;function jo(a,r){if(a===r)return!0;if(typeof a!=typeof r)return!1;if(typeof a=="function"&&a.toString()===r.toString())return!0;let u,c,f;if(a&&r&&typeof a=="object"){if(Array.isArray(a)){if(u=a.length,u!==r.length)return!1;for(c=u;c--!==0;)if(!jo(a[c],r[c]))return!1;return!0}if(f=Object.keys(a),u=f.length,u!==Object.keys(r).length)return!1;for(c=u;c--!==0;)if(!{}.hasOwnProperty.call(r,f[c]))return!1;for(c=u;c--!==0;){const d=f[c];if(!(d==="_owner"&&a.$$typeof)&&!jo(a[d],r[d]))return!1}return!0}return a!==a&&r!==r}function gp(a){return typeof window>"u"?1:(a.ownerDocument.defaultView||window).devicePixelRatio||1}function Ov(a,r){const u=gp(a);return Math.round(r*u)/u}function vs(a){const r=S.useRef(a);return xo(()=>{r.current=a}),r}function tw(a){a===void 0&&(a={});const{placement:r="bottom",strategy:u="absolute",middleware:c=[],platform:f,elements:{reference:d,floating:m}={},transform:g=!0,whileElementsMounted:y,open:v}=a,[b,_]=S.useState({x:0,y:0,strategy:u,placement:r,middlewareData:{},isPositioned:!1}),[A,C]=S.useState(c);jo(A,c)||C(c);const[w,x]=S.useState(null),[N,z]=S.useState(null),U=S.useCallback(L=>{L!==W.current&&(W.current=L,x(L))},[]),B=S.useCallback(L=>{L!==J.current&&(J.current=L,z(L))},[]),X=d||w,G=m||N,W=S.useRef(null),J=S.useRef(null),Q=S.useRef(b),ce=y!=null,me=vs(y),ve=vs(f),fe=vs(v),ge=S.useCallback(()=>{if(!W.current||!J.current)return;const L={placement:r,strategy:u,middleware:A};ve.current&&(L.platform=ve.current),ew(W.current,J.current,L).then(le=>{const T={...le,isPositioned:fe.current!==!1};ye.current&&!jo(Q.current,T)&&(Q.current=T,Xi.flushSync(()=>{_(T)}))})},[A,r,u,ve,fe]);xo(()=>{v===!1&&Q.current.isPositioned&&(Q.current.isPositioned=!1,_(L=>({...L,isPositioned:!1})))},[v]);const ye=S.useRef(!1);xo(()=>(ye.current=!0,()=>{ye.current=!1}),[]),xo(()=>{if(X&&(W.current=X),G&&(J.current=G),X&&G){if(me.current)return me.current(X,G,ge);ge()}},[X,G,ge,me,ce]);const re=S.useMemo(()=>({reference:W,floating:J,setReference:U,setFloating:B}),[U,B]),O=S.useMemo(()=>({reference:X,floating:G}),[X,G]),Z=S.useMemo(()=>{const L={position:u,left:0,top:0};if(!O.floating)return L;const le=Ov(O.floating,b.x),T=Ov(O.floating,b.y);return g?{...L,transform:"translate("+le+"px, "+T+"px)",...gp(O.floating)>=1.5&&{willChange:"transform"}}:{position:u,left:le,top:T}},[u,g,O.floating,b.x,b.y]);return S.useMemo(()=>({...b,update:ge,refs:re,elements:O,floatingStyles:Z}),[b,ge,re,O,Z])}const nw=a=>{function r(u){return{}.hasOwnProperty.call(u,"current")}return{name:"arrow",options:a,fn(u){const{element:c,padding:f}=typeof a=="function"?a(u):a;return c&&r(c)?c.current!=null?Rv({element:c.current,padding:f}).fn(u):{}:c?Rv({element:c,padding:f}).fn(u):{}}}},lw=(a,r)=>({...F2(a),options:[a,r]}),aw=(a,r)=>({...J2(a),options:[a,r]}),iw=(a,r)=>({...I2(a),options:[a,r]}),rw=(a,r)=>({...P2(a),options:[a,r]}),ow=(a,r)=>({...$2(a),options:[a,r]}),cw=(a,r)=>({...W2(a),options:[a,r]}),uw=(a,r)=>({...nw(a),options:[a,r]});var sw="Arrow",pp=S.forwardRef((a,r)=>{const{children:u,width:c=10,height:f=5,...d}=a;return s.jsx(Te.svg,{...d,ref:r,width:c,height:f,viewBox:"0 0 30 10",preserveAspectRatio:"none",children:a.asChild?u:s.jsx("polygon",{points:"0,0 30,0 15,10"})})});pp.displayName=sw;var fw=pp;function yp(a){const[r,u]=S.useState(void 0);return vt(()=>{if(a){u({width:a.offsetWidth,height:a.offsetHeight});const c=new ResizeObserver(f=>{if(!Array.isArray(f)||!f.length)return;const d=f[0];let m,g;if("borderBoxSize"in d){const y=d.borderBoxSize,v=Array.isArray(y)?y[0]:y;m=v.inlineSize,g=v.blockSize}else m=a.offsetWidth,g=a.offsetHeight;u({width:m,height:g})});return c.observe(a,{box:"border-box"}),()=>c.unobserve(a)}else u(void 0)},[a]),r}var $s="Popper",[bp,xp]=Hl($s),[dw,Sp]=bp($s),wp=a=>{const{__scopePopper:r,children:u}=a,[c,f]=S.useState(null);return s.jsx(dw,{scope:r,anchor:c,onAnchorChange:f,children:u})};wp.displayName=$s;var _p="PopperAnchor",Ep=S.forwardRef((a,r)=>{const{__scopePopper:u,virtualRef:c,...f}=a,d=Sp(_p,u),m=S.useRef(null),g=Ye(r,m);return S.useEffect(()=>{d.onAnchorChange((c==null?void 0:c.current)||m.current)}),c?null:s.jsx(Te.div,{...f,ref:g})});Ep.displayName=_p;var Ws="PopperContent",[hw,mw]=bp(Ws),Ap=S.forwardRef((a,r)=>{var $,oe,ze,Ne,we,_e;const{__scopePopper:u,side:c="bottom",sideOffset:f=0,align:d="center",alignOffset:m=0,arrowPadding:g=0,avoidCollisions:y=!0,collisionBoundary:v=[],collisionPadding:b=0,sticky:_="partial",hideWhenDetached:A=!1,updatePositionStrategy:C="optimized",onPlaced:w,...x}=a,N=Sp(Ws,u),[z,U]=S.useState(null),B=Ye(r,rt=>U(rt)),[X,G]=S.useState(null),W=yp(X),J=(W==null?void 0:W.width)??0,Q=(W==null?void 0:W.height)??0,ce=c+(d!=="center"?"-"+d:""),me=typeof b=="number"?b:{top:0,right:0,bottom:0,left:0,...b},ve=Array.isArray(v)?v:[v],fe=ve.length>0,ge={padding:me,boundary:ve.filter(gw),altBoundary:fe},{refs:ye,floatingStyles:re,placement:O,isPositioned:Z,middlewareData:L}=tw({strategy:"fixed",placement:ce,whileElementsMounted:(...rt)=>Z2(...rt,{animationFrame:C==="always"}),elements:{reference:N.anchor},middleware:[lw({mainAxis:f+Q,alignmentAxis:m}),y&&aw({mainAxis:!0,crossAxis:!1,limiter:_==="partial"?iw():void 0,...ge}),y&&rw({...ge}),ow({...ge,apply:({elements:rt,rects:pt,availableWidth:dl,availableHeight:hl})=>{const{width:st,height:Lo}=pt.reference,ml=rt.floating.style;ml.setProperty("--radix-popper-available-width",`${dl}px`),ml.setProperty("--radix-popper-available-height",`${hl}px`),ml.setProperty("--radix-popper-anchor-width",`${st}px`),ml.setProperty("--radix-popper-anchor-height",`${Lo}px`)}}),X&&uw({element:X,padding:g}),pw({arrowWidth:J,arrowHeight:Q}),A&&cw({strategy:"referenceHidden",...ge})]}),[le,T]=Np(O),V=ol(w);vt(()=>{Z&&(V==null||V())},[Z,V]);const P=($=L.arrow)==null?void 0:$.x,F=(oe=L.arrow)==null?void 0:oe.y,I=((ze=L.arrow)==null?void 0:ze.centerOffset)!==0,[he,ie]=S.useState();return vt(()=>{z&&ie(window.getComputedStyle(z).zIndex)},[z]),s.jsx("div",{ref:ye.setFloating,"data-radix-popper-content-wrapper":"",style:{...re,transform:Z?re.transform:"translate(0, -200%)",minWidth:"max-content",zIndex:he,"--radix-popper-transform-origin":[(Ne=L.transformOrigin)==null?void 0:Ne.x,(we=L.transformOrigin)==null?void 0:we.y].join(" "),...((_e=L.hide)==null?void 0:_e.referenceHidden)&&{visibility:"hidden",pointerEvents:"none"}},dir:a.dir,children:s.jsx(hw,{scope:u,placedSide:le,onArrowChange:G,arrowX:P,arrowY:F,shouldHideArrow:I,children:s.jsx(Te.div,{"data-side":le,"data-align":T,...x,ref:B,style:{...x.style,animation:Z?void 0:"none"}})})})});Ap.displayName=Ws;var Tp="PopperArrow",vw={top:"bottom",right:"left",bottom:"top",left:"right"},jp=S.forwardRef(function(r,u){const{__scopePopper:c,...f}=r,d=mw(Tp,c),m=vw[d.placedSide];return s.jsx("span",{ref:d.onArrowChange,style:{position:"absolute",left:d.arrowX,top:d.arrowY,[m]:0,transformOrigin:{top:"",right:"0 0",bottom:"center 0",left:"100% 0"}[d.placedSide],transform:{top:"translateY(100%)",right:"translateY(50%) rotate(90deg) translateX(-50%)",bottom:"rotate(180deg)",left:"translateY(50%) rotate(-90deg) translateX(50%)"}[d.placedSide],visibility:d.shouldHideArrow?"hidden":void 0},children:s.jsx(fw,{...f,ref:u,style:{...f.style,display:"block"}})})});jp.displayName=Tp;function gw(a){return a!==null}var pw=a=>({name:"transformOrigin",options:a,fn(r){var N,z,U;const{placement:u,rects:c,middlewareData:f}=r,m=((N=f.arrow)==null?void 0:N.centerOffset)!==0,g=m?0:a.arrowWidth,y=m?0:a.arrowHeight,[v,b]=Np(u),_={start:"0%",center:"50%",end:"100%"}[b],A=(((z=f.arrow)==null?void 0:z.x)??0)+g/2,C=(((U=f.arrow)==null?void 0:U.y)??0)+y/2;let w="",x="";return v==="bottom"?(w=m?_:`${A}px`,x=`${-y}px`):v==="top"?(w=m?_:`${A}px`,x=`${c.floating.height+y}px`):v==="right"?(w=`${-y}px`,x=m?_:`${C}px`):v==="left"&&(w=`${c.floating.width+y}px`,x=m?_:`${C}px`),{data:{x:w,y:x}}}});function Np(a){const[r,u="center"]=a.split("-");return[r,u]}var yw=wp,bw=Ep,xw=Ap,Sw=jp;function Cp(a){const r=S.useRef({value:a,previous:a});return S.useMemo(()=>(r.current.value!==a&&(r.current.previous=r.current.value,r.current.value=a),r.current.previous),[a])}var Rp=Object.freeze({position:"absolute",border:0,width:1,height:1,padding:0,margin:-1,overflow:"hidden",clip:"rect(0, 0, 0, 0)",whiteSpace:"nowrap",wordWrap:"normal"}),ww="VisuallyHidden",_w=S.forwardRef((a,r)=>s.jsx(Te.span,{...a,ref:r,style:{...Rp,...a.style}}));_w.displayName=ww;var Ew=[" ","Enter","ArrowUp","ArrowDown"],Aw=[" ","Enter"],Ul="Select",[ko,Uo,Tw]=tg(Ul),[La,w_]=Hl(Ul,[Tw,xp]),Bo=xp(),[jw,sl]=La(Ul),[Nw,Cw]=La(Ul),Op=a=>{const{__scopeSelect:r,children:u,open:c,defaultOpen:f,onOpenChange:d,value:m,defaultValue:g,onValueChange:y,dir:v,name:b,autoComplete:_,disabled:A,required:C,form:w}=a,x=Bo(r),[N,z]=S.useState(null),[U,B]=S.useState(null),[X,G]=S.useState(!1),W=ks(v),[J,Q]=Ma({prop:c,defaultProp:f??!1,onChange:d,caller:Ul}),[ce,me]=Ma({prop:m,defaultProp:g,onChange:y,caller:Ul}),ve=S.useRef(null),fe=N?w||!!N.closest("form"):!0,[ge,ye]=S.useState(new Set),re=Array.from(ge).map(O=>O.props.value).join(";");return s.jsx(yw,{...x,children:s.jsxs(jw,{required:C,scope:r,trigger:N,onTriggerChange:z,valueNode:U,onValueNodeChange:B,valueNodeHasChildren:X,onValueNodeHasChildrenChange:G,contentId:il(),value:ce,onValueChange:me,open:J,onOpenChange:Q,dir:W,triggerPointerDownPosRef:ve,disabled:A,children:[s.jsx(ko.Provider,{scope:r,children:s.jsx(Nw,{scope:a.__scopeSelect,onNativeOptionAdd:S.useCallback(O=>{ye(Z=>new Set(Z).add(O))},[]),onNativeOptionRemove:S.useCallback(O=>{ye(Z=>{const L=new Set(Z);return L.delete(O),L})},[]),children:u})}),fe?s.jsxs(Ip,{"aria-hidden":!0,required:C,tabIndex:-1,name:b,autoComplete:_,value:ce,onChange:O=>me(O.target.value),disabled:A,form:w,children:[ce===void 0?s.jsx("option",{value:""}):null,Array.from(ge)]},re):null]})})};Op.displayName=Ul;var Mp="SelectTrigger",Dp=S.forwardRef((a,r)=>{const{__scopeSelect:u,disabled:c=!1,...f}=a,d=Bo(u),m=sl(Mp,u),g=m.disabled||c,y=Ye(r,m.onTriggerChange),v=Uo(u),b=S.useRef("touch"),[_,A,C]=ty(x=>{const N=v().filter(B=>!B.disabled),z=N.find(B=>B.value===m.value),U=ny(N,x,z);U!==void 0&&m.onValueChange(U.value)}),w=x=>{g||(m.onOpenChange(!0),C()),x&&(m.triggerPointerDownPosRef.current={x:Math.round(x.pageX),y:Math.round(x.pageY)})};return s.jsx(bw,{asChild:!0,...d,children:s.jsx(Te.button,{type:"button",role:"combobox","aria-controls":m.contentId,"aria-expanded":m.open,"aria-required":m.required,"aria-autocomplete":"none",dir:m.dir,"data-state":m.open?"open":"closed",disabled:g,"data-disabled":g?"":void 0,"data-placeholder":ey(m.value)?"":void 0,...f,ref:y,onClick:je(f.onClick,x=>{x.currentTarget.focus(),b.current!=="mouse"&&w(x)}),onPointerDown:je(f.onPointerDown,x=>{b.current=x.pointerType;const N=x.target;N.hasPointerCapture(x.pointerId)&&N.releasePointerCapture(x.pointerId),x.button===0&&x.ctrlKey===!1&&x.pointerType==="mouse"&&(w(x),x.preventDefault())}),onKeyDown:je(f.onKeyDown,x=>{const N=_.current!=="";!(x.ctrlKey||x.altKey||x.metaKey)&&x.key.length===1&&A(x.key),!(N&&x.key===" ")&&Ew.includes(x.key)&&(w(),x.preventDefault())})})})});Dp.displayName=Mp;var zp="SelectValue",kp=S.forwardRef((a,r)=>{const{__scopeSelect:u,className:c,style:f,children:d,placeholder:m="",...g}=a,y=sl(zp,u),{onValueNodeHasChildrenChange:v}=y,b=d!==void 0,_=Ye(r,y.onValueNodeChange);return vt(()=>{v(b)},[v,b]),s.jsx(Te.span,{...g,ref:_,style:{pointerEvents:"none"},children:ey(y.value)?s.jsx(s.Fragment,{children:m}):d})});kp.displayName=zp;var Rw="SelectIcon",Up=S.forwardRef((a,r)=>{const{__scopeSelect:u,children:c,...f}=a;return s.jsx(Te.span,{"aria-hidden":!0,...f,ref:r,children:c||"▼"})});Up.displayName=Rw;var Ow="SelectPortal",Bp=a=>s.jsx(Ls,{asChild:!0,...a});Bp.displayName=Ow;var Bl="SelectContent",Hp=S.forwardRef((a,r)=>{const u=sl(Bl,a.__scopeSelect),[c,f]=S.useState();if(vt(()=>{f(new DocumentFragment)},[]),!u.open){const d=c;return d?Xi.createPortal(s.jsx(Lp,{scope:a.__scopeSelect,children:s.jsx(ko.Slot,{scope:a.__scopeSelect,children:s.jsx("div",{children:a.children})})}),d):null}return s.jsx(qp,{...a,ref:r})});Hp.displayName=Bl;var Wt=10,[Lp,fl]=La(Bl),Mw="SelectContentImpl",Dw=Oa("SelectContent.RemoveScroll"),qp=S.forwardRef((a,r)=>{const{__scopeSelect:u,position:c="item-aligned",onCloseAutoFocus:f,onEscapeKeyDown:d,onPointerDownOutside:m,side:g,sideOffset:y,align:v,alignOffset:b,arrowPadding:_,collisionBoundary:A,collisionPadding:C,sticky:w,hideWhenDetached:x,avoidCollisions:N,...z}=a,U=sl(Bl,u),[B,X]=S.useState(null),[G,W]=S.useState(null),J=Ye(r,$=>X($)),[Q,ce]=S.useState(null),[me,ve]=S.useState(null),fe=Uo(u),[ge,ye]=S.useState(!1),re=S.useRef(!1);S.useEffect(()=>{if(B)return Ug(B)},[B]),jg();const O=S.useCallback($=>{const[oe,...ze]=fe().map(_e=>_e.ref.current),[Ne]=ze.slice(-1),we=document.activeElement;for(const _e of $)if(_e===we||(_e==null||_e.scrollIntoView({block:"nearest"}),_e===oe&&G&&(G.scrollTop=0),_e===Ne&&G&&(G.scrollTop=G.scrollHeight),_e==null||_e.focus(),document.activeElement!==we))return},[fe,G]),Z=S.useCallback(()=>O([Q,B]),[O,Q,B]);S.useEffect(()=>{ge&&Z()},[ge,Z]);const{onOpenChange:L,triggerPointerDownPosRef:le}=U;S.useEffect(()=>{if(B){let $={x:0,y:0};const oe=Ne=>{var we,_e;$={x:Math.abs(Math.round(Ne.pageX)-(((we=le.current)==null?void 0:we.x)??0)),y:Math.abs(Math.round(Ne.pageY)-(((_e=le.current)==null?void 0:_e.y)??0))}},ze=Ne=>{$.x<=10&&$.y<=10?Ne.preventDefault():B.contains(Ne.target)||L(!1),document.removeEventListener("pointermove",oe),le.current=null};return le.current!==null&&(document.addEventListener("pointermove",oe),document.addEventListener("pointerup",ze,{capture:!0,once:!0})),()=>{document.removeEventListener("pointermove",oe),document.removeEventListener("pointerup",ze,{capture:!0})}}},[B,L,le]),S.useEffect(()=>{const $=()=>L(!1);return window.addEventListener("blur",$),window.addEventListener("resize",$),()=>{window.removeEventListener("blur",$),window.removeEventListener("resize",$)}},[L]);const[T,V]=ty($=>{const oe=fe().filter(we=>!we.disabled),ze=oe.find(we=>we.ref.current===document.activeElement),Ne=ny(oe,$,ze);Ne&&setTimeout(()=>Ne.ref.current.focus())}),P=S.useCallback(($,oe,ze)=>{const Ne=!re.current&&!ze;(U.value!==void 0&&U.value===oe||Ne)&&(ce($),Ne&&(re.current=!0))},[U.value]),F=S.useCallback(()=>B==null?void 0:B.focus(),[B]),I=S.useCallback(($,oe,ze)=>{const Ne=!re.current&&!ze;(U.value!==void 0&&U.value===oe||Ne)&&ve($)},[U.value]),he=c==="popper"?Ns:Gp,ie=he===Ns?{side:g,sideOffset:y,align:v,alignOffset:b,arrowPadding:_,collisionBoundary:A,collisionPadding:C,sticky:w,hideWhenDetached:x,avoidCollisions:N}:{};return s.jsx(Lp,{scope:u,content:B,viewport:G,onViewportChange:W,itemRefCallback:P,selectedItem:Q,onItemLeave:F,itemTextRefCallback:I,focusSelectedItem:Z,selectedItemText:me,position:c,isPositioned:ge,searchRef:T,children:s.jsx(qs,{as:Dw,allowPinchZoom:!0,children:s.jsx(Hs,{asChild:!0,trapped:U.open,onMountAutoFocus:$=>{$.preventDefault()},onUnmountAutoFocus:je(f,$=>{var oe;(oe=U.trigger)==null||oe.focus({preventScroll:!0}),$.preventDefault()}),children:s.jsx(Bs,{asChild:!0,disableOutsidePointerEvents:!0,onEscapeKeyDown:d,onPointerDownOutside:m,onFocusOutside:$=>$.preventDefault(),onDismiss:()=>U.onOpenChange(!1),children:s.jsx(he,{role:"listbox",id:U.contentId,"data-state":U.open?"open":"closed",dir:U.dir,onContextMenu:$=>$.preventDefault(),...z,...ie,onPlaced:()=>ye(!0),ref:J,style:{display:"flex",flexDirection:"column",outline:"none",...z.style},onKeyDown:je(z.onKeyDown,$=>{const oe=$.ctrlKey||$.altKey||$.metaKey;if($.key==="Tab"&&$.preventDefault(),!oe&&$.key.length===1&&V($.key),["ArrowUp","ArrowDown","Home","End"].includes($.key)){let Ne=fe().filter(we=>!we.disabled).map(we=>we.ref.current);if(["ArrowUp","End"].includes($.key)&&(Ne=Ne.slice().reverse()),["ArrowUp","ArrowDown"].includes($.key)){const we=$.target,_e=Ne.indexOf(we);Ne=Ne.slice(_e+1)}setTimeout(()=>O(Ne)),$.preventDefault()}})})})})})})});qp.displayName=Mw;var zw="SelectItemAlignedPosition",Gp=S.forwardRef((a,r)=>{const{__scopeSelect:u,onPlaced:c,...f}=a,d=sl(Bl,u),m=fl(Bl,u),[g,y]=S.useState(null),[v,b]=S.useState(null),_=Ye(r,J=>b(J)),A=Uo(u),C=S.useRef(!1),w=S.useRef(!0),{viewport:x,selectedItem:N,selectedItemText:z,focusSelectedItem:U}=m,B=S.useCallback(()=>{if(d.trigger&&d.valueNode&&g&&v&&x&&N&&z){const J=d.trigger.getBoundingClientRect(),Q=v.getBoundingClientRect(),ce=d.valueNode.getBoundingClientRect(),me=z.getBoundingClientRect();if(d.dir!=="rtl"){const we=me.left-Q.left,_e=ce.left-we,rt=J.left-_e,pt=J.width+rt,dl=Math.max(pt,Q.width),hl=window.innerWidth-Wt,st=_v(_e,[Wt,Math.max(Wt,hl-dl)]);g.style.minWidth=pt+"px",g.style.left=st+"px"}else{const we=Q.right-me.right,_e=window.innerWidth-ce.right-we,rt=window.innerWidth-J.right-_e,pt=J.width+rt,dl=Math.max(pt,Q.width),hl=window.innerWidth-Wt,st=_v(_e,[Wt,Math.max(Wt,hl-dl)]);g.style.minWidth=pt+"px",g.style.right=st+"px"}const ve=A(),fe=window.innerHeight-Wt*2,ge=x.scrollHeight,ye=window.getComputedStyle(v),re=parseInt(ye.borderTopWidth,10),O=parseInt(ye.paddingTop,10),Z=parseInt(ye.borderBottomWidth,10),L=parseInt(ye.paddingBottom,10),le=re+O+ge+L+Z,T=Math.min(N.offsetHeight*5,le),V=window.getComputedStyle(x),P=parseInt(V.paddingTop,10),F=parseInt(V.paddingBottom,10),I=J.top+J.height/2-Wt,he=fe-I,ie=N.offsetHeight/2,$=N.offsetTop+ie,oe=re+O+$,ze=le-oe;if(oe<=I){const we=ve.length>0&&N===ve[ve.length-1].ref.current;g.style.bottom="0px";const _e=v.clientHeight-x.offsetTop-x.offsetHeight,rt=Math.max(he,ie+(we?F:0)+_e+Z),pt=oe+rt;g.style.height=pt+"px"}else{const we=ve.length>0&&N===ve[0].ref.current;g.style.top="0px";const rt=Math.max(I,re+x.offsetTop+(we?P:0)+ie)+ze;g.style.height=rt+"px",x.scrollTop=oe-I+x.offsetTop}g.style.margin=`${Wt}px 0`,g.style.minHeight=T+"px",g.style.maxHeight=fe+"px",c==null||c(),requestAnimationFrame(()=>C.current=!0)}},[A,d.trigger,d.valueNode,g,v,x,N,z,d.dir,c]);vt(()=>B(),[B]);const[X,G]=S.useState();vt(()=>{v&&G(window.getComputedStyle(v).zIndex)},[v]);const W=S.useCallback(J=>{J&&w.current===!0&&(B(),U==null||U(),w.current=!1)},[B,U]);return s.jsx(Uw,{scope:u,contentWrapper:g,shouldExpandOnScrollRef:C,onScrollButtonChange:W,children:s.jsx("div",{ref:y,style:{display:"flex",flexDirection:"column",position:"fixed",zIndex:X},children:s.jsx(Te.div,{...f,ref:_,style:{boxSizing:"border-box",maxHeight:"100%",...f.style}})})})});Gp.displayName=zw;var kw="SelectPopperPosition",Ns=S.forwardRef((a,r)=>{const{__scopeSelect:u,align:c="start",collisionPadding:f=Wt,...d}=a,m=Bo(u);return s.jsx(xw,{...m,...d,ref:r,align:c,collisionPadding:f,style:{boxSizing:"border-box",...d.style,"--radix-select-content-transform-origin":"var(--radix-popper-transform-origin)","--radix-select-content-available-width":"var(--radix-popper-available-width)","--radix-select-content-available-height":"var(--radix-popper-available-height)","--radix-select-trigger-width":"var(--radix-popper-anchor-width)","--radix-select-trigger-height":"var(--radix-popper-anchor-height)"}})});Ns.displayName=kw;var[Uw,Is]=La(Bl,{}),Cs="SelectViewport",Vp=S.forwardRef((a,r)=>{const{__scopeSelect:u,nonce:c,...f}=a,d=fl(Cs,u),m=Is(Cs,u),g=Ye(r,d.onViewportChange),y=S.useRef(0);return s.jsxs(s.Fragment,{children:[s.jsx("style",{dangerouslySetInnerHTML:{__html:"[data-radix-select-viewport]{scrollbar-width:none;-ms-overflow-style:none;-webkit-overflow-scrolling:touch;}[data-radix-select-viewport]::-webkit-scrollbar{display:none}"},nonce:c}),s.jsx(ko.Slot,{scope:u,children:s.jsx(Te.div,{"data-radix-select-viewport":"",role:"presentation",...f,ref:g,style:{position:"relative",flex:1,overflow:"hidden auto",...f.style},onScroll:je(f.onScroll,v=>{const b=v.currentTarget,{contentWrapper:_,shouldExpandOnScrollRef:A}=m;if(A!=null&&A.current&&_){const C=Math.abs(y.current-b.scrollTop);if(C>0){const w=window.innerHeight-Wt*2,x=parseFloat(_.style.minHeight),N=parseFloat(_.style.height),z=Math.max(x,N);if(z<w){const U=z+C,B=Math.min(w,U),X=U-B;_.style.height=B+"px",_.style.bottom==="0px"&&(b.scrollTop=X>0?X:0,_.style.justifyContent="flex-end")}}}y.current=b.scrollTop})})})]})});Vp.displayName=Cs;var Yp="SelectGroup",[Bw,Hw]=La(Yp),Lw=S.forwardRef((a,r)=>{const{__scopeSelect:u,...c}=a,f=il();return s.jsx(Bw,{scope:u,id:f,children:s.jsx(Te.div,{role:"group","aria-labelledby":f,...c,ref:r})})});Lw.displayName=Yp;var Xp="SelectLabel",qw=S.forwardRef((a,r)=>{const{__scopeSelect:u,...c}=a,f=Hw(Xp,u);return s.jsx(Te.div,{id:f.id,...c,ref:r})});qw.displayName=Xp;var No="SelectItem",[Gw,Kp]=La(No),Qp=S.forwardRef((a,r)=>{const{__scopeSelect:u,value:c,disabled:f=!1,textValue:d,...m}=a,g=sl(No,u),y=fl(No,u),v=g.value===c,[b,_]=S.useState(d??""),[A,C]=S.useState(!1),w=Ye(r,U=>{var B;return(B=y.itemRefCallback)==null?void 0:B.call(y,U,c,f)}),x=il(),N=S.useRef("touch"),z=()=>{f||(g.onValueChange(c),g.onOpenChange(!1))};if(c==="")throw new Error("A <Select.Item /> must have a value prop that is not an empty string. This is because the Select value can be set to an empty string to clear the selection and show the placeholder.");return s.jsx(Gw,{scope:u,value:c,disabled:f,textId:x,isSelected:v,onItemTextChange:S.useCallback(U=>{_(B=>B||((U==null?void 0:U.textContent)??"").trim())},[]),children:s.jsx(ko.ItemSlot,{scope:u,value:c,disabled:f,textValue:b,children:s.jsx(Te.div,{role:"option","aria-labelledby":x,"data-highlighted":A?"":void 0,"aria-selected":v&&A,"data-state":v?"checked":"unchecked","aria-disabled":f||void 0,"data-disabled":f?"":void 0,tabIndex:f?void 0:-1,...m,ref:w,onFocus:je(m.onFocus,()=>C(!0)),onBlur:je(m.onBlur,()=>C(!1)),onClick:je(m.onClick,()=>{N.current!=="mouse"&&z()}),onPointerUp:je(m.onPointerUp,()=>{N.current==="mouse"&&z()}),onPointerDown:je(m.onPointerDown,U=>{N.current=U.pointerType}),onPointerMove:je(m.onPointerMove,U=>{var B;N.current=U.pointerType,f?(B=y.onItemLeave)==null||B.call(y):N.current==="mouse"&&U.currentTarget.focus({preventScroll:!0})}),onPointerLeave:je(m.onPointerLeave,U=>{var B;U.currentTarget===document.activeElement&&((B=y.onItemLeave)==null||B.call(y))}),onKeyDown:je(m.onKeyDown,U=>{var X;((X=y.searchRef)==null?void 0:X.current)!==""&&U.key===" "||(Aw.includes(U.key)&&z(),U.key===" "&&U.preventDefault())})})})})});Qp.displayName=No;var Gi="SelectItemText",Zp=S.forwardRef((a,r)=>{const{__scopeSelect:u,className:c,style:f,...d}=a,m=sl(Gi,u),g=fl(Gi,u),y=Kp(Gi,u),v=Cw(Gi,u),[b,_]=S.useState(null),A=Ye(r,z=>_(z),y.onItemTextChange,z=>{var U;return(U=g.itemTextRefCallback)==null?void 0:U.call(g,z,y.value,y.disabled)}),C=b==null?void 0:b.textContent,w=S.useMemo(()=>s.jsx("option",{value:y.value,disabled:y.disabled,children:C},y.value),[y.disabled,y.value,C]),{onNativeOptionAdd:x,onNativeOptionRemove:N}=v;return vt(()=>(x(w),()=>N(w)),[x,N,w]),s.jsxs(s.Fragment,{children:[s.jsx(Te.span,{id:y.textId,...d,ref:A}),y.isSelected&&m.valueNode&&!m.valueNodeHasChildren?Xi.createPortal(d.children,m.valueNode):null]})});Zp.displayName=Gi;var Fp="SelectItemIndicator",Jp=S.forwardRef((a,r)=>{const{__scopeSelect:u,...c}=a;return Kp(Fp,u).isSelected?s.jsx(Te.span,{"aria-hidden":!0,...c,ref:r}):null});Jp.displayName=Fp;var Rs="SelectScrollUpButton",Pp=S.forwardRef((a,r)=>{const u=fl(Rs,a.__scopeSelect),c=Is(Rs,a.__scopeSelect),[f,d]=S.useState(!1),m=Ye(r,c.onScrollButtonChange);return vt(()=>{if(u.viewport&&u.isPositioned){let g=function(){const v=y.scrollTop>0;d(v)};const y=u.viewport;return g(),y.addEventListener("scroll",g),()=>y.removeEventListener("scroll",g)}},[u.viewport,u.isPositioned]),f?s.jsx(Wp,{...a,ref:m,onAutoScroll:()=>{const{viewport:g,selectedItem:y}=u;g&&y&&(g.scrollTop=g.scrollTop-y.offsetHeight)}}):null});Pp.displayName=Rs;var Os="SelectScrollDownButton",$p=S.forwardRef((a,r)=>{const u=fl(Os,a.__scopeSelect),c=Is(Os,a.__scopeSelect),[f,d]=S.useState(!1),m=Ye(r,c.onScrollButtonChange);return vt(()=>{if(u.viewport&&u.isPositioned){let g=function(){const v=y.scrollHeight-y.clientHeight,b=Math.ceil(y.scrollTop)<v;d(b)};const y=u.viewport;return g(),y.addEventListener("scroll",g),()=>y.removeEventListener("scroll",g)}},[u.viewport,u.isPositioned]),f?s.jsx(Wp,{...a,ref:m,onAutoScroll:()=>{const{viewport:g,selectedItem:y}=u;g&&y&&(g.scrollTop=g.scrollTop+y.offsetHeight)}}):null});$p.displayName=Os;var Wp=S.forwardRef((a,r)=>{const{__scopeSelect:u,onAutoScroll:c,...f}=a,d=fl("SelectScrollButton",u),m=S.useRef(null),g=Uo(u),y=S.useCallback(()=>{m.current!==null&&(window.clearInterval(m.current),m.current=null)},[]);return S.useEffect(()=>()=>y(),[y]),vt(()=>{var b;const v=g().find(_=>_.ref.current===document.activeElement);(b=v==null?void 0:v.ref.current)==null||b.scrollIntoView({block:"nearest"})},[g]),s.jsx(Te.div,{"aria-hidden":!0,...f,ref:r,style:{flexShrink:0,...f.style},onPointerDown:je(f.onPointerDown,()=>{m.current===null&&(m.current=window.setInterval(c,50))}),onPointerMove:je(f.onPointerMove,()=>{var v;(v=d.onItemLeave)==null||v.call(d),m.current===null&&(m.current=window.setInterval(c,50))}),onPointerLeave:je(f.onPointerLeave,()=>{y()})})}),Vw="SelectSeparator",Yw=S.forwardRef((a,r)=>{const{__scopeSelect:u,...c}=a;return s.jsx(Te.div,{"aria-hidden":!0,...c,ref:r})});Yw.displayName=Vw;var Ms="SelectArrow",Xw=S.forwardRef((a,r)=>{const{__scopeSelect:u,...c}=a,f=Bo(u),d=sl(Ms,u),m=fl(Ms,u);return d.open&&m.position==="popper"?s.jsx(Sw,{...f,...c,ref:r}):null});Xw.displayName=Ms;var Kw="SelectBubbleInput",Ip=S.forwardRef(({__scopeSelect:a,value:r,...u},c)=>{const f=S.useRef(null),d=Ye(c,f),m=Cp(r);return S.useEffect(()=>{const g=f.current;if(!g)return;const y=window.HTMLSelectElement.prototype,b=Object.getOwnPropertyDescriptor(y,"value").set;if(m!==r&&b){const _=new Event("change",{bubbles:!0});b.call(g,r),g.dispatchEvent(_)}},[m,r]),s.jsx(Te.select,{...u,style:{...Rp,...u.style},ref:d,defaultValue:r})});Ip.displayName=Kw;function ey(a){return a===""||a===void 0}function ty(a){const r=ol(a),u=S.useRef(""),c=S.useRef(0),f=S.useCallback(m=>{const g=u.current+m;r(g),function y(v){u.current=v,window.clearTimeout(c.current),v!==""&&(c.current=window.setTimeout(()=>y(""),1e3))}(g)},[r]),d=S.useCallback(()=>{u.current="",window.clearTimeout(c.current)},[]);return S.useEffect(()=>()=>window.clearTimeout(c.current),[]),[u,f,d]}function ny(a,r,u){const f=r.length>1&&Array.from(r).every(v=>v===r[0])?r[0]:r,d=u?a.indexOf(u):-1;let m=Qw(a,Math.max(d,0));f.length===1&&(m=m.filter(v=>v!==u));const y=m.find(v=>v.textValue.toLowerCase().startsWith(f.toLowerCase()));return y!==u?y:void 0}function Qw(a,r){return a.map((u,c)=>a[(r+c)%a.length])}var Zw=Op,Fw=Dp,Jw=kp,Pw=Up,$w=Bp,Ww=Hp,Iw=Vp,e_=Qp,t_=Zp,n_=Jp,l_=Pp,a_=$p;function Mv({...a}){return s.jsx(Zw,{"data-slot":"select",...a})}function Dv({...a}){return s.jsx(Jw,{"data-slot":"select-value",...a})}function zv({className:a,size:r="default",children:u,...c}){return s.jsxs(Fw,{"data-slot":"select-trigger","data-size":r,className:Oe("border-input data-[placeholder]:text-muted-foreground [&_svg:not([class*='text-'])]:text-muted-foreground focus-visible:border-ring focus-visible:ring-ring/50 aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive dark:bg-input/30 dark:hover:bg-input/50 flex w-fit items-center justify-between gap-2 rounded-md border bg-transparent px-3 py-2 text-sm whitespace-nowrap shadow-xs transition-[color,box-shadow] outline-none focus-visible:ring-[3px] disabled:cursor-not-allowed disabled:opacity-50 data-[size=default]:h-9 data-[size=sm]:h-8 *:data-[slot=select-value]:line-clamp-1 *:data-[slot=select-value]:flex *:data-[slot=select-value]:items-center *:data-[slot=select-value]:gap-2 [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4",a),...c,children:[u,s.jsx(Pw,{asChild:!0,children:s.jsx(xg,{className:"size-4 opacity-50"})})]})}function kv({className:a,children:r,position:u="popper",...c}){return s.jsx($w,{children:s.jsxs(Ww,{"data-slot":"select-content",className:Oe("bg-popover text-popover-foreground data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 data-[side=bottom]:slide-in-from-top-2 data-[side=left]:slide-in-from-right-2 data-[side=right]:slide-in-from-left-2 data-[side=top]:slide-in-from-bottom-2 relative z-50 max-h-(--radix-select-content-available-height) min-w-[8rem] origin-(--radix-select-content-transform-origin) overflow-x-hidden overflow-y-auto rounded-md border shadow-md",u==="popper"&&"data-[side=bottom]:translate-y-1 data-[side=left]:-translate-x-1 data-[side=right]:translate-x-1 data-[side=top]:-translate-y-1",a),position:u,...c,children:[s.jsx(i_,{}),s.jsx(Iw,{className:Oe("p-1",u==="popper"&&"h-[var(--radix-select-trigger-height)] w-full min-w-[var(--radix-select-trigger-width)] scroll-my-1"),children:r}),s.jsx(r_,{})]})})}function Uv({className:a,children:r,...u}){return s.jsxs(e_,{"data-slot":"select-item",className:Oe("focus:bg-accent focus:text-accent-foreground [&_svg:not([class*='text-'])]:text-muted-foreground relative flex w-full cursor-default items-center gap-2 rounded-sm py-1.5 pr-8 pl-2 text-sm outline-hidden select-none data-[disabled]:pointer-events-none data-[disabled]:opacity-50 [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4 *:[span]:last:flex *:[span]:last:items-center *:[span]:last:gap-2",a),...u,children:[s.jsx("span",{className:"absolute right-2 flex size-3.5 items-center justify-center",children:s.jsx(n_,{children:s.jsx(bg,{className:"size-4"})})}),s.jsx(t_,{children:r})]})}function i_({className:a,...r}){return s.jsx(l_,{"data-slot":"select-scroll-up-button",className:Oe("flex cursor-default items-center justify-center py-1",a),...r,children:s.jsx(b1,{className:"size-4"})})}function r_({className:a,...r}){return s.jsx(a_,{"data-slot":"select-scroll-down-button",className:Oe("flex cursor-default items-center justify-center py-1",a),...r,children:s.jsx(xg,{className:"size-4"})})}var Ho="Checkbox",[o_,__]=Hl(Ho),[c_,ef]=o_(Ho);function u_(a){const{__scopeCheckbox:r,checked:u,children:c,defaultChecked:f,disabled:d,form:m,name:g,onCheckedChange:y,required:v,value:b="on",internal_do_not_use_render:_}=a,[A,C]=Ma({prop:u,defaultProp:f??!1,onChange:y,caller:Ho}),[w,x]=S.useState(null),[N,z]=S.useState(null),U=S.useRef(!1),B=w?!!m||!!w.closest("form"):!0,X={checked:A,disabled:d,setChecked:C,control:w,setControl:x,name:g,form:m,value:b,hasConsumerStoppedPropagationRef:U,required:v,defaultChecked:rl(f)?!1:f,isFormControl:B,bubbleInput:N,setBubbleInput:z};return s.jsx(c_,{scope:r,...X,children:s_(_)?_(X):c})}var ly="CheckboxTrigger",ay=S.forwardRef(({__scopeCheckbox:a,onKeyDown:r,onClick:u,...c},f)=>{const{control:d,value:m,disabled:g,checked:y,required:v,setControl:b,setChecked:_,hasConsumerStoppedPropagationRef:A,isFormControl:C,bubbleInput:w}=ef(ly,a),x=Ye(f,b),N=S.useRef(y);return S.useEffect(()=>{const z=d==null?void 0:d.form;if(z){const U=()=>_(N.current);return z.addEventListener("reset",U),()=>z.removeEventListener("reset",U)}},[d,_]),s.jsx(Te.button,{type:"button",role:"checkbox","aria-checked":rl(y)?"mixed":y,"aria-required":v,"data-state":sy(y),"data-disabled":g?"":void 0,disabled:g,value:m,...c,ref:x,onKeyDown:je(r,z=>{z.key==="Enter"&&z.preventDefault()}),onClick:je(u,z=>{_(U=>rl(U)?!0:!U),w&&C&&(A.current=z.isPropagationStopped(),A.current||z.stopPropagation())})})});ay.displayName=ly;var iy=S.forwardRef((a,r)=>{const{__scopeCheckbox:u,name:c,checked:f,defaultChecked:d,required:m,disabled:g,value:y,onCheckedChange:v,form:b,..._}=a;return s.jsx(u_,{__scopeCheckbox:u,checked:f,defaultChecked:d,disabled:g,required:m,onCheckedChange:v,name:c,form:b,value:y,internal_do_not_use_render:({isFormControl:A})=>s.jsxs(s.Fragment,{children:[s.jsx(ay,{..._,ref:r,__scopeCheckbox:u}),A&&s.jsx(uy,{__scopeCheckbox:u})]})})});iy.displayName=Ho;var ry="CheckboxIndicator",oy=S.forwardRef((a,r)=>{const{__scopeCheckbox:u,forceMount:c,...f}=a,d=ef(ry,u);return s.jsx(Ua,{present:c||rl(d.checked)||d.checked===!0,children:s.jsx(Te.span,{"data-state":sy(d.checked),"data-disabled":d.disabled?"":void 0,...f,ref:r,style:{pointerEvents:"none",...a.style}})})});oy.displayName=ry;var cy="CheckboxBubbleInput",uy=S.forwardRef(({__scopeCheckbox:a,...r},u)=>{const{control:c,hasConsumerStoppedPropagationRef:f,checked:d,defaultChecked:m,required:g,disabled:y,name:v,value:b,form:_,bubbleInput:A,setBubbleInput:C}=ef(cy,a),w=Ye(u,C),x=Cp(d),N=yp(c);S.useEffect(()=>{const U=A;if(!U)return;const B=window.HTMLInputElement.prototype,G=Object.getOwnPropertyDescriptor(B,"checked").set,W=!f.current;if(x!==d&&G){const J=new Event("click",{bubbles:W});U.indeterminate=rl(d),G.call(U,rl(d)?!1:d),U.dispatchEvent(J)}},[A,x,d,f]);const z=S.useRef(rl(d)?!1:d);return s.jsx(Te.input,{type:"checkbox","aria-hidden":!0,defaultChecked:m??z.current,required:g,disabled:y,name:v,value:b,form:_,...r,tabIndex:-1,ref:w,style:{...r.style,...N,position:"absolute",pointerEvents:"none",opacity:0,margin:0,transform:"translateX(-100%)"}})});uy.displayName=cy;function s_(a){return typeof a=="function"}function rl(a){return a==="indeterminate"}function sy(a){return rl(a)?"indeterminate":a?"checked":"unchecked"}function gs({className:a,...r}){return s.jsx(iy,{"data-slot":"checkbox",className:Oe("peer border-input dark:bg-input/30 data-[state=checked]:bg-primary data-[state=checked]:text-primary-foreground dark:data-[state=checked]:bg-primary data-[state=checked]:border-primary focus-visible:border-ring focus-visible:ring-ring/50 aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive size-4 shrink-0 rounded-[4px] border shadow-xs transition-shadow outline-none focus-visible:ring-[3px] disabled:cursor-not-allowed disabled:opacity-50",a),...r,children:s.jsx(oy,{"data-slot":"checkbox-indicator",className:"flex items-center justify-center text-current transition-none",children:s.jsx(bg,{className:"size-3.5"})})})}var f_="Separator",Bv="horizontal",d_=["horizontal","vertical"],fy=S.forwardRef((a,r)=>{const{decorative:u,orientation:c=Bv,...f}=a,d=h_(c)?c:Bv,g=u?{role:"none"}:{"aria-orientation":d==="vertical"?d:void 0,role:"separator"};return s.jsx(Te.div,{"data-orientation":d,...g,...f,ref:r})});fy.displayName=f_;function h_(a){return d_.includes(a)}var m_=fy;function v_({className:a,orientation:r="horizontal",decorative:u=!0,...c}){return s.jsx(m_,{"data-slot":"separator-root",decorative:u,orientation:r,className:Oe("bg-border shrink-0 data-[orientation=horizontal]:h-px data-[orientation=horizontal]:w-full data-[orientation=vertical]:h-full data-[orientation=vertical]:w-px",a),...c})}const g_=({customers:a,onAddReport:r,onReportCreated:u})=>{const[c,f]=S.useState({customer_id:"",audit_date:new Date().toISOString().split("T")[0],author:"Ralf Hartmann",author_phone:"0173 / 135 90 00",author_email:"rh@haral.eu",focus_goals:[],machine_manufacturer:"",machine_type:"",machine_model:"",machine_number:"",machine_year:"",machine_quantity:1,machine_features:[],palette_type:"",palette_length:"",palette_width:"",palette_weight:"",packaging_types:[],foil_supplier:"",foil_manufacturer:"",foil_article_number:"",foil_thickness:"",foil_height:"",foil_roll_weight:"",foil_work_area:""}),d=["Folienverbrauch","CO2-Emissionen","Kosten"],m=["Doppelkante","ERS Zusatzmodul"],g=[{value:"euro",label:"Euro",length:120,width:80},{value:"duesseldorfer",label:"Düsseldorfer",length:80,width:60},{value:"custom",label:"Benutzerdefiniert",length:"",width:""}],y=["Kartonagen","PET-Flaschen","Bechersteigen","Sackware"],v=(w,x)=>{f(N=>({...N,[w]:x}))},b=(w,x,N)=>{f(z=>({...z,[w]:N?[...z[w],x]:z[w].filter(U=>U!==x)}))},_=w=>{const x=g.find(N=>N.value===w);f(N=>({...N,palette_type:w,palette_length:(x==null?void 0:x.length)||"",palette_width:(x==null?void 0:x.width)||""}))},A=w=>{var N;if(w.preventDefault(),!c.customer_id){alert("Bitte wählen Sie einen Kunden aus.");return}const x={...c,title:`Prüfbericht - ${(N=a.find(z=>z.id==c.customer_id))==null?void 0:N.company_name}`,content:c};r(x),f({customer_id:"",audit_date:new Date().toISOString().split("T")[0],author:"Ralf Hartmann",author_phone:"0173 / 135 90 00",author_email:"rh@haral.eu",focus_goals:[],machine_manufacturer:"",machine_type:"",machine_model:"",machine_number:"",machine_year:"",machine_quantity:1,machine_features:[],palette_type:"",palette_length:"",palette_width:"",palette_weight:"",packaging_types:[],foil_supplier:"",foil_manufacturer:"",foil_article_number:"",foil_thickness:"",foil_height:"",foil_roll_weight:"",foil_work_area:""}),alert("Prüfbericht wurde erfolgreich erstellt!"),u()},C=a.find(w=>w.id==c.customer_id);return s.jsxs("div",{className:"space-y-6",children:[s.jsx("div",{className:"flex justify-between items-center",children:s.jsxs("div",{children:[s.jsx("h2",{className:"text-3xl font-bold tracking-tight",children:"Neuer Prüfbericht"}),s.jsx("p",{className:"text-muted-foreground",children:"Erstellen Sie einen neuen Prüfbericht für einen Kunden"})]})}),s.jsxs("form",{onSubmit:A,className:"space-y-6",children:[s.jsxs(Mt,{children:[s.jsxs(Dt,{children:[s.jsx(zt,{children:"Kunde auswählen"}),s.jsx(cn,{children:"Wählen Sie den Kunden für diesen Prüfbericht aus"})]}),s.jsx(kt,{children:s.jsxs("div",{className:"space-y-4",children:[s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"customer",children:"Kunde *"}),s.jsxs(Mv,{value:c.customer_id,onValueChange:w=>v("customer_id",w),children:[s.jsx(zv,{children:s.jsx(Dv,{placeholder:"Kunde auswählen..."})}),s.jsx(kv,{children:a.map(w=>s.jsx(Uv,{value:w.id.toString(),children:w.company_name},w.id))})]})]}),C&&s.jsxs("div",{className:"p-4 bg-muted rounded-lg",children:[s.jsx("h4",{className:"font-semibold mb-2",children:"Kundendaten"}),s.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[s.jsxs("div",{children:[s.jsx("strong",{children:"Firma:"})," ",C.company_name]}),s.jsxs("div",{children:[s.jsx("strong",{children:"Ansprechpartner:"})," ",C.contact_person]}),s.jsxs("div",{children:[s.jsx("strong",{children:"Adresse:"})," ",C.street,", ",C.postal_code," ",C.city]})]})]})]})})]}),s.jsxs(Mt,{children:[s.jsxs(Dt,{children:[s.jsx(zt,{children:"Audit-Informationen"}),s.jsx(cn,{children:"Grundlegende Informationen zum Audit"})]}),s.jsx(kt,{children:s.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:[s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"audit_date",children:"Datum *"}),s.jsx(Ge,{id:"audit_date",type:"date",value:c.audit_date,onChange:w=>v("audit_date",w.target.value),required:!0})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"author",children:"Verfasser *"}),s.jsx(Ge,{id:"author",value:c.author,onChange:w=>v("author",w.target.value),required:!0})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"author_phone",children:"Telefon"}),s.jsx(Ge,{id:"author_phone",value:c.author_phone,onChange:w=>v("author_phone",w.target.value)})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"author_email",children:"E-Mail"}),s.jsx(Ge,{id:"author_email",type:"email",value:c.author_email,onChange:w=>v("author_email",w.target.value)})]})]})})]}),s.jsxs(Mt,{children:[s.jsxs(Dt,{children:[s.jsx(zt,{children:"Fokus und Ziele"}),s.jsx(cn,{children:"Wählen Sie die Schwerpunkte für diesen Prüfbericht"})]}),s.jsx(kt,{children:s.jsx("div",{className:"space-y-3",children:d.map(w=>s.jsxs("div",{className:"flex items-center space-x-2",children:[s.jsx(gs,{id:`focus_${w}`,checked:c.focus_goals.includes(w),onCheckedChange:x=>b("focus_goals",w,x)}),s.jsx(Ce,{htmlFor:`focus_${w}`,children:w})]},w))})})]}),s.jsxs(Mt,{children:[s.jsxs(Dt,{children:[s.jsx(zt,{children:"Wickelanlage"}),s.jsx(cn,{children:"Technische Daten der Wickelanlage"})]}),s.jsx(kt,{children:s.jsxs("div",{className:"space-y-4",children:[s.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:[s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"machine_manufacturer",children:"Hersteller"}),s.jsx(Ge,{id:"machine_manufacturer",value:c.machine_manufacturer,onChange:w=>v("machine_manufacturer",w.target.value),placeholder:"z.B. Motion"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"machine_type",children:"Automatentyp"}),s.jsx(Ge,{id:"machine_type",value:c.machine_type,onChange:w=>v("machine_type",w.target.value),placeholder:"z.B. Roboter"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"machine_model",children:"Modell"}),s.jsx(Ge,{id:"machine_model",value:c.machine_model,onChange:w=>v("machine_model",w.target.value),placeholder:"z.B. S243464"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"machine_number",children:"Maschinennummer"}),s.jsx(Ge,{id:"machine_number",value:c.machine_number,onChange:w=>v("machine_number",w.target.value)})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"machine_year",children:"Baujahr"}),s.jsx(Ge,{id:"machine_year",type:"number",value:c.machine_year,onChange:w=>v("machine_year",w.target.value),placeholder:"z.B. 2020"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"machine_quantity",children:"Anzahl"}),s.jsx(Ge,{id:"machine_quantity",type:"number",value:c.machine_quantity,onChange:w=>v("machine_quantity",w.target.value),min:"1"})]})]}),s.jsx(v_,{}),s.jsxs("div",{children:[s.jsx(Ce,{children:"Besonderheiten"}),s.jsx("div",{className:"mt-2 space-y-3",children:m.map(w=>s.jsxs("div",{className:"flex items-center space-x-2",children:[s.jsx(gs,{id:`feature_${w}`,checked:c.machine_features.includes(w),onCheckedChange:x=>b("machine_features",w,x)}),s.jsx(Ce,{htmlFor:`feature_${w}`,children:w})]},w))})]})]})})]}),s.jsxs(Mt,{children:[s.jsxs(Dt,{children:[s.jsx(zt,{children:"Palette"}),s.jsx(cn,{children:"Spezifikationen der verwendeten Palette"})]}),s.jsx(kt,{children:s.jsxs("div",{className:"space-y-4",children:[s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"palette_type",children:"Palettentyp"}),s.jsxs(Mv,{value:c.palette_type,onValueChange:_,children:[s.jsx(zv,{children:s.jsx(Dv,{placeholder:"Palettentyp auswählen..."})}),s.jsx(kv,{children:g.map(w=>s.jsx(Uv,{value:w.value,children:w.label},w.value))})]})]}),s.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-4",children:[s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"palette_length",children:"Länge (cm)"}),s.jsx(Ge,{id:"palette_length",type:"number",value:c.palette_length,onChange:w=>v("palette_length",w.target.value),disabled:c.palette_type!=="custom"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"palette_width",children:"Breite (cm)"}),s.jsx(Ge,{id:"palette_width",type:"number",value:c.palette_width,onChange:w=>v("palette_width",w.target.value),disabled:c.palette_type!=="custom"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"palette_weight",children:"Gewicht (kg)"}),s.jsx(Ge,{id:"palette_weight",type:"number",value:c.palette_weight,onChange:w=>v("palette_weight",w.target.value),placeholder:"z.B. 1200"})]})]})]})})]}),s.jsxs(Mt,{children:[s.jsxs(Dt,{children:[s.jsx(zt,{children:"Packgut"}),s.jsx(cn,{children:"Art des zu verpackenden Guts"})]}),s.jsx(kt,{children:s.jsx("div",{className:"space-y-3",children:y.map(w=>s.jsxs("div",{className:"flex items-center space-x-2",children:[s.jsx(gs,{id:`packaging_${w}`,checked:c.packaging_types.includes(w),onCheckedChange:x=>b("packaging_types",w,x)}),s.jsx(Ce,{htmlFor:`packaging_${w}`,children:w})]},w))})})]}),s.jsxs(Mt,{children:[s.jsxs(Dt,{children:[s.jsx(zt,{children:"Folie"}),s.jsx(cn,{children:"Spezifikationen der verwendeten Folie"})]}),s.jsx(kt,{children:s.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:[s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"foil_supplier",children:"Folienlieferant"}),s.jsx(Ge,{id:"foil_supplier",value:c.foil_supplier,onChange:w=>v("foil_supplier",w.target.value),placeholder:"z.B. Tecnifol"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"foil_manufacturer",children:"Hersteller"}),s.jsx(Ge,{id:"foil_manufacturer",value:c.foil_manufacturer,onChange:w=>v("foil_manufacturer",w.target.value),placeholder:"z.B. unbekannt"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"foil_article_number",children:"Artikelnummer"}),s.jsx(Ge,{id:"foil_article_number",value:c.foil_article_number,onChange:w=>v("foil_article_number",w.target.value)})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"foil_thickness",children:"Folien-Dicke (μm)"}),s.jsx(Ge,{id:"foil_thickness",type:"number",value:c.foil_thickness,onChange:w=>v("foil_thickness",w.target.value),placeholder:"z.B. 23"})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"foil_height",children:"Folien-Höhe (mm)"}),s.jsx(Ge,{id:"foil_height",type:"number",value:c.foil_height,onChange:w=>v("foil_height",w.target.value)})]}),s.jsxs("div",{children:[s.jsx(Ce,{htmlFor:"foil_roll_weight",children:"Rollengewicht mit Kern (kg)"}),s.jsx(Ge,{id:"foil_roll_weight",type:"number",value:c.foil_roll_weight,onChange:w=>v("foil_roll_weight",w.target.value)})]}),s.jsxs("div",{className:"md:col-span-2",children:[s.jsx(Ce,{htmlFor:"foil_work_area",children:"Arbeitsbereich (mm)"}),s.jsx(Ge,{id:"foil_work_area",type:"number",value:c.foil_work_area,onChange:w=>v("foil_work_area",w.target.value),placeholder:"z.B. 250"})]})]})})]}),s.jsxs("div",{className:"flex justify-end space-x-4",children:[s.jsxs(mt,{type:"button",variant:"outline",children:[s.jsx(N1,{className:"h-4 w-4 mr-2"}),"Als Entwurf speichern"]}),s.jsxs(mt,{type:"submit",children:[s.jsx(Na,{className:"h-4 w-4 mr-2"}),"Bericht erstellen"]})]})]})]})},p_=({reports:a,customers:r})=>{const[u,c]=S.useState(null),[f,d]=S.useState(!1),m=A=>{const C=r.find(w=>w.id==A);return C?C.company_name:"Unbekannter Kunde"},g=A=>{const C={draft:{label:"Entwurf",variant:"secondary"},completed:{label:"Abgeschlossen",variant:"default"},archived:{label:"Archiviert",variant:"outline"}},w=C[A]||C.draft;return s.jsx(qi,{variant:w.variant,children:w.label})},y=A=>{c(A),d(!0)},v=A=>{alert(`PDF-Download für Bericht "${A.title}" wird vorbereitet...`)},b=A=>{window.confirm(`Möchten Sie den Bericht "${A.title}" wirklich löschen?`)&&alert("Bericht wurde gelöscht.")},_=A=>new Date(A).toLocaleDateString("de-DE",{year:"numeric",month:"2-digit",day:"2-digit"});return s.jsxs("div",{className:"space-y-6",children:[s.jsx("div",{className:"flex justify-between items-center",children:s.jsxs("div",{children:[s.jsx("h2",{className:"text-3xl font-bold tracking-tight",children:"Prüfberichte"}),s.jsx("p",{className:"text-muted-foreground",children:"Übersicht aller erstellten Prüfberichte"})]})}),s.jsxs(Mt,{children:[s.jsxs(Dt,{children:[s.jsxs(zt,{children:["Berichte (",a.length,")"]}),s.jsx(cn,{children:"Alle erstellten und gespeicherten Prüfberichte"})]}),s.jsx(kt,{children:a.length===0?s.jsxs("div",{className:"text-center py-8",children:[s.jsx(Na,{className:"h-12 w-12 text-muted-foreground mx-auto mb-4"}),s.jsx("h3",{className:"text-lg font-semibold mb-2",children:"Keine Berichte vorhanden"}),s.jsx("p",{className:"text-muted-foreground mb-4",children:"Erstellen Sie Ihren ersten Prüfbericht, um zu beginnen."})]}):s.jsxs(ap,{children:[s.jsx(ip,{children:s.jsxs(_o,{children:[s.jsx(Ut,{children:"Titel"}),s.jsx(Ut,{children:"Kunde"}),s.jsx(Ut,{children:"Audit-Datum"}),s.jsx(Ut,{children:"Verfasser"}),s.jsx(Ut,{children:"Status"}),s.jsx(Ut,{children:"Erstellt"}),s.jsx(Ut,{className:"text-right",children:"Aktionen"})]})}),s.jsx(rp,{children:a.map(A=>s.jsxs(_o,{children:[s.jsx(Bt,{className:"font-medium",children:s.jsxs("div",{className:"flex items-center gap-2",children:[s.jsx(Na,{className:"h-4 w-4 text-muted-foreground"}),A.title]})}),s.jsx(Bt,{children:s.jsxs("div",{className:"flex items-center gap-2",children:[s.jsx(Ss,{className:"h-4 w-4 text-muted-foreground"}),m(A.customer_id)]})}),s.jsx(Bt,{children:s.jsxs("div",{className:"flex items-center gap-2",children:[s.jsx(v1,{className:"h-4 w-4 text-muted-foreground"}),_(A.audit_date)]})}),s.jsx(Bt,{children:s.jsxs("div",{className:"flex items-center gap-2",children:[s.jsx(wg,{className:"h-4 w-4 text-muted-foreground"}),A.author]})}),s.jsx(Bt,{children:g(A.status)}),s.jsx(Bt,{children:_(A.created_at)}),s.jsx(Bt,{className:"text-right",children:s.jsxs("div",{className:"flex items-center justify-end gap-2",children:[s.jsx(mt,{variant:"outline",size:"sm",onClick:()=>y(A),children:s.jsx(w1,{className:"h-4 w-4"})}),s.jsx(mt,{variant:"outline",size:"sm",onClick:()=>v(A),children:s.jsx(ws,{className:"h-4 w-4"})}),s.jsx(mt,{variant:"outline",size:"sm",onClick:()=>b(A),className:"text-destructive hover:text-destructive",children:s.jsx(Sg,{className:"h-4 w-4"})})]})})]},A.id))})]})})]}),s.jsx(Ig,{open:f,onOpenChange:d,children:s.jsxs(ep,{className:"max-w-4xl max-h-[80vh] overflow-y-auto",children:[s.jsxs(tp,{children:[s.jsx(np,{children:"Berichtsvorschau"}),s.jsx(lp,{children:"Vorschau des Prüfberichts"})]}),u&&s.jsxs("div",{className:"space-y-6",children:[s.jsxs("div",{className:"border-b pb-4",children:[s.jsx("h1",{className:"text-2xl font-bold mb-2",children:u.title}),s.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[s.jsxs("div",{children:[s.jsx("strong",{children:"Kunde:"})," ",m(u.customer_id)]}),s.jsxs("div",{children:[s.jsx("strong",{children:"Audit-Datum:"})," ",_(u.audit_date)]}),s.jsxs("div",{children:[s.jsx("strong",{children:"Verfasser:"})," ",u.author]}),s.jsxs("div",{children:[s.jsx("strong",{children:"Status:"})," ",g(u.status)]})]})]}),s.jsxs("div",{children:[s.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Audit-Informationen"}),s.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[s.jsxs("div",{children:[s.jsx("strong",{children:"Telefon:"})," ",u.author_phone]}),s.jsxs("div",{children:[s.jsx("strong",{children:"E-Mail:"})," ",u.author_email]})]})]}),u.focus_goals&&u.focus_goals.length>0&&s.jsxs("div",{children:[s.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Fokus und Ziele"}),s.jsx("div",{className:"flex flex-wrap gap-2",children:u.focus_goals.map((A,C)=>s.jsx(qi,{variant:"secondary",children:A},C))})]}),s.jsxs("div",{children:[s.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Wickelanlage"}),s.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[u.machine_manufacturer&&s.jsxs("div",{children:[s.jsx("strong",{children:"Hersteller:"})," ",u.machine_manufacturer]}),u.machine_type&&s.jsxs("div",{children:[s.jsx("strong",{children:"Typ:"})," ",u.machine_type]}),u.machine_model&&s.jsxs("div",{children:[s.jsx("strong",{children:"Modell:"})," ",u.machine_model]}),u.machine_year&&s.jsxs("div",{children:[s.jsx("strong",{children:"Baujahr:"})," ",u.machine_year]}),u.machine_quantity&&s.jsxs("div",{children:[s.jsx("strong",{children:"Anzahl:"})," ",u.machine_quantity]})]}),u.machine_features&&u.machine_features.length>0&&s.jsxs("div",{className:"mt-2",children:[s.jsx("strong",{children:"Besonderheiten:"}),s.jsx("div",{className:"flex flex-wrap gap-2 mt-1",children:u.machine_features.map((A,C)=>s.jsx(qi,{variant:"outline",children:A},C))})]})]}),u.palette_type&&s.jsxs("div",{children:[s.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Palette"}),s.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[s.jsxs("div",{children:[s.jsx("strong",{children:"Typ:"})," ",u.palette_type]}),u.palette_length&&s.jsxs("div",{children:[s.jsx("strong",{children:"Länge:"})," ",u.palette_length," cm"]}),u.palette_width&&s.jsxs("div",{children:[s.jsx("strong",{children:"Breite:"})," ",u.palette_width," cm"]}),u.palette_weight&&s.jsxs("div",{children:[s.jsx("strong",{children:"Gewicht:"})," ",u.palette_weight," kg"]})]})]}),u.packaging_types&&u.packaging_types.length>0&&s.jsxs("div",{children:[s.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Packgut"}),s.jsx("div",{className:"flex flex-wrap gap-2",children:u.packaging_types.map((A,C)=>s.jsx(qi,{variant:"secondary",children:A},C))})]}),s.jsxs("div",{children:[s.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Folie"}),s.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[u.foil_supplier&&s.jsxs("div",{children:[s.jsx("strong",{children:"Lieferant:"})," ",u.foil_supplier]}),u.foil_manufacturer&&s.jsxs("div",{children:[s.jsx("strong",{children:"Hersteller:"})," ",u.foil_manufacturer]}),u.foil_thickness&&s.jsxs("div",{children:[s.jsx("strong",{children:"Dicke:"})," ",u.foil_thickness," μm"]}),u.foil_height&&s.jsxs("div",{children:[s.jsx("strong",{children:"Höhe:"})," ",u.foil_height," mm"]}),u.foil_work_area&&s.jsxs("div",{children:[s.jsx("strong",{children:"Arbeitsbereich:"})," ",u.foil_work_area," mm"]})]})]}),s.jsxs("div",{className:"flex justify-end space-x-2 pt-4 border-t",children:[s.jsx(mt,{variant:"outline",onClick:()=>d(!1),children:"Schließen"}),s.jsxs(mt,{onClick:()=>v(u),children:[s.jsx(ws,{className:"h-4 w-4 mr-2"}),"PDF herunterladen"]})]})]})]})})]})};function y_(){const[a,r]=S.useState("dashboard"),[u,c]=S.useState([{id:1,company_name:"IGM GmbH & Co. KG Fenster und Fassaden",contact_person:"Marius Veith",street:"Hinter Inghell",postal_code:"67744",city:"Medard",logo_path:null,created_at:new Date().toISOString()}]),[f,d]=S.useState([]),m=b=>{const _={...b,id:u.length+1,created_at:new Date().toISOString()};c([...u,_])},g=(b,_)=>{c(u.map(A=>A.id===b?{...A,..._}:A))},y=b=>{c(u.filter(_=>_.id!==b)),d(f.filter(_=>_.customer_id!==b))},v=b=>{const _={...b,id:f.length+1,created_at:new Date().toISOString(),status:"draft"};d([...f,_])};return s.jsxs("div",{className:"min-h-screen bg-gray-50",children:[s.jsx("header",{className:"bg-white shadow-sm border-b",children:s.jsx("div",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8",children:s.jsxs("div",{className:"flex justify-between items-center h-16",children:[s.jsxs("div",{className:"flex items-center",children:[s.jsx(Na,{className:"h-8 w-8 text-blue-600 mr-3"}),s.jsx("h1",{className:"text-2xl font-bold text-gray-900",children:"HARAL Prüfbericht Generator"})]}),s.jsx("div",{className:"flex items-center space-x-4",children:s.jsxs("span",{className:"text-sm text-gray-500",children:[u.length," Kunden • ",f.length," Berichte"]})})]})})}),s.jsx("main",{className:"max-w-7xl mx-auto px-4 sm:px-6 lg:px-8 py-8",children:s.jsxs(r1,{value:a,onValueChange:r,className:"w-full",children:[s.jsxs(o1,{className:"grid w-full grid-cols-4 mb-8",children:[s.jsxs(so,{value:"dashboard",className:"flex items-center gap-2",children:[s.jsx(Na,{className:"h-4 w-4"}),"Dashboard"]}),s.jsxs(so,{value:"customers",className:"flex items-center gap-2",children:[s.jsx(rs,{className:"h-4 w-4"}),"Kunden"]}),s.jsxs(so,{value:"new-report",className:"flex items-center gap-2",children:[s.jsx(So,{className:"h-4 w-4"}),"Neuer Bericht"]}),s.jsxs(so,{value:"reports",className:"flex items-center gap-2",children:[s.jsx(ws,{className:"h-4 w-4"}),"Berichte"]})]}),s.jsxs(fo,{value:"dashboard",className:"space-y-6",children:[s.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-3 gap-6",children:[s.jsxs(Mt,{children:[s.jsxs(Dt,{className:"flex flex-row items-center justify-between space-y-0 pb-2",children:[s.jsx(zt,{className:"text-sm font-medium",children:"Gesamt Kunden"}),s.jsx(rs,{className:"h-4 w-4 text-muted-foreground"})]}),s.jsxs(kt,{children:[s.jsx("div",{className:"text-2xl font-bold",children:u.length}),s.jsx("p",{className:"text-xs text-muted-foreground",children:"Aktive Kunden im System"})]})]}),s.jsxs(Mt,{children:[s.jsxs(Dt,{className:"flex flex-row items-center justify-between space-y-0 pb-2",children:[s.jsx(zt,{className:"text-sm font-medium",children:"Berichte"}),s.jsx(Na,{className:"h-4 w-4 text-muted-foreground"})]}),s.jsxs(kt,{children:[s.jsx("div",{className:"text-2xl font-bold",children:f.length}),s.jsx("p",{className:"text-xs text-muted-foreground",children:"Erstellte Prüfberichte"})]})]}),s.jsxs(Mt,{children:[s.jsxs(Dt,{className:"flex flex-row items-center justify-between space-y-0 pb-2",children:[s.jsx(zt,{className:"text-sm font-medium",children:"Letzte Aktivität"}),s.jsx(R1,{className:"h-4 w-4 text-muted-foreground"})]}),s.jsxs(kt,{children:[s.jsx("div",{className:"text-2xl font-bold",children:f.length>0?"Heute":"Keine"}),s.jsx("p",{className:"text-xs text-muted-foreground",children:"Letzte Berichtserstellung"})]})]})]}),s.jsxs(Mt,{children:[s.jsxs(Dt,{children:[s.jsx(zt,{children:"Willkommen bei HARAL Prüfbericht Generator"}),s.jsx(cn,{children:"Erstellen Sie professionelle Prüfberichte für Ihre Kunden mit wenigen Klicks."})]}),s.jsxs(kt,{className:"space-y-4",children:[s.jsxs("div",{className:"grid grid-cols-1 md:grid-cols-2 gap-4",children:[s.jsxs(mt,{onClick:()=>r("customers"),className:"h-20 flex flex-col items-center justify-center space-y-2",children:[s.jsx(rs,{className:"h-6 w-6"}),s.jsx("span",{children:"Kunden verwalten"})]}),s.jsxs(mt,{onClick:()=>r("new-report"),className:"h-20 flex flex-col items-center justify-center space-y-2",disabled:u.length===0,children:[s.jsx(So,{className:"h-6 w-6"}),s.jsx("span",{children:"Neuen Bericht erstellen"})]})]}),u.length===0&&s.jsx("p",{className:"text-sm text-muted-foreground text-center",children:"Fügen Sie zuerst einen Kunden hinzu, um Berichte erstellen zu können."})]})]})]}),s.jsx(fo,{value:"customers",children:s.jsx(d2,{customers:u,onAddCustomer:m,onUpdateCustomer:g,onDeleteCustomer:y})}),s.jsx(fo,{value:"new-report",children:s.jsx(g_,{customers:u,onAddReport:v,onReportCreated:()=>r("reports")})}),s.jsx(fo,{value:"reports",children:s.jsx(p_,{reports:f,customers:u})})]})})]})}qb.createRoot(document.getElementById("root")).render(s.jsx(S.StrictMode,{children:s.jsx(y_,{})}));
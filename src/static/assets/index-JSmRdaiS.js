@@ -1,155 +0,0 @@
-function sy(n,u){for(var s=0;s<u.length;s++){const c=u[s];if(typeof c!="string"&&!Array.isArray(c)){for(const f in c)if(f!=="default"&&!(f in n)){const h=Object.getOwnPropertyDescriptor(c,f);h&&Object.defineProperty(n,f,h.get?h:{enumerable:!0,get:()=>c[f]})}}}return Object.freeze(Object.defineProperty(n,Symbol.toStringTag,{value:"Module"}))}(function(){const u=document.createElement("link").relList;if(u&&u.supports&&u.supports("modulepreload"))return;for(const f of document.querySelectorAll('link[rel="modulepreload"]'))c(f);new MutationObserver(f=>{for(const h of f)if(h.type==="childList")for(const g of h.addedNodes)g.tagName==="LINK"&&g.rel==="modulepreload"&&c(g)}).observe(document,{childList:!0,subtree:!0});function s(f){const h={};return f.integrity&&(h.integrity=f.integrity),f.referrerPolicy&&(h.referrerPolicy=f.referrerPolicy),f.crossOrigin==="use-credentials"?h.credentials="include":f.crossOrigin==="anonymous"?h.credentials="omit":h.credentials="same-origin",h}function c(f){if(f.ep)return;f.ep=!0;const h=s(f);fetch(f.href,h)}})();function Cm(n){return n&&n.__esModule&&Object.prototype.hasOwnProperty.call(n,"default")?n.default:n}var ds={exports:{}},ii={};/**
- * @license React
- * react-jsx-runtime.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Xh;function oy(){if(Xh)return ii;Xh=1;var n=Symbol.for("react.transitional.element"),u=Symbol.for("react.fragment");function s(c,f,h){var g=null;if(h!==void 0&&(g=""+h),f.key!==void 0&&(g=""+f.key),"key"in f){h={};for(var p in f)p!=="key"&&(h[p]=f[p])}else h=f;return f=h.ref,{$$typeof:n,type:c,key:g,ref:f!==void 0?f:null,props:h}}return ii.Fragment=u,ii.jsx=s,ii.jsxs=s,ii}var Qh;function fy(){return Qh||(Qh=1,ds.exports=oy()),ds.exports}var o=fy(),hs={exports:{}},ue={};/**
- * @license React
- * react.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Zh;function dy(){if(Zh)return ue;Zh=1;var n=Symbol.for("react.transitional.element"),u=Symbol.for("react.portal"),s=Symbol.for("react.fragment"),c=Symbol.for("react.strict_mode"),f=Symbol.for("react.profiler"),h=Symbol.for("react.consumer"),g=Symbol.for("react.context"),p=Symbol.for("react.forward_ref"),y=Symbol.for("react.suspense"),m=Symbol.for("react.memo"),x=Symbol.for("react.lazy"),A=Symbol.iterator;function S(_){return _===null||typeof _!="object"?null:(_=A&&_[A]||_["@@iterator"],typeof _=="function"?_:null)}var N={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},C=Object.assign,T={};function B(_,G,F){this.props=_,this.context=G,this.refs=T,this.updater=F||N}B.prototype.isReactComponent={},B.prototype.setState=function(_,G){if(typeof _!="object"&&typeof _!="function"&&_!=null)throw Error("takes an object of state variables to update or a function which returns an object of state variables.");this.updater.enqueueSetState(this,_,G,"setState")},B.prototype.forceUpdate=function(_){this.updater.enqueueForceUpdate(this,_,"forceUpdate")};function z(){}z.prototype=B.prototype;function H(_,G,F){this.props=_,this.context=G,this.refs=T,this.updater=F||N}var V=H.prototype=new z;V.constructor=H,C(V,B.prototype),V.isPureReactComponent=!0;var $=Array.isArray,Z={H:null,A:null,T:null,S:null,V:null},ce=Object.prototype.hasOwnProperty;function te(_,G,F,X,W,he){return F=he.ref,{$$typeof:n,type:_,key:G,ref:F!==void 0?F:null,props:he}}function J(_,G){return te(_.type,G,void 0,void 0,void 0,_.props)}function Q(_){return typeof _=="object"&&_!==null&&_.$$typeof===n}function de(_){var G={"=":"=0",":":"=2"};return"$"+_.replace(/[=:]/g,function(F){return G[F]})}var ze=/\/+/g;function Te(_,G){return typeof _=="object"&&_!==null&&_.key!=null?de(""+_.key):G.toString(36)}function Ut(){}function At(_){switch(_.status){case"fulfilled":return _.value;case"rejected":throw _.reason;default:switch(typeof _.status=="string"?_.then(Ut,Ut):(_.status="pending",_.then(function(G){_.status==="pending"&&(_.status="fulfilled",_.value=G)},function(G){_.status==="pending"&&(_.status="rejected",_.reason=G)})),_.status){case"fulfilled":return _.value;case"rejected":throw _.reason}}throw _}function Me(_,G,F,X,W){var he=typeof _;(he==="undefined"||he==="boolean")&&(_=null);var re=!1;if(_===null)re=!0;else switch(he){case"bigint":case"string":case"number":re=!0;break;case"object":switch(_.$$typeof){case n:case u:re=!0;break;case x:return re=_._init,Me(re(_._payload),G,F,X,W)}}if(re)return W=W(_),re=X===""?"."+Te(_,0):X,$(W)?(F="",re!=null&&(F=re.replace(ze,"$&/")+"/"),Me(W,G,F,"",function(ct){return ct})):W!=null&&(Q(W)&&(W=J(W,F+(W.key==null||_&&_.key===W.key?"":(""+W.key).replace(ze,"$&/")+"/")+re)),G.push(W)),1;re=0;var ge=X===""?".":X+":";if($(_))for(var we=0;we<_.length;we++)X=_[we],he=ge+Te(X,we),re+=Me(X,G,F,he,W);else if(we=S(_),typeof we=="function")for(_=we.call(_),we=0;!(X=_.next()).done;)X=X.value,he=ge+Te(X,we++),re+=Me(X,G,F,he,W);else if(he==="object"){if(typeof _.then=="function")return Me(At(_),G,F,X,W);throw G=String(_),Error("Objects are not valid as a React child (found: "+(G==="[object Object]"?"object with keys {"+Object.keys(_).join(", ")+"}":G)+"). If you meant to render a collection of children, use an array instead.")}return re}function U(_,G,F){if(_==null)return _;var X=[],W=0;return Me(_,X,"","",function(he){return G.call(F,he,W++)}),X}function K(_){if(_._status===-1){var G=_._result;G=G(),G.then(function(F){(_._status===0||_._status===-1)&&(_._status=1,_._result=F)},function(F){(_._status===0||_._status===-1)&&(_._status=2,_._result=F)}),_._status===-1&&(_._status=0,_._result=G)}if(_._status===1)return _._result.default;throw _._result}var Y=typeof reportError=="function"?reportError:function(_){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var G=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof _=="object"&&_!==null&&typeof _.message=="string"?String(_.message):String(_),error:_});if(!window.dispatchEvent(G))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",_);return}console.error(_)};function xe(){}return ue.Children={map:U,forEach:function(_,G,F){U(_,function(){G.apply(this,arguments)},F)},count:function(_){var G=0;return U(_,function(){G++}),G},toArray:function(_){return U(_,function(G){return G})||[]},only:function(_){if(!Q(_))throw Error("React.Children.only expected to receive a single React element child.");return _}},ue.Component=B,ue.Fragment=s,ue.Profiler=f,ue.PureComponent=H,ue.StrictMode=c,ue.Suspense=y,ue.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=Z,ue.__COMPILER_RUNTIME={__proto__:null,c:function(_){return Z.H.useMemoCache(_)}},ue.cache=function(_){return function(){return _.apply(null,arguments)}},ue.cloneElement=function(_,G,F){if(_==null)throw Error("The argument must be a React element, but you passed "+_+".");var X=C({},_.props),W=_.key,he=void 0;if(G!=null)for(re in G.ref!==void 0&&(he=void 0),G.key!==void 0&&(W=""+G.key),G)!ce.call(G,re)||re==="key"||re==="__self"||re==="__source"||re==="ref"&&G.ref===void 0||(X[re]=G[re]);var re=arguments.length-2;if(re===1)X.children=F;else if(1<re){for(var ge=Array(re),we=0;we<re;we++)ge[we]=arguments[we+2];X.children=ge}return te(_.type,W,void 0,void 0,he,X)},ue.createContext=function(_){return _={$$typeof:g,_currentValue:_,_currentValue2:_,_threadCount:0,Provider:null,Consumer:null},_.Provider=_,_.Consumer={$$typeof:h,_context:_},_},ue.createElement=function(_,G,F){var X,W={},he=null;if(G!=null)for(X in G.key!==void 0&&(he=""+G.key),G)ce.call(G,X)&&X!=="key"&&X!=="__self"&&X!=="__source"&&(W[X]=G[X]);var re=arguments.length-2;if(re===1)W.children=F;else if(1<re){for(var ge=Array(re),we=0;we<re;we++)ge[we]=arguments[we+2];W.children=ge}if(_&&_.defaultProps)for(X in re=_.defaultProps,re)W[X]===void 0&&(W[X]=re[X]);return te(_,he,void 0,void 0,null,W)},ue.createRef=function(){return{current:null}},ue.forwardRef=function(_){return{$$typeof:p,render:_}},ue.isValidElement=Q,ue.lazy=function(_){return{$$typeof:x,_payload:{_status:-1,_result:_},_init:K}},ue.memo=function(_,G){return{$$typeof:m,type:_,compare:G===void 0?null:G}},ue.startTransition=function(_){var G=Z.T,F={};Z.T=F;try{var X=_(),W=Z.S;W!==null&&W(F,X),typeof X=="object"&&X!==null&&typeof X.then=="function"&&X.then(xe,Y)}catch(he){Y(he)}finally{Z.T=G}},ue.unstable_useCacheRefresh=function(){return Z.H.useCacheRefresh()},ue.use=function(_){return Z.H.use(_)},ue.useActionState=function(_,G,F){return Z.H.useActionState(_,G,F)},ue.useCallback=function(_,G){return Z.H.useCallback(_,G)},ue.useContext=function(_){return Z.H.useContext(_)},ue.useDebugValue=function(){},ue.useDeferredValue=function(_,G){return Z.H.useDeferredValue(_,G)},ue.useEffect=function(_,G,F){var X=Z.H;if(typeof F=="function")throw Error("useEffect CRUD overload is not enabled in this build of React.");return X.useEffect(_,G)},ue.useId=function(){return Z.H.useId()},ue.useImperativeHandle=function(_,G,F){return Z.H.useImperativeHandle(_,G,F)},ue.useInsertionEffect=function(_,G){return Z.H.useInsertionEffect(_,G)},ue.useLayoutEffect=function(_,G){return Z.H.useLayoutEffect(_,G)},ue.useMemo=function(_,G){return Z.H.useMemo(_,G)},ue.useOptimistic=function(_,G){return Z.H.useOptimistic(_,G)},ue.useReducer=function(_,G,F){return Z.H.useReducer(_,G,F)},ue.useRef=function(_){return Z.H.useRef(_)},ue.useState=function(_){return Z.H.useState(_)},ue.useSyncExternalStore=function(_,G,F){return Z.H.useSyncExternalStore(_,G,F)},ue.useTransition=function(){return Z.H.useTransition()},ue.version="19.1.0",ue}var Kh;function Ls(){return Kh||(Kh=1,hs.exports=dy()),hs.exports}var b=Ls();const hy=Cm(b),Dm=sy({__proto__:null,default:hy},[b]);var ms={exports:{}},ri={},vs={exports:{}},ps={};/**
- * @license React
- * scheduler.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Jh;function my(){return Jh||(Jh=1,function(n){function u(U,K){var Y=U.length;U.push(K);e:for(;0<Y;){var xe=Y-1>>>1,_=U[xe];if(0<f(_,K))U[xe]=K,U[Y]=_,Y=xe;else break e}}function s(U){return U.length===0?null:U[0]}function c(U){if(U.length===0)return null;var K=U[0],Y=U.pop();if(Y!==K){U[0]=Y;e:for(var xe=0,_=U.length,G=_>>>1;xe<G;){var F=2*(xe+1)-1,X=U[F],W=F+1,he=U[W];if(0>f(X,Y))W<_&&0>f(he,X)?(U[xe]=he,U[W]=Y,xe=W):(U[xe]=X,U[F]=Y,xe=F);else if(W<_&&0>f(he,Y))U[xe]=he,U[W]=Y,xe=W;else break e}}return K}function f(U,K){var Y=U.sortIndex-K.sortIndex;return Y!==0?Y:U.id-K.id}if(n.unstable_now=void 0,typeof performance=="object"&&typeof performance.now=="function"){var h=performance;n.unstable_now=function(){return h.now()}}else{var g=Date,p=g.now();n.unstable_now=function(){return g.now()-p}}var y=[],m=[],x=1,A=null,S=3,N=!1,C=!1,T=!1,B=!1,z=typeof setTimeout=="function"?setTimeout:null,H=typeof clearTimeout=="function"?clearTimeout:null,V=typeof setImmediate<"u"?setImmediate:null;function $(U){for(var K=s(m);K!==null;){if(K.callback===null)c(m);else if(K.startTime<=U)c(m),K.sortIndex=K.expirationTime,u(y,K);else break;K=s(m)}}function Z(U){if(T=!1,$(U),!C)if(s(y)!==null)C=!0,ce||(ce=!0,Te());else{var K=s(m);K!==null&&Me(Z,K.startTime-U)}}var ce=!1,te=-1,J=5,Q=-1;function de(){return B?!0:!(n.unstable_now()-Q<J)}function ze(){if(B=!1,ce){var U=n.unstable_now();Q=U;var K=!0;try{e:{C=!1,T&&(T=!1,H(te),te=-1),N=!0;var Y=S;try{t:{for($(U),A=s(y);A!==null&&!(A.expirationTime>U&&de());){var xe=A.callback;if(typeof xe=="function"){A.callback=null,S=A.priorityLevel;var _=xe(A.expirationTime<=U);if(U=n.unstable_now(),typeof _=="function"){A.callback=_,$(U),K=!0;break t}A===s(y)&&c(y),$(U)}else c(y);A=s(y)}if(A!==null)K=!0;else{var G=s(m);G!==null&&Me(Z,G.startTime-U),K=!1}}break e}finally{A=null,S=Y,N=!1}K=void 0}}finally{K?Te():ce=!1}}}var Te;if(typeof V=="function")Te=function(){V(ze)};else if(typeof MessageChannel<"u"){var Ut=new MessageChannel,At=Ut.port2;Ut.port1.onmessage=ze,Te=function(){At.postMessage(null)}}else Te=function(){z(ze,0)};function Me(U,K){te=z(function(){U(n.unstable_now())},K)}n.unstable_IdlePriority=5,n.unstable_ImmediatePriority=1,n.unstable_LowPriority=4,n.unstable_NormalPriority=3,n.unstable_Profiling=null,n.unstable_UserBlockingPriority=2,n.unstable_cancelCallback=function(U){U.callback=null},n.unstable_forceFrameRate=function(U){0>U||125<U?console.error("forceFrameRate takes a positive int between 0 and 125, forcing frame rates higher than 125 fps is not supported"):J=0<U?Math.floor(1e3/U):5},n.unstable_getCurrentPriorityLevel=function(){return S},n.unstable_next=function(U){switch(S){case 1:case 2:case 3:var K=3;break;default:K=S}var Y=S;S=K;try{return U()}finally{S=Y}},n.unstable_requestPaint=function(){B=!0},n.unstable_runWithPriority=function(U,K){switch(U){case 1:case 2:case 3:case 4:case 5:break;default:U=3}var Y=S;S=U;try{return K()}finally{S=Y}},n.unstable_scheduleCallback=function(U,K,Y){var xe=n.unstable_now();switch(typeof Y=="object"&&Y!==null?(Y=Y.delay,Y=typeof Y=="number"&&0<Y?xe+Y:xe):Y=xe,U){case 1:var _=-1;break;case 2:_=250;break;case 5:_=1073741823;break;case 4:_=1e4;break;default:_=5e3}return _=Y+_,U={id:x++,callback:K,priorityLevel:U,startTime:Y,expirationTime:_,sortIndex:-1},Y>xe?(U.sortIndex=Y,u(m,U),s(y)===null&&U===s(m)&&(T?(H(te),te=-1):T=!0,Me(Z,Y-xe))):(U.sortIndex=_,u(y,U),C||N||(C=!0,ce||(ce=!0,Te()))),U},n.unstable_shouldYield=de,n.unstable_wrapCallback=function(U){var K=S;return function(){var Y=S;S=K;try{return U.apply(this,arguments)}finally{S=Y}}}}(ps)),ps}var $h;function vy(){return $h||($h=1,vs.exports=my()),vs.exports}var gs={exports:{}},tt={};/**
- * @license React
- * react-dom.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Fh;function py(){if(Fh)return tt;Fh=1;var n=Ls();function u(y){var m="https://react.dev/errors/"+y;if(1<arguments.length){m+="?args[]="+encodeURIComponent(arguments[1]);for(var x=2;x<arguments.length;x++)m+="&args[]="+encodeURIComponent(arguments[x])}return"Minified React error #"+y+"; visit "+m+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function s(){}var c={d:{f:s,r:function(){throw Error(u(522))},D:s,C:s,L:s,m:s,X:s,S:s,M:s},p:0,findDOMNode:null},f=Symbol.for("react.portal");function h(y,m,x){var A=3<arguments.length&&arguments[3]!==void 0?arguments[3]:null;return{$$typeof:f,key:A==null?null:""+A,children:y,containerInfo:m,implementation:x}}var g=n.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE;function p(y,m){if(y==="font")return"";if(typeof m=="string")return m==="use-credentials"?m:""}return tt.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE=c,tt.createPortal=function(y,m){var x=2<arguments.length&&arguments[2]!==void 0?arguments[2]:null;if(!m||m.nodeType!==1&&m.nodeType!==9&&m.nodeType!==11)throw Error(u(299));return h(y,m,null,x)},tt.flushSync=function(y){var m=g.T,x=c.p;try{if(g.T=null,c.p=2,y)return y()}finally{g.T=m,c.p=x,c.d.f()}},tt.preconnect=function(y,m){typeof y=="string"&&(m?(m=m.crossOrigin,m=typeof m=="string"?m==="use-credentials"?m:"":void 0):m=null,c.d.C(y,m))},tt.prefetchDNS=function(y){typeof y=="string"&&c.d.D(y)},tt.preinit=function(y,m){if(typeof y=="string"&&m&&typeof m.as=="string"){var x=m.as,A=p(x,m.crossOrigin),S=typeof m.integrity=="string"?m.integrity:void 0,N=typeof m.fetchPriority=="string"?m.fetchPriority:void 0;x==="style"?c.d.S(y,typeof m.precedence=="string"?m.precedence:void 0,{crossOrigin:A,integrity:S,fetchPriority:N}):x==="script"&&c.d.X(y,{crossOrigin:A,integrity:S,fetchPriority:N,nonce:typeof m.nonce=="string"?m.nonce:void 0})}},tt.preinitModule=function(y,m){if(typeof y=="string")if(typeof m=="object"&&m!==null){if(m.as==null||m.as==="script"){var x=p(m.as,m.crossOrigin);c.d.M(y,{crossOrigin:x,integrity:typeof m.integrity=="string"?m.integrity:void 0,nonce:typeof m.nonce=="string"?m.nonce:void 0})}}else m==null&&c.d.M(y)},tt.preload=function(y,m){if(typeof y=="string"&&typeof m=="object"&&m!==null&&typeof m.as=="string"){var x=m.as,A=p(x,m.crossOrigin);c.d.L(y,x,{crossOrigin:A,integrity:typeof m.integrity=="string"?m.integrity:void 0,nonce:typeof m.nonce=="string"?m.nonce:void 0,type:typeof m.type=="string"?m.type:void 0,fetchPriority:typeof m.fetchPriority=="string"?m.fetchPriority:void 0,referrerPolicy:typeof m.referrerPolicy=="string"?m.referrerPolicy:void 0,imageSrcSet:typeof m.imageSrcSet=="string"?m.imageSrcSet:void 0,imageSizes:typeof m.imageSizes=="string"?m.imageSizes:void 0,media:typeof m.media=="string"?m.media:void 0})}},tt.preloadModule=function(y,m){if(typeof y=="string")if(m){var x=p(m.as,m.crossOrigin);c.d.m(y,{as:typeof m.as=="string"&&m.as!=="script"?m.as:void 0,crossOrigin:x,integrity:typeof m.integrity=="string"?m.integrity:void 0})}else c.d.m(y)},tt.requestFormReset=function(y){c.d.r(y)},tt.unstable_batchedUpdates=function(y,m){return y(m)},tt.useFormState=function(y,m,x){return g.H.useFormState(y,m,x)},tt.useFormStatus=function(){return g.H.useHostTransitionStatus()},tt.version="19.1.0",tt}var Wh;function Mm(){if(Wh)return gs.exports;Wh=1;function n(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(n)}catch(u){console.error(u)}}return n(),gs.exports=py(),gs.exports}/**
- * @license React
- * react-dom-client.production.js
- *
- * Copyright (c) Meta Platforms, Inc. and affiliates.
- *
- * This source code is licensed under the MIT license found in the
- * LICENSE file in the root directory of this source tree.
- */var Ph;function gy(){if(Ph)return ri;Ph=1;var n=vy(),u=Ls(),s=Mm();function c(e){var t="https://react.dev/errors/"+e;if(1<arguments.length){t+="?args[]="+encodeURIComponent(arguments[1]);for(var a=2;a<arguments.length;a++)t+="&args[]="+encodeURIComponent(arguments[a])}return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}function f(e){return!(!e||e.nodeType!==1&&e.nodeType!==9&&e.nodeType!==11)}function h(e){var t=e,a=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do t=e,(t.flags&4098)!==0&&(a=t.return),e=t.return;while(e)}return t.tag===3?a:null}function g(e){if(e.tag===13){var t=e.memoizedState;if(t===null&&(e=e.alternate,e!==null&&(t=e.memoizedState)),t!==null)return t.dehydrated}return null}function p(e){if(h(e)!==e)throw Error(c(188))}function y(e){var t=e.alternate;if(!t){if(t=h(e),t===null)throw Error(c(188));return t!==e?null:e}for(var a=e,l=t;;){var i=a.return;if(i===null)break;var r=i.alternate;if(r===null){if(l=i.return,l!==null){a=l;continue}break}if(i.child===r.child){for(r=i.child;r;){if(r===a)return p(i),e;if(r===l)return p(i),t;r=r.sibling}throw Error(c(188))}if(a.return!==l.return)a=i,l=r;else{for(var d=!1,v=i.child;v;){if(v===a){d=!0,a=i,l=r;break}if(v===l){d=!0,l=i,a=r;break}v=v.sibling}if(!d){for(v=r.child;v;){if(v===a){d=!0,a=r,l=i;break}if(v===l){d=!0,l=r,a=i;break}v=v.sibling}if(!d)throw Error(c(189))}}if(a.alternate!==l)throw Error(c(190))}if(a.tag!==3)throw Error(c(188));return a.stateNode.current===a?e:t}function m(e){var t=e.tag;if(t===5||t===26||t===27||t===6)return e;for(e=e.child;e!==null;){if(t=m(e),t!==null)return t;e=e.sibling}return null}var x=Object.assign,A=Symbol.for("react.element"),S=Symbol.for("react.transitional.element"),N=Symbol.for("react.portal"),C=Symbol.for("react.fragment"),T=Symbol.for("react.strict_mode"),B=Symbol.for("react.profiler"),z=Symbol.for("react.provider"),H=Symbol.for("react.consumer"),V=Symbol.for("react.context"),$=Symbol.for("react.forward_ref"),Z=Symbol.for("react.suspense"),ce=Symbol.for("react.suspense_list"),te=Symbol.for("react.memo"),J=Symbol.for("react.lazy"),Q=Symbol.for("react.activity"),de=Symbol.for("react.memo_cache_sentinel"),ze=Symbol.iterator;function Te(e){return e===null||typeof e!="object"?null:(e=ze&&e[ze]||e["@@iterator"],typeof e=="function"?e:null)}var Ut=Symbol.for("react.client.reference");function At(e){if(e==null)return null;if(typeof e=="function")return e.$$typeof===Ut?null:e.displayName||e.name||null;if(typeof e=="string")return e;switch(e){case C:return"Fragment";case B:return"Profiler";case T:return"StrictMode";case Z:return"Suspense";case ce:return"SuspenseList";case Q:return"Activity"}if(typeof e=="object")switch(e.$$typeof){case N:return"Portal";case V:return(e.displayName||"Context")+".Provider";case H:return(e._context.displayName||"Context")+".Consumer";case $:var t=e.render;return e=e.displayName,e||(e=t.displayName||t.name||"",e=e!==""?"ForwardRef("+e+")":"ForwardRef"),e;case te:return t=e.displayName||null,t!==null?t:At(e.type)||"Memo";case J:t=e._payload,e=e._init;try{return At(e(t))}catch{}}return null}var Me=Array.isArray,U=u.__CLIENT_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,K=s.__DOM_INTERNALS_DO_NOT_USE_OR_WARN_USERS_THEY_CANNOT_UPGRADE,Y={pending:!1,data:null,method:null,action:null},xe=[],_=-1;function G(e){return{current:e}}function F(e){0>_||(e.current=xe[_],xe[_]=null,_--)}function X(e,t){_++,xe[_]=e.current,e.current=t}var W=G(null),he=G(null),re=G(null),ge=G(null);function we(e,t){switch(X(re,t),X(he,e),X(W,null),t.nodeType){case 9:case 11:e=(e=t.documentElement)&&(e=e.namespaceURI)?yh(e):0;break;default:if(e=t.tagName,t=t.namespaceURI)t=yh(t),e=bh(t,e);else switch(e){case"svg":e=1;break;case"math":e=2;break;default:e=0}}F(W),X(W,e)}function ct(){F(W),F(he),F(re)}function oa(e){e.memoizedState!==null&&X(ge,e);var t=W.current,a=bh(t,e.type);t!==a&&(X(he,e),X(W,a))}function fa(e){he.current===e&&(F(W),F(he)),ge.current===e&&(F(ge),ei._currentValue=Y)}var da=Object.prototype.hasOwnProperty,Ir=n.unstable_scheduleCallback,eu=n.unstable_cancelCallback,Gv=n.unstable_shouldYield,Yv=n.unstable_requestPaint,Bt=n.unstable_now,Vv=n.unstable_getCurrentPriorityLevel,Fs=n.unstable_ImmediatePriority,Ws=n.unstable_UserBlockingPriority,yi=n.unstable_NormalPriority,Xv=n.unstable_LowPriority,Ps=n.unstable_IdlePriority,Qv=n.log,Zv=n.unstable_setDisableYieldValue,cn=null,st=null;function ha(e){if(typeof Qv=="function"&&Zv(e),st&&typeof st.setStrictMode=="function")try{st.setStrictMode(cn,e)}catch{}}var ot=Math.clz32?Math.clz32:$v,Kv=Math.log,Jv=Math.LN2;function $v(e){return e>>>=0,e===0?32:31-(Kv(e)/Jv|0)|0}var bi=256,xi=4194304;function Va(e){var t=e&42;if(t!==0)return t;switch(e&-e){case 1:return 1;case 2:return 2;case 4:return 4;case 8:return 8;case 16:return 16;case 32:return 32;case 64:return 64;case 128:return 128;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return e&4194048;case 4194304:case 8388608:case 16777216:case 33554432:return e&62914560;case 67108864:return 67108864;case 134217728:return 134217728;case 268435456:return 268435456;case 536870912:return 536870912;case 1073741824:return 0;default:return e}}function Si(e,t,a){var l=e.pendingLanes;if(l===0)return 0;var i=0,r=e.suspendedLanes,d=e.pingedLanes;e=e.warmLanes;var v=l&134217727;return v!==0?(l=v&~r,l!==0?i=Va(l):(d&=v,d!==0?i=Va(d):a||(a=v&~e,a!==0&&(i=Va(a))))):(v=l&~r,v!==0?i=Va(v):d!==0?i=Va(d):a||(a=l&~e,a!==0&&(i=Va(a)))),i===0?0:t!==0&&t!==i&&(t&r)===0&&(r=i&-i,a=t&-t,r>=a||r===32&&(a&4194048)!==0)?t:i}function sn(e,t){return(e.pendingLanes&~(e.suspendedLanes&~e.pingedLanes)&t)===0}function Fv(e,t){switch(e){case 1:case 2:case 4:case 8:case 64:return t+250;case 16:case 32:case 128:case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:return t+5e3;case 4194304:case 8388608:case 16777216:case 33554432:return-1;case 67108864:case 134217728:case 268435456:case 536870912:case 1073741824:return-1;default:return-1}}function Is(){var e=bi;return bi<<=1,(bi&4194048)===0&&(bi=256),e}function eo(){var e=xi;return xi<<=1,(xi&62914560)===0&&(xi=4194304),e}function tu(e){for(var t=[],a=0;31>a;a++)t.push(e);return t}function on(e,t){e.pendingLanes|=t,t!==268435456&&(e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0)}function Wv(e,t,a,l,i,r){var d=e.pendingLanes;e.pendingLanes=a,e.suspendedLanes=0,e.pingedLanes=0,e.warmLanes=0,e.expiredLanes&=a,e.entangledLanes&=a,e.errorRecoveryDisabledLanes&=a,e.shellSuspendCounter=0;var v=e.entanglements,E=e.expirationTimes,D=e.hiddenUpdates;for(a=d&~a;0<a;){var L=31-ot(a),q=1<<L;v[L]=0,E[L]=-1;var M=D[L];if(M!==null)for(D[L]=null,L=0;L<M.length;L++){var O=M[L];O!==null&&(O.lane&=-536870913)}a&=~q}l!==0&&to(e,l,0),r!==0&&i===0&&e.tag!==0&&(e.suspendedLanes|=r&~(d&~t))}function to(e,t,a){e.pendingLanes|=t,e.suspendedLanes&=~t;var l=31-ot(t);e.entangledLanes|=t,e.entanglements[l]=e.entanglements[l]|1073741824|a&4194090}function ao(e,t){var a=e.entangledLanes|=t;for(e=e.entanglements;a;){var l=31-ot(a),i=1<<l;i&t|e[l]&t&&(e[l]|=t),a&=~i}}function au(e){switch(e){case 2:e=1;break;case 8:e=4;break;case 32:e=16;break;case 256:case 512:case 1024:case 2048:case 4096:case 8192:case 16384:case 32768:case 65536:case 131072:case 262144:case 524288:case 1048576:case 2097152:case 4194304:case 8388608:case 16777216:case 33554432:e=128;break;case 268435456:e=134217728;break;default:e=0}return e}function lu(e){return e&=-e,2<e?8<e?(e&134217727)!==0?32:268435456:8:2}function lo(){var e=K.p;return e!==0?e:(e=window.event,e===void 0?32:kh(e.type))}function Pv(e,t){var a=K.p;try{return K.p=e,t()}finally{K.p=a}}var ma=Math.random().toString(36).slice(2),Ie="__reactFiber$"+ma,lt="__reactProps$"+ma,dl="__reactContainer$"+ma,nu="__reactEvents$"+ma,Iv="__reactListeners$"+ma,ep="__reactHandles$"+ma,no="__reactResources$"+ma,fn="__reactMarker$"+ma;function iu(e){delete e[Ie],delete e[lt],delete e[nu],delete e[Iv],delete e[ep]}function hl(e){var t=e[Ie];if(t)return t;for(var a=e.parentNode;a;){if(t=a[dl]||a[Ie]){if(a=t.alternate,t.child!==null||a!==null&&a.child!==null)for(e=_h(e);e!==null;){if(a=e[Ie])return a;e=_h(e)}return t}e=a,a=e.parentNode}return null}function ml(e){if(e=e[Ie]||e[dl]){var t=e.tag;if(t===5||t===6||t===13||t===26||t===27||t===3)return e}return null}function dn(e){var t=e.tag;if(t===5||t===26||t===27||t===6)return e.stateNode;throw Error(c(33))}function vl(e){var t=e[no];return t||(t=e[no]={hoistableStyles:new Map,hoistableScripts:new Map}),t}function Xe(e){e[fn]=!0}var io=new Set,ro={};function Xa(e,t){pl(e,t),pl(e+"Capture",t)}function pl(e,t){for(ro[e]=t,e=0;e<t.length;e++)io.add(t[e])}var tp=RegExp("^[:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD][:A-Z_a-z\\u00C0-\\u00D6\\u00D8-\\u00F6\\u00F8-\\u02FF\\u0370-\\u037D\\u037F-\\u1FFF\\u200C-\\u200D\\u2070-\\u218F\\u2C00-\\u2FEF\\u3001-\\uD7FF\\uF900-\\uFDCF\\uFDF0-\\uFFFD\\-.0-9\\u00B7\\u0300-\\u036F\\u203F-\\u2040]*$"),uo={},co={};function ap(e){return da.call(co,e)?!0:da.call(uo,e)?!1:tp.test(e)?co[e]=!0:(uo[e]=!0,!1)}function Ei(e,t,a){if(ap(t))if(a===null)e.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":e.removeAttribute(t);return;case"boolean":var l=t.toLowerCase().slice(0,5);if(l!=="data-"&&l!=="aria-"){e.removeAttribute(t);return}}e.setAttribute(t,""+a)}}function _i(e,t,a){if(a===null)e.removeAttribute(t);else{switch(typeof a){case"undefined":case"function":case"symbol":case"boolean":e.removeAttribute(t);return}e.setAttribute(t,""+a)}}function Xt(e,t,a,l){if(l===null)e.removeAttribute(a);else{switch(typeof l){case"undefined":case"function":case"symbol":case"boolean":e.removeAttribute(a);return}e.setAttributeNS(t,a,""+l)}}var ru,so;function gl(e){if(ru===void 0)try{throw Error()}catch(a){var t=a.stack.trim().match(/\n( *(at )?)/);ru=t&&t[1]||"",so=-1<a.stack.indexOf(`
-    at`)?" (<anonymous>)":-1<a.stack.indexOf("@")?"@unknown:0:0":""}return`
-`+ru+e+so}var uu=!1;function cu(e,t){if(!e||uu)return"";uu=!0;var a=Error.prepareStackTrace;Error.prepareStackTrace=void 0;try{var l={DetermineComponentFrameRoot:function(){try{if(t){var q=function(){throw Error()};if(Object.defineProperty(q.prototype,"props",{set:function(){throw Error()}}),typeof Reflect=="object"&&Reflect.construct){try{Reflect.construct(q,[])}catch(O){var M=O}Reflect.construct(e,[],q)}else{try{q.call()}catch(O){M=O}e.call(q.prototype)}}else{try{throw Error()}catch(O){M=O}(q=e())&&typeof q.catch=="function"&&q.catch(function(){})}}catch(O){if(O&&M&&typeof O.stack=="string")return[O.stack,M.stack]}return[null,null]}};l.DetermineComponentFrameRoot.displayName="DetermineComponentFrameRoot";var i=Object.getOwnPropertyDescriptor(l.DetermineComponentFrameRoot,"name");i&&i.configurable&&Object.defineProperty(l.DetermineComponentFrameRoot,"name",{value:"DetermineComponentFrameRoot"});var r=l.DetermineComponentFrameRoot(),d=r[0],v=r[1];if(d&&v){var E=d.split(`
-`),D=v.split(`
-`);for(i=l=0;l<E.length&&!E[l].includes("DetermineComponentFrameRoot");)l++;for(;i<D.length&&!D[i].includes("DetermineComponentFrameRoot");)i++;if(l===E.length||i===D.length)for(l=E.length-1,i=D.length-1;1<=l&&0<=i&&E[l]!==D[i];)i--;for(;1<=l&&0<=i;l--,i--)if(E[l]!==D[i]){if(l!==1||i!==1)do if(l--,i--,0>i||E[l]!==D[i]){var L=`
-`+E[l].replace(" at new "," at ");return e.displayName&&L.includes("<anonymous>")&&(L=L.replace("<anonymous>",e.displayName)),L}while(1<=l&&0<=i);break}}}finally{uu=!1,Error.prepareStackTrace=a}return(a=e?e.displayName||e.name:"")?gl(a):""}function lp(e){switch(e.tag){case 26:case 27:case 5:return gl(e.type);case 16:return gl("Lazy");case 13:return gl("Suspense");case 19:return gl("SuspenseList");case 0:case 15:return cu(e.type,!1);case 11:return cu(e.type.render,!1);case 1:return cu(e.type,!0);case 31:return gl("Activity");default:return""}}function oo(e){try{var t="";do t+=lp(e),e=e.return;while(e);return t}catch(a){return`
-Error generating stack: `+a.message+`
-`+a.stack}}function yt(e){switch(typeof e){case"bigint":case"boolean":case"number":case"string":case"undefined":return e;case"object":return e;default:return""}}function fo(e){var t=e.type;return(e=e.nodeName)&&e.toLowerCase()==="input"&&(t==="checkbox"||t==="radio")}function np(e){var t=fo(e)?"checked":"value",a=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),l=""+e[t];if(!e.hasOwnProperty(t)&&typeof a<"u"&&typeof a.get=="function"&&typeof a.set=="function"){var i=a.get,r=a.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return i.call(this)},set:function(d){l=""+d,r.call(this,d)}}),Object.defineProperty(e,t,{enumerable:a.enumerable}),{getValue:function(){return l},setValue:function(d){l=""+d},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}function ji(e){e._valueTracker||(e._valueTracker=np(e))}function ho(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var a=t.getValue(),l="";return e&&(l=fo(e)?e.checked?"true":"false":e.value),e=l,e!==a?(t.setValue(e),!0):!1}function Ni(e){if(e=e||(typeof document<"u"?document:void 0),typeof e>"u")return null;try{return e.activeElement||e.body}catch{return e.body}}var ip=/[\n"\\]/g;function bt(e){return e.replace(ip,function(t){return"\\"+t.charCodeAt(0).toString(16)+" "})}function su(e,t,a,l,i,r,d,v){e.name="",d!=null&&typeof d!="function"&&typeof d!="symbol"&&typeof d!="boolean"?e.type=d:e.removeAttribute("type"),t!=null?d==="number"?(t===0&&e.value===""||e.value!=t)&&(e.value=""+yt(t)):e.value!==""+yt(t)&&(e.value=""+yt(t)):d!=="submit"&&d!=="reset"||e.removeAttribute("value"),t!=null?ou(e,d,yt(t)):a!=null?ou(e,d,yt(a)):l!=null&&e.removeAttribute("value"),i==null&&r!=null&&(e.defaultChecked=!!r),i!=null&&(e.checked=i&&typeof i!="function"&&typeof i!="symbol"),v!=null&&typeof v!="function"&&typeof v!="symbol"&&typeof v!="boolean"?e.name=""+yt(v):e.removeAttribute("name")}function mo(e,t,a,l,i,r,d,v){if(r!=null&&typeof r!="function"&&typeof r!="symbol"&&typeof r!="boolean"&&(e.type=r),t!=null||a!=null){if(!(r!=="submit"&&r!=="reset"||t!=null))return;a=a!=null?""+yt(a):"",t=t!=null?""+yt(t):a,v||t===e.value||(e.value=t),e.defaultValue=t}l=l??i,l=typeof l!="function"&&typeof l!="symbol"&&!!l,e.checked=v?e.checked:!!l,e.defaultChecked=!!l,d!=null&&typeof d!="function"&&typeof d!="symbol"&&typeof d!="boolean"&&(e.name=d)}function ou(e,t,a){t==="number"&&Ni(e.ownerDocument)===e||e.defaultValue===""+a||(e.defaultValue=""+a)}function yl(e,t,a,l){if(e=e.options,t){t={};for(var i=0;i<a.length;i++)t["$"+a[i]]=!0;for(a=0;a<e.length;a++)i=t.hasOwnProperty("$"+e[a].value),e[a].selected!==i&&(e[a].selected=i),i&&l&&(e[a].defaultSelected=!0)}else{for(a=""+yt(a),t=null,i=0;i<e.length;i++){if(e[i].value===a){e[i].selected=!0,l&&(e[i].defaultSelected=!0);return}t!==null||e[i].disabled||(t=e[i])}t!==null&&(t.selected=!0)}}function vo(e,t,a){if(t!=null&&(t=""+yt(t),t!==e.value&&(e.value=t),a==null)){e.defaultValue!==t&&(e.defaultValue=t);return}e.defaultValue=a!=null?""+yt(a):""}function po(e,t,a,l){if(t==null){if(l!=null){if(a!=null)throw Error(c(92));if(Me(l)){if(1<l.length)throw Error(c(93));l=l[0]}a=l}a==null&&(a=""),t=a}a=yt(t),e.defaultValue=a,l=e.textContent,l===a&&l!==""&&l!==null&&(e.value=l)}function bl(e,t){if(t){var a=e.firstChild;if(a&&a===e.lastChild&&a.nodeType===3){a.nodeValue=t;return}}e.textContent=t}var rp=new Set("animationIterationCount aspectRatio borderImageOutset borderImageSlice borderImageWidth boxFlex boxFlexGroup boxOrdinalGroup columnCount columns flex flexGrow flexPositive flexShrink flexNegative flexOrder gridArea gridRow gridRowEnd gridRowSpan gridRowStart gridColumn gridColumnEnd gridColumnSpan gridColumnStart fontWeight lineClamp lineHeight opacity order orphans scale tabSize widows zIndex zoom fillOpacity floodOpacity stopOpacity strokeDasharray strokeDashoffset strokeMiterlimit strokeOpacity strokeWidth MozAnimationIterationCount MozBoxFlex MozBoxFlexGroup MozLineClamp msAnimationIterationCount msFlex msZoom msFlexGrow msFlexNegative msFlexOrder msFlexPositive msFlexShrink msGridColumn msGridColumnSpan msGridRow msGridRowSpan WebkitAnimationIterationCount WebkitBoxFlex WebKitBoxFlexGroup WebkitBoxOrdinalGroup WebkitColumnCount WebkitColumns WebkitFlex WebkitFlexGrow WebkitFlexPositive WebkitFlexShrink WebkitLineClamp".split(" "));function go(e,t,a){var l=t.indexOf("--")===0;a==null||typeof a=="boolean"||a===""?l?e.setProperty(t,""):t==="float"?e.cssFloat="":e[t]="":l?e.setProperty(t,a):typeof a!="number"||a===0||rp.has(t)?t==="float"?e.cssFloat=a:e[t]=(""+a).trim():e[t]=a+"px"}function yo(e,t,a){if(t!=null&&typeof t!="object")throw Error(c(62));if(e=e.style,a!=null){for(var l in a)!a.hasOwnProperty(l)||t!=null&&t.hasOwnProperty(l)||(l.indexOf("--")===0?e.setProperty(l,""):l==="float"?e.cssFloat="":e[l]="");for(var i in t)l=t[i],t.hasOwnProperty(i)&&a[i]!==l&&go(e,i,l)}else for(var r in t)t.hasOwnProperty(r)&&go(e,r,t[r])}function fu(e){if(e.indexOf("-")===-1)return!1;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var up=new Map([["acceptCharset","accept-charset"],["htmlFor","for"],["httpEquiv","http-equiv"],["crossOrigin","crossorigin"],["accentHeight","accent-height"],["alignmentBaseline","alignment-baseline"],["arabicForm","arabic-form"],["baselineShift","baseline-shift"],["capHeight","cap-height"],["clipPath","clip-path"],["clipRule","clip-rule"],["colorInterpolation","color-interpolation"],["colorInterpolationFilters","color-interpolation-filters"],["colorProfile","color-profile"],["colorRendering","color-rendering"],["dominantBaseline","dominant-baseline"],["enableBackground","enable-background"],["fillOpacity","fill-opacity"],["fillRule","fill-rule"],["floodColor","flood-color"],["floodOpacity","flood-opacity"],["fontFamily","font-family"],["fontSize","font-size"],["fontSizeAdjust","font-size-adjust"],["fontStretch","font-stretch"],["fontStyle","font-style"],["fontVariant","font-variant"],["fontWeight","font-weight"],["glyphName","glyph-name"],["glyphOrientationHorizontal","glyph-orientation-horizontal"],["glyphOrientationVertical","glyph-orientation-vertical"],["horizAdvX","horiz-adv-x"],["horizOriginX","horiz-origin-x"],["imageRendering","image-rendering"],["letterSpacing","letter-spacing"],["lightingColor","lighting-color"],["markerEnd","marker-end"],["markerMid","marker-mid"],["markerStart","marker-start"],["overlinePosition","overline-position"],["overlineThickness","overline-thickness"],["paintOrder","paint-order"],["panose-1","panose-1"],["pointerEvents","pointer-events"],["renderingIntent","rendering-intent"],["shapeRendering","shape-rendering"],["stopColor","stop-color"],["stopOpacity","stop-opacity"],["strikethroughPosition","strikethrough-position"],["strikethroughThickness","strikethrough-thickness"],["strokeDasharray","stroke-dasharray"],["strokeDashoffset","stroke-dashoffset"],["strokeLinecap","stroke-linecap"],["strokeLinejoin","stroke-linejoin"],["strokeMiterlimit","stroke-miterlimit"],["strokeOpacity","stroke-opacity"],["strokeWidth","stroke-width"],["textAnchor","text-anchor"],["textDecoration","text-decoration"],["textRendering","text-rendering"],["transformOrigin","transform-origin"],["underlinePosition","underline-position"],["underlineThickness","underline-thickness"],["unicodeBidi","unicode-bidi"],["unicodeRange","unicode-range"],["unitsPerEm","units-per-em"],["vAlphabetic","v-alphabetic"],["vHanging","v-hanging"],["vIdeographic","v-ideographic"],["vMathematical","v-mathematical"],["vectorEffect","vector-effect"],["vertAdvY","vert-adv-y"],["vertOriginX","vert-origin-x"],["vertOriginY","vert-origin-y"],["wordSpacing","word-spacing"],["writingMode","writing-mode"],["xmlnsXlink","xmlns:xlink"],["xHeight","x-height"]]),cp=/^[\u0000-\u001F ]*j[\r\n\t]*a[\r\n\t]*v[\r\n\t]*a[\r\n\t]*s[\r\n\t]*c[\r\n\t]*r[\r\n\t]*i[\r\n\t]*p[\r\n\t]*t[\r\n\t]*:/i;function wi(e){return cp.test(""+e)?"javascript:throw new Error('React has blocked a javascript: URL as a security precaution.')":e}var du=null;function hu(e){return e=e.target||e.srcElement||window,e.correspondingUseElement&&(e=e.correspondingUseElement),e.nodeType===3?e.parentNode:e}var xl=null,Sl=null;function bo(e){var t=ml(e);if(t&&(e=t.stateNode)){var a=e[lt]||null;e:switch(e=t.stateNode,t.type){case"input":if(su(e,a.value,a.defaultValue,a.defaultValue,a.checked,a.defaultChecked,a.type,a.name),t=a.name,a.type==="radio"&&t!=null){for(a=e;a.parentNode;)a=a.parentNode;for(a=a.querySelectorAll('input[name="'+bt(""+t)+'"][type="radio"]'),t=0;t<a.length;t++){var l=a[t];if(l!==e&&l.form===e.form){var i=l[lt]||null;if(!i)throw Error(c(90));su(l,i.value,i.defaultValue,i.defaultValue,i.checked,i.defaultChecked,i.type,i.name)}}for(t=0;t<a.length;t++)l=a[t],l.form===e.form&&ho(l)}break e;case"textarea":vo(e,a.value,a.defaultValue);break e;case"select":t=a.value,t!=null&&yl(e,!!a.multiple,t,!1)}}}var mu=!1;function xo(e,t,a){if(mu)return e(t,a);mu=!0;try{var l=e(t);return l}finally{if(mu=!1,(xl!==null||Sl!==null)&&(fr(),xl&&(t=xl,e=Sl,Sl=xl=null,bo(t),e)))for(t=0;t<e.length;t++)bo(e[t])}}function hn(e,t){var a=e.stateNode;if(a===null)return null;var l=a[lt]||null;if(l===null)return null;a=l[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(l=!l.disabled)||(e=e.type,l=!(e==="button"||e==="input"||e==="select"||e==="textarea")),e=!l;break e;default:e=!1}if(e)return null;if(a&&typeof a!="function")throw Error(c(231,t,typeof a));return a}var Qt=!(typeof window>"u"||typeof window.document>"u"||typeof window.document.createElement>"u"),vu=!1;if(Qt)try{var mn={};Object.defineProperty(mn,"passive",{get:function(){vu=!0}}),window.addEventListener("test",mn,mn),window.removeEventListener("test",mn,mn)}catch{vu=!1}var va=null,pu=null,Ai=null;function So(){if(Ai)return Ai;var e,t=pu,a=t.length,l,i="value"in va?va.value:va.textContent,r=i.length;for(e=0;e<a&&t[e]===i[e];e++);var d=a-e;for(l=1;l<=d&&t[a-l]===i[r-l];l++);return Ai=i.slice(e,1<l?1-l:void 0)}function Ti(e){var t=e.keyCode;return"charCode"in e?(e=e.charCode,e===0&&t===13&&(e=13)):e=t,e===10&&(e=13),32<=e||e===13?e:0}function Ri(){return!0}function Eo(){return!1}function nt(e){function t(a,l,i,r,d){this._reactName=a,this._targetInst=i,this.type=l,this.nativeEvent=r,this.target=d,this.currentTarget=null;for(var v in e)e.hasOwnProperty(v)&&(a=e[v],this[v]=a?a(r):r[v]);return this.isDefaultPrevented=(r.defaultPrevented!=null?r.defaultPrevented:r.returnValue===!1)?Ri:Eo,this.isPropagationStopped=Eo,this}return x(t.prototype,{preventDefault:function(){this.defaultPrevented=!0;var a=this.nativeEvent;a&&(a.preventDefault?a.preventDefault():typeof a.returnValue!="unknown"&&(a.returnValue=!1),this.isDefaultPrevented=Ri)},stopPropagation:function(){var a=this.nativeEvent;a&&(a.stopPropagation?a.stopPropagation():typeof a.cancelBubble!="unknown"&&(a.cancelBubble=!0),this.isPropagationStopped=Ri)},persist:function(){},isPersistent:Ri}),t}var Qa={eventPhase:0,bubbles:0,cancelable:0,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:0,isTrusted:0},Ci=nt(Qa),vn=x({},Qa,{view:0,detail:0}),sp=nt(vn),gu,yu,pn,Di=x({},vn,{screenX:0,screenY:0,clientX:0,clientY:0,pageX:0,pageY:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,getModifierState:xu,button:0,buttons:0,relatedTarget:function(e){return e.relatedTarget===void 0?e.fromElement===e.srcElement?e.toElement:e.fromElement:e.relatedTarget},movementX:function(e){return"movementX"in e?e.movementX:(e!==pn&&(pn&&e.type==="mousemove"?(gu=e.screenX-pn.screenX,yu=e.screenY-pn.screenY):yu=gu=0,pn=e),gu)},movementY:function(e){return"movementY"in e?e.movementY:yu}}),_o=nt(Di),op=x({},Di,{dataTransfer:0}),fp=nt(op),dp=x({},vn,{relatedTarget:0}),bu=nt(dp),hp=x({},Qa,{animationName:0,elapsedTime:0,pseudoElement:0}),mp=nt(hp),vp=x({},Qa,{clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),pp=nt(vp),gp=x({},Qa,{data:0}),jo=nt(gp),yp={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},bp={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},xp={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Sp(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):(e=xp[e])?!!t[e]:!1}function xu(){return Sp}var Ep=x({},vn,{key:function(e){if(e.key){var t=yp[e.key]||e.key;if(t!=="Unidentified")return t}return e.type==="keypress"?(e=Ti(e),e===13?"Enter":String.fromCharCode(e)):e.type==="keydown"||e.type==="keyup"?bp[e.keyCode]||"Unidentified":""},code:0,location:0,ctrlKey:0,shiftKey:0,altKey:0,metaKey:0,repeat:0,locale:0,getModifierState:xu,charCode:function(e){return e.type==="keypress"?Ti(e):0},keyCode:function(e){return e.type==="keydown"||e.type==="keyup"?e.keyCode:0},which:function(e){return e.type==="keypress"?Ti(e):e.type==="keydown"||e.type==="keyup"?e.keyCode:0}}),_p=nt(Ep),jp=x({},Di,{pointerId:0,width:0,height:0,pressure:0,tangentialPressure:0,tiltX:0,tiltY:0,twist:0,pointerType:0,isPrimary:0}),No=nt(jp),Np=x({},vn,{touches:0,targetTouches:0,changedTouches:0,altKey:0,metaKey:0,ctrlKey:0,shiftKey:0,getModifierState:xu}),wp=nt(Np),Ap=x({},Qa,{propertyName:0,elapsedTime:0,pseudoElement:0}),Tp=nt(Ap),Rp=x({},Di,{deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:0,deltaMode:0}),Cp=nt(Rp),Dp=x({},Qa,{newState:0,oldState:0}),Mp=nt(Dp),Op=[9,13,27,32],Su=Qt&&"CompositionEvent"in window,gn=null;Qt&&"documentMode"in document&&(gn=document.documentMode);var zp=Qt&&"TextEvent"in window&&!gn,wo=Qt&&(!Su||gn&&8<gn&&11>=gn),Ao=" ",To=!1;function Ro(e,t){switch(e){case"keyup":return Op.indexOf(t.keyCode)!==-1;case"keydown":return t.keyCode!==229;case"keypress":case"mousedown":case"focusout":return!0;default:return!1}}function Co(e){return e=e.detail,typeof e=="object"&&"data"in e?e.data:null}var El=!1;function Up(e,t){switch(e){case"compositionend":return Co(t);case"keypress":return t.which!==32?null:(To=!0,Ao);case"textInput":return e=t.data,e===Ao&&To?null:e;default:return null}}function Bp(e,t){if(El)return e==="compositionend"||!Su&&Ro(e,t)?(e=So(),Ai=pu=va=null,El=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return wo&&t.locale!=="ko"?null:t.data;default:return null}}var Lp={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function Do(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t==="input"?!!Lp[e.type]:t==="textarea"}function Mo(e,t,a,l){xl?Sl?Sl.push(l):Sl=[l]:xl=l,t=gr(t,"onChange"),0<t.length&&(a=new Ci("onChange","change",null,a,l),e.push({event:a,listeners:t}))}var yn=null,bn=null;function kp(e){hh(e,0)}function Mi(e){var t=dn(e);if(ho(t))return e}function Oo(e,t){if(e==="change")return t}var zo=!1;if(Qt){var Eu;if(Qt){var _u="oninput"in document;if(!_u){var Uo=document.createElement("div");Uo.setAttribute("oninput","return;"),_u=typeof Uo.oninput=="function"}Eu=_u}else Eu=!1;zo=Eu&&(!document.documentMode||9<document.documentMode)}function Bo(){yn&&(yn.detachEvent("onpropertychange",Lo),bn=yn=null)}function Lo(e){if(e.propertyName==="value"&&Mi(bn)){var t=[];Mo(t,bn,e,hu(e)),xo(kp,t)}}function Hp(e,t,a){e==="focusin"?(Bo(),yn=t,bn=a,yn.attachEvent("onpropertychange",Lo)):e==="focusout"&&Bo()}function qp(e){if(e==="selectionchange"||e==="keyup"||e==="keydown")return Mi(bn)}function Gp(e,t){if(e==="click")return Mi(t)}function Yp(e,t){if(e==="input"||e==="change")return Mi(t)}function Vp(e,t){return e===t&&(e!==0||1/e===1/t)||e!==e&&t!==t}var ft=typeof Object.is=="function"?Object.is:Vp;function xn(e,t){if(ft(e,t))return!0;if(typeof e!="object"||e===null||typeof t!="object"||t===null)return!1;var a=Object.keys(e),l=Object.keys(t);if(a.length!==l.length)return!1;for(l=0;l<a.length;l++){var i=a[l];if(!da.call(t,i)||!ft(e[i],t[i]))return!1}return!0}function ko(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function Ho(e,t){var a=ko(e);e=0;for(var l;a;){if(a.nodeType===3){if(l=e+a.textContent.length,e<=t&&l>=t)return{node:a,offset:t-e};e=l}e:{for(;a;){if(a.nextSibling){a=a.nextSibling;break e}a=a.parentNode}a=void 0}a=ko(a)}}function qo(e,t){return e&&t?e===t?!0:e&&e.nodeType===3?!1:t&&t.nodeType===3?qo(e,t.parentNode):"contains"in e?e.contains(t):e.compareDocumentPosition?!!(e.compareDocumentPosition(t)&16):!1:!1}function Go(e){e=e!=null&&e.ownerDocument!=null&&e.ownerDocument.defaultView!=null?e.ownerDocument.defaultView:window;for(var t=Ni(e.document);t instanceof e.HTMLIFrameElement;){try{var a=typeof t.contentWindow.location.href=="string"}catch{a=!1}if(a)e=t.contentWindow;else break;t=Ni(e.document)}return t}function ju(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&(t==="input"&&(e.type==="text"||e.type==="search"||e.type==="tel"||e.type==="url"||e.type==="password")||t==="textarea"||e.contentEditable==="true")}var Xp=Qt&&"documentMode"in document&&11>=document.documentMode,_l=null,Nu=null,Sn=null,wu=!1;function Yo(e,t,a){var l=a.window===a?a.document:a.nodeType===9?a:a.ownerDocument;wu||_l==null||_l!==Ni(l)||(l=_l,"selectionStart"in l&&ju(l)?l={start:l.selectionStart,end:l.selectionEnd}:(l=(l.ownerDocument&&l.ownerDocument.defaultView||window).getSelection(),l={anchorNode:l.anchorNode,anchorOffset:l.anchorOffset,focusNode:l.focusNode,focusOffset:l.focusOffset}),Sn&&xn(Sn,l)||(Sn=l,l=gr(Nu,"onSelect"),0<l.length&&(t=new Ci("onSelect","select",null,t,a),e.push({event:t,listeners:l}),t.target=_l)))}function Za(e,t){var a={};return a[e.toLowerCase()]=t.toLowerCase(),a["Webkit"+e]="webkit"+t,a["Moz"+e]="moz"+t,a}var jl={animationend:Za("Animation","AnimationEnd"),animationiteration:Za("Animation","AnimationIteration"),animationstart:Za("Animation","AnimationStart"),transitionrun:Za("Transition","TransitionRun"),transitionstart:Za("Transition","TransitionStart"),transitioncancel:Za("Transition","TransitionCancel"),transitionend:Za("Transition","TransitionEnd")},Au={},Vo={};Qt&&(Vo=document.createElement("div").style,"AnimationEvent"in window||(delete jl.animationend.animation,delete jl.animationiteration.animation,delete jl.animationstart.animation),"TransitionEvent"in window||delete jl.transitionend.transition);function Ka(e){if(Au[e])return Au[e];if(!jl[e])return e;var t=jl[e],a;for(a in t)if(t.hasOwnProperty(a)&&a in Vo)return Au[e]=t[a];return e}var Xo=Ka("animationend"),Qo=Ka("animationiteration"),Zo=Ka("animationstart"),Qp=Ka("transitionrun"),Zp=Ka("transitionstart"),Kp=Ka("transitioncancel"),Ko=Ka("transitionend"),Jo=new Map,Tu="abort auxClick beforeToggle cancel canPlay canPlayThrough click close contextMenu copy cut drag dragEnd dragEnter dragExit dragLeave dragOver dragStart drop durationChange emptied encrypted ended error gotPointerCapture input invalid keyDown keyPress keyUp load loadedData loadedMetadata loadStart lostPointerCapture mouseDown mouseMove mouseOut mouseOver mouseUp paste pause play playing pointerCancel pointerDown pointerMove pointerOut pointerOver pointerUp progress rateChange reset resize seeked seeking stalled submit suspend timeUpdate touchCancel touchEnd touchStart volumeChange scroll toggle touchMove waiting wheel".split(" ");Tu.push("scrollEnd");function Tt(e,t){Jo.set(e,t),Xa(t,[e])}var $o=new WeakMap;function xt(e,t){if(typeof e=="object"&&e!==null){var a=$o.get(e);return a!==void 0?a:(t={value:e,source:t,stack:oo(t)},$o.set(e,t),t)}return{value:e,source:t,stack:oo(t)}}var St=[],Nl=0,Ru=0;function Oi(){for(var e=Nl,t=Ru=Nl=0;t<e;){var a=St[t];St[t++]=null;var l=St[t];St[t++]=null;var i=St[t];St[t++]=null;var r=St[t];if(St[t++]=null,l!==null&&i!==null){var d=l.pending;d===null?i.next=i:(i.next=d.next,d.next=i),l.pending=i}r!==0&&Fo(a,i,r)}}function zi(e,t,a,l){St[Nl++]=e,St[Nl++]=t,St[Nl++]=a,St[Nl++]=l,Ru|=l,e.lanes|=l,e=e.alternate,e!==null&&(e.lanes|=l)}function Cu(e,t,a,l){return zi(e,t,a,l),Ui(e)}function wl(e,t){return zi(e,null,null,t),Ui(e)}function Fo(e,t,a){e.lanes|=a;var l=e.alternate;l!==null&&(l.lanes|=a);for(var i=!1,r=e.return;r!==null;)r.childLanes|=a,l=r.alternate,l!==null&&(l.childLanes|=a),r.tag===22&&(e=r.stateNode,e===null||e._visibility&1||(i=!0)),e=r,r=r.return;return e.tag===3?(r=e.stateNode,i&&t!==null&&(i=31-ot(a),e=r.hiddenUpdates,l=e[i],l===null?e[i]=[t]:l.push(t),t.lane=a|536870912),r):null}function Ui(e){if(50<Zn)throw Zn=0,Bc=null,Error(c(185));for(var t=e.return;t!==null;)e=t,t=e.return;return e.tag===3?e.stateNode:null}var Al={};function Jp(e,t,a,l){this.tag=e,this.key=a,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.refCleanup=this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=l,this.subtreeFlags=this.flags=0,this.deletions=null,this.childLanes=this.lanes=0,this.alternate=null}function dt(e,t,a,l){return new Jp(e,t,a,l)}function Du(e){return e=e.prototype,!(!e||!e.isReactComponent)}function Zt(e,t){var a=e.alternate;return a===null?(a=dt(e.tag,t,e.key,e.mode),a.elementType=e.elementType,a.type=e.type,a.stateNode=e.stateNode,a.alternate=e,e.alternate=a):(a.pendingProps=t,a.type=e.type,a.flags=0,a.subtreeFlags=0,a.deletions=null),a.flags=e.flags&65011712,a.childLanes=e.childLanes,a.lanes=e.lanes,a.child=e.child,a.memoizedProps=e.memoizedProps,a.memoizedState=e.memoizedState,a.updateQueue=e.updateQueue,t=e.dependencies,a.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext},a.sibling=e.sibling,a.index=e.index,a.ref=e.ref,a.refCleanup=e.refCleanup,a}function Wo(e,t){e.flags&=65011714;var a=e.alternate;return a===null?(e.childLanes=0,e.lanes=t,e.child=null,e.subtreeFlags=0,e.memoizedProps=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.stateNode=null):(e.childLanes=a.childLanes,e.lanes=a.lanes,e.child=a.child,e.subtreeFlags=0,e.deletions=null,e.memoizedProps=a.memoizedProps,e.memoizedState=a.memoizedState,e.updateQueue=a.updateQueue,e.type=a.type,t=a.dependencies,e.dependencies=t===null?null:{lanes:t.lanes,firstContext:t.firstContext}),e}function Bi(e,t,a,l,i,r){var d=0;if(l=e,typeof e=="function")Du(e)&&(d=1);else if(typeof e=="string")d=Fg(e,a,W.current)?26:e==="html"||e==="head"||e==="body"?27:5;else e:switch(e){case Q:return e=dt(31,a,t,i),e.elementType=Q,e.lanes=r,e;case C:return Ja(a.children,i,r,t);case T:d=8,i|=24;break;case B:return e=dt(12,a,t,i|2),e.elementType=B,e.lanes=r,e;case Z:return e=dt(13,a,t,i),e.elementType=Z,e.lanes=r,e;case ce:return e=dt(19,a,t,i),e.elementType=ce,e.lanes=r,e;default:if(typeof e=="object"&&e!==null)switch(e.$$typeof){case z:case V:d=10;break e;case H:d=9;break e;case $:d=11;break e;case te:d=14;break e;case J:d=16,l=null;break e}d=29,a=Error(c(130,e===null?"null":typeof e,"")),l=null}return t=dt(d,a,t,i),t.elementType=e,t.type=l,t.lanes=r,t}function Ja(e,t,a,l){return e=dt(7,e,l,t),e.lanes=a,e}function Mu(e,t,a){return e=dt(6,e,null,t),e.lanes=a,e}function Ou(e,t,a){return t=dt(4,e.children!==null?e.children:[],e.key,t),t.lanes=a,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}var Tl=[],Rl=0,Li=null,ki=0,Et=[],_t=0,$a=null,Kt=1,Jt="";function Fa(e,t){Tl[Rl++]=ki,Tl[Rl++]=Li,Li=e,ki=t}function Po(e,t,a){Et[_t++]=Kt,Et[_t++]=Jt,Et[_t++]=$a,$a=e;var l=Kt;e=Jt;var i=32-ot(l)-1;l&=~(1<<i),a+=1;var r=32-ot(t)+i;if(30<r){var d=i-i%5;r=(l&(1<<d)-1).toString(32),l>>=d,i-=d,Kt=1<<32-ot(t)+i|a<<i|l,Jt=r+e}else Kt=1<<r|a<<i|l,Jt=e}function zu(e){e.return!==null&&(Fa(e,1),Po(e,1,0))}function Uu(e){for(;e===Li;)Li=Tl[--Rl],Tl[Rl]=null,ki=Tl[--Rl],Tl[Rl]=null;for(;e===$a;)$a=Et[--_t],Et[_t]=null,Jt=Et[--_t],Et[_t]=null,Kt=Et[--_t],Et[_t]=null}var at=null,Ue=null,be=!1,Wa=null,Lt=!1,Bu=Error(c(519));function Pa(e){var t=Error(c(418,""));throw jn(xt(t,e)),Bu}function Io(e){var t=e.stateNode,a=e.type,l=e.memoizedProps;switch(t[Ie]=e,t[lt]=l,a){case"dialog":ve("cancel",t),ve("close",t);break;case"iframe":case"object":case"embed":ve("load",t);break;case"video":case"audio":for(a=0;a<Jn.length;a++)ve(Jn[a],t);break;case"source":ve("error",t);break;case"img":case"image":case"link":ve("error",t),ve("load",t);break;case"details":ve("toggle",t);break;case"input":ve("invalid",t),mo(t,l.value,l.defaultValue,l.checked,l.defaultChecked,l.type,l.name,!0),ji(t);break;case"select":ve("invalid",t);break;case"textarea":ve("invalid",t),po(t,l.value,l.defaultValue,l.children),ji(t)}a=l.children,typeof a!="string"&&typeof a!="number"&&typeof a!="bigint"||t.textContent===""+a||l.suppressHydrationWarning===!0||gh(t.textContent,a)?(l.popover!=null&&(ve("beforetoggle",t),ve("toggle",t)),l.onScroll!=null&&ve("scroll",t),l.onScrollEnd!=null&&ve("scrollend",t),l.onClick!=null&&(t.onclick=yr),t=!0):t=!1,t||Pa(e)}function ef(e){for(at=e.return;at;)switch(at.tag){case 5:case 13:Lt=!1;return;case 27:case 3:Lt=!0;return;default:at=at.return}}function En(e){if(e!==at)return!1;if(!be)return ef(e),be=!0,!1;var t=e.tag,a;if((a=t!==3&&t!==27)&&((a=t===5)&&(a=e.type,a=!(a!=="form"&&a!=="button")||Pc(e.type,e.memoizedProps)),a=!a),a&&Ue&&Pa(e),ef(e),t===13){if(e=e.memoizedState,e=e!==null?e.dehydrated:null,!e)throw Error(c(317));e:{for(e=e.nextSibling,t=0;e;){if(e.nodeType===8)if(a=e.data,a==="/$"){if(t===0){Ue=Ct(e.nextSibling);break e}t--}else a!=="$"&&a!=="$!"&&a!=="$?"||t++;e=e.nextSibling}Ue=null}}else t===27?(t=Ue,Da(e.type)?(e=as,as=null,Ue=e):Ue=t):Ue=at?Ct(e.stateNode.nextSibling):null;return!0}function _n(){Ue=at=null,be=!1}function tf(){var e=Wa;return e!==null&&(ut===null?ut=e:ut.push.apply(ut,e),Wa=null),e}function jn(e){Wa===null?Wa=[e]:Wa.push(e)}var Lu=G(null),Ia=null,$t=null;function pa(e,t,a){X(Lu,t._currentValue),t._currentValue=a}function Ft(e){e._currentValue=Lu.current,F(Lu)}function ku(e,t,a){for(;e!==null;){var l=e.alternate;if((e.childLanes&t)!==t?(e.childLanes|=t,l!==null&&(l.childLanes|=t)):l!==null&&(l.childLanes&t)!==t&&(l.childLanes|=t),e===a)break;e=e.return}}function Hu(e,t,a,l){var i=e.child;for(i!==null&&(i.return=e);i!==null;){var r=i.dependencies;if(r!==null){var d=i.child;r=r.firstContext;e:for(;r!==null;){var v=r;r=i;for(var E=0;E<t.length;E++)if(v.context===t[E]){r.lanes|=a,v=r.alternate,v!==null&&(v.lanes|=a),ku(r.return,a,e),l||(d=null);break e}r=v.next}}else if(i.tag===18){if(d=i.return,d===null)throw Error(c(341));d.lanes|=a,r=d.alternate,r!==null&&(r.lanes|=a),ku(d,a,e),d=null}else d=i.child;if(d!==null)d.return=i;else for(d=i;d!==null;){if(d===e){d=null;break}if(i=d.sibling,i!==null){i.return=d.return,d=i;break}d=d.return}i=d}}function Nn(e,t,a,l){e=null;for(var i=t,r=!1;i!==null;){if(!r){if((i.flags&524288)!==0)r=!0;else if((i.flags&262144)!==0)break}if(i.tag===10){var d=i.alternate;if(d===null)throw Error(c(387));if(d=d.memoizedProps,d!==null){var v=i.type;ft(i.pendingProps.value,d.value)||(e!==null?e.push(v):e=[v])}}else if(i===ge.current){if(d=i.alternate,d===null)throw Error(c(387));d.memoizedState.memoizedState!==i.memoizedState.memoizedState&&(e!==null?e.push(ei):e=[ei])}i=i.return}e!==null&&Hu(t,e,a,l),t.flags|=262144}function Hi(e){for(e=e.firstContext;e!==null;){if(!ft(e.context._currentValue,e.memoizedValue))return!0;e=e.next}return!1}function el(e){Ia=e,$t=null,e=e.dependencies,e!==null&&(e.firstContext=null)}function et(e){return af(Ia,e)}function qi(e,t){return Ia===null&&el(e),af(e,t)}function af(e,t){var a=t._currentValue;if(t={context:t,memoizedValue:a,next:null},$t===null){if(e===null)throw Error(c(308));$t=t,e.dependencies={lanes:0,firstContext:t},e.flags|=524288}else $t=$t.next=t;return a}var $p=typeof AbortController<"u"?AbortController:function(){var e=[],t=this.signal={aborted:!1,addEventListener:function(a,l){e.push(l)}};this.abort=function(){t.aborted=!0,e.forEach(function(a){return a()})}},Fp=n.unstable_scheduleCallback,Wp=n.unstable_NormalPriority,Ge={$$typeof:V,Consumer:null,Provider:null,_currentValue:null,_currentValue2:null,_threadCount:0};function qu(){return{controller:new $p,data:new Map,refCount:0}}function wn(e){e.refCount--,e.refCount===0&&Fp(Wp,function(){e.controller.abort()})}var An=null,Gu=0,Cl=0,Dl=null;function Pp(e,t){if(An===null){var a=An=[];Gu=0,Cl=Vc(),Dl={status:"pending",value:void 0,then:function(l){a.push(l)}}}return Gu++,t.then(lf,lf),t}function lf(){if(--Gu===0&&An!==null){Dl!==null&&(Dl.status="fulfilled");var e=An;An=null,Cl=0,Dl=null;for(var t=0;t<e.length;t++)(0,e[t])()}}function Ip(e,t){var a=[],l={status:"pending",value:null,reason:null,then:function(i){a.push(i)}};return e.then(function(){l.status="fulfilled",l.value=t;for(var i=0;i<a.length;i++)(0,a[i])(t)},function(i){for(l.status="rejected",l.reason=i,i=0;i<a.length;i++)(0,a[i])(void 0)}),l}var nf=U.S;U.S=function(e,t){typeof t=="object"&&t!==null&&typeof t.then=="function"&&Pp(e,t),nf!==null&&nf(e,t)};var tl=G(null);function Yu(){var e=tl.current;return e!==null?e:Re.pooledCache}function Gi(e,t){t===null?X(tl,tl.current):X(tl,t.pool)}function rf(){var e=Yu();return e===null?null:{parent:Ge._currentValue,pool:e}}var Tn=Error(c(460)),uf=Error(c(474)),Yi=Error(c(542)),Vu={then:function(){}};function cf(e){return e=e.status,e==="fulfilled"||e==="rejected"}function Vi(){}function sf(e,t,a){switch(a=e[a],a===void 0?e.push(t):a!==t&&(t.then(Vi,Vi),t=a),t.status){case"fulfilled":return t.value;case"rejected":throw e=t.reason,ff(e),e;default:if(typeof t.status=="string")t.then(Vi,Vi);else{if(e=Re,e!==null&&100<e.shellSuspendCounter)throw Error(c(482));e=t,e.status="pending",e.then(function(l){if(t.status==="pending"){var i=t;i.status="fulfilled",i.value=l}},function(l){if(t.status==="pending"){var i=t;i.status="rejected",i.reason=l}})}switch(t.status){case"fulfilled":return t.value;case"rejected":throw e=t.reason,ff(e),e}throw Rn=t,Tn}}var Rn=null;function of(){if(Rn===null)throw Error(c(459));var e=Rn;return Rn=null,e}function ff(e){if(e===Tn||e===Yi)throw Error(c(483))}var ga=!1;function Xu(e){e.updateQueue={baseState:e.memoizedState,firstBaseUpdate:null,lastBaseUpdate:null,shared:{pending:null,lanes:0,hiddenCallbacks:null},callbacks:null}}function Qu(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,firstBaseUpdate:e.firstBaseUpdate,lastBaseUpdate:e.lastBaseUpdate,shared:e.shared,callbacks:null})}function ya(e){return{lane:e,tag:0,payload:null,callback:null,next:null}}function ba(e,t,a){var l=e.updateQueue;if(l===null)return null;if(l=l.shared,(Se&2)!==0){var i=l.pending;return i===null?t.next=t:(t.next=i.next,i.next=t),l.pending=t,t=Ui(e),Fo(e,null,a),t}return zi(e,l,t,a),Ui(e)}function Cn(e,t,a){if(t=t.updateQueue,t!==null&&(t=t.shared,(a&4194048)!==0)){var l=t.lanes;l&=e.pendingLanes,a|=l,t.lanes=a,ao(e,a)}}function Zu(e,t){var a=e.updateQueue,l=e.alternate;if(l!==null&&(l=l.updateQueue,a===l)){var i=null,r=null;if(a=a.firstBaseUpdate,a!==null){do{var d={lane:a.lane,tag:a.tag,payload:a.payload,callback:null,next:null};r===null?i=r=d:r=r.next=d,a=a.next}while(a!==null);r===null?i=r=t:r=r.next=t}else i=r=t;a={baseState:l.baseState,firstBaseUpdate:i,lastBaseUpdate:r,shared:l.shared,callbacks:l.callbacks},e.updateQueue=a;return}e=a.lastBaseUpdate,e===null?a.firstBaseUpdate=t:e.next=t,a.lastBaseUpdate=t}var Ku=!1;function Dn(){if(Ku){var e=Dl;if(e!==null)throw e}}function Mn(e,t,a,l){Ku=!1;var i=e.updateQueue;ga=!1;var r=i.firstBaseUpdate,d=i.lastBaseUpdate,v=i.shared.pending;if(v!==null){i.shared.pending=null;var E=v,D=E.next;E.next=null,d===null?r=D:d.next=D,d=E;var L=e.alternate;L!==null&&(L=L.updateQueue,v=L.lastBaseUpdate,v!==d&&(v===null?L.firstBaseUpdate=D:v.next=D,L.lastBaseUpdate=E))}if(r!==null){var q=i.baseState;d=0,L=D=E=null,v=r;do{var M=v.lane&-536870913,O=M!==v.lane;if(O?(pe&M)===M:(l&M)===M){M!==0&&M===Cl&&(Ku=!0),L!==null&&(L=L.next={lane:0,tag:v.tag,payload:v.payload,callback:null,next:null});e:{var ie=e,le=v;M=t;var Ne=a;switch(le.tag){case 1:if(ie=le.payload,typeof ie=="function"){q=ie.call(Ne,q,M);break e}q=ie;break e;case 3:ie.flags=ie.flags&-65537|128;case 0:if(ie=le.payload,M=typeof ie=="function"?ie.call(Ne,q,M):ie,M==null)break e;q=x({},q,M);break e;case 2:ga=!0}}M=v.callback,M!==null&&(e.flags|=64,O&&(e.flags|=8192),O=i.callbacks,O===null?i.callbacks=[M]:O.push(M))}else O={lane:M,tag:v.tag,payload:v.payload,callback:v.callback,next:null},L===null?(D=L=O,E=q):L=L.next=O,d|=M;if(v=v.next,v===null){if(v=i.shared.pending,v===null)break;O=v,v=O.next,O.next=null,i.lastBaseUpdate=O,i.shared.pending=null}}while(!0);L===null&&(E=q),i.baseState=E,i.firstBaseUpdate=D,i.lastBaseUpdate=L,r===null&&(i.shared.lanes=0),Aa|=d,e.lanes=d,e.memoizedState=q}}function df(e,t){if(typeof e!="function")throw Error(c(191,e));e.call(t)}function hf(e,t){var a=e.callbacks;if(a!==null)for(e.callbacks=null,e=0;e<a.length;e++)df(a[e],t)}var Ml=G(null),Xi=G(0);function mf(e,t){e=la,X(Xi,e),X(Ml,t),la=e|t.baseLanes}function Ju(){X(Xi,la),X(Ml,Ml.current)}function $u(){la=Xi.current,F(Ml),F(Xi)}var xa=0,se=null,_e=null,He=null,Qi=!1,Ol=!1,al=!1,Zi=0,On=0,zl=null,eg=0;function Le(){throw Error(c(321))}function Fu(e,t){if(t===null)return!1;for(var a=0;a<t.length&&a<e.length;a++)if(!ft(e[a],t[a]))return!1;return!0}function Wu(e,t,a,l,i,r){return xa=r,se=t,t.memoizedState=null,t.updateQueue=null,t.lanes=0,U.H=e===null||e.memoizedState===null?Wf:Pf,al=!1,r=a(l,i),al=!1,Ol&&(r=pf(t,a,l,i)),vf(e),r}function vf(e){U.H=Pi;var t=_e!==null&&_e.next!==null;if(xa=0,He=_e=se=null,Qi=!1,On=0,zl=null,t)throw Error(c(300));e===null||Qe||(e=e.dependencies,e!==null&&Hi(e)&&(Qe=!0))}function pf(e,t,a,l){se=e;var i=0;do{if(Ol&&(zl=null),On=0,Ol=!1,25<=i)throw Error(c(301));if(i+=1,He=_e=null,e.updateQueue!=null){var r=e.updateQueue;r.lastEffect=null,r.events=null,r.stores=null,r.memoCache!=null&&(r.memoCache.index=0)}U.H=ug,r=t(a,l)}while(Ol);return r}function tg(){var e=U.H,t=e.useState()[0];return t=typeof t.then=="function"?zn(t):t,e=e.useState()[0],(_e!==null?_e.memoizedState:null)!==e&&(se.flags|=1024),t}function Pu(){var e=Zi!==0;return Zi=0,e}function Iu(e,t,a){t.updateQueue=e.updateQueue,t.flags&=-2053,e.lanes&=~a}function ec(e){if(Qi){for(e=e.memoizedState;e!==null;){var t=e.queue;t!==null&&(t.pending=null),e=e.next}Qi=!1}xa=0,He=_e=se=null,Ol=!1,On=Zi=0,zl=null}function it(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return He===null?se.memoizedState=He=e:He=He.next=e,He}function qe(){if(_e===null){var e=se.alternate;e=e!==null?e.memoizedState:null}else e=_e.next;var t=He===null?se.memoizedState:He.next;if(t!==null)He=t,_e=e;else{if(e===null)throw se.alternate===null?Error(c(467)):Error(c(310));_e=e,e={memoizedState:_e.memoizedState,baseState:_e.baseState,baseQueue:_e.baseQueue,queue:_e.queue,next:null},He===null?se.memoizedState=He=e:He=He.next=e}return He}function tc(){return{lastEffect:null,events:null,stores:null,memoCache:null}}function zn(e){var t=On;return On+=1,zl===null&&(zl=[]),e=sf(zl,e,t),t=se,(He===null?t.memoizedState:He.next)===null&&(t=t.alternate,U.H=t===null||t.memoizedState===null?Wf:Pf),e}function Ki(e){if(e!==null&&typeof e=="object"){if(typeof e.then=="function")return zn(e);if(e.$$typeof===V)return et(e)}throw Error(c(438,String(e)))}function ac(e){var t=null,a=se.updateQueue;if(a!==null&&(t=a.memoCache),t==null){var l=se.alternate;l!==null&&(l=l.updateQueue,l!==null&&(l=l.memoCache,l!=null&&(t={data:l.data.map(function(i){return i.slice()}),index:0})))}if(t==null&&(t={data:[],index:0}),a===null&&(a=tc(),se.updateQueue=a),a.memoCache=t,a=t.data[t.index],a===void 0)for(a=t.data[t.index]=Array(e),l=0;l<e;l++)a[l]=de;return t.index++,a}function Wt(e,t){return typeof t=="function"?t(e):t}function Ji(e){var t=qe();return lc(t,_e,e)}function lc(e,t,a){var l=e.queue;if(l===null)throw Error(c(311));l.lastRenderedReducer=a;var i=e.baseQueue,r=l.pending;if(r!==null){if(i!==null){var d=i.next;i.next=r.next,r.next=d}t.baseQueue=i=r,l.pending=null}if(r=e.baseState,i===null)e.memoizedState=r;else{t=i.next;var v=d=null,E=null,D=t,L=!1;do{var q=D.lane&-536870913;if(q!==D.lane?(pe&q)===q:(xa&q)===q){var M=D.revertLane;if(M===0)E!==null&&(E=E.next={lane:0,revertLane:0,action:D.action,hasEagerState:D.hasEagerState,eagerState:D.eagerState,next:null}),q===Cl&&(L=!0);else if((xa&M)===M){D=D.next,M===Cl&&(L=!0);continue}else q={lane:0,revertLane:D.revertLane,action:D.action,hasEagerState:D.hasEagerState,eagerState:D.eagerState,next:null},E===null?(v=E=q,d=r):E=E.next=q,se.lanes|=M,Aa|=M;q=D.action,al&&a(r,q),r=D.hasEagerState?D.eagerState:a(r,q)}else M={lane:q,revertLane:D.revertLane,action:D.action,hasEagerState:D.hasEagerState,eagerState:D.eagerState,next:null},E===null?(v=E=M,d=r):E=E.next=M,se.lanes|=q,Aa|=q;D=D.next}while(D!==null&&D!==t);if(E===null?d=r:E.next=v,!ft(r,e.memoizedState)&&(Qe=!0,L&&(a=Dl,a!==null)))throw a;e.memoizedState=r,e.baseState=d,e.baseQueue=E,l.lastRenderedState=r}return i===null&&(l.lanes=0),[e.memoizedState,l.dispatch]}function nc(e){var t=qe(),a=t.queue;if(a===null)throw Error(c(311));a.lastRenderedReducer=e;var l=a.dispatch,i=a.pending,r=t.memoizedState;if(i!==null){a.pending=null;var d=i=i.next;do r=e(r,d.action),d=d.next;while(d!==i);ft(r,t.memoizedState)||(Qe=!0),t.memoizedState=r,t.baseQueue===null&&(t.baseState=r),a.lastRenderedState=r}return[r,l]}function gf(e,t,a){var l=se,i=qe(),r=be;if(r){if(a===void 0)throw Error(c(407));a=a()}else a=t();var d=!ft((_e||i).memoizedState,a);d&&(i.memoizedState=a,Qe=!0),i=i.queue;var v=xf.bind(null,l,i,e);if(Un(2048,8,v,[e]),i.getSnapshot!==t||d||He!==null&&He.memoizedState.tag&1){if(l.flags|=2048,Ul(9,$i(),bf.bind(null,l,i,a,t),null),Re===null)throw Error(c(349));r||(xa&124)!==0||yf(l,t,a)}return a}function yf(e,t,a){e.flags|=16384,e={getSnapshot:t,value:a},t=se.updateQueue,t===null?(t=tc(),se.updateQueue=t,t.stores=[e]):(a=t.stores,a===null?t.stores=[e]:a.push(e))}function bf(e,t,a,l){t.value=a,t.getSnapshot=l,Sf(t)&&Ef(e)}function xf(e,t,a){return a(function(){Sf(t)&&Ef(e)})}function Sf(e){var t=e.getSnapshot;e=e.value;try{var a=t();return!ft(e,a)}catch{return!0}}function Ef(e){var t=wl(e,2);t!==null&&gt(t,e,2)}function ic(e){var t=it();if(typeof e=="function"){var a=e;if(e=a(),al){ha(!0);try{a()}finally{ha(!1)}}}return t.memoizedState=t.baseState=e,t.queue={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Wt,lastRenderedState:e},t}function _f(e,t,a,l){return e.baseState=a,lc(e,_e,typeof l=="function"?l:Wt)}function ag(e,t,a,l,i){if(Wi(e))throw Error(c(485));if(e=t.action,e!==null){var r={payload:i,action:e,next:null,isTransition:!0,status:"pending",value:null,reason:null,listeners:[],then:function(d){r.listeners.push(d)}};U.T!==null?a(!0):r.isTransition=!1,l(r),a=t.pending,a===null?(r.next=t.pending=r,jf(t,r)):(r.next=a.next,t.pending=a.next=r)}}function jf(e,t){var a=t.action,l=t.payload,i=e.state;if(t.isTransition){var r=U.T,d={};U.T=d;try{var v=a(i,l),E=U.S;E!==null&&E(d,v),Nf(e,t,v)}catch(D){rc(e,t,D)}finally{U.T=r}}else try{r=a(i,l),Nf(e,t,r)}catch(D){rc(e,t,D)}}function Nf(e,t,a){a!==null&&typeof a=="object"&&typeof a.then=="function"?a.then(function(l){wf(e,t,l)},function(l){return rc(e,t,l)}):wf(e,t,a)}function wf(e,t,a){t.status="fulfilled",t.value=a,Af(t),e.state=a,t=e.pending,t!==null&&(a=t.next,a===t?e.pending=null:(a=a.next,t.next=a,jf(e,a)))}function rc(e,t,a){var l=e.pending;if(e.pending=null,l!==null){l=l.next;do t.status="rejected",t.reason=a,Af(t),t=t.next;while(t!==l)}e.action=null}function Af(e){e=e.listeners;for(var t=0;t<e.length;t++)(0,e[t])()}function Tf(e,t){return t}function Rf(e,t){if(be){var a=Re.formState;if(a!==null){e:{var l=se;if(be){if(Ue){t:{for(var i=Ue,r=Lt;i.nodeType!==8;){if(!r){i=null;break t}if(i=Ct(i.nextSibling),i===null){i=null;break t}}r=i.data,i=r==="F!"||r==="F"?i:null}if(i){Ue=Ct(i.nextSibling),l=i.data==="F!";break e}}Pa(l)}l=!1}l&&(t=a[0])}}return a=it(),a.memoizedState=a.baseState=t,l={pending:null,lanes:0,dispatch:null,lastRenderedReducer:Tf,lastRenderedState:t},a.queue=l,a=Jf.bind(null,se,l),l.dispatch=a,l=ic(!1),r=fc.bind(null,se,!1,l.queue),l=it(),i={state:t,dispatch:null,action:e,pending:null},l.queue=i,a=ag.bind(null,se,i,r,a),i.dispatch=a,l.memoizedState=e,[t,a,!1]}function Cf(e){var t=qe();return Df(t,_e,e)}function Df(e,t,a){if(t=lc(e,t,Tf)[0],e=Ji(Wt)[0],typeof t=="object"&&t!==null&&typeof t.then=="function")try{var l=zn(t)}catch(d){throw d===Tn?Yi:d}else l=t;t=qe();var i=t.queue,r=i.dispatch;return a!==t.memoizedState&&(se.flags|=2048,Ul(9,$i(),lg.bind(null,i,a),null)),[l,r,e]}function lg(e,t){e.action=t}function Mf(e){var t=qe(),a=_e;if(a!==null)return Df(t,a,e);qe(),t=t.memoizedState,a=qe();var l=a.queue.dispatch;return a.memoizedState=e,[t,l,!1]}function Ul(e,t,a,l){return e={tag:e,create:a,deps:l,inst:t,next:null},t=se.updateQueue,t===null&&(t=tc(),se.updateQueue=t),a=t.lastEffect,a===null?t.lastEffect=e.next=e:(l=a.next,a.next=e,e.next=l,t.lastEffect=e),e}function $i(){return{destroy:void 0,resource:void 0}}function Of(){return qe().memoizedState}function Fi(e,t,a,l){var i=it();l=l===void 0?null:l,se.flags|=e,i.memoizedState=Ul(1|t,$i(),a,l)}function Un(e,t,a,l){var i=qe();l=l===void 0?null:l;var r=i.memoizedState.inst;_e!==null&&l!==null&&Fu(l,_e.memoizedState.deps)?i.memoizedState=Ul(t,r,a,l):(se.flags|=e,i.memoizedState=Ul(1|t,r,a,l))}function zf(e,t){Fi(8390656,8,e,t)}function Uf(e,t){Un(2048,8,e,t)}function Bf(e,t){return Un(4,2,e,t)}function Lf(e,t){return Un(4,4,e,t)}function kf(e,t){if(typeof t=="function"){e=e();var a=t(e);return function(){typeof a=="function"?a():t(null)}}if(t!=null)return e=e(),t.current=e,function(){t.current=null}}function Hf(e,t,a){a=a!=null?a.concat([e]):null,Un(4,4,kf.bind(null,t,e),a)}function uc(){}function qf(e,t){var a=qe();t=t===void 0?null:t;var l=a.memoizedState;return t!==null&&Fu(t,l[1])?l[0]:(a.memoizedState=[e,t],e)}function Gf(e,t){var a=qe();t=t===void 0?null:t;var l=a.memoizedState;if(t!==null&&Fu(t,l[1]))return l[0];if(l=e(),al){ha(!0);try{e()}finally{ha(!1)}}return a.memoizedState=[l,t],l}function cc(e,t,a){return a===void 0||(xa&1073741824)!==0?e.memoizedState=t:(e.memoizedState=a,e=Xd(),se.lanes|=e,Aa|=e,a)}function Yf(e,t,a,l){return ft(a,t)?a:Ml.current!==null?(e=cc(e,a,l),ft(e,t)||(Qe=!0),e):(xa&42)===0?(Qe=!0,e.memoizedState=a):(e=Xd(),se.lanes|=e,Aa|=e,t)}function Vf(e,t,a,l,i){var r=K.p;K.p=r!==0&&8>r?r:8;var d=U.T,v={};U.T=v,fc(e,!1,t,a);try{var E=i(),D=U.S;if(D!==null&&D(v,E),E!==null&&typeof E=="object"&&typeof E.then=="function"){var L=Ip(E,l);Bn(e,t,L,pt(e))}else Bn(e,t,l,pt(e))}catch(q){Bn(e,t,{then:function(){},status:"rejected",reason:q},pt())}finally{K.p=r,U.T=d}}function ng(){}function sc(e,t,a,l){if(e.tag!==5)throw Error(c(476));var i=Xf(e).queue;Vf(e,i,t,Y,a===null?ng:function(){return Qf(e),a(l)})}function Xf(e){var t=e.memoizedState;if(t!==null)return t;t={memoizedState:Y,baseState:Y,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Wt,lastRenderedState:Y},next:null};var a={};return t.next={memoizedState:a,baseState:a,baseQueue:null,queue:{pending:null,lanes:0,dispatch:null,lastRenderedReducer:Wt,lastRenderedState:a},next:null},e.memoizedState=t,e=e.alternate,e!==null&&(e.memoizedState=t),t}function Qf(e){var t=Xf(e).next.queue;Bn(e,t,{},pt())}function oc(){return et(ei)}function Zf(){return qe().memoizedState}function Kf(){return qe().memoizedState}function ig(e){for(var t=e.return;t!==null;){switch(t.tag){case 24:case 3:var a=pt();e=ya(a);var l=ba(t,e,a);l!==null&&(gt(l,t,a),Cn(l,t,a)),t={cache:qu()},e.payload=t;return}t=t.return}}function rg(e,t,a){var l=pt();a={lane:l,revertLane:0,action:a,hasEagerState:!1,eagerState:null,next:null},Wi(e)?$f(t,a):(a=Cu(e,t,a,l),a!==null&&(gt(a,e,l),Ff(a,t,l)))}function Jf(e,t,a){var l=pt();Bn(e,t,a,l)}function Bn(e,t,a,l){var i={lane:l,revertLane:0,action:a,hasEagerState:!1,eagerState:null,next:null};if(Wi(e))$f(t,i);else{var r=e.alternate;if(e.lanes===0&&(r===null||r.lanes===0)&&(r=t.lastRenderedReducer,r!==null))try{var d=t.lastRenderedState,v=r(d,a);if(i.hasEagerState=!0,i.eagerState=v,ft(v,d))return zi(e,t,i,0),Re===null&&Oi(),!1}catch{}finally{}if(a=Cu(e,t,i,l),a!==null)return gt(a,e,l),Ff(a,t,l),!0}return!1}function fc(e,t,a,l){if(l={lane:2,revertLane:Vc(),action:l,hasEagerState:!1,eagerState:null,next:null},Wi(e)){if(t)throw Error(c(479))}else t=Cu(e,a,l,2),t!==null&&gt(t,e,2)}function Wi(e){var t=e.alternate;return e===se||t!==null&&t===se}function $f(e,t){Ol=Qi=!0;var a=e.pending;a===null?t.next=t:(t.next=a.next,a.next=t),e.pending=t}function Ff(e,t,a){if((a&4194048)!==0){var l=t.lanes;l&=e.pendingLanes,a|=l,t.lanes=a,ao(e,a)}}var Pi={readContext:et,use:Ki,useCallback:Le,useContext:Le,useEffect:Le,useImperativeHandle:Le,useLayoutEffect:Le,useInsertionEffect:Le,useMemo:Le,useReducer:Le,useRef:Le,useState:Le,useDebugValue:Le,useDeferredValue:Le,useTransition:Le,useSyncExternalStore:Le,useId:Le,useHostTransitionStatus:Le,useFormState:Le,useActionState:Le,useOptimistic:Le,useMemoCache:Le,useCacheRefresh:Le},Wf={readContext:et,use:Ki,useCallback:function(e,t){return it().memoizedState=[e,t===void 0?null:t],e},useContext:et,useEffect:zf,useImperativeHandle:function(e,t,a){a=a!=null?a.concat([e]):null,Fi(4194308,4,kf.bind(null,t,e),a)},useLayoutEffect:function(e,t){return Fi(4194308,4,e,t)},useInsertionEffect:function(e,t){Fi(4,2,e,t)},useMemo:function(e,t){var a=it();t=t===void 0?null:t;var l=e();if(al){ha(!0);try{e()}finally{ha(!1)}}return a.memoizedState=[l,t],l},useReducer:function(e,t,a){var l=it();if(a!==void 0){var i=a(t);if(al){ha(!0);try{a(t)}finally{ha(!1)}}}else i=t;return l.memoizedState=l.baseState=i,e={pending:null,lanes:0,dispatch:null,lastRenderedReducer:e,lastRenderedState:i},l.queue=e,e=e.dispatch=rg.bind(null,se,e),[l.memoizedState,e]},useRef:function(e){var t=it();return e={current:e},t.memoizedState=e},useState:function(e){e=ic(e);var t=e.queue,a=Jf.bind(null,se,t);return t.dispatch=a,[e.memoizedState,a]},useDebugValue:uc,useDeferredValue:function(e,t){var a=it();return cc(a,e,t)},useTransition:function(){var e=ic(!1);return e=Vf.bind(null,se,e.queue,!0,!1),it().memoizedState=e,[!1,e]},useSyncExternalStore:function(e,t,a){var l=se,i=it();if(be){if(a===void 0)throw Error(c(407));a=a()}else{if(a=t(),Re===null)throw Error(c(349));(pe&124)!==0||yf(l,t,a)}i.memoizedState=a;var r={value:a,getSnapshot:t};return i.queue=r,zf(xf.bind(null,l,r,e),[e]),l.flags|=2048,Ul(9,$i(),bf.bind(null,l,r,a,t),null),a},useId:function(){var e=it(),t=Re.identifierPrefix;if(be){var a=Jt,l=Kt;a=(l&~(1<<32-ot(l)-1)).toString(32)+a,t="«"+t+"R"+a,a=Zi++,0<a&&(t+="H"+a.toString(32)),t+="»"}else a=eg++,t="«"+t+"r"+a.toString(32)+"»";return e.memoizedState=t},useHostTransitionStatus:oc,useFormState:Rf,useActionState:Rf,useOptimistic:function(e){var t=it();t.memoizedState=t.baseState=e;var a={pending:null,lanes:0,dispatch:null,lastRenderedReducer:null,lastRenderedState:null};return t.queue=a,t=fc.bind(null,se,!0,a),a.dispatch=t,[e,t]},useMemoCache:ac,useCacheRefresh:function(){return it().memoizedState=ig.bind(null,se)}},Pf={readContext:et,use:Ki,useCallback:qf,useContext:et,useEffect:Uf,useImperativeHandle:Hf,useInsertionEffect:Bf,useLayoutEffect:Lf,useMemo:Gf,useReducer:Ji,useRef:Of,useState:function(){return Ji(Wt)},useDebugValue:uc,useDeferredValue:function(e,t){var a=qe();return Yf(a,_e.memoizedState,e,t)},useTransition:function(){var e=Ji(Wt)[0],t=qe().memoizedState;return[typeof e=="boolean"?e:zn(e),t]},useSyncExternalStore:gf,useId:Zf,useHostTransitionStatus:oc,useFormState:Cf,useActionState:Cf,useOptimistic:function(e,t){var a=qe();return _f(a,_e,e,t)},useMemoCache:ac,useCacheRefresh:Kf},ug={readContext:et,use:Ki,useCallback:qf,useContext:et,useEffect:Uf,useImperativeHandle:Hf,useInsertionEffect:Bf,useLayoutEffect:Lf,useMemo:Gf,useReducer:nc,useRef:Of,useState:function(){return nc(Wt)},useDebugValue:uc,useDeferredValue:function(e,t){var a=qe();return _e===null?cc(a,e,t):Yf(a,_e.memoizedState,e,t)},useTransition:function(){var e=nc(Wt)[0],t=qe().memoizedState;return[typeof e=="boolean"?e:zn(e),t]},useSyncExternalStore:gf,useId:Zf,useHostTransitionStatus:oc,useFormState:Mf,useActionState:Mf,useOptimistic:function(e,t){var a=qe();return _e!==null?_f(a,_e,e,t):(a.baseState=e,[e,a.queue.dispatch])},useMemoCache:ac,useCacheRefresh:Kf},Bl=null,Ln=0;function Ii(e){var t=Ln;return Ln+=1,Bl===null&&(Bl=[]),sf(Bl,e,t)}function kn(e,t){t=t.props.ref,e.ref=t!==void 0?t:null}function er(e,t){throw t.$$typeof===A?Error(c(525)):(e=Object.prototype.toString.call(t),Error(c(31,e==="[object Object]"?"object with keys {"+Object.keys(t).join(", ")+"}":e)))}function If(e){var t=e._init;return t(e._payload)}function ed(e){function t(w,j){if(e){var R=w.deletions;R===null?(w.deletions=[j],w.flags|=16):R.push(j)}}function a(w,j){if(!e)return null;for(;j!==null;)t(w,j),j=j.sibling;return null}function l(w){for(var j=new Map;w!==null;)w.key!==null?j.set(w.key,w):j.set(w.index,w),w=w.sibling;return j}function i(w,j){return w=Zt(w,j),w.index=0,w.sibling=null,w}function r(w,j,R){return w.index=R,e?(R=w.alternate,R!==null?(R=R.index,R<j?(w.flags|=67108866,j):R):(w.flags|=67108866,j)):(w.flags|=1048576,j)}function d(w){return e&&w.alternate===null&&(w.flags|=67108866),w}function v(w,j,R,k){return j===null||j.tag!==6?(j=Mu(R,w.mode,k),j.return=w,j):(j=i(j,R),j.return=w,j)}function E(w,j,R,k){var P=R.type;return P===C?L(w,j,R.props.children,k,R.key):j!==null&&(j.elementType===P||typeof P=="object"&&P!==null&&P.$$typeof===J&&If(P)===j.type)?(j=i(j,R.props),kn(j,R),j.return=w,j):(j=Bi(R.type,R.key,R.props,null,w.mode,k),kn(j,R),j.return=w,j)}function D(w,j,R,k){return j===null||j.tag!==4||j.stateNode.containerInfo!==R.containerInfo||j.stateNode.implementation!==R.implementation?(j=Ou(R,w.mode,k),j.return=w,j):(j=i(j,R.children||[]),j.return=w,j)}function L(w,j,R,k,P){return j===null||j.tag!==7?(j=Ja(R,w.mode,k,P),j.return=w,j):(j=i(j,R),j.return=w,j)}function q(w,j,R){if(typeof j=="string"&&j!==""||typeof j=="number"||typeof j=="bigint")return j=Mu(""+j,w.mode,R),j.return=w,j;if(typeof j=="object"&&j!==null){switch(j.$$typeof){case S:return R=Bi(j.type,j.key,j.props,null,w.mode,R),kn(R,j),R.return=w,R;case N:return j=Ou(j,w.mode,R),j.return=w,j;case J:var k=j._init;return j=k(j._payload),q(w,j,R)}if(Me(j)||Te(j))return j=Ja(j,w.mode,R,null),j.return=w,j;if(typeof j.then=="function")return q(w,Ii(j),R);if(j.$$typeof===V)return q(w,qi(w,j),R);er(w,j)}return null}function M(w,j,R,k){var P=j!==null?j.key:null;if(typeof R=="string"&&R!==""||typeof R=="number"||typeof R=="bigint")return P!==null?null:v(w,j,""+R,k);if(typeof R=="object"&&R!==null){switch(R.$$typeof){case S:return R.key===P?E(w,j,R,k):null;case N:return R.key===P?D(w,j,R,k):null;case J:return P=R._init,R=P(R._payload),M(w,j,R,k)}if(Me(R)||Te(R))return P!==null?null:L(w,j,R,k,null);if(typeof R.then=="function")return M(w,j,Ii(R),k);if(R.$$typeof===V)return M(w,j,qi(w,R),k);er(w,R)}return null}function O(w,j,R,k,P){if(typeof k=="string"&&k!==""||typeof k=="number"||typeof k=="bigint")return w=w.get(R)||null,v(j,w,""+k,P);if(typeof k=="object"&&k!==null){switch(k.$$typeof){case S:return w=w.get(k.key===null?R:k.key)||null,E(j,w,k,P);case N:return w=w.get(k.key===null?R:k.key)||null,D(j,w,k,P);case J:var fe=k._init;return k=fe(k._payload),O(w,j,R,k,P)}if(Me(k)||Te(k))return w=w.get(R)||null,L(j,w,k,P,null);if(typeof k.then=="function")return O(w,j,R,Ii(k),P);if(k.$$typeof===V)return O(w,j,R,qi(j,k),P);er(j,k)}return null}function ie(w,j,R,k){for(var P=null,fe=null,ae=j,ne=j=0,Ke=null;ae!==null&&ne<R.length;ne++){ae.index>ne?(Ke=ae,ae=null):Ke=ae.sibling;var ye=M(w,ae,R[ne],k);if(ye===null){ae===null&&(ae=Ke);break}e&&ae&&ye.alternate===null&&t(w,ae),j=r(ye,j,ne),fe===null?P=ye:fe.sibling=ye,fe=ye,ae=Ke}if(ne===R.length)return a(w,ae),be&&Fa(w,ne),P;if(ae===null){for(;ne<R.length;ne++)ae=q(w,R[ne],k),ae!==null&&(j=r(ae,j,ne),fe===null?P=ae:fe.sibling=ae,fe=ae);return be&&Fa(w,ne),P}for(ae=l(ae);ne<R.length;ne++)Ke=O(ae,w,ne,R[ne],k),Ke!==null&&(e&&Ke.alternate!==null&&ae.delete(Ke.key===null?ne:Ke.key),j=r(Ke,j,ne),fe===null?P=Ke:fe.sibling=Ke,fe=Ke);return e&&ae.forEach(function(Ba){return t(w,Ba)}),be&&Fa(w,ne),P}function le(w,j,R,k){if(R==null)throw Error(c(151));for(var P=null,fe=null,ae=j,ne=j=0,Ke=null,ye=R.next();ae!==null&&!ye.done;ne++,ye=R.next()){ae.index>ne?(Ke=ae,ae=null):Ke=ae.sibling;var Ba=M(w,ae,ye.value,k);if(Ba===null){ae===null&&(ae=Ke);break}e&&ae&&Ba.alternate===null&&t(w,ae),j=r(Ba,j,ne),fe===null?P=Ba:fe.sibling=Ba,fe=Ba,ae=Ke}if(ye.done)return a(w,ae),be&&Fa(w,ne),P;if(ae===null){for(;!ye.done;ne++,ye=R.next())ye=q(w,ye.value,k),ye!==null&&(j=r(ye,j,ne),fe===null?P=ye:fe.sibling=ye,fe=ye);return be&&Fa(w,ne),P}for(ae=l(ae);!ye.done;ne++,ye=R.next())ye=O(ae,w,ne,ye.value,k),ye!==null&&(e&&ye.alternate!==null&&ae.delete(ye.key===null?ne:ye.key),j=r(ye,j,ne),fe===null?P=ye:fe.sibling=ye,fe=ye);return e&&ae.forEach(function(cy){return t(w,cy)}),be&&Fa(w,ne),P}function Ne(w,j,R,k){if(typeof R=="object"&&R!==null&&R.type===C&&R.key===null&&(R=R.props.children),typeof R=="object"&&R!==null){switch(R.$$typeof){case S:e:{for(var P=R.key;j!==null;){if(j.key===P){if(P=R.type,P===C){if(j.tag===7){a(w,j.sibling),k=i(j,R.props.children),k.return=w,w=k;break e}}else if(j.elementType===P||typeof P=="object"&&P!==null&&P.$$typeof===J&&If(P)===j.type){a(w,j.sibling),k=i(j,R.props),kn(k,R),k.return=w,w=k;break e}a(w,j);break}else t(w,j);j=j.sibling}R.type===C?(k=Ja(R.props.children,w.mode,k,R.key),k.return=w,w=k):(k=Bi(R.type,R.key,R.props,null,w.mode,k),kn(k,R),k.return=w,w=k)}return d(w);case N:e:{for(P=R.key;j!==null;){if(j.key===P)if(j.tag===4&&j.stateNode.containerInfo===R.containerInfo&&j.stateNode.implementation===R.implementation){a(w,j.sibling),k=i(j,R.children||[]),k.return=w,w=k;break e}else{a(w,j);break}else t(w,j);j=j.sibling}k=Ou(R,w.mode,k),k.return=w,w=k}return d(w);case J:return P=R._init,R=P(R._payload),Ne(w,j,R,k)}if(Me(R))return ie(w,j,R,k);if(Te(R)){if(P=Te(R),typeof P!="function")throw Error(c(150));return R=P.call(R),le(w,j,R,k)}if(typeof R.then=="function")return Ne(w,j,Ii(R),k);if(R.$$typeof===V)return Ne(w,j,qi(w,R),k);er(w,R)}return typeof R=="string"&&R!==""||typeof R=="number"||typeof R=="bigint"?(R=""+R,j!==null&&j.tag===6?(a(w,j.sibling),k=i(j,R),k.return=w,w=k):(a(w,j),k=Mu(R,w.mode,k),k.return=w,w=k),d(w)):a(w,j)}return function(w,j,R,k){try{Ln=0;var P=Ne(w,j,R,k);return Bl=null,P}catch(ae){if(ae===Tn||ae===Yi)throw ae;var fe=dt(29,ae,null,w.mode);return fe.lanes=k,fe.return=w,fe}finally{}}}var Ll=ed(!0),td=ed(!1),jt=G(null),kt=null;function Sa(e){var t=e.alternate;X(Ye,Ye.current&1),X(jt,e),kt===null&&(t===null||Ml.current!==null||t.memoizedState!==null)&&(kt=e)}function ad(e){if(e.tag===22){if(X(Ye,Ye.current),X(jt,e),kt===null){var t=e.alternate;t!==null&&t.memoizedState!==null&&(kt=e)}}else Ea()}function Ea(){X(Ye,Ye.current),X(jt,jt.current)}function Pt(e){F(jt),kt===e&&(kt=null),F(Ye)}var Ye=G(0);function tr(e){for(var t=e;t!==null;){if(t.tag===13){var a=t.memoizedState;if(a!==null&&(a=a.dehydrated,a===null||a.data==="$?"||ts(a)))return t}else if(t.tag===19&&t.memoizedProps.revealOrder!==void 0){if((t.flags&128)!==0)return t}else if(t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function dc(e,t,a,l){t=e.memoizedState,a=a(l,t),a=a==null?t:x({},t,a),e.memoizedState=a,e.lanes===0&&(e.updateQueue.baseState=a)}var hc={enqueueSetState:function(e,t,a){e=e._reactInternals;var l=pt(),i=ya(l);i.payload=t,a!=null&&(i.callback=a),t=ba(e,i,l),t!==null&&(gt(t,e,l),Cn(t,e,l))},enqueueReplaceState:function(e,t,a){e=e._reactInternals;var l=pt(),i=ya(l);i.tag=1,i.payload=t,a!=null&&(i.callback=a),t=ba(e,i,l),t!==null&&(gt(t,e,l),Cn(t,e,l))},enqueueForceUpdate:function(e,t){e=e._reactInternals;var a=pt(),l=ya(a);l.tag=2,t!=null&&(l.callback=t),t=ba(e,l,a),t!==null&&(gt(t,e,a),Cn(t,e,a))}};function ld(e,t,a,l,i,r,d){return e=e.stateNode,typeof e.shouldComponentUpdate=="function"?e.shouldComponentUpdate(l,r,d):t.prototype&&t.prototype.isPureReactComponent?!xn(a,l)||!xn(i,r):!0}function nd(e,t,a,l){e=t.state,typeof t.componentWillReceiveProps=="function"&&t.componentWillReceiveProps(a,l),typeof t.UNSAFE_componentWillReceiveProps=="function"&&t.UNSAFE_componentWillReceiveProps(a,l),t.state!==e&&hc.enqueueReplaceState(t,t.state,null)}function ll(e,t){var a=t;if("ref"in t){a={};for(var l in t)l!=="ref"&&(a[l]=t[l])}if(e=e.defaultProps){a===t&&(a=x({},a));for(var i in e)a[i]===void 0&&(a[i]=e[i])}return a}var ar=typeof reportError=="function"?reportError:function(e){if(typeof window=="object"&&typeof window.ErrorEvent=="function"){var t=new window.ErrorEvent("error",{bubbles:!0,cancelable:!0,message:typeof e=="object"&&e!==null&&typeof e.message=="string"?String(e.message):String(e),error:e});if(!window.dispatchEvent(t))return}else if(typeof process=="object"&&typeof process.emit=="function"){process.emit("uncaughtException",e);return}console.error(e)};function id(e){ar(e)}function rd(e){console.error(e)}function ud(e){ar(e)}function lr(e,t){try{var a=e.onUncaughtError;a(t.value,{componentStack:t.stack})}catch(l){setTimeout(function(){throw l})}}function cd(e,t,a){try{var l=e.onCaughtError;l(a.value,{componentStack:a.stack,errorBoundary:t.tag===1?t.stateNode:null})}catch(i){setTimeout(function(){throw i})}}function mc(e,t,a){return a=ya(a),a.tag=3,a.payload={element:null},a.callback=function(){lr(e,t)},a}function sd(e){return e=ya(e),e.tag=3,e}function od(e,t,a,l){var i=a.type.getDerivedStateFromError;if(typeof i=="function"){var r=l.value;e.payload=function(){return i(r)},e.callback=function(){cd(t,a,l)}}var d=a.stateNode;d!==null&&typeof d.componentDidCatch=="function"&&(e.callback=function(){cd(t,a,l),typeof i!="function"&&(Ta===null?Ta=new Set([this]):Ta.add(this));var v=l.stack;this.componentDidCatch(l.value,{componentStack:v!==null?v:""})})}function cg(e,t,a,l,i){if(a.flags|=32768,l!==null&&typeof l=="object"&&typeof l.then=="function"){if(t=a.alternate,t!==null&&Nn(t,a,i,!0),a=jt.current,a!==null){switch(a.tag){case 13:return kt===null?kc():a.alternate===null&&Be===0&&(Be=3),a.flags&=-257,a.flags|=65536,a.lanes=i,l===Vu?a.flags|=16384:(t=a.updateQueue,t===null?a.updateQueue=new Set([l]):t.add(l),qc(e,l,i)),!1;case 22:return a.flags|=65536,l===Vu?a.flags|=16384:(t=a.updateQueue,t===null?(t={transitions:null,markerInstances:null,retryQueue:new Set([l])},a.updateQueue=t):(a=t.retryQueue,a===null?t.retryQueue=new Set([l]):a.add(l)),qc(e,l,i)),!1}throw Error(c(435,a.tag))}return qc(e,l,i),kc(),!1}if(be)return t=jt.current,t!==null?((t.flags&65536)===0&&(t.flags|=256),t.flags|=65536,t.lanes=i,l!==Bu&&(e=Error(c(422),{cause:l}),jn(xt(e,a)))):(l!==Bu&&(t=Error(c(423),{cause:l}),jn(xt(t,a))),e=e.current.alternate,e.flags|=65536,i&=-i,e.lanes|=i,l=xt(l,a),i=mc(e.stateNode,l,i),Zu(e,i),Be!==4&&(Be=2)),!1;var r=Error(c(520),{cause:l});if(r=xt(r,a),Qn===null?Qn=[r]:Qn.push(r),Be!==4&&(Be=2),t===null)return!0;l=xt(l,a),a=t;do{switch(a.tag){case 3:return a.flags|=65536,e=i&-i,a.lanes|=e,e=mc(a.stateNode,l,e),Zu(a,e),!1;case 1:if(t=a.type,r=a.stateNode,(a.flags&128)===0&&(typeof t.getDerivedStateFromError=="function"||r!==null&&typeof r.componentDidCatch=="function"&&(Ta===null||!Ta.has(r))))return a.flags|=65536,i&=-i,a.lanes|=i,i=sd(i),od(i,e,a,l),Zu(a,i),!1}a=a.return}while(a!==null);return!1}var fd=Error(c(461)),Qe=!1;function $e(e,t,a,l){t.child=e===null?td(t,null,a,l):Ll(t,e.child,a,l)}function dd(e,t,a,l,i){a=a.render;var r=t.ref;if("ref"in l){var d={};for(var v in l)v!=="ref"&&(d[v]=l[v])}else d=l;return el(t),l=Wu(e,t,a,d,r,i),v=Pu(),e!==null&&!Qe?(Iu(e,t,i),It(e,t,i)):(be&&v&&zu(t),t.flags|=1,$e(e,t,l,i),t.child)}function hd(e,t,a,l,i){if(e===null){var r=a.type;return typeof r=="function"&&!Du(r)&&r.defaultProps===void 0&&a.compare===null?(t.tag=15,t.type=r,md(e,t,r,l,i)):(e=Bi(a.type,null,l,t,t.mode,i),e.ref=t.ref,e.return=t,t.child=e)}if(r=e.child,!Ec(e,i)){var d=r.memoizedProps;if(a=a.compare,a=a!==null?a:xn,a(d,l)&&e.ref===t.ref)return It(e,t,i)}return t.flags|=1,e=Zt(r,l),e.ref=t.ref,e.return=t,t.child=e}function md(e,t,a,l,i){if(e!==null){var r=e.memoizedProps;if(xn(r,l)&&e.ref===t.ref)if(Qe=!1,t.pendingProps=l=r,Ec(e,i))(e.flags&131072)!==0&&(Qe=!0);else return t.lanes=e.lanes,It(e,t,i)}return vc(e,t,a,l,i)}function vd(e,t,a){var l=t.pendingProps,i=l.children,r=e!==null?e.memoizedState:null;if(l.mode==="hidden"){if((t.flags&128)!==0){if(l=r!==null?r.baseLanes|a:a,e!==null){for(i=t.child=e.child,r=0;i!==null;)r=r|i.lanes|i.childLanes,i=i.sibling;t.childLanes=r&~l}else t.childLanes=0,t.child=null;return pd(e,t,l,a)}if((a&536870912)!==0)t.memoizedState={baseLanes:0,cachePool:null},e!==null&&Gi(t,r!==null?r.cachePool:null),r!==null?mf(t,r):Ju(),ad(t);else return t.lanes=t.childLanes=536870912,pd(e,t,r!==null?r.baseLanes|a:a,a)}else r!==null?(Gi(t,r.cachePool),mf(t,r),Ea(),t.memoizedState=null):(e!==null&&Gi(t,null),Ju(),Ea());return $e(e,t,i,a),t.child}function pd(e,t,a,l){var i=Yu();return i=i===null?null:{parent:Ge._currentValue,pool:i},t.memoizedState={baseLanes:a,cachePool:i},e!==null&&Gi(t,null),Ju(),ad(t),e!==null&&Nn(e,t,l,!0),null}function nr(e,t){var a=t.ref;if(a===null)e!==null&&e.ref!==null&&(t.flags|=4194816);else{if(typeof a!="function"&&typeof a!="object")throw Error(c(284));(e===null||e.ref!==a)&&(t.flags|=4194816)}}function vc(e,t,a,l,i){return el(t),a=Wu(e,t,a,l,void 0,i),l=Pu(),e!==null&&!Qe?(Iu(e,t,i),It(e,t,i)):(be&&l&&zu(t),t.flags|=1,$e(e,t,a,i),t.child)}function gd(e,t,a,l,i,r){return el(t),t.updateQueue=null,a=pf(t,l,a,i),vf(e),l=Pu(),e!==null&&!Qe?(Iu(e,t,r),It(e,t,r)):(be&&l&&zu(t),t.flags|=1,$e(e,t,a,r),t.child)}function yd(e,t,a,l,i){if(el(t),t.stateNode===null){var r=Al,d=a.contextType;typeof d=="object"&&d!==null&&(r=et(d)),r=new a(l,r),t.memoizedState=r.state!==null&&r.state!==void 0?r.state:null,r.updater=hc,t.stateNode=r,r._reactInternals=t,r=t.stateNode,r.props=l,r.state=t.memoizedState,r.refs={},Xu(t),d=a.contextType,r.context=typeof d=="object"&&d!==null?et(d):Al,r.state=t.memoizedState,d=a.getDerivedStateFromProps,typeof d=="function"&&(dc(t,a,d,l),r.state=t.memoizedState),typeof a.getDerivedStateFromProps=="function"||typeof r.getSnapshotBeforeUpdate=="function"||typeof r.UNSAFE_componentWillMount!="function"&&typeof r.componentWillMount!="function"||(d=r.state,typeof r.componentWillMount=="function"&&r.componentWillMount(),typeof r.UNSAFE_componentWillMount=="function"&&r.UNSAFE_componentWillMount(),d!==r.state&&hc.enqueueReplaceState(r,r.state,null),Mn(t,l,r,i),Dn(),r.state=t.memoizedState),typeof r.componentDidMount=="function"&&(t.flags|=4194308),l=!0}else if(e===null){r=t.stateNode;var v=t.memoizedProps,E=ll(a,v);r.props=E;var D=r.context,L=a.contextType;d=Al,typeof L=="object"&&L!==null&&(d=et(L));var q=a.getDerivedStateFromProps;L=typeof q=="function"||typeof r.getSnapshotBeforeUpdate=="function",v=t.pendingProps!==v,L||typeof r.UNSAFE_componentWillReceiveProps!="function"&&typeof r.componentWillReceiveProps!="function"||(v||D!==d)&&nd(t,r,l,d),ga=!1;var M=t.memoizedState;r.state=M,Mn(t,l,r,i),Dn(),D=t.memoizedState,v||M!==D||ga?(typeof q=="function"&&(dc(t,a,q,l),D=t.memoizedState),(E=ga||ld(t,a,E,l,M,D,d))?(L||typeof r.UNSAFE_componentWillMount!="function"&&typeof r.componentWillMount!="function"||(typeof r.componentWillMount=="function"&&r.componentWillMount(),typeof r.UNSAFE_componentWillMount=="function"&&r.UNSAFE_componentWillMount()),typeof r.componentDidMount=="function"&&(t.flags|=4194308)):(typeof r.componentDidMount=="function"&&(t.flags|=4194308),t.memoizedProps=l,t.memoizedState=D),r.props=l,r.state=D,r.context=d,l=E):(typeof r.componentDidMount=="function"&&(t.flags|=4194308),l=!1)}else{r=t.stateNode,Qu(e,t),d=t.memoizedProps,L=ll(a,d),r.props=L,q=t.pendingProps,M=r.context,D=a.contextType,E=Al,typeof D=="object"&&D!==null&&(E=et(D)),v=a.getDerivedStateFromProps,(D=typeof v=="function"||typeof r.getSnapshotBeforeUpdate=="function")||typeof r.UNSAFE_componentWillReceiveProps!="function"&&typeof r.componentWillReceiveProps!="function"||(d!==q||M!==E)&&nd(t,r,l,E),ga=!1,M=t.memoizedState,r.state=M,Mn(t,l,r,i),Dn();var O=t.memoizedState;d!==q||M!==O||ga||e!==null&&e.dependencies!==null&&Hi(e.dependencies)?(typeof v=="function"&&(dc(t,a,v,l),O=t.memoizedState),(L=ga||ld(t,a,L,l,M,O,E)||e!==null&&e.dependencies!==null&&Hi(e.dependencies))?(D||typeof r.UNSAFE_componentWillUpdate!="function"&&typeof r.componentWillUpdate!="function"||(typeof r.componentWillUpdate=="function"&&r.componentWillUpdate(l,O,E),typeof r.UNSAFE_componentWillUpdate=="function"&&r.UNSAFE_componentWillUpdate(l,O,E)),typeof r.componentDidUpdate=="function"&&(t.flags|=4),typeof r.getSnapshotBeforeUpdate=="function"&&(t.flags|=1024)):(typeof r.componentDidUpdate!="function"||d===e.memoizedProps&&M===e.memoizedState||(t.flags|=4),typeof r.getSnapshotBeforeUpdate!="function"||d===e.memoizedProps&&M===e.memoizedState||(t.flags|=1024),t.memoizedProps=l,t.memoizedState=O),r.props=l,r.state=O,r.context=E,l=L):(typeof r.componentDidUpdate!="function"||d===e.memoizedProps&&M===e.memoizedState||(t.flags|=4),typeof r.getSnapshotBeforeUpdate!="function"||d===e.memoizedProps&&M===e.memoizedState||(t.flags|=1024),l=!1)}return r=l,nr(e,t),l=(t.flags&128)!==0,r||l?(r=t.stateNode,a=l&&typeof a.getDerivedStateFromError!="function"?null:r.render(),t.flags|=1,e!==null&&l?(t.child=Ll(t,e.child,null,i),t.child=Ll(t,null,a,i)):$e(e,t,a,i),t.memoizedState=r.state,e=t.child):e=It(e,t,i),e}function bd(e,t,a,l){return _n(),t.flags|=256,$e(e,t,a,l),t.child}var pc={dehydrated:null,treeContext:null,retryLane:0,hydrationErrors:null};function gc(e){return{baseLanes:e,cachePool:rf()}}function yc(e,t,a){return e=e!==null?e.childLanes&~a:0,t&&(e|=Nt),e}function xd(e,t,a){var l=t.pendingProps,i=!1,r=(t.flags&128)!==0,d;if((d=r)||(d=e!==null&&e.memoizedState===null?!1:(Ye.current&2)!==0),d&&(i=!0,t.flags&=-129),d=(t.flags&32)!==0,t.flags&=-33,e===null){if(be){if(i?Sa(t):Ea(),be){var v=Ue,E;if(E=v){e:{for(E=v,v=Lt;E.nodeType!==8;){if(!v){v=null;break e}if(E=Ct(E.nextSibling),E===null){v=null;break e}}v=E}v!==null?(t.memoizedState={dehydrated:v,treeContext:$a!==null?{id:Kt,overflow:Jt}:null,retryLane:536870912,hydrationErrors:null},E=dt(18,null,null,0),E.stateNode=v,E.return=t,t.child=E,at=t,Ue=null,E=!0):E=!1}E||Pa(t)}if(v=t.memoizedState,v!==null&&(v=v.dehydrated,v!==null))return ts(v)?t.lanes=32:t.lanes=536870912,null;Pt(t)}return v=l.children,l=l.fallback,i?(Ea(),i=t.mode,v=ir({mode:"hidden",children:v},i),l=Ja(l,i,a,null),v.return=t,l.return=t,v.sibling=l,t.child=v,i=t.child,i.memoizedState=gc(a),i.childLanes=yc(e,d,a),t.memoizedState=pc,l):(Sa(t),bc(t,v))}if(E=e.memoizedState,E!==null&&(v=E.dehydrated,v!==null)){if(r)t.flags&256?(Sa(t),t.flags&=-257,t=xc(e,t,a)):t.memoizedState!==null?(Ea(),t.child=e.child,t.flags|=128,t=null):(Ea(),i=l.fallback,v=t.mode,l=ir({mode:"visible",children:l.children},v),i=Ja(i,v,a,null),i.flags|=2,l.return=t,i.return=t,l.sibling=i,t.child=l,Ll(t,e.child,null,a),l=t.child,l.memoizedState=gc(a),l.childLanes=yc(e,d,a),t.memoizedState=pc,t=i);else if(Sa(t),ts(v)){if(d=v.nextSibling&&v.nextSibling.dataset,d)var D=d.dgst;d=D,l=Error(c(419)),l.stack="",l.digest=d,jn({value:l,source:null,stack:null}),t=xc(e,t,a)}else if(Qe||Nn(e,t,a,!1),d=(a&e.childLanes)!==0,Qe||d){if(d=Re,d!==null&&(l=a&-a,l=(l&42)!==0?1:au(l),l=(l&(d.suspendedLanes|a))!==0?0:l,l!==0&&l!==E.retryLane))throw E.retryLane=l,wl(e,l),gt(d,e,l),fd;v.data==="$?"||kc(),t=xc(e,t,a)}else v.data==="$?"?(t.flags|=192,t.child=e.child,t=null):(e=E.treeContext,Ue=Ct(v.nextSibling),at=t,be=!0,Wa=null,Lt=!1,e!==null&&(Et[_t++]=Kt,Et[_t++]=Jt,Et[_t++]=$a,Kt=e.id,Jt=e.overflow,$a=t),t=bc(t,l.children),t.flags|=4096);return t}return i?(Ea(),i=l.fallback,v=t.mode,E=e.child,D=E.sibling,l=Zt(E,{mode:"hidden",children:l.children}),l.subtreeFlags=E.subtreeFlags&65011712,D!==null?i=Zt(D,i):(i=Ja(i,v,a,null),i.flags|=2),i.return=t,l.return=t,l.sibling=i,t.child=l,l=i,i=t.child,v=e.child.memoizedState,v===null?v=gc(a):(E=v.cachePool,E!==null?(D=Ge._currentValue,E=E.parent!==D?{parent:D,pool:D}:E):E=rf(),v={baseLanes:v.baseLanes|a,cachePool:E}),i.memoizedState=v,i.childLanes=yc(e,d,a),t.memoizedState=pc,l):(Sa(t),a=e.child,e=a.sibling,a=Zt(a,{mode:"visible",children:l.children}),a.return=t,a.sibling=null,e!==null&&(d=t.deletions,d===null?(t.deletions=[e],t.flags|=16):d.push(e)),t.child=a,t.memoizedState=null,a)}function bc(e,t){return t=ir({mode:"visible",children:t},e.mode),t.return=e,e.child=t}function ir(e,t){return e=dt(22,e,null,t),e.lanes=0,e.stateNode={_visibility:1,_pendingMarkers:null,_retryCache:null,_transitions:null},e}function xc(e,t,a){return Ll(t,e.child,null,a),e=bc(t,t.pendingProps.children),e.flags|=2,t.memoizedState=null,e}function Sd(e,t,a){e.lanes|=t;var l=e.alternate;l!==null&&(l.lanes|=t),ku(e.return,t,a)}function Sc(e,t,a,l,i){var r=e.memoizedState;r===null?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:l,tail:a,tailMode:i}:(r.isBackwards=t,r.rendering=null,r.renderingStartTime=0,r.last=l,r.tail=a,r.tailMode=i)}function Ed(e,t,a){var l=t.pendingProps,i=l.revealOrder,r=l.tail;if($e(e,t,l.children,a),l=Ye.current,(l&2)!==0)l=l&1|2,t.flags|=128;else{if(e!==null&&(e.flags&128)!==0)e:for(e=t.child;e!==null;){if(e.tag===13)e.memoizedState!==null&&Sd(e,a,t);else if(e.tag===19)Sd(e,a,t);else if(e.child!==null){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;e.sibling===null;){if(e.return===null||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}l&=1}switch(X(Ye,l),i){case"forwards":for(a=t.child,i=null;a!==null;)e=a.alternate,e!==null&&tr(e)===null&&(i=a),a=a.sibling;a=i,a===null?(i=t.child,t.child=null):(i=a.sibling,a.sibling=null),Sc(t,!1,i,a,r);break;case"backwards":for(a=null,i=t.child,t.child=null;i!==null;){if(e=i.alternate,e!==null&&tr(e)===null){t.child=i;break}e=i.sibling,i.sibling=a,a=i,i=e}Sc(t,!0,a,null,r);break;case"together":Sc(t,!1,null,null,void 0);break;default:t.memoizedState=null}return t.child}function It(e,t,a){if(e!==null&&(t.dependencies=e.dependencies),Aa|=t.lanes,(a&t.childLanes)===0)if(e!==null){if(Nn(e,t,a,!1),(a&t.childLanes)===0)return null}else return null;if(e!==null&&t.child!==e.child)throw Error(c(153));if(t.child!==null){for(e=t.child,a=Zt(e,e.pendingProps),t.child=a,a.return=t;e.sibling!==null;)e=e.sibling,a=a.sibling=Zt(e,e.pendingProps),a.return=t;a.sibling=null}return t.child}function Ec(e,t){return(e.lanes&t)!==0?!0:(e=e.dependencies,!!(e!==null&&Hi(e)))}function sg(e,t,a){switch(t.tag){case 3:we(t,t.stateNode.containerInfo),pa(t,Ge,e.memoizedState.cache),_n();break;case 27:case 5:oa(t);break;case 4:we(t,t.stateNode.containerInfo);break;case 10:pa(t,t.type,t.memoizedProps.value);break;case 13:var l=t.memoizedState;if(l!==null)return l.dehydrated!==null?(Sa(t),t.flags|=128,null):(a&t.child.childLanes)!==0?xd(e,t,a):(Sa(t),e=It(e,t,a),e!==null?e.sibling:null);Sa(t);break;case 19:var i=(e.flags&128)!==0;if(l=(a&t.childLanes)!==0,l||(Nn(e,t,a,!1),l=(a&t.childLanes)!==0),i){if(l)return Ed(e,t,a);t.flags|=128}if(i=t.memoizedState,i!==null&&(i.rendering=null,i.tail=null,i.lastEffect=null),X(Ye,Ye.current),l)break;return null;case 22:case 23:return t.lanes=0,vd(e,t,a);case 24:pa(t,Ge,e.memoizedState.cache)}return It(e,t,a)}function _d(e,t,a){if(e!==null)if(e.memoizedProps!==t.pendingProps)Qe=!0;else{if(!Ec(e,a)&&(t.flags&128)===0)return Qe=!1,sg(e,t,a);Qe=(e.flags&131072)!==0}else Qe=!1,be&&(t.flags&1048576)!==0&&Po(t,ki,t.index);switch(t.lanes=0,t.tag){case 16:e:{e=t.pendingProps;var l=t.elementType,i=l._init;if(l=i(l._payload),t.type=l,typeof l=="function")Du(l)?(e=ll(l,e),t.tag=1,t=yd(null,t,l,e,a)):(t.tag=0,t=vc(null,t,l,e,a));else{if(l!=null){if(i=l.$$typeof,i===$){t.tag=11,t=dd(null,t,l,e,a);break e}else if(i===te){t.tag=14,t=hd(null,t,l,e,a);break e}}throw t=At(l)||l,Error(c(306,t,""))}}return t;case 0:return vc(e,t,t.type,t.pendingProps,a);case 1:return l=t.type,i=ll(l,t.pendingProps),yd(e,t,l,i,a);case 3:e:{if(we(t,t.stateNode.containerInfo),e===null)throw Error(c(387));l=t.pendingProps;var r=t.memoizedState;i=r.element,Qu(e,t),Mn(t,l,null,a);var d=t.memoizedState;if(l=d.cache,pa(t,Ge,l),l!==r.cache&&Hu(t,[Ge],a,!0),Dn(),l=d.element,r.isDehydrated)if(r={element:l,isDehydrated:!1,cache:d.cache},t.updateQueue.baseState=r,t.memoizedState=r,t.flags&256){t=bd(e,t,l,a);break e}else if(l!==i){i=xt(Error(c(424)),t),jn(i),t=bd(e,t,l,a);break e}else{switch(e=t.stateNode.containerInfo,e.nodeType){case 9:e=e.body;break;default:e=e.nodeName==="HTML"?e.ownerDocument.body:e}for(Ue=Ct(e.firstChild),at=t,be=!0,Wa=null,Lt=!0,a=td(t,null,l,a),t.child=a;a;)a.flags=a.flags&-3|4096,a=a.sibling}else{if(_n(),l===i){t=It(e,t,a);break e}$e(e,t,l,a)}t=t.child}return t;case 26:return nr(e,t),e===null?(a=Ah(t.type,null,t.pendingProps,null))?t.memoizedState=a:be||(a=t.type,e=t.pendingProps,l=br(re.current).createElement(a),l[Ie]=t,l[lt]=e,We(l,a,e),Xe(l),t.stateNode=l):t.memoizedState=Ah(t.type,e.memoizedProps,t.pendingProps,e.memoizedState),null;case 27:return oa(t),e===null&&be&&(l=t.stateNode=jh(t.type,t.pendingProps,re.current),at=t,Lt=!0,i=Ue,Da(t.type)?(as=i,Ue=Ct(l.firstChild)):Ue=i),$e(e,t,t.pendingProps.children,a),nr(e,t),e===null&&(t.flags|=4194304),t.child;case 5:return e===null&&be&&((i=l=Ue)&&(l=Lg(l,t.type,t.pendingProps,Lt),l!==null?(t.stateNode=l,at=t,Ue=Ct(l.firstChild),Lt=!1,i=!0):i=!1),i||Pa(t)),oa(t),i=t.type,r=t.pendingProps,d=e!==null?e.memoizedProps:null,l=r.children,Pc(i,r)?l=null:d!==null&&Pc(i,d)&&(t.flags|=32),t.memoizedState!==null&&(i=Wu(e,t,tg,null,null,a),ei._currentValue=i),nr(e,t),$e(e,t,l,a),t.child;case 6:return e===null&&be&&((e=a=Ue)&&(a=kg(a,t.pendingProps,Lt),a!==null?(t.stateNode=a,at=t,Ue=null,e=!0):e=!1),e||Pa(t)),null;case 13:return xd(e,t,a);case 4:return we(t,t.stateNode.containerInfo),l=t.pendingProps,e===null?t.child=Ll(t,null,l,a):$e(e,t,l,a),t.child;case 11:return dd(e,t,t.type,t.pendingProps,a);case 7:return $e(e,t,t.pendingProps,a),t.child;case 8:return $e(e,t,t.pendingProps.children,a),t.child;case 12:return $e(e,t,t.pendingProps.children,a),t.child;case 10:return l=t.pendingProps,pa(t,t.type,l.value),$e(e,t,l.children,a),t.child;case 9:return i=t.type._context,l=t.pendingProps.children,el(t),i=et(i),l=l(i),t.flags|=1,$e(e,t,l,a),t.child;case 14:return hd(e,t,t.type,t.pendingProps,a);case 15:return md(e,t,t.type,t.pendingProps,a);case 19:return Ed(e,t,a);case 31:return l=t.pendingProps,a=t.mode,l={mode:l.mode,children:l.children},e===null?(a=ir(l,a),a.ref=t.ref,t.child=a,a.return=t,t=a):(a=Zt(e.child,l),a.ref=t.ref,t.child=a,a.return=t,t=a),t;case 22:return vd(e,t,a);case 24:return el(t),l=et(Ge),e===null?(i=Yu(),i===null&&(i=Re,r=qu(),i.pooledCache=r,r.refCount++,r!==null&&(i.pooledCacheLanes|=a),i=r),t.memoizedState={parent:l,cache:i},Xu(t),pa(t,Ge,i)):((e.lanes&a)!==0&&(Qu(e,t),Mn(t,null,null,a),Dn()),i=e.memoizedState,r=t.memoizedState,i.parent!==l?(i={parent:l,cache:l},t.memoizedState=i,t.lanes===0&&(t.memoizedState=t.updateQueue.baseState=i),pa(t,Ge,l)):(l=r.cache,pa(t,Ge,l),l!==i.cache&&Hu(t,[Ge],a,!0))),$e(e,t,t.pendingProps.children,a),t.child;case 29:throw t.pendingProps}throw Error(c(156,t.tag))}function ea(e){e.flags|=4}function jd(e,t){if(t.type!=="stylesheet"||(t.state.loading&4)!==0)e.flags&=-16777217;else if(e.flags|=16777216,!Mh(t)){if(t=jt.current,t!==null&&((pe&4194048)===pe?kt!==null:(pe&62914560)!==pe&&(pe&536870912)===0||t!==kt))throw Rn=Vu,uf;e.flags|=8192}}function rr(e,t){t!==null&&(e.flags|=4),e.flags&16384&&(t=e.tag!==22?eo():536870912,e.lanes|=t,Gl|=t)}function Hn(e,t){if(!be)switch(e.tailMode){case"hidden":t=e.tail;for(var a=null;t!==null;)t.alternate!==null&&(a=t),t=t.sibling;a===null?e.tail=null:a.sibling=null;break;case"collapsed":a=e.tail;for(var l=null;a!==null;)a.alternate!==null&&(l=a),a=a.sibling;l===null?t||e.tail===null?e.tail=null:e.tail.sibling=null:l.sibling=null}}function Oe(e){var t=e.alternate!==null&&e.alternate.child===e.child,a=0,l=0;if(t)for(var i=e.child;i!==null;)a|=i.lanes|i.childLanes,l|=i.subtreeFlags&65011712,l|=i.flags&65011712,i.return=e,i=i.sibling;else for(i=e.child;i!==null;)a|=i.lanes|i.childLanes,l|=i.subtreeFlags,l|=i.flags,i.return=e,i=i.sibling;return e.subtreeFlags|=l,e.childLanes=a,t}function og(e,t,a){var l=t.pendingProps;switch(Uu(t),t.tag){case 31:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return Oe(t),null;case 1:return Oe(t),null;case 3:return a=t.stateNode,l=null,e!==null&&(l=e.memoizedState.cache),t.memoizedState.cache!==l&&(t.flags|=2048),Ft(Ge),ct(),a.pendingContext&&(a.context=a.pendingContext,a.pendingContext=null),(e===null||e.child===null)&&(En(t)?ea(t):e===null||e.memoizedState.isDehydrated&&(t.flags&256)===0||(t.flags|=1024,tf())),Oe(t),null;case 26:return a=t.memoizedState,e===null?(ea(t),a!==null?(Oe(t),jd(t,a)):(Oe(t),t.flags&=-16777217)):a?a!==e.memoizedState?(ea(t),Oe(t),jd(t,a)):(Oe(t),t.flags&=-16777217):(e.memoizedProps!==l&&ea(t),Oe(t),t.flags&=-16777217),null;case 27:fa(t),a=re.current;var i=t.type;if(e!==null&&t.stateNode!=null)e.memoizedProps!==l&&ea(t);else{if(!l){if(t.stateNode===null)throw Error(c(166));return Oe(t),null}e=W.current,En(t)?Io(t):(e=jh(i,l,a),t.stateNode=e,ea(t))}return Oe(t),null;case 5:if(fa(t),a=t.type,e!==null&&t.stateNode!=null)e.memoizedProps!==l&&ea(t);else{if(!l){if(t.stateNode===null)throw Error(c(166));return Oe(t),null}if(e=W.current,En(t))Io(t);else{switch(i=br(re.current),e){case 1:e=i.createElementNS("http://www.w3.org/2000/svg",a);break;case 2:e=i.createElementNS("http://www.w3.org/1998/Math/MathML",a);break;default:switch(a){case"svg":e=i.createElementNS("http://www.w3.org/2000/svg",a);break;case"math":e=i.createElementNS("http://www.w3.org/1998/Math/MathML",a);break;case"script":e=i.createElement("div"),e.innerHTML="<script><\/script>",e=e.removeChild(e.firstChild);break;case"select":e=typeof l.is=="string"?i.createElement("select",{is:l.is}):i.createElement("select"),l.multiple?e.multiple=!0:l.size&&(e.size=l.size);break;default:e=typeof l.is=="string"?i.createElement(a,{is:l.is}):i.createElement(a)}}e[Ie]=t,e[lt]=l;e:for(i=t.child;i!==null;){if(i.tag===5||i.tag===6)e.appendChild(i.stateNode);else if(i.tag!==4&&i.tag!==27&&i.child!==null){i.child.return=i,i=i.child;continue}if(i===t)break e;for(;i.sibling===null;){if(i.return===null||i.return===t)break e;i=i.return}i.sibling.return=i.return,i=i.sibling}t.stateNode=e;e:switch(We(e,a,l),a){case"button":case"input":case"select":case"textarea":e=!!l.autoFocus;break e;case"img":e=!0;break e;default:e=!1}e&&ea(t)}}return Oe(t),t.flags&=-16777217,null;case 6:if(e&&t.stateNode!=null)e.memoizedProps!==l&&ea(t);else{if(typeof l!="string"&&t.stateNode===null)throw Error(c(166));if(e=re.current,En(t)){if(e=t.stateNode,a=t.memoizedProps,l=null,i=at,i!==null)switch(i.tag){case 27:case 5:l=i.memoizedProps}e[Ie]=t,e=!!(e.nodeValue===a||l!==null&&l.suppressHydrationWarning===!0||gh(e.nodeValue,a)),e||Pa(t)}else e=br(e).createTextNode(l),e[Ie]=t,t.stateNode=e}return Oe(t),null;case 13:if(l=t.memoizedState,e===null||e.memoizedState!==null&&e.memoizedState.dehydrated!==null){if(i=En(t),l!==null&&l.dehydrated!==null){if(e===null){if(!i)throw Error(c(318));if(i=t.memoizedState,i=i!==null?i.dehydrated:null,!i)throw Error(c(317));i[Ie]=t}else _n(),(t.flags&128)===0&&(t.memoizedState=null),t.flags|=4;Oe(t),i=!1}else i=tf(),e!==null&&e.memoizedState!==null&&(e.memoizedState.hydrationErrors=i),i=!0;if(!i)return t.flags&256?(Pt(t),t):(Pt(t),null)}if(Pt(t),(t.flags&128)!==0)return t.lanes=a,t;if(a=l!==null,e=e!==null&&e.memoizedState!==null,a){l=t.child,i=null,l.alternate!==null&&l.alternate.memoizedState!==null&&l.alternate.memoizedState.cachePool!==null&&(i=l.alternate.memoizedState.cachePool.pool);var r=null;l.memoizedState!==null&&l.memoizedState.cachePool!==null&&(r=l.memoizedState.cachePool.pool),r!==i&&(l.flags|=2048)}return a!==e&&a&&(t.child.flags|=8192),rr(t,t.updateQueue),Oe(t),null;case 4:return ct(),e===null&&Kc(t.stateNode.containerInfo),Oe(t),null;case 10:return Ft(t.type),Oe(t),null;case 19:if(F(Ye),i=t.memoizedState,i===null)return Oe(t),null;if(l=(t.flags&128)!==0,r=i.rendering,r===null)if(l)Hn(i,!1);else{if(Be!==0||e!==null&&(e.flags&128)!==0)for(e=t.child;e!==null;){if(r=tr(e),r!==null){for(t.flags|=128,Hn(i,!1),e=r.updateQueue,t.updateQueue=e,rr(t,e),t.subtreeFlags=0,e=a,a=t.child;a!==null;)Wo(a,e),a=a.sibling;return X(Ye,Ye.current&1|2),t.child}e=e.sibling}i.tail!==null&&Bt()>sr&&(t.flags|=128,l=!0,Hn(i,!1),t.lanes=4194304)}else{if(!l)if(e=tr(r),e!==null){if(t.flags|=128,l=!0,e=e.updateQueue,t.updateQueue=e,rr(t,e),Hn(i,!0),i.tail===null&&i.tailMode==="hidden"&&!r.alternate&&!be)return Oe(t),null}else 2*Bt()-i.renderingStartTime>sr&&a!==536870912&&(t.flags|=128,l=!0,Hn(i,!1),t.lanes=4194304);i.isBackwards?(r.sibling=t.child,t.child=r):(e=i.last,e!==null?e.sibling=r:t.child=r,i.last=r)}return i.tail!==null?(t=i.tail,i.rendering=t,i.tail=t.sibling,i.renderingStartTime=Bt(),t.sibling=null,e=Ye.current,X(Ye,l?e&1|2:e&1),t):(Oe(t),null);case 22:case 23:return Pt(t),$u(),l=t.memoizedState!==null,e!==null?e.memoizedState!==null!==l&&(t.flags|=8192):l&&(t.flags|=8192),l?(a&536870912)!==0&&(t.flags&128)===0&&(Oe(t),t.subtreeFlags&6&&(t.flags|=8192)):Oe(t),a=t.updateQueue,a!==null&&rr(t,a.retryQueue),a=null,e!==null&&e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(a=e.memoizedState.cachePool.pool),l=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(l=t.memoizedState.cachePool.pool),l!==a&&(t.flags|=2048),e!==null&&F(tl),null;case 24:return a=null,e!==null&&(a=e.memoizedState.cache),t.memoizedState.cache!==a&&(t.flags|=2048),Ft(Ge),Oe(t),null;case 25:return null;case 30:return null}throw Error(c(156,t.tag))}function fg(e,t){switch(Uu(t),t.tag){case 1:return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 3:return Ft(Ge),ct(),e=t.flags,(e&65536)!==0&&(e&128)===0?(t.flags=e&-65537|128,t):null;case 26:case 27:case 5:return fa(t),null;case 13:if(Pt(t),e=t.memoizedState,e!==null&&e.dehydrated!==null){if(t.alternate===null)throw Error(c(340));_n()}return e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 19:return F(Ye),null;case 4:return ct(),null;case 10:return Ft(t.type),null;case 22:case 23:return Pt(t),$u(),e!==null&&F(tl),e=t.flags,e&65536?(t.flags=e&-65537|128,t):null;case 24:return Ft(Ge),null;case 25:return null;default:return null}}function Nd(e,t){switch(Uu(t),t.tag){case 3:Ft(Ge),ct();break;case 26:case 27:case 5:fa(t);break;case 4:ct();break;case 13:Pt(t);break;case 19:F(Ye);break;case 10:Ft(t.type);break;case 22:case 23:Pt(t),$u(),e!==null&&F(tl);break;case 24:Ft(Ge)}}function qn(e,t){try{var a=t.updateQueue,l=a!==null?a.lastEffect:null;if(l!==null){var i=l.next;a=i;do{if((a.tag&e)===e){l=void 0;var r=a.create,d=a.inst;l=r(),d.destroy=l}a=a.next}while(a!==i)}}catch(v){Ae(t,t.return,v)}}function _a(e,t,a){try{var l=t.updateQueue,i=l!==null?l.lastEffect:null;if(i!==null){var r=i.next;l=r;do{if((l.tag&e)===e){var d=l.inst,v=d.destroy;if(v!==void 0){d.destroy=void 0,i=t;var E=a,D=v;try{D()}catch(L){Ae(i,E,L)}}}l=l.next}while(l!==r)}}catch(L){Ae(t,t.return,L)}}function wd(e){var t=e.updateQueue;if(t!==null){var a=e.stateNode;try{hf(t,a)}catch(l){Ae(e,e.return,l)}}}function Ad(e,t,a){a.props=ll(e.type,e.memoizedProps),a.state=e.memoizedState;try{a.componentWillUnmount()}catch(l){Ae(e,t,l)}}function Gn(e,t){try{var a=e.ref;if(a!==null){switch(e.tag){case 26:case 27:case 5:var l=e.stateNode;break;case 30:l=e.stateNode;break;default:l=e.stateNode}typeof a=="function"?e.refCleanup=a(l):a.current=l}}catch(i){Ae(e,t,i)}}function Ht(e,t){var a=e.ref,l=e.refCleanup;if(a!==null)if(typeof l=="function")try{l()}catch(i){Ae(e,t,i)}finally{e.refCleanup=null,e=e.alternate,e!=null&&(e.refCleanup=null)}else if(typeof a=="function")try{a(null)}catch(i){Ae(e,t,i)}else a.current=null}function Td(e){var t=e.type,a=e.memoizedProps,l=e.stateNode;try{e:switch(t){case"button":case"input":case"select":case"textarea":a.autoFocus&&l.focus();break e;case"img":a.src?l.src=a.src:a.srcSet&&(l.srcset=a.srcSet)}}catch(i){Ae(e,e.return,i)}}function _c(e,t,a){try{var l=e.stateNode;Mg(l,e.type,a,t),l[lt]=t}catch(i){Ae(e,e.return,i)}}function Rd(e){return e.tag===5||e.tag===3||e.tag===26||e.tag===27&&Da(e.type)||e.tag===4}function jc(e){e:for(;;){for(;e.sibling===null;){if(e.return===null||Rd(e.return))return null;e=e.return}for(e.sibling.return=e.return,e=e.sibling;e.tag!==5&&e.tag!==6&&e.tag!==18;){if(e.tag===27&&Da(e.type)||e.flags&2||e.child===null||e.tag===4)continue e;e.child.return=e,e=e.child}if(!(e.flags&2))return e.stateNode}}function Nc(e,t,a){var l=e.tag;if(l===5||l===6)e=e.stateNode,t?(a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a).insertBefore(e,t):(t=a.nodeType===9?a.body:a.nodeName==="HTML"?a.ownerDocument.body:a,t.appendChild(e),a=a._reactRootContainer,a!=null||t.onclick!==null||(t.onclick=yr));else if(l!==4&&(l===27&&Da(e.type)&&(a=e.stateNode,t=null),e=e.child,e!==null))for(Nc(e,t,a),e=e.sibling;e!==null;)Nc(e,t,a),e=e.sibling}function ur(e,t,a){var l=e.tag;if(l===5||l===6)e=e.stateNode,t?a.insertBefore(e,t):a.appendChild(e);else if(l!==4&&(l===27&&Da(e.type)&&(a=e.stateNode),e=e.child,e!==null))for(ur(e,t,a),e=e.sibling;e!==null;)ur(e,t,a),e=e.sibling}function Cd(e){var t=e.stateNode,a=e.memoizedProps;try{for(var l=e.type,i=t.attributes;i.length;)t.removeAttributeNode(i[0]);We(t,l,a),t[Ie]=e,t[lt]=a}catch(r){Ae(e,e.return,r)}}var ta=!1,ke=!1,wc=!1,Dd=typeof WeakSet=="function"?WeakSet:Set,Ze=null;function dg(e,t){if(e=e.containerInfo,Fc=Nr,e=Go(e),ju(e)){if("selectionStart"in e)var a={start:e.selectionStart,end:e.selectionEnd};else e:{a=(a=e.ownerDocument)&&a.defaultView||window;var l=a.getSelection&&a.getSelection();if(l&&l.rangeCount!==0){a=l.anchorNode;var i=l.anchorOffset,r=l.focusNode;l=l.focusOffset;try{a.nodeType,r.nodeType}catch{a=null;break e}var d=0,v=-1,E=-1,D=0,L=0,q=e,M=null;t:for(;;){for(var O;q!==a||i!==0&&q.nodeType!==3||(v=d+i),q!==r||l!==0&&q.nodeType!==3||(E=d+l),q.nodeType===3&&(d+=q.nodeValue.length),(O=q.firstChild)!==null;)M=q,q=O;for(;;){if(q===e)break t;if(M===a&&++D===i&&(v=d),M===r&&++L===l&&(E=d),(O=q.nextSibling)!==null)break;q=M,M=q.parentNode}q=O}a=v===-1||E===-1?null:{start:v,end:E}}else a=null}a=a||{start:0,end:0}}else a=null;for(Wc={focusedElem:e,selectionRange:a},Nr=!1,Ze=t;Ze!==null;)if(t=Ze,e=t.child,(t.subtreeFlags&1024)!==0&&e!==null)e.return=t,Ze=e;else for(;Ze!==null;){switch(t=Ze,r=t.alternate,e=t.flags,t.tag){case 0:break;case 11:case 15:break;case 1:if((e&1024)!==0&&r!==null){e=void 0,a=t,i=r.memoizedProps,r=r.memoizedState,l=a.stateNode;try{var ie=ll(a.type,i,a.elementType===a.type);e=l.getSnapshotBeforeUpdate(ie,r),l.__reactInternalSnapshotBeforeUpdate=e}catch(le){Ae(a,a.return,le)}}break;case 3:if((e&1024)!==0){if(e=t.stateNode.containerInfo,a=e.nodeType,a===9)es(e);else if(a===1)switch(e.nodeName){case"HEAD":case"HTML":case"BODY":es(e);break;default:e.textContent=""}}break;case 5:case 26:case 27:case 6:case 4:case 17:break;default:if((e&1024)!==0)throw Error(c(163))}if(e=t.sibling,e!==null){e.return=t.return,Ze=e;break}Ze=t.return}}function Md(e,t,a){var l=a.flags;switch(a.tag){case 0:case 11:case 15:ja(e,a),l&4&&qn(5,a);break;case 1:if(ja(e,a),l&4)if(e=a.stateNode,t===null)try{e.componentDidMount()}catch(d){Ae(a,a.return,d)}else{var i=ll(a.type,t.memoizedProps);t=t.memoizedState;try{e.componentDidUpdate(i,t,e.__reactInternalSnapshotBeforeUpdate)}catch(d){Ae(a,a.return,d)}}l&64&&wd(a),l&512&&Gn(a,a.return);break;case 3:if(ja(e,a),l&64&&(e=a.updateQueue,e!==null)){if(t=null,a.child!==null)switch(a.child.tag){case 27:case 5:t=a.child.stateNode;break;case 1:t=a.child.stateNode}try{hf(e,t)}catch(d){Ae(a,a.return,d)}}break;case 27:t===null&&l&4&&Cd(a);case 26:case 5:ja(e,a),t===null&&l&4&&Td(a),l&512&&Gn(a,a.return);break;case 12:ja(e,a);break;case 13:ja(e,a),l&4&&Ud(e,a),l&64&&(e=a.memoizedState,e!==null&&(e=e.dehydrated,e!==null&&(a=Sg.bind(null,a),Hg(e,a))));break;case 22:if(l=a.memoizedState!==null||ta,!l){t=t!==null&&t.memoizedState!==null||ke,i=ta;var r=ke;ta=l,(ke=t)&&!r?Na(e,a,(a.subtreeFlags&8772)!==0):ja(e,a),ta=i,ke=r}break;case 30:break;default:ja(e,a)}}function Od(e){var t=e.alternate;t!==null&&(e.alternate=null,Od(t)),e.child=null,e.deletions=null,e.sibling=null,e.tag===5&&(t=e.stateNode,t!==null&&iu(t)),e.stateNode=null,e.return=null,e.dependencies=null,e.memoizedProps=null,e.memoizedState=null,e.pendingProps=null,e.stateNode=null,e.updateQueue=null}var Ce=null,rt=!1;function aa(e,t,a){for(a=a.child;a!==null;)zd(e,t,a),a=a.sibling}function zd(e,t,a){if(st&&typeof st.onCommitFiberUnmount=="function")try{st.onCommitFiberUnmount(cn,a)}catch{}switch(a.tag){case 26:ke||Ht(a,t),aa(e,t,a),a.memoizedState?a.memoizedState.count--:a.stateNode&&(a=a.stateNode,a.parentNode.removeChild(a));break;case 27:ke||Ht(a,t);var l=Ce,i=rt;Da(a.type)&&(Ce=a.stateNode,rt=!1),aa(e,t,a),Fn(a.stateNode),Ce=l,rt=i;break;case 5:ke||Ht(a,t);case 6:if(l=Ce,i=rt,Ce=null,aa(e,t,a),Ce=l,rt=i,Ce!==null)if(rt)try{(Ce.nodeType===9?Ce.body:Ce.nodeName==="HTML"?Ce.ownerDocument.body:Ce).removeChild(a.stateNode)}catch(r){Ae(a,t,r)}else try{Ce.removeChild(a.stateNode)}catch(r){Ae(a,t,r)}break;case 18:Ce!==null&&(rt?(e=Ce,Eh(e.nodeType===9?e.body:e.nodeName==="HTML"?e.ownerDocument.body:e,a.stateNode),ni(e)):Eh(Ce,a.stateNode));break;case 4:l=Ce,i=rt,Ce=a.stateNode.containerInfo,rt=!0,aa(e,t,a),Ce=l,rt=i;break;case 0:case 11:case 14:case 15:ke||_a(2,a,t),ke||_a(4,a,t),aa(e,t,a);break;case 1:ke||(Ht(a,t),l=a.stateNode,typeof l.componentWillUnmount=="function"&&Ad(a,t,l)),aa(e,t,a);break;case 21:aa(e,t,a);break;case 22:ke=(l=ke)||a.memoizedState!==null,aa(e,t,a),ke=l;break;default:aa(e,t,a)}}function Ud(e,t){if(t.memoizedState===null&&(e=t.alternate,e!==null&&(e=e.memoizedState,e!==null&&(e=e.dehydrated,e!==null))))try{ni(e)}catch(a){Ae(t,t.return,a)}}function hg(e){switch(e.tag){case 13:case 19:var t=e.stateNode;return t===null&&(t=e.stateNode=new Dd),t;case 22:return e=e.stateNode,t=e._retryCache,t===null&&(t=e._retryCache=new Dd),t;default:throw Error(c(435,e.tag))}}function Ac(e,t){var a=hg(e);t.forEach(function(l){var i=Eg.bind(null,e,l);a.has(l)||(a.add(l),l.then(i,i))})}function ht(e,t){var a=t.deletions;if(a!==null)for(var l=0;l<a.length;l++){var i=a[l],r=e,d=t,v=d;e:for(;v!==null;){switch(v.tag){case 27:if(Da(v.type)){Ce=v.stateNode,rt=!1;break e}break;case 5:Ce=v.stateNode,rt=!1;break e;case 3:case 4:Ce=v.stateNode.containerInfo,rt=!0;break e}v=v.return}if(Ce===null)throw Error(c(160));zd(r,d,i),Ce=null,rt=!1,r=i.alternate,r!==null&&(r.return=null),i.return=null}if(t.subtreeFlags&13878)for(t=t.child;t!==null;)Bd(t,e),t=t.sibling}var Rt=null;function Bd(e,t){var a=e.alternate,l=e.flags;switch(e.tag){case 0:case 11:case 14:case 15:ht(t,e),mt(e),l&4&&(_a(3,e,e.return),qn(3,e),_a(5,e,e.return));break;case 1:ht(t,e),mt(e),l&512&&(ke||a===null||Ht(a,a.return)),l&64&&ta&&(e=e.updateQueue,e!==null&&(l=e.callbacks,l!==null&&(a=e.shared.hiddenCallbacks,e.shared.hiddenCallbacks=a===null?l:a.concat(l))));break;case 26:var i=Rt;if(ht(t,e),mt(e),l&512&&(ke||a===null||Ht(a,a.return)),l&4){var r=a!==null?a.memoizedState:null;if(l=e.memoizedState,a===null)if(l===null)if(e.stateNode===null){e:{l=e.type,a=e.memoizedProps,i=i.ownerDocument||i;t:switch(l){case"title":r=i.getElementsByTagName("title")[0],(!r||r[fn]||r[Ie]||r.namespaceURI==="http://www.w3.org/2000/svg"||r.hasAttribute("itemprop"))&&(r=i.createElement(l),i.head.insertBefore(r,i.querySelector("head > title"))),We(r,l,a),r[Ie]=e,Xe(r),l=r;break e;case"link":var d=Ch("link","href",i).get(l+(a.href||""));if(d){for(var v=0;v<d.length;v++)if(r=d[v],r.getAttribute("href")===(a.href==null||a.href===""?null:a.href)&&r.getAttribute("rel")===(a.rel==null?null:a.rel)&&r.getAttribute("title")===(a.title==null?null:a.title)&&r.getAttribute("crossorigin")===(a.crossOrigin==null?null:a.crossOrigin)){d.splice(v,1);break t}}r=i.createElement(l),We(r,l,a),i.head.appendChild(r);break;case"meta":if(d=Ch("meta","content",i).get(l+(a.content||""))){for(v=0;v<d.length;v++)if(r=d[v],r.getAttribute("content")===(a.content==null?null:""+a.content)&&r.getAttribute("name")===(a.name==null?null:a.name)&&r.getAttribute("property")===(a.property==null?null:a.property)&&r.getAttribute("http-equiv")===(a.httpEquiv==null?null:a.httpEquiv)&&r.getAttribute("charset")===(a.charSet==null?null:a.charSet)){d.splice(v,1);break t}}r=i.createElement(l),We(r,l,a),i.head.appendChild(r);break;default:throw Error(c(468,l))}r[Ie]=e,Xe(r),l=r}e.stateNode=l}else Dh(i,e.type,e.stateNode);else e.stateNode=Rh(i,l,e.memoizedProps);else r!==l?(r===null?a.stateNode!==null&&(a=a.stateNode,a.parentNode.removeChild(a)):r.count--,l===null?Dh(i,e.type,e.stateNode):Rh(i,l,e.memoizedProps)):l===null&&e.stateNode!==null&&_c(e,e.memoizedProps,a.memoizedProps)}break;case 27:ht(t,e),mt(e),l&512&&(ke||a===null||Ht(a,a.return)),a!==null&&l&4&&_c(e,e.memoizedProps,a.memoizedProps);break;case 5:if(ht(t,e),mt(e),l&512&&(ke||a===null||Ht(a,a.return)),e.flags&32){i=e.stateNode;try{bl(i,"")}catch(O){Ae(e,e.return,O)}}l&4&&e.stateNode!=null&&(i=e.memoizedProps,_c(e,i,a!==null?a.memoizedProps:i)),l&1024&&(wc=!0);break;case 6:if(ht(t,e),mt(e),l&4){if(e.stateNode===null)throw Error(c(162));l=e.memoizedProps,a=e.stateNode;try{a.nodeValue=l}catch(O){Ae(e,e.return,O)}}break;case 3:if(Er=null,i=Rt,Rt=xr(t.containerInfo),ht(t,e),Rt=i,mt(e),l&4&&a!==null&&a.memoizedState.isDehydrated)try{ni(t.containerInfo)}catch(O){Ae(e,e.return,O)}wc&&(wc=!1,Ld(e));break;case 4:l=Rt,Rt=xr(e.stateNode.containerInfo),ht(t,e),mt(e),Rt=l;break;case 12:ht(t,e),mt(e);break;case 13:ht(t,e),mt(e),e.child.flags&8192&&e.memoizedState!==null!=(a!==null&&a.memoizedState!==null)&&(Oc=Bt()),l&4&&(l=e.updateQueue,l!==null&&(e.updateQueue=null,Ac(e,l)));break;case 22:i=e.memoizedState!==null;var E=a!==null&&a.memoizedState!==null,D=ta,L=ke;if(ta=D||i,ke=L||E,ht(t,e),ke=L,ta=D,mt(e),l&8192)e:for(t=e.stateNode,t._visibility=i?t._visibility&-2:t._visibility|1,i&&(a===null||E||ta||ke||nl(e)),a=null,t=e;;){if(t.tag===5||t.tag===26){if(a===null){E=a=t;try{if(r=E.stateNode,i)d=r.style,typeof d.setProperty=="function"?d.setProperty("display","none","important"):d.display="none";else{v=E.stateNode;var q=E.memoizedProps.style,M=q!=null&&q.hasOwnProperty("display")?q.display:null;v.style.display=M==null||typeof M=="boolean"?"":(""+M).trim()}}catch(O){Ae(E,E.return,O)}}}else if(t.tag===6){if(a===null){E=t;try{E.stateNode.nodeValue=i?"":E.memoizedProps}catch(O){Ae(E,E.return,O)}}}else if((t.tag!==22&&t.tag!==23||t.memoizedState===null||t===e)&&t.child!==null){t.child.return=t,t=t.child;continue}if(t===e)break e;for(;t.sibling===null;){if(t.return===null||t.return===e)break e;a===t&&(a=null),t=t.return}a===t&&(a=null),t.sibling.return=t.return,t=t.sibling}l&4&&(l=e.updateQueue,l!==null&&(a=l.retryQueue,a!==null&&(l.retryQueue=null,Ac(e,a))));break;case 19:ht(t,e),mt(e),l&4&&(l=e.updateQueue,l!==null&&(e.updateQueue=null,Ac(e,l)));break;case 30:break;case 21:break;default:ht(t,e),mt(e)}}function mt(e){var t=e.flags;if(t&2){try{for(var a,l=e.return;l!==null;){if(Rd(l)){a=l;break}l=l.return}if(a==null)throw Error(c(160));switch(a.tag){case 27:var i=a.stateNode,r=jc(e);ur(e,r,i);break;case 5:var d=a.stateNode;a.flags&32&&(bl(d,""),a.flags&=-33);var v=jc(e);ur(e,v,d);break;case 3:case 4:var E=a.stateNode.containerInfo,D=jc(e);Nc(e,D,E);break;default:throw Error(c(161))}}catch(L){Ae(e,e.return,L)}e.flags&=-3}t&4096&&(e.flags&=-4097)}function Ld(e){if(e.subtreeFlags&1024)for(e=e.child;e!==null;){var t=e;Ld(t),t.tag===5&&t.flags&1024&&t.stateNode.reset(),e=e.sibling}}function ja(e,t){if(t.subtreeFlags&8772)for(t=t.child;t!==null;)Md(e,t.alternate,t),t=t.sibling}function nl(e){for(e=e.child;e!==null;){var t=e;switch(t.tag){case 0:case 11:case 14:case 15:_a(4,t,t.return),nl(t);break;case 1:Ht(t,t.return);var a=t.stateNode;typeof a.componentWillUnmount=="function"&&Ad(t,t.return,a),nl(t);break;case 27:Fn(t.stateNode);case 26:case 5:Ht(t,t.return),nl(t);break;case 22:t.memoizedState===null&&nl(t);break;case 30:nl(t);break;default:nl(t)}e=e.sibling}}function Na(e,t,a){for(a=a&&(t.subtreeFlags&8772)!==0,t=t.child;t!==null;){var l=t.alternate,i=e,r=t,d=r.flags;switch(r.tag){case 0:case 11:case 15:Na(i,r,a),qn(4,r);break;case 1:if(Na(i,r,a),l=r,i=l.stateNode,typeof i.componentDidMount=="function")try{i.componentDidMount()}catch(D){Ae(l,l.return,D)}if(l=r,i=l.updateQueue,i!==null){var v=l.stateNode;try{var E=i.shared.hiddenCallbacks;if(E!==null)for(i.shared.hiddenCallbacks=null,i=0;i<E.length;i++)df(E[i],v)}catch(D){Ae(l,l.return,D)}}a&&d&64&&wd(r),Gn(r,r.return);break;case 27:Cd(r);case 26:case 5:Na(i,r,a),a&&l===null&&d&4&&Td(r),Gn(r,r.return);break;case 12:Na(i,r,a);break;case 13:Na(i,r,a),a&&d&4&&Ud(i,r);break;case 22:r.memoizedState===null&&Na(i,r,a),Gn(r,r.return);break;case 30:break;default:Na(i,r,a)}t=t.sibling}}function Tc(e,t){var a=null;e!==null&&e.memoizedState!==null&&e.memoizedState.cachePool!==null&&(a=e.memoizedState.cachePool.pool),e=null,t.memoizedState!==null&&t.memoizedState.cachePool!==null&&(e=t.memoizedState.cachePool.pool),e!==a&&(e!=null&&e.refCount++,a!=null&&wn(a))}function Rc(e,t){e=null,t.alternate!==null&&(e=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==e&&(t.refCount++,e!=null&&wn(e))}function qt(e,t,a,l){if(t.subtreeFlags&10256)for(t=t.child;t!==null;)kd(e,t,a,l),t=t.sibling}function kd(e,t,a,l){var i=t.flags;switch(t.tag){case 0:case 11:case 15:qt(e,t,a,l),i&2048&&qn(9,t);break;case 1:qt(e,t,a,l);break;case 3:qt(e,t,a,l),i&2048&&(e=null,t.alternate!==null&&(e=t.alternate.memoizedState.cache),t=t.memoizedState.cache,t!==e&&(t.refCount++,e!=null&&wn(e)));break;case 12:if(i&2048){qt(e,t,a,l),e=t.stateNode;try{var r=t.memoizedProps,d=r.id,v=r.onPostCommit;typeof v=="function"&&v(d,t.alternate===null?"mount":"update",e.passiveEffectDuration,-0)}catch(E){Ae(t,t.return,E)}}else qt(e,t,a,l);break;case 13:qt(e,t,a,l);break;case 23:break;case 22:r=t.stateNode,d=t.alternate,t.memoizedState!==null?r._visibility&2?qt(e,t,a,l):Yn(e,t):r._visibility&2?qt(e,t,a,l):(r._visibility|=2,kl(e,t,a,l,(t.subtreeFlags&10256)!==0)),i&2048&&Tc(d,t);break;case 24:qt(e,t,a,l),i&2048&&Rc(t.alternate,t);break;default:qt(e,t,a,l)}}function kl(e,t,a,l,i){for(i=i&&(t.subtreeFlags&10256)!==0,t=t.child;t!==null;){var r=e,d=t,v=a,E=l,D=d.flags;switch(d.tag){case 0:case 11:case 15:kl(r,d,v,E,i),qn(8,d);break;case 23:break;case 22:var L=d.stateNode;d.memoizedState!==null?L._visibility&2?kl(r,d,v,E,i):Yn(r,d):(L._visibility|=2,kl(r,d,v,E,i)),i&&D&2048&&Tc(d.alternate,d);break;case 24:kl(r,d,v,E,i),i&&D&2048&&Rc(d.alternate,d);break;default:kl(r,d,v,E,i)}t=t.sibling}}function Yn(e,t){if(t.subtreeFlags&10256)for(t=t.child;t!==null;){var a=e,l=t,i=l.flags;switch(l.tag){case 22:Yn(a,l),i&2048&&Tc(l.alternate,l);break;case 24:Yn(a,l),i&2048&&Rc(l.alternate,l);break;default:Yn(a,l)}t=t.sibling}}var Vn=8192;function Hl(e){if(e.subtreeFlags&Vn)for(e=e.child;e!==null;)Hd(e),e=e.sibling}function Hd(e){switch(e.tag){case 26:Hl(e),e.flags&Vn&&e.memoizedState!==null&&Pg(Rt,e.memoizedState,e.memoizedProps);break;case 5:Hl(e);break;case 3:case 4:var t=Rt;Rt=xr(e.stateNode.containerInfo),Hl(e),Rt=t;break;case 22:e.memoizedState===null&&(t=e.alternate,t!==null&&t.memoizedState!==null?(t=Vn,Vn=16777216,Hl(e),Vn=t):Hl(e));break;default:Hl(e)}}function qd(e){var t=e.alternate;if(t!==null&&(e=t.child,e!==null)){t.child=null;do t=e.sibling,e.sibling=null,e=t;while(e!==null)}}function Xn(e){var t=e.deletions;if((e.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var l=t[a];Ze=l,Yd(l,e)}qd(e)}if(e.subtreeFlags&10256)for(e=e.child;e!==null;)Gd(e),e=e.sibling}function Gd(e){switch(e.tag){case 0:case 11:case 15:Xn(e),e.flags&2048&&_a(9,e,e.return);break;case 3:Xn(e);break;case 12:Xn(e);break;case 22:var t=e.stateNode;e.memoizedState!==null&&t._visibility&2&&(e.return===null||e.return.tag!==13)?(t._visibility&=-3,cr(e)):Xn(e);break;default:Xn(e)}}function cr(e){var t=e.deletions;if((e.flags&16)!==0){if(t!==null)for(var a=0;a<t.length;a++){var l=t[a];Ze=l,Yd(l,e)}qd(e)}for(e=e.child;e!==null;){switch(t=e,t.tag){case 0:case 11:case 15:_a(8,t,t.return),cr(t);break;case 22:a=t.stateNode,a._visibility&2&&(a._visibility&=-3,cr(t));break;default:cr(t)}e=e.sibling}}function Yd(e,t){for(;Ze!==null;){var a=Ze;switch(a.tag){case 0:case 11:case 15:_a(8,a,t);break;case 23:case 22:if(a.memoizedState!==null&&a.memoizedState.cachePool!==null){var l=a.memoizedState.cachePool.pool;l!=null&&l.refCount++}break;case 24:wn(a.memoizedState.cache)}if(l=a.child,l!==null)l.return=a,Ze=l;else e:for(a=e;Ze!==null;){l=Ze;var i=l.sibling,r=l.return;if(Od(l),l===a){Ze=null;break e}if(i!==null){i.return=r,Ze=i;break e}Ze=r}}}var mg={getCacheForType:function(e){var t=et(Ge),a=t.data.get(e);return a===void 0&&(a=e(),t.data.set(e,a)),a}},vg=typeof WeakMap=="function"?WeakMap:Map,Se=0,Re=null,me=null,pe=0,Ee=0,vt=null,wa=!1,ql=!1,Cc=!1,la=0,Be=0,Aa=0,il=0,Dc=0,Nt=0,Gl=0,Qn=null,ut=null,Mc=!1,Oc=0,sr=1/0,or=null,Ta=null,Fe=0,Ra=null,Yl=null,Vl=0,zc=0,Uc=null,Vd=null,Zn=0,Bc=null;function pt(){if((Se&2)!==0&&pe!==0)return pe&-pe;if(U.T!==null){var e=Cl;return e!==0?e:Vc()}return lo()}function Xd(){Nt===0&&(Nt=(pe&536870912)===0||be?Is():536870912);var e=jt.current;return e!==null&&(e.flags|=32),Nt}function gt(e,t,a){(e===Re&&(Ee===2||Ee===9)||e.cancelPendingCommit!==null)&&(Xl(e,0),Ca(e,pe,Nt,!1)),on(e,a),((Se&2)===0||e!==Re)&&(e===Re&&((Se&2)===0&&(il|=a),Be===4&&Ca(e,pe,Nt,!1)),Gt(e))}function Qd(e,t,a){if((Se&6)!==0)throw Error(c(327));var l=!a&&(t&124)===0&&(t&e.expiredLanes)===0||sn(e,t),i=l?yg(e,t):Hc(e,t,!0),r=l;do{if(i===0){ql&&!l&&Ca(e,t,0,!1);break}else{if(a=e.current.alternate,r&&!pg(a)){i=Hc(e,t,!1),r=!1;continue}if(i===2){if(r=t,e.errorRecoveryDisabledLanes&r)var d=0;else d=e.pendingLanes&-536870913,d=d!==0?d:d&536870912?536870912:0;if(d!==0){t=d;e:{var v=e;i=Qn;var E=v.current.memoizedState.isDehydrated;if(E&&(Xl(v,d).flags|=256),d=Hc(v,d,!1),d!==2){if(Cc&&!E){v.errorRecoveryDisabledLanes|=r,il|=r,i=4;break e}r=ut,ut=i,r!==null&&(ut===null?ut=r:ut.push.apply(ut,r))}i=d}if(r=!1,i!==2)continue}}if(i===1){Xl(e,0),Ca(e,t,0,!0);break}e:{switch(l=e,r=i,r){case 0:case 1:throw Error(c(345));case 4:if((t&4194048)!==t)break;case 6:Ca(l,t,Nt,!wa);break e;case 2:ut=null;break;case 3:case 5:break;default:throw Error(c(329))}if((t&62914560)===t&&(i=Oc+300-Bt(),10<i)){if(Ca(l,t,Nt,!wa),Si(l,0,!0)!==0)break e;l.timeoutHandle=xh(Zd.bind(null,l,a,ut,or,Mc,t,Nt,il,Gl,wa,r,2,-0,0),i);break e}Zd(l,a,ut,or,Mc,t,Nt,il,Gl,wa,r,0,-0,0)}}break}while(!0);Gt(e)}function Zd(e,t,a,l,i,r,d,v,E,D,L,q,M,O){if(e.timeoutHandle=-1,q=t.subtreeFlags,(q&8192||(q&16785408)===16785408)&&(In={stylesheets:null,count:0,unsuspend:Wg},Hd(t),q=Ig(),q!==null)){e.cancelPendingCommit=q(Id.bind(null,e,t,r,a,l,i,d,v,E,L,1,M,O)),Ca(e,r,d,!D);return}Id(e,t,r,a,l,i,d,v,E)}function pg(e){for(var t=e;;){var a=t.tag;if((a===0||a===11||a===15)&&t.flags&16384&&(a=t.updateQueue,a!==null&&(a=a.stores,a!==null)))for(var l=0;l<a.length;l++){var i=a[l],r=i.getSnapshot;i=i.value;try{if(!ft(r(),i))return!1}catch{return!1}}if(a=t.child,t.subtreeFlags&16384&&a!==null)a.return=t,t=a;else{if(t===e)break;for(;t.sibling===null;){if(t.return===null||t.return===e)return!0;t=t.return}t.sibling.return=t.return,t=t.sibling}}return!0}function Ca(e,t,a,l){t&=~Dc,t&=~il,e.suspendedLanes|=t,e.pingedLanes&=~t,l&&(e.warmLanes|=t),l=e.expirationTimes;for(var i=t;0<i;){var r=31-ot(i),d=1<<r;l[r]=-1,i&=~d}a!==0&&to(e,a,t)}function fr(){return(Se&6)===0?(Kn(0),!1):!0}function Lc(){if(me!==null){if(Ee===0)var e=me.return;else e=me,$t=Ia=null,ec(e),Bl=null,Ln=0,e=me;for(;e!==null;)Nd(e.alternate,e),e=e.return;me=null}}function Xl(e,t){var a=e.timeoutHandle;a!==-1&&(e.timeoutHandle=-1,zg(a)),a=e.cancelPendingCommit,a!==null&&(e.cancelPendingCommit=null,a()),Lc(),Re=e,me=a=Zt(e.current,null),pe=t,Ee=0,vt=null,wa=!1,ql=sn(e,t),Cc=!1,Gl=Nt=Dc=il=Aa=Be=0,ut=Qn=null,Mc=!1,(t&8)!==0&&(t|=t&32);var l=e.entangledLanes;if(l!==0)for(e=e.entanglements,l&=t;0<l;){var i=31-ot(l),r=1<<i;t|=e[i],l&=~r}return la=t,Oi(),a}function Kd(e,t){se=null,U.H=Pi,t===Tn||t===Yi?(t=of(),Ee=3):t===uf?(t=of(),Ee=4):Ee=t===fd?8:t!==null&&typeof t=="object"&&typeof t.then=="function"?6:1,vt=t,me===null&&(Be=1,lr(e,xt(t,e.current)))}function Jd(){var e=U.H;return U.H=Pi,e===null?Pi:e}function $d(){var e=U.A;return U.A=mg,e}function kc(){Be=4,wa||(pe&4194048)!==pe&&jt.current!==null||(ql=!0),(Aa&134217727)===0&&(il&134217727)===0||Re===null||Ca(Re,pe,Nt,!1)}function Hc(e,t,a){var l=Se;Se|=2;var i=Jd(),r=$d();(Re!==e||pe!==t)&&(or=null,Xl(e,t)),t=!1;var d=Be;e:do try{if(Ee!==0&&me!==null){var v=me,E=vt;switch(Ee){case 8:Lc(),d=6;break e;case 3:case 2:case 9:case 6:jt.current===null&&(t=!0);var D=Ee;if(Ee=0,vt=null,Ql(e,v,E,D),a&&ql){d=0;break e}break;default:D=Ee,Ee=0,vt=null,Ql(e,v,E,D)}}gg(),d=Be;break}catch(L){Kd(e,L)}while(!0);return t&&e.shellSuspendCounter++,$t=Ia=null,Se=l,U.H=i,U.A=r,me===null&&(Re=null,pe=0,Oi()),d}function gg(){for(;me!==null;)Fd(me)}function yg(e,t){var a=Se;Se|=2;var l=Jd(),i=$d();Re!==e||pe!==t?(or=null,sr=Bt()+500,Xl(e,t)):ql=sn(e,t);e:do try{if(Ee!==0&&me!==null){t=me;var r=vt;t:switch(Ee){case 1:Ee=0,vt=null,Ql(e,t,r,1);break;case 2:case 9:if(cf(r)){Ee=0,vt=null,Wd(t);break}t=function(){Ee!==2&&Ee!==9||Re!==e||(Ee=7),Gt(e)},r.then(t,t);break e;case 3:Ee=7;break e;case 4:Ee=5;break e;case 7:cf(r)?(Ee=0,vt=null,Wd(t)):(Ee=0,vt=null,Ql(e,t,r,7));break;case 5:var d=null;switch(me.tag){case 26:d=me.memoizedState;case 5:case 27:var v=me;if(!d||Mh(d)){Ee=0,vt=null;var E=v.sibling;if(E!==null)me=E;else{var D=v.return;D!==null?(me=D,dr(D)):me=null}break t}}Ee=0,vt=null,Ql(e,t,r,5);break;case 6:Ee=0,vt=null,Ql(e,t,r,6);break;case 8:Lc(),Be=6;break e;default:throw Error(c(462))}}bg();break}catch(L){Kd(e,L)}while(!0);return $t=Ia=null,U.H=l,U.A=i,Se=a,me!==null?0:(Re=null,pe=0,Oi(),Be)}function bg(){for(;me!==null&&!Gv();)Fd(me)}function Fd(e){var t=_d(e.alternate,e,la);e.memoizedProps=e.pendingProps,t===null?dr(e):me=t}function Wd(e){var t=e,a=t.alternate;switch(t.tag){case 15:case 0:t=gd(a,t,t.pendingProps,t.type,void 0,pe);break;case 11:t=gd(a,t,t.pendingProps,t.type.render,t.ref,pe);break;case 5:ec(t);default:Nd(a,t),t=me=Wo(t,la),t=_d(a,t,la)}e.memoizedProps=e.pendingProps,t===null?dr(e):me=t}function Ql(e,t,a,l){$t=Ia=null,ec(t),Bl=null,Ln=0;var i=t.return;try{if(cg(e,i,t,a,pe)){Be=1,lr(e,xt(a,e.current)),me=null;return}}catch(r){if(i!==null)throw me=i,r;Be=1,lr(e,xt(a,e.current)),me=null;return}t.flags&32768?(be||l===1?e=!0:ql||(pe&536870912)!==0?e=!1:(wa=e=!0,(l===2||l===9||l===3||l===6)&&(l=jt.current,l!==null&&l.tag===13&&(l.flags|=16384))),Pd(t,e)):dr(t)}function dr(e){var t=e;do{if((t.flags&32768)!==0){Pd(t,wa);return}e=t.return;var a=og(t.alternate,t,la);if(a!==null){me=a;return}if(t=t.sibling,t!==null){me=t;return}me=t=e}while(t!==null);Be===0&&(Be=5)}function Pd(e,t){do{var a=fg(e.alternate,e);if(a!==null){a.flags&=32767,me=a;return}if(a=e.return,a!==null&&(a.flags|=32768,a.subtreeFlags=0,a.deletions=null),!t&&(e=e.sibling,e!==null)){me=e;return}me=e=a}while(e!==null);Be=6,me=null}function Id(e,t,a,l,i,r,d,v,E){e.cancelPendingCommit=null;do hr();while(Fe!==0);if((Se&6)!==0)throw Error(c(327));if(t!==null){if(t===e.current)throw Error(c(177));if(r=t.lanes|t.childLanes,r|=Ru,Wv(e,a,r,d,v,E),e===Re&&(me=Re=null,pe=0),Yl=t,Ra=e,Vl=a,zc=r,Uc=i,Vd=l,(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?(e.callbackNode=null,e.callbackPriority=0,_g(yi,function(){return nh(),null})):(e.callbackNode=null,e.callbackPriority=0),l=(t.flags&13878)!==0,(t.subtreeFlags&13878)!==0||l){l=U.T,U.T=null,i=K.p,K.p=2,d=Se,Se|=4;try{dg(e,t,a)}finally{Se=d,K.p=i,U.T=l}}Fe=1,eh(),th(),ah()}}function eh(){if(Fe===1){Fe=0;var e=Ra,t=Yl,a=(t.flags&13878)!==0;if((t.subtreeFlags&13878)!==0||a){a=U.T,U.T=null;var l=K.p;K.p=2;var i=Se;Se|=4;try{Bd(t,e);var r=Wc,d=Go(e.containerInfo),v=r.focusedElem,E=r.selectionRange;if(d!==v&&v&&v.ownerDocument&&qo(v.ownerDocument.documentElement,v)){if(E!==null&&ju(v)){var D=E.start,L=E.end;if(L===void 0&&(L=D),"selectionStart"in v)v.selectionStart=D,v.selectionEnd=Math.min(L,v.value.length);else{var q=v.ownerDocument||document,M=q&&q.defaultView||window;if(M.getSelection){var O=M.getSelection(),ie=v.textContent.length,le=Math.min(E.start,ie),Ne=E.end===void 0?le:Math.min(E.end,ie);!O.extend&&le>Ne&&(d=Ne,Ne=le,le=d);var w=Ho(v,le),j=Ho(v,Ne);if(w&&j&&(O.rangeCount!==1||O.anchorNode!==w.node||O.anchorOffset!==w.offset||O.focusNode!==j.node||O.focusOffset!==j.offset)){var R=q.createRange();R.setStart(w.node,w.offset),O.removeAllRanges(),le>Ne?(O.addRange(R),O.extend(j.node,j.offset)):(R.setEnd(j.node,j.offset),O.addRange(R))}}}}for(q=[],O=v;O=O.parentNode;)O.nodeType===1&&q.push({element:O,left:O.scrollLeft,top:O.scrollTop});for(typeof v.focus=="function"&&v.focus(),v=0;v<q.length;v++){var k=q[v];k.element.scrollLeft=k.left,k.element.scrollTop=k.top}}Nr=!!Fc,Wc=Fc=null}finally{Se=i,K.p=l,U.T=a}}e.current=t,Fe=2}}function th(){if(Fe===2){Fe=0;var e=Ra,t=Yl,a=(t.flags&8772)!==0;if((t.subtreeFlags&8772)!==0||a){a=U.T,U.T=null;var l=K.p;K.p=2;var i=Se;Se|=4;try{Md(e,t.alternate,t)}finally{Se=i,K.p=l,U.T=a}}Fe=3}}function ah(){if(Fe===4||Fe===3){Fe=0,Yv();var e=Ra,t=Yl,a=Vl,l=Vd;(t.subtreeFlags&10256)!==0||(t.flags&10256)!==0?Fe=5:(Fe=0,Yl=Ra=null,lh(e,e.pendingLanes));var i=e.pendingLanes;if(i===0&&(Ta=null),lu(a),t=t.stateNode,st&&typeof st.onCommitFiberRoot=="function")try{st.onCommitFiberRoot(cn,t,void 0,(t.current.flags&128)===128)}catch{}if(l!==null){t=U.T,i=K.p,K.p=2,U.T=null;try{for(var r=e.onRecoverableError,d=0;d<l.length;d++){var v=l[d];r(v.value,{componentStack:v.stack})}}finally{U.T=t,K.p=i}}(Vl&3)!==0&&hr(),Gt(e),i=e.pendingLanes,(a&4194090)!==0&&(i&42)!==0?e===Bc?Zn++:(Zn=0,Bc=e):Zn=0,Kn(0)}}function lh(e,t){(e.pooledCacheLanes&=t)===0&&(t=e.pooledCache,t!=null&&(e.pooledCache=null,wn(t)))}function hr(e){return eh(),th(),ah(),nh()}function nh(){if(Fe!==5)return!1;var e=Ra,t=zc;zc=0;var a=lu(Vl),l=U.T,i=K.p;try{K.p=32>a?32:a,U.T=null,a=Uc,Uc=null;var r=Ra,d=Vl;if(Fe=0,Yl=Ra=null,Vl=0,(Se&6)!==0)throw Error(c(331));var v=Se;if(Se|=4,Gd(r.current),kd(r,r.current,d,a),Se=v,Kn(0,!1),st&&typeof st.onPostCommitFiberRoot=="function")try{st.onPostCommitFiberRoot(cn,r)}catch{}return!0}finally{K.p=i,U.T=l,lh(e,t)}}function ih(e,t,a){t=xt(a,t),t=mc(e.stateNode,t,2),e=ba(e,t,2),e!==null&&(on(e,2),Gt(e))}function Ae(e,t,a){if(e.tag===3)ih(e,e,a);else for(;t!==null;){if(t.tag===3){ih(t,e,a);break}else if(t.tag===1){var l=t.stateNode;if(typeof t.type.getDerivedStateFromError=="function"||typeof l.componentDidCatch=="function"&&(Ta===null||!Ta.has(l))){e=xt(a,e),a=sd(2),l=ba(t,a,2),l!==null&&(od(a,l,t,e),on(l,2),Gt(l));break}}t=t.return}}function qc(e,t,a){var l=e.pingCache;if(l===null){l=e.pingCache=new vg;var i=new Set;l.set(t,i)}else i=l.get(t),i===void 0&&(i=new Set,l.set(t,i));i.has(a)||(Cc=!0,i.add(a),e=xg.bind(null,e,t,a),t.then(e,e))}function xg(e,t,a){var l=e.pingCache;l!==null&&l.delete(t),e.pingedLanes|=e.suspendedLanes&a,e.warmLanes&=~a,Re===e&&(pe&a)===a&&(Be===4||Be===3&&(pe&62914560)===pe&&300>Bt()-Oc?(Se&2)===0&&Xl(e,0):Dc|=a,Gl===pe&&(Gl=0)),Gt(e)}function rh(e,t){t===0&&(t=eo()),e=wl(e,t),e!==null&&(on(e,t),Gt(e))}function Sg(e){var t=e.memoizedState,a=0;t!==null&&(a=t.retryLane),rh(e,a)}function Eg(e,t){var a=0;switch(e.tag){case 13:var l=e.stateNode,i=e.memoizedState;i!==null&&(a=i.retryLane);break;case 19:l=e.stateNode;break;case 22:l=e.stateNode._retryCache;break;default:throw Error(c(314))}l!==null&&l.delete(t),rh(e,a)}function _g(e,t){return Ir(e,t)}var mr=null,Zl=null,Gc=!1,vr=!1,Yc=!1,rl=0;function Gt(e){e!==Zl&&e.next===null&&(Zl===null?mr=Zl=e:Zl=Zl.next=e),vr=!0,Gc||(Gc=!0,Ng())}function Kn(e,t){if(!Yc&&vr){Yc=!0;do for(var a=!1,l=mr;l!==null;){if(e!==0){var i=l.pendingLanes;if(i===0)var r=0;else{var d=l.suspendedLanes,v=l.pingedLanes;r=(1<<31-ot(42|e)+1)-1,r&=i&~(d&~v),r=r&201326741?r&201326741|1:r?r|2:0}r!==0&&(a=!0,oh(l,r))}else r=pe,r=Si(l,l===Re?r:0,l.cancelPendingCommit!==null||l.timeoutHandle!==-1),(r&3)===0||sn(l,r)||(a=!0,oh(l,r));l=l.next}while(a);Yc=!1}}function jg(){uh()}function uh(){vr=Gc=!1;var e=0;rl!==0&&(Og()&&(e=rl),rl=0);for(var t=Bt(),a=null,l=mr;l!==null;){var i=l.next,r=ch(l,t);r===0?(l.next=null,a===null?mr=i:a.next=i,i===null&&(Zl=a)):(a=l,(e!==0||(r&3)!==0)&&(vr=!0)),l=i}Kn(e)}function ch(e,t){for(var a=e.suspendedLanes,l=e.pingedLanes,i=e.expirationTimes,r=e.pendingLanes&-62914561;0<r;){var d=31-ot(r),v=1<<d,E=i[d];E===-1?((v&a)===0||(v&l)!==0)&&(i[d]=Fv(v,t)):E<=t&&(e.expiredLanes|=v),r&=~v}if(t=Re,a=pe,a=Si(e,e===t?a:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),l=e.callbackNode,a===0||e===t&&(Ee===2||Ee===9)||e.cancelPendingCommit!==null)return l!==null&&l!==null&&eu(l),e.callbackNode=null,e.callbackPriority=0;if((a&3)===0||sn(e,a)){if(t=a&-a,t===e.callbackPriority)return t;switch(l!==null&&eu(l),lu(a)){case 2:case 8:a=Ws;break;case 32:a=yi;break;case 268435456:a=Ps;break;default:a=yi}return l=sh.bind(null,e),a=Ir(a,l),e.callbackPriority=t,e.callbackNode=a,t}return l!==null&&l!==null&&eu(l),e.callbackPriority=2,e.callbackNode=null,2}function sh(e,t){if(Fe!==0&&Fe!==5)return e.callbackNode=null,e.callbackPriority=0,null;var a=e.callbackNode;if(hr()&&e.callbackNode!==a)return null;var l=pe;return l=Si(e,e===Re?l:0,e.cancelPendingCommit!==null||e.timeoutHandle!==-1),l===0?null:(Qd(e,l,t),ch(e,Bt()),e.callbackNode!=null&&e.callbackNode===a?sh.bind(null,e):null)}function oh(e,t){if(hr())return null;Qd(e,t,!0)}function Ng(){Ug(function(){(Se&6)!==0?Ir(Fs,jg):uh()})}function Vc(){return rl===0&&(rl=Is()),rl}function fh(e){return e==null||typeof e=="symbol"||typeof e=="boolean"?null:typeof e=="function"?e:wi(""+e)}function dh(e,t){var a=t.ownerDocument.createElement("input");return a.name=t.name,a.value=t.value,e.id&&a.setAttribute("form",e.id),t.parentNode.insertBefore(a,t),e=new FormData(e),a.parentNode.removeChild(a),e}function wg(e,t,a,l,i){if(t==="submit"&&a&&a.stateNode===i){var r=fh((i[lt]||null).action),d=l.submitter;d&&(t=(t=d[lt]||null)?fh(t.formAction):d.getAttribute("formAction"),t!==null&&(r=t,d=null));var v=new Ci("action","action",null,l,i);e.push({event:v,listeners:[{instance:null,listener:function(){if(l.defaultPrevented){if(rl!==0){var E=d?dh(i,d):new FormData(i);sc(a,{pending:!0,data:E,method:i.method,action:r},null,E)}}else typeof r=="function"&&(v.preventDefault(),E=d?dh(i,d):new FormData(i),sc(a,{pending:!0,data:E,method:i.method,action:r},r,E))},currentTarget:i}]})}}for(var Xc=0;Xc<Tu.length;Xc++){var Qc=Tu[Xc],Ag=Qc.toLowerCase(),Tg=Qc[0].toUpperCase()+Qc.slice(1);Tt(Ag,"on"+Tg)}Tt(Xo,"onAnimationEnd"),Tt(Qo,"onAnimationIteration"),Tt(Zo,"onAnimationStart"),Tt("dblclick","onDoubleClick"),Tt("focusin","onFocus"),Tt("focusout","onBlur"),Tt(Qp,"onTransitionRun"),Tt(Zp,"onTransitionStart"),Tt(Kp,"onTransitionCancel"),Tt(Ko,"onTransitionEnd"),pl("onMouseEnter",["mouseout","mouseover"]),pl("onMouseLeave",["mouseout","mouseover"]),pl("onPointerEnter",["pointerout","pointerover"]),pl("onPointerLeave",["pointerout","pointerover"]),Xa("onChange","change click focusin focusout input keydown keyup selectionchange".split(" ")),Xa("onSelect","focusout contextmenu dragend focusin keydown keyup mousedown mouseup selectionchange".split(" ")),Xa("onBeforeInput",["compositionend","keypress","textInput","paste"]),Xa("onCompositionEnd","compositionend focusout keydown keypress keyup mousedown".split(" ")),Xa("onCompositionStart","compositionstart focusout keydown keypress keyup mousedown".split(" ")),Xa("onCompositionUpdate","compositionupdate focusout keydown keypress keyup mousedown".split(" "));var Jn="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange resize seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Rg=new Set("beforetoggle cancel close invalid load scroll scrollend toggle".split(" ").concat(Jn));function hh(e,t){t=(t&4)!==0;for(var a=0;a<e.length;a++){var l=e[a],i=l.event;l=l.listeners;e:{var r=void 0;if(t)for(var d=l.length-1;0<=d;d--){var v=l[d],E=v.instance,D=v.currentTarget;if(v=v.listener,E!==r&&i.isPropagationStopped())break e;r=v,i.currentTarget=D;try{r(i)}catch(L){ar(L)}i.currentTarget=null,r=E}else for(d=0;d<l.length;d++){if(v=l[d],E=v.instance,D=v.currentTarget,v=v.listener,E!==r&&i.isPropagationStopped())break e;r=v,i.currentTarget=D;try{r(i)}catch(L){ar(L)}i.currentTarget=null,r=E}}}}function ve(e,t){var a=t[nu];a===void 0&&(a=t[nu]=new Set);var l=e+"__bubble";a.has(l)||(mh(t,e,2,!1),a.add(l))}function Zc(e,t,a){var l=0;t&&(l|=4),mh(a,e,l,t)}var pr="_reactListening"+Math.random().toString(36).slice(2);function Kc(e){if(!e[pr]){e[pr]=!0,io.forEach(function(a){a!=="selectionchange"&&(Rg.has(a)||Zc(a,!1,e),Zc(a,!0,e))});var t=e.nodeType===9?e:e.ownerDocument;t===null||t[pr]||(t[pr]=!0,Zc("selectionchange",!1,t))}}function mh(e,t,a,l){switch(kh(t)){case 2:var i=ay;break;case 8:i=ly;break;default:i=us}a=i.bind(null,t,a,e),i=void 0,!vu||t!=="touchstart"&&t!=="touchmove"&&t!=="wheel"||(i=!0),l?i!==void 0?e.addEventListener(t,a,{capture:!0,passive:i}):e.addEventListener(t,a,!0):i!==void 0?e.addEventListener(t,a,{passive:i}):e.addEventListener(t,a,!1)}function Jc(e,t,a,l,i){var r=l;if((t&1)===0&&(t&2)===0&&l!==null)e:for(;;){if(l===null)return;var d=l.tag;if(d===3||d===4){var v=l.stateNode.containerInfo;if(v===i)break;if(d===4)for(d=l.return;d!==null;){var E=d.tag;if((E===3||E===4)&&d.stateNode.containerInfo===i)return;d=d.return}for(;v!==null;){if(d=hl(v),d===null)return;if(E=d.tag,E===5||E===6||E===26||E===27){l=r=d;continue e}v=v.parentNode}}l=l.return}xo(function(){var D=r,L=hu(a),q=[];e:{var M=Jo.get(e);if(M!==void 0){var O=Ci,ie=e;switch(e){case"keypress":if(Ti(a)===0)break e;case"keydown":case"keyup":O=_p;break;case"focusin":ie="focus",O=bu;break;case"focusout":ie="blur",O=bu;break;case"beforeblur":case"afterblur":O=bu;break;case"click":if(a.button===2)break e;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":O=_o;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":O=fp;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":O=wp;break;case Xo:case Qo:case Zo:O=mp;break;case Ko:O=Tp;break;case"scroll":case"scrollend":O=sp;break;case"wheel":O=Cp;break;case"copy":case"cut":case"paste":O=pp;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":O=No;break;case"toggle":case"beforetoggle":O=Mp}var le=(t&4)!==0,Ne=!le&&(e==="scroll"||e==="scrollend"),w=le?M!==null?M+"Capture":null:M;le=[];for(var j=D,R;j!==null;){var k=j;if(R=k.stateNode,k=k.tag,k!==5&&k!==26&&k!==27||R===null||w===null||(k=hn(j,w),k!=null&&le.push($n(j,k,R))),Ne)break;j=j.return}0<le.length&&(M=new O(M,ie,null,a,L),q.push({event:M,listeners:le}))}}if((t&7)===0){e:{if(M=e==="mouseover"||e==="pointerover",O=e==="mouseout"||e==="pointerout",M&&a!==du&&(ie=a.relatedTarget||a.fromElement)&&(hl(ie)||ie[dl]))break e;if((O||M)&&(M=L.window===L?L:(M=L.ownerDocument)?M.defaultView||M.parentWindow:window,O?(ie=a.relatedTarget||a.toElement,O=D,ie=ie?hl(ie):null,ie!==null&&(Ne=h(ie),le=ie.tag,ie!==Ne||le!==5&&le!==27&&le!==6)&&(ie=null)):(O=null,ie=D),O!==ie)){if(le=_o,k="onMouseLeave",w="onMouseEnter",j="mouse",(e==="pointerout"||e==="pointerover")&&(le=No,k="onPointerLeave",w="onPointerEnter",j="pointer"),Ne=O==null?M:dn(O),R=ie==null?M:dn(ie),M=new le(k,j+"leave",O,a,L),M.target=Ne,M.relatedTarget=R,k=null,hl(L)===D&&(le=new le(w,j+"enter",ie,a,L),le.target=R,le.relatedTarget=Ne,k=le),Ne=k,O&&ie)t:{for(le=O,w=ie,j=0,R=le;R;R=Kl(R))j++;for(R=0,k=w;k;k=Kl(k))R++;for(;0<j-R;)le=Kl(le),j--;for(;0<R-j;)w=Kl(w),R--;for(;j--;){if(le===w||w!==null&&le===w.alternate)break t;le=Kl(le),w=Kl(w)}le=null}else le=null;O!==null&&vh(q,M,O,le,!1),ie!==null&&Ne!==null&&vh(q,Ne,ie,le,!0)}}e:{if(M=D?dn(D):window,O=M.nodeName&&M.nodeName.toLowerCase(),O==="select"||O==="input"&&M.type==="file")var P=Oo;else if(Do(M))if(zo)P=Yp;else{P=qp;var fe=Hp}else O=M.nodeName,!O||O.toLowerCase()!=="input"||M.type!=="checkbox"&&M.type!=="radio"?D&&fu(D.elementType)&&(P=Oo):P=Gp;if(P&&(P=P(e,D))){Mo(q,P,a,L);break e}fe&&fe(e,M,D),e==="focusout"&&D&&M.type==="number"&&D.memoizedProps.value!=null&&ou(M,"number",M.value)}switch(fe=D?dn(D):window,e){case"focusin":(Do(fe)||fe.contentEditable==="true")&&(_l=fe,Nu=D,Sn=null);break;case"focusout":Sn=Nu=_l=null;break;case"mousedown":wu=!0;break;case"contextmenu":case"mouseup":case"dragend":wu=!1,Yo(q,a,L);break;case"selectionchange":if(Xp)break;case"keydown":case"keyup":Yo(q,a,L)}var ae;if(Su)e:{switch(e){case"compositionstart":var ne="onCompositionStart";break e;case"compositionend":ne="onCompositionEnd";break e;case"compositionupdate":ne="onCompositionUpdate";break e}ne=void 0}else El?Ro(e,a)&&(ne="onCompositionEnd"):e==="keydown"&&a.keyCode===229&&(ne="onCompositionStart");ne&&(wo&&a.locale!=="ko"&&(El||ne!=="onCompositionStart"?ne==="onCompositionEnd"&&El&&(ae=So()):(va=L,pu="value"in va?va.value:va.textContent,El=!0)),fe=gr(D,ne),0<fe.length&&(ne=new jo(ne,e,null,a,L),q.push({event:ne,listeners:fe}),ae?ne.data=ae:(ae=Co(a),ae!==null&&(ne.data=ae)))),(ae=zp?Up(e,a):Bp(e,a))&&(ne=gr(D,"onBeforeInput"),0<ne.length&&(fe=new jo("onBeforeInput","beforeinput",null,a,L),q.push({event:fe,listeners:ne}),fe.data=ae)),wg(q,e,D,a,L)}hh(q,t)})}function $n(e,t,a){return{instance:e,listener:t,currentTarget:a}}function gr(e,t){for(var a=t+"Capture",l=[];e!==null;){var i=e,r=i.stateNode;if(i=i.tag,i!==5&&i!==26&&i!==27||r===null||(i=hn(e,a),i!=null&&l.unshift($n(e,i,r)),i=hn(e,t),i!=null&&l.push($n(e,i,r))),e.tag===3)return l;e=e.return}return[]}function Kl(e){if(e===null)return null;do e=e.return;while(e&&e.tag!==5&&e.tag!==27);return e||null}function vh(e,t,a,l,i){for(var r=t._reactName,d=[];a!==null&&a!==l;){var v=a,E=v.alternate,D=v.stateNode;if(v=v.tag,E!==null&&E===l)break;v!==5&&v!==26&&v!==27||D===null||(E=D,i?(D=hn(a,r),D!=null&&d.unshift($n(a,D,E))):i||(D=hn(a,r),D!=null&&d.push($n(a,D,E)))),a=a.return}d.length!==0&&e.push({event:t,listeners:d})}var Cg=/\r\n?/g,Dg=/\u0000|\uFFFD/g;function ph(e){return(typeof e=="string"?e:""+e).replace(Cg,`
-`).replace(Dg,"")}function gh(e,t){return t=ph(t),ph(e)===t}function yr(){}function je(e,t,a,l,i,r){switch(a){case"children":typeof l=="string"?t==="body"||t==="textarea"&&l===""||bl(e,l):(typeof l=="number"||typeof l=="bigint")&&t!=="body"&&bl(e,""+l);break;case"className":_i(e,"class",l);break;case"tabIndex":_i(e,"tabindex",l);break;case"dir":case"role":case"viewBox":case"width":case"height":_i(e,a,l);break;case"style":yo(e,l,r);break;case"data":if(t!=="object"){_i(e,"data",l);break}case"src":case"href":if(l===""&&(t!=="a"||a!=="href")){e.removeAttribute(a);break}if(l==null||typeof l=="function"||typeof l=="symbol"||typeof l=="boolean"){e.removeAttribute(a);break}l=wi(""+l),e.setAttribute(a,l);break;case"action":case"formAction":if(typeof l=="function"){e.setAttribute(a,"javascript:throw new Error('A React form was unexpectedly submitted. If you called form.submit() manually, consider using form.requestSubmit() instead. If you\\'re trying to use event.stopPropagation() in a submit event handler, consider also calling event.preventDefault().')");break}else typeof r=="function"&&(a==="formAction"?(t!=="input"&&je(e,t,"name",i.name,i,null),je(e,t,"formEncType",i.formEncType,i,null),je(e,t,"formMethod",i.formMethod,i,null),je(e,t,"formTarget",i.formTarget,i,null)):(je(e,t,"encType",i.encType,i,null),je(e,t,"method",i.method,i,null),je(e,t,"target",i.target,i,null)));if(l==null||typeof l=="symbol"||typeof l=="boolean"){e.removeAttribute(a);break}l=wi(""+l),e.setAttribute(a,l);break;case"onClick":l!=null&&(e.onclick=yr);break;case"onScroll":l!=null&&ve("scroll",e);break;case"onScrollEnd":l!=null&&ve("scrollend",e);break;case"dangerouslySetInnerHTML":if(l!=null){if(typeof l!="object"||!("__html"in l))throw Error(c(61));if(a=l.__html,a!=null){if(i.children!=null)throw Error(c(60));e.innerHTML=a}}break;case"multiple":e.multiple=l&&typeof l!="function"&&typeof l!="symbol";break;case"muted":e.muted=l&&typeof l!="function"&&typeof l!="symbol";break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"defaultValue":case"defaultChecked":case"innerHTML":case"ref":break;case"autoFocus":break;case"xlinkHref":if(l==null||typeof l=="function"||typeof l=="boolean"||typeof l=="symbol"){e.removeAttribute("xlink:href");break}a=wi(""+l),e.setAttributeNS("http://www.w3.org/1999/xlink","xlink:href",a);break;case"contentEditable":case"spellCheck":case"draggable":case"value":case"autoReverse":case"externalResourcesRequired":case"focusable":case"preserveAlpha":l!=null&&typeof l!="function"&&typeof l!="symbol"?e.setAttribute(a,""+l):e.removeAttribute(a);break;case"inert":case"allowFullScreen":case"async":case"autoPlay":case"controls":case"default":case"defer":case"disabled":case"disablePictureInPicture":case"disableRemotePlayback":case"formNoValidate":case"hidden":case"loop":case"noModule":case"noValidate":case"open":case"playsInline":case"readOnly":case"required":case"reversed":case"scoped":case"seamless":case"itemScope":l&&typeof l!="function"&&typeof l!="symbol"?e.setAttribute(a,""):e.removeAttribute(a);break;case"capture":case"download":l===!0?e.setAttribute(a,""):l!==!1&&l!=null&&typeof l!="function"&&typeof l!="symbol"?e.setAttribute(a,l):e.removeAttribute(a);break;case"cols":case"rows":case"size":case"span":l!=null&&typeof l!="function"&&typeof l!="symbol"&&!isNaN(l)&&1<=l?e.setAttribute(a,l):e.removeAttribute(a);break;case"rowSpan":case"start":l==null||typeof l=="function"||typeof l=="symbol"||isNaN(l)?e.removeAttribute(a):e.setAttribute(a,l);break;case"popover":ve("beforetoggle",e),ve("toggle",e),Ei(e,"popover",l);break;case"xlinkActuate":Xt(e,"http://www.w3.org/1999/xlink","xlink:actuate",l);break;case"xlinkArcrole":Xt(e,"http://www.w3.org/1999/xlink","xlink:arcrole",l);break;case"xlinkRole":Xt(e,"http://www.w3.org/1999/xlink","xlink:role",l);break;case"xlinkShow":Xt(e,"http://www.w3.org/1999/xlink","xlink:show",l);break;case"xlinkTitle":Xt(e,"http://www.w3.org/1999/xlink","xlink:title",l);break;case"xlinkType":Xt(e,"http://www.w3.org/1999/xlink","xlink:type",l);break;case"xmlBase":Xt(e,"http://www.w3.org/XML/1998/namespace","xml:base",l);break;case"xmlLang":Xt(e,"http://www.w3.org/XML/1998/namespace","xml:lang",l);break;case"xmlSpace":Xt(e,"http://www.w3.org/XML/1998/namespace","xml:space",l);break;case"is":Ei(e,"is",l);break;case"innerText":case"textContent":break;default:(!(2<a.length)||a[0]!=="o"&&a[0]!=="O"||a[1]!=="n"&&a[1]!=="N")&&(a=up.get(a)||a,Ei(e,a,l))}}function $c(e,t,a,l,i,r){switch(a){case"style":yo(e,l,r);break;case"dangerouslySetInnerHTML":if(l!=null){if(typeof l!="object"||!("__html"in l))throw Error(c(61));if(a=l.__html,a!=null){if(i.children!=null)throw Error(c(60));e.innerHTML=a}}break;case"children":typeof l=="string"?bl(e,l):(typeof l=="number"||typeof l=="bigint")&&bl(e,""+l);break;case"onScroll":l!=null&&ve("scroll",e);break;case"onScrollEnd":l!=null&&ve("scrollend",e);break;case"onClick":l!=null&&(e.onclick=yr);break;case"suppressContentEditableWarning":case"suppressHydrationWarning":case"innerHTML":case"ref":break;case"innerText":case"textContent":break;default:if(!ro.hasOwnProperty(a))e:{if(a[0]==="o"&&a[1]==="n"&&(i=a.endsWith("Capture"),t=a.slice(2,i?a.length-7:void 0),r=e[lt]||null,r=r!=null?r[a]:null,typeof r=="function"&&e.removeEventListener(t,r,i),typeof l=="function")){typeof r!="function"&&r!==null&&(a in e?e[a]=null:e.hasAttribute(a)&&e.removeAttribute(a)),e.addEventListener(t,l,i);break e}a in e?e[a]=l:l===!0?e.setAttribute(a,""):Ei(e,a,l)}}}function We(e,t,a){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"img":ve("error",e),ve("load",e);var l=!1,i=!1,r;for(r in a)if(a.hasOwnProperty(r)){var d=a[r];if(d!=null)switch(r){case"src":l=!0;break;case"srcSet":i=!0;break;case"children":case"dangerouslySetInnerHTML":throw Error(c(137,t));default:je(e,t,r,d,a,null)}}i&&je(e,t,"srcSet",a.srcSet,a,null),l&&je(e,t,"src",a.src,a,null);return;case"input":ve("invalid",e);var v=r=d=i=null,E=null,D=null;for(l in a)if(a.hasOwnProperty(l)){var L=a[l];if(L!=null)switch(l){case"name":i=L;break;case"type":d=L;break;case"checked":E=L;break;case"defaultChecked":D=L;break;case"value":r=L;break;case"defaultValue":v=L;break;case"children":case"dangerouslySetInnerHTML":if(L!=null)throw Error(c(137,t));break;default:je(e,t,l,L,a,null)}}mo(e,r,v,E,D,d,i,!1),ji(e);return;case"select":ve("invalid",e),l=d=r=null;for(i in a)if(a.hasOwnProperty(i)&&(v=a[i],v!=null))switch(i){case"value":r=v;break;case"defaultValue":d=v;break;case"multiple":l=v;default:je(e,t,i,v,a,null)}t=r,a=d,e.multiple=!!l,t!=null?yl(e,!!l,t,!1):a!=null&&yl(e,!!l,a,!0);return;case"textarea":ve("invalid",e),r=i=l=null;for(d in a)if(a.hasOwnProperty(d)&&(v=a[d],v!=null))switch(d){case"value":l=v;break;case"defaultValue":i=v;break;case"children":r=v;break;case"dangerouslySetInnerHTML":if(v!=null)throw Error(c(91));break;default:je(e,t,d,v,a,null)}po(e,l,i,r),ji(e);return;case"option":for(E in a)if(a.hasOwnProperty(E)&&(l=a[E],l!=null))switch(E){case"selected":e.selected=l&&typeof l!="function"&&typeof l!="symbol";break;default:je(e,t,E,l,a,null)}return;case"dialog":ve("beforetoggle",e),ve("toggle",e),ve("cancel",e),ve("close",e);break;case"iframe":case"object":ve("load",e);break;case"video":case"audio":for(l=0;l<Jn.length;l++)ve(Jn[l],e);break;case"image":ve("error",e),ve("load",e);break;case"details":ve("toggle",e);break;case"embed":case"source":case"link":ve("error",e),ve("load",e);case"area":case"base":case"br":case"col":case"hr":case"keygen":case"meta":case"param":case"track":case"wbr":case"menuitem":for(D in a)if(a.hasOwnProperty(D)&&(l=a[D],l!=null))switch(D){case"children":case"dangerouslySetInnerHTML":throw Error(c(137,t));default:je(e,t,D,l,a,null)}return;default:if(fu(t)){for(L in a)a.hasOwnProperty(L)&&(l=a[L],l!==void 0&&$c(e,t,L,l,a,void 0));return}}for(v in a)a.hasOwnProperty(v)&&(l=a[v],l!=null&&je(e,t,v,l,a,null))}function Mg(e,t,a,l){switch(t){case"div":case"span":case"svg":case"path":case"a":case"g":case"p":case"li":break;case"input":var i=null,r=null,d=null,v=null,E=null,D=null,L=null;for(O in a){var q=a[O];if(a.hasOwnProperty(O)&&q!=null)switch(O){case"checked":break;case"value":break;case"defaultValue":E=q;default:l.hasOwnProperty(O)||je(e,t,O,null,l,q)}}for(var M in l){var O=l[M];if(q=a[M],l.hasOwnProperty(M)&&(O!=null||q!=null))switch(M){case"type":r=O;break;case"name":i=O;break;case"checked":D=O;break;case"defaultChecked":L=O;break;case"value":d=O;break;case"defaultValue":v=O;break;case"children":case"dangerouslySetInnerHTML":if(O!=null)throw Error(c(137,t));break;default:O!==q&&je(e,t,M,O,l,q)}}su(e,d,v,E,D,L,r,i);return;case"select":O=d=v=M=null;for(r in a)if(E=a[r],a.hasOwnProperty(r)&&E!=null)switch(r){case"value":break;case"multiple":O=E;default:l.hasOwnProperty(r)||je(e,t,r,null,l,E)}for(i in l)if(r=l[i],E=a[i],l.hasOwnProperty(i)&&(r!=null||E!=null))switch(i){case"value":M=r;break;case"defaultValue":v=r;break;case"multiple":d=r;default:r!==E&&je(e,t,i,r,l,E)}t=v,a=d,l=O,M!=null?yl(e,!!a,M,!1):!!l!=!!a&&(t!=null?yl(e,!!a,t,!0):yl(e,!!a,a?[]:"",!1));return;case"textarea":O=M=null;for(v in a)if(i=a[v],a.hasOwnProperty(v)&&i!=null&&!l.hasOwnProperty(v))switch(v){case"value":break;case"children":break;default:je(e,t,v,null,l,i)}for(d in l)if(i=l[d],r=a[d],l.hasOwnProperty(d)&&(i!=null||r!=null))switch(d){case"value":M=i;break;case"defaultValue":O=i;break;case"children":break;case"dangerouslySetInnerHTML":if(i!=null)throw Error(c(91));break;default:i!==r&&je(e,t,d,i,l,r)}vo(e,M,O);return;case"option":for(var ie in a)if(M=a[ie],a.hasOwnProperty(ie)&&M!=null&&!l.hasOwnProperty(ie))switch(ie){case"selected":e.selected=!1;break;default:je(e,t,ie,null,l,M)}for(E in l)if(M=l[E],O=a[E],l.hasOwnProperty(E)&&M!==O&&(M!=null||O!=null))switch(E){case"selected":e.selected=M&&typeof M!="function"&&typeof M!="symbol";break;default:je(e,t,E,M,l,O)}return;case"img":case"link":case"area":case"base":case"br":case"col":case"embed":case"hr":case"keygen":case"meta":case"param":case"source":case"track":case"wbr":case"menuitem":for(var le in a)M=a[le],a.hasOwnProperty(le)&&M!=null&&!l.hasOwnProperty(le)&&je(e,t,le,null,l,M);for(D in l)if(M=l[D],O=a[D],l.hasOwnProperty(D)&&M!==O&&(M!=null||O!=null))switch(D){case"children":case"dangerouslySetInnerHTML":if(M!=null)throw Error(c(137,t));break;default:je(e,t,D,M,l,O)}return;default:if(fu(t)){for(var Ne in a)M=a[Ne],a.hasOwnProperty(Ne)&&M!==void 0&&!l.hasOwnProperty(Ne)&&$c(e,t,Ne,void 0,l,M);for(L in l)M=l[L],O=a[L],!l.hasOwnProperty(L)||M===O||M===void 0&&O===void 0||$c(e,t,L,M,l,O);return}}for(var w in a)M=a[w],a.hasOwnProperty(w)&&M!=null&&!l.hasOwnProperty(w)&&je(e,t,w,null,l,M);for(q in l)M=l[q],O=a[q],!l.hasOwnProperty(q)||M===O||M==null&&O==null||je(e,t,q,M,l,O)}var Fc=null,Wc=null;function br(e){return e.nodeType===9?e:e.ownerDocument}function yh(e){switch(e){case"http://www.w3.org/2000/svg":return 1;case"http://www.w3.org/1998/Math/MathML":return 2;default:return 0}}function bh(e,t){if(e===0)switch(t){case"svg":return 1;case"math":return 2;default:return 0}return e===1&&t==="foreignObject"?0:e}function Pc(e,t){return e==="textarea"||e==="noscript"||typeof t.children=="string"||typeof t.children=="number"||typeof t.children=="bigint"||typeof t.dangerouslySetInnerHTML=="object"&&t.dangerouslySetInnerHTML!==null&&t.dangerouslySetInnerHTML.__html!=null}var Ic=null;function Og(){var e=window.event;return e&&e.type==="popstate"?e===Ic?!1:(Ic=e,!0):(Ic=null,!1)}var xh=typeof setTimeout=="function"?setTimeout:void 0,zg=typeof clearTimeout=="function"?clearTimeout:void 0,Sh=typeof Promise=="function"?Promise:void 0,Ug=typeof queueMicrotask=="function"?queueMicrotask:typeof Sh<"u"?function(e){return Sh.resolve(null).then(e).catch(Bg)}:xh;function Bg(e){setTimeout(function(){throw e})}function Da(e){return e==="head"}function Eh(e,t){var a=t,l=0,i=0;do{var r=a.nextSibling;if(e.removeChild(a),r&&r.nodeType===8)if(a=r.data,a==="/$"){if(0<l&&8>l){a=l;var d=e.ownerDocument;if(a&1&&Fn(d.documentElement),a&2&&Fn(d.body),a&4)for(a=d.head,Fn(a),d=a.firstChild;d;){var v=d.nextSibling,E=d.nodeName;d[fn]||E==="SCRIPT"||E==="STYLE"||E==="LINK"&&d.rel.toLowerCase()==="stylesheet"||a.removeChild(d),d=v}}if(i===0){e.removeChild(r),ni(t);return}i--}else a==="$"||a==="$?"||a==="$!"?i++:l=a.charCodeAt(0)-48;else l=0;a=r}while(a);ni(t)}function es(e){var t=e.firstChild;for(t&&t.nodeType===10&&(t=t.nextSibling);t;){var a=t;switch(t=t.nextSibling,a.nodeName){case"HTML":case"HEAD":case"BODY":es(a),iu(a);continue;case"SCRIPT":case"STYLE":continue;case"LINK":if(a.rel.toLowerCase()==="stylesheet")continue}e.removeChild(a)}}function Lg(e,t,a,l){for(;e.nodeType===1;){var i=a;if(e.nodeName.toLowerCase()!==t.toLowerCase()){if(!l&&(e.nodeName!=="INPUT"||e.type!=="hidden"))break}else if(l){if(!e[fn])switch(t){case"meta":if(!e.hasAttribute("itemprop"))break;return e;case"link":if(r=e.getAttribute("rel"),r==="stylesheet"&&e.hasAttribute("data-precedence"))break;if(r!==i.rel||e.getAttribute("href")!==(i.href==null||i.href===""?null:i.href)||e.getAttribute("crossorigin")!==(i.crossOrigin==null?null:i.crossOrigin)||e.getAttribute("title")!==(i.title==null?null:i.title))break;return e;case"style":if(e.hasAttribute("data-precedence"))break;return e;case"script":if(r=e.getAttribute("src"),(r!==(i.src==null?null:i.src)||e.getAttribute("type")!==(i.type==null?null:i.type)||e.getAttribute("crossorigin")!==(i.crossOrigin==null?null:i.crossOrigin))&&r&&e.hasAttribute("async")&&!e.hasAttribute("itemprop"))break;return e;default:return e}}else if(t==="input"&&e.type==="hidden"){var r=i.name==null?null:""+i.name;if(i.type==="hidden"&&e.getAttribute("name")===r)return e}else return e;if(e=Ct(e.nextSibling),e===null)break}return null}function kg(e,t,a){if(t==="")return null;for(;e.nodeType!==3;)if((e.nodeType!==1||e.nodeName!=="INPUT"||e.type!=="hidden")&&!a||(e=Ct(e.nextSibling),e===null))return null;return e}function ts(e){return e.data==="$!"||e.data==="$?"&&e.ownerDocument.readyState==="complete"}function Hg(e,t){var a=e.ownerDocument;if(e.data!=="$?"||a.readyState==="complete")t();else{var l=function(){t(),a.removeEventListener("DOMContentLoaded",l)};a.addEventListener("DOMContentLoaded",l),e._reactRetry=l}}function Ct(e){for(;e!=null;e=e.nextSibling){var t=e.nodeType;if(t===1||t===3)break;if(t===8){if(t=e.data,t==="$"||t==="$!"||t==="$?"||t==="F!"||t==="F")break;if(t==="/$")return null}}return e}var as=null;function _h(e){e=e.previousSibling;for(var t=0;e;){if(e.nodeType===8){var a=e.data;if(a==="$"||a==="$!"||a==="$?"){if(t===0)return e;t--}else a==="/$"&&t++}e=e.previousSibling}return null}function jh(e,t,a){switch(t=br(a),e){case"html":if(e=t.documentElement,!e)throw Error(c(452));return e;case"head":if(e=t.head,!e)throw Error(c(453));return e;case"body":if(e=t.body,!e)throw Error(c(454));return e;default:throw Error(c(451))}}function Fn(e){for(var t=e.attributes;t.length;)e.removeAttributeNode(t[0]);iu(e)}var wt=new Map,Nh=new Set;function xr(e){return typeof e.getRootNode=="function"?e.getRootNode():e.nodeType===9?e:e.ownerDocument}var na=K.d;K.d={f:qg,r:Gg,D:Yg,C:Vg,L:Xg,m:Qg,X:Kg,S:Zg,M:Jg};function qg(){var e=na.f(),t=fr();return e||t}function Gg(e){var t=ml(e);t!==null&&t.tag===5&&t.type==="form"?Qf(t):na.r(e)}var Jl=typeof document>"u"?null:document;function wh(e,t,a){var l=Jl;if(l&&typeof t=="string"&&t){var i=bt(t);i='link[rel="'+e+'"][href="'+i+'"]',typeof a=="string"&&(i+='[crossorigin="'+a+'"]'),Nh.has(i)||(Nh.add(i),e={rel:e,crossOrigin:a,href:t},l.querySelector(i)===null&&(t=l.createElement("link"),We(t,"link",e),Xe(t),l.head.appendChild(t)))}}function Yg(e){na.D(e),wh("dns-prefetch",e,null)}function Vg(e,t){na.C(e,t),wh("preconnect",e,t)}function Xg(e,t,a){na.L(e,t,a);var l=Jl;if(l&&e&&t){var i='link[rel="preload"][as="'+bt(t)+'"]';t==="image"&&a&&a.imageSrcSet?(i+='[imagesrcset="'+bt(a.imageSrcSet)+'"]',typeof a.imageSizes=="string"&&(i+='[imagesizes="'+bt(a.imageSizes)+'"]')):i+='[href="'+bt(e)+'"]';var r=i;switch(t){case"style":r=$l(e);break;case"script":r=Fl(e)}wt.has(r)||(e=x({rel:"preload",href:t==="image"&&a&&a.imageSrcSet?void 0:e,as:t},a),wt.set(r,e),l.querySelector(i)!==null||t==="style"&&l.querySelector(Wn(r))||t==="script"&&l.querySelector(Pn(r))||(t=l.createElement("link"),We(t,"link",e),Xe(t),l.head.appendChild(t)))}}function Qg(e,t){na.m(e,t);var a=Jl;if(a&&e){var l=t&&typeof t.as=="string"?t.as:"script",i='link[rel="modulepreload"][as="'+bt(l)+'"][href="'+bt(e)+'"]',r=i;switch(l){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":r=Fl(e)}if(!wt.has(r)&&(e=x({rel:"modulepreload",href:e},t),wt.set(r,e),a.querySelector(i)===null)){switch(l){case"audioworklet":case"paintworklet":case"serviceworker":case"sharedworker":case"worker":case"script":if(a.querySelector(Pn(r)))return}l=a.createElement("link"),We(l,"link",e),Xe(l),a.head.appendChild(l)}}}function Zg(e,t,a){na.S(e,t,a);var l=Jl;if(l&&e){var i=vl(l).hoistableStyles,r=$l(e);t=t||"default";var d=i.get(r);if(!d){var v={loading:0,preload:null};if(d=l.querySelector(Wn(r)))v.loading=5;else{e=x({rel:"stylesheet",href:e,"data-precedence":t},a),(a=wt.get(r))&&ls(e,a);var E=d=l.createElement("link");Xe(E),We(E,"link",e),E._p=new Promise(function(D,L){E.onload=D,E.onerror=L}),E.addEventListener("load",function(){v.loading|=1}),E.addEventListener("error",function(){v.loading|=2}),v.loading|=4,Sr(d,t,l)}d={type:"stylesheet",instance:d,count:1,state:v},i.set(r,d)}}}function Kg(e,t){na.X(e,t);var a=Jl;if(a&&e){var l=vl(a).hoistableScripts,i=Fl(e),r=l.get(i);r||(r=a.querySelector(Pn(i)),r||(e=x({src:e,async:!0},t),(t=wt.get(i))&&ns(e,t),r=a.createElement("script"),Xe(r),We(r,"link",e),a.head.appendChild(r)),r={type:"script",instance:r,count:1,state:null},l.set(i,r))}}function Jg(e,t){na.M(e,t);var a=Jl;if(a&&e){var l=vl(a).hoistableScripts,i=Fl(e),r=l.get(i);r||(r=a.querySelector(Pn(i)),r||(e=x({src:e,async:!0,type:"module"},t),(t=wt.get(i))&&ns(e,t),r=a.createElement("script"),Xe(r),We(r,"link",e),a.head.appendChild(r)),r={type:"script",instance:r,count:1,state:null},l.set(i,r))}}function Ah(e,t,a,l){var i=(i=re.current)?xr(i):null;if(!i)throw Error(c(446));switch(e){case"meta":case"title":return null;case"style":return typeof a.precedence=="string"&&typeof a.href=="string"?(t=$l(a.href),a=vl(i).hoistableStyles,l=a.get(t),l||(l={type:"style",instance:null,count:0,state:null},a.set(t,l)),l):{type:"void",instance:null,count:0,state:null};case"link":if(a.rel==="stylesheet"&&typeof a.href=="string"&&typeof a.precedence=="string"){e=$l(a.href);var r=vl(i).hoistableStyles,d=r.get(e);if(d||(i=i.ownerDocument||i,d={type:"stylesheet",instance:null,count:0,state:{loading:0,preload:null}},r.set(e,d),(r=i.querySelector(Wn(e)))&&!r._p&&(d.instance=r,d.state.loading=5),wt.has(e)||(a={rel:"preload",as:"style",href:a.href,crossOrigin:a.crossOrigin,integrity:a.integrity,media:a.media,hrefLang:a.hrefLang,referrerPolicy:a.referrerPolicy},wt.set(e,a),r||$g(i,e,a,d.state))),t&&l===null)throw Error(c(528,""));return d}if(t&&l!==null)throw Error(c(529,""));return null;case"script":return t=a.async,a=a.src,typeof a=="string"&&t&&typeof t!="function"&&typeof t!="symbol"?(t=Fl(a),a=vl(i).hoistableScripts,l=a.get(t),l||(l={type:"script",instance:null,count:0,state:null},a.set(t,l)),l):{type:"void",instance:null,count:0,state:null};default:throw Error(c(444,e))}}function $l(e){return'href="'+bt(e)+'"'}function Wn(e){return'link[rel="stylesheet"]['+e+"]"}function Th(e){return x({},e,{"data-precedence":e.precedence,precedence:null})}function $g(e,t,a,l){e.querySelector('link[rel="preload"][as="style"]['+t+"]")?l.loading=1:(t=e.createElement("link"),l.preload=t,t.addEventListener("load",function(){return l.loading|=1}),t.addEventListener("error",function(){return l.loading|=2}),We(t,"link",a),Xe(t),e.head.appendChild(t))}function Fl(e){return'[src="'+bt(e)+'"]'}function Pn(e){return"script[async]"+e}function Rh(e,t,a){if(t.count++,t.instance===null)switch(t.type){case"style":var l=e.querySelector('style[data-href~="'+bt(a.href)+'"]');if(l)return t.instance=l,Xe(l),l;var i=x({},a,{"data-href":a.href,"data-precedence":a.precedence,href:null,precedence:null});return l=(e.ownerDocument||e).createElement("style"),Xe(l),We(l,"style",i),Sr(l,a.precedence,e),t.instance=l;case"stylesheet":i=$l(a.href);var r=e.querySelector(Wn(i));if(r)return t.state.loading|=4,t.instance=r,Xe(r),r;l=Th(a),(i=wt.get(i))&&ls(l,i),r=(e.ownerDocument||e).createElement("link"),Xe(r);var d=r;return d._p=new Promise(function(v,E){d.onload=v,d.onerror=E}),We(r,"link",l),t.state.loading|=4,Sr(r,a.precedence,e),t.instance=r;case"script":return r=Fl(a.src),(i=e.querySelector(Pn(r)))?(t.instance=i,Xe(i),i):(l=a,(i=wt.get(r))&&(l=x({},a),ns(l,i)),e=e.ownerDocument||e,i=e.createElement("script"),Xe(i),We(i,"link",l),e.head.appendChild(i),t.instance=i);case"void":return null;default:throw Error(c(443,t.type))}else t.type==="stylesheet"&&(t.state.loading&4)===0&&(l=t.instance,t.state.loading|=4,Sr(l,a.precedence,e));return t.instance}function Sr(e,t,a){for(var l=a.querySelectorAll('link[rel="stylesheet"][data-precedence],style[data-precedence]'),i=l.length?l[l.length-1]:null,r=i,d=0;d<l.length;d++){var v=l[d];if(v.dataset.precedence===t)r=v;else if(r!==i)break}r?r.parentNode.insertBefore(e,r.nextSibling):(t=a.nodeType===9?a.head:a,t.insertBefore(e,t.firstChild))}function ls(e,t){e.crossOrigin==null&&(e.crossOrigin=t.crossOrigin),e.referrerPolicy==null&&(e.referrerPolicy=t.referrerPolicy),e.title==null&&(e.title=t.title)}function ns(e,t){e.crossOrigin==null&&(e.crossOrigin=t.crossOrigin),e.referrerPolicy==null&&(e.referrerPolicy=t.referrerPolicy),e.integrity==null&&(e.integrity=t.integrity)}var Er=null;function Ch(e,t,a){if(Er===null){var l=new Map,i=Er=new Map;i.set(a,l)}else i=Er,l=i.get(a),l||(l=new Map,i.set(a,l));if(l.has(e))return l;for(l.set(e,null),a=a.getElementsByTagName(e),i=0;i<a.length;i++){var r=a[i];if(!(r[fn]||r[Ie]||e==="link"&&r.getAttribute("rel")==="stylesheet")&&r.namespaceURI!=="http://www.w3.org/2000/svg"){var d=r.getAttribute(t)||"";d=e+d;var v=l.get(d);v?v.push(r):l.set(d,[r])}}return l}function Dh(e,t,a){e=e.ownerDocument||e,e.head.insertBefore(a,t==="title"?e.querySelector("head > title"):null)}function Fg(e,t,a){if(a===1||t.itemProp!=null)return!1;switch(e){case"meta":case"title":return!0;case"style":if(typeof t.precedence!="string"||typeof t.href!="string"||t.href==="")break;return!0;case"link":if(typeof t.rel!="string"||typeof t.href!="string"||t.href===""||t.onLoad||t.onError)break;switch(t.rel){case"stylesheet":return e=t.disabled,typeof t.precedence=="string"&&e==null;default:return!0}case"script":if(t.async&&typeof t.async!="function"&&typeof t.async!="symbol"&&!t.onLoad&&!t.onError&&t.src&&typeof t.src=="string")return!0}return!1}function Mh(e){return!(e.type==="stylesheet"&&(e.state.loading&3)===0)}var In=null;function Wg(){}function Pg(e,t,a){if(In===null)throw Error(c(475));var l=In;if(t.type==="stylesheet"&&(typeof a.media!="string"||matchMedia(a.media).matches!==!1)&&(t.state.loading&4)===0){if(t.instance===null){var i=$l(a.href),r=e.querySelector(Wn(i));if(r){e=r._p,e!==null&&typeof e=="object"&&typeof e.then=="function"&&(l.count++,l=_r.bind(l),e.then(l,l)),t.state.loading|=4,t.instance=r,Xe(r);return}r=e.ownerDocument||e,a=Th(a),(i=wt.get(i))&&ls(a,i),r=r.createElement("link"),Xe(r);var d=r;d._p=new Promise(function(v,E){d.onload=v,d.onerror=E}),We(r,"link",a),t.instance=r}l.stylesheets===null&&(l.stylesheets=new Map),l.stylesheets.set(t,e),(e=t.state.preload)&&(t.state.loading&3)===0&&(l.count++,t=_r.bind(l),e.addEventListener("load",t),e.addEventListener("error",t))}}function Ig(){if(In===null)throw Error(c(475));var e=In;return e.stylesheets&&e.count===0&&is(e,e.stylesheets),0<e.count?function(t){var a=setTimeout(function(){if(e.stylesheets&&is(e,e.stylesheets),e.unsuspend){var l=e.unsuspend;e.unsuspend=null,l()}},6e4);return e.unsuspend=t,function(){e.unsuspend=null,clearTimeout(a)}}:null}function _r(){if(this.count--,this.count===0){if(this.stylesheets)is(this,this.stylesheets);else if(this.unsuspend){var e=this.unsuspend;this.unsuspend=null,e()}}}var jr=null;function is(e,t){e.stylesheets=null,e.unsuspend!==null&&(e.count++,jr=new Map,t.forEach(ey,e),jr=null,_r.call(e))}function ey(e,t){if(!(t.state.loading&4)){var a=jr.get(e);if(a)var l=a.get(null);else{a=new Map,jr.set(e,a);for(var i=e.querySelectorAll("link[data-precedence],style[data-precedence]"),r=0;r<i.length;r++){var d=i[r];(d.nodeName==="LINK"||d.getAttribute("media")!=="not all")&&(a.set(d.dataset.precedence,d),l=d)}l&&a.set(null,l)}i=t.instance,d=i.getAttribute("data-precedence"),r=a.get(d)||l,r===l&&a.set(null,i),a.set(d,i),this.count++,l=_r.bind(this),i.addEventListener("load",l),i.addEventListener("error",l),r?r.parentNode.insertBefore(i,r.nextSibling):(e=e.nodeType===9?e.head:e,e.insertBefore(i,e.firstChild)),t.state.loading|=4}}var ei={$$typeof:V,Provider:null,Consumer:null,_currentValue:Y,_currentValue2:Y,_threadCount:0};function ty(e,t,a,l,i,r,d,v){this.tag=1,this.containerInfo=e,this.pingCache=this.current=this.pendingChildren=null,this.timeoutHandle=-1,this.callbackNode=this.next=this.pendingContext=this.context=this.cancelPendingCommit=null,this.callbackPriority=0,this.expirationTimes=tu(-1),this.entangledLanes=this.shellSuspendCounter=this.errorRecoveryDisabledLanes=this.expiredLanes=this.warmLanes=this.pingedLanes=this.suspendedLanes=this.pendingLanes=0,this.entanglements=tu(0),this.hiddenUpdates=tu(null),this.identifierPrefix=l,this.onUncaughtError=i,this.onCaughtError=r,this.onRecoverableError=d,this.pooledCache=null,this.pooledCacheLanes=0,this.formState=v,this.incompleteTransitions=new Map}function Oh(e,t,a,l,i,r,d,v,E,D,L,q){return e=new ty(e,t,a,d,v,E,D,q),t=1,r===!0&&(t|=24),r=dt(3,null,null,t),e.current=r,r.stateNode=e,t=qu(),t.refCount++,e.pooledCache=t,t.refCount++,r.memoizedState={element:l,isDehydrated:a,cache:t},Xu(r),e}function zh(e){return e?(e=Al,e):Al}function Uh(e,t,a,l,i,r){i=zh(i),l.context===null?l.context=i:l.pendingContext=i,l=ya(t),l.payload={element:a},r=r===void 0?null:r,r!==null&&(l.callback=r),a=ba(e,l,t),a!==null&&(gt(a,e,t),Cn(a,e,t))}function Bh(e,t){if(e=e.memoizedState,e!==null&&e.dehydrated!==null){var a=e.retryLane;e.retryLane=a!==0&&a<t?a:t}}function rs(e,t){Bh(e,t),(e=e.alternate)&&Bh(e,t)}function Lh(e){if(e.tag===13){var t=wl(e,67108864);t!==null&&gt(t,e,67108864),rs(e,67108864)}}var Nr=!0;function ay(e,t,a,l){var i=U.T;U.T=null;var r=K.p;try{K.p=2,us(e,t,a,l)}finally{K.p=r,U.T=i}}function ly(e,t,a,l){var i=U.T;U.T=null;var r=K.p;try{K.p=8,us(e,t,a,l)}finally{K.p=r,U.T=i}}function us(e,t,a,l){if(Nr){var i=cs(l);if(i===null)Jc(e,t,l,wr,a),Hh(e,l);else if(iy(i,e,t,a,l))l.stopPropagation();else if(Hh(e,l),t&4&&-1<ny.indexOf(e)){for(;i!==null;){var r=ml(i);if(r!==null)switch(r.tag){case 3:if(r=r.stateNode,r.current.memoizedState.isDehydrated){var d=Va(r.pendingLanes);if(d!==0){var v=r;for(v.pendingLanes|=2,v.entangledLanes|=2;d;){var E=1<<31-ot(d);v.entanglements[1]|=E,d&=~E}Gt(r),(Se&6)===0&&(sr=Bt()+500,Kn(0))}}break;case 13:v=wl(r,2),v!==null&&gt(v,r,2),fr(),rs(r,2)}if(r=cs(l),r===null&&Jc(e,t,l,wr,a),r===i)break;i=r}i!==null&&l.stopPropagation()}else Jc(e,t,l,null,a)}}function cs(e){return e=hu(e),ss(e)}var wr=null;function ss(e){if(wr=null,e=hl(e),e!==null){var t=h(e);if(t===null)e=null;else{var a=t.tag;if(a===13){if(e=g(t),e!==null)return e;e=null}else if(a===3){if(t.stateNode.current.memoizedState.isDehydrated)return t.tag===3?t.stateNode.containerInfo:null;e=null}else t!==e&&(e=null)}}return wr=e,null}function kh(e){switch(e){case"beforetoggle":case"cancel":case"click":case"close":case"contextmenu":case"copy":case"cut":case"auxclick":case"dblclick":case"dragend":case"dragstart":case"drop":case"focusin":case"focusout":case"input":case"invalid":case"keydown":case"keypress":case"keyup":case"mousedown":case"mouseup":case"paste":case"pause":case"play":case"pointercancel":case"pointerdown":case"pointerup":case"ratechange":case"reset":case"resize":case"seeked":case"submit":case"toggle":case"touchcancel":case"touchend":case"touchstart":case"volumechange":case"change":case"selectionchange":case"textInput":case"compositionstart":case"compositionend":case"compositionupdate":case"beforeblur":case"afterblur":case"beforeinput":case"blur":case"fullscreenchange":case"focus":case"hashchange":case"popstate":case"select":case"selectstart":return 2;case"drag":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"mousemove":case"mouseout":case"mouseover":case"pointermove":case"pointerout":case"pointerover":case"scroll":case"touchmove":case"wheel":case"mouseenter":case"mouseleave":case"pointerenter":case"pointerleave":return 8;case"message":switch(Vv()){case Fs:return 2;case Ws:return 8;case yi:case Xv:return 32;case Ps:return 268435456;default:return 32}default:return 32}}var os=!1,Ma=null,Oa=null,za=null,ti=new Map,ai=new Map,Ua=[],ny="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput copy cut paste click change contextmenu reset".split(" ");function Hh(e,t){switch(e){case"focusin":case"focusout":Ma=null;break;case"dragenter":case"dragleave":Oa=null;break;case"mouseover":case"mouseout":za=null;break;case"pointerover":case"pointerout":ti.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":ai.delete(t.pointerId)}}function li(e,t,a,l,i,r){return e===null||e.nativeEvent!==r?(e={blockedOn:t,domEventName:a,eventSystemFlags:l,nativeEvent:r,targetContainers:[i]},t!==null&&(t=ml(t),t!==null&&Lh(t)),e):(e.eventSystemFlags|=l,t=e.targetContainers,i!==null&&t.indexOf(i)===-1&&t.push(i),e)}function iy(e,t,a,l,i){switch(t){case"focusin":return Ma=li(Ma,e,t,a,l,i),!0;case"dragenter":return Oa=li(Oa,e,t,a,l,i),!0;case"mouseover":return za=li(za,e,t,a,l,i),!0;case"pointerover":var r=i.pointerId;return ti.set(r,li(ti.get(r)||null,e,t,a,l,i)),!0;case"gotpointercapture":return r=i.pointerId,ai.set(r,li(ai.get(r)||null,e,t,a,l,i)),!0}return!1}function qh(e){var t=hl(e.target);if(t!==null){var a=h(t);if(a!==null){if(t=a.tag,t===13){if(t=g(a),t!==null){e.blockedOn=t,Pv(e.priority,function(){if(a.tag===13){var l=pt();l=au(l);var i=wl(a,l);i!==null&&gt(i,a,l),rs(a,l)}});return}}else if(t===3&&a.stateNode.current.memoizedState.isDehydrated){e.blockedOn=a.tag===3?a.stateNode.containerInfo:null;return}}}e.blockedOn=null}function Ar(e){if(e.blockedOn!==null)return!1;for(var t=e.targetContainers;0<t.length;){var a=cs(e.nativeEvent);if(a===null){a=e.nativeEvent;var l=new a.constructor(a.type,a);du=l,a.target.dispatchEvent(l),du=null}else return t=ml(a),t!==null&&Lh(t),e.blockedOn=a,!1;t.shift()}return!0}function Gh(e,t,a){Ar(e)&&a.delete(t)}function ry(){os=!1,Ma!==null&&Ar(Ma)&&(Ma=null),Oa!==null&&Ar(Oa)&&(Oa=null),za!==null&&Ar(za)&&(za=null),ti.forEach(Gh),ai.forEach(Gh)}function Tr(e,t){e.blockedOn===t&&(e.blockedOn=null,os||(os=!0,n.unstable_scheduleCallback(n.unstable_NormalPriority,ry)))}var Rr=null;function Yh(e){Rr!==e&&(Rr=e,n.unstable_scheduleCallback(n.unstable_NormalPriority,function(){Rr===e&&(Rr=null);for(var t=0;t<e.length;t+=3){var a=e[t],l=e[t+1],i=e[t+2];if(typeof l!="function"){if(ss(l||a)===null)continue;break}var r=ml(a);r!==null&&(e.splice(t,3),t-=3,sc(r,{pending:!0,data:i,method:a.method,action:l},l,i))}}))}function ni(e){function t(E){return Tr(E,e)}Ma!==null&&Tr(Ma,e),Oa!==null&&Tr(Oa,e),za!==null&&Tr(za,e),ti.forEach(t),ai.forEach(t);for(var a=0;a<Ua.length;a++){var l=Ua[a];l.blockedOn===e&&(l.blockedOn=null)}for(;0<Ua.length&&(a=Ua[0],a.blockedOn===null);)qh(a),a.blockedOn===null&&Ua.shift();if(a=(e.ownerDocument||e).$$reactFormReplay,a!=null)for(l=0;l<a.length;l+=3){var i=a[l],r=a[l+1],d=i[lt]||null;if(typeof r=="function")d||Yh(a);else if(d){var v=null;if(r&&r.hasAttribute("formAction")){if(i=r,d=r[lt]||null)v=d.formAction;else if(ss(i)!==null)continue}else v=d.action;typeof v=="function"?a[l+1]=v:(a.splice(l,3),l-=3),Yh(a)}}}function fs(e){this._internalRoot=e}Cr.prototype.render=fs.prototype.render=function(e){var t=this._internalRoot;if(t===null)throw Error(c(409));var a=t.current,l=pt();Uh(a,l,e,t,null,null)},Cr.prototype.unmount=fs.prototype.unmount=function(){var e=this._internalRoot;if(e!==null){this._internalRoot=null;var t=e.containerInfo;Uh(e.current,2,null,e,null,null),fr(),t[dl]=null}};function Cr(e){this._internalRoot=e}Cr.prototype.unstable_scheduleHydration=function(e){if(e){var t=lo();e={blockedOn:null,target:e,priority:t};for(var a=0;a<Ua.length&&t!==0&&t<Ua[a].priority;a++);Ua.splice(a,0,e),a===0&&qh(e)}};var Vh=u.version;if(Vh!=="19.1.0")throw Error(c(527,Vh,"19.1.0"));K.findDOMNode=function(e){var t=e._reactInternals;if(t===void 0)throw typeof e.render=="function"?Error(c(188)):(e=Object.keys(e).join(","),Error(c(268,e)));return e=y(t),e=e!==null?m(e):null,e=e===null?null:e.stateNode,e};var uy={bundleType:0,version:"19.1.0",rendererPackageName:"react-dom",currentDispatcherRef:U,reconcilerVersion:"19.1.0"};if(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__<"u"){var Dr=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(!Dr.isDisabled&&Dr.supportsFiber)try{cn=Dr.inject(uy),st=Dr}catch{}}return ri.createRoot=function(e,t){if(!f(e))throw Error(c(299));var a=!1,l="",i=id,r=rd,d=ud,v=null;return t!=null&&(t.unstable_strictMode===!0&&(a=!0),t.identifierPrefix!==void 0&&(l=t.identifierPrefix),t.onUncaughtError!==void 0&&(i=t.onUncaughtError),t.onCaughtError!==void 0&&(r=t.onCaughtError),t.onRecoverableError!==void 0&&(d=t.onRecoverableError),t.unstable_transitionCallbacks!==void 0&&(v=t.unstable_transitionCallbacks)),t=Oh(e,1,!1,null,null,a,l,i,r,d,v,null),e[dl]=t.current,Kc(e),new fs(t)},ri.hydrateRoot=function(e,t,a){if(!f(e))throw Error(c(299));var l=!1,i="",r=id,d=rd,v=ud,E=null,D=null;return a!=null&&(a.unstable_strictMode===!0&&(l=!0),a.identifierPrefix!==void 0&&(i=a.identifierPrefix),a.onUncaughtError!==void 0&&(r=a.onUncaughtError),a.onCaughtError!==void 0&&(d=a.onCaughtError),a.onRecoverableError!==void 0&&(v=a.onRecoverableError),a.unstable_transitionCallbacks!==void 0&&(E=a.unstable_transitionCallbacks),a.formState!==void 0&&(D=a.formState)),t=Oh(e,1,!0,t,a??null,l,i,r,d,v,E,D),t.context=zh(null),a=t.current,l=pt(),l=au(l),i=ya(l),i.callback=null,ba(a,i,l),a=l,t.current.lanes=a,on(t,a),Gt(t),e[dl]=t.current,Kc(e),new Cr(t)},ri.version="19.1.0",ri}var Ih;function yy(){if(Ih)return ms.exports;Ih=1;function n(){if(!(typeof __REACT_DEVTOOLS_GLOBAL_HOOK__>"u"||typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE!="function"))try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(n)}catch(u){console.error(u)}}return n(),ms.exports=gy(),ms.exports}var by=yy(),ui={},em;function xy(){if(em)return ui;em=1,Object.defineProperty(ui,"__esModule",{value:!0}),ui.parse=g,ui.serialize=m;const n=/^[\u0021-\u003A\u003C\u003E-\u007E]+$/,u=/^[\u0021-\u003A\u003C-\u007E]*$/,s=/^([.]?[a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)([.][a-z0-9]([a-z0-9-]{0,61}[a-z0-9])?)*$/i,c=/^[\u0020-\u003A\u003D-\u007E]*$/,f=Object.prototype.toString,h=(()=>{const S=function(){};return S.prototype=Object.create(null),S})();function g(S,N){const C=new h,T=S.length;if(T<2)return C;const B=(N==null?void 0:N.decode)||x;let z=0;do{const H=S.indexOf("=",z);if(H===-1)break;const V=S.indexOf(";",z),$=V===-1?T:V;if(H>$){z=S.lastIndexOf(";",H-1)+1;continue}const Z=p(S,z,H),ce=y(S,H,Z),te=S.slice(Z,ce);if(C[te]===void 0){let J=p(S,H+1,$),Q=y(S,$,J);const de=B(S.slice(J,Q));C[te]=de}z=$+1}while(z<T);return C}function p(S,N,C){do{const T=S.charCodeAt(N);if(T!==32&&T!==9)return N}while(++N<C);return C}function y(S,N,C){for(;N>C;){const T=S.charCodeAt(--N);if(T!==32&&T!==9)return N+1}return C}function m(S,N,C){const T=(C==null?void 0:C.encode)||encodeURIComponent;if(!n.test(S))throw new TypeError(`argument name is invalid: ${S}`);const B=T(N);if(!u.test(B))throw new TypeError(`argument val is invalid: ${N}`);let z=S+"="+B;if(!C)return z;if(C.maxAge!==void 0){if(!Number.isInteger(C.maxAge))throw new TypeError(`option maxAge is invalid: ${C.maxAge}`);z+="; Max-Age="+C.maxAge}if(C.domain){if(!s.test(C.domain))throw new TypeError(`option domain is invalid: ${C.domain}`);z+="; Domain="+C.domain}if(C.path){if(!c.test(C.path))throw new TypeError(`option path is invalid: ${C.path}`);z+="; Path="+C.path}if(C.expires){if(!A(C.expires)||!Number.isFinite(C.expires.valueOf()))throw new TypeError(`option expires is invalid: ${C.expires}`);z+="; Expires="+C.expires.toUTCString()}if(C.httpOnly&&(z+="; HttpOnly"),C.secure&&(z+="; Secure"),C.partitioned&&(z+="; Partitioned"),C.priority)switch(typeof C.priority=="string"?C.priority.toLowerCase():void 0){case"low":z+="; Priority=Low";break;case"medium":z+="; Priority=Medium";break;case"high":z+="; Priority=High";break;default:throw new TypeError(`option priority is invalid: ${C.priority}`)}if(C.sameSite)switch(typeof C.sameSite=="string"?C.sameSite.toLowerCase():C.sameSite){case!0:case"strict":z+="; SameSite=Strict";break;case"lax":z+="; SameSite=Lax";break;case"none":z+="; SameSite=None";break;default:throw new TypeError(`option sameSite is invalid: ${C.sameSite}`)}return z}function x(S){if(S.indexOf("%")===-1)return S;try{return decodeURIComponent(S)}catch{return S}}function A(S){return f.call(S)==="[object Date]"}return ui}xy();var tm="popstate";function Sy(n={}){function u(c,f){let{pathname:h,search:g,hash:p}=c.location;return Cs("",{pathname:h,search:g,hash:p},f.state&&f.state.usr||null,f.state&&f.state.key||"default")}function s(c,f){return typeof f=="string"?f:di(f)}return _y(u,s,null,n)}function De(n,u){if(n===!1||n===null||typeof n>"u")throw new Error(u)}function Mt(n,u){if(!n){typeof console<"u"&&console.warn(u);try{throw new Error(u)}catch{}}}function Ey(){return Math.random().toString(36).substring(2,10)}function am(n,u){return{usr:n.state,key:n.key,idx:u}}function Cs(n,u,s=null,c){return{pathname:typeof n=="string"?n:n.pathname,search:"",hash:"",...typeof u=="string"?an(u):u,state:s,key:u&&u.key||c||Ey()}}function di({pathname:n="/",search:u="",hash:s=""}){return u&&u!=="?"&&(n+=u.charAt(0)==="?"?u:"?"+u),s&&s!=="#"&&(n+=s.charAt(0)==="#"?s:"#"+s),n}function an(n){let u={};if(n){let s=n.indexOf("#");s>=0&&(u.hash=n.substring(s),n=n.substring(0,s));let c=n.indexOf("?");c>=0&&(u.search=n.substring(c),n=n.substring(0,c)),n&&(u.pathname=n)}return u}function _y(n,u,s,c={}){let{window:f=document.defaultView,v5Compat:h=!1}=c,g=f.history,p="POP",y=null,m=x();m==null&&(m=0,g.replaceState({...g.state,idx:m},""));function x(){return(g.state||{idx:null}).idx}function A(){p="POP";let B=x(),z=B==null?null:B-m;m=B,y&&y({action:p,location:T.location,delta:z})}function S(B,z){p="PUSH";let H=Cs(T.location,B,z);m=x()+1;let V=am(H,m),$=T.createHref(H);try{g.pushState(V,"",$)}catch(Z){if(Z instanceof DOMException&&Z.name==="DataCloneError")throw Z;f.location.assign($)}h&&y&&y({action:p,location:T.location,delta:1})}function N(B,z){p="REPLACE";let H=Cs(T.location,B,z);m=x();let V=am(H,m),$=T.createHref(H);g.replaceState(V,"",$),h&&y&&y({action:p,location:T.location,delta:0})}function C(B){return jy(B)}let T={get action(){return p},get location(){return n(f,g)},listen(B){if(y)throw new Error("A history only accepts one active listener");return f.addEventListener(tm,A),y=B,()=>{f.removeEventListener(tm,A),y=null}},createHref(B){return u(f,B)},createURL:C,encodeLocation(B){let z=C(B);return{pathname:z.pathname,search:z.search,hash:z.hash}},push:S,replace:N,go(B){return g.go(B)}};return T}function jy(n,u=!1){let s="http://localhost";typeof window<"u"&&(s=window.location.origin!=="null"?window.location.origin:window.location.href),De(s,"No window.location.(origin|href) available to create URL");let c=typeof n=="string"?n:di(n);return c=c.replace(/ $/,"%20"),!u&&c.startsWith("//")&&(c=s+c),new URL(c,s)}function Om(n,u,s="/"){return Ny(n,u,s,!1)}function Ny(n,u,s,c){let f=typeof u=="string"?an(u):u,h=ua(f.pathname||"/",s);if(h==null)return null;let g=zm(n);wy(g);let p=null;for(let y=0;p==null&&y<g.length;++y){let m=Ly(h);p=Uy(g[y],m,c)}return p}function zm(n,u=[],s=[],c=""){let f=(h,g,p)=>{let y={relativePath:p===void 0?h.path||"":p,caseSensitive:h.caseSensitive===!0,childrenIndex:g,route:h};y.relativePath.startsWith("/")&&(De(y.relativePath.startsWith(c),`Absolute route path "${y.relativePath}" nested under path "${c}" is not valid. An absolute child route path must start with the combined path of all its parent routes.`),y.relativePath=y.relativePath.slice(c.length));let m=ra([c,y.relativePath]),x=s.concat(y);h.children&&h.children.length>0&&(De(h.index!==!0,`Index routes must not have child routes. Please remove all child routes from route path "${m}".`),zm(h.children,u,x,m)),!(h.path==null&&!h.index)&&u.push({path:m,score:Oy(m,h.index),routesMeta:x})};return n.forEach((h,g)=>{var p;if(h.path===""||!((p=h.path)!=null&&p.includes("?")))f(h,g);else for(let y of Um(h.path))f(h,g,y)}),u}function Um(n){let u=n.split("/");if(u.length===0)return[];let[s,...c]=u,f=s.endsWith("?"),h=s.replace(/\?$/,"");if(c.length===0)return f?[h,""]:[h];let g=Um(c.join("/")),p=[];return p.push(...g.map(y=>y===""?h:[h,y].join("/"))),f&&p.push(...g),p.map(y=>n.startsWith("/")&&y===""?"/":y)}function wy(n){n.sort((u,s)=>u.score!==s.score?s.score-u.score:zy(u.routesMeta.map(c=>c.childrenIndex),s.routesMeta.map(c=>c.childrenIndex)))}var Ay=/^:[\w-]+$/,Ty=3,Ry=2,Cy=1,Dy=10,My=-2,lm=n=>n==="*";function Oy(n,u){let s=n.split("/"),c=s.length;return s.some(lm)&&(c+=My),u&&(c+=Ry),s.filter(f=>!lm(f)).reduce((f,h)=>f+(Ay.test(h)?Ty:h===""?Cy:Dy),c)}function zy(n,u){return n.length===u.length&&n.slice(0,-1).every((c,f)=>c===u[f])?n[n.length-1]-u[u.length-1]:0}function Uy(n,u,s=!1){let{routesMeta:c}=n,f={},h="/",g=[];for(let p=0;p<c.length;++p){let y=c[p],m=p===c.length-1,x=h==="/"?u:u.slice(h.length)||"/",A=Qr({path:y.relativePath,caseSensitive:y.caseSensitive,end:m},x),S=y.route;if(!A&&m&&s&&!c[c.length-1].route.index&&(A=Qr({path:y.relativePath,caseSensitive:y.caseSensitive,end:!1},x)),!A)return null;Object.assign(f,A.params),g.push({params:f,pathname:ra([h,A.pathname]),pathnameBase:Gy(ra([h,A.pathnameBase])),route:S}),A.pathnameBase!=="/"&&(h=ra([h,A.pathnameBase]))}return g}function Qr(n,u){typeof n=="string"&&(n={path:n,caseSensitive:!1,end:!0});let[s,c]=By(n.path,n.caseSensitive,n.end),f=u.match(s);if(!f)return null;let h=f[0],g=h.replace(/(.)\/+$/,"$1"),p=f.slice(1);return{params:c.reduce((m,{paramName:x,isOptional:A},S)=>{if(x==="*"){let C=p[S]||"";g=h.slice(0,h.length-C.length).replace(/(.)\/+$/,"$1")}const N=p[S];return A&&!N?m[x]=void 0:m[x]=(N||"").replace(/%2F/g,"/"),m},{}),pathname:h,pathnameBase:g,pattern:n}}function By(n,u=!1,s=!0){Mt(n==="*"||!n.endsWith("*")||n.endsWith("/*"),`Route path "${n}" will be treated as if it were "${n.replace(/\*$/,"/*")}" because the \`*\` character must always follow a \`/\` in the pattern. To get rid of this warning, please change the route path to "${n.replace(/\*$/,"/*")}".`);let c=[],f="^"+n.replace(/\/*\*?$/,"").replace(/^\/*/,"/").replace(/[\\.*+^${}|()[\]]/g,"\\$&").replace(/\/:([\w-]+)(\?)?/g,(g,p,y)=>(c.push({paramName:p,isOptional:y!=null}),y?"/?([^\\/]+)?":"/([^\\/]+)"));return n.endsWith("*")?(c.push({paramName:"*"}),f+=n==="*"||n==="/*"?"(.*)$":"(?:\\/(.+)|\\/*)$"):s?f+="\\/*$":n!==""&&n!=="/"&&(f+="(?:(?=\\/|$))"),[new RegExp(f,u?void 0:"i"),c]}function Ly(n){try{return n.split("/").map(u=>decodeURIComponent(u).replace(/\//g,"%2F")).join("/")}catch(u){return Mt(!1,`The URL path "${n}" could not be decoded because it is a malformed URL segment. This is probably due to a bad percent encoding (${u}).`),n}}function ua(n,u){if(u==="/")return n;if(!n.toLowerCase().startsWith(u.toLowerCase()))return null;let s=u.endsWith("/")?u.length-1:u.length,c=n.charAt(s);return c&&c!=="/"?null:n.slice(s)||"/"}function ky(n,u="/"){let{pathname:s,search:c="",hash:f=""}=typeof n=="string"?an(n):n;return{pathname:s?s.startsWith("/")?s:Hy(s,u):u,search:Yy(c),hash:Vy(f)}}function Hy(n,u){let s=u.replace(/\/+$/,"").split("/");return n.split("/").forEach(f=>{f===".."?s.length>1&&s.pop():f!=="."&&s.push(f)}),s.length>1?s.join("/"):"/"}function ys(n,u,s,c){return`Cannot include a '${n}' character in a manually specified \`to.${u}\` field [${JSON.stringify(c)}].  Please separate it out to the \`to.${s}\` field. Alternatively you may provide the full path as a string in <Link to="..."> and the router will parse it for you.`}function qy(n){return n.filter((u,s)=>s===0||u.route.path&&u.route.path.length>0)}function ks(n){let u=qy(n);return u.map((s,c)=>c===u.length-1?s.pathname:s.pathnameBase)}function Hs(n,u,s,c=!1){let f;typeof n=="string"?f=an(n):(f={...n},De(!f.pathname||!f.pathname.includes("?"),ys("?","pathname","search",f)),De(!f.pathname||!f.pathname.includes("#"),ys("#","pathname","hash",f)),De(!f.search||!f.search.includes("#"),ys("#","search","hash",f)));let h=n===""||f.pathname==="",g=h?"/":f.pathname,p;if(g==null)p=s;else{let A=u.length-1;if(!c&&g.startsWith("..")){let S=g.split("/");for(;S[0]==="..";)S.shift(),A-=1;f.pathname=S.join("/")}p=A>=0?u[A]:"/"}let y=ky(f,p),m=g&&g!=="/"&&g.endsWith("/"),x=(h||g===".")&&s.endsWith("/");return!y.pathname.endsWith("/")&&(m||x)&&(y.pathname+="/"),y}var ra=n=>n.join("/").replace(/\/\/+/g,"/"),Gy=n=>n.replace(/\/+$/,"").replace(/^\/*/,"/"),Yy=n=>!n||n==="?"?"":n.startsWith("?")?n:"?"+n,Vy=n=>!n||n==="#"?"":n.startsWith("#")?n:"#"+n;function Xy(n){return n!=null&&typeof n.status=="number"&&typeof n.statusText=="string"&&typeof n.internal=="boolean"&&"data"in n}var Bm=["POST","PUT","PATCH","DELETE"];new Set(Bm);var Qy=["GET",...Bm];new Set(Qy);var ln=b.createContext(null);ln.displayName="DataRouter";var Jr=b.createContext(null);Jr.displayName="DataRouterState";var Lm=b.createContext({isTransitioning:!1});Lm.displayName="ViewTransition";var Zy=b.createContext(new Map);Zy.displayName="Fetchers";var Ky=b.createContext(null);Ky.displayName="Await";var Ot=b.createContext(null);Ot.displayName="Navigation";var vi=b.createContext(null);vi.displayName="Location";var Vt=b.createContext({outlet:null,matches:[],isDataRoute:!1});Vt.displayName="Route";var qs=b.createContext(null);qs.displayName="RouteError";function Jy(n,{relative:u}={}){De(nn(),"useHref() may be used only in the context of a <Router> component.");let{basename:s,navigator:c}=b.useContext(Ot),{hash:f,pathname:h,search:g}=pi(n,{relative:u}),p=h;return s!=="/"&&(p=h==="/"?s:ra([s,h])),c.createHref({pathname:p,search:g,hash:f})}function nn(){return b.useContext(vi)!=null}function ca(){return De(nn(),"useLocation() may be used only in the context of a <Router> component."),b.useContext(vi).location}var km="You should call navigate() in a React.useEffect(), not when your component is first rendered.";function Hm(n){b.useContext(Ot).static||b.useLayoutEffect(n)}function qm(){let{isDataRoute:n}=b.useContext(Vt);return n?ub():$y()}function $y(){De(nn(),"useNavigate() may be used only in the context of a <Router> component.");let n=b.useContext(ln),{basename:u,navigator:s}=b.useContext(Ot),{matches:c}=b.useContext(Vt),{pathname:f}=ca(),h=JSON.stringify(ks(c)),g=b.useRef(!1);return Hm(()=>{g.current=!0}),b.useCallback((y,m={})=>{if(Mt(g.current,km),!g.current)return;if(typeof y=="number"){s.go(y);return}let x=Hs(y,JSON.parse(h),f,m.relative==="path");n==null&&u!=="/"&&(x.pathname=x.pathname==="/"?u:ra([u,x.pathname])),(m.replace?s.replace:s.push)(x,m.state,m)},[u,s,h,f,n])}b.createContext(null);function pi(n,{relative:u}={}){let{matches:s}=b.useContext(Vt),{pathname:c}=ca(),f=JSON.stringify(ks(s));return b.useMemo(()=>Hs(n,JSON.parse(f),c,u==="path"),[n,f,c,u])}function Fy(n,u){return Gm(n,u)}function Gm(n,u,s,c){var z;De(nn(),"useRoutes() may be used only in the context of a <Router> component.");let{navigator:f}=b.useContext(Ot),{matches:h}=b.useContext(Vt),g=h[h.length-1],p=g?g.params:{},y=g?g.pathname:"/",m=g?g.pathnameBase:"/",x=g&&g.route;{let H=x&&x.path||"";Ym(y,!x||H.endsWith("*")||H.endsWith("*?"),`You rendered descendant <Routes> (or called \`useRoutes()\`) at "${y}" (under <Route path="${H}">) but the parent route path has no trailing "*". This means if you navigate deeper, the parent won't match anymore and therefore the child routes will never render.
-
-Please change the parent <Route path="${H}"> to <Route path="${H==="/"?"*":`${H}/*`}">.`)}let A=ca(),S;if(u){let H=typeof u=="string"?an(u):u;De(m==="/"||((z=H.pathname)==null?void 0:z.startsWith(m)),`When overriding the location using \`<Routes location>\` or \`useRoutes(routes, location)\`, the location pathname must begin with the portion of the URL pathname that was matched by all parent routes. The current pathname base is "${m}" but pathname "${H.pathname}" was given in the \`location\` prop.`),S=H}else S=A;let N=S.pathname||"/",C=N;if(m!=="/"){let H=m.replace(/^\//,"").split("/");C="/"+N.replace(/^\//,"").split("/").slice(H.length).join("/")}let T=Om(n,{pathname:C});Mt(x||T!=null,`No routes matched location "${S.pathname}${S.search}${S.hash}" `),Mt(T==null||T[T.length-1].route.element!==void 0||T[T.length-1].route.Component!==void 0||T[T.length-1].route.lazy!==void 0,`Matched leaf route at location "${S.pathname}${S.search}${S.hash}" does not have an element or Component. This means it will render an <Outlet /> with a null value by default resulting in an "empty" page.`);let B=tb(T&&T.map(H=>Object.assign({},H,{params:Object.assign({},p,H.params),pathname:ra([m,f.encodeLocation?f.encodeLocation(H.pathname).pathname:H.pathname]),pathnameBase:H.pathnameBase==="/"?m:ra([m,f.encodeLocation?f.encodeLocation(H.pathnameBase).pathname:H.pathnameBase])})),h,s,c);return u&&B?b.createElement(vi.Provider,{value:{location:{pathname:"/",search:"",hash:"",state:null,key:"default",...S},navigationType:"POP"}},B):B}function Wy(){let n=rb(),u=Xy(n)?`${n.status} ${n.statusText}`:n instanceof Error?n.message:JSON.stringify(n),s=n instanceof Error?n.stack:null,c="rgba(200,200,200, 0.5)",f={padding:"0.5rem",backgroundColor:c},h={padding:"2px 4px",backgroundColor:c},g=null;return console.error("Error handled by React Router default ErrorBoundary:",n),g=b.createElement(b.Fragment,null,b.createElement("p",null,"💿 Hey developer 👋"),b.createElement("p",null,"You can provide a way better UX than this when your app throws errors by providing your own ",b.createElement("code",{style:h},"ErrorBoundary")," or"," ",b.createElement("code",{style:h},"errorElement")," prop on your route.")),b.createElement(b.Fragment,null,b.createElement("h2",null,"Unexpected Application Error!"),b.createElement("h3",{style:{fontStyle:"italic"}},u),s?b.createElement("pre",{style:f},s):null,g)}var Py=b.createElement(Wy,null),Iy=class extends b.Component{constructor(n){super(n),this.state={location:n.location,revalidation:n.revalidation,error:n.error}}static getDerivedStateFromError(n){return{error:n}}static getDerivedStateFromProps(n,u){return u.location!==n.location||u.revalidation!=="idle"&&n.revalidation==="idle"?{error:n.error,location:n.location,revalidation:n.revalidation}:{error:n.error!==void 0?n.error:u.error,location:u.location,revalidation:n.revalidation||u.revalidation}}componentDidCatch(n,u){console.error("React Router caught the following error during render",n,u)}render(){return this.state.error!==void 0?b.createElement(Vt.Provider,{value:this.props.routeContext},b.createElement(qs.Provider,{value:this.state.error,children:this.props.component})):this.props.children}};function eb({routeContext:n,match:u,children:s}){let c=b.useContext(ln);return c&&c.static&&c.staticContext&&(u.route.errorElement||u.route.ErrorBoundary)&&(c.staticContext._deepestRenderedBoundaryId=u.route.id),b.createElement(Vt.Provider,{value:n},s)}function tb(n,u=[],s=null,c=null){if(n==null){if(!s)return null;if(s.errors)n=s.matches;else if(u.length===0&&!s.initialized&&s.matches.length>0)n=s.matches;else return null}let f=n,h=s==null?void 0:s.errors;if(h!=null){let y=f.findIndex(m=>m.route.id&&(h==null?void 0:h[m.route.id])!==void 0);De(y>=0,`Could not find a matching route for errors on route IDs: ${Object.keys(h).join(",")}`),f=f.slice(0,Math.min(f.length,y+1))}let g=!1,p=-1;if(s)for(let y=0;y<f.length;y++){let m=f[y];if((m.route.HydrateFallback||m.route.hydrateFallbackElement)&&(p=y),m.route.id){let{loaderData:x,errors:A}=s,S=m.route.loader&&!x.hasOwnProperty(m.route.id)&&(!A||A[m.route.id]===void 0);if(m.route.lazy||S){g=!0,p>=0?f=f.slice(0,p+1):f=[f[0]];break}}}return f.reduceRight((y,m,x)=>{let A,S=!1,N=null,C=null;s&&(A=h&&m.route.id?h[m.route.id]:void 0,N=m.route.errorElement||Py,g&&(p<0&&x===0?(Ym("route-fallback",!1,"No `HydrateFallback` element provided to render during initial hydration"),S=!0,C=null):p===x&&(S=!0,C=m.route.hydrateFallbackElement||null)));let T=u.concat(f.slice(0,x+1)),B=()=>{let z;return A?z=N:S?z=C:m.route.Component?z=b.createElement(m.route.Component,null):m.route.element?z=m.route.element:z=y,b.createElement(eb,{match:m,routeContext:{outlet:y,matches:T,isDataRoute:s!=null},children:z})};return s&&(m.route.ErrorBoundary||m.route.errorElement||x===0)?b.createElement(Iy,{location:s.location,revalidation:s.revalidation,component:N,error:A,children:B(),routeContext:{outlet:null,matches:T,isDataRoute:!0}}):B()},null)}function Gs(n){return`${n} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function ab(n){let u=b.useContext(ln);return De(u,Gs(n)),u}function lb(n){let u=b.useContext(Jr);return De(u,Gs(n)),u}function nb(n){let u=b.useContext(Vt);return De(u,Gs(n)),u}function Ys(n){let u=nb(n),s=u.matches[u.matches.length-1];return De(s.route.id,`${n} can only be used on routes that contain a unique "id"`),s.route.id}function ib(){return Ys("useRouteId")}function rb(){var c;let n=b.useContext(qs),u=lb("useRouteError"),s=Ys("useRouteError");return n!==void 0?n:(c=u.errors)==null?void 0:c[s]}function ub(){let{router:n}=ab("useNavigate"),u=Ys("useNavigate"),s=b.useRef(!1);return Hm(()=>{s.current=!0}),b.useCallback(async(f,h={})=>{Mt(s.current,km),s.current&&(typeof f=="number"?n.navigate(f):await n.navigate(f,{fromRouteId:u,...h}))},[n,u])}var nm={};function Ym(n,u,s){!u&&!nm[n]&&(nm[n]=!0,Mt(!1,s))}b.memo(cb);function cb({routes:n,future:u,state:s}){return Gm(n,void 0,s,u)}function sb({to:n,replace:u,state:s,relative:c}){De(nn(),"<Navigate> may be used only in the context of a <Router> component.");let{static:f}=b.useContext(Ot);Mt(!f,"<Navigate> must not be used on the initial render in a <StaticRouter>. This is a no-op, but you should modify your code so the <Navigate> is only ever rendered in response to some user interaction or state change.");let{matches:h}=b.useContext(Vt),{pathname:g}=ca(),p=qm(),y=Hs(n,ks(h),g,c==="path"),m=JSON.stringify(y);return b.useEffect(()=>{p(JSON.parse(m),{replace:u,state:s,relative:c})},[p,m,c,u,s]),null}function ka(n){De(!1,"A <Route> is only ever to be used as the child of <Routes> element, never rendered directly. Please wrap your <Route> in a <Routes>.")}function ob({basename:n="/",children:u=null,location:s,navigationType:c="POP",navigator:f,static:h=!1}){De(!nn(),"You cannot render a <Router> inside another <Router>. You should never have more than one in your app.");let g=n.replace(/^\/*/,"/"),p=b.useMemo(()=>({basename:g,navigator:f,static:h,future:{}}),[g,f,h]);typeof s=="string"&&(s=an(s));let{pathname:y="/",search:m="",hash:x="",state:A=null,key:S="default"}=s,N=b.useMemo(()=>{let C=ua(y,g);return C==null?null:{location:{pathname:C,search:m,hash:x,state:A,key:S},navigationType:c}},[g,y,m,x,A,S,c]);return Mt(N!=null,`<Router basename="${g}"> is not able to match the URL "${y}${m}${x}" because it does not start with the basename, so the <Router> won't render anything.`),N==null?null:b.createElement(Ot.Provider,{value:p},b.createElement(vi.Provider,{children:u,value:N}))}function fb({children:n,location:u}){return Fy(Ds(n),u)}function Ds(n,u=[]){let s=[];return b.Children.forEach(n,(c,f)=>{if(!b.isValidElement(c))return;let h=[...u,f];if(c.type===b.Fragment){s.push.apply(s,Ds(c.props.children,h));return}De(c.type===ka,`[${typeof c.type=="string"?c.type:c.type.name}] is not a <Route> component. All component children of <Routes> must be a <Route> or <React.Fragment>`),De(!c.props.index||!c.props.children,"An index route cannot have child routes.");let g={id:c.props.id||h.join("-"),caseSensitive:c.props.caseSensitive,element:c.props.element,Component:c.props.Component,index:c.props.index,path:c.props.path,loader:c.props.loader,action:c.props.action,hydrateFallbackElement:c.props.hydrateFallbackElement,HydrateFallback:c.props.HydrateFallback,errorElement:c.props.errorElement,ErrorBoundary:c.props.ErrorBoundary,hasErrorBoundary:c.props.hasErrorBoundary===!0||c.props.ErrorBoundary!=null||c.props.errorElement!=null,shouldRevalidate:c.props.shouldRevalidate,handle:c.props.handle,lazy:c.props.lazy};c.props.children&&(g.children=Ds(c.props.children,h)),s.push(g)}),s}var Gr="get",Yr="application/x-www-form-urlencoded";function $r(n){return n!=null&&typeof n.tagName=="string"}function db(n){return $r(n)&&n.tagName.toLowerCase()==="button"}function hb(n){return $r(n)&&n.tagName.toLowerCase()==="form"}function mb(n){return $r(n)&&n.tagName.toLowerCase()==="input"}function vb(n){return!!(n.metaKey||n.altKey||n.ctrlKey||n.shiftKey)}function pb(n,u){return n.button===0&&(!u||u==="_self")&&!vb(n)}var Mr=null;function gb(){if(Mr===null)try{new FormData(document.createElement("form"),0),Mr=!1}catch{Mr=!0}return Mr}var yb=new Set(["application/x-www-form-urlencoded","multipart/form-data","text/plain"]);function bs(n){return n!=null&&!yb.has(n)?(Mt(!1,`"${n}" is not a valid \`encType\` for \`<Form>\`/\`<fetcher.Form>\` and will default to "${Yr}"`),null):n}function bb(n,u){let s,c,f,h,g;if(hb(n)){let p=n.getAttribute("action");c=p?ua(p,u):null,s=n.getAttribute("method")||Gr,f=bs(n.getAttribute("enctype"))||Yr,h=new FormData(n)}else if(db(n)||mb(n)&&(n.type==="submit"||n.type==="image")){let p=n.form;if(p==null)throw new Error('Cannot submit a <button> or <input type="submit"> without a <form>');let y=n.getAttribute("formaction")||p.getAttribute("action");if(c=y?ua(y,u):null,s=n.getAttribute("formmethod")||p.getAttribute("method")||Gr,f=bs(n.getAttribute("formenctype"))||bs(p.getAttribute("enctype"))||Yr,h=new FormData(p,n),!gb()){let{name:m,type:x,value:A}=n;if(x==="image"){let S=m?`${m}.`:"";h.append(`${S}x`,"0"),h.append(`${S}y`,"0")}else m&&h.append(m,A)}}else{if($r(n))throw new Error('Cannot submit element that is not <form>, <button>, or <input type="submit|image">');s=Gr,c=null,f=Yr,g=n}return h&&f==="text/plain"&&(g=h,h=void 0),{action:c,method:s.toLowerCase(),encType:f,formData:h,body:g}}function Vs(n,u){if(n===!1||n===null||typeof n>"u")throw new Error(u)}async function xb(n,u){if(n.id in u)return u[n.id];try{let s=await import(n.module);return u[n.id]=s,s}catch(s){return console.error(`Error loading route module \`${n.module}\`, reloading page...`),console.error(s),window.__reactRouterContext&&window.__reactRouterContext.isSpaMode,window.location.reload(),new Promise(()=>{})}}function Sb(n){return n==null?!1:n.href==null?n.rel==="preload"&&typeof n.imageSrcSet=="string"&&typeof n.imageSizes=="string":typeof n.rel=="string"&&typeof n.href=="string"}async function Eb(n,u,s){let c=await Promise.all(n.map(async f=>{let h=u.routes[f.route.id];if(h){let g=await xb(h,s);return g.links?g.links():[]}return[]}));return wb(c.flat(1).filter(Sb).filter(f=>f.rel==="stylesheet"||f.rel==="preload").map(f=>f.rel==="stylesheet"?{...f,rel:"prefetch",as:"style"}:{...f,rel:"prefetch"}))}function im(n,u,s,c,f,h){let g=(y,m)=>s[m]?y.route.id!==s[m].route.id:!0,p=(y,m)=>{var x;return s[m].pathname!==y.pathname||((x=s[m].route.path)==null?void 0:x.endsWith("*"))&&s[m].params["*"]!==y.params["*"]};return h==="assets"?u.filter((y,m)=>g(y,m)||p(y,m)):h==="data"?u.filter((y,m)=>{var A;let x=c.routes[y.route.id];if(!x||!x.hasLoader)return!1;if(g(y,m)||p(y,m))return!0;if(y.route.shouldRevalidate){let S=y.route.shouldRevalidate({currentUrl:new URL(f.pathname+f.search+f.hash,window.origin),currentParams:((A=s[0])==null?void 0:A.params)||{},nextUrl:new URL(n,window.origin),nextParams:y.params,defaultShouldRevalidate:!0});if(typeof S=="boolean")return S}return!0}):[]}function _b(n,u,{includeHydrateFallback:s}={}){return jb(n.map(c=>{let f=u.routes[c.route.id];if(!f)return[];let h=[f.module];return f.clientActionModule&&(h=h.concat(f.clientActionModule)),f.clientLoaderModule&&(h=h.concat(f.clientLoaderModule)),s&&f.hydrateFallbackModule&&(h=h.concat(f.hydrateFallbackModule)),f.imports&&(h=h.concat(f.imports)),h}).flat(1))}function jb(n){return[...new Set(n)]}function Nb(n){let u={},s=Object.keys(n).sort();for(let c of s)u[c]=n[c];return u}function wb(n,u){let s=new Set;return new Set(u),n.reduce((c,f)=>{let h=JSON.stringify(Nb(f));return s.has(h)||(s.add(h),c.push({key:h,link:f})),c},[])}Object.getOwnPropertyNames(Object.prototype).sort().join("\0");var Ab=new Set([100,101,204,205]);function Tb(n,u){let s=typeof n=="string"?new URL(n,typeof window>"u"?"server://singlefetch/":window.location.origin):n;return s.pathname==="/"?s.pathname="_root.data":u&&ua(s.pathname,u)==="/"?s.pathname=`${u.replace(/\/$/,"")}/_root.data`:s.pathname=`${s.pathname.replace(/\/$/,"")}.data`,s}function Vm(){let n=b.useContext(ln);return Vs(n,"You must render this element inside a <DataRouterContext.Provider> element"),n}function Rb(){let n=b.useContext(Jr);return Vs(n,"You must render this element inside a <DataRouterStateContext.Provider> element"),n}var Xs=b.createContext(void 0);Xs.displayName="FrameworkContext";function Xm(){let n=b.useContext(Xs);return Vs(n,"You must render this element inside a <HydratedRouter> element"),n}function Cb(n,u){let s=b.useContext(Xs),[c,f]=b.useState(!1),[h,g]=b.useState(!1),{onFocus:p,onBlur:y,onMouseEnter:m,onMouseLeave:x,onTouchStart:A}=u,S=b.useRef(null);b.useEffect(()=>{if(n==="render"&&g(!0),n==="viewport"){let T=z=>{z.forEach(H=>{g(H.isIntersecting)})},B=new IntersectionObserver(T,{threshold:.5});return S.current&&B.observe(S.current),()=>{B.disconnect()}}},[n]),b.useEffect(()=>{if(c){let T=setTimeout(()=>{g(!0)},100);return()=>{clearTimeout(T)}}},[c]);let N=()=>{f(!0)},C=()=>{f(!1),g(!1)};return s?n!=="intent"?[h,S,{}]:[h,S,{onFocus:ci(p,N),onBlur:ci(y,C),onMouseEnter:ci(m,N),onMouseLeave:ci(x,C),onTouchStart:ci(A,N)}]:[!1,S,{}]}function ci(n,u){return s=>{n&&n(s),s.defaultPrevented||u(s)}}function Db({page:n,...u}){let{router:s}=Vm(),c=b.useMemo(()=>Om(s.routes,n,s.basename),[s.routes,n,s.basename]);return c?b.createElement(Ob,{page:n,matches:c,...u}):null}function Mb(n){let{manifest:u,routeModules:s}=Xm(),[c,f]=b.useState([]);return b.useEffect(()=>{let h=!1;return Eb(n,u,s).then(g=>{h||f(g)}),()=>{h=!0}},[n,u,s]),c}function Ob({page:n,matches:u,...s}){let c=ca(),{manifest:f,routeModules:h}=Xm(),{basename:g}=Vm(),{loaderData:p,matches:y}=Rb(),m=b.useMemo(()=>im(n,u,y,f,c,"data"),[n,u,y,f,c]),x=b.useMemo(()=>im(n,u,y,f,c,"assets"),[n,u,y,f,c]),A=b.useMemo(()=>{if(n===c.pathname+c.search+c.hash)return[];let C=new Set,T=!1;if(u.forEach(z=>{var V;let H=f.routes[z.route.id];!H||!H.hasLoader||(!m.some($=>$.route.id===z.route.id)&&z.route.id in p&&((V=h[z.route.id])!=null&&V.shouldRevalidate)||H.hasClientLoader?T=!0:C.add(z.route.id))}),C.size===0)return[];let B=Tb(n,g);return T&&C.size>0&&B.searchParams.set("_routes",u.filter(z=>C.has(z.route.id)).map(z=>z.route.id).join(",")),[B.pathname+B.search]},[g,p,c,f,m,u,n,h]),S=b.useMemo(()=>_b(x,f),[x,f]),N=Mb(x);return b.createElement(b.Fragment,null,A.map(C=>b.createElement("link",{key:C,rel:"prefetch",as:"fetch",href:C,...s})),S.map(C=>b.createElement("link",{key:C,rel:"modulepreload",href:C,...s})),N.map(({key:C,link:T})=>b.createElement("link",{key:C,...T})))}function zb(...n){return u=>{n.forEach(s=>{typeof s=="function"?s(u):s!=null&&(s.current=u)})}}var Qm=typeof window<"u"&&typeof window.document<"u"&&typeof window.document.createElement<"u";try{Qm&&(window.__reactRouterVersion="7.6.1")}catch{}function Ub({basename:n,children:u,window:s}){let c=b.useRef();c.current==null&&(c.current=Sy({window:s,v5Compat:!0}));let f=c.current,[h,g]=b.useState({action:f.action,location:f.location}),p=b.useCallback(y=>{b.startTransition(()=>g(y))},[g]);return b.useLayoutEffect(()=>f.listen(p),[f,p]),b.createElement(ob,{basename:n,children:u,location:h.location,navigationType:h.action,navigator:f})}var Zm=/^(?:[a-z][a-z0-9+.-]*:|\/\/)/i,Dt=b.forwardRef(function({onClick:u,discover:s="render",prefetch:c="none",relative:f,reloadDocument:h,replace:g,state:p,target:y,to:m,preventScrollReset:x,viewTransition:A,...S},N){let{basename:C}=b.useContext(Ot),T=typeof m=="string"&&Zm.test(m),B,z=!1;if(typeof m=="string"&&T&&(B=m,Qm))try{let Q=new URL(window.location.href),de=m.startsWith("//")?new URL(Q.protocol+m):new URL(m),ze=ua(de.pathname,C);de.origin===Q.origin&&ze!=null?m=ze+de.search+de.hash:z=!0}catch{Mt(!1,`<Link to="${m}"> contains an invalid URL which will probably break when clicked - please update to a valid URL path.`)}let H=Jy(m,{relative:f}),[V,$,Z]=Cb(c,S),ce=Hb(m,{replace:g,state:p,target:y,preventScrollReset:x,relative:f,viewTransition:A});function te(Q){u&&u(Q),Q.defaultPrevented||ce(Q)}let J=b.createElement("a",{...S,...Z,href:B||H,onClick:z||h?u:te,ref:zb(N,$),target:y,"data-discover":!T&&s==="render"?"true":void 0});return V&&!T?b.createElement(b.Fragment,null,J,b.createElement(Db,{page:H})):J});Dt.displayName="Link";var Bb=b.forwardRef(function({"aria-current":u="page",caseSensitive:s=!1,className:c="",end:f=!1,style:h,to:g,viewTransition:p,children:y,...m},x){let A=pi(g,{relative:m.relative}),S=ca(),N=b.useContext(Jr),{navigator:C,basename:T}=b.useContext(Ot),B=N!=null&&Xb(A)&&p===!0,z=C.encodeLocation?C.encodeLocation(A).pathname:A.pathname,H=S.pathname,V=N&&N.navigation&&N.navigation.location?N.navigation.location.pathname:null;s||(H=H.toLowerCase(),V=V?V.toLowerCase():null,z=z.toLowerCase()),V&&T&&(V=ua(V,T)||V);const $=z!=="/"&&z.endsWith("/")?z.length-1:z.length;let Z=H===z||!f&&H.startsWith(z)&&H.charAt($)==="/",ce=V!=null&&(V===z||!f&&V.startsWith(z)&&V.charAt(z.length)==="/"),te={isActive:Z,isPending:ce,isTransitioning:B},J=Z?u:void 0,Q;typeof c=="function"?Q=c(te):Q=[c,Z?"active":null,ce?"pending":null,B?"transitioning":null].filter(Boolean).join(" ");let de=typeof h=="function"?h(te):h;return b.createElement(Dt,{...m,"aria-current":J,className:Q,ref:x,style:de,to:g,viewTransition:p},typeof y=="function"?y(te):y)});Bb.displayName="NavLink";var Lb=b.forwardRef(({discover:n="render",fetcherKey:u,navigate:s,reloadDocument:c,replace:f,state:h,method:g=Gr,action:p,onSubmit:y,relative:m,preventScrollReset:x,viewTransition:A,...S},N)=>{let C=Yb(),T=Vb(p,{relative:m}),B=g.toLowerCase()==="get"?"get":"post",z=typeof p=="string"&&Zm.test(p),H=V=>{if(y&&y(V),V.defaultPrevented)return;V.preventDefault();let $=V.nativeEvent.submitter,Z=($==null?void 0:$.getAttribute("formmethod"))||g;C($||V.currentTarget,{fetcherKey:u,method:Z,navigate:s,replace:f,state:h,relative:m,preventScrollReset:x,viewTransition:A})};return b.createElement("form",{ref:N,method:B,action:T,onSubmit:c?y:H,...S,"data-discover":!z&&n==="render"?"true":void 0})});Lb.displayName="Form";function kb(n){return`${n} must be used within a data router.  See https://reactrouter.com/en/main/routers/picking-a-router.`}function Km(n){let u=b.useContext(ln);return De(u,kb(n)),u}function Hb(n,{target:u,replace:s,state:c,preventScrollReset:f,relative:h,viewTransition:g}={}){let p=qm(),y=ca(),m=pi(n,{relative:h});return b.useCallback(x=>{if(pb(x,u)){x.preventDefault();let A=s!==void 0?s:di(y)===di(m);p(n,{replace:A,state:c,preventScrollReset:f,relative:h,viewTransition:g})}},[y,p,m,s,c,u,n,f,h,g])}var qb=0,Gb=()=>`__${String(++qb)}__`;function Yb(){let{router:n}=Km("useSubmit"),{basename:u}=b.useContext(Ot),s=ib();return b.useCallback(async(c,f={})=>{let{action:h,method:g,encType:p,formData:y,body:m}=bb(c,u);if(f.navigate===!1){let x=f.fetcherKey||Gb();await n.fetch(x,s,f.action||h,{preventScrollReset:f.preventScrollReset,formData:y,body:m,formMethod:f.method||g,formEncType:f.encType||p,flushSync:f.flushSync})}else await n.navigate(f.action||h,{preventScrollReset:f.preventScrollReset,formData:y,body:m,formMethod:f.method||g,formEncType:f.encType||p,replace:f.replace,state:f.state,fromRouteId:s,flushSync:f.flushSync,viewTransition:f.viewTransition})},[n,u,s])}function Vb(n,{relative:u}={}){let{basename:s}=b.useContext(Ot),c=b.useContext(Vt);De(c,"useFormAction must be used inside a RouteContext");let[f]=c.matches.slice(-1),h={...pi(n||".",{relative:u})},g=ca();if(n==null){h.search=g.search;let p=new URLSearchParams(h.search),y=p.getAll("index");if(y.some(x=>x==="")){p.delete("index"),y.filter(A=>A).forEach(A=>p.append("index",A));let x=p.toString();h.search=x?`?${x}`:""}}return(!n||n===".")&&f.route.index&&(h.search=h.search?h.search.replace(/^\?/,"?index&"):"?index"),s!=="/"&&(h.pathname=h.pathname==="/"?s:ra([s,h.pathname])),di(h)}function Xb(n,u={}){let s=b.useContext(Lm);De(s!=null,"`useViewTransitionState` must be used within `react-router-dom`'s `RouterProvider`.  Did you accidentally import `RouterProvider` from `react-router`?");let{basename:c}=Km("useViewTransitionState"),f=pi(n,{relative:u.relative});if(!s.isTransitioning)return!1;let h=ua(s.currentLocation.pathname,c)||s.currentLocation.pathname,g=ua(s.nextLocation.pathname,c)||s.nextLocation.pathname;return Qr(f.pathname,g)!=null||Qr(f.pathname,h)!=null}[...Ab];var Jm=Mm();const Qb=Cm(Jm),$m="/api",Pe=async(n,u={})=>{const s=`${$m}${n}`,c={headers:{"Content-Type":"application/json",...u.headers},credentials:"include",...u};u.body&&typeof u.body=="object"&&(c.body=JSON.stringify(u.body));try{const f=await fetch(s,c);if(!f.ok){const g=await f.json().catch(()=>({}));throw new Error(g.error||`HTTP error! status: ${f.status}`)}const h=f.headers.get("content-type");return h&&h.includes("application/json")?await f.json():f}catch(f){throw console.error("API call failed:",f),f}},Zr={login:async(n,u)=>await Pe("/auth/login",{method:"POST",body:{username:n,password:u}}),logout:async()=>await Pe("/auth/logout",{method:"POST"}),register:async n=>await Pe("/auth/register",{method:"POST",body:n}),getCurrentUser:async()=>await Pe("/auth/me")},ol={getAll:async()=>await Pe("/customers"),getById:async n=>await Pe(`/customers/${n}`),create:async n=>await Pe("/customers",{method:"POST",body:n}),update:async(n,u)=>await Pe(`/customers/${n}`,{method:"PUT",body:u}),delete:async n=>await Pe(`/customers/${n}`,{method:"DELETE"}),uploadLogo:async(n,u)=>{const s=new FormData;return s.append("logo",u),await Pe(`/customers/${n}/logo`,{method:"POST",headers:{},body:s})}},fi={getAll:async()=>await Pe("/reports"),getById:async n=>await Pe(`/reports/${n}`),create:async n=>await Pe("/reports",{method:"POST",body:n}),update:async(n,u)=>await Pe(`/reports/${n}`,{method:"PUT",body:u}),delete:async n=>await Pe(`/reports/${n}`,{method:"DELETE"}),updateStatus:async(n,u)=>await Pe(`/reports/${n}/status`,{method:"PUT",body:{status:u}}),generatePdf:async n=>await Pe(`/reports/${n}/generate-pdf`,{method:"POST"}),downloadPdf:async n=>{const u=await fetch(`${$m}/reports/${n}/pdf`,{credentials:"include"});if(!u.ok)throw new Error("Failed to download PDF");return u.blob()}},Zb=({onLogin:n})=>{const[u,s]=b.useState({username:"",password:""}),[c,f]=b.useState(!1),[h,g]=b.useState(""),[p,y]=b.useState(!1),m=S=>{const{name:N,value:C}=S.target;s(T=>({...T,[N]:C})),g("")},x=async S=>{S.preventDefault(),f(!0),g("");try{const N=await Zr.login(u.username,u.password);n(N.user)}catch(N){g(N.message||"Login fehlgeschlagen")}finally{f(!1)}},A=async(S,N)=>{s({username:S,password:N}),f(!0),g("");try{const C=await Zr.login(S,N);n(C.user)}catch(C){g(C.message||"Demo-Login fehlgeschlagen")}finally{f(!1)}};return o.jsx("div",{className:"login-container",children:o.jsxs("div",{className:"login-card",children:[o.jsxs("div",{className:"login-header",children:[o.jsxs("div",{className:"company-logo",children:[o.jsx("div",{className:"logo-icon",children:"📋"}),o.jsx("h1",{children:"HARAL"})]}),o.jsx("h2",{children:"Prüfbericht Generator"}),o.jsx("p",{children:"Melden Sie sich an, um fortzufahren"})]}),o.jsxs("form",{onSubmit:x,className:"login-form",children:[h&&o.jsxs("div",{className:"error-message",children:[o.jsx("span",{className:"error-icon",children:"⚠️"}),h]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"username",children:"Benutzername"}),o.jsx("input",{type:"text",id:"username",name:"username",value:u.username,onChange:m,required:!0,placeholder:"Benutzername eingeben",autoComplete:"username"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"password",children:"Passwort"}),o.jsx("input",{type:"password",id:"password",name:"password",value:u.password,onChange:m,required:!0,placeholder:"Passwort eingeben",autoComplete:"current-password"})]}),o.jsx("button",{type:"submit",className:"login-button",disabled:c,children:c?o.jsxs(o.Fragment,{children:[o.jsx("span",{className:"spinner"}),"Anmelden..."]}):"Anmelden"})]}),o.jsxs("div",{className:"demo-section",children:[o.jsxs("button",{type:"button",className:"demo-toggle",onClick:()=>y(!p),children:[p?"🔼":"🔽"," Demo-Zugänge"]}),p&&o.jsxs("div",{className:"demo-accounts",children:[o.jsxs("div",{className:"demo-account",children:[o.jsx("h4",{children:"👨‍💼 Administrator"}),o.jsx("p",{children:"Vollzugriff auf alle Funktionen"}),o.jsx("button",{onClick:()=>A("admin","admin123"),className:"demo-login-btn admin",disabled:c,children:"Als Admin anmelden"})]}),o.jsxs("div",{className:"demo-account",children:[o.jsx("h4",{children:"🔍 Auditor"}),o.jsx("p",{children:"Prüfberichte erstellen und verwalten"}),o.jsx("button",{onClick:()=>A("ralf.hartmann","auditor123"),className:"demo-login-btn auditor",disabled:c,children:"Als Auditor anmelden"})]})]})]}),o.jsx("div",{className:"login-footer",children:o.jsx("p",{children:"© 2025 HARAL Prüfbericht Generator"})})]})})},gi=({size:n="medium",message:u="Laden..."})=>o.jsxs("div",{className:`loading-container ${n}`,children:[o.jsxs("div",{className:"loading-spinner",children:[o.jsx("div",{className:"spinner-ring"}),o.jsx("div",{className:"spinner-ring"}),o.jsx("div",{className:"spinner-ring"}),o.jsx("div",{className:"spinner-ring"})]}),u&&o.jsx("p",{className:"loading-message",children:u})]}),rm=({user:n})=>{var x,A;const[u,s]=b.useState({customers:0,reports:0,recentReports:[]}),[c,f]=b.useState(!0),[h,g]=b.useState("");b.useEffect(()=>{p()},[]);const p=async()=>{try{f(!0);const[S,N]=await Promise.all([ol.getAll(),fi.getAll()]),C=N.sort((T,B)=>new Date(B.created_at)-new Date(T.created_at)).slice(0,5);s({customers:S.length,reports:N.length,recentReports:C})}catch(S){g("Fehler beim Laden der Dashboard-Daten"),console.error("Dashboard error:",S)}finally{f(!1)}},y=S=>S?new Date(S).toLocaleDateString("de-DE"):"",m=()=>{const S=new Date().getHours();return S<12?"Guten Morgen":S<18?"Guten Tag":"Guten Abend"};return c?o.jsx(gi,{message:"Dashboard wird geladen..."}):o.jsx("div",{className:"dashboard",children:o.jsxs("div",{className:"dashboard-container",children:[o.jsxs("div",{className:"welcome-section",children:[o.jsxs("div",{className:"welcome-content",children:[o.jsxs("h1",{className:"welcome-title",children:[m(),", ",n.first_name,"! 👋"]}),o.jsx("p",{className:"welcome-subtitle",children:"Willkommen zurück im HARAL Prüfbericht Generator"})]}),o.jsx("div",{className:"welcome-avatar",children:o.jsxs("div",{className:"user-avatar-large",children:[(x=n.first_name)==null?void 0:x[0],(A=n.last_name)==null?void 0:A[0]]})})]}),h&&o.jsxs("div",{className:"error-banner",children:[o.jsx("span",{className:"error-icon",children:"⚠️"}),h]}),o.jsxs("div",{className:"stats-grid",children:[o.jsxs("div",{className:"stat-card customers",children:[o.jsx("div",{className:"stat-icon",children:"👥"}),o.jsxs("div",{className:"stat-content",children:[o.jsx("div",{className:"stat-number",children:u.customers}),o.jsx("div",{className:"stat-label",children:"Kunden"})]}),o.jsx(Dt,{to:"/customers",className:"stat-link",children:"Verwalten →"})]}),o.jsxs("div",{className:"stat-card reports",children:[o.jsx("div",{className:"stat-icon",children:"📋"}),o.jsxs("div",{className:"stat-content",children:[o.jsx("div",{className:"stat-number",children:u.reports}),o.jsx("div",{className:"stat-label",children:"Berichte"})]}),o.jsx(Dt,{to:"/reports",className:"stat-link",children:"Anzeigen →"})]})]}),o.jsxs("div",{className:"quick-actions",children:[o.jsx("h2",{className:"section-title",children:"Schnellaktionen"}),o.jsxs("div",{className:"action-grid",children:[o.jsxs(Dt,{to:"/reports/new",className:"action-card primary",children:[o.jsx("div",{className:"action-icon",children:"➕"}),o.jsxs("div",{className:"action-content",children:[o.jsx("h3",{children:"Neuer Bericht"}),o.jsx("p",{children:"Erstellen Sie einen neuen Prüfbericht für einen Kunden"})]})]}),o.jsxs(Dt,{to:"/customers",className:"action-card secondary",children:[o.jsx("div",{className:"action-icon",children:"👤"}),o.jsxs("div",{className:"action-content",children:[o.jsx("h3",{children:"Kunde hinzufügen"}),o.jsx("p",{children:"Neuen Kunden zum System hinzufügen"})]})]})]})]}),o.jsxs("div",{className:"recent-section",children:[o.jsxs("div",{className:"section-header",children:[o.jsx("h2",{className:"section-title",children:"Letzte Berichte"}),o.jsx(Dt,{to:"/reports",className:"section-link",children:"Alle anzeigen →"})]}),u.recentReports.length>0?o.jsx("div",{className:"recent-reports",children:u.recentReports.map(S=>o.jsxs("div",{className:"report-item",children:[o.jsxs("div",{className:"report-info",children:[o.jsx("h4",{className:"report-title",children:S.title}),o.jsxs("p",{className:"report-meta",children:["Erstellt am ",y(S.created_at)]})]}),o.jsx("div",{className:"report-status",children:o.jsx("span",{className:`status-badge ${S.status}`,children:S.status==="draft"?"Entwurf":S.status==="completed"?"Abgeschlossen":"Archiviert"})})]},S.id))}):o.jsxs("div",{className:"empty-state",children:[o.jsx("div",{className:"empty-icon",children:"📄"}),o.jsx("h3",{children:"Keine Berichte vorhanden"}),o.jsx("p",{children:"Erstellen Sie Ihren ersten Prüfbericht"}),o.jsx(Dt,{to:"/reports/new",className:"empty-action",children:"Bericht erstellen"})]})]})]})})},Kb=()=>{const[n,u]=b.useState([]),[s,c]=b.useState(!0),[f,h]=b.useState(!1),[g,p]=b.useState(!1),[y,m]=b.useState(null),[x,A]=b.useState(""),[S,N]=b.useState(""),[C,T]=b.useState({company_name:"",contact_person:"",email:"",phone:"",address:"",notes:""});b.useEffect(()=>{B()},[]);const B=async()=>{try{c(!0);const Q=await ol.getAll();u(Q)}catch(Q){A("Fehler beim Laden der Kunden"),console.error("Load customers error:",Q)}finally{c(!1)}},z=Q=>{const{name:de,value:ze}=Q.target;T(Te=>({...Te,[de]:ze}))},H=async Q=>{Q.preventDefault();try{y?(await ol.update(y.id,C),N("Kunde erfolgreich aktualisiert!")):(await ol.create(C),N("Kunde erfolgreich erstellt!")),B(),te(),setTimeout(()=>{N("")},3e3)}catch(de){A("Fehler beim Speichern des Kunden: "+de.message),console.error("Save customer error:",de)}},V=Q=>{m(Q),T({company_name:Q.company_name||"",contact_person:Q.contact_person||"",email:Q.email||"",phone:Q.phone||"",address:Q.address||"",notes:Q.notes||""}),p(!0)},$=async Q=>{if(window.confirm("Sind Sie sicher, dass Sie diesen Kunden löschen möchten?"))try{await ol.delete(Q),N("Kunde erfolgreich gelöscht!"),B(),setTimeout(()=>{N("")},3e3)}catch(de){A("Fehler beim Löschen des Kunden: "+de.message),console.error("Delete customer error:",de)}},Z=async(Q,de)=>{try{h(!0),await ol.uploadLogo(Q,de),N("Logo erfolgreich hochgeladen!"),B(),setTimeout(()=>{N("")},3e3)}catch(ze){A("Fehler beim Hochladen des Logos: "+ze.message),console.error("Logo upload error:",ze)}finally{h(!1)}},ce=Q=>{const de=document.createElement("input");de.type="file",de.accept="image/*",de.onchange=ze=>{const Te=ze.target.files[0];Te&&Z(Q,Te)},de.click()},te=()=>{p(!1),m(null),T({company_name:"",contact_person:"",email:"",phone:"",address:"",notes:""}),A("")},J=()=>{T({company_name:"",contact_person:"",email:"",phone:"",address:"",notes:""})};return s?o.jsx(gi,{message:"Kunden werden geladen..."}):o.jsxs("div",{className:"customer-management",children:[o.jsxs("div",{className:"customer-header",children:[o.jsxs("div",{children:[o.jsx("h1",{children:"Kundenverwaltung"}),o.jsx("p",{children:"Verwalten Sie Ihre Kunden und deren Informationen"})]}),o.jsx("button",{onClick:()=>p(!0),className:"btn-primary",disabled:f,children:"➕ Neuer Kunde"})]}),x&&o.jsxs("div",{className:"error-message",children:[o.jsx("span",{className:"error-icon",children:"⚠️"}),x,o.jsx("button",{onClick:()=>A(""),className:"error-close",children:"✕"})]}),S&&o.jsxs("div",{className:"success-message",children:[o.jsx("span",{className:"success-icon",children:"✅"}),S]}),f&&o.jsxs("div",{className:"upload-message",children:[o.jsx("span",{className:"upload-icon",children:"⏳"}),"Logo wird hochgeladen..."]}),o.jsx("div",{className:"customers-grid",children:n.length===0?o.jsxs("div",{className:"empty-state",children:[o.jsx("div",{className:"empty-icon",children:"👥"}),o.jsx("h3",{children:"Keine Kunden vorhanden"}),o.jsx("p",{children:"Erstellen Sie Ihren ersten Kunden, um zu beginnen."})]}):n.map(Q=>o.jsxs("div",{className:"customer-card",children:[o.jsxs("div",{className:"customer-header",children:[o.jsxs("div",{className:"customer-logo",children:[Q.logo_path?o.jsx("img",{src:`/api/customers/${Q.id}/logo`,alt:`${Q.company_name} Logo`,className:"logo-image"}):o.jsx("div",{className:"logo-placeholder",children:"🏢"}),o.jsx("div",{className:"logo-upload",children:o.jsx("button",{onClick:()=>ce(Q.id),className:"logo-upload-btn",disabled:f,title:"Logo hochladen",children:"📁"})})]}),o.jsxs("div",{className:"customer-info",children:[o.jsx("h3",{children:Q.company_name}),Q.contact_person&&o.jsx("p",{className:"contact-person",children:Q.contact_person})]})]}),o.jsxs("div",{className:"customer-details",children:[Q.email&&o.jsxs("p",{children:[o.jsx("span",{children:"📧"})," ",Q.email]}),Q.phone&&o.jsxs("p",{children:[o.jsx("span",{children:"📞"})," ",Q.phone]}),Q.address&&o.jsxs("p",{children:[o.jsx("span",{children:"📍"})," ",Q.address]}),Q.notes&&o.jsxs("p",{className:"notes",children:[o.jsx("span",{children:"📝"})," ",Q.notes]})]}),o.jsxs("div",{className:"customer-actions",children:[o.jsx("button",{onClick:()=>V(Q),className:"btn-edit",title:"Bearbeiten",children:"✏️"}),o.jsx("button",{onClick:()=>$(Q.id),className:"btn-delete",title:"Löschen",children:"🗑️"})]})]},Q.id))}),g&&o.jsx("div",{className:"modal-overlay",onClick:te,children:o.jsxs("div",{className:"modal-content",onClick:Q=>Q.stopPropagation(),children:[o.jsxs("div",{className:"modal-header",children:[o.jsx("h2",{children:y?"Kunde bearbeiten":"Neuer Kunde"}),o.jsx("button",{onClick:te,className:"modal-close",children:"✕"})]}),o.jsxs("form",{onSubmit:H,className:"customer-form",children:[o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"company_name",children:"Firmenname *"}),o.jsx("input",{type:"text",id:"company_name",name:"company_name",value:C.company_name,onChange:z,required:!0,placeholder:"Name der Firma"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"contact_person",children:"Ansprechpartner"}),o.jsx("input",{type:"text",id:"contact_person",name:"contact_person",value:C.contact_person,onChange:z,placeholder:"Name des Ansprechpartners"})]})]}),o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"email",children:"E-Mail"}),o.jsx("input",{type:"email",id:"email",name:"email",value:C.email,onChange:z,placeholder:"E-Mail-Adresse"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"phone",children:"Telefon"}),o.jsx("input",{type:"tel",id:"phone",name:"phone",value:C.phone,onChange:z,placeholder:"Telefonnummer"})]})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"address",children:"Adresse"}),o.jsx("textarea",{id:"address",name:"address",value:C.address,onChange:z,placeholder:"Vollständige Adresse",rows:"3"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"notes",children:"Notizen"}),o.jsx("textarea",{id:"notes",name:"notes",value:C.notes,onChange:z,placeholder:"Zusätzliche Informationen",rows:"3"})]}),o.jsxs("div",{className:"form-actions",children:[o.jsx("button",{type:"button",onClick:te,className:"btn-secondary",children:"Abbrechen"}),o.jsx("button",{type:"button",onClick:J,className:"btn-secondary",children:"Zurücksetzen"}),o.jsx("button",{type:"submit",className:"btn-primary",children:y?"Aktualisieren":"Erstellen"})]})]})]})})]})},Jb=()=>{const[n,u]=b.useState([]),[s,c]=b.useState(!0),[f,h]=b.useState(!1),[g,p]=b.useState(""),[y,m]=b.useState(""),[x,A]=b.useState({customer_id:"",title:"",author:"",author_phone:"",author_email:"",audit_date:new Date().toISOString().split("T")[0],status:"draft",focus_goals:"",machine_manufacturer:"",machine_type:"",machine_model:"",machine_number:"",machine_year:"",machine_quantity:"",machine_features:"",palette_type:"",palette_length:"",palette_width:"",palette_weight:"",packaging_types:"",foil_supplier:"",foil_manufacturer:"",foil_article_number:"",foil_thickness:"",foil_height:"",foil_roll_weight:"",foil_work_area:""});b.useEffect(()=>{S()},[]);const S=async()=>{try{c(!0);const H=await ol.getAll();u(H)}catch(H){p("Fehler beim Laden der Kunden"),console.error("Load customers error:",H)}finally{c(!1)}},N=H=>{const{name:V,value:$}=H.target;A(Z=>({...Z,[V]:$}))},C=async H=>{if(H.preventDefault(),!x.customer_id){p("Bitte wählen Sie einen Kunden aus");return}try{h(!0),p("");const V={...x,status:"draft"},$=await fi.create(V);m("Bericht erfolgreich erstellt!"),setTimeout(()=>{z(),m("")},2e3)}catch(V){p("Fehler beim Erstellen des Berichts: "+V.message),console.error("Create report error:",V)}finally{h(!1)}},T=async()=>{try{h(!0),p("");const H={...x,status:"draft"};await fi.create(H),m("Entwurf gespeichert!"),setTimeout(()=>{m("")},2e3)}catch(H){p("Fehler beim Speichern des Entwurfs: "+H.message),console.error("Save draft error:",H)}finally{h(!1)}},B=async()=>{if(!x.customer_id){p("Bitte wählen Sie einen Kunden aus");return}try{h(!0),p("");const H={...x,status:"completed"},V=await fi.create(H);try{await fi.generatePdf(V.id),m("Bericht finalisiert und PDF generiert!")}catch($){m("Bericht finalisiert! PDF-Generierung fehlgeschlagen."),console.error("PDF generation error:",$)}setTimeout(()=>{z(),m("")},3e3)}catch(H){p("Fehler beim Finalisieren des Berichts: "+H.message),console.error("Finalize report error:",H)}finally{h(!1)}},z=()=>{A({customer_id:"",title:"",author:"",author_phone:"",author_email:"",audit_date:new Date().toISOString().split("T")[0],status:"draft",focus_goals:"",machine_manufacturer:"",machine_type:"",machine_model:"",machine_number:"",machine_year:"",machine_quantity:"",machine_features:"",palette_type:"",palette_length:"",palette_width:"",palette_weight:"",packaging_types:"",foil_supplier:"",foil_manufacturer:"",foil_article_number:"",foil_thickness:"",foil_height:"",foil_roll_weight:"",foil_work_area:""})};return s?o.jsx(gi,{message:"Formular wird geladen..."}):o.jsxs("div",{className:"report-form",children:[o.jsxs("div",{className:"form-header",children:[o.jsx("h1",{children:"Neuen Prüfbericht erstellen"}),o.jsx("p",{children:"Erstellen Sie einen detaillierten Prüfbericht für Ihre Kunden"})]}),g&&o.jsxs("div",{className:"error-message",children:[o.jsx("span",{className:"error-icon",children:"⚠️"}),g,o.jsx("button",{onClick:()=>p(""),className:"error-close",children:"✕"})]}),y&&o.jsxs("div",{className:"success-message",children:[o.jsx("span",{className:"success-icon",children:"✅"}),y]}),o.jsxs("form",{onSubmit:C,className:"report-form-content",children:[o.jsxs("div",{className:"form-section",children:[o.jsx("h2",{children:"📋 Grundinformationen"}),o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"customer_id",children:"Kunde *"}),o.jsxs("select",{id:"customer_id",name:"customer_id",value:x.customer_id,onChange:N,required:!0,children:[o.jsx("option",{value:"",children:"Kunde auswählen"}),n.map(H=>o.jsx("option",{value:H.id,children:H.company_name},H.id))]})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"audit_date",children:"Prüfdatum *"}),o.jsx("input",{type:"date",id:"audit_date",name:"audit_date",value:x.audit_date,onChange:N,required:!0})]})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"title",children:"Berichtstitel"}),o.jsx("input",{type:"text",id:"title",name:"title",value:x.title,onChange:N,placeholder:"z.B. Sicherheitsprüfung Verpackungsmaschine"})]})]}),o.jsxs("div",{className:"form-section",children:[o.jsx("h2",{children:"👤 Prüfer-Informationen"}),o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"author",children:"Prüfer Name"}),o.jsx("input",{type:"text",id:"author",name:"author",value:x.author,onChange:N,placeholder:"Vor- und Nachname"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"author_phone",children:"Telefon"}),o.jsx("input",{type:"tel",id:"author_phone",name:"author_phone",value:x.author_phone,onChange:N,placeholder:"Telefonnummer"})]})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"author_email",children:"E-Mail"}),o.jsx("input",{type:"email",id:"author_email",name:"author_email",value:x.author_email,onChange:N,placeholder:"E-Mail-Adresse"})]})]}),o.jsxs("div",{className:"form-section",children:[o.jsx("h2",{children:"🎯 Prüfziele und Schwerpunkte"}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"focus_goals",children:"Schwerpunkte und Ziele"}),o.jsx("textarea",{id:"focus_goals",name:"focus_goals",value:x.focus_goals,onChange:N,placeholder:"Beschreiben Sie die Prüfziele und Schwerpunkte...",rows:"4"})]})]}),o.jsxs("div",{className:"form-section",children:[o.jsx("h2",{children:"🏭 Maschinen-Informationen"}),o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"machine_manufacturer",children:"Hersteller"}),o.jsx("input",{type:"text",id:"machine_manufacturer",name:"machine_manufacturer",value:x.machine_manufacturer,onChange:N,placeholder:"Maschinenhersteller"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"machine_type",children:"Maschinentyp"}),o.jsx("input",{type:"text",id:"machine_type",name:"machine_type",value:x.machine_type,onChange:N,placeholder:"Typ der Maschine"})]})]}),o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"machine_model",children:"Modell"}),o.jsx("input",{type:"text",id:"machine_model",name:"machine_model",value:x.machine_model,onChange:N,placeholder:"Maschinenmodell"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"machine_number",children:"Maschinennummer"}),o.jsx("input",{type:"text",id:"machine_number",name:"machine_number",value:x.machine_number,onChange:N,placeholder:"Seriennummer"})]})]}),o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"machine_year",children:"Baujahr"}),o.jsx("input",{type:"number",id:"machine_year",name:"machine_year",value:x.machine_year,onChange:N,placeholder:"Baujahr",min:"1900",max:new Date().getFullYear()})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"machine_quantity",children:"Anzahl Maschinen"}),o.jsx("input",{type:"number",id:"machine_quantity",name:"machine_quantity",value:x.machine_quantity,onChange:N,placeholder:"Anzahl",min:"1"})]})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"machine_features",children:"Besondere Merkmale"}),o.jsx("textarea",{id:"machine_features",name:"machine_features",value:x.machine_features,onChange:N,placeholder:"Besondere Eigenschaften oder Ausstattung...",rows:"3"})]})]}),o.jsxs("div",{className:"form-section",children:[o.jsx("h2",{children:"📦 Paletten-Informationen"}),o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"palette_type",children:"Palettentyp"}),o.jsx("input",{type:"text",id:"palette_type",name:"palette_type",value:x.palette_type,onChange:N,placeholder:"z.B. Europalette, Industriepalette"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"palette_weight",children:"Gewicht (kg)"}),o.jsx("input",{type:"number",id:"palette_weight",name:"palette_weight",value:x.palette_weight,onChange:N,placeholder:"Gewicht in kg",step:"0.1"})]})]}),o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"palette_length",children:"Länge (mm)"}),o.jsx("input",{type:"number",id:"palette_length",name:"palette_length",value:x.palette_length,onChange:N,placeholder:"Länge in mm"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"palette_width",children:"Breite (mm)"}),o.jsx("input",{type:"number",id:"palette_width",name:"palette_width",value:x.palette_width,onChange:N,placeholder:"Breite in mm"})]})]})]}),o.jsxs("div",{className:"form-section",children:[o.jsx("h2",{children:"📄 Verpackung und Folie"}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"packaging_types",children:"Verpackungsarten"}),o.jsx("input",{type:"text",id:"packaging_types",name:"packaging_types",value:x.packaging_types,onChange:N,placeholder:"z.B. Stretchfolie, Schrumpffolie"})]}),o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"foil_supplier",children:"Folienlieferant"}),o.jsx("input",{type:"text",id:"foil_supplier",name:"foil_supplier",value:x.foil_supplier,onChange:N,placeholder:"Name des Lieferanten"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"foil_manufacturer",children:"Folienhersteller"}),o.jsx("input",{type:"text",id:"foil_manufacturer",name:"foil_manufacturer",value:x.foil_manufacturer,onChange:N,placeholder:"Hersteller der Folie"})]})]}),o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"foil_article_number",children:"Artikelnummer"}),o.jsx("input",{type:"text",id:"foil_article_number",name:"foil_article_number",value:x.foil_article_number,onChange:N,placeholder:"Artikelnummer der Folie"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"foil_thickness",children:"Foliendicke (μm)"}),o.jsx("input",{type:"number",id:"foil_thickness",name:"foil_thickness",value:x.foil_thickness,onChange:N,placeholder:"Dicke in Mikrometern",step:"0.1"})]})]}),o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"foil_height",children:"Folienhöhe (mm)"}),o.jsx("input",{type:"number",id:"foil_height",name:"foil_height",value:x.foil_height,onChange:N,placeholder:"Höhe in mm"})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"foil_roll_weight",children:"Rollengewicht (kg)"}),o.jsx("input",{type:"number",id:"foil_roll_weight",name:"foil_roll_weight",value:x.foil_roll_weight,onChange:N,placeholder:"Gewicht der Rolle in kg",step:"0.1"})]})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"foil_work_area",children:"Arbeitsbereich"}),o.jsx("input",{type:"text",id:"foil_work_area",name:"foil_work_area",value:x.foil_work_area,onChange:N,placeholder:"Beschreibung des Arbeitsbereichs"})]})]}),o.jsxs("div",{className:"form-actions",children:[o.jsx("button",{type:"button",onClick:z,className:"btn-secondary",disabled:f,children:"🔄 Zurücksetzen"}),o.jsx("button",{type:"button",onClick:T,className:"btn-draft",disabled:f,children:f?"⏳ Speichert...":"📝 Als Entwurf speichern"}),o.jsx("button",{type:"button",onClick:B,className:"btn-primary",disabled:f,children:f?"⏳ Verarbeitet...":"✅ Bericht finalisieren"})]})]})]})};function um(n,u){if(typeof n=="function")return n(u);n!=null&&(n.current=u)}function $b(...n){return u=>{let s=!1;const c=n.map(f=>{const h=um(f,u);return!s&&typeof h=="function"&&(s=!0),h});if(s)return()=>{for(let f=0;f<c.length;f++){const h=c[f];typeof h=="function"?h():um(n[f],null)}}}}function Ga(...n){return b.useCallback($b(...n),n)}function Qs(n){const u=Fb(n),s=b.forwardRef((c,f)=>{const{children:h,...g}=c,p=b.Children.toArray(h),y=p.find(Pb);if(y){const m=y.props.children,x=p.map(A=>A===y?b.Children.count(m)>1?b.Children.only(null):b.isValidElement(m)?m.props.children:null:A);return o.jsx(u,{...g,ref:f,children:b.isValidElement(m)?b.cloneElement(m,void 0,x):null})}return o.jsx(u,{...g,ref:f,children:h})});return s.displayName=`${n}.Slot`,s}var Fm=Qs("Slot");function Fb(n){const u=b.forwardRef((s,c)=>{const{children:f,...h}=s,g=b.isValidElement(f)?e0(f):void 0,p=Ga(g,c);if(b.isValidElement(f)){const y=Ib(h,f.props);return f.type!==b.Fragment&&(y.ref=p),b.cloneElement(f,y)}return b.Children.count(f)>1?b.Children.only(null):null});return u.displayName=`${n}.SlotClone`,u}var Wb=Symbol("radix.slottable");function Pb(n){return b.isValidElement(n)&&typeof n.type=="function"&&"__radixId"in n.type&&n.type.__radixId===Wb}function Ib(n,u){const s={...u};for(const c in u){const f=n[c],h=u[c];/^on[A-Z]/.test(c)?f&&h?s[c]=(...p)=>{const y=h(...p);return f(...p),y}:f&&(s[c]=f):c==="style"?s[c]={...f,...h}:c==="className"&&(s[c]=[f,h].filter(Boolean).join(" "))}return{...n,...s}}function e0(n){var c,f;let u=(c=Object.getOwnPropertyDescriptor(n.props,"ref"))==null?void 0:c.get,s=u&&"isReactWarning"in u&&u.isReactWarning;return s?n.ref:(u=(f=Object.getOwnPropertyDescriptor(n,"ref"))==null?void 0:f.get,s=u&&"isReactWarning"in u&&u.isReactWarning,s?n.props.ref:n.props.ref||n.ref)}function Wm(n){var u,s,c="";if(typeof n=="string"||typeof n=="number")c+=n;else if(typeof n=="object")if(Array.isArray(n)){var f=n.length;for(u=0;u<f;u++)n[u]&&(s=Wm(n[u]))&&(c&&(c+=" "),c+=s)}else for(s in n)n[s]&&(c&&(c+=" "),c+=s);return c}function Pm(){for(var n,u,s=0,c="",f=arguments.length;s<f;s++)(n=arguments[s])&&(u=Wm(n))&&(c&&(c+=" "),c+=u);return c}const cm=n=>typeof n=="boolean"?`${n}`:n===0?"0":n,sm=Pm,Im=(n,u)=>s=>{var c;if((u==null?void 0:u.variants)==null)return sm(n,s==null?void 0:s.class,s==null?void 0:s.className);const{variants:f,defaultVariants:h}=u,g=Object.keys(f).map(m=>{const x=s==null?void 0:s[m],A=h==null?void 0:h[m];if(x===null)return null;const S=cm(x)||cm(A);return f[m][S]}),p=s&&Object.entries(s).reduce((m,x)=>{let[A,S]=x;return S===void 0||(m[A]=S),m},{}),y=u==null||(c=u.compoundVariants)===null||c===void 0?void 0:c.reduce((m,x)=>{let{class:A,className:S,...N}=x;return Object.entries(N).every(C=>{let[T,B]=C;return Array.isArray(B)?B.includes({...h,...p}[T]):{...h,...p}[T]===B})?[...m,A,S]:m},[]);return sm(n,g,y,s==null?void 0:s.class,s==null?void 0:s.className)},Zs="-",t0=n=>{const u=l0(n),{conflictingClassGroups:s,conflictingClassGroupModifiers:c}=n;return{getClassGroupId:g=>{const p=g.split(Zs);return p[0]===""&&p.length!==1&&p.shift(),ev(p,u)||a0(g)},getConflictingClassGroupIds:(g,p)=>{const y=s[g]||[];return p&&c[g]?[...y,...c[g]]:y}}},ev=(n,u)=>{var g;if(n.length===0)return u.classGroupId;const s=n[0],c=u.nextPart.get(s),f=c?ev(n.slice(1),c):void 0;if(f)return f;if(u.validators.length===0)return;const h=n.join(Zs);return(g=u.validators.find(({validator:p})=>p(h)))==null?void 0:g.classGroupId},om=/^\[(.+)\]$/,a0=n=>{if(om.test(n)){const u=om.exec(n)[1],s=u==null?void 0:u.substring(0,u.indexOf(":"));if(s)return"arbitrary.."+s}},l0=n=>{const{theme:u,classGroups:s}=n,c={nextPart:new Map,validators:[]};for(const f in s)Ms(s[f],c,f,u);return c},Ms=(n,u,s,c)=>{n.forEach(f=>{if(typeof f=="string"){const h=f===""?u:fm(u,f);h.classGroupId=s;return}if(typeof f=="function"){if(n0(f)){Ms(f(c),u,s,c);return}u.validators.push({validator:f,classGroupId:s});return}Object.entries(f).forEach(([h,g])=>{Ms(g,fm(u,h),s,c)})})},fm=(n,u)=>{let s=n;return u.split(Zs).forEach(c=>{s.nextPart.has(c)||s.nextPart.set(c,{nextPart:new Map,validators:[]}),s=s.nextPart.get(c)}),s},n0=n=>n.isThemeGetter,i0=n=>{if(n<1)return{get:()=>{},set:()=>{}};let u=0,s=new Map,c=new Map;const f=(h,g)=>{s.set(h,g),u++,u>n&&(u=0,c=s,s=new Map)};return{get(h){let g=s.get(h);if(g!==void 0)return g;if((g=c.get(h))!==void 0)return f(h,g),g},set(h,g){s.has(h)?s.set(h,g):f(h,g)}}},Os="!",zs=":",r0=zs.length,u0=n=>{const{prefix:u,experimentalParseClassName:s}=n;let c=f=>{const h=[];let g=0,p=0,y=0,m;for(let C=0;C<f.length;C++){let T=f[C];if(g===0&&p===0){if(T===zs){h.push(f.slice(y,C)),y=C+r0;continue}if(T==="/"){m=C;continue}}T==="["?g++:T==="]"?g--:T==="("?p++:T===")"&&p--}const x=h.length===0?f:f.substring(y),A=c0(x),S=A!==x,N=m&&m>y?m-y:void 0;return{modifiers:h,hasImportantModifier:S,baseClassName:A,maybePostfixModifierPosition:N}};if(u){const f=u+zs,h=c;c=g=>g.startsWith(f)?h(g.substring(f.length)):{isExternal:!0,modifiers:[],hasImportantModifier:!1,baseClassName:g,maybePostfixModifierPosition:void 0}}if(s){const f=c;c=h=>s({className:h,parseClassName:f})}return c},c0=n=>n.endsWith(Os)?n.substring(0,n.length-1):n.startsWith(Os)?n.substring(1):n,s0=n=>{const u=Object.fromEntries(n.orderSensitiveModifiers.map(c=>[c,!0]));return c=>{if(c.length<=1)return c;const f=[];let h=[];return c.forEach(g=>{g[0]==="["||u[g]?(f.push(...h.sort(),g),h=[]):h.push(g)}),f.push(...h.sort()),f}},o0=n=>({cache:i0(n.cacheSize),parseClassName:u0(n),sortModifiers:s0(n),...t0(n)}),f0=/\s+/,d0=(n,u)=>{const{parseClassName:s,getClassGroupId:c,getConflictingClassGroupIds:f,sortModifiers:h}=u,g=[],p=n.trim().split(f0);let y="";for(let m=p.length-1;m>=0;m-=1){const x=p[m],{isExternal:A,modifiers:S,hasImportantModifier:N,baseClassName:C,maybePostfixModifierPosition:T}=s(x);if(A){y=x+(y.length>0?" "+y:y);continue}let B=!!T,z=c(B?C.substring(0,T):C);if(!z){if(!B){y=x+(y.length>0?" "+y:y);continue}if(z=c(C),!z){y=x+(y.length>0?" "+y:y);continue}B=!1}const H=h(S).join(":"),V=N?H+Os:H,$=V+z;if(g.includes($))continue;g.push($);const Z=f(z,B);for(let ce=0;ce<Z.length;++ce){const te=Z[ce];g.push(V+te)}y=x+(y.length>0?" "+y:y)}return y};function h0(){let n=0,u,s,c="";for(;n<arguments.length;)(u=arguments[n++])&&(s=tv(u))&&(c&&(c+=" "),c+=s);return c}const tv=n=>{if(typeof n=="string")return n;let u,s="";for(let c=0;c<n.length;c++)n[c]&&(u=tv(n[c]))&&(s&&(s+=" "),s+=u);return s};function m0(n,...u){let s,c,f,h=g;function g(y){const m=u.reduce((x,A)=>A(x),n());return s=o0(m),c=s.cache.get,f=s.cache.set,h=p,p(y)}function p(y){const m=c(y);if(m)return m;const x=d0(y,s);return f(y,x),x}return function(){return h(h0.apply(null,arguments))}}const Ve=n=>{const u=s=>s[n]||[];return u.isThemeGetter=!0,u},av=/^\[(?:(\w[\w-]*):)?(.+)\]$/i,lv=/^\((?:(\w[\w-]*):)?(.+)\)$/i,v0=/^\d+\/\d+$/,p0=/^(\d+(\.\d+)?)?(xs|sm|md|lg|xl)$/,g0=/\d+(%|px|r?em|[sdl]?v([hwib]|min|max)|pt|pc|in|cm|mm|cap|ch|ex|r?lh|cq(w|h|i|b|min|max))|\b(calc|min|max|clamp)\(.+\)|^0$/,y0=/^(rgba?|hsla?|hwb|(ok)?(lab|lch))\(.+\)$/,b0=/^(inset_)?-?((\d+)?\.?(\d+)[a-z]+|0)_-?((\d+)?\.?(\d+)[a-z]+|0)/,x0=/^(url|image|image-set|cross-fade|element|(repeating-)?(linear|radial|conic)-gradient)\(.+\)$/,Wl=n=>v0.test(n),oe=n=>!!n&&!Number.isNaN(Number(n)),La=n=>!!n&&Number.isInteger(Number(n)),xs=n=>n.endsWith("%")&&oe(n.slice(0,-1)),ia=n=>p0.test(n),S0=()=>!0,E0=n=>g0.test(n)&&!y0.test(n),nv=()=>!1,_0=n=>b0.test(n),j0=n=>x0.test(n),N0=n=>!I(n)&&!ee(n),w0=n=>rn(n,uv,nv),I=n=>av.test(n),ul=n=>rn(n,cv,E0),Ss=n=>rn(n,D0,oe),dm=n=>rn(n,iv,nv),A0=n=>rn(n,rv,j0),Or=n=>rn(n,sv,_0),ee=n=>lv.test(n),si=n=>un(n,cv),T0=n=>un(n,M0),hm=n=>un(n,iv),R0=n=>un(n,uv),C0=n=>un(n,rv),zr=n=>un(n,sv,!0),rn=(n,u,s)=>{const c=av.exec(n);return c?c[1]?u(c[1]):s(c[2]):!1},un=(n,u,s=!1)=>{const c=lv.exec(n);return c?c[1]?u(c[1]):s:!1},iv=n=>n==="position"||n==="percentage",rv=n=>n==="image"||n==="url",uv=n=>n==="length"||n==="size"||n==="bg-size",cv=n=>n==="length",D0=n=>n==="number",M0=n=>n==="family-name",sv=n=>n==="shadow",O0=()=>{const n=Ve("color"),u=Ve("font"),s=Ve("text"),c=Ve("font-weight"),f=Ve("tracking"),h=Ve("leading"),g=Ve("breakpoint"),p=Ve("container"),y=Ve("spacing"),m=Ve("radius"),x=Ve("shadow"),A=Ve("inset-shadow"),S=Ve("text-shadow"),N=Ve("drop-shadow"),C=Ve("blur"),T=Ve("perspective"),B=Ve("aspect"),z=Ve("ease"),H=Ve("animate"),V=()=>["auto","avoid","all","avoid-page","page","left","right","column"],$=()=>["center","top","bottom","left","right","top-left","left-top","top-right","right-top","bottom-right","right-bottom","bottom-left","left-bottom"],Z=()=>[...$(),ee,I],ce=()=>["auto","hidden","clip","visible","scroll"],te=()=>["auto","contain","none"],J=()=>[ee,I,y],Q=()=>[Wl,"full","auto",...J()],de=()=>[La,"none","subgrid",ee,I],ze=()=>["auto",{span:["full",La,ee,I]},La,ee,I],Te=()=>[La,"auto",ee,I],Ut=()=>["auto","min","max","fr",ee,I],At=()=>["start","end","center","between","around","evenly","stretch","baseline","center-safe","end-safe"],Me=()=>["start","end","center","stretch","center-safe","end-safe"],U=()=>["auto",...J()],K=()=>[Wl,"auto","full","dvw","dvh","lvw","lvh","svw","svh","min","max","fit",...J()],Y=()=>[n,ee,I],xe=()=>[...$(),hm,dm,{position:[ee,I]}],_=()=>["no-repeat",{repeat:["","x","y","space","round"]}],G=()=>["auto","cover","contain",R0,w0,{size:[ee,I]}],F=()=>[xs,si,ul],X=()=>["","none","full",m,ee,I],W=()=>["",oe,si,ul],he=()=>["solid","dashed","dotted","double"],re=()=>["normal","multiply","screen","overlay","darken","lighten","color-dodge","color-burn","hard-light","soft-light","difference","exclusion","hue","saturation","color","luminosity"],ge=()=>[oe,xs,hm,dm],we=()=>["","none",C,ee,I],ct=()=>["none",oe,ee,I],oa=()=>["none",oe,ee,I],fa=()=>[oe,ee,I],da=()=>[Wl,"full",...J()];return{cacheSize:500,theme:{animate:["spin","ping","pulse","bounce"],aspect:["video"],blur:[ia],breakpoint:[ia],color:[S0],container:[ia],"drop-shadow":[ia],ease:["in","out","in-out"],font:[N0],"font-weight":["thin","extralight","light","normal","medium","semibold","bold","extrabold","black"],"inset-shadow":[ia],leading:["none","tight","snug","normal","relaxed","loose"],perspective:["dramatic","near","normal","midrange","distant","none"],radius:[ia],shadow:[ia],spacing:["px",oe],text:[ia],"text-shadow":[ia],tracking:["tighter","tight","normal","wide","wider","widest"]},classGroups:{aspect:[{aspect:["auto","square",Wl,I,ee,B]}],container:["container"],columns:[{columns:[oe,I,ee,p]}],"break-after":[{"break-after":V()}],"break-before":[{"break-before":V()}],"break-inside":[{"break-inside":["auto","avoid","avoid-page","avoid-column"]}],"box-decoration":[{"box-decoration":["slice","clone"]}],box:[{box:["border","content"]}],display:["block","inline-block","inline","flex","inline-flex","table","inline-table","table-caption","table-cell","table-column","table-column-group","table-footer-group","table-header-group","table-row-group","table-row","flow-root","grid","inline-grid","contents","list-item","hidden"],sr:["sr-only","not-sr-only"],float:[{float:["right","left","none","start","end"]}],clear:[{clear:["left","right","both","none","start","end"]}],isolation:["isolate","isolation-auto"],"object-fit":[{object:["contain","cover","fill","none","scale-down"]}],"object-position":[{object:Z()}],overflow:[{overflow:ce()}],"overflow-x":[{"overflow-x":ce()}],"overflow-y":[{"overflow-y":ce()}],overscroll:[{overscroll:te()}],"overscroll-x":[{"overscroll-x":te()}],"overscroll-y":[{"overscroll-y":te()}],position:["static","fixed","absolute","relative","sticky"],inset:[{inset:Q()}],"inset-x":[{"inset-x":Q()}],"inset-y":[{"inset-y":Q()}],start:[{start:Q()}],end:[{end:Q()}],top:[{top:Q()}],right:[{right:Q()}],bottom:[{bottom:Q()}],left:[{left:Q()}],visibility:["visible","invisible","collapse"],z:[{z:[La,"auto",ee,I]}],basis:[{basis:[Wl,"full","auto",p,...J()]}],"flex-direction":[{flex:["row","row-reverse","col","col-reverse"]}],"flex-wrap":[{flex:["nowrap","wrap","wrap-reverse"]}],flex:[{flex:[oe,Wl,"auto","initial","none",I]}],grow:[{grow:["",oe,ee,I]}],shrink:[{shrink:["",oe,ee,I]}],order:[{order:[La,"first","last","none",ee,I]}],"grid-cols":[{"grid-cols":de()}],"col-start-end":[{col:ze()}],"col-start":[{"col-start":Te()}],"col-end":[{"col-end":Te()}],"grid-rows":[{"grid-rows":de()}],"row-start-end":[{row:ze()}],"row-start":[{"row-start":Te()}],"row-end":[{"row-end":Te()}],"grid-flow":[{"grid-flow":["row","col","dense","row-dense","col-dense"]}],"auto-cols":[{"auto-cols":Ut()}],"auto-rows":[{"auto-rows":Ut()}],gap:[{gap:J()}],"gap-x":[{"gap-x":J()}],"gap-y":[{"gap-y":J()}],"justify-content":[{justify:[...At(),"normal"]}],"justify-items":[{"justify-items":[...Me(),"normal"]}],"justify-self":[{"justify-self":["auto",...Me()]}],"align-content":[{content:["normal",...At()]}],"align-items":[{items:[...Me(),{baseline:["","last"]}]}],"align-self":[{self:["auto",...Me(),{baseline:["","last"]}]}],"place-content":[{"place-content":At()}],"place-items":[{"place-items":[...Me(),"baseline"]}],"place-self":[{"place-self":["auto",...Me()]}],p:[{p:J()}],px:[{px:J()}],py:[{py:J()}],ps:[{ps:J()}],pe:[{pe:J()}],pt:[{pt:J()}],pr:[{pr:J()}],pb:[{pb:J()}],pl:[{pl:J()}],m:[{m:U()}],mx:[{mx:U()}],my:[{my:U()}],ms:[{ms:U()}],me:[{me:U()}],mt:[{mt:U()}],mr:[{mr:U()}],mb:[{mb:U()}],ml:[{ml:U()}],"space-x":[{"space-x":J()}],"space-x-reverse":["space-x-reverse"],"space-y":[{"space-y":J()}],"space-y-reverse":["space-y-reverse"],size:[{size:K()}],w:[{w:[p,"screen",...K()]}],"min-w":[{"min-w":[p,"screen","none",...K()]}],"max-w":[{"max-w":[p,"screen","none","prose",{screen:[g]},...K()]}],h:[{h:["screen","lh",...K()]}],"min-h":[{"min-h":["screen","lh","none",...K()]}],"max-h":[{"max-h":["screen","lh",...K()]}],"font-size":[{text:["base",s,si,ul]}],"font-smoothing":["antialiased","subpixel-antialiased"],"font-style":["italic","not-italic"],"font-weight":[{font:[c,ee,Ss]}],"font-stretch":[{"font-stretch":["ultra-condensed","extra-condensed","condensed","semi-condensed","normal","semi-expanded","expanded","extra-expanded","ultra-expanded",xs,I]}],"font-family":[{font:[T0,I,u]}],"fvn-normal":["normal-nums"],"fvn-ordinal":["ordinal"],"fvn-slashed-zero":["slashed-zero"],"fvn-figure":["lining-nums","oldstyle-nums"],"fvn-spacing":["proportional-nums","tabular-nums"],"fvn-fraction":["diagonal-fractions","stacked-fractions"],tracking:[{tracking:[f,ee,I]}],"line-clamp":[{"line-clamp":[oe,"none",ee,Ss]}],leading:[{leading:[h,...J()]}],"list-image":[{"list-image":["none",ee,I]}],"list-style-position":[{list:["inside","outside"]}],"list-style-type":[{list:["disc","decimal","none",ee,I]}],"text-alignment":[{text:["left","center","right","justify","start","end"]}],"placeholder-color":[{placeholder:Y()}],"text-color":[{text:Y()}],"text-decoration":["underline","overline","line-through","no-underline"],"text-decoration-style":[{decoration:[...he(),"wavy"]}],"text-decoration-thickness":[{decoration:[oe,"from-font","auto",ee,ul]}],"text-decoration-color":[{decoration:Y()}],"underline-offset":[{"underline-offset":[oe,"auto",ee,I]}],"text-transform":["uppercase","lowercase","capitalize","normal-case"],"text-overflow":["truncate","text-ellipsis","text-clip"],"text-wrap":[{text:["wrap","nowrap","balance","pretty"]}],indent:[{indent:J()}],"vertical-align":[{align:["baseline","top","middle","bottom","text-top","text-bottom","sub","super",ee,I]}],whitespace:[{whitespace:["normal","nowrap","pre","pre-line","pre-wrap","break-spaces"]}],break:[{break:["normal","words","all","keep"]}],wrap:[{wrap:["break-word","anywhere","normal"]}],hyphens:[{hyphens:["none","manual","auto"]}],content:[{content:["none",ee,I]}],"bg-attachment":[{bg:["fixed","local","scroll"]}],"bg-clip":[{"bg-clip":["border","padding","content","text"]}],"bg-origin":[{"bg-origin":["border","padding","content"]}],"bg-position":[{bg:xe()}],"bg-repeat":[{bg:_()}],"bg-size":[{bg:G()}],"bg-image":[{bg:["none",{linear:[{to:["t","tr","r","br","b","bl","l","tl"]},La,ee,I],radial:["",ee,I],conic:[La,ee,I]},C0,A0]}],"bg-color":[{bg:Y()}],"gradient-from-pos":[{from:F()}],"gradient-via-pos":[{via:F()}],"gradient-to-pos":[{to:F()}],"gradient-from":[{from:Y()}],"gradient-via":[{via:Y()}],"gradient-to":[{to:Y()}],rounded:[{rounded:X()}],"rounded-s":[{"rounded-s":X()}],"rounded-e":[{"rounded-e":X()}],"rounded-t":[{"rounded-t":X()}],"rounded-r":[{"rounded-r":X()}],"rounded-b":[{"rounded-b":X()}],"rounded-l":[{"rounded-l":X()}],"rounded-ss":[{"rounded-ss":X()}],"rounded-se":[{"rounded-se":X()}],"rounded-ee":[{"rounded-ee":X()}],"rounded-es":[{"rounded-es":X()}],"rounded-tl":[{"rounded-tl":X()}],"rounded-tr":[{"rounded-tr":X()}],"rounded-br":[{"rounded-br":X()}],"rounded-bl":[{"rounded-bl":X()}],"border-w":[{border:W()}],"border-w-x":[{"border-x":W()}],"border-w-y":[{"border-y":W()}],"border-w-s":[{"border-s":W()}],"border-w-e":[{"border-e":W()}],"border-w-t":[{"border-t":W()}],"border-w-r":[{"border-r":W()}],"border-w-b":[{"border-b":W()}],"border-w-l":[{"border-l":W()}],"divide-x":[{"divide-x":W()}],"divide-x-reverse":["divide-x-reverse"],"divide-y":[{"divide-y":W()}],"divide-y-reverse":["divide-y-reverse"],"border-style":[{border:[...he(),"hidden","none"]}],"divide-style":[{divide:[...he(),"hidden","none"]}],"border-color":[{border:Y()}],"border-color-x":[{"border-x":Y()}],"border-color-y":[{"border-y":Y()}],"border-color-s":[{"border-s":Y()}],"border-color-e":[{"border-e":Y()}],"border-color-t":[{"border-t":Y()}],"border-color-r":[{"border-r":Y()}],"border-color-b":[{"border-b":Y()}],"border-color-l":[{"border-l":Y()}],"divide-color":[{divide:Y()}],"outline-style":[{outline:[...he(),"none","hidden"]}],"outline-offset":[{"outline-offset":[oe,ee,I]}],"outline-w":[{outline:["",oe,si,ul]}],"outline-color":[{outline:Y()}],shadow:[{shadow:["","none",x,zr,Or]}],"shadow-color":[{shadow:Y()}],"inset-shadow":[{"inset-shadow":["none",A,zr,Or]}],"inset-shadow-color":[{"inset-shadow":Y()}],"ring-w":[{ring:W()}],"ring-w-inset":["ring-inset"],"ring-color":[{ring:Y()}],"ring-offset-w":[{"ring-offset":[oe,ul]}],"ring-offset-color":[{"ring-offset":Y()}],"inset-ring-w":[{"inset-ring":W()}],"inset-ring-color":[{"inset-ring":Y()}],"text-shadow":[{"text-shadow":["none",S,zr,Or]}],"text-shadow-color":[{"text-shadow":Y()}],opacity:[{opacity:[oe,ee,I]}],"mix-blend":[{"mix-blend":[...re(),"plus-darker","plus-lighter"]}],"bg-blend":[{"bg-blend":re()}],"mask-clip":[{"mask-clip":["border","padding","content","fill","stroke","view"]},"mask-no-clip"],"mask-composite":[{mask:["add","subtract","intersect","exclude"]}],"mask-image-linear-pos":[{"mask-linear":[oe]}],"mask-image-linear-from-pos":[{"mask-linear-from":ge()}],"mask-image-linear-to-pos":[{"mask-linear-to":ge()}],"mask-image-linear-from-color":[{"mask-linear-from":Y()}],"mask-image-linear-to-color":[{"mask-linear-to":Y()}],"mask-image-t-from-pos":[{"mask-t-from":ge()}],"mask-image-t-to-pos":[{"mask-t-to":ge()}],"mask-image-t-from-color":[{"mask-t-from":Y()}],"mask-image-t-to-color":[{"mask-t-to":Y()}],"mask-image-r-from-pos":[{"mask-r-from":ge()}],"mask-image-r-to-pos":[{"mask-r-to":ge()}],"mask-image-r-from-color":[{"mask-r-from":Y()}],"mask-image-r-to-color":[{"mask-r-to":Y()}],"mask-image-b-from-pos":[{"mask-b-from":ge()}],"mask-image-b-to-pos":[{"mask-b-to":ge()}],"mask-image-b-from-color":[{"mask-b-from":Y()}],"mask-image-b-to-color":[{"mask-b-to":Y()}],"mask-image-l-from-pos":[{"mask-l-from":ge()}],"mask-image-l-to-pos":[{"mask-l-to":ge()}],"mask-image-l-from-color":[{"mask-l-from":Y()}],"mask-image-l-to-color":[{"mask-l-to":Y()}],"mask-image-x-from-pos":[{"mask-x-from":ge()}],"mask-image-x-to-pos":[{"mask-x-to":ge()}],"mask-image-x-from-color":[{"mask-x-from":Y()}],"mask-image-x-to-color":[{"mask-x-to":Y()}],"mask-image-y-from-pos":[{"mask-y-from":ge()}],"mask-image-y-to-pos":[{"mask-y-to":ge()}],"mask-image-y-from-color":[{"mask-y-from":Y()}],"mask-image-y-to-color":[{"mask-y-to":Y()}],"mask-image-radial":[{"mask-radial":[ee,I]}],"mask-image-radial-from-pos":[{"mask-radial-from":ge()}],"mask-image-radial-to-pos":[{"mask-radial-to":ge()}],"mask-image-radial-from-color":[{"mask-radial-from":Y()}],"mask-image-radial-to-color":[{"mask-radial-to":Y()}],"mask-image-radial-shape":[{"mask-radial":["circle","ellipse"]}],"mask-image-radial-size":[{"mask-radial":[{closest:["side","corner"],farthest:["side","corner"]}]}],"mask-image-radial-pos":[{"mask-radial-at":$()}],"mask-image-conic-pos":[{"mask-conic":[oe]}],"mask-image-conic-from-pos":[{"mask-conic-from":ge()}],"mask-image-conic-to-pos":[{"mask-conic-to":ge()}],"mask-image-conic-from-color":[{"mask-conic-from":Y()}],"mask-image-conic-to-color":[{"mask-conic-to":Y()}],"mask-mode":[{mask:["alpha","luminance","match"]}],"mask-origin":[{"mask-origin":["border","padding","content","fill","stroke","view"]}],"mask-position":[{mask:xe()}],"mask-repeat":[{mask:_()}],"mask-size":[{mask:G()}],"mask-type":[{"mask-type":["alpha","luminance"]}],"mask-image":[{mask:["none",ee,I]}],filter:[{filter:["","none",ee,I]}],blur:[{blur:we()}],brightness:[{brightness:[oe,ee,I]}],contrast:[{contrast:[oe,ee,I]}],"drop-shadow":[{"drop-shadow":["","none",N,zr,Or]}],"drop-shadow-color":[{"drop-shadow":Y()}],grayscale:[{grayscale:["",oe,ee,I]}],"hue-rotate":[{"hue-rotate":[oe,ee,I]}],invert:[{invert:["",oe,ee,I]}],saturate:[{saturate:[oe,ee,I]}],sepia:[{sepia:["",oe,ee,I]}],"backdrop-filter":[{"backdrop-filter":["","none",ee,I]}],"backdrop-blur":[{"backdrop-blur":we()}],"backdrop-brightness":[{"backdrop-brightness":[oe,ee,I]}],"backdrop-contrast":[{"backdrop-contrast":[oe,ee,I]}],"backdrop-grayscale":[{"backdrop-grayscale":["",oe,ee,I]}],"backdrop-hue-rotate":[{"backdrop-hue-rotate":[oe,ee,I]}],"backdrop-invert":[{"backdrop-invert":["",oe,ee,I]}],"backdrop-opacity":[{"backdrop-opacity":[oe,ee,I]}],"backdrop-saturate":[{"backdrop-saturate":[oe,ee,I]}],"backdrop-sepia":[{"backdrop-sepia":["",oe,ee,I]}],"border-collapse":[{border:["collapse","separate"]}],"border-spacing":[{"border-spacing":J()}],"border-spacing-x":[{"border-spacing-x":J()}],"border-spacing-y":[{"border-spacing-y":J()}],"table-layout":[{table:["auto","fixed"]}],caption:[{caption:["top","bottom"]}],transition:[{transition:["","all","colors","opacity","shadow","transform","none",ee,I]}],"transition-behavior":[{transition:["normal","discrete"]}],duration:[{duration:[oe,"initial",ee,I]}],ease:[{ease:["linear","initial",z,ee,I]}],delay:[{delay:[oe,ee,I]}],animate:[{animate:["none",H,ee,I]}],backface:[{backface:["hidden","visible"]}],perspective:[{perspective:[T,ee,I]}],"perspective-origin":[{"perspective-origin":Z()}],rotate:[{rotate:ct()}],"rotate-x":[{"rotate-x":ct()}],"rotate-y":[{"rotate-y":ct()}],"rotate-z":[{"rotate-z":ct()}],scale:[{scale:oa()}],"scale-x":[{"scale-x":oa()}],"scale-y":[{"scale-y":oa()}],"scale-z":[{"scale-z":oa()}],"scale-3d":["scale-3d"],skew:[{skew:fa()}],"skew-x":[{"skew-x":fa()}],"skew-y":[{"skew-y":fa()}],transform:[{transform:[ee,I,"","none","gpu","cpu"]}],"transform-origin":[{origin:Z()}],"transform-style":[{transform:["3d","flat"]}],translate:[{translate:da()}],"translate-x":[{"translate-x":da()}],"translate-y":[{"translate-y":da()}],"translate-z":[{"translate-z":da()}],"translate-none":["translate-none"],accent:[{accent:Y()}],appearance:[{appearance:["none","auto"]}],"caret-color":[{caret:Y()}],"color-scheme":[{scheme:["normal","dark","light","light-dark","only-dark","only-light"]}],cursor:[{cursor:["auto","default","pointer","wait","text","move","help","not-allowed","none","context-menu","progress","cell","crosshair","vertical-text","alias","copy","no-drop","grab","grabbing","all-scroll","col-resize","row-resize","n-resize","e-resize","s-resize","w-resize","ne-resize","nw-resize","se-resize","sw-resize","ew-resize","ns-resize","nesw-resize","nwse-resize","zoom-in","zoom-out",ee,I]}],"field-sizing":[{"field-sizing":["fixed","content"]}],"pointer-events":[{"pointer-events":["auto","none"]}],resize:[{resize:["none","","y","x"]}],"scroll-behavior":[{scroll:["auto","smooth"]}],"scroll-m":[{"scroll-m":J()}],"scroll-mx":[{"scroll-mx":J()}],"scroll-my":[{"scroll-my":J()}],"scroll-ms":[{"scroll-ms":J()}],"scroll-me":[{"scroll-me":J()}],"scroll-mt":[{"scroll-mt":J()}],"scroll-mr":[{"scroll-mr":J()}],"scroll-mb":[{"scroll-mb":J()}],"scroll-ml":[{"scroll-ml":J()}],"scroll-p":[{"scroll-p":J()}],"scroll-px":[{"scroll-px":J()}],"scroll-py":[{"scroll-py":J()}],"scroll-ps":[{"scroll-ps":J()}],"scroll-pe":[{"scroll-pe":J()}],"scroll-pt":[{"scroll-pt":J()}],"scroll-pr":[{"scroll-pr":J()}],"scroll-pb":[{"scroll-pb":J()}],"scroll-pl":[{"scroll-pl":J()}],"snap-align":[{snap:["start","end","center","align-none"]}],"snap-stop":[{snap:["normal","always"]}],"snap-type":[{snap:["none","x","y","both"]}],"snap-strictness":[{snap:["mandatory","proximity"]}],touch:[{touch:["auto","none","manipulation"]}],"touch-x":[{"touch-pan":["x","left","right"]}],"touch-y":[{"touch-pan":["y","up","down"]}],"touch-pz":["touch-pinch-zoom"],select:[{select:["none","text","all","auto"]}],"will-change":[{"will-change":["auto","scroll","contents","transform",ee,I]}],fill:[{fill:["none",...Y()]}],"stroke-w":[{stroke:[oe,si,ul,Ss]}],stroke:[{stroke:["none",...Y()]}],"forced-color-adjust":[{"forced-color-adjust":["auto","none"]}]},conflictingClassGroups:{overflow:["overflow-x","overflow-y"],overscroll:["overscroll-x","overscroll-y"],inset:["inset-x","inset-y","start","end","top","right","bottom","left"],"inset-x":["right","left"],"inset-y":["top","bottom"],flex:["basis","grow","shrink"],gap:["gap-x","gap-y"],p:["px","py","ps","pe","pt","pr","pb","pl"],px:["pr","pl"],py:["pt","pb"],m:["mx","my","ms","me","mt","mr","mb","ml"],mx:["mr","ml"],my:["mt","mb"],size:["w","h"],"font-size":["leading"],"fvn-normal":["fvn-ordinal","fvn-slashed-zero","fvn-figure","fvn-spacing","fvn-fraction"],"fvn-ordinal":["fvn-normal"],"fvn-slashed-zero":["fvn-normal"],"fvn-figure":["fvn-normal"],"fvn-spacing":["fvn-normal"],"fvn-fraction":["fvn-normal"],"line-clamp":["display","overflow"],rounded:["rounded-s","rounded-e","rounded-t","rounded-r","rounded-b","rounded-l","rounded-ss","rounded-se","rounded-ee","rounded-es","rounded-tl","rounded-tr","rounded-br","rounded-bl"],"rounded-s":["rounded-ss","rounded-es"],"rounded-e":["rounded-se","rounded-ee"],"rounded-t":["rounded-tl","rounded-tr"],"rounded-r":["rounded-tr","rounded-br"],"rounded-b":["rounded-br","rounded-bl"],"rounded-l":["rounded-tl","rounded-bl"],"border-spacing":["border-spacing-x","border-spacing-y"],"border-w":["border-w-x","border-w-y","border-w-s","border-w-e","border-w-t","border-w-r","border-w-b","border-w-l"],"border-w-x":["border-w-r","border-w-l"],"border-w-y":["border-w-t","border-w-b"],"border-color":["border-color-x","border-color-y","border-color-s","border-color-e","border-color-t","border-color-r","border-color-b","border-color-l"],"border-color-x":["border-color-r","border-color-l"],"border-color-y":["border-color-t","border-color-b"],translate:["translate-x","translate-y","translate-none"],"translate-none":["translate","translate-x","translate-y","translate-z"],"scroll-m":["scroll-mx","scroll-my","scroll-ms","scroll-me","scroll-mt","scroll-mr","scroll-mb","scroll-ml"],"scroll-mx":["scroll-mr","scroll-ml"],"scroll-my":["scroll-mt","scroll-mb"],"scroll-p":["scroll-px","scroll-py","scroll-ps","scroll-pe","scroll-pt","scroll-pr","scroll-pb","scroll-pl"],"scroll-px":["scroll-pr","scroll-pl"],"scroll-py":["scroll-pt","scroll-pb"],touch:["touch-x","touch-y","touch-pz"],"touch-x":["touch"],"touch-y":["touch"],"touch-pz":["touch"]},conflictingClassGroupModifiers:{"font-size":["leading"]},orderSensitiveModifiers:["*","**","after","backdrop","before","details-content","file","first-letter","first-line","marker","placeholder","selection"]}},z0=m0(O0);function Je(...n){return z0(Pm(n))}const U0=Im("inline-flex items-center justify-center gap-2 whitespace-nowrap rounded-md text-sm font-medium transition-all disabled:pointer-events-none disabled:opacity-50 [&_svg]:pointer-events-none [&_svg:not([class*='size-'])]:size-4 shrink-0 [&_svg]:shrink-0 outline-none focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive",{variants:{variant:{default:"bg-primary text-primary-foreground shadow-xs hover:bg-primary/90",destructive:"bg-destructive text-white shadow-xs hover:bg-destructive/90 focus-visible:ring-destructive/20 dark:focus-visible:ring-destructive/40 dark:bg-destructive/60",outline:"border bg-background shadow-xs hover:bg-accent hover:text-accent-foreground dark:bg-input/30 dark:border-input dark:hover:bg-input/50",secondary:"bg-secondary text-secondary-foreground shadow-xs hover:bg-secondary/80",ghost:"hover:bg-accent hover:text-accent-foreground dark:hover:bg-accent/50",link:"text-primary underline-offset-4 hover:underline"},size:{default:"h-9 px-4 py-2 has-[>svg]:px-3",sm:"h-8 rounded-md gap-1.5 px-3 has-[>svg]:px-2.5",lg:"h-10 rounded-md px-6 has-[>svg]:px-4",icon:"size-9"}},defaultVariants:{variant:"default",size:"default"}});function oi({className:n,variant:u,size:s,asChild:c=!1,...f}){const h=c?Fm:"button";return o.jsx(h,{"data-slot":"button",className:Je(U0({variant:u,size:s,className:n})),...f})}function B0({className:n,...u}){return o.jsx("div",{"data-slot":"card",className:Je("bg-card text-card-foreground flex flex-col gap-6 rounded-xl border py-6 shadow-sm",n),...u})}function L0({className:n,...u}){return o.jsx("div",{"data-slot":"card-header",className:Je("@container/card-header grid auto-rows-min grid-rows-[auto_auto] items-start gap-1.5 px-6 has-data-[slot=card-action]:grid-cols-[1fr_auto] [.border-b]:pb-6",n),...u})}function k0({className:n,...u}){return o.jsx("div",{"data-slot":"card-title",className:Je("leading-none font-semibold",n),...u})}function H0({className:n,...u}){return o.jsx("div",{"data-slot":"card-description",className:Je("text-muted-foreground text-sm",n),...u})}function q0({className:n,...u}){return o.jsx("div",{"data-slot":"card-content",className:Je("px-6",n),...u})}function G0({className:n,...u}){return o.jsx("div",{"data-slot":"table-container",className:"relative w-full overflow-x-auto",children:o.jsx("table",{"data-slot":"table",className:Je("w-full caption-bottom text-sm",n),...u})})}function Y0({className:n,...u}){return o.jsx("thead",{"data-slot":"table-header",className:Je("[&_tr]:border-b",n),...u})}function V0({className:n,...u}){return o.jsx("tbody",{"data-slot":"table-body",className:Je("[&_tr:last-child]:border-0",n),...u})}function mm({className:n,...u}){return o.jsx("tr",{"data-slot":"table-row",className:Je("hover:bg-muted/50 data-[state=selected]:bg-muted border-b transition-colors",n),...u})}function cl({className:n,...u}){return o.jsx("th",{"data-slot":"table-head",className:Je("text-foreground h-10 px-2 text-left align-middle font-medium whitespace-nowrap [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",n),...u})}function sl({className:n,...u}){return o.jsx("td",{"data-slot":"table-cell",className:Je("p-2 align-middle whitespace-nowrap [&:has([role=checkbox])]:pr-0 [&>[role=checkbox]]:translate-y-[2px]",n),...u})}const X0=Im("inline-flex items-center justify-center rounded-md border px-2 py-0.5 text-xs font-medium w-fit whitespace-nowrap shrink-0 [&>svg]:size-3 gap-1 [&>svg]:pointer-events-none focus-visible:border-ring focus-visible:ring-ring/50 focus-visible:ring-[3px] aria-invalid:ring-destructive/20 dark:aria-invalid:ring-destructive/40 aria-invalid:border-destructive transition-[color,box-shadow] overflow-hidden",{variants:{variant:{default:"border-transparent bg-primary text-primary-foreground [a&]:hover:bg-primary/90",secondary:"border-transparent bg-secondary text-secondary-foreground [a&]:hover:bg-secondary/90",destructive:"border-transparent bg-destructive text-white [a&]:hover:bg-destructive/90 focus-visible:ring-destructive/20 dark:focus-visible:ring-destructive/40 dark:bg-destructive/60",outline:"text-foreground [a&]:hover:bg-accent [a&]:hover:text-accent-foreground"}},defaultVariants:{variant:"default"}});function Ur({className:n,variant:u,asChild:s=!1,...c}){const f=s?Fm:"span";return o.jsx(f,{"data-slot":"badge",className:Je(X0({variant:u}),n),...c})}function qa(n,u,{checkForDefaultPrevented:s=!0}={}){return function(f){if(n==null||n(f),s===!1||!f.defaultPrevented)return u==null?void 0:u(f)}}function Q0(n,u){const s=b.createContext(u),c=h=>{const{children:g,...p}=h,y=b.useMemo(()=>p,Object.values(p));return o.jsx(s.Provider,{value:y,children:g})};c.displayName=n+"Provider";function f(h){const g=b.useContext(s);if(g)return g;if(u!==void 0)return u;throw new Error(`\`${h}\` must be used within \`${n}\``)}return[c,f]}function Z0(n,u=[]){let s=[];function c(h,g){const p=b.createContext(g),y=s.length;s=[...s,g];const m=A=>{var z;const{scope:S,children:N,...C}=A,T=((z=S==null?void 0:S[n])==null?void 0:z[y])||p,B=b.useMemo(()=>C,Object.values(C));return o.jsx(T.Provider,{value:B,children:N})};m.displayName=h+"Provider";function x(A,S){var T;const N=((T=S==null?void 0:S[n])==null?void 0:T[y])||p,C=b.useContext(N);if(C)return C;if(g!==void 0)return g;throw new Error(`\`${A}\` must be used within \`${h}\``)}return[m,x]}const f=()=>{const h=s.map(g=>b.createContext(g));return function(p){const y=(p==null?void 0:p[n])||h;return b.useMemo(()=>({[`__scope${n}`]:{...p,[n]:y}}),[p,y])}};return f.scopeName=n,[c,K0(f,...u)]}function K0(...n){const u=n[0];if(n.length===1)return u;const s=()=>{const c=n.map(f=>({useScope:f(),scopeName:f.scopeName}));return function(h){const g=c.reduce((p,{useScope:y,scopeName:m})=>{const A=y(h)[`__scope${m}`];return{...p,...A}},{});return b.useMemo(()=>({[`__scope${u.scopeName}`]:g}),[g])}};return s.scopeName=u.scopeName,s}var hi=globalThis!=null&&globalThis.document?b.useLayoutEffect:()=>{},J0=Dm[" useId ".trim().toString()]||(()=>{}),$0=0;function Es(n){const[u,s]=b.useState(J0());return hi(()=>{s(c=>c??String($0++))},[n]),n||(u?`radix-${u}`:"")}var F0=Dm[" useInsertionEffect ".trim().toString()]||hi;function W0({prop:n,defaultProp:u,onChange:s=()=>{},caller:c}){const[f,h,g]=P0({defaultProp:u,onChange:s}),p=n!==void 0,y=p?n:f;{const x=b.useRef(n!==void 0);b.useEffect(()=>{const A=x.current;A!==p&&console.warn(`${c} is changing from ${A?"controlled":"uncontrolled"} to ${p?"controlled":"uncontrolled"}. Components should not switch from controlled to uncontrolled (or vice versa). Decide between using a controlled or uncontrolled value for the lifetime of the component.`),x.current=p},[p,c])}const m=b.useCallback(x=>{var A;if(p){const S=I0(x)?x(n):x;S!==n&&((A=g.current)==null||A.call(g,S))}else h(x)},[p,n,h,g]);return[y,m]}function P0({defaultProp:n,onChange:u}){const[s,c]=b.useState(n),f=b.useRef(s),h=b.useRef(u);return F0(()=>{h.current=u},[u]),b.useEffect(()=>{var g;f.current!==s&&((g=h.current)==null||g.call(h,s),f.current=s)},[s,f]),[s,c,h]}function I0(n){return typeof n=="function"}var ex=["a","button","div","form","h2","h3","img","input","label","li","nav","ol","p","select","span","svg","ul"],sa=ex.reduce((n,u)=>{const s=Qs(`Primitive.${u}`),c=b.forwardRef((f,h)=>{const{asChild:g,...p}=f,y=g?s:u;return typeof window<"u"&&(window[Symbol.for("radix-ui")]=!0),o.jsx(y,{...p,ref:h})});return c.displayName=`Primitive.${u}`,{...n,[u]:c}},{});function tx(n,u){n&&Jm.flushSync(()=>n.dispatchEvent(u))}function mi(n){const u=b.useRef(n);return b.useEffect(()=>{u.current=n}),b.useMemo(()=>(...s)=>{var c;return(c=u.current)==null?void 0:c.call(u,...s)},[])}function ax(n,u=globalThis==null?void 0:globalThis.document){const s=mi(n);b.useEffect(()=>{const c=f=>{f.key==="Escape"&&s(f)};return u.addEventListener("keydown",c,{capture:!0}),()=>u.removeEventListener("keydown",c,{capture:!0})},[s,u])}var lx="DismissableLayer",Us="dismissableLayer.update",nx="dismissableLayer.pointerDownOutside",ix="dismissableLayer.focusOutside",vm,ov=b.createContext({layers:new Set,layersWithOutsidePointerEventsDisabled:new Set,branches:new Set}),fv=b.forwardRef((n,u)=>{const{disableOutsidePointerEvents:s=!1,onEscapeKeyDown:c,onPointerDownOutside:f,onFocusOutside:h,onInteractOutside:g,onDismiss:p,...y}=n,m=b.useContext(ov),[x,A]=b.useState(null),S=(x==null?void 0:x.ownerDocument)??(globalThis==null?void 0:globalThis.document),[,N]=b.useState({}),C=Ga(u,te=>A(te)),T=Array.from(m.layers),[B]=[...m.layersWithOutsidePointerEventsDisabled].slice(-1),z=T.indexOf(B),H=x?T.indexOf(x):-1,V=m.layersWithOutsidePointerEventsDisabled.size>0,$=H>=z,Z=cx(te=>{const J=te.target,Q=[...m.branches].some(de=>de.contains(J));!$||Q||(f==null||f(te),g==null||g(te),te.defaultPrevented||p==null||p())},S),ce=sx(te=>{const J=te.target;[...m.branches].some(de=>de.contains(J))||(h==null||h(te),g==null||g(te),te.defaultPrevented||p==null||p())},S);return ax(te=>{H===m.layers.size-1&&(c==null||c(te),!te.defaultPrevented&&p&&(te.preventDefault(),p()))},S),b.useEffect(()=>{if(x)return s&&(m.layersWithOutsidePointerEventsDisabled.size===0&&(vm=S.body.style.pointerEvents,S.body.style.pointerEvents="none"),m.layersWithOutsidePointerEventsDisabled.add(x)),m.layers.add(x),pm(),()=>{s&&m.layersWithOutsidePointerEventsDisabled.size===1&&(S.body.style.pointerEvents=vm)}},[x,S,s,m]),b.useEffect(()=>()=>{x&&(m.layers.delete(x),m.layersWithOutsidePointerEventsDisabled.delete(x),pm())},[x,m]),b.useEffect(()=>{const te=()=>N({});return document.addEventListener(Us,te),()=>document.removeEventListener(Us,te)},[]),o.jsx(sa.div,{...y,ref:C,style:{pointerEvents:V?$?"auto":"none":void 0,...n.style},onFocusCapture:qa(n.onFocusCapture,ce.onFocusCapture),onBlurCapture:qa(n.onBlurCapture,ce.onBlurCapture),onPointerDownCapture:qa(n.onPointerDownCapture,Z.onPointerDownCapture)})});fv.displayName=lx;var rx="DismissableLayerBranch",ux=b.forwardRef((n,u)=>{const s=b.useContext(ov),c=b.useRef(null),f=Ga(u,c);return b.useEffect(()=>{const h=c.current;if(h)return s.branches.add(h),()=>{s.branches.delete(h)}},[s.branches]),o.jsx(sa.div,{...n,ref:f})});ux.displayName=rx;function cx(n,u=globalThis==null?void 0:globalThis.document){const s=mi(n),c=b.useRef(!1),f=b.useRef(()=>{});return b.useEffect(()=>{const h=p=>{if(p.target&&!c.current){let y=function(){dv(nx,s,m,{discrete:!0})};const m={originalEvent:p};p.pointerType==="touch"?(u.removeEventListener("click",f.current),f.current=y,u.addEventListener("click",f.current,{once:!0})):y()}else u.removeEventListener("click",f.current);c.current=!1},g=window.setTimeout(()=>{u.addEventListener("pointerdown",h)},0);return()=>{window.clearTimeout(g),u.removeEventListener("pointerdown",h),u.removeEventListener("click",f.current)}},[u,s]),{onPointerDownCapture:()=>c.current=!0}}function sx(n,u=globalThis==null?void 0:globalThis.document){const s=mi(n),c=b.useRef(!1);return b.useEffect(()=>{const f=h=>{h.target&&!c.current&&dv(ix,s,{originalEvent:h},{discrete:!1})};return u.addEventListener("focusin",f),()=>u.removeEventListener("focusin",f)},[u,s]),{onFocusCapture:()=>c.current=!0,onBlurCapture:()=>c.current=!1}}function pm(){const n=new CustomEvent(Us);document.dispatchEvent(n)}function dv(n,u,s,{discrete:c}){const f=s.originalEvent.target,h=new CustomEvent(n,{bubbles:!1,cancelable:!0,detail:s});u&&f.addEventListener(n,u,{once:!0}),c?tx(f,h):f.dispatchEvent(h)}var _s="focusScope.autoFocusOnMount",js="focusScope.autoFocusOnUnmount",gm={bubbles:!1,cancelable:!0},ox="FocusScope",hv=b.forwardRef((n,u)=>{const{loop:s=!1,trapped:c=!1,onMountAutoFocus:f,onUnmountAutoFocus:h,...g}=n,[p,y]=b.useState(null),m=mi(f),x=mi(h),A=b.useRef(null),S=Ga(u,T=>y(T)),N=b.useRef({paused:!1,pause(){this.paused=!0},resume(){this.paused=!1}}).current;b.useEffect(()=>{if(c){let T=function(V){if(N.paused||!p)return;const $=V.target;p.contains($)?A.current=$:Ha(A.current,{select:!0})},B=function(V){if(N.paused||!p)return;const $=V.relatedTarget;$!==null&&(p.contains($)||Ha(A.current,{select:!0}))},z=function(V){if(document.activeElement===document.body)for(const Z of V)Z.removedNodes.length>0&&Ha(p)};document.addEventListener("focusin",T),document.addEventListener("focusout",B);const H=new MutationObserver(z);return p&&H.observe(p,{childList:!0,subtree:!0}),()=>{document.removeEventListener("focusin",T),document.removeEventListener("focusout",B),H.disconnect()}}},[c,p,N.paused]),b.useEffect(()=>{if(p){bm.add(N);const T=document.activeElement;if(!p.contains(T)){const z=new CustomEvent(_s,gm);p.addEventListener(_s,m),p.dispatchEvent(z),z.defaultPrevented||(fx(px(mv(p)),{select:!0}),document.activeElement===T&&Ha(p))}return()=>{p.removeEventListener(_s,m),setTimeout(()=>{const z=new CustomEvent(js,gm);p.addEventListener(js,x),p.dispatchEvent(z),z.defaultPrevented||Ha(T??document.body,{select:!0}),p.removeEventListener(js,x),bm.remove(N)},0)}}},[p,m,x,N]);const C=b.useCallback(T=>{if(!s&&!c||N.paused)return;const B=T.key==="Tab"&&!T.altKey&&!T.ctrlKey&&!T.metaKey,z=document.activeElement;if(B&&z){const H=T.currentTarget,[V,$]=dx(H);V&&$?!T.shiftKey&&z===$?(T.preventDefault(),s&&Ha(V,{select:!0})):T.shiftKey&&z===V&&(T.preventDefault(),s&&Ha($,{select:!0})):z===H&&T.preventDefault()}},[s,c,N.paused]);return o.jsx(sa.div,{tabIndex:-1,...g,ref:S,onKeyDown:C})});hv.displayName=ox;function fx(n,{select:u=!1}={}){const s=document.activeElement;for(const c of n)if(Ha(c,{select:u}),document.activeElement!==s)return}function dx(n){const u=mv(n),s=ym(u,n),c=ym(u.reverse(),n);return[s,c]}function mv(n){const u=[],s=document.createTreeWalker(n,NodeFilter.SHOW_ELEMENT,{acceptNode:c=>{const f=c.tagName==="INPUT"&&c.type==="hidden";return c.disabled||c.hidden||f?NodeFilter.FILTER_SKIP:c.tabIndex>=0?NodeFilter.FILTER_ACCEPT:NodeFilter.FILTER_SKIP}});for(;s.nextNode();)u.push(s.currentNode);return u}function ym(n,u){for(const s of n)if(!hx(s,{upTo:u}))return s}function hx(n,{upTo:u}){if(getComputedStyle(n).visibility==="hidden")return!0;for(;n;){if(u!==void 0&&n===u)return!1;if(getComputedStyle(n).display==="none")return!0;n=n.parentElement}return!1}function mx(n){return n instanceof HTMLInputElement&&"select"in n}function Ha(n,{select:u=!1}={}){if(n&&n.focus){const s=document.activeElement;n.focus({preventScroll:!0}),n!==s&&mx(n)&&u&&n.select()}}var bm=vx();function vx(){let n=[];return{add(u){const s=n[0];u!==s&&(s==null||s.pause()),n=xm(n,u),n.unshift(u)},remove(u){var s;n=xm(n,u),(s=n[0])==null||s.resume()}}}function xm(n,u){const s=[...n],c=s.indexOf(u);return c!==-1&&s.splice(c,1),s}function px(n){return n.filter(u=>u.tagName!=="A")}var gx="Portal",vv=b.forwardRef((n,u)=>{var p;const{container:s,...c}=n,[f,h]=b.useState(!1);hi(()=>h(!0),[]);const g=s||f&&((p=globalThis==null?void 0:globalThis.document)==null?void 0:p.body);return g?Qb.createPortal(o.jsx(sa.div,{...c,ref:u}),g):null});vv.displayName=gx;function yx(n,u){return b.useReducer((s,c)=>u[s][c]??s,n)}var Fr=n=>{const{present:u,children:s}=n,c=bx(u),f=typeof s=="function"?s({present:c.isPresent}):b.Children.only(s),h=Ga(c.ref,xx(f));return typeof s=="function"||c.isPresent?b.cloneElement(f,{ref:h}):null};Fr.displayName="Presence";function bx(n){const[u,s]=b.useState(),c=b.useRef(null),f=b.useRef(n),h=b.useRef("none"),g=n?"mounted":"unmounted",[p,y]=yx(g,{mounted:{UNMOUNT:"unmounted",ANIMATION_OUT:"unmountSuspended"},unmountSuspended:{MOUNT:"mounted",ANIMATION_END:"unmounted"},unmounted:{MOUNT:"mounted"}});return b.useEffect(()=>{const m=Br(c.current);h.current=p==="mounted"?m:"none"},[p]),hi(()=>{const m=c.current,x=f.current;if(x!==n){const S=h.current,N=Br(m);n?y("MOUNT"):N==="none"||(m==null?void 0:m.display)==="none"?y("UNMOUNT"):y(x&&S!==N?"ANIMATION_OUT":"UNMOUNT"),f.current=n}},[n,y]),hi(()=>{if(u){let m;const x=u.ownerDocument.defaultView??window,A=N=>{const T=Br(c.current).includes(N.animationName);if(N.target===u&&T&&(y("ANIMATION_END"),!f.current)){const B=u.style.animationFillMode;u.style.animationFillMode="forwards",m=x.setTimeout(()=>{u.style.animationFillMode==="forwards"&&(u.style.animationFillMode=B)})}},S=N=>{N.target===u&&(h.current=Br(c.current))};return u.addEventListener("animationstart",S),u.addEventListener("animationcancel",A),u.addEventListener("animationend",A),()=>{x.clearTimeout(m),u.removeEventListener("animationstart",S),u.removeEventListener("animationcancel",A),u.removeEventListener("animationend",A)}}else y("ANIMATION_END")},[u,y]),{isPresent:["mounted","unmountSuspended"].includes(p),ref:b.useCallback(m=>{c.current=m?getComputedStyle(m):null,s(m)},[])}}function Br(n){return(n==null?void 0:n.animationName)||"none"}function xx(n){var c,f;let u=(c=Object.getOwnPropertyDescriptor(n.props,"ref"))==null?void 0:c.get,s=u&&"isReactWarning"in u&&u.isReactWarning;return s?n.ref:(u=(f=Object.getOwnPropertyDescriptor(n,"ref"))==null?void 0:f.get,s=u&&"isReactWarning"in u&&u.isReactWarning,s?n.props.ref:n.props.ref||n.ref)}var Ns=0;function Sx(){b.useEffect(()=>{const n=document.querySelectorAll("[data-radix-focus-guard]");return document.body.insertAdjacentElement("afterbegin",n[0]??Sm()),document.body.insertAdjacentElement("beforeend",n[1]??Sm()),Ns++,()=>{Ns===1&&document.querySelectorAll("[data-radix-focus-guard]").forEach(u=>u.remove()),Ns--}},[])}function Sm(){const n=document.createElement("span");return n.setAttribute("data-radix-focus-guard",""),n.tabIndex=0,n.style.outline="none",n.style.opacity="0",n.style.position="fixed",n.style.pointerEvents="none",n}var Yt=function(){return Yt=Object.assign||function(u){for(var s,c=1,f=arguments.length;c<f;c++){s=arguments[c];for(var h in s)Object.prototype.hasOwnProperty.call(s,h)&&(u[h]=s[h])}return u},Yt.apply(this,arguments)};function pv(n,u){var s={};for(var c in n)Object.prototype.hasOwnProperty.call(n,c)&&u.indexOf(c)<0&&(s[c]=n[c]);if(n!=null&&typeof Object.getOwnPropertySymbols=="function")for(var f=0,c=Object.getOwnPropertySymbols(n);f<c.length;f++)u.indexOf(c[f])<0&&Object.prototype.propertyIsEnumerable.call(n,c[f])&&(s[c[f]]=n[c[f]]);return s}function Ex(n,u,s){if(s||arguments.length===2)for(var c=0,f=u.length,h;c<f;c++)(h||!(c in u))&&(h||(h=Array.prototype.slice.call(u,0,c)),h[c]=u[c]);return n.concat(h||Array.prototype.slice.call(u))}var Vr="right-scroll-bar-position",Xr="width-before-scroll-bar",_x="with-scroll-bars-hidden",jx="--removed-body-scroll-bar-size";function ws(n,u){return typeof n=="function"?n(u):n&&(n.current=u),n}function Nx(n,u){var s=b.useState(function(){return{value:n,callback:u,facade:{get current(){return s.value},set current(c){var f=s.value;f!==c&&(s.value=c,s.callback(c,f))}}}})[0];return s.callback=u,s.facade}var wx=typeof window<"u"?b.useLayoutEffect:b.useEffect,Em=new WeakMap;function Ax(n,u){var s=Nx(null,function(c){return n.forEach(function(f){return ws(f,c)})});return wx(function(){var c=Em.get(s);if(c){var f=new Set(c),h=new Set(n),g=s.current;f.forEach(function(p){h.has(p)||ws(p,null)}),h.forEach(function(p){f.has(p)||ws(p,g)})}Em.set(s,n)},[n]),s}function Tx(n){return n}function Rx(n,u){u===void 0&&(u=Tx);var s=[],c=!1,f={read:function(){if(c)throw new Error("Sidecar: could not `read` from an `assigned` medium. `read` could be used only with `useMedium`.");return s.length?s[s.length-1]:n},useMedium:function(h){var g=u(h,c);return s.push(g),function(){s=s.filter(function(p){return p!==g})}},assignSyncMedium:function(h){for(c=!0;s.length;){var g=s;s=[],g.forEach(h)}s={push:function(p){return h(p)},filter:function(){return s}}},assignMedium:function(h){c=!0;var g=[];if(s.length){var p=s;s=[],p.forEach(h),g=s}var y=function(){var x=g;g=[],x.forEach(h)},m=function(){return Promise.resolve().then(y)};m(),s={push:function(x){g.push(x),m()},filter:function(x){return g=g.filter(x),s}}}};return f}function Cx(n){n===void 0&&(n={});var u=Rx(null);return u.options=Yt({async:!0,ssr:!1},n),u}var gv=function(n){var u=n.sideCar,s=pv(n,["sideCar"]);if(!u)throw new Error("Sidecar: please provide `sideCar` property to import the right car");var c=u.read();if(!c)throw new Error("Sidecar medium not found");return b.createElement(c,Yt({},s))};gv.isSideCarExport=!0;function Dx(n,u){return n.useMedium(u),gv}var yv=Cx(),As=function(){},Wr=b.forwardRef(function(n,u){var s=b.useRef(null),c=b.useState({onScrollCapture:As,onWheelCapture:As,onTouchMoveCapture:As}),f=c[0],h=c[1],g=n.forwardProps,p=n.children,y=n.className,m=n.removeScrollBar,x=n.enabled,A=n.shards,S=n.sideCar,N=n.noIsolation,C=n.inert,T=n.allowPinchZoom,B=n.as,z=B===void 0?"div":B,H=n.gapMode,V=pv(n,["forwardProps","children","className","removeScrollBar","enabled","shards","sideCar","noIsolation","inert","allowPinchZoom","as","gapMode"]),$=S,Z=Ax([s,u]),ce=Yt(Yt({},V),f);return b.createElement(b.Fragment,null,x&&b.createElement($,{sideCar:yv,removeScrollBar:m,shards:A,noIsolation:N,inert:C,setCallbacks:h,allowPinchZoom:!!T,lockRef:s,gapMode:H}),g?b.cloneElement(b.Children.only(p),Yt(Yt({},ce),{ref:Z})):b.createElement(z,Yt({},ce,{className:y,ref:Z}),p))});Wr.defaultProps={enabled:!0,removeScrollBar:!0,inert:!1};Wr.classNames={fullWidth:Xr,zeroRight:Vr};var Mx=function(){if(typeof __webpack_nonce__<"u")return __webpack_nonce__};function Ox(){if(!document)return null;var n=document.createElement("style");n.type="text/css";var u=Mx();return u&&n.setAttribute("nonce",u),n}function zx(n,u){n.styleSheet?n.styleSheet.cssText=u:n.appendChild(document.createTextNode(u))}function Ux(n){var u=document.head||document.getElementsByTagName("head")[0];u.appendChild(n)}var Bx=function(){var n=0,u=null;return{add:function(s){n==0&&(u=Ox())&&(zx(u,s),Ux(u)),n++},remove:function(){n--,!n&&u&&(u.parentNode&&u.parentNode.removeChild(u),u=null)}}},Lx=function(){var n=Bx();return function(u,s){b.useEffect(function(){return n.add(u),function(){n.remove()}},[u&&s])}},bv=function(){var n=Lx(),u=function(s){var c=s.styles,f=s.dynamic;return n(c,f),null};return u},kx={left:0,top:0,right:0,gap:0},Ts=function(n){return parseInt(n||"",10)||0},Hx=function(n){var u=window.getComputedStyle(document.body),s=u[n==="padding"?"paddingLeft":"marginLeft"],c=u[n==="padding"?"paddingTop":"marginTop"],f=u[n==="padding"?"paddingRight":"marginRight"];return[Ts(s),Ts(c),Ts(f)]},qx=function(n){if(n===void 0&&(n="margin"),typeof window>"u")return kx;var u=Hx(n),s=document.documentElement.clientWidth,c=window.innerWidth;return{left:u[0],top:u[1],right:u[2],gap:Math.max(0,c-s+u[2]-u[0])}},Gx=bv(),tn="data-scroll-locked",Yx=function(n,u,s,c){var f=n.left,h=n.top,g=n.right,p=n.gap;return s===void 0&&(s="margin"),`
-  .`.concat(_x,` {
-   overflow: hidden `).concat(c,`;
-   padding-right: `).concat(p,"px ").concat(c,`;
-  }
-  body[`).concat(tn,`] {
-    overflow: hidden `).concat(c,`;
-    overscroll-behavior: contain;
-    `).concat([u&&"position: relative ".concat(c,";"),s==="margin"&&`
-    padding-left: `.concat(f,`px;
-    padding-top: `).concat(h,`px;
-    padding-right: `).concat(g,`px;
-    margin-left:0;
-    margin-top:0;
-    margin-right: `).concat(p,"px ").concat(c,`;
-    `),s==="padding"&&"padding-right: ".concat(p,"px ").concat(c,";")].filter(Boolean).join(""),`
-  }
-  
-  .`).concat(Vr,` {
-    right: `).concat(p,"px ").concat(c,`;
-  }
-  
-  .`).concat(Xr,` {
-    margin-right: `).concat(p,"px ").concat(c,`;
-  }
-  
-  .`).concat(Vr," .").concat(Vr,` {
-    right: 0 `).concat(c,`;
-  }
-  
-  .`).concat(Xr," .").concat(Xr,` {
-    margin-right: 0 `).concat(c,`;
-  }
-  
-  body[`).concat(tn,`] {
-    `).concat(jx,": ").concat(p,`px;
-  }
-`)},_m=function(){var n=parseInt(document.body.getAttribute(tn)||"0",10);return isFinite(n)?n:0},Vx=function(){b.useEffect(function(){return document.body.setAttribute(tn,(_m()+1).toString()),function(){var n=_m()-1;n<=0?document.body.removeAttribute(tn):document.body.setAttribute(tn,n.toString())}},[])},Xx=function(n){var u=n.noRelative,s=n.noImportant,c=n.gapMode,f=c===void 0?"margin":c;Vx();var h=b.useMemo(function(){return qx(f)},[f]);return b.createElement(Gx,{styles:Yx(h,!u,f,s?"":"!important")})},Bs=!1;if(typeof window<"u")try{var Lr=Object.defineProperty({},"passive",{get:function(){return Bs=!0,!0}});window.addEventListener("test",Lr,Lr),window.removeEventListener("test",Lr,Lr)}catch{Bs=!1}var Pl=Bs?{passive:!1}:!1,Qx=function(n){return n.tagName==="TEXTAREA"},xv=function(n,u){if(!(n instanceof Element))return!1;var s=window.getComputedStyle(n);return s[u]!=="hidden"&&!(s.overflowY===s.overflowX&&!Qx(n)&&s[u]==="visible")},Zx=function(n){return xv(n,"overflowY")},Kx=function(n){return xv(n,"overflowX")},jm=function(n,u){var s=u.ownerDocument,c=u;do{typeof ShadowRoot<"u"&&c instanceof ShadowRoot&&(c=c.host);var f=Sv(n,c);if(f){var h=Ev(n,c),g=h[1],p=h[2];if(g>p)return!0}c=c.parentNode}while(c&&c!==s.body);return!1},Jx=function(n){var u=n.scrollTop,s=n.scrollHeight,c=n.clientHeight;return[u,s,c]},$x=function(n){var u=n.scrollLeft,s=n.scrollWidth,c=n.clientWidth;return[u,s,c]},Sv=function(n,u){return n==="v"?Zx(u):Kx(u)},Ev=function(n,u){return n==="v"?Jx(u):$x(u)},Fx=function(n,u){return n==="h"&&u==="rtl"?-1:1},Wx=function(n,u,s,c,f){var h=Fx(n,window.getComputedStyle(u).direction),g=h*c,p=s.target,y=u.contains(p),m=!1,x=g>0,A=0,S=0;do{var N=Ev(n,p),C=N[0],T=N[1],B=N[2],z=T-B-h*C;(C||z)&&Sv(n,p)&&(A+=z,S+=C),p instanceof ShadowRoot?p=p.host:p=p.parentNode}while(!y&&p!==document.body||y&&(u.contains(p)||u===p));return(x&&Math.abs(A)<1||!x&&Math.abs(S)<1)&&(m=!0),m},kr=function(n){return"changedTouches"in n?[n.changedTouches[0].clientX,n.changedTouches[0].clientY]:[0,0]},Nm=function(n){return[n.deltaX,n.deltaY]},wm=function(n){return n&&"current"in n?n.current:n},Px=function(n,u){return n[0]===u[0]&&n[1]===u[1]},Ix=function(n){return`
-  .block-interactivity-`.concat(n,` {pointer-events: none;}
-  .allow-interactivity-`).concat(n,` {pointer-events: all;}
-`)},e1=0,Il=[];function t1(n){var u=b.useRef([]),s=b.useRef([0,0]),c=b.useRef(),f=b.useState(e1++)[0],h=b.useState(bv)[0],g=b.useRef(n);b.useEffect(function(){g.current=n},[n]),b.useEffect(function(){if(n.inert){document.body.classList.add("block-interactivity-".concat(f));var T=Ex([n.lockRef.current],(n.shards||[]).map(wm),!0).filter(Boolean);return T.forEach(function(B){return B.classList.add("allow-interactivity-".concat(f))}),function(){document.body.classList.remove("block-interactivity-".concat(f)),T.forEach(function(B){return B.classList.remove("allow-interactivity-".concat(f))})}}},[n.inert,n.lockRef.current,n.shards]);var p=b.useCallback(function(T,B){if("touches"in T&&T.touches.length===2||T.type==="wheel"&&T.ctrlKey)return!g.current.allowPinchZoom;var z=kr(T),H=s.current,V="deltaX"in T?T.deltaX:H[0]-z[0],$="deltaY"in T?T.deltaY:H[1]-z[1],Z,ce=T.target,te=Math.abs(V)>Math.abs($)?"h":"v";if("touches"in T&&te==="h"&&ce.type==="range")return!1;var J=jm(te,ce);if(!J)return!0;if(J?Z=te:(Z=te==="v"?"h":"v",J=jm(te,ce)),!J)return!1;if(!c.current&&"changedTouches"in T&&(V||$)&&(c.current=Z),!Z)return!0;var Q=c.current||Z;return Wx(Q,B,T,Q==="h"?V:$)},[]),y=b.useCallback(function(T){var B=T;if(!(!Il.length||Il[Il.length-1]!==h)){var z="deltaY"in B?Nm(B):kr(B),H=u.current.filter(function(Z){return Z.name===B.type&&(Z.target===B.target||B.target===Z.shadowParent)&&Px(Z.delta,z)})[0];if(H&&H.should){B.cancelable&&B.preventDefault();return}if(!H){var V=(g.current.shards||[]).map(wm).filter(Boolean).filter(function(Z){return Z.contains(B.target)}),$=V.length>0?p(B,V[0]):!g.current.noIsolation;$&&B.cancelable&&B.preventDefault()}}},[]),m=b.useCallback(function(T,B,z,H){var V={name:T,delta:B,target:z,should:H,shadowParent:a1(z)};u.current.push(V),setTimeout(function(){u.current=u.current.filter(function($){return $!==V})},1)},[]),x=b.useCallback(function(T){s.current=kr(T),c.current=void 0},[]),A=b.useCallback(function(T){m(T.type,Nm(T),T.target,p(T,n.lockRef.current))},[]),S=b.useCallback(function(T){m(T.type,kr(T),T.target,p(T,n.lockRef.current))},[]);b.useEffect(function(){return Il.push(h),n.setCallbacks({onScrollCapture:A,onWheelCapture:A,onTouchMoveCapture:S}),document.addEventListener("wheel",y,Pl),document.addEventListener("touchmove",y,Pl),document.addEventListener("touchstart",x,Pl),function(){Il=Il.filter(function(T){return T!==h}),document.removeEventListener("wheel",y,Pl),document.removeEventListener("touchmove",y,Pl),document.removeEventListener("touchstart",x,Pl)}},[]);var N=n.removeScrollBar,C=n.inert;return b.createElement(b.Fragment,null,C?b.createElement(h,{styles:Ix(f)}):null,N?b.createElement(Xx,{gapMode:n.gapMode}):null)}function a1(n){for(var u=null;n!==null;)n instanceof ShadowRoot&&(u=n.host,n=n.host),n=n.parentNode;return u}const l1=Dx(yv,t1);var _v=b.forwardRef(function(n,u){return b.createElement(Wr,Yt({},n,{ref:u,sideCar:l1}))});_v.classNames=Wr.classNames;var n1=function(n){if(typeof document>"u")return null;var u=Array.isArray(n)?n[0]:n;return u.ownerDocument.body},en=new WeakMap,Hr=new WeakMap,qr={},Rs=0,jv=function(n){return n&&(n.host||jv(n.parentNode))},i1=function(n,u){return u.map(function(s){if(n.contains(s))return s;var c=jv(s);return c&&n.contains(c)?c:(console.error("aria-hidden",s,"in not contained inside",n,". Doing nothing"),null)}).filter(function(s){return!!s})},r1=function(n,u,s,c){var f=i1(u,Array.isArray(n)?n:[n]);qr[s]||(qr[s]=new WeakMap);var h=qr[s],g=[],p=new Set,y=new Set(f),m=function(A){!A||p.has(A)||(p.add(A),m(A.parentNode))};f.forEach(m);var x=function(A){!A||y.has(A)||Array.prototype.forEach.call(A.children,function(S){if(p.has(S))x(S);else try{var N=S.getAttribute(c),C=N!==null&&N!=="false",T=(en.get(S)||0)+1,B=(h.get(S)||0)+1;en.set(S,T),h.set(S,B),g.push(S),T===1&&C&&Hr.set(S,!0),B===1&&S.setAttribute(s,"true"),C||S.setAttribute(c,"true")}catch(z){console.error("aria-hidden: cannot operate on ",S,z)}})};return x(u),p.clear(),Rs++,function(){g.forEach(function(A){var S=en.get(A)-1,N=h.get(A)-1;en.set(A,S),h.set(A,N),S||(Hr.has(A)||A.removeAttribute(c),Hr.delete(A)),N||A.removeAttribute(s)}),Rs--,Rs||(en=new WeakMap,en=new WeakMap,Hr=new WeakMap,qr={})}},u1=function(n,u,s){s===void 0&&(s="data-aria-hidden");var c=Array.from(Array.isArray(n)?n:[n]),f=n1(n);return f?(c.push.apply(c,Array.from(f.querySelectorAll("[aria-live]"))),r1(c,f,s,"aria-hidden")):function(){return null}},Pr="Dialog",[Nv,tS]=Z0(Pr),[c1,zt]=Nv(Pr),wv=n=>{const{__scopeDialog:u,children:s,open:c,defaultOpen:f,onOpenChange:h,modal:g=!0}=n,p=b.useRef(null),y=b.useRef(null),[m,x]=W0({prop:c,defaultProp:f??!1,onChange:h,caller:Pr});return o.jsx(c1,{scope:u,triggerRef:p,contentRef:y,contentId:Es(),titleId:Es(),descriptionId:Es(),open:m,onOpenChange:x,onOpenToggle:b.useCallback(()=>x(A=>!A),[x]),modal:g,children:s})};wv.displayName=Pr;var Av="DialogTrigger",s1=b.forwardRef((n,u)=>{const{__scopeDialog:s,...c}=n,f=zt(Av,s),h=Ga(u,f.triggerRef);return o.jsx(sa.button,{type:"button","aria-haspopup":"dialog","aria-expanded":f.open,"aria-controls":f.contentId,"data-state":$s(f.open),...c,ref:h,onClick:qa(n.onClick,f.onOpenToggle)})});s1.displayName=Av;var Ks="DialogPortal",[o1,Tv]=Nv(Ks,{forceMount:void 0}),Rv=n=>{const{__scopeDialog:u,forceMount:s,children:c,container:f}=n,h=zt(Ks,u);return o.jsx(o1,{scope:u,forceMount:s,children:b.Children.map(c,g=>o.jsx(Fr,{present:s||h.open,children:o.jsx(vv,{asChild:!0,container:f,children:g})}))})};Rv.displayName=Ks;var Kr="DialogOverlay",Cv=b.forwardRef((n,u)=>{const s=Tv(Kr,n.__scopeDialog),{forceMount:c=s.forceMount,...f}=n,h=zt(Kr,n.__scopeDialog);return h.modal?o.jsx(Fr,{present:c||h.open,children:o.jsx(d1,{...f,ref:u})}):null});Cv.displayName=Kr;var f1=Qs("DialogOverlay.RemoveScroll"),d1=b.forwardRef((n,u)=>{const{__scopeDialog:s,...c}=n,f=zt(Kr,s);return o.jsx(_v,{as:f1,allowPinchZoom:!0,shards:[f.contentRef],children:o.jsx(sa.div,{"data-state":$s(f.open),...c,ref:u,style:{pointerEvents:"auto",...c.style}})})}),fl="DialogContent",Dv=b.forwardRef((n,u)=>{const s=Tv(fl,n.__scopeDialog),{forceMount:c=s.forceMount,...f}=n,h=zt(fl,n.__scopeDialog);return o.jsx(Fr,{present:c||h.open,children:h.modal?o.jsx(h1,{...f,ref:u}):o.jsx(m1,{...f,ref:u})})});Dv.displayName=fl;var h1=b.forwardRef((n,u)=>{const s=zt(fl,n.__scopeDialog),c=b.useRef(null),f=Ga(u,s.contentRef,c);return b.useEffect(()=>{const h=c.current;if(h)return u1(h)},[]),o.jsx(Mv,{...n,ref:f,trapFocus:s.open,disableOutsidePointerEvents:!0,onCloseAutoFocus:qa(n.onCloseAutoFocus,h=>{var g;h.preventDefault(),(g=s.triggerRef.current)==null||g.focus()}),onPointerDownOutside:qa(n.onPointerDownOutside,h=>{const g=h.detail.originalEvent,p=g.button===0&&g.ctrlKey===!0;(g.button===2||p)&&h.preventDefault()}),onFocusOutside:qa(n.onFocusOutside,h=>h.preventDefault())})}),m1=b.forwardRef((n,u)=>{const s=zt(fl,n.__scopeDialog),c=b.useRef(!1),f=b.useRef(!1);return o.jsx(Mv,{...n,ref:u,trapFocus:!1,disableOutsidePointerEvents:!1,onCloseAutoFocus:h=>{var g,p;(g=n.onCloseAutoFocus)==null||g.call(n,h),h.defaultPrevented||(c.current||(p=s.triggerRef.current)==null||p.focus(),h.preventDefault()),c.current=!1,f.current=!1},onInteractOutside:h=>{var y,m;(y=n.onInteractOutside)==null||y.call(n,h),h.defaultPrevented||(c.current=!0,h.detail.originalEvent.type==="pointerdown"&&(f.current=!0));const g=h.target;((m=s.triggerRef.current)==null?void 0:m.contains(g))&&h.preventDefault(),h.detail.originalEvent.type==="focusin"&&f.current&&h.preventDefault()}})}),Mv=b.forwardRef((n,u)=>{const{__scopeDialog:s,trapFocus:c,onOpenAutoFocus:f,onCloseAutoFocus:h,...g}=n,p=zt(fl,s),y=b.useRef(null),m=Ga(u,y);return Sx(),o.jsxs(o.Fragment,{children:[o.jsx(hv,{asChild:!0,loop:!0,trapped:c,onMountAutoFocus:f,onUnmountAutoFocus:h,children:o.jsx(fv,{role:"dialog",id:p.contentId,"aria-describedby":p.descriptionId,"aria-labelledby":p.titleId,"data-state":$s(p.open),...g,ref:m,onDismiss:()=>p.onOpenChange(!1)})}),o.jsxs(o.Fragment,{children:[o.jsx(v1,{titleId:p.titleId}),o.jsx(g1,{contentRef:y,descriptionId:p.descriptionId})]})]})}),Js="DialogTitle",Ov=b.forwardRef((n,u)=>{const{__scopeDialog:s,...c}=n,f=zt(Js,s);return o.jsx(sa.h2,{id:f.titleId,...c,ref:u})});Ov.displayName=Js;var zv="DialogDescription",Uv=b.forwardRef((n,u)=>{const{__scopeDialog:s,...c}=n,f=zt(zv,s);return o.jsx(sa.p,{id:f.descriptionId,...c,ref:u})});Uv.displayName=zv;var Bv="DialogClose",Lv=b.forwardRef((n,u)=>{const{__scopeDialog:s,...c}=n,f=zt(Bv,s);return o.jsx(sa.button,{type:"button",...c,ref:u,onClick:qa(n.onClick,()=>f.onOpenChange(!1))})});Lv.displayName=Bv;function $s(n){return n?"open":"closed"}var kv="DialogTitleWarning",[aS,Hv]=Q0(kv,{contentName:fl,titleName:Js,docsSlug:"dialog"}),v1=({titleId:n})=>{const u=Hv(kv),s=`\`${u.contentName}\` requires a \`${u.titleName}\` for the component to be accessible for screen reader users.
-
-If you want to hide the \`${u.titleName}\`, you can wrap it with our VisuallyHidden component.
-
-For more information, see https://radix-ui.com/primitives/docs/components/${u.docsSlug}`;return b.useEffect(()=>{n&&(document.getElementById(n)||console.error(s))},[s,n]),null},p1="DialogDescriptionWarning",g1=({contentRef:n,descriptionId:u})=>{const c=`Warning: Missing \`Description\` or \`aria-describedby={undefined}\` for {${Hv(p1).contentName}}.`;return b.useEffect(()=>{var h;const f=(h=n.current)==null?void 0:h.getAttribute("aria-describedby");u&&f&&(document.getElementById(u)||console.warn(c))},[c,n,u]),null},y1=wv,b1=Rv,x1=Cv,S1=Dv,E1=Ov,_1=Uv,j1=Lv;/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const N1=n=>n.replace(/([a-z0-9])([A-Z])/g,"$1-$2").toLowerCase(),w1=n=>n.replace(/^([A-Z])|[\s-_]+(\w)/g,(u,s,c)=>c?c.toUpperCase():s.toLowerCase()),Am=n=>{const u=w1(n);return u.charAt(0).toUpperCase()+u.slice(1)},qv=(...n)=>n.filter((u,s,c)=>!!u&&u.trim()!==""&&c.indexOf(u)===s).join(" ").trim(),A1=n=>{for(const u in n)if(u.startsWith("aria-")||u==="role"||u==="title")return!0};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */var T1={xmlns:"http://www.w3.org/2000/svg",width:24,height:24,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:2,strokeLinecap:"round",strokeLinejoin:"round"};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const R1=b.forwardRef(({color:n="currentColor",size:u=24,strokeWidth:s=2,absoluteStrokeWidth:c,className:f="",children:h,iconNode:g,...p},y)=>b.createElement("svg",{ref:y,...T1,width:u,height:u,stroke:n,strokeWidth:c?Number(s)*24/Number(u):s,className:qv("lucide",f),...!h&&!A1(p)&&{"aria-hidden":"true"},...p},[...g.map(([m,x])=>b.createElement(m,x)),...Array.isArray(h)?h:[h]]));/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Ya=(n,u)=>{const s=b.forwardRef(({className:c,...f},h)=>b.createElement(R1,{ref:h,iconNode:u,className:qv(`lucide-${N1(Am(n))}`,`lucide-${n}`,c),...f}));return s.displayName=Am(n),s};/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const C1=[["rect",{width:"16",height:"20",x:"4",y:"2",rx:"2",ry:"2",key:"76otgf"}],["path",{d:"M9 22v-4h6v4",key:"r93iot"}],["path",{d:"M8 6h.01",key:"1dz90k"}],["path",{d:"M16 6h.01",key:"1x0f13"}],["path",{d:"M12 6h.01",key:"1vi96p"}],["path",{d:"M12 10h.01",key:"1nrarc"}],["path",{d:"M12 14h.01",key:"1etili"}],["path",{d:"M16 10h.01",key:"1m94wz"}],["path",{d:"M16 14h.01",key:"1gbofw"}],["path",{d:"M8 10h.01",key:"19clt8"}],["path",{d:"M8 14h.01",key:"6423bh"}]],D1=Ya("building",C1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const M1=[["path",{d:"M8 2v4",key:"1cmpym"}],["path",{d:"M16 2v4",key:"4m81vk"}],["rect",{width:"18",height:"18",x:"3",y:"4",rx:"2",key:"1hopcy"}],["path",{d:"M3 10h18",key:"8toen8"}]],O1=Ya("calendar",M1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const z1=[["path",{d:"M21 15v4a2 2 0 0 1-2 2H5a2 2 0 0 1-2-2v-4",key:"ih7n3h"}],["polyline",{points:"7 10 12 15 17 10",key:"2ggqvy"}],["line",{x1:"12",x2:"12",y1:"15",y2:"3",key:"1vk2je"}]],Tm=Ya("download",z1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const U1=[["path",{d:"M2.062 12.348a1 1 0 0 1 0-.696 10.75 10.75 0 0 1 19.876 0 1 1 0 0 1 0 .696 10.75 10.75 0 0 1-19.876 0",key:"1nclc0"}],["circle",{cx:"12",cy:"12",r:"3",key:"1v7zrd"}]],B1=Ya("eye",U1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const L1=[["path",{d:"M15 2H6a2 2 0 0 0-2 2v16a2 2 0 0 0 2 2h12a2 2 0 0 0 2-2V7Z",key:"1rqfz7"}],["path",{d:"M14 2v4a2 2 0 0 0 2 2h4",key:"tnqrlb"}],["path",{d:"M10 9H8",key:"b1mrlr"}],["path",{d:"M16 13H8",key:"t4e002"}],["path",{d:"M16 17H8",key:"z1uh3a"}]],Rm=Ya("file-text",L1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const k1=[["path",{d:"M3 6h18",key:"d0wm0j"}],["path",{d:"M19 6v14c0 1-1 2-2 2H7c-1 0-2-1-2-2V6",key:"4alrt4"}],["path",{d:"M8 6V4c0-1 1-2 2-2h4c1 0 2 1 2 2v2",key:"v07s0e"}],["line",{x1:"10",x2:"10",y1:"11",y2:"17",key:"1uufr5"}],["line",{x1:"14",x2:"14",y1:"11",y2:"17",key:"xtxkd"}]],H1=Ya("trash-2",k1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const q1=[["path",{d:"M19 21v-2a4 4 0 0 0-4-4H9a4 4 0 0 0-4 4v2",key:"975kel"}],["circle",{cx:"12",cy:"7",r:"4",key:"17ys0d"}]],G1=Ya("user",q1);/**
- * @license lucide-react v0.510.0 - ISC
- *
- * This source code is licensed under the ISC license.
- * See the LICENSE file in the root directory of this source tree.
- */const Y1=[["path",{d:"M18 6 6 18",key:"1bl5f8"}],["path",{d:"m6 6 12 12",key:"d8bk6v"}]],V1=Ya("x",Y1);function X1({...n}){return o.jsx(y1,{"data-slot":"dialog",...n})}function Q1({...n}){return o.jsx(b1,{"data-slot":"dialog-portal",...n})}function Z1({className:n,...u}){return o.jsx(x1,{"data-slot":"dialog-overlay",className:Je("data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 fixed inset-0 z-50 bg-black/50",n),...u})}function K1({className:n,children:u,...s}){return o.jsxs(Q1,{"data-slot":"dialog-portal",children:[o.jsx(Z1,{}),o.jsxs(S1,{"data-slot":"dialog-content",className:Je("bg-background data-[state=open]:animate-in data-[state=closed]:animate-out data-[state=closed]:fade-out-0 data-[state=open]:fade-in-0 data-[state=closed]:zoom-out-95 data-[state=open]:zoom-in-95 fixed top-[50%] left-[50%] z-50 grid w-full max-w-[calc(100%-2rem)] translate-x-[-50%] translate-y-[-50%] gap-4 rounded-lg border p-6 shadow-lg duration-200 sm:max-w-lg",n),...s,children:[u,o.jsxs(j1,{className:"ring-offset-background focus:ring-ring data-[state=open]:bg-accent data-[state=open]:text-muted-foreground absolute top-4 right-4 rounded-xs opacity-70 transition-opacity hover:opacity-100 focus:ring-2 focus:ring-offset-2 focus:outline-hidden disabled:pointer-events-none [&_svg]:pointer-events-none [&_svg]:shrink-0 [&_svg:not([class*='size-'])]:size-4",children:[o.jsx(V1,{}),o.jsx("span",{className:"sr-only",children:"Close"})]})]})]})}function J1({className:n,...u}){return o.jsx("div",{"data-slot":"dialog-header",className:Je("flex flex-col gap-2 text-center sm:text-left",n),...u})}function $1({className:n,...u}){return o.jsx(E1,{"data-slot":"dialog-title",className:Je("text-lg leading-none font-semibold",n),...u})}function F1({className:n,...u}){return o.jsx(_1,{"data-slot":"dialog-description",className:Je("text-muted-foreground text-sm",n),...u})}const W1=({reports:n,customers:u})=>{const[s,c]=b.useState(null),[f,h]=b.useState(!1),g=S=>{const N=u.find(C=>C.id==S);return N?N.company_name:"Unbekannter Kunde"},p=S=>{const N={draft:{label:"Entwurf",variant:"secondary"},completed:{label:"Abgeschlossen",variant:"default"},archived:{label:"Archiviert",variant:"outline"}},C=N[S]||N.draft;return o.jsx(Ur,{variant:C.variant,children:C.label})},y=S=>{c(S),h(!0)},m=S=>{alert(`PDF-Download für Bericht "${S.title}" wird vorbereitet...`)},x=S=>{window.confirm(`Möchten Sie den Bericht "${S.title}" wirklich löschen?`)&&alert("Bericht wurde gelöscht.")},A=S=>new Date(S).toLocaleDateString("de-DE",{year:"numeric",month:"2-digit",day:"2-digit"});return o.jsxs("div",{className:"space-y-6",children:[o.jsx("div",{className:"flex justify-between items-center",children:o.jsxs("div",{children:[o.jsx("h2",{className:"text-3xl font-bold tracking-tight",children:"Prüfberichte"}),o.jsx("p",{className:"text-muted-foreground",children:"Übersicht aller erstellten Prüfberichte"})]})}),o.jsxs(B0,{children:[o.jsxs(L0,{children:[o.jsxs(k0,{children:["Berichte (",n.length,")"]}),o.jsx(H0,{children:"Alle erstellten und gespeicherten Prüfberichte"})]}),o.jsx(q0,{children:n.length===0?o.jsxs("div",{className:"text-center py-8",children:[o.jsx(Rm,{className:"h-12 w-12 text-muted-foreground mx-auto mb-4"}),o.jsx("h3",{className:"text-lg font-semibold mb-2",children:"Keine Berichte vorhanden"}),o.jsx("p",{className:"text-muted-foreground mb-4",children:"Erstellen Sie Ihren ersten Prüfbericht, um zu beginnen."})]}):o.jsxs(G0,{children:[o.jsx(Y0,{children:o.jsxs(mm,{children:[o.jsx(cl,{children:"Titel"}),o.jsx(cl,{children:"Kunde"}),o.jsx(cl,{children:"Audit-Datum"}),o.jsx(cl,{children:"Verfasser"}),o.jsx(cl,{children:"Status"}),o.jsx(cl,{children:"Erstellt"}),o.jsx(cl,{className:"text-right",children:"Aktionen"})]})}),o.jsx(V0,{children:n.map(S=>o.jsxs(mm,{children:[o.jsx(sl,{className:"font-medium",children:o.jsxs("div",{className:"flex items-center gap-2",children:[o.jsx(Rm,{className:"h-4 w-4 text-muted-foreground"}),S.title]})}),o.jsx(sl,{children:o.jsxs("div",{className:"flex items-center gap-2",children:[o.jsx(D1,{className:"h-4 w-4 text-muted-foreground"}),g(S.customer_id)]})}),o.jsx(sl,{children:o.jsxs("div",{className:"flex items-center gap-2",children:[o.jsx(O1,{className:"h-4 w-4 text-muted-foreground"}),A(S.audit_date)]})}),o.jsx(sl,{children:o.jsxs("div",{className:"flex items-center gap-2",children:[o.jsx(G1,{className:"h-4 w-4 text-muted-foreground"}),S.author]})}),o.jsx(sl,{children:p(S.status)}),o.jsx(sl,{children:A(S.created_at)}),o.jsx(sl,{className:"text-right",children:o.jsxs("div",{className:"flex items-center justify-end gap-2",children:[o.jsx(oi,{variant:"outline",size:"sm",onClick:()=>y(S),children:o.jsx(B1,{className:"h-4 w-4"})}),o.jsx(oi,{variant:"outline",size:"sm",onClick:()=>m(S),children:o.jsx(Tm,{className:"h-4 w-4"})}),o.jsx(oi,{variant:"outline",size:"sm",onClick:()=>x(S),className:"text-destructive hover:text-destructive",children:o.jsx(H1,{className:"h-4 w-4"})})]})})]},S.id))})]})})]}),o.jsx(X1,{open:f,onOpenChange:h,children:o.jsxs(K1,{className:"max-w-4xl max-h-[80vh] overflow-y-auto",children:[o.jsxs(J1,{children:[o.jsx($1,{children:"Berichtsvorschau"}),o.jsx(F1,{children:"Vorschau des Prüfberichts"})]}),s&&o.jsxs("div",{className:"space-y-6",children:[o.jsxs("div",{className:"border-b pb-4",children:[o.jsx("h1",{className:"text-2xl font-bold mb-2",children:s.title}),o.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[o.jsxs("div",{children:[o.jsx("strong",{children:"Kunde:"})," ",g(s.customer_id)]}),o.jsxs("div",{children:[o.jsx("strong",{children:"Audit-Datum:"})," ",A(s.audit_date)]}),o.jsxs("div",{children:[o.jsx("strong",{children:"Verfasser:"})," ",s.author]}),o.jsxs("div",{children:[o.jsx("strong",{children:"Status:"})," ",p(s.status)]})]})]}),o.jsxs("div",{children:[o.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Audit-Informationen"}),o.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[o.jsxs("div",{children:[o.jsx("strong",{children:"Telefon:"})," ",s.author_phone]}),o.jsxs("div",{children:[o.jsx("strong",{children:"E-Mail:"})," ",s.author_email]})]})]}),s.focus_goals&&s.focus_goals.length>0&&o.jsxs("div",{children:[o.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Fokus und Ziele"}),o.jsx("div",{className:"flex flex-wrap gap-2",children:s.focus_goals.map((S,N)=>o.jsx(Ur,{variant:"secondary",children:S},N))})]}),o.jsxs("div",{children:[o.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Wickelanlage"}),o.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[s.machine_manufacturer&&o.jsxs("div",{children:[o.jsx("strong",{children:"Hersteller:"})," ",s.machine_manufacturer]}),s.machine_type&&o.jsxs("div",{children:[o.jsx("strong",{children:"Typ:"})," ",s.machine_type]}),s.machine_model&&o.jsxs("div",{children:[o.jsx("strong",{children:"Modell:"})," ",s.machine_model]}),s.machine_year&&o.jsxs("div",{children:[o.jsx("strong",{children:"Baujahr:"})," ",s.machine_year]}),s.machine_quantity&&o.jsxs("div",{children:[o.jsx("strong",{children:"Anzahl:"})," ",s.machine_quantity]})]}),s.machine_features&&s.machine_features.length>0&&o.jsxs("div",{className:"mt-2",children:[o.jsx("strong",{children:"Besonderheiten:"}),o.jsx("div",{className:"flex flex-wrap gap-2 mt-1",children:s.machine_features.map((S,N)=>o.jsx(Ur,{variant:"outline",children:S},N))})]})]}),s.palette_type&&o.jsxs("div",{children:[o.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Palette"}),o.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[o.jsxs("div",{children:[o.jsx("strong",{children:"Typ:"})," ",s.palette_type]}),s.palette_length&&o.jsxs("div",{children:[o.jsx("strong",{children:"Länge:"})," ",s.palette_length," cm"]}),s.palette_width&&o.jsxs("div",{children:[o.jsx("strong",{children:"Breite:"})," ",s.palette_width," cm"]}),s.palette_weight&&o.jsxs("div",{children:[o.jsx("strong",{children:"Gewicht:"})," ",s.palette_weight," kg"]})]})]}),s.packaging_types&&s.packaging_types.length>0&&o.jsxs("div",{children:[o.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Packgut"}),o.jsx("div",{className:"flex flex-wrap gap-2",children:s.packaging_types.map((S,N)=>o.jsx(Ur,{variant:"secondary",children:S},N))})]}),o.jsxs("div",{children:[o.jsx("h3",{className:"text-lg font-semibold mb-3",children:"Folie"}),o.jsxs("div",{className:"grid grid-cols-2 gap-4 text-sm",children:[s.foil_supplier&&o.jsxs("div",{children:[o.jsx("strong",{children:"Lieferant:"})," ",s.foil_supplier]}),s.foil_manufacturer&&o.jsxs("div",{children:[o.jsx("strong",{children:"Hersteller:"})," ",s.foil_manufacturer]}),s.foil_thickness&&o.jsxs("div",{children:[o.jsx("strong",{children:"Dicke:"})," ",s.foil_thickness," μm"]}),s.foil_height&&o.jsxs("div",{children:[o.jsx("strong",{children:"Höhe:"})," ",s.foil_height," mm"]}),s.foil_work_area&&o.jsxs("div",{children:[o.jsx("strong",{children:"Arbeitsbereich:"})," ",s.foil_work_area," mm"]})]})]}),o.jsxs("div",{className:"flex justify-end space-x-2 pt-4 border-t",children:[o.jsx(oi,{variant:"outline",onClick:()=>h(!1),children:"Schließen"}),o.jsxs(oi,{onClick:()=>m(s),children:[o.jsx(Tm,{className:"h-4 w-4 mr-2"}),"PDF herunterladen"]})]})]})]})})]})},P1=({user:n,onUpdateUser:u})=>{var T,B;const[s,c]=b.useState(!1),[f,h]=b.useState(!1),[g,p]=b.useState(""),[y,m]=b.useState(""),[x,A]=b.useState({first_name:(n==null?void 0:n.first_name)||"",last_name:(n==null?void 0:n.last_name)||"",email:(n==null?void 0:n.email)||"",phone:(n==null?void 0:n.phone)||""}),S=z=>{const{name:H,value:V}=z.target;A($=>({...$,[H]:V}))},N=async z=>{z.preventDefault();try{h(!0),p(""),m("Profil erfolgreich aktualisiert!"),c(!1),setTimeout(()=>{m("")},3e3)}catch(H){p("Fehler beim Aktualisieren des Profils"),console.error("Update profile error:",H)}finally{h(!1)}},C=()=>{A({first_name:(n==null?void 0:n.first_name)||"",last_name:(n==null?void 0:n.last_name)||"",email:(n==null?void 0:n.email)||"",phone:(n==null?void 0:n.phone)||""}),c(!1),p("")};return f?o.jsx(gi,{message:"Profil wird aktualisiert..."}):o.jsxs("div",{className:"user-profile",children:[o.jsxs("div",{className:"profile-header",children:[o.jsx("h1",{children:"Benutzerprofil"}),o.jsx("p",{children:"Verwalten Sie Ihre persönlichen Informationen"})]}),g&&o.jsxs("div",{className:"error-message",children:[o.jsx("span",{className:"error-icon",children:"⚠️"}),g,o.jsx("button",{onClick:()=>p(""),className:"error-close",children:"✕"})]}),y&&o.jsxs("div",{className:"success-message",children:[o.jsx("span",{className:"success-icon",children:"✅"}),y]}),o.jsxs("div",{className:"profile-card",children:[o.jsxs("div",{className:"profile-avatar",children:[o.jsxs("div",{className:"avatar-circle",children:[(T=n==null?void 0:n.first_name)==null?void 0:T[0],(B=n==null?void 0:n.last_name)==null?void 0:B[0]]}),o.jsxs("div",{className:"user-info",children:[o.jsxs("h2",{children:[n==null?void 0:n.first_name," ",n==null?void 0:n.last_name]}),o.jsx("p",{className:"user-role",children:n==null?void 0:n.role}),o.jsxs("p",{className:"user-username",children:["@",n==null?void 0:n.username]})]})]}),s?o.jsxs("form",{onSubmit:N,className:"profile-form",children:[o.jsxs("div",{className:"form-row",children:[o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"first_name",children:"Vorname"}),o.jsx("input",{type:"text",id:"first_name",name:"first_name",value:x.first_name,onChange:S,required:!0})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"last_name",children:"Nachname"}),o.jsx("input",{type:"text",id:"last_name",name:"last_name",value:x.last_name,onChange:S,required:!0})]})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"email",children:"E-Mail"}),o.jsx("input",{type:"email",id:"email",name:"email",value:x.email,onChange:S,required:!0})]}),o.jsxs("div",{className:"form-group",children:[o.jsx("label",{htmlFor:"phone",children:"Telefon"}),o.jsx("input",{type:"tel",id:"phone",name:"phone",value:x.phone,onChange:S})]}),o.jsxs("div",{className:"form-actions",children:[o.jsx("button",{type:"button",onClick:C,className:"btn-secondary",children:"Abbrechen"}),o.jsx("button",{type:"submit",className:"btn-primary",children:"Speichern"})]})]}):o.jsxs("div",{className:"profile-details",children:[o.jsxs("div",{className:"detail-row",children:[o.jsx("span",{className:"detail-label",children:"📧 E-Mail:"}),o.jsx("span",{className:"detail-value",children:n==null?void 0:n.email})]}),o.jsxs("div",{className:"detail-row",children:[o.jsx("span",{className:"detail-label",children:"📞 Telefon:"}),o.jsx("span",{className:"detail-value",children:(n==null?void 0:n.phone)||"Nicht angegeben"})]}),o.jsxs("div",{className:"detail-row",children:[o.jsx("span",{className:"detail-label",children:"👤 Rolle:"}),o.jsx("span",{className:"detail-value",children:n==null?void 0:n.role})]}),o.jsxs("div",{className:"detail-row",children:[o.jsx("span",{className:"detail-label",children:"📅 Erstellt:"}),o.jsx("span",{className:"detail-value",children:n!=null&&n.created_at?new Date(n.created_at).toLocaleDateString("de-DE"):"Unbekannt"})]}),o.jsx("button",{onClick:()=>c(!0),className:"btn-primary",children:"✏️ Profil bearbeiten"})]})]})]})},I1=({user:n,onLogout:u,isMobile:s})=>{var A,S;const[c,f]=b.useState(!1),h=ca(),g=()=>{f(!c)},p=()=>{f(!1)},y=()=>{p(),u()},m=N=>h.pathname===N,x=[{path:"/dashboard",label:"Dashboard",icon:"📊"},{path:"/customers",label:"Kunden",icon:"👥"},{path:"/reports/new",label:"Neuer Bericht",icon:"➕"},{path:"/reports",label:"Berichte",icon:"📋"}];return o.jsx("nav",{className:`navigation ${s?"mobile":"desktop"}`,children:o.jsxs("div",{className:"nav-container",children:[o.jsx("div",{className:"nav-brand",children:o.jsxs(Dt,{to:"/dashboard",className:"brand-link",onClick:p,children:[o.jsx("div",{className:"brand-icon",children:"📋"}),o.jsx("span",{className:"brand-text",children:"HARAL"})]})}),s&&o.jsxs("button",{className:`menu-toggle ${c?"active":""}`,onClick:g,"aria-label":"Toggle menu",children:[o.jsx("span",{}),o.jsx("span",{}),o.jsx("span",{})]}),o.jsxs("div",{className:`nav-menu ${s&&c?"open":""}`,children:[o.jsx("div",{className:"nav-items",children:x.map(N=>o.jsxs(Dt,{to:N.path,className:`nav-item ${m(N.path)?"active":""}`,onClick:p,children:[o.jsx("span",{className:"nav-icon",children:N.icon}),o.jsx("span",{className:"nav-label",children:N.label})]},N.path))}),o.jsxs("div",{className:"user-menu",children:[o.jsxs("div",{className:"user-info",children:[o.jsxs("div",{className:"user-avatar",children:[(A=n.first_name)==null?void 0:A[0],(S=n.last_name)==null?void 0:S[0]]}),o.jsxs("div",{className:"user-details",children:[o.jsx("div",{className:"user-name",children:n.full_name}),o.jsx("div",{className:"user-role",children:n.role})]})]}),o.jsxs("div",{className:"user-actions",children:[o.jsxs(Dt,{to:"/profile",className:"user-action",onClick:p,children:[o.jsx("span",{className:"action-icon",children:"👤"}),o.jsx("span",{className:"action-label",children:"Profil"})]}),o.jsxs("button",{className:"user-action logout",onClick:y,children:[o.jsx("span",{className:"action-icon",children:"🚪"}),o.jsx("span",{className:"action-label",children:"Abmelden"})]})]})]})]}),s&&c&&o.jsx("div",{className:"menu-overlay",onClick:p})]})})};function eS(){const[n,u]=b.useState(null),[s,c]=b.useState(!0),[f,h]=b.useState(window.innerWidth<=768);b.useEffect(()=>{g();const m=()=>{h(window.innerWidth<=768)};return window.addEventListener("resize",m),()=>window.removeEventListener("resize",m)},[]);const g=async()=>{try{const m=await Zr.getCurrentUser();m.user&&u(m.user)}catch{console.log("Not authenticated")}finally{c(!1)}},p=m=>{u(m)},y=async()=>{try{await Zr.logout(),u(null)}catch(m){console.error("Logout error:",m),u(null)}};return s?o.jsx(gi,{}):n?o.jsx(Ub,{children:o.jsxs("div",{className:`app ${f?"mobile":"desktop"}`,children:[o.jsx(I1,{user:n,onLogout:y,isMobile:f}),o.jsx("main",{className:"main-content",children:o.jsxs(fb,{children:[o.jsx(ka,{path:"/",element:o.jsx(rm,{user:n})}),o.jsx(ka,{path:"/dashboard",element:o.jsx(rm,{user:n})}),o.jsx(ka,{path:"/customers",element:o.jsx(Kb,{})}),o.jsx(ka,{path:"/reports/new",element:o.jsx(Jb,{user:n})}),o.jsx(ka,{path:"/reports",element:o.jsx(W1,{})}),o.jsx(ka,{path:"/profile",element:o.jsx(P1,{user:n,setUser:u})}),o.jsx(ka,{path:"*",element:o.jsx(sb,{to:"/",replace:!0})})]})})]})}):o.jsx(Zb,{onLogin:p})}by.createRoot(document.getElementById("root")).render(o.jsx(b.StrictMode,{children:o.jsx(eS,{})}));
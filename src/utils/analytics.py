@@ -0,0 +1,164 @@
+"""Flottenweite Auswertungen über alle Berichte (spaltenweise mit NumPy)
+
+Die numerischen Spalten werden mit einer einzigen Abfrage als Spalten-Arrays
+geladen; Abweichungen, Verbrauch, Kosten und CO2 werden vektorisiert mit den
+Formeln aus ``src.utils.calculations`` berechnet.
+"""
+import numpy as np
+from sqlalchemy import select
+from src import db
+from src.models.report import Report
+from src.models.customer import Customer
+from src.models.calculation_factors import current_factors
+from src.utils import calculations
+
+NUMERIC_COLUMNS = (
+    'film_consumption_per_pallet', 'pallets_per_year', 'roll_core_weight', 'film_thickness',
+) + tuple(
+    f'holding_force_{side}_{kind}'
+    for side in calculations.HOLDING_FORCE_SIDES
+    for kind in ('target', 'actual')
+)
+
+class ReportColumns:
+    """Spalten-Arrays einer Berichtsmenge; fehlende Werte sind NaN"""
+
+    def __init__(self, ids, customer_ids, numeric):
+        self.ids = ids
+        self.customer_ids = customer_ids
+        self.numeric = numeric
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, column):
+        return self.numeric[column]
+
+def report_filters(status=None, customer_id=None):
+    criteria = []
+    if status:
+        criteria.append(Report.status == status)
+    if customer_id:
+        criteria.append(Report.customer_id == customer_id)
+    return criteria
+
+def load_report_columns(*criteria, columns=NUMERIC_COLUMNS):
+    """Lädt id, customer_id und die numerischen Spalten aller (gefilterten) Berichte"""
+    stmt = select(Report.id, Report.customer_id, *[getattr(Report, column) for column in columns])
+    if criteria:
+        stmt = stmt.where(*criteria)
+    rows = db.session.execute(stmt).all()
+
+    if not rows:
+        empty = np.empty(0, dtype=float)
+        return ReportColumns(np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64),
+                             {column: empty for column in columns})
+
+    transposed = list(zip(*rows))
+    numeric = {
+        column: np.array(values, dtype=float)  # None -> NaN
+        for column, values in zip(columns, transposed[2:])
+    }
+    return ReportColumns(
+        np.array(transposed[0], dtype=np.int64),
+        np.array(transposed[1], dtype=np.int64),
+        numeric
+    )
+
+def holding_force_deviations(data):
+    """Abweichungen je Seite in %; NaN wo kein gültiger SOLL-Wert vorliegt"""
+    deviations = {}
+    for side in calculations.HOLDING_FORCE_SIDES:
+        target = data[f'holding_force_{side}_target']
+        actual = np.nan_to_num(data[f'holding_force_{side}_actual'], nan=0.0)
+        valid = target > 0  # NaN ergibt False
+        with np.errstate(divide='ignore', invalid='ignore'):
+            deviations[side] = np.where(valid, calculations.holding_force_deviation(actual, target), np.nan)
+    return deviations
+
+def consumption_and_costs(data, factors=None):
+    """Jahresverbrauch (kg), Kosten (€) und CO2 (kg); NaN wo keine Verbrauchsdaten vorliegen"""
+    factors = factors or current_factors()
+    per_pallet = data['film_consumption_per_pallet']
+    pallets = data['pallets_per_year']
+    valid = (np.nan_to_num(per_pallet) != 0) & (np.nan_to_num(pallets) != 0)
+
+    consumption = np.where(valid, calculations.annual_material_consumption(per_pallet, pallets), np.nan)
+    costs = np.where(valid, calculations.annual_costs(
+        consumption, np.nan_to_num(data['roll_core_weight']), np.nan_to_num(pallets), factors
+    ), np.nan)
+    emissions = np.where(valid, calculations.co2_emissions(consumption, factors), np.nan)
+    return consumption, costs, emissions
+
+def distribution(values, bins=20):
+    """Kennzahlen und Histogramm der endlichen Werte"""
+    values = values[np.isfinite(values)]
+    if values.size == 0:
+        return {'count': 0}
+
+    counts, edges = np.histogram(values, bins=bins)
+    p10, p50, p90 = np.percentile(values, [10, 50, 90])
+    return {
+        'count': int(values.size),
+        'mean': round(float(values.mean()), 1),
+        'median': round(float(p50), 1),
+        'p10': round(float(p10), 1),
+        'p90': round(float(p90), 1),
+        'min': round(float(values.min()), 1),
+        'max': round(float(values.max()), 1),
+        'histogram': {
+            'edges': [round(float(edge), 1) for edge in edges],
+            'counts': counts.tolist()
+        }
+    }
+
+def holding_force_deviation_distribution(*criteria, bins=20):
+    data = load_report_columns(*criteria, columns=tuple(
+        column for column in NUMERIC_COLUMNS if column.startswith('holding_force_')
+    ))
+    deviations = holding_force_deviations(data)
+    return {
+        'reports': len(data),
+        'sides': {side: distribution(values, bins) for side, values in deviations.items()}
+    }
+
+def consumption_by_customer(*criteria):
+    """Summen von Verbrauch, Kosten und CO2 je Kunde"""
+    data = load_report_columns(*criteria, columns=(
+        'film_consumption_per_pallet', 'pallets_per_year', 'roll_core_weight'
+    ))
+    consumption, costs, emissions = consumption_and_costs(data)
+    valid = np.isfinite(consumption)
+
+    customer_ids, inverse = np.unique(data.customer_ids, return_inverse=True)
+    size = len(customer_ids)
+    report_counts = np.bincount(inverse, minlength=size)
+    valid_counts = np.bincount(inverse, weights=valid, minlength=size)
+    consumption_sums = np.bincount(inverse, weights=np.where(valid, consumption, 0), minlength=size)
+    cost_sums = np.bincount(inverse, weights=np.where(valid, costs, 0), minlength=size)
+    emission_sums = np.bincount(inverse, weights=np.where(valid, emissions, 0), minlength=size)
+
+    names = dict(db.session.execute(
+        select(Customer.id, Customer.company_name).where(Customer.id.in_(customer_ids.tolist()))
+    ).all()) if size else {}
+
+    customers = [{
+        'customer_id': int(customer_id),
+        'company_name': names.get(int(customer_id)),
+        'reports': int(report_counts[i]),
+        'reports_with_consumption': int(valid_counts[i]),
+        'total_material_consumption': round(float(consumption_sums[i]), 1),
+        'annual_costs': round(float(cost_sums[i]), 2),
+        'co2_emissions': round(float(emission_sums[i]), 1)
+    } for i, customer_id in enumerate(customer_ids)]
+    customers.sort(key=lambda entry: entry['total_material_consumption'], reverse=True)
+
+    return {
+        'reports': len(data),
+        'totals': {
+            'total_material_consumption': round(float(consumption_sums.sum()), 1),
+            'annual_costs': round(float(cost_sums.sum()), 2),
+            'co2_emissions': round(float(emission_sums.sum()), 1)
+        },
+        'customers': customers
+    }
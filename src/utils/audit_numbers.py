@@ -0,0 +1,103 @@
+"""Kollisionsfreie Vergabe von Auftragsnummern
+
+Jeder Prozess reserviert in einer eigenen, kurzen Transaktion einen Block
+fortlaufender Nummern aus der Tabelle ``number_sequences`` und vergibt sie
+anschließend ohne weitere Datenbankzugriffe. Nummern sind pro Prozess
+monoton steigend; nicht genutzte Reste eines Blocks gehen verloren (Lücken
+sind zulässig), Doppelvergaben sind ausgeschlossen.
+"""
+import os
+import threading
+from flask import current_app
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+from src import db
+from src.models.sequence import NumberSequence
+
+DEFAULT_BLOCK_SIZE = 20
+FIRST_AUDIT_NUMBER = 10000000  # achtstellig wie die bisherigen Nummern
+
+class BlockAllocator:
+    """Vergibt Werte eines Nummernkreises aus lokal zwischengespeicherten Blöcken"""
+
+    def __init__(self, name, first_value, existing_values=None):
+        self.name = name
+        self.first_value = first_value
+        self.existing_values = existing_values  # Callable(connection, start, end) -> belegte Werte
+        self._lock = threading.Lock()
+        self._pid = None
+        self._values = []
+
+    def next(self):
+        return self.allocate(1)[0]
+
+    def allocate(self, count):
+        """Gibt ``count`` neue Werte in aufsteigender Reihenfolge zurück"""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Nach einem Fork (z.B. gunicorn) darf der Block des Elternprozesses nicht weiterverwendet werden
+                self._pid = os.getpid()
+                self._values = []
+
+            while len(self._values) < count:
+                block_size = max(current_app.config.get('AUDIT_NUMBER_BLOCK_SIZE', DEFAULT_BLOCK_SIZE), 1)
+                self._values.extend(self._reserve(max(block_size, count - len(self._values))))
+
+            values, self._values = self._values[:count], self._values[count:]
+            return values
+
+    def _reserve(self, size):
+        """Reserviert atomar einen Block und entfernt bereits belegte Werte"""
+        table = NumberSequence.__table__
+        while True:
+            try:
+                with db.engine.begin() as connection:
+                    result = connection.execute(
+                        table.update()
+                        .where(table.c.name == self.name)
+                        .values(next_value=table.c.next_value + size, updated_at=func.now())
+                    )
+                    if result.rowcount:
+                        end = connection.execute(
+                            select(table.c.next_value).where(table.c.name == self.name)
+                        ).scalar_one()
+                        start = end - size
+                    else:
+                        start = self._initial_value(connection)
+                        end = start + size
+                        connection.execute(table.insert().values(name=self.name, next_value=end))
+
+                    taken = self.existing_values(connection, start, end) if self.existing_values else set()
+                    return [value for value in range(start, end) if value not in taken]
+            except IntegrityError:
+                # Ein anderer Prozess hat den Nummernkreis gleichzeitig angelegt
+                continue
+
+    def _initial_value(self, connection):
+        if not self.existing_values:
+            return self.first_value
+        taken = self.existing_values(connection, None, None)
+        return max([self.first_value - 1] + list(taken)) + 1
+
+def _existing_audit_numbers(connection, start, end):
+    """Bereits vergebene numerische Auftragsnummern im Bereich [start, end)"""
+    from src.models.report import Report
+
+    if start is None:
+        numbers = connection.execute(select(Report.audit_number)).scalars()
+        return {int(number) for number in numbers if number and number.isdigit()}
+
+    taken = set()
+    for chunk_start in range(start, end, 1000):
+        candidates = [str(value) for value in range(chunk_start, min(chunk_start + 1000, end))]
+        numbers = connection.execute(select(Report.audit_number).where(Report.audit_number.in_(candidates)))
+        taken.update(int(number) for number in numbers.scalars())
+    return taken
+
+audit_numbers = BlockAllocator('audit_number', FIRST_AUDIT_NUMBER, _existing_audit_numbers)
+
+def next_audit_number():
+    return str(audit_numbers.next())
+
+def allocate_audit_numbers(count):
+    return [str(value) for value in audit_numbers.allocate(count)]
@@ -0,0 +1,268 @@
+"""Signierte, kurzlebige Zugangstokens ohne Datenbankzugriff pro Anfrage
+
+Ein Token enthält Benutzer-ID, Benutzername, Rolle und Aktiv-Status und ist mit
+dem ``SECRET_KEY`` signiert (itsdangerous). Geprüft werden nur Signatur,
+Ablaufzeit und die prozesslokale Sperrliste.
+
+- Zugangstoken: ``AUTH_TOKEN_TTL`` Sekunden gültig, per ``Authorization: Bearer``
+  oder in der Browser-Sitzung.
+- Refresh-Token: ``AUTH_REFRESH_TTL`` Sekunden gültig; ``POST /api/auth/refresh``
+  liest den Benutzer einmal neu und stellt ein neues Paar aus. In der
+  Browser-Sitzung wird das Zugangstoken automatisch erneuert.
+- Sperrliste: ``revoked_tokens``, je Prozess gecacht; andere Worker sehen neue
+  Einträge spätestens nach ``AUTH_REVOCATION_TTL`` Sekunden.
+"""
+import secrets
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime, timezone
+from functools import wraps
+from flask import current_app, g, jsonify, request, session
+from itsdangerous import BadSignature, SignatureExpired, URLSafeTimedSerializer
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from src import db
+from src.models.revoked_token import RevokedToken
+from src.models.user import User
+from src.utils.metrics import record_cache
+
+DEFAULT_ACCESS_TTL = 15 * 60  # Sekunden
+DEFAULT_REFRESH_TTL = 14 * 24 * 3600
+DEFAULT_REVOCATION_TTL = 30
+
+ACCESS = 'access'
+REFRESH = 'refresh'
+SALTS = {ACCESS: 'haral-access-token', REFRESH: 'haral-refresh-token'}
+
+Identity = namedtuple('Identity', 'user_id username role is_active jti issued_at')
+
+class TokenError(Exception):
+    pass
+
+def token_ttl(kind=ACCESS):
+    if kind == ACCESS:
+        return current_app.config.get('AUTH_TOKEN_TTL', DEFAULT_ACCESS_TTL)
+    return current_app.config.get('AUTH_REFRESH_TTL', DEFAULT_REFRESH_TTL)
+
+def _serializer(kind):
+    return URLSafeTimedSerializer(current_app.secret_key, salt=SALTS[kind])
+
+def _timestamp(value):
+    return value.replace(tzinfo=timezone.utc).timestamp()
+
+def _datetime(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
+
+def issue_token(user, kind=ACCESS):
+    return _serializer(kind).dumps({
+        'uid': user.id,
+        'usr': user.username,
+        'role': user.role,
+        'act': bool(user.is_active),
+        'jti': secrets.token_hex(16),
+        'iat': time.time()  # genauer als der Zeitstempel der Signatur (Sekunden)
+    })
+
+def issue_tokens(user):
+    return {
+        'access_token': issue_token(user, ACCESS),
+        'refresh_token': issue_token(user, REFRESH),
+        'token_type': 'Bearer',
+        'expires_in': token_ttl(ACCESS)
+    }
+
+def verify_token(token, kind=ACCESS):
+    """Prüft Signatur, Ablauf und Sperrliste; gibt die Identity zurück oder wirft TokenError"""
+    try:
+        payload = _serializer(kind).loads(token, max_age=token_ttl(kind))
+    except SignatureExpired:
+        raise TokenError('Token expired')
+    except BadSignature:
+        raise TokenError('Invalid token')
+
+    identity = Identity(payload['uid'], payload.get('usr'), payload.get('role'),
+                        payload.get('act', False), payload['jti'], payload['iat'])
+    if not identity.is_active:
+        raise TokenError('Account is deactivated')
+    if revocation_list.is_revoked(identity):
+        raise TokenError('Token revoked')
+    return identity
+
+class RevocationList:
+    """Prozesslokale Kopie der nicht abgelaufenen Einträge aus ``revoked_tokens``
+
+    Sperren im selben Prozess gelten sofort, Sperren anderer Prozesse nach
+    spätestens ``AUTH_REVOCATION_TTL`` Sekunden.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jtis = frozenset()
+        self._users = {}
+        self._expires_at = 0
+
+    def is_revoked(self, identity):
+        self._refresh()
+        if identity.jti in self._jtis:
+            return True
+        revoked_at = self._users.get(identity.user_id)
+        return revoked_at is not None and identity.issued_at <= revoked_at
+
+    def _refresh(self):
+        if time.monotonic() < self._expires_at:
+            record_cache('revoked_tokens', True)
+            return
+        with self._lock:
+            if time.monotonic() < self._expires_at:
+                record_cache('revoked_tokens', True)
+                return
+            record_cache('revoked_tokens', False)
+            self._jtis, self._users = self._load()
+            ttl = current_app.config.get('AUTH_REVOCATION_TTL', DEFAULT_REVOCATION_TTL)
+            self._expires_at = time.monotonic() + ttl
+
+    @staticmethod
+    def _load():
+        table = RevokedToken.__table__
+        with db.engine.connect() as connection:
+            rows = connection.execute(
+                select(table.c.jti, table.c.user_id, table.c.revoked_at)
+                .where(table.c.expires_at > datetime.utcnow())
+            ).all()
+
+        jtis, users = set(), {}
+        for jti, user_id, revoked_at in rows:
+            if jti:
+                jtis.add(jti)
+            elif user_id is not None:
+                users[user_id] = max(users.get(user_id, 0), _timestamp(revoked_at))
+        return frozenset(jtis), users
+
+    def revoke(self, jti=None, user_id=None, expires_at=None):
+        """Sperrt ein einzelnes Token (``jti``) oder alle bisherigen Tokens eines Benutzers"""
+        now = time.time()
+        table = RevokedToken.__table__
+        try:
+            with db.engine.begin() as connection:
+                # Abgelaufene Einträge werden nicht mehr gebraucht
+                connection.execute(table.delete().where(table.c.expires_at <= _datetime(now)))
+                connection.execute(table.insert().values(
+                    jti=jti, user_id=user_id, revoked_at=_datetime(now), expires_at=_datetime(expires_at)
+                ))
+        except IntegrityError:
+            pass  # Token war bereits gesperrt
+
+        with self._lock:
+            if jti:
+                self._jtis = self._jtis | {jti}
+            else:
+                self._users = dict(self._users)
+                self._users[user_id] = now
+
+    def clear(self):
+        with self._lock:
+            self._jtis = frozenset()
+            self._users = {}
+            self._expires_at = 0
+
+revocation_list = RevocationList()
+
+def revoke_token(token, kind=ACCESS):
+    """Sperrt ein (noch gültiges) Token; ungültige Tokens werden ignoriert"""
+    try:
+        identity = verify_token(token, kind)
+    except TokenError:
+        return False
+    revocation_list.revoke(jti=identity.jti, expires_at=identity.issued_at + token_ttl(kind))
+    return True
+
+def revoke_user_tokens(user_id):
+    """Sperrt alle bisher ausgestellten Tokens eines Benutzers (z. B. nach Rollenänderung)"""
+    longest = max(token_ttl(ACCESS), token_ttl(REFRESH))
+    revocation_list.revoke(user_id=user_id, expires_at=time.time() + longest)
+
+def start_session(user):
+    """Tokens in der Browser-Sitzung ablegen (Login, erneuerte Rechte)"""
+    session['user_id'] = user.id
+    session['username'] = user.username
+    session['access_token'] = issue_token(user, ACCESS)
+    session['refresh_token'] = issue_token(user, REFRESH)
+
+def bearer_token():
+    scheme, _, token = request.headers.get('Authorization', '').partition(' ')
+    token = token.strip()
+    return token if scheme.lower() == 'bearer' and token else None
+
+def _renew_session():
+    """Abgelaufenes Zugangstoken der Sitzung mit ihrem Refresh-Token erneuern"""
+    if 'refresh_token' in session:
+        try:
+            user_id = verify_token(session['refresh_token'], REFRESH).user_id
+        except TokenError:
+            return None
+    elif 'user_id' in session:
+        user_id = session['user_id']  # Sitzung von vor der Umstellung auf Tokens
+    else:
+        return None
+
+    user = db.session.get(User, user_id)
+    if not user or not user.is_active:
+        session.clear()
+        return None
+    if 'refresh_token' in session:
+        session['access_token'] = issue_token(user, ACCESS)
+    else:
+        start_session(user)
+    return verify_token(session['access_token'])
+
+def _resolve_identity():
+    token = bearer_token()
+    if token:
+        try:
+            return verify_token(token)
+        except TokenError:
+            return None
+
+    if 'access_token' in session:
+        try:
+            return verify_token(session['access_token'])
+        except TokenError:
+            pass
+    return _renew_session()
+
+def current_identity():
+    """Angemeldeter Benutzer dieser Anfrage (oder None), einmal pro Anfrage ermittelt"""
+    if 'identity' not in g:
+        g.identity = _resolve_identity()
+    return g.identity
+
+def require_login():
+    """``before_request``-Hook für Blueprints, die nur angemeldet nutzbar sind"""
+    if request.method == 'OPTIONS':
+        return None
+    if current_identity() is None:
+        return jsonify({'error': 'Not authenticated'}), 401
+    return None
+
+def login_required(view):
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        if current_identity() is None:
+            return jsonify({'error': 'Not authenticated'}), 401
+        return view(*args, **kwargs)
+    return wrapper
+
+def role_required(*roles):
+    """Nur für angemeldete Benutzer mit einer der Rollen (z. B. ``'Admin'``)"""
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            identity = current_identity()
+            if identity is None:
+                return jsonify({'error': 'Not authenticated'}), 401
+            if identity.role not in roles:
+                return jsonify({'error': 'Insufficient permissions'}), 403
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
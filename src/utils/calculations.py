@@ -0,0 +1,65 @@
+"""Berechnungsformeln für Verbrauch, Kosten und CO2
+
+Die Funktionen arbeiten mit einzelnen Zahlen ebenso wie mit NumPy-Arrays,
+damit Einzelberichte und Flottenauswertungen dieselben Formeln verwenden.
+Preise und Faktoren kommen aus der versionierten Faktortabelle
+(``src.models.calculation_factors``); ohne Eintrag gelten die Vorgaben unten.
+"""
+from collections import namedtuple
+import numpy as np
+
+# Vereinfachte Kostenberechnung (€2.50 pro kg Folie + Rollenkern-Kosten)
+FOIL_COST_PER_KG = 2.50
+ROLL_CORE_COST_PER_KG = 0.50
+
+# CO2-Emissionen (3.02 kg CO2 pro kg Folie)
+CO2_PER_KG_FILM = 3.02
+
+# Quintessenz: Anteil der Materialeinsparung an Kostenreduzierung bzw. Stabilitätssteigerung (kg)
+COST_REDUCTION_FACTOR = 0.4
+STABILITY_FACTOR = 0.2
+
+HOLDING_FORCE_SIDES = ('long_top', 'long_bottom', 'short_top', 'short_bottom')
+
+Factors = namedtuple('Factors', [
+    'version', 'foil_cost_per_kg', 'roll_core_cost_per_kg', 'co2_per_kg_film',
+    'cost_reduction_factor', 'stability_factor'
+])
+
+DEFAULT_FACTORS = Factors(
+    version=None,
+    foil_cost_per_kg=FOIL_COST_PER_KG,
+    roll_core_cost_per_kg=ROLL_CORE_COST_PER_KG,
+    co2_per_kg_film=CO2_PER_KG_FILM,
+    cost_reduction_factor=COST_REDUCTION_FACTOR,
+    stability_factor=STABILITY_FACTOR
+)
+
+def annual_material_consumption(film_consumption_per_pallet, pallets_per_year):
+    """Gesamtmaterialverbrauch in kg/Jahr (Verbrauch pro Palette in g)"""
+    return (film_consumption_per_pallet * pallets_per_year) / 1000
+
+def annual_costs(total_material_consumption, roll_core_weight, pallets_per_year, factors=DEFAULT_FACTORS):
+    """Jährliche Kosten in € aus Folienverbrauch und Rollenkern"""
+    roll_core_cost_per_year = roll_core_weight * factors.roll_core_cost_per_kg * pallets_per_year / 1000
+    return (total_material_consumption * factors.foil_cost_per_kg) + roll_core_cost_per_year
+
+def co2_emissions(total_material_consumption, factors=DEFAULT_FACTORS):
+    """CO2-Emissionen in kg/Jahr"""
+    return total_material_consumption * factors.co2_per_kg_film
+
+def cost_reduction(material_savings, factors=DEFAULT_FACTORS):
+    """Kostenreduzierung in % (Anteil der Materialeinsparung)"""
+    return material_savings * factors.cost_reduction_factor
+
+def stability_increase(material_savings, factors=DEFAULT_FACTORS):
+    """Stabilitätssteigerung in kg (Anteil der Materialeinsparung)"""
+    return material_savings * factors.stability_factor
+
+def round_quintessenz(value):
+    """Rundung der Quintessenz-Werte auf eine Nachkommastelle (gleich für Zahl und Array)"""
+    return np.round(value, 1)
+
+def holding_force_deviation(actual, target):
+    """Abweichung der IST- von der SOLL-Haltekraft in %"""
+    return (actual - target) / target * 100
@@ -0,0 +1,147 @@
+"""Komprimierung von API-Antworten und vorkomprimierte statische Dateien
+
+- JSON-Antworten ab ``COMPRESSION_MIN_SIZE`` Bytes werden je nach
+  ``Accept-Encoding`` mit Brotli oder gzip komprimiert.
+- Statische Dateien (JS, CSS, HTML, ...) werden einmalig als ``.br``/``.gz``
+  neben das Original gelegt und direkt ausgeliefert, statt sie bei jeder
+  Anfrage neu zu komprimieren.
+"""
+import gzip
+import mimetypes
+import os
+import stat
+import tempfile
+from flask import request, send_from_directory
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optionale Abhängigkeit
+    brotli = None
+
+COMPRESSIBLE_MIMETYPES = frozenset(['application/json', 'application/problem+json'])
+STATIC_EXTENSIONS = frozenset(['.js', '.mjs', '.css', '.html', '.svg', '.json', '.map', '.txt', '.ico'])
+STATIC_MIN_SIZE = 1024
+
+# Endung der vorkomprimierten Datei je Content-Encoding
+ENCODING_SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+def available_encodings():
+    return ('br', 'gzip') if brotli is not None else ('gzip',)
+
+def negotiate_encoding(encodings=None):
+    """Bestes vom Client akzeptiertes Encoding (oder None)"""
+    return request.accept_encodings.best_match(encodings or available_encodings())
+
+def compress(data, encoding, gzip_level=6, brotli_quality=4):
+    if encoding == 'br':
+        return brotli.compress(data, quality=brotli_quality)
+    return gzip.compress(data, compresslevel=gzip_level, mtime=0)
+
+def init_compression(app):
+    """Registriert die Komprimierung der dynamischen Antworten"""
+    app.config.setdefault('COMPRESSION_MIN_SIZE', 1024)
+    app.config.setdefault('COMPRESSION_GZIP_LEVEL', 6)
+    app.config.setdefault('COMPRESSION_BROTLI_QUALITY', 4)  # schnell genug für dynamische Antworten
+
+    @app.after_request
+    def compress_response(response):
+        if (response.direct_passthrough or response.is_streamed
+                or response.mimetype not in COMPRESSIBLE_MIMETYPES
+                or 'Content-Encoding' in response.headers
+                or not 200 <= response.status_code < 300):
+            return response
+
+        response.vary.add('Accept-Encoding')
+        data = response.get_data()
+        if len(data) < app.config['COMPRESSION_MIN_SIZE']:
+            return response
+
+        encoding = negotiate_encoding()
+        if not encoding:
+            return response
+
+        compressed = compress(
+            data, encoding,
+            gzip_level=app.config['COMPRESSION_GZIP_LEVEL'],
+            brotli_quality=app.config['COMPRESSION_BROTLI_QUALITY']
+        )
+        if len(compressed) >= len(data):
+            return response
+
+        response.set_data(compressed)
+        response.headers['Content-Encoding'] = encoding
+        # Die komprimierte Darstellung ist nicht bytegleich: starke ETags abschwächen
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+def _write_atomic(path, data, mode):
+    directory = os.path.dirname(path)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix='.precompress-')
+    try:
+        with os.fdopen(fd, 'wb') as temp_file:
+            temp_file.write(data)
+        # mkstemp legt die Datei mit 0600 an; Rechte des Originals übernehmen
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+def precompress_static(static_folder, min_size=STATIC_MIN_SIZE):
+    """Legt ``.br``/``.gz``-Varianten aller komprimierbaren Dateien an (nur wenn veraltet)
+
+    Gibt die Anzahl neu geschriebener Dateien zurück.
+    """
+    written = 0
+    for root, _, files in os.walk(static_folder):
+        for name in files:
+            if os.path.splitext(name)[1].lower() not in STATIC_EXTENSIONS:
+                continue
+            path = os.path.join(root, name)
+            source_stat = os.stat(path)
+            if source_stat.st_size < min_size:
+                continue
+
+            data = None
+            for encoding in available_encodings():
+                target = path + ENCODING_SUFFIXES[encoding]
+                if os.path.exists(target) and os.stat(target).st_mtime >= source_stat.st_mtime:
+                    continue
+                if data is None:
+                    with open(path, 'rb') as source:
+                        data = source.read()
+                # Einmalig: höchste Stufe
+                compressed = brotli.compress(data, quality=11) if encoding == 'br' else gzip.compress(data, 9, mtime=0)
+                if len(compressed) < len(data):
+                    _write_atomic(target, compressed, stat.S_IMODE(source_stat.st_mode))
+                    written += 1
+    return written
+
+def send_static(static_folder, path, encodings=None, **kwargs):
+    """Statische Datei ausliefern, bevorzugt als vorkomprimierte Variante
+
+    ``encodings`` sind die vorhandenen Varianten (z. B. aus dem Manifest); ohne
+    Angabe wird im Dateisystem nachgesehen.
+    """
+    mimetype = kwargs.pop('mimetype', None) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+    full_path = safe_join(static_folder, path)
+    if full_path and os.path.splitext(path)[1].lower() in STATIC_EXTENSIONS:
+        # Vorkomprimierte Dateien brauchen zum Ausliefern kein Brotli-Modul
+        if encodings is None:
+            encodings = [encoding for encoding in ENCODING_SUFFIXES
+                         if os.path.isfile(full_path + ENCODING_SUFFIXES[encoding])]
+        encoding = negotiate_encoding(encodings) if encodings else None
+        if encoding:
+            response = send_from_directory(static_folder, path + ENCODING_SUFFIXES[encoding], mimetype=mimetype, **kwargs)
+            response.headers['Content-Encoding'] = encoding
+            response.vary.add('Accept-Encoding')
+            return response
+        response = send_from_directory(static_folder, path, mimetype=mimetype, **kwargs)
+        if encodings:
+            response.vary.add('Accept-Encoding')
+        return response
+    return send_from_directory(static_folder, path, mimetype=mimetype, **kwargs)
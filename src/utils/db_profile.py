@@ -0,0 +1,147 @@
+"""Datenbankprofil: Engine-Tuning je Datenbanktyp und Lesezugriffe über ein Replikat
+
+- SQLite: WAL-Modus und angepasste PRAGMAs, damit Leser Schreiber nicht blockieren
+- PostgreSQL: Poolgröße, Pre-Ping, Recycle und Statement-Timeout
+- Optional: Endpunkte mit ``@read_only`` lesen über ``DATABASE_REPLICA_URL``
+- Gemeinsame Zeitmessung aller SQL-Statements: ``add_statement_listener``
+  registriert Auswertungen (Metriken, SQL-Profiler, Tracing), die jede Messung
+  erhalten, statt dass jede eigene Engine-Events installiert
+"""
+import os
+import time
+import weakref
+from collections import namedtuple
+from functools import wraps
+from flask import g, has_app_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+REPLICA_BIND = 'replica'
+
+STATEMENT_START = 'statement_start'
+
+# Gemessen von before_cursor_execute bis after_cursor_execute bzw. handle_error
+StatementTiming = namedtuple('StatementTiming', 'statement parameters executemany seconds rowcount error')
+
+_statement_listeners = weakref.WeakKeyDictionary()  # Engine -> [listener, ...]
+
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'foreign_keys': 'ON',
+    'busy_timeout': 5000,  # ms
+    'cache_size': -20000,  # negativ = KiB
+    'temp_store': 'MEMORY',
+}
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+def engine_options(database_url):
+    """Engine-Optionen passend zum Datenbanktyp"""
+    if database_url.startswith('postgresql'):
+        statement_timeout = _env_int('DB_STATEMENT_TIMEOUT_MS', 30000)
+        return {
+            'pool_size': _env_int('DB_POOL_SIZE', 10),
+            'max_overflow': _env_int('DB_MAX_OVERFLOW', 20),
+            'pool_timeout': _env_int('DB_POOL_TIMEOUT', 30),
+            'pool_recycle': _env_int('DB_POOL_RECYCLE', 1800),
+            'pool_pre_ping': True,
+            'connect_args': {
+                'options': f'-c statement_timeout={statement_timeout}',
+                'application_name': 'haral-pruefbericht',
+            },
+        }
+    if database_url.startswith('sqlite'):
+        return {
+            'connect_args': {'timeout': SQLITE_PRAGMAS['busy_timeout'] / 1000},
+        }
+    return {}
+
+def configure_database(app, database_url):
+    """Setzt URI, Engine-Optionen und ein optionales Lese-Replikat in der App-Konfiguration"""
+    app.config['SQLALCHEMY_DATABASE_URI'] = database_url
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = engine_options(database_url)
+
+    replica_url = os.environ.get('DATABASE_REPLICA_URL')
+    if replica_url:
+        if replica_url.startswith('postgres://'):
+            replica_url = replica_url.replace('postgres://', 'postgresql://', 1)
+        app.config['SQLALCHEMY_BINDS'] = {
+            REPLICA_BIND: dict(engine_options(replica_url), url=replica_url)
+        }
+
+def install_engine_events(db):
+    """Registriert die SQLite-PRAGMAs auf allen SQLite-Engines (innerhalb eines App-Kontexts aufrufen)"""
+    for engine in db.engines.values():
+        if engine.dialect.name == 'sqlite':
+            event.listen(engine, 'connect', _apply_sqlite_pragmas)
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma, value in SQLITE_PRAGMAS.items():
+            cursor.execute(f'PRAGMA {pragma}={value}')
+    finally:
+        cursor.close()
+
+def add_statement_listener(db, listener):
+    """Ruft ``listener(conn, timing)`` nach jedem Statement auf allen Engines auf (im App-Kontext aufrufen)
+
+    ``timing`` ist ein ``StatementTiming``; bei fehlgeschlagenen Statements ist
+    ``error`` die Ausnahme und ``rowcount`` None. Die Engine-Events werden je
+    Engine nur einmal installiert, das Statement also nur einmal gemessen.
+    """
+    for engine in db.engines.values():
+        listeners = _statement_listeners.get(engine)
+        if listeners is None:
+            listeners = _statement_listeners[engine] = []
+            event.listen(engine, 'before_cursor_execute', _before_cursor_execute)
+            event.listen(engine, 'after_cursor_execute', _after_cursor_execute)
+            event.listen(engine, 'handle_error', _handle_error)
+        listeners.append(listener)
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault(STATEMENT_START, []).append(time.perf_counter())
+
+def _notify(conn, timing):
+    for listener in _statement_listeners.get(conn.engine, ()):
+        listener(conn, timing)
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    starts = conn.info.get(STATEMENT_START)
+    if not starts:
+        return
+    seconds = time.perf_counter() - starts.pop()
+    rowcount = cursor.rowcount if cursor.rowcount is not None and cursor.rowcount >= 0 else None
+    _notify(conn, StatementTiming(statement, parameters, executemany, seconds, rowcount, None))
+
+def _handle_error(exception_context):
+    # Fehlgeschlagene Statements lösen kein after_cursor_execute aus
+    conn = exception_context.connection
+    starts = conn.info.get(STATEMENT_START) if conn is not None else None
+    if not starts:
+        return
+    seconds = time.perf_counter() - starts.pop()
+    context = exception_context.execution_context
+    executemany = context.executemany if context is not None else False
+    _notify(conn, StatementTiming(exception_context.statement, exception_context.parameters, executemany,
+                                  seconds, None, exception_context.original_exception))
+
+def read_only(view):
+    """Markiert einen Endpunkt als rein lesend; Abfragen gehen dann an das Replikat (falls konfiguriert)"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        g.db_read_only = True
+        return view(*args, **kwargs)
+    return wrapper
+
+class RoutingSession(Session):
+    """Session, die Lesezugriffe rein lesender Endpunkte an das Replikat leitet"""
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and has_app_context() and g.get('db_read_only'):
+            replica = self._db.engines.get(REPLICA_BIND)
+            if replica is not None:
+                return replica
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
@@ -9,6 +9,7 @@ from reportlab.lib.utils import ImageReader
 import os
 from datetime import datetime
 import tempfile
+from src.utils.tracing import span, traced
 
 class HARALReportTemplate:
     """Template für HARAL Prüfberichte basierend auf dem ursprünglichen Design"""
@@ -270,6 +271,7 @@ class HARALPageTemplate:
             datetime.now().strftime("%d.%m.%Y")
         )
 
+@traced('pdf.generate')
 def generate_enhanced_report_pdf(report):
     """Generiert ein PDF basierend auf dem ursprünglichen HARAL Design"""
     
@@ -307,14 +309,16 @@ def generate_enhanced_report_pdf(report):
     story.extend(build_main_content(template))
     
     # PDF generieren
-    doc.build(
-        story,
-        onFirstPage=page_template.draw_header_footer,
-        onLaterPages=page_template.draw_header_footer
-    )
+    with span('pdf.doc_build', flowables=len(story)):
+        doc.build(
+            story,
+            onFirstPage=page_template.draw_header_footer,
+            onLaterPages=page_template.draw_header_footer
+        )
     
     return pdf_path
 
+@traced('pdf.build_title_page')
 def build_title_page(template):
     """Titelseite erstellen"""
     story = []
@@ -355,6 +359,7 @@ def build_title_page(template):
     
     return story
 
+@traced('pdf.build_quintessenz_box')
 def build_quintessenz_box(template):
     """Quintessenz-Box erstellen"""
     story = []
@@ -371,6 +376,7 @@ def build_quintessenz_box(template):
     
     return story
 
+@traced('pdf.build_table_of_contents')
 def build_table_of_contents(template):
     """Inhaltsverzeichnis erstellen"""
     story = []
@@ -394,6 +400,7 @@ def build_table_of_contents(template):
     
     return story
 
+@traced('pdf.build_main_content')
 def build_main_content(template):
     """Hauptinhalt erstellen"""
     story = []
@@ -424,6 +431,7 @@ def build_main_content(template):
     
     return story
 
+@traced('pdf.build_ausgangssituation')
 def build_ausgangssituation(template):
     """Ausgangssituation-Kapitel erstellen"""
     story = []
@@ -477,6 +485,7 @@ def build_ausgangssituation(template):
     
     return story
 
+@traced('pdf.build_palettenstabilitaet')
 def build_palettenstabilitaet(template):
     """Palettenstabilität-Kapitel erstellen"""
     story = []
@@ -572,6 +581,7 @@ def build_palettenstabilitaet(template):
     
     return story
 
+@traced('pdf.build_gesamtuebersicht')
 def build_gesamtuebersicht(template):
     """Gesamtübersicht-Kapitel erstellen"""
     story = []
@@ -690,6 +700,7 @@ def build_gesamtuebersicht(template):
     
     return story
 
+@traced('pdf.build_einsparpotentiale')
 def build_einsparpotentiale(template):
     """Einsparpotentiale-Kapitel erstellen"""
     story = []
@@ -739,6 +750,7 @@ def build_einsparpotentiale(template):
     
     return story
 
+@traced('pdf.build_fazit')
 def build_fazit(template):
     """Fazit-Kapitel erstellen"""
     story = []
@@ -760,6 +772,7 @@ def build_fazit(template):
     
     return story
 
+@traced('pdf.build_bilddokumentation')
 def build_bilddokumentation(template):
     """Bilddokumentation-Kapitel erstellen"""
     story = []
@@ -0,0 +1,80 @@
+"""JSON-Provider für alle API-Antworten
+
+Verwendet ``orjson`` (serialisiert direkt in Bytes, datetime/date/UUID und
+NumPy-Werte nativ). Ist das Paket nicht installiert, wird auf die Standard-
+bibliothek zurückgefallen; Datumswerte werden in beiden Fällen als ISO 8601
+ausgegeben.
+"""
+import dataclasses
+import decimal
+import json
+import uuid
+from datetime import date
+from flask.json.provider import DefaultJSONProvider
+from src.utils.tracing import span
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optionale Abhängigkeit
+    orjson = None
+
+def _default(o):
+    """Typen, die weder orjson noch json selbst kennen"""
+    if isinstance(o, date):
+        return o.isoformat()
+    if isinstance(o, decimal.Decimal):
+        return str(o)
+    if isinstance(o, uuid.UUID):
+        return str(o)
+    if dataclasses.is_dataclass(o) and not isinstance(o, type):
+        return dataclasses.asdict(o)
+    if hasattr(o, 'tolist'):  # NumPy-Werte ohne orjson
+        return o.tolist()
+    if hasattr(o, '__html__'):
+        return str(o.__html__())
+    raise TypeError(f'Object of type {type(o).__name__} is not JSON serializable')
+
+def dumps_compact(obj):
+    """Kompaktes JSON ohne Zeilenumbrüche (z. B. für NDJSON), unabhängig vom Debug-Modus"""
+    if orjson is None:
+        return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_default)
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON-Provider auf Basis von orjson mit Rückfall auf die Standardbibliothek"""
+
+    default = staticmethod(_default)
+
+    def _options(self):
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if self._indent():
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def _indent(self):
+        compact = self.compact
+        if compact is None:
+            compact = not self._app.debug
+        return not compact
+
+    def dumps(self, obj, **kwargs):
+        if orjson is None or kwargs:
+            return super().dumps(obj, **kwargs)
+        return orjson.dumps(obj, default=_default, option=self._options()).decode()
+
+    def loads(self, s, **kwargs):
+        if orjson is None or kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        if orjson is None:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        with span('json.serialize') as active:
+            body = orjson.dumps(obj, default=_default, option=self._options() | orjson.OPT_APPEND_NEWLINE)
+            if active is not None:
+                active.set('bytes', len(body))
+        return self._app.response_class(body, mimetype=self.mimetype)
@@ -0,0 +1,155 @@
+"""Prometheus-Metriken für API, Datenbank, PDF-Erstellung und Caches
+
+- ``http_request_duration_seconds``: Latenz je Endpunkt (Blueprint-Route), Methode und Status
+- ``http_requests_in_progress``: laufende Anfragen je Endpunkt
+- ``http_request_db_queries`` / ``http_request_db_seconds``: Anzahl und Dauer der
+  Datenbankabfragen pro Anfrage
+- ``pdf_render_seconds``, ``pdf_render_pages``, ``pdf_render_bytes`` und
+  ``pdf_render_rejected_total``
+- ``cache_requests_total``: Treffer/Fehlschläge je Cache (Trefferquote per PromQL)
+
+Unter Gunicorn schreiben alle Worker in ``PROMETHEUS_MULTIPROC_DIR`` (siehe
+``gunicorn.conf.py``); ``GET /metrics`` fasst die Dateien aller Prozesse
+zusammen. Ohne ``prometheus_client`` werden keine Metriken erfasst.
+"""
+import hmac
+import os
+import re
+import time
+from flask import g, has_request_context, jsonify, request
+from src.utils.db_profile import add_statement_listener
+
+try:
+    import prometheus_client
+    from prometheus_client import CollectorRegistry, multiprocess
+except ImportError:  # pragma: no cover - optionale Abhängigkeit
+    prometheus_client = None
+
+class _NoopMetric:
+    def labels(self, *args, **kwargs):
+        return self
+
+    def observe(self, value):
+        pass
+
+    def inc(self, amount=1):
+        pass
+
+    def dec(self, amount=1):
+        pass
+
+def _metric(kind, *args, **kwargs):
+    if prometheus_client is None:
+        return _NoopMetric()
+    return getattr(prometheus_client, kind)(*args, **kwargs)
+
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+RENDER_SECONDS_BUCKETS = (0.25, 0.5, 1, 2, 5, 10, 20, 30, 60, 120)
+PAGE_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+BYTES_BUCKETS = (50e3, 100e3, 250e3, 500e3, 1e6, 2.5e6, 5e6, 10e6, 25e6)
+
+REQUEST_LATENCY = _metric(
+    'Histogram', 'http_request_duration_seconds',
+    'Latenz der HTTP-Anfragen', ['endpoint', 'method', 'status']
+)
+REQUESTS_IN_PROGRESS = _metric(
+    'Gauge', 'http_requests_in_progress',
+    'Laufende HTTP-Anfragen', ['endpoint'], multiprocess_mode='livesum'
+)
+REQUEST_DB_QUERIES = _metric(
+    'Histogram', 'http_request_db_queries',
+    'Datenbankabfragen pro Anfrage', ['endpoint'], buckets=QUERY_BUCKETS
+)
+REQUEST_DB_SECONDS = _metric(
+    'Histogram', 'http_request_db_seconds',
+    'Dauer aller Datenbankabfragen pro Anfrage', ['endpoint']
+)
+PDF_RENDER_SECONDS = _metric(
+    'Histogram', 'pdf_render_seconds',
+    'Dauer der PDF-Erstellung', buckets=RENDER_SECONDS_BUCKETS
+)
+PDF_RENDER_PAGES = _metric(
+    'Histogram', 'pdf_render_pages',
+    'Seitenzahl der erstellten PDFs', buckets=PAGE_BUCKETS
+)
+PDF_RENDER_BYTES = _metric(
+    'Histogram', 'pdf_render_bytes',
+    'Größe der erstellten PDFs', buckets=BYTES_BUCKETS
+)
+PDF_RENDER_REJECTED = _metric(
+    'Counter', 'pdf_render_rejected_total',
+    'Abgewiesene PDF-Anfragen (Warteschlange voll oder Wartezeit abgelaufen)'
+)
+CACHE_REQUESTS = _metric(
+    'Counter', 'cache_requests_total',
+    'Cache-Zugriffe nach Ergebnis', ['cache', 'result']
+)
+
+PDF_PAGE_PATTERN = re.compile(rb'/Type\s*/Page(?![a-zA-Z])')
+
+def record_cache(cache, hit):
+    CACHE_REQUESTS.labels(cache, 'hit' if hit else 'miss').inc()
+
+def record_pdf_render(seconds, pdf_path):
+    PDF_RENDER_SECONDS.observe(seconds)
+    with open(pdf_path, 'rb') as f:
+        data = f.read()
+    PDF_RENDER_BYTES.observe(len(data))
+    PDF_RENDER_PAGES.observe(len(PDF_PAGE_PATTERN.findall(data)))
+
+def _endpoint():
+    return request.endpoint or 'unmatched'
+
+def _record_statement(conn, timing):
+    if has_request_context():
+        g.metrics_db_queries = g.get('metrics_db_queries', 0) + 1
+        g.metrics_db_seconds = g.get('metrics_db_seconds', 0.0) + timing.seconds
+
+def _registry():
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return prometheus_client.REGISTRY
+
+def metrics_view():
+    if prometheus_client is None:
+        return jsonify({'error': 'prometheus_client ist nicht installiert'}), 503
+
+    token = os.environ.get('METRICS_TOKEN')
+    if token and not hmac.compare_digest(request.headers.get('Authorization', ''), f'Bearer {token}'):
+        return jsonify({'error': 'Not authenticated'}), 401
+
+    body = prometheus_client.generate_latest(_registry())
+    return body, 200, {'Content-Type': prometheus_client.CONTENT_TYPE_LATEST}
+
+def init_metrics(app, db):
+    """Registriert Request-Hooks, Statement-Auswertung und ``GET /metrics`` (im App-Kontext aufrufen)"""
+    app.add_url_rule('/metrics', 'metrics', metrics_view)
+    if prometheus_client is None:
+        return
+
+    add_statement_listener(db, _record_statement)
+
+    @app.before_request
+    def start_request_metrics():
+        g.metrics_started = time.perf_counter()
+        REQUESTS_IN_PROGRESS.labels(_endpoint()).inc()
+
+    @app.after_request
+    def remember_status(response):
+        g.metrics_status = response.status_code
+        return response
+
+    @app.teardown_request
+    def finish_request_metrics(exc):
+        started = g.pop('metrics_started', None)
+        if started is None:
+            return
+        endpoint = _endpoint()
+        REQUESTS_IN_PROGRESS.labels(endpoint).dec()
+        REQUEST_LATENCY.labels(endpoint, request.method, str(g.get('metrics_status', 500))).observe(
+            time.perf_counter() - started
+        )
+        REQUEST_DB_QUERIES.labels(endpoint).observe(g.get('metrics_db_queries', 0))
+        REQUEST_DB_SECONDS.labels(endpoint).observe(g.get('metrics_db_seconds', 0.0))
@@ -0,0 +1,153 @@
+"""Idempotente Schema-Migrationen für bestehende Datenbanken (ergänzt db.create_all)"""
+import json
+from datetime import datetime
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect, text
+from sqlalchemy.types import Text
+
+metadata = MetaData()
+
+schema_migrations = Table(
+    'schema_migrations', metadata,
+    Column('name', String(100), primary_key=True),
+    Column('applied_at', DateTime, nullable=False)
+)
+
+MIGRATIONS = []
+
+def migration(name):
+    """Registriert eine Migration; die Reihenfolge entspricht der Definitionsreihenfolge"""
+    def decorator(func):
+        MIGRATIONS.append((name, func))
+        return func
+    return decorator
+
+def run_migrations(connection):
+    """Führt alle noch nicht angewendeten Migrationen aus und gibt deren Namen zurück"""
+    schema_migrations.create(connection, checkfirst=True)
+    applied = set(connection.execute(schema_migrations.select().with_only_columns(schema_migrations.c.name)).scalars())
+
+    newly_applied = []
+    for name, func in MIGRATIONS:
+        if name in applied:
+            continue
+        func(connection)
+        connection.execute(schema_migrations.insert().values(name=name, applied_at=datetime.utcnow()))
+        newly_applied.append(name)
+    return newly_applied
+
+def _columns(connection, table_name):
+    inspector = inspect(connection)
+    if not inspector.has_table(table_name):
+        return {}
+    return {column['name']: column for column in inspector.get_columns(table_name)}
+
+def _clean_json_text_column(connection, table_name, column_name):
+    """Setzt nicht parsebare Werte einer Text-Spalte mit JSON-Inhalt auf NULL"""
+    rows = connection.execute(text(
+        f'SELECT id, {column_name} FROM {table_name} WHERE {column_name} IS NOT NULL'
+    ))
+    invalid_ids = []
+    for row_id, value in rows:
+        try:
+            parsed = json.loads(value)
+        except (TypeError, json.JSONDecodeError):
+            parsed = None
+        if not isinstance(parsed, list):
+            invalid_ids.append(row_id)
+    for row_id in invalid_ids:
+        connection.execute(
+            text(f'UPDATE {table_name} SET {column_name} = NULL WHERE id = :id'),
+            {'id': row_id}
+        )
+
+@migration('0001_native_json_columns')
+def native_json_columns(connection):
+    """alternatives/images von Text auf native JSON-Typen umstellen (JSONB auf PostgreSQL)"""
+    columns = _columns(connection, 'reports')
+    if not columns:
+        return
+
+    for column_name in ('alternatives', 'images'):
+        if not isinstance(columns[column_name]['type'], Text):
+            continue
+        _clean_json_text_column(connection, 'reports', column_name)
+        if connection.dialect.name == 'postgresql':
+            connection.execute(text(
+                f'ALTER TABLE reports ALTER COLUMN {column_name} TYPE JSONB '
+                f'USING {column_name}::jsonb'
+            ))
+        # SQLite speichert JSON als Text; nach der Bereinigung ist keine Typänderung nötig
+
+    if connection.dialect.name == 'postgresql':
+        connection.execute(text(
+            'CREATE INDEX IF NOT EXISTS ix_reports_alternatives_gin '
+            'ON reports USING gin (alternatives jsonb_path_ops)'
+        ))
+
+@migration('0002_report_alternatives_backfill')
+def report_alternatives_backfill(connection):
+    """Alternativen aus dem JSON-Feld in die Tabelle report_alternatives übernehmen"""
+    from src.models.report import Report
+    from src.models.report_alternative import ReportAlternative
+
+    alternatives_table = ReportAlternative.__table__
+    alternatives_table.create(connection, checkfirst=True)
+    reports = Report.__table__
+
+    existing = alternatives_table.select().with_only_columns(alternatives_table.c.report_id)
+    rows = connection.execute(
+        reports.select()
+        .with_only_columns(reports.c.id, reports.c.alternatives)
+        .where(reports.c.alternatives.isnot(None), reports.c.id.not_in(existing))
+    )
+
+    batch = []
+    for report_id, alternatives in rows:
+        if isinstance(alternatives, str):
+            try:
+                alternatives = json.loads(alternatives)
+            except json.JSONDecodeError:
+                continue
+        for position, alternative in enumerate(alternatives or []):
+            if isinstance(alternative, dict):
+                batch.append(dict(ReportAlternative.row_values(alternative, position), report_id=report_id))
+        if len(batch) >= 1000:
+            connection.execute(alternatives_table.insert(), batch)
+            batch = []
+    if batch:
+        connection.execute(alternatives_table.insert(), batch)
+
+@migration('0003_change_log_baseline')
+def change_log_baseline(connection):
+    """Bestehende Berichte und Kunden als Ausgangsstand ins Änderungsprotokoll übernehmen"""
+    from sqlalchemy import literal, select
+    from src.models.change_log import ACTION_UPSERT, ChangeLogEntry
+    from src.models.customer import Customer
+    from src.models.report import Report
+
+    change_log = ChangeLogEntry.__table__
+    change_log.create(connection, checkfirst=True)
+    now = datetime.utcnow()
+
+    for entity, table in (('customer', Customer.__table__), ('report', Report.__table__)):
+        logged = select(change_log.c.entity_id).where(change_log.c.entity == entity)
+        connection.execute(change_log.insert().from_select(
+            ['entity', 'entity_id', 'action', 'changed_at'],
+            select(literal(entity), table.c.id, literal(ACTION_UPSERT), literal(now))
+            .where(table.c.id.not_in(logged))
+            .order_by(table.c.id)
+        ))
+
+@migration('0004_report_version')
+def report_version(connection):
+    """Versionsspalte für optimistische Sperren ergänzen"""
+    columns = _columns(connection, 'reports')
+    if columns and 'version' not in columns:
+        connection.execute(text('ALTER TABLE reports ADD COLUMN version INTEGER NOT NULL DEFAULT 1'))
+
+@migration('0005_report_factor_version')
+def report_factor_version(connection):
+    """Spalte für die Version der Faktortabelle der letzten Berechnung ergänzen"""
+    columns = _columns(connection, 'reports')
+    if columns and 'factor_version' not in columns:
+        connection.execute(text('ALTER TABLE reports ADD COLUMN factor_version INTEGER'))
@@ -0,0 +1,109 @@
+"""Profiling einzelner Aufrufe mit cProfile und tracemalloc
+
+``profile_call`` führt eine Funktion unter beiden Profilern aus und liefert
+Laufzeit, die teuersten Funktionen, die größten Allokationsstellen, den
+Spitzenverbrauch und einen pstats-Dump (mit ``pstats``/snakeviz auswertbar).
+Beide Profiler gelten für den ganzen Prozess, daher läuft höchstens ein
+Profiling gleichzeitig (sonst ``ProfilerBusy``).
+"""
+import cProfile
+import io
+import marshal
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import namedtuple
+
+DEFAULT_TOP = 30
+MAX_TOP = 200
+SORT_KEYS = ('cumulative', 'tottime', 'calls')
+TRACEMALLOC_FRAMES = 1
+
+ProfileResult = namedtuple('ProfileResult', 'value error wall_ms peak_memory_bytes functions allocations text pstats_dump')
+
+_lock = threading.Lock()
+
+class ProfilerBusy(Exception):
+    pass
+
+def _function_name(key):
+    filename, line, name = key
+    return f'{filename}:{line}({name})' if line else name
+
+def _functions(stats, sort, top):
+    index = {'cumulative': 3, 'tottime': 2, 'calls': 1}[sort]
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][index], reverse=True)[:top]
+    return [{
+        'function': _function_name(key),
+        'calls': calls,
+        'primitive_calls': primitive_calls,
+        'total_ms': round(total * 1000, 3),
+        'cumulative_ms': round(cumulative * 1000, 3)
+    } for key, (primitive_calls, calls, total, cumulative, _) in rows]
+
+def _allocations(before, after, top):
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__),
+              tracemalloc.Filter(False, '<frozen importlib._bootstrap>'))
+    differences = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), 'lineno')
+    return [{
+        'location': f'{difference.traceback[0].filename}:{difference.traceback[0].lineno}',
+        'size_bytes': difference.size_diff,
+        'count': difference.count_diff
+    } for difference in differences[:top] if difference.size_diff > 0]
+
+def profile_call(function, sort='cumulative', top=DEFAULT_TOP):
+    """Führt ``function()`` unter cProfile und tracemalloc aus
+
+    Allokationen sind der Speicher, der nach dem Aufruf (Rückgabewert noch
+    referenziert) mehr belegt ist als vorher; vorübergehende Allokationen
+    gehen nur in ``peak_memory_bytes`` ein. Fehler von ``function`` werden
+    nicht geworfen, sondern in ``error`` zurückgegeben.
+    """
+    if sort not in SORT_KEYS:
+        raise ValueError(f'Unbekannte Sortierung: {sort}')
+    top = max(1, min(int(top), MAX_TOP))
+    if not _lock.acquire(blocking=False):
+        raise ProfilerBusy('Es läuft bereits ein Profiling')
+
+    started_tracing = not tracemalloc.is_tracing()  # z. B. PYTHONTRACEMALLOC
+    try:
+        if started_tracing:
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        tracemalloc.reset_peak()
+        baseline, _ = tracemalloc.get_traced_memory()
+        before = tracemalloc.take_snapshot()
+
+        profiler = cProfile.Profile()
+        value = error = None
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            value = function()
+        except Exception as e:
+            error = f'{type(e).__name__}: {e}'
+        finally:
+            profiler.disable()
+        wall_ms = (time.perf_counter() - started) * 1000
+
+        _, peak = tracemalloc.get_traced_memory()
+        after = tracemalloc.take_snapshot()
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+        _lock.release()
+
+    text = io.StringIO()
+    stats = pstats.Stats(profiler, stream=text)
+    stats.sort_stats(sort).print_stats(top)
+
+    return ProfileResult(
+        value=value,
+        error=error,
+        wall_ms=round(wall_ms, 3),
+        peak_memory_bytes=peak - baseline,
+        functions=_functions(stats, sort, top),
+        allocations=_allocations(before, after, top),
+        text=text.getvalue(),
+        pstats_dump=marshal.dumps(stats.stats)
+    )
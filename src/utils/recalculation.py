@@ -0,0 +1,180 @@
+"""Neuberechnung der abgeleiteten Werte nach einer Änderung der Faktortabelle
+
+Betroffen sind alle Berichte, deren ``factor_version`` älter als die aktuelle
+Version ist. Sie werden blockweise (Keyset über die ID) geladen, spaltenweise
+mit NumPy neu berechnet und per ``executemany`` zurückgeschrieben; jeder Block
+wird einzeln committet. Gleichzeitig geänderte Berichte (andere ``version``)
+werden übersprungen und bleiben für den nächsten Lauf offen.
+"""
+import threading
+from datetime import datetime
+import numpy as np
+from sqlalchemy import and_, bindparam, exists, false, or_, select
+from src import db
+from src.models.report import Report
+from src.models.report_alternative import ReportAlternative
+from src.models import report_statistics
+from src.models.calculation_factors import current_factors, invalidate_factors
+from src.models.change_log import record_changes
+from src.utils import calculations
+from src.utils.analytics import consumption_and_costs
+
+DEFAULT_CHUNK_SIZE = 1000
+
+INPUT_COLUMNS = ('film_consumption_per_pallet', 'pallets_per_year', 'roll_core_weight', 'film_thickness', 'material_savings')
+DERIVED_COLUMNS = Report.CONSUMPTION_OUTPUTS + ('cost_reduction', 'stability_increase')
+
+def pending_criteria(factors):
+    """Berichte, die mit einer älteren (oder keiner) Faktorversion berechnet wurden"""
+    if factors.version is None:
+        return [false()]  # Ohne Faktortabelle gelten die Vorgaben; nichts zu tun
+    return [or_(Report.factor_version.is_(None), Report.factor_version < factors.version)]
+
+def count_pending(connection, factors):
+    return connection.execute(
+        select(db.func.count(Report.id)).where(*pending_criteria(factors))
+    ).scalar()
+
+def _load_chunk(connection, factors, after_id, limit):
+    # Quintessenz wird nur berechnet, wenn eine Alternative mit Foliendicke existiert
+    has_alternative = exists().where(
+        ReportAlternative.report_id == Report.id,
+        ReportAlternative.film_thickness.isnot(None),
+        ReportAlternative.film_thickness != 0
+    )
+    stmt = select(
+        Report.id, Report.version, has_alternative,
+        *[getattr(Report, column) for column in INPUT_COLUMNS + DERIVED_COLUMNS]
+    ).where(*pending_criteria(factors), Report.id > after_id).order_by(Report.id).limit(limit)
+    rows = connection.execute(stmt).all()
+    if not rows:
+        return None
+
+    transposed = list(zip(*rows))
+    columns = {
+        column: np.array(values, dtype=float)  # None -> NaN
+        for column, values in zip(INPUT_COLUMNS + DERIVED_COLUMNS, transposed[3:])
+    }
+    columns['id'] = list(transposed[0])
+    columns['version'] = list(transposed[1])
+    columns['has_alternative'] = np.array(transposed[2], dtype=bool)
+    return columns
+
+def recalculate_columns(data, factors):
+    """Neue Werte der abgeleiteten Spalten; wo nichts zu berechnen ist, bleibt der alte Wert"""
+    consumption, costs, emissions = consumption_and_costs(data, factors)
+    valid = np.isfinite(consumption)
+
+    savings = data['material_savings']
+    quintessenz = data['has_alternative'] & (np.nan_to_num(data['film_thickness']) > 0) & np.isfinite(savings)
+
+    return {
+        'total_material_consumption': np.where(valid, consumption, data['total_material_consumption']),
+        'annual_costs': np.where(valid, costs, data['annual_costs']),
+        'co2_emissions': np.where(valid, emissions, data['co2_emissions']),
+        'cost_reduction': np.where(
+            quintessenz, calculations.round_quintessenz(calculations.cost_reduction(savings, factors)), data['cost_reduction']
+        ),
+        'stability_increase': np.where(
+            quintessenz, calculations.round_quintessenz(calculations.stability_increase(savings, factors)), data['stability_increase']
+        ),
+    }
+
+def _python_value(value):
+    return None if np.isnan(value) else float(value)
+
+def _update_statement():
+    reports = Report.__table__
+    return reports.update().where(and_(
+        reports.c.id == bindparam('b_id'),
+        reports.c.version == bindparam('b_version')
+    )).values(
+        version=reports.c.version + 1,
+        factor_version=bindparam('b_factor_version'),
+        updated_at=bindparam('b_updated_at'),
+        **{column: bindparam(f'b_{column}') for column in DERIVED_COLUMNS}
+    )
+
+def _write_chunk(connection, data, values, factors):
+    ids = data['id']
+    now = datetime.utcnow()
+    params = [{
+        'b_id': report_id,
+        'b_version': data['version'][i],
+        'b_factor_version': factors.version,
+        'b_updated_at': now,
+        **{f'b_{column}': _python_value(values[column][i]) for column in DERIVED_COLUMNS}
+    } for i, report_id in enumerate(ids)]
+
+    # Rollup erst nach der Änderung um die Differenz korrigieren
+    criteria = Report.id.in_(ids)
+    before = report_statistics.aggregate_counters(connection, criteria)
+    result = connection.execute(_update_statement(), params)
+    after = report_statistics.aggregate_counters(connection, criteria)
+    report_statistics.apply_delta(connection, {column: after[column] - before[column] for column in after})
+    record_changes(connection, 'report', ids)
+    return result.rowcount
+
+def recalculate_reports(chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """Berechnet alle betroffenen Berichte mit den aktuellen Faktoren neu
+
+    Gibt (aktualisiert, übersprungen) zurück. ``progress`` wird nach jedem Block
+    mit den bisherigen Zählern aufgerufen.
+    """
+    updated = skipped = 0
+    while True:
+        invalidate_factors()
+        factors = current_factors()
+        after_id = 0
+        while True:
+            with db.engine.begin() as connection:
+                data = _load_chunk(connection, factors, after_id, chunk_size)
+                if data is None:
+                    break
+                rowcount = _write_chunk(connection, data, recalculate_columns(data, factors), factors)
+            updated += rowcount
+            skipped += len(data['id']) - rowcount
+            after_id = data['id'][-1]
+            if progress:
+                progress(updated, skipped)
+
+        # Während des Laufs neu angelegte Version: erneut durchlaufen
+        invalidate_factors()
+        if current_factors().version == factors.version:
+            return updated, skipped
+
+class RecalculationJob:
+    """Hintergrund-Thread für die Neuberechnung (höchstens einer pro Prozess)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread = None
+        self.state = {'running': False, 'updated': 0, 'skipped': 0, 'error': None,
+                      'started_at': None, 'finished_at': None}
+
+    def start(self, app, chunk_size=DEFAULT_CHUNK_SIZE):
+        """Startet den Job, falls er nicht schon läuft; gibt True zurück, wenn gestartet"""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return False
+            self.state = {'running': True, 'updated': 0, 'skipped': 0, 'error': None,
+                          'started_at': datetime.utcnow().isoformat(), 'finished_at': None}
+            self._thread = threading.Thread(
+                target=self._run, args=(app, chunk_size), name='report-recalculation', daemon=True
+            )
+            self._thread.start()
+            return True
+
+    def _run(self, app, chunk_size):
+        def progress(updated, skipped):
+            self.state.update(updated=updated, skipped=skipped)
+
+        try:
+            with app.app_context():
+                recalculate_reports(chunk_size, progress)
+        except Exception as e:
+            self.state['error'] = str(e)
+        finally:
+            self.state.update(running=False, finished_at=datetime.utcnow().isoformat())
+
+recalculation_job = RecalculationJob()
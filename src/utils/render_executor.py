@@ -0,0 +1,107 @@
+"""Begrenzter Executor für die PDF-Erstellung
+
+``RENDER_EXECUTOR`` legt fest, wo ReportLab läuft:
+
+- ``inline`` (Standard unter WSGI): im Thread der Anfrage.
+- ``thread``: in einem Thread-Pool mit ``RENDER_WORKERS`` Threads; jeder Auftrag
+  lädt den Bericht in einem eigenen App-Kontext.
+- ``process`` (Standard im ASGI-Modus, ``src.asgi``): in ``RENDER_WORKERS``
+  Prozessen. Jeder Prozess baut beim Start eine eigene App auf und wird nach
+  ``RENDER_MAX_TASKS_PER_CHILD`` Aufträgen ersetzt, damit der Speicherbedarf
+  vorhersehbar bleibt. Das Rendern blockiert so weder die Request-Threads
+  noch den GIL des Serverprozesses.
+
+Die Anzahl wartender Aufträge begrenzt ``src.utils.render_limiter``.
+"""
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from flask import current_app, g
+from src import db
+from src.models.report import Report
+from src.utils.enhanced_pdf_generator import generate_enhanced_report_pdf
+from src.utils.metrics import record_pdf_render
+from src.utils.tracing import continue_trace, current_traceparent
+
+EXECUTOR_KINDS = ('inline', 'thread', 'process')
+DEFAULT_WORKERS = 2
+DEFAULT_MAX_TASKS_PER_CHILD = 50
+
+_process_app = None
+
+def _init_process():
+    """Initialisierung eines Render-Prozesses: eigene App und Datenbankverbindungen"""
+    global _process_app
+    from src import create_app
+    from src.models import customer, user  # noqa: F401 - Beziehungen von Report auflösen
+    _process_app = create_app()
+
+def _render_report(app, report_id, traceparent=None, request_id=None):
+    with app.app_context(), continue_trace(traceparent, 'pdf.render_job', request_id, report_id=report_id):
+        report = db.session.get(Report, report_id)
+        if report is None:
+            raise LookupError(f'Bericht {report_id} nicht gefunden')
+        return generate_enhanced_report_pdf(report)
+
+def _render_report_in_process(report_id, traceparent=None, request_id=None):
+    return _render_report(_process_app, report_id, traceparent, request_id)
+
+class RenderExecutor:
+    """Prozessweiter Pool, der beim ersten Auftrag angelegt wird"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor = None
+        self._kind = None
+
+    def _pool(self, app, kind):
+        with self._lock:
+            if self._executor is None or self._kind != kind:
+                if self._executor is not None:
+                    self._executor.shutdown(wait=False)
+                workers = max(1, int(app.config.get('RENDER_WORKERS', DEFAULT_WORKERS)))
+                if kind == 'thread':
+                    self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='pdf-render')
+                else:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=workers,
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=_init_process,
+                        max_tasks_per_child=app.config.get('RENDER_MAX_TASKS_PER_CHILD', DEFAULT_MAX_TASKS_PER_CHILD)
+                    )
+                self._kind = kind
+            return self._executor
+
+    def render_pdf(self, report):
+        """Erstellt das PDF eines Berichts und gibt den Dateipfad zurück"""
+        app = current_app._get_current_object()
+        kind = app.config.get('RENDER_EXECUTOR', 'inline')
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f'Unbekannter RENDER_EXECUTOR: {kind}')
+
+        started = time.perf_counter()
+        if kind == 'inline':
+            pdf_path = generate_enhanced_report_pdf(report)
+        else:
+            # Der Auftrag lädt den Bericht selbst; ORM-Objekte bleiben in ihrer Session
+            trace = (current_traceparent(), g.get('request_id'))  # Spans des Auftrags gehören zur Anfrage
+            if kind == 'thread':
+                future = self._pool(app, kind).submit(_render_report, app, report.id, *trace)
+            else:
+                future = self._pool(app, kind).submit(_render_report_in_process, report.id, *trace)
+            pdf_path = future.result()
+
+        if os.path.exists(pdf_path):
+            record_pdf_render(time.perf_counter() - started, pdf_path)
+        return pdf_path
+
+    def shutdown(self, wait=True):
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+            self._executor = None
+            self._kind = None
+
+render_executor = RenderExecutor()
@@ -0,0 +1,136 @@
+"""Zugangskontrolle für die PDF-Erstellung über alle Worker-Prozesse
+
+ReportLab blockiert einen Worker für die gesamte Renderdauer. Damit bei vielen
+gleichzeitigen PDF-Anfragen noch Worker für die übrige API frei bleiben, dürfen
+höchstens ``PDF_RENDER_CONCURRENCY`` PDFs gleichzeitig entstehen.
+
+Plätze und Warteplätze sind Lock-Dateien in ``PDF_RENDER_LOCK_DIR``, die per
+``flock`` belegt werden. Das gilt für alle Prozesse auf dem Rechner, und ein
+abgestürzter Prozess gibt seinen Platz automatisch frei. Ist kein Platz frei,
+wartet die Anfrage auf einem von ``PDF_RENDER_QUEUE`` Warteplätzen höchstens
+``PDF_RENDER_TIMEOUT`` Sekunden. Sind auch alle Warteplätze belegt oder läuft
+die Wartezeit ab, wird ``RenderBusy`` mit einer Retry-After-Schätzung
+ausgelöst. Ohne ``fcntl`` (Windows) gilt die Grenze pro Prozess.
+"""
+import errno
+import math
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from flask import current_app
+from src.utils.metrics import PDF_RENDER_REJECTED
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+DEFAULT_CONCURRENCY = 2
+DEFAULT_QUEUE_SIZE = 8
+DEFAULT_WAIT_TIMEOUT = 20  # Sekunden
+DEFAULT_RENDER_SECONDS = 3  # Schätzung, bis die erste Renderdauer gemessen ist
+POLL_INTERVAL = 0.05
+MAX_POLL_INTERVAL = 0.25
+
+class RenderBusy(Exception):
+    """Alle Plätze und Warteplätze belegt oder Wartezeit abgelaufen"""
+
+    def __init__(self, retry_after):
+        super().__init__(f'PDF-Erstellung ausgelastet, bitte in {retry_after} s erneut versuchen')
+        self.retry_after = retry_after
+
+def _try_flock(path):
+    fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError as e:
+        os.close(fd)
+        if e.errno in (errno.EAGAIN, errno.EACCES):
+            return None
+        raise
+    return fd
+
+def _release_flock(fd):
+    try:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+class RenderLimiter:
+    """Prozessübergreifendes Semaphor mit begrenzter Warteschlange"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._semaphores = {}
+        self._average_seconds = None
+
+    def _settings(self):
+        config = current_app.config
+        return (
+            max(1, int(config.get('PDF_RENDER_CONCURRENCY', DEFAULT_CONCURRENCY))),
+            max(0, int(config.get('PDF_RENDER_QUEUE', DEFAULT_QUEUE_SIZE))),
+            float(config.get('PDF_RENDER_TIMEOUT', DEFAULT_WAIT_TIMEOUT)),
+            config.get('PDF_RENDER_LOCK_DIR') or os.path.join(tempfile.gettempdir(), 'haral-pdf-render')
+        )
+
+    def _try_acquire(self, kind, count, directory):
+        """Belegt einen freien Platz der Art ``kind``; gibt die Freigabefunktion oder None zurück"""
+        if fcntl is None:
+            with self._lock:
+                semaphore = self._semaphores.setdefault((kind, count), threading.BoundedSemaphore(count))
+            return semaphore.release if semaphore.acquire(blocking=False) else None
+
+        os.makedirs(directory, exist_ok=True)
+        start = os.getpid() + threading.get_ident()  # Prozesse beginnen bei verschiedenen Plätzen
+        for offset in range(count):
+            fd = _try_flock(os.path.join(directory, f'{kind}-{(start + offset) % count}.lock'))
+            if fd is not None:
+                return lambda: _release_flock(fd)
+        return None
+
+    def retry_after(self, concurrency, queue_size):
+        """Geschätzte Sekunden, bis Warteschlange und laufende Renderjobs abgearbeitet sind"""
+        seconds = self._average_seconds or DEFAULT_RENDER_SECONDS
+        return max(1, math.ceil(seconds * (1 + queue_size / concurrency)))
+
+    def _record(self, seconds):
+        with self._lock:
+            if self._average_seconds is None:
+                self._average_seconds = seconds
+            else:
+                self._average_seconds = 0.8 * self._average_seconds + 0.2 * seconds
+
+    @contextmanager
+    def slot(self):
+        """Kontext, in dem genau ein PDF gerendert werden darf (wirft RenderBusy)"""
+        concurrency, queue_size, timeout, directory = self._settings()
+
+        release = self._try_acquire('slot', concurrency, directory)
+        if release is None:
+            release_ticket = self._try_acquire('queue', queue_size, directory) if queue_size else None
+            if release_ticket is None:
+                PDF_RENDER_REJECTED.inc()
+                raise RenderBusy(self.retry_after(concurrency, queue_size))
+            try:
+                deadline = time.monotonic() + timeout
+                interval = POLL_INTERVAL
+                while release is None:
+                    if time.monotonic() >= deadline:
+                        PDF_RENDER_REJECTED.inc()
+                        raise RenderBusy(self.retry_after(concurrency, queue_size))
+                    time.sleep(interval)
+                    interval = min(interval * 2, MAX_POLL_INTERVAL)
+                    release = self._try_acquire('slot', concurrency, directory)
+            finally:
+                release_ticket()
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            release()
+            self._record(time.monotonic() - started)
+
+render_limiter = RenderLimiter()
@@ -0,0 +1,140 @@
+"""Massenoperationen auf Berichten direkt in der Datenbank
+
+- Duplizieren per ``INSERT … SELECT`` (inkl. Alternativen), ohne die Originale zu laden
+- Statuswechsel ganzer Berichtsmengen: Zeilen per ``SELECT … FOR UPDATE`` sperren,
+  dann blockweise ``UPDATE`` über die gesperrten IDs
+
+Die ORM-Ereignisse greifen hier nicht; Statistik-Rollup und Änderungsprotokoll
+werden deshalb explizit nachgeführt.
+"""
+from datetime import datetime
+from sqlalchemy import case, func, literal, select
+from src.models.report import Report
+from src.models.report_alternative import ReportAlternative
+from src.models import report_statistics
+from src.models.change_log import record_changes
+from src.utils.audit_numbers import allocate_audit_numbers
+
+# Anzahl Berichte je INSERT … SELECT (begrenzt die Größe der CASE-Ausdrücke)
+DUPLICATE_CHUNK_SIZE = 500
+# Anzahl IDs je UPDATE beim Statuswechsel
+STATUS_CHUNK_SIZE = 1000
+COPY_SUFFIX = ' (Kopie)'
+
+def _chunks(values, size):
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+def _duplicate_chunk(connection, source_ids, audit_numbers, now):
+    """Dupliziert einen Block; gibt {Original-ID: neue ID} zurück"""
+    reports = Report.__table__
+    numbers = dict(zip(source_ids, audit_numbers))
+
+    overrides = {
+        'audit_number': case(numbers, value=reports.c.id),
+        # Titel kürzen, damit der Zusatz in die Spalte passt (PostgreSQL lehnt zu lange Werte ab)
+        'title': func.substr(reports.c.title, 1, reports.c.title.type.length - len(COPY_SUFFIX)) + COPY_SUFFIX,
+        'status': literal('draft'),  # Neue Berichte sind immer Entwürfe
+        'version': literal(1),
+        'created_at': literal(now, reports.c.created_at.type),
+        'updated_at': literal(now, reports.c.updated_at.type),
+    }
+    columns = [column for column in reports.columns if not column.primary_key]
+    connection.execute(reports.insert().from_select(
+        [column.key for column in columns],
+        select(*[overrides.get(column.key, column) for column in columns]).where(
+            reports.c.id.in_(source_ids)
+        )
+    ))
+
+    ids_by_number = dict(connection.execute(
+        select(reports.c.audit_number, reports.c.id).where(reports.c.audit_number.in_(numbers.values()))
+    ).all())
+    new_ids = {source_id: ids_by_number[number] for source_id, number in numbers.items()}
+
+    # Normalisierte Alternativen der Originale mitkopieren
+    alternatives = ReportAlternative.__table__
+    alternative_columns = [
+        column for column in alternatives.columns if not column.primary_key
+    ]
+    connection.execute(alternatives.insert().from_select(
+        [column.key for column in alternative_columns],
+        select(*[
+            case(new_ids, value=alternatives.c.report_id) if column.key == 'report_id' else column
+            for column in alternative_columns
+        ]).where(alternatives.c.report_id.in_(source_ids))
+    ))
+
+    report_statistics.apply_aggregate(connection, reports.c.id.in_(list(new_ids.values())))
+    record_changes(connection, 'report', list(new_ids.values()))
+    return new_ids
+
+def duplicate_reports(connection, report_ids):
+    """Dupliziert Berichte serverseitig; gibt (Original-ID, neue ID)-Paare zurück
+
+    Nicht vorhandene IDs werden übersprungen. Berechnete Werte werden übernommen,
+    da die Eingabewerte identisch sind.
+    """
+    reports = Report.__table__
+    existing = set()
+    for chunk in _chunks(sorted(set(report_ids)), DUPLICATE_CHUNK_SIZE):
+        existing.update(connection.execute(select(reports.c.id).where(reports.c.id.in_(chunk))).scalars())
+    source_ids = [report_id for report_id in dict.fromkeys(report_ids) if report_id in existing]
+
+    # Alle Prüfnummern vor dem ersten INSERT reservieren: der Allokator schreibt in
+    # einer eigenen Transaktion, die auf SQLite sonst auf diese warten würde
+    audit_numbers = allocate_audit_numbers(len(source_ids)) if source_ids else []
+
+    now = datetime.utcnow()
+    pairs = []
+    for start in range(0, len(source_ids), DUPLICATE_CHUNK_SIZE):
+        chunk = source_ids[start:start + DUPLICATE_CHUNK_SIZE]
+        new_ids = _duplicate_chunk(connection, chunk, audit_numbers[start:start + DUPLICATE_CHUNK_SIZE], now)
+        pairs.extend((source_id, new_ids[source_id]) for source_id in chunk)
+    return pairs
+
+def status_criteria(report_ids=None, status=None, customer_id=None, created_from=None, created_to=None):
+    """Auswahlkriterien für Statuswechsel (IDs und/oder Filter)"""
+    criteria = []
+    if report_ids is not None:
+        criteria.append(Report.id.in_(report_ids))
+    if status:
+        criteria.append(Report.status == status)
+    if customer_id:
+        criteria.append(Report.customer_id == customer_id)
+    if created_from:
+        criteria.append(Report.created_at >= created_from)
+    if created_to:
+        criteria.append(Report.created_at < created_to)
+    return criteria
+
+def transition_status(connection, new_status, *criteria):
+    """Setzt den Status aller passenden Berichte mit einem UPDATE; gibt die geänderten IDs zurück"""
+    if new_status not in report_statistics.REPORT_STATUSES:
+        raise ValueError(f'Ungültiger Status: {new_status}')
+    criteria = criteria + (Report.status != new_status,)
+
+    # Zeilen sperren und den alten Status lesen: das Delta für die Statistik
+    # stammt aus genau den Zeilen, die anschließend geändert werden
+    reports = Report.__table__
+    locked = connection.execute(
+        select(reports.c.id, reports.c.status).where(*criteria).with_for_update()
+    ).all()
+    ids = [report_id for report_id, _ in locked]
+
+    now = datetime.utcnow()
+    for chunk in _chunks(ids, STATUS_CHUNK_SIZE):
+        connection.execute(reports.update().where(reports.c.id.in_(chunk)).values(
+            status=new_status,
+            version=reports.c.version + 1,
+            updated_at=now
+        ))
+
+    # Nur die Statuszähler verschieben sich; Einsparungssummen bleiben gleich
+    delta = {f'{new_status}_reports': len(locked)}
+    for _, old_status in locked:
+        if old_status in report_statistics.REPORT_STATUSES:
+            delta[f'{old_status}_reports'] = delta.get(f'{old_status}_reports', 0) - 1
+    report_statistics.apply_delta(connection, delta)
+    record_changes(connection, 'report', ids)
+    return sorted(ids)
@@ -0,0 +1,66 @@
+"""Streaming-Export von Berichten als NDJSON oder CSV
+
+Berichte werden mit ``yield_per`` (serverseitiger Cursor auf PostgreSQL)
+blockweise gelesen und sofort geschrieben, sodass der Speicherbedarf
+unabhängig von der Tabellengröße konstant bleibt.
+"""
+import csv
+import io
+import json
+from datetime import datetime
+from src.models.report import Report
+from src.utils.json_provider import dumps_compact
+
+EXPORT_BATCH_SIZE = 500
+JSON_FIELDS = ('alternatives', 'images', 'holding_force_deviations')
+COMPUTED_FIELDS = ('holding_force_deviations',)  # in Report.to_dict nach den Tabellenspalten
+
+def export_query(since=None, status=None, customer_id=None):
+    query = Report.query
+    if since:
+        query = query.filter(Report.updated_at >= since)
+    if status:
+        query = query.filter(Report.status == status)
+    if customer_id:
+        query = query.filter(Report.customer_id == customer_id)
+    return query.order_by(Report.id).yield_per(EXPORT_BATCH_SIZE)
+
+def iter_ndjson(query):
+    buffer = []
+    for report in query:
+        buffer.append(dumps_compact(report.to_dict(include_relations=False)))
+        if len(buffer) >= EXPORT_BATCH_SIZE:
+            yield '\n'.join(buffer) + '\n'
+            buffer = []
+    if buffer:
+        yield '\n'.join(buffer) + '\n'
+
+def csv_columns():
+    """Spaltenreihenfolge entspricht Report.to_dict ohne Verknüpfungen
+
+    Aus den Tabellenspalten statt aus ``Report()`` gebildet: der Konstruktor
+    vergibt eine Prüfnummer und würde beim Export den Nummernkreis verbrauchen.
+    """
+    return [column.name for column in Report.__table__.columns] + list(COMPUTED_FIELDS)
+
+def iter_csv(query):
+    output = io.StringIO()
+    # Kopfzeile auch dann, wenn kein Bericht passt
+    writer = csv.DictWriter(output, fieldnames=csv_columns())
+    writer.writeheader()
+
+    rows = 0
+    for report in query:
+        row = report.to_dict(include_relations=False)
+        for field in JSON_FIELDS:
+            row[field] = json.dumps(row[field], ensure_ascii=False) if row[field] else ''
+        for field, value in row.items():
+            if isinstance(value, datetime):
+                row[field] = value.isoformat()
+        writer.writerow(row)
+        rows += 1
+        if rows % EXPORT_BATCH_SIZE == 0:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+    yield output.getvalue()
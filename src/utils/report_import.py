@@ -0,0 +1,195 @@
+"""Massenimport von Berichten aus CSV oder NDJSON
+
+Die Eingabe wird zeilenweise gelesen und in Blöcken verarbeitet: Kunden und
+Benutzer werden pro Block mit einer Abfrage geprüft, Auftragsnummern als
+Block reserviert und die Berichte per ``executemany`` eingefügt. Fehlerhafte
+Zeilen werden mit Zeilennummer gemeldet, ohne den restlichen Import abzubrechen.
+"""
+import csv
+import json
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from src import db
+from src.models.customer import Customer
+from src.models.report import Report
+from src.models.report_alternative import ReportAlternative
+from src.models.user import User
+from src.models import report_statistics
+from src.models.change_log import record_changes
+from src.utils.audit_numbers import allocate_audit_numbers
+from src.utils.report_schema import REPORT_SCHEMA, ValidationError
+
+DEFAULT_CHUNK_SIZE = 500
+
+class ImportResult:
+    def __init__(self):
+        self.imported_ids = []
+        self.errors = []
+
+    def add_error(self, row_number, message):
+        self.errors.append({'row': row_number, 'error': message})
+
+    def to_dict(self):
+        return {
+            'imported': len(self.imported_ids),
+            'failed': len(self.errors),
+            'ids': self.imported_ids,
+            'errors': sorted(self.errors, key=lambda error: error['row'])
+        }
+
+def iter_ndjson_rows(stream):
+    """Liefert (Zeilennummer, Daten oder Fehlermeldung) je nicht-leerer Zeile"""
+    for row_number, line in enumerate(stream, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield row_number, f'Ungültiges JSON: {e.msg}'
+            continue
+        if not isinstance(data, dict):
+            yield row_number, 'Zeile ist kein JSON-Objekt'
+            continue
+        yield row_number, data
+
+def iter_csv_rows(stream):
+    """Liefert (Zeilennummer, Daten oder Fehlermeldung) je CSV-Datensatz"""
+    header_line = stream.readline()
+    if not header_line:
+        return
+    # Trennzeichen aus der Kopfzeile ableiten (Excel exportiert in DE mit Semikolon)
+    delimiter = max(',;\t', key=header_line.count)
+    header = next(csv.reader([header_line], delimiter=delimiter))
+    reader = csv.DictReader(stream, fieldnames=[name.strip() for name in header], delimiter=delimiter)
+
+    # Werte bleiben Text; Ja/Nein, Zahlen und JSON konvertiert das Feldschema
+    for row_number, row in enumerate(reader, start=2):
+        data = {}
+        for key, value in row.items():
+            if key is None or value is None:
+                continue
+            value = value.strip()
+            if value != '':
+                data[key] = value
+        yield row_number, data
+
+def _column_values(report, now):
+    """Spaltenwerte eines (nicht gespeicherten) Berichts für einen Core-Insert"""
+    values = {}
+    for column in Report.__table__.columns:
+        if column.primary_key:
+            continue
+        value = getattr(report, column.key)
+        if value is None and column.default is not None:
+            if column.default.is_callable:
+                value = now if column.key in ('created_at', 'updated_at') else column.default.arg(None)
+            elif column.default.is_scalar:
+                value = column.default.arg
+        values[column.key] = value
+    return values
+
+def _existing_ids(model, ids):
+    if not ids:
+        return set()
+    return set(db.session.execute(select(model.id).where(model.id.in_(ids))).scalars())
+
+def _prepare_chunk(rows, result):
+    """Validiert einen Block und erstellt die Insert-Parameter"""
+    candidates = []
+    for row_number, data in rows:
+        if isinstance(data, str):
+            result.add_error(row_number, data)
+            continue
+        try:
+            candidates.append((row_number, REPORT_SCHEMA.load(data)))
+        except ValidationError as e:
+            result.add_error(row_number, str(e))
+
+    customer_ids = _existing_ids(Customer, {values['customer_id'] for _, values in candidates})
+    user_ids = _existing_ids(User, {values['user_id'] for _, values in candidates})
+    audit_numbers = iter(allocate_audit_numbers(sum(1 for _, values in candidates if not values.get('audit_number'))))
+
+    prepared = []
+    now = datetime.utcnow()
+    for row_number, values in candidates:
+        if values['customer_id'] not in customer_ids:
+            result.add_error(row_number, 'Kunde nicht gefunden')
+            continue
+        if values['user_id'] not in user_ids:
+            result.add_error(row_number, 'Benutzer nicht gefunden')
+            continue
+        if not values.get('audit_number'):
+            values['audit_number'] = next(audit_numbers)
+        report = Report.from_values(values)
+        report.update_calculations()
+        prepared.append((row_number, _column_values(report, now), report.get_alternatives()))
+    return prepared
+
+def _insert(prepared):
+    """Fügt Berichte und ihre Alternativen ein; gibt die neuen IDs in Eingabereihenfolge zurück"""
+    if not prepared:
+        return []
+    reports_table = Report.__table__
+    db.session.execute(reports_table.insert(), [values for _, values, _ in prepared])
+
+    numbers = [values['audit_number'] for _, values, _ in prepared]
+    ids_by_number = dict(db.session.execute(
+        select(Report.audit_number, Report.id).where(Report.audit_number.in_(numbers))
+    ).all())
+    ids = [ids_by_number[number] for number in numbers]
+
+    alternative_rows = [
+        dict(ReportAlternative.row_values(alternative, position), report_id=report_id)
+        for report_id, (_, _, alternatives) in zip(ids, prepared)
+        for position, alternative in enumerate(alternatives)
+        if isinstance(alternative, dict)
+    ]
+    if alternative_rows:
+        db.session.execute(ReportAlternative.__table__.insert(), alternative_rows)
+
+    connection = db.session.connection()
+    report_statistics.apply_aggregate(connection, Report.id.in_(ids))
+    record_changes(connection, 'report', ids)
+    return ids
+
+def _import_chunk(rows, result):
+    prepared = _prepare_chunk(rows, result)
+    try:
+        result.imported_ids.extend(_insert(prepared))
+        db.session.commit()
+        return
+    except IntegrityError:
+        db.session.rollback()
+
+    # Block enthält Konflikte (z.B. doppelte Auftragsnummern): zeilenweise wiederholen
+    for entry in prepared:
+        try:
+            with db.session.begin_nested():
+                ids = _insert([entry])
+        except IntegrityError as e:
+            result.add_error(entry[0], f'Datenbankfehler: {e.orig}')
+            continue
+        result.imported_ids.extend(ids)
+    db.session.commit()
+
+def import_reports(rows, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Importiert (Zeilennummer, Daten)-Paare blockweise und gibt ein ImportResult zurück"""
+    result = ImportResult()
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= chunk_size:
+            _import_chunk(chunk, result)
+            chunk = []
+    if chunk:
+        _import_chunk(chunk, result)
+    return result
+
+def parse_rows(stream, format):
+    if format == 'csv':
+        return iter_csv_rows(stream)
+    if format == 'ndjson':
+        return iter_ndjson_rows(stream)
+    raise ValueError(f'Unbekanntes Importformat: {format}')
@@ -0,0 +1,221 @@
+"""Deklaratives Feldschema der Berichte
+
+Das Schema wird einmalig aus den Spalten von ``Report`` abgeleitet und in
+einen Konverter pro Feld übersetzt. Anlegen, Aktualisieren, Duplizieren und
+der Massenimport verwenden dieselben Konverter; ungültige Werte werden pro
+Feld gesammelt, statt beim ersten Fehler abzubrechen.
+"""
+import json
+import math
+from src import db
+from src.models.report import Report
+from src.models.report_statistics import REPORT_STATUSES
+
+# Eingaben für Ja/Nein-Felder (CSV, Formulare); alles andere ist Nein
+TRUE_VALUES = frozenset(['1', 'true', 'yes', 'ja', 'x', 'on'])
+
+# Nicht beschreibbar: Schlüssel, Versionszähler, Zeitstempel und berechnete Werte
+READ_ONLY_FIELDS = frozenset(['id', 'version', 'factor_version', 'created_at', 'updated_at']) | frozenset(Report.CONSUMPTION_OUTPUTS)
+
+# Nur beim Anlegen setzbar
+CREATE_ONLY_FIELDS = frozenset(['customer_id', 'user_id', 'audit_number'])
+
+# Werden beim Anlegen erzeugt, wenn sie fehlen
+GENERATED_FIELDS = frozenset(['audit_number'])
+
+# JSON-Listen werden über die Setter des Modells gesetzt (hält die Alternativzeilen synchron)
+JSON_SETTERS = {'alternatives': 'set_alternatives', 'images': 'set_images'}
+
+FIELD_CHOICES = {'status': REPORT_STATUSES}
+
+class ValidationError(ValueError):
+    """Ungültige Eingabedaten; ``errors`` enthält je Feld eine Meldung"""
+
+    def __init__(self, errors):
+        self.errors = errors
+        super().__init__('; '.join(errors.values()))
+
+def _boolean(name):
+    def convert(value):
+        # None/null bedeutet Nein (Spalten haben die Vorgabe False)
+        if isinstance(value, str):
+            return value.strip().lower() in TRUE_VALUES
+        return bool(value)
+    return convert
+
+def _integer(name):
+    message = f'Feld {name} muss eine Ganzzahl sein'
+    def convert(value):
+        if value is None or value == '':
+            return None
+        if isinstance(value, bool):
+            raise ValueError(message)
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ValueError(message)
+    return convert
+
+def _float(name):
+    message = f'Feld {name} muss eine Zahl sein'
+    def convert(value):
+        if value is None or value == '':
+            return None
+        if isinstance(value, bool):
+            raise ValueError(message)
+        if isinstance(value, str):
+            value = value.strip().replace(',', '.')  # Dezimalkomma aus deutschen Tabellen
+        try:
+            value = float(value)
+        except (TypeError, ValueError):
+            raise ValueError(message)
+        if not math.isfinite(value):
+            raise ValueError(message)
+        return value
+    return convert
+
+def _string(name, max_length=None):
+    def convert(value):
+        if value is None:
+            return None
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            value = str(value)
+        elif not isinstance(value, str):
+            raise ValueError(f'Feld {name} muss ein Text sein')
+        if max_length is not None and len(value) > max_length:
+            raise ValueError(f'Feld {name} ist zu lang (max. {max_length} Zeichen)')
+        return value
+    return convert
+
+def _json_list(name):
+    message = f'Feld {name} muss eine Liste sein'
+    def convert(value):
+        if value is None or value == '':
+            return None
+        if isinstance(value, str):
+            try:
+                value = json.loads(value)
+            except json.JSONDecodeError:
+                raise ValueError(message)
+        if not isinstance(value, list):
+            raise ValueError(message)
+        return value
+    return convert
+
+def _choice(convert, name, choices):
+    message = f'Feld {name} hat einen ungültigen Wert (erlaubt: {", ".join(choices)})'
+    def convert_choice(value):
+        value = convert(value)
+        if value is not None and value not in choices:
+            raise ValueError(message)
+        return value
+    return convert_choice
+
+def _converter(column):
+    """Konverter passend zum Spaltentyp"""
+    column_type = column.type
+    if isinstance(column_type, db.Boolean):
+        convert = _boolean(column.key)
+    elif isinstance(column_type, db.Integer):
+        convert = _integer(column.key)
+    elif isinstance(column_type, db.Float):
+        convert = _float(column.key)
+    elif isinstance(column_type, db.String):  # inkl. Text
+        convert = _string(column.key, column_type.length)
+    elif column.key in JSON_SETTERS:
+        convert = _json_list(column.key)
+    else:
+        raise TypeError(f'Kein Konverter für Spalte {column.key} ({column_type})')
+
+    if column.key in FIELD_CHOICES:
+        convert = _choice(convert, column.key, FIELD_CHOICES[column.key])
+    return convert
+
+class Field:
+    __slots__ = ('name', 'convert', 'nullable', 'has_default')
+
+    def __init__(self, column):
+        self.name = column.key
+        self.convert = _converter(column)
+        self.nullable = column.nullable
+        self.has_default = column.default is not None or column.key in GENERATED_FIELDS
+
+class ReportSchema:
+    """Aus den Spalten kompiliertes Schema mit einem Konverter je Feld"""
+
+    def __init__(self, table):
+        self.fields = tuple(
+            Field(column) for column in table.columns if column.key not in READ_ONLY_FIELDS
+        )
+        self.updatable_fields = tuple(
+            field for field in self.fields if field.name not in CREATE_ONLY_FIELDS
+        )
+        self.names = frozenset(field.name for field in self.fields)
+        self.updatable_names = frozenset(field.name for field in self.updatable_fields)
+
+    def load(self, data, partial=False):
+        """Konvertiert Eingabedaten in Spaltenwerte
+
+        ``partial=False`` (Anlegen): alle Felder, Pflichtfelder werden geprüft.
+        ``partial=True`` (Aktualisieren): nur übermittelte, änderbare Felder.
+        Unbekannte Felder werden ignoriert. Wirft ``ValidationError`` mit allen
+        fehlerhaften Feldern.
+        """
+        values = {}
+        errors = {}
+        for field in self.updatable_fields if partial else self.fields:
+            name = field.name
+            value = None
+            if name in data:
+                try:
+                    value = field.convert(data[name])
+                except ValueError as e:
+                    errors[name] = str(e)
+                    continue
+
+            if not field.nullable and (value is None or value == ''):
+                if partial:
+                    if name in data:
+                        errors[name] = f'Feld {name} darf nicht leer sein'
+                    continue
+                if not field.has_default:
+                    errors[name] = f'Feld {name} ist erforderlich'
+                continue  # sonst greift die Spaltenvorgabe bzw. der erzeugte Wert
+
+            if name in data:
+                values[name] = value
+
+        if errors:
+            raise ValidationError(errors)
+        return values
+
+    def unknown_fields(self, data, allowed=()):
+        """Übermittelte Felder, die nicht geändert werden können"""
+        return sorted(set(data) - self.updatable_names - set(allowed))
+
+    def apply(self, report, values):
+        """Überträgt konvertierte Werte auf einen Bericht; gibt die geänderten Felder zurück"""
+        changed = set()
+        for name, value in values.items():
+            setter = JSON_SETTERS.get(name)
+            if setter:
+                getattr(report, setter)(value)
+                changed.add(name)
+            elif getattr(report, name) != value:
+                setattr(report, name, value)
+                changed.add(name)
+        return changed
+
+    def copy_values(self, report, exclude=()):
+        """Spaltenwerte eines bestehenden Berichts (z.B. zum Duplizieren)"""
+        values = {}
+        for field in self.fields:
+            if field.name in exclude:
+                continue
+            if field.name in JSON_SETTERS:
+                values[field.name] = list(getattr(report, f'get_{field.name}')())
+            else:
+                values[field.name] = getattr(report, field.name)
+        return values
+
+REPORT_SCHEMA = ReportSchema(Report.__table__)
@@ -0,0 +1,218 @@
+"""Was-wäre-wenn-Szenarien für Foliendicke, Vordehnung und Wickelschema
+
+Ein Bericht liefert die Ausgangswerte (Verbrauch pro Palette bei aktueller
+Foliendicke, Vordehnung und Wicklungszahl). Für jedes Szenario des Rasters
+wird der Verbrauch vereinfacht skaliert:
+
+    Verbrauch ~ Foliendicke × Wicklungen / (1 + Vordehnung)
+
+und die Haltekraft proportional zu Foliendicke × Wicklungen geschätzt. Kosten,
+CO2 und Quintessenz kommen aus denselben Formeln wie beim Bericht
+(``src.utils.calculations``). Zurückgegeben werden die Pareto-optimalen
+Szenarien (minimale Kosten bei maximaler Haltekraft).
+"""
+import math
+import numpy as np
+from src.models.calculation_factors import current_factors
+from src.utils import calculations
+
+MAX_SCENARIOS = 100000
+WINDING_FIELDS = ('windings_top', 'windings_middle', 'windings_bottom')
+WINDING_ZONES = ('top', 'middle', 'bottom')
+RANGE_TOLERANCE = 1e-9  # Rundungsfehler, z. B. (0.3 - 0.1) / 0.1
+
+class ScenarioError(ValueError):
+    pass
+
+def _range(spec, name):
+    """(Start, Schrittweite, Anzahl) eines Bereichs ``{"min", "max", "step"}``, ohne ihn anzulegen"""
+    try:
+        start, stop, step = float(spec['min']), float(spec['max']), float(spec.get('step', 1))
+    except (KeyError, TypeError, ValueError):
+        raise ScenarioError(f'{name}: Bereich benötigt min, max und optional step')
+    if not all(math.isfinite(value) for value in (start, stop, step)):
+        raise ScenarioError(f'{name}: Grenzen und Schrittweite müssen endlich sein')
+    if step <= 0 or stop < start:
+        raise ScenarioError(f'{name}: ungültiger Bereich')
+    return start, step, math.floor((stop - start) / step + RANGE_TOLERANCE) + 1
+
+def _length(spec, name):
+    """Anzahl Werte einer Liste oder eines Bereichs"""
+    if isinstance(spec, dict):
+        return _range(spec, name)[2]
+    if isinstance(spec, list) and spec:
+        return len(spec)
+    raise ScenarioError(f'{name}: Liste oder Bereich erwartet')
+
+def _values(spec, name):
+    """Liste von Werten oder Bereich als Array (Größe vorher mit ``_length`` prüfen)"""
+    if isinstance(spec, dict):
+        start, step, length = _range(spec, name)
+        return start + step * np.arange(length)
+    try:
+        values = np.asarray([float(value) for value in spec], dtype=float)
+    except (TypeError, ValueError):
+        raise ScenarioError(f'{name}: Zahlen erwartet')
+    if not np.isfinite(values).all():
+        raise ScenarioError(f'{name}: endliche Zahlen erwartet')
+    return values
+
+def _zone_specs(spec, base):
+    return [(spec.get(zone) if spec.get(zone) is not None else [base[i]], f'windings.{zone}')
+            for i, zone in enumerate(WINDING_ZONES)]
+
+def _winding_count(spec, base):
+    """Anzahl Wickelschemata, ohne das Raster anzulegen"""
+    if spec is None:
+        return 3 ** len(WINDING_ZONES)
+    if isinstance(spec, dict):
+        return math.prod(_length(zone_spec, name) for zone_spec, name in _zone_specs(spec, base))
+    if isinstance(spec, list) and spec:
+        return len(spec)
+    raise ScenarioError('windings: Liste oder Bereiche je Zone erwartet')
+
+def _winding_schemes(spec, base):
+    """Wickelschemata als (n, 3)-Array [oben, mitte, unten] (Größe vorher mit ``_winding_count`` prüfen)"""
+    if spec is None:
+        # Ausgangsschema und je eine Wicklung weniger/mehr in jeder Zone
+        offsets = np.array(np.meshgrid([-1, 0, 1], [-1, 0, 1], [-1, 0, 1])).T.reshape(-1, 3)
+        schemes = base + offsets
+        return schemes[(schemes >= 0).all(axis=1) & (schemes.sum(axis=1) > 0)]
+    if isinstance(spec, dict):
+        zones = [_values(zone_spec, name) for zone_spec, name in _zone_specs(spec, base)]
+        schemes = np.array(np.meshgrid(*zones)).T.reshape(-1, 3)
+    else:
+        try:
+            schemes = np.asarray(spec, dtype=float).reshape(-1, 3)
+        except (TypeError, ValueError):
+            raise ScenarioError('windings: Liste von [oben, mitte, unten] erwartet')
+        if not np.isfinite(schemes).all():
+            raise ScenarioError('windings: endliche Zahlen erwartet')
+    if (schemes < 0).any() or (schemes.sum(axis=1) <= 0).any():
+        raise ScenarioError('windings: Wicklungszahlen müssen positiv sein')
+    return schemes
+
+def _int_or_none(value):
+    return None if value is None else int(value)
+
+def _mean(values):
+    values = [value for value in values if value]
+    return sum(values) / len(values) if values else None
+
+def pareto_front(costs, holding_force):
+    """Indizes der Szenarien, die von keinem günstigeren mit mehr Haltekraft dominiert werden"""
+    order = np.lexsort((-holding_force, costs))  # Kosten aufsteigend, bei Gleichstand Haltekraft absteigend
+    sorted_force = holding_force[order]
+    best_before = np.concatenate(([-np.inf], np.maximum.accumulate(sorted_force)[:-1]))
+    return order[sorted_force > best_before]
+
+def evaluate(report, film_thickness=None, prestretch=None, windings=None, only_feasible=False,
+             min_holding_force=None, factors=None):
+    """Bewertet das Raster Foliendicke × Vordehnung × Wickelschema für einen Bericht"""
+    base_thickness = report.film_thickness
+    base_consumption = report.film_consumption_per_pallet
+    pallets = report.pallets_per_year
+    if not (base_thickness and base_consumption and pallets):
+        raise ScenarioError('Für Szenarien werden Foliendicke, Verbrauch pro Palette und Paletten pro Jahr benötigt')
+
+    factors = factors or current_factors()
+    base_prestretch = report.prestretch_actual or 0
+    base_windings = np.array([getattr(report, field) or 0 for field in WINDING_FIELDS], dtype=float)
+    if base_windings.sum() <= 0:
+        if windings is not None:
+            raise ScenarioError('Für Wickelschema-Szenarien wird das aktuelle Wickelschema benötigt')
+        # Ohne Wickelschema bleibt die Wicklungszahl unverändert
+        base_windings = np.array([0, 1, 0], dtype=float)
+        windings = [base_windings.tolist()]
+
+    if film_thickness is None:
+        film_thickness = {'min': min(8, base_thickness), 'max': base_thickness, 'step': 1}
+    max_prestretch = report.max_prestretch or max(base_prestretch, 300)
+    if prestretch is None:
+        prestretch = ({'min': base_prestretch, 'max': max_prestretch, 'step': 10}
+                      if max_prestretch > base_prestretch else [base_prestretch])
+
+    # Größe des Rasters prüfen, bevor Arrays angelegt werden
+    count = (_length(film_thickness, 'film_thickness') * _length(prestretch, 'prestretch')
+             * _winding_count(windings, base_windings))
+    if count > MAX_SCENARIOS:
+        raise ScenarioError(f'Zu viele Szenarien ({count}, maximal {MAX_SCENARIOS})')
+
+    thickness = _values(film_thickness, 'film_thickness')
+    prestretch_values = _values(prestretch, 'prestretch')
+    schemes = _winding_schemes(windings, base_windings)
+
+    if (thickness <= 0).any() or (prestretch_values < 0).any():
+        raise ScenarioError('Foliendicke muss positiv und Vordehnung nicht negativ sein')
+
+    # Raster aufspannen: eine Zeile je Kombination
+    t, p, w = np.meshgrid(thickness, prestretch_values, np.arange(len(schemes)), indexing='ij')
+    t, p, w = t.ravel(), p.ravel(), w.ravel()
+    winding_totals = schemes.sum(axis=1)[w]
+    thickness_ratio = t / base_thickness
+    winding_ratio = winding_totals / base_windings.sum()
+
+    per_pallet = base_consumption * thickness_ratio * winding_ratio * (1 + base_prestretch / 100) / (1 + p / 100)
+    consumption = calculations.annual_material_consumption(per_pallet, pallets)
+    costs = calculations.annual_costs(consumption, report.roll_core_weight or 0, pallets, factors)
+    emissions = calculations.co2_emissions(consumption, factors)
+
+    base_annual = calculations.annual_material_consumption(base_consumption, pallets)
+    material_savings = (base_annual - consumption) / base_annual * 100
+
+    relative_force = thickness_ratio * winding_ratio
+    base_force = _mean(getattr(report, f'holding_force_{side}_actual') for side in calculations.HOLDING_FORCE_SIDES)
+    required_force = min_holding_force or _mean(
+        getattr(report, f'holding_force_{side}_target') for side in calculations.HOLDING_FORCE_SIDES
+    )
+    holding_force = relative_force * base_force if base_force else relative_force
+    if base_force and required_force:
+        feasible = holding_force >= required_force
+    else:
+        feasible = np.ones(len(t), dtype=bool)
+
+    candidates = np.flatnonzero(feasible) if only_feasible else np.arange(len(t))
+    front = candidates[pareto_front(costs[candidates], holding_force[candidates])]
+
+    has_windings = any(getattr(report, field) for field in WINDING_FIELDS)
+
+    def scenario(i):
+        winding_scheme = schemes[w[i]] if has_windings else [None] * 3
+        return {
+            'film_thickness': round(float(t[i]), 2),
+            'prestretch': round(float(p[i]), 1),
+            'windings_top': _int_or_none(winding_scheme[0]),
+            'windings_middle': _int_or_none(winding_scheme[1]),
+            'windings_bottom': _int_or_none(winding_scheme[2]),
+            'film_consumption_per_pallet': round(float(per_pallet[i]), 1),
+            'total_material_consumption': round(float(consumption[i]), 1),
+            'annual_costs': round(float(costs[i]), 2),
+            'co2_emissions': round(float(emissions[i]), 1),
+            'material_savings': round(float(material_savings[i]), 1),
+            'cost_reduction': float(calculations.round_quintessenz(calculations.cost_reduction(material_savings[i], factors))),
+            'co2_reduction': round(float(material_savings[i]), 1),
+            'stability_increase': float(calculations.round_quintessenz(calculations.stability_increase(material_savings[i], factors))),
+            'holding_force': round(float(holding_force[i]), 1) if base_force else None,
+            'relative_holding_force': round(float(relative_force[i]), 3),
+            'meets_target': bool(feasible[i])
+        }
+
+    return {
+        'report_id': report.id,
+        'factor_version': factors.version,
+        'evaluated': int(len(t)),
+        'feasible': int(feasible.sum()),
+        'required_holding_force': round(required_force, 1) if required_force else None,
+        'baseline': {
+            'film_thickness': base_thickness,
+            'prestretch': base_prestretch,
+            'windings_top': report.windings_top,
+            'windings_middle': report.windings_middle,
+            'windings_bottom': report.windings_bottom,
+            'total_material_consumption': round(float(base_annual), 1),
+            'annual_costs': round(float(calculations.annual_costs(base_annual, report.roll_core_weight or 0, pallets, factors)), 2),
+            'co2_emissions': round(float(calculations.co2_emissions(base_annual, factors)), 1),
+            'holding_force': round(base_force, 1) if base_force else None
+        },
+        'pareto': [scenario(i) for i in front]
+    }
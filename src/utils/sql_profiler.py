@@ -0,0 +1,113 @@
+"""Optionaler SQL-Profiler pro Anfrage (``SQL_PROFILER=1``)
+
+- Zählt und misst alle Statements einer Anfrage; die Antwort erhält
+  ``X-SQL-Query-Count``, ``X-SQL-Query-Time`` (ms) und ``Server-Timing``.
+- N+1-Erkennung: Wird dieselbe Statement-Form (Parameter und IN-Listen
+  normalisiert) in einer Anfrage mindestens ``SQL_N_PLUS_ONE_THRESHOLD`` mal
+  ausgeführt, wird sie mit Anzahl und Dauer geloggt und im Header
+  ``X-SQL-N-Plus-One`` gezählt (typisch: Beziehungen, die in einer Schleife
+  einzeln nachgeladen werden).
+- Langsame Statements ab ``SQL_SLOW_QUERY_MS`` werden mit Parametern ins Log
+  ``haral.sql`` geschrieben, bei gesetztem ``SQL_SLOW_QUERY_LOG`` in diese Datei.
+"""
+import logging
+import re
+from flask import g, has_request_context, request
+from src.utils.db_profile import add_statement_listener
+
+logger = logging.getLogger('haral.sql')
+
+PLACEHOLDER = r'(?:\?|%\(\w+\)s|%s|\$\d+|:\w+)'
+PLACEHOLDER_LIST = re.compile(rf'{PLACEHOLDER}(?:\s*,\s*{PLACEHOLDER})+')
+WHITESPACE = re.compile(r'\s+')
+MAX_PARAMETER_LENGTH = 500
+
+def statement_shape(statement):
+    """Statement ohne Formatierungsunterschiede; IN-Listen unabhängig von ihrer Länge"""
+    shape = WHITESPACE.sub(' ', statement).strip()
+    return PLACEHOLDER_LIST.sub('?, ...', shape)
+
+def _format_parameters(parameters):
+    text = repr(parameters)
+    if len(text) > MAX_PARAMETER_LENGTH:
+        text = text[:MAX_PARAMETER_LENGTH] + '...'
+    return text
+
+class RequestProfile:
+    """Statements einer Anfrage, gruppiert nach Form"""
+    __slots__ = ('count', 'seconds', 'shapes')
+
+    def __init__(self):
+        self.count = 0
+        self.seconds = 0.0
+        self.shapes = {}  # Form -> [Anzahl, Sekunden]
+
+    def add(self, shape, seconds):
+        self.count += 1
+        self.seconds += seconds
+        entry = self.shapes.setdefault(shape, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+    def repeated(self, threshold):
+        """Formen, die mindestens ``threshold`` mal vorkamen (häufigste zuerst)"""
+        return sorted(
+            ((shape, count, seconds) for shape, (count, seconds) in self.shapes.items() if count >= threshold),
+            key=lambda item: -item[1]
+        )
+
+def _configure_log(path):
+    logger.setLevel(logging.INFO)
+    if path and not any(getattr(handler, 'baseFilename', None) == path for handler in logger.handlers):
+        handler = logging.FileHandler(path, encoding='utf-8')
+        handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(message)s'))
+        logger.addHandler(handler)
+
+def init_sql_profiler(app, db):
+    """Registriert Statement-Auswertung und Request-Hooks, falls ``SQL_PROFILER`` aktiv ist (im App-Kontext aufrufen)"""
+    if not app.config.get('SQL_PROFILER'):
+        return
+
+    slow_seconds = app.config.get('SQL_SLOW_QUERY_MS', 100) / 1000
+    threshold = max(2, app.config.get('SQL_N_PLUS_ONE_THRESHOLD', 5))
+    _configure_log(app.config.get('SQL_SLOW_QUERY_LOG'))
+
+    def record_statement(conn, timing):
+        shape = statement_shape(timing.statement)
+
+        endpoint = None
+        if has_request_context():
+            endpoint = request.endpoint
+            profile = g.get('sql_profile')
+            if profile is not None:
+                profile.add(shape, timing.seconds)
+
+        if timing.seconds >= slow_seconds:
+            logger.warning('Langsame Abfrage %.1f ms [%s]%s %s | Parameter: %s',
+                           timing.seconds * 1000, endpoint or '-', ' (executemany)' if timing.executemany else '',
+                           shape, _format_parameters(timing.parameters))
+
+    add_statement_listener(db, record_statement)
+
+    @app.before_request
+    def start_sql_profile():
+        g.sql_profile = RequestProfile()
+
+    @app.after_request
+    def add_sql_profile_headers(response):
+        profile = g.get('sql_profile')
+        if profile is None:
+            return response
+
+        milliseconds = profile.seconds * 1000
+        response.headers['X-SQL-Query-Count'] = str(profile.count)
+        response.headers['X-SQL-Query-Time'] = f'{milliseconds:.1f}'
+        response.headers.add('Server-Timing', f'db;desc="SQL ({profile.count})";dur={milliseconds:.1f}')
+
+        repeated = profile.repeated(threshold)
+        if repeated:
+            response.headers['X-SQL-N-Plus-One'] = str(len(repeated))
+            for shape, count, seconds in repeated:
+                logger.warning('Mögliches N+1 in %s %s: %d× (%.1f ms) %s',
+                               request.method, request.endpoint or request.path, count, seconds * 1000, shape)
+        return response
@@ -0,0 +1,146 @@
+"""Auslieferung der Single-Page-App aus einem beim Start erstellten Manifest
+
+Beim Start wird ``static/`` einmal durchsucht: welche Dateien es gibt, welche
+vorkomprimierten Varianten (``.br``/``.gz``) vorliegen und welche Dateien
+Hash-Namen aus dem Vite-Build tragen (``assets/index-<hash>.js``). ``index.html``
+wird im Speicher gehalten.
+
+- Hash-Dateien ändern sich nie und werden ein Jahr lang als ``immutable`` gecacht.
+- ``index.html`` wird immer revalidiert (ETag), damit ein neuer Build sofort greift.
+- SPA-Routen werden über das Manifest aufgelöst, ohne Dateisystemzugriff und
+  ohne Ausnahmen als Kontrollfluss. Unbekannte Pfade unter ``assets/`` und
+  ``api/`` liefern 404 statt ``index.html``.
+- ``prune_unreferenced`` entfernt alte Builds, die ``index.html`` nicht mehr
+  (direkt oder über andere Bundles) referenziert.
+"""
+import hashlib
+import os
+import re
+from flask import current_app, jsonify, request
+from werkzeug.security import safe_join
+from src.utils.compression import ENCODING_SUFFIXES, negotiate_encoding, send_static
+
+INDEX_FILE = 'index.html'
+ASSETS_DIR = 'assets/'
+# Zur Laufzeit beschriebene Verzeichnisse (Kundenlogos) stehen nicht im Manifest
+DYNAMIC_PREFIXES = ('uploads/',)
+NOT_FOUND_PREFIXES = (ASSETS_DIR, 'api/')
+
+HASHED_ASSET = re.compile(r'^assets/[^/]+-[A-Za-z0-9_-]{8}\.(?:js|mjs|css|map)$')
+ASSET_REFERENCE = re.compile(r'assets/[^\s"\'`()<>]+-[A-Za-z0-9_-]{8}\.(?:js|mjs|css|map)')
+
+IMMUTABLE_CACHE = 'public, max-age=31536000, immutable'
+DEFAULT_MAX_AGE = 3600
+INDEX_CACHE = 'no-cache'
+
+class StaticManifest:
+    """Dateien unter ``static/`` mit ihren vorkomprimierten Varianten"""
+
+    def __init__(self, static_folder):
+        self.static_folder = static_folder
+        self.files = {}
+        self.index = {}
+        self.index_etag = None
+        self.load()
+
+    def load(self):
+        files = {}
+        variant_suffixes = tuple(ENCODING_SUFFIXES.values())
+        for root, dirs, names in os.walk(self.static_folder):
+            relative_root = os.path.relpath(root, self.static_folder).replace(os.sep, '/')
+            prefix = '' if relative_root == '.' else relative_root + '/'
+            dirs[:] = [name for name in dirs if not (prefix + name + '/').startswith(DYNAMIC_PREFIXES)]
+            present = set(names)
+            for name in names:
+                if name.startswith('.') or name.endswith(variant_suffixes):
+                    continue
+                files[prefix + name] = tuple(
+                    encoding for encoding, suffix in ENCODING_SUFFIXES.items() if name + suffix in present
+                )
+        self.files = files
+
+        self.index = {}
+        self.index_etag = None
+        if INDEX_FILE in files:
+            for encoding in (None,) + files[INDEX_FILE]:
+                with open(os.path.join(self.static_folder, INDEX_FILE + ENCODING_SUFFIXES.get(encoding, '')), 'rb') as f:
+                    self.index[encoding] = f.read()
+            self.index_etag = hashlib.sha1(self.index[None]).hexdigest()
+
+    def is_hashed(self, path):
+        return HASHED_ASSET.match(path) is not None
+
+    def resolve(self, path):
+        """``'file'``, ``'dynamic'``, ``'index'`` oder None (404) für einen Anfragepfad"""
+        if path in self.files and path != INDEX_FILE:
+            return 'file'
+        if path.startswith(DYNAMIC_PREFIXES):
+            full_path = safe_join(self.static_folder, path)
+            return 'dynamic' if full_path and os.path.isfile(full_path) else None
+        if path.startswith(NOT_FOUND_PREFIXES):
+            return None
+        return 'index'
+
+    def index_response(self):
+        if not self.index:
+            return jsonify({'error': 'Frontend nicht gefunden'}), 404
+        encoding = negotiate_encoding([encoding for encoding in self.index if encoding]) if len(self.index) > 1 else None
+        response = current_app.response_class(self.index[encoding], mimetype='text/html')
+        if encoding:
+            response.headers['Content-Encoding'] = encoding
+        if len(self.index) > 1:
+            response.vary.add('Accept-Encoding')
+        response.set_etag(self.index_etag + (f'-{encoding}' if encoding else ''))
+        response.headers['Cache-Control'] = INDEX_CACHE
+        return response.make_conditional(request)
+
+    def serve(self, path):
+        """Antwort für einen beliebigen Pfad (Datei, SPA-Route oder 404)"""
+        kind = self.resolve(path)
+        if kind == 'index':
+            return self.index_response()
+        if kind is None:
+            return jsonify({'error': 'Nicht gefunden'}), 404
+        if kind == 'dynamic':
+            return send_static(self.static_folder, path, max_age=DEFAULT_MAX_AGE)
+
+        hashed = self.is_hashed(path)
+        response = send_static(
+            self.static_folder, path, encodings=self.files[path],
+            max_age=None if hashed else DEFAULT_MAX_AGE
+        )
+        if hashed:
+            response.headers['Cache-Control'] = IMMUTABLE_CACHE
+        return response
+
+    def referenced_assets(self):
+        """Hash-Dateien, die ``index.html`` direkt oder über andere Bundles referenziert"""
+        if None not in self.index:
+            return set()
+        referenced = set()
+        pending = [self.index[None].decode('utf-8', 'replace')]
+        while pending:
+            for path in ASSET_REFERENCE.findall(pending.pop()):
+                if path in self.files and path not in referenced:
+                    referenced.add(path)
+                    with open(os.path.join(self.static_folder, path), 'rb') as f:
+                        pending.append(f.read().decode('utf-8', 'replace'))
+        return referenced
+
+    def unreferenced_assets(self):
+        referenced = self.referenced_assets()
+        return sorted(path for path in self.files if self.is_hashed(path) and path not in referenced)
+
+    def prune_unreferenced(self, dry_run=False):
+        """Löscht nicht mehr referenzierte Hash-Dateien samt ``.br``/``.gz``; gibt die Pfade zurück"""
+        if not self.index:
+            raise ValueError(f'{INDEX_FILE} fehlt - es wird nichts gelöscht')
+        removed = self.unreferenced_assets()
+        if not dry_run:
+            for path in removed:
+                for suffix in ('',) + tuple(ENCODING_SUFFIXES[encoding] for encoding in self.files[path]):
+                    full_path = os.path.join(self.static_folder, path + suffix)
+                    if os.path.exists(full_path):
+                        os.remove(full_path)
+            self.load()
+        return removed
@@ -0,0 +1,357 @@
+"""Request-Tracing mit Spans über Route, SQL, Berechnungen, Serialisierung und PDF
+
+Jede Anfrage erhält eine Request-ID (eingehender ``X-Request-ID``-Header oder
+neu erzeugt), die in der Antwort zurückgegeben wird. Ein Anteil von
+``TRACE_SAMPLE_RATE`` (0 bis 1) der Anfragen wird aufgezeichnet; Anfragen mit
+einem W3C-``traceparent``-Header, dessen Sampled-Flag gesetzt ist, immer. Für
+aufgezeichnete Anfragen entstehen Spans für
+
+- die Anfrage selbst (Route, Methode, Status, Request-ID),
+- jedes SQL-Statement (``sql``),
+- mit ``@traced`` markierte Funktionen (``update_calculations``, die
+  ``build_*``-Kapitel der PDF-Erstellung) und ``span()``-Blöcke
+  (``to_dict``-Serialisierung, ``doc.build``).
+
+Nicht aufgezeichnete Anfragen kosten pro Span nur einen ContextVar-Zugriff.
+Beendete Traces werden als JSON-Zeilen nach ``TRACE_EXPORT_FILE`` geschrieben
+und/oder gesammelt per OTLP/HTTP (JSON) an ``TRACE_OTLP_ENDPOINT`` gesendet
+(z. B. ``http://localhost:4318`` für einen OpenTelemetry Collector oder Jaeger).
+Ohne Exporter ist das Tracing aus; die Request-ID wird trotzdem vergeben.
+"""
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from flask import g, request
+from src.utils.db_profile import add_statement_listener
+from src.utils.sql_profiler import statement_shape
+
+logger = logging.getLogger('haral.tracing')
+
+DEFAULT_SERVICE_NAME = 'haral-pruefbericht-generator'
+OTLP_BATCH_SIZE = 512
+OTLP_FLUSH_INTERVAL = 2  # Sekunden
+OTLP_QUEUE_SIZE = 10000
+MAX_STATEMENT_LENGTH = 2000
+
+TRACEPARENT = re.compile(r'^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$')
+REQUEST_ID = re.compile(r'^[\w.:-]{1,128}$')
+
+_current_span = ContextVar('haral_current_span', default=None)
+_exporters = []
+
+class Span:
+    """Ein Abschnitt eines Traces; Zeiten in Nanosekunden seit Epoche"""
+    __slots__ = ('trace', 'span_id', 'parent_id', 'name', 'kind', 'start', 'end', 'attributes', 'error')
+
+    def __init__(self, trace, name, parent_id=None, kind='internal', attributes=None):
+        self.trace = trace
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start = time.time_ns()
+        self.end = None
+        self.attributes = attributes or {}
+        self.error = None
+
+    @property
+    def trace_id(self):
+        return self.trace.trace_id
+
+    def set(self, key, value):
+        self.attributes[key] = value
+
+    def finish(self, error=None):
+        self.end = time.time_ns()
+        if error is not None:
+            self.error = f'{type(error).__name__}: {error}'
+        self.trace.spans.append(self)
+
+    def traceparent(self):
+        return f'00-{self.trace_id}-{self.span_id}-01'
+
+    def to_dict(self):
+        return {
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'request_id': self.trace.request_id,
+            'name': self.name,
+            'kind': self.kind,
+            'start': self.start,
+            'duration_ms': round((self.end - self.start) / 1e6, 3),
+            'attributes': self.attributes,
+            'error': self.error
+        }
+
+class Trace:
+    """Gesammelte Spans eines Traces in diesem Prozess"""
+    __slots__ = ('trace_id', 'request_id', 'spans')
+
+    def __init__(self, trace_id=None, request_id=None):
+        self.trace_id = trace_id or os.urandom(16).hex()
+        self.request_id = request_id
+        self.spans = []
+
+def parse_traceparent(value):
+    """(trace_id, parent_span_id, sampled) aus einem W3C-traceparent oder None"""
+    match = TRACEPARENT.match((value or '').strip().lower())
+    if not match or match.group(1) == '0' * 32 or match.group(2) == '0' * 16:
+        return None
+    return match.group(1), match.group(2), int(match.group(3), 16) & 1 == 1
+
+def current_span():
+    return _current_span.get()
+
+def current_traceparent():
+    """traceparent des aktiven Spans zur Weitergabe an andere Prozesse (oder None)"""
+    active = _current_span.get()
+    return active.traceparent() if active is not None else None
+
+@contextmanager
+def span(name, **attributes):
+    """Kind-Span des aktiven Spans; ohne aktiven Trace ein No-op (liefert None)"""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    child = Span(parent.trace, name, parent.span_id, attributes=attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as e:
+        child.finish(e)
+        raise
+    else:
+        child.finish()
+    finally:
+        _current_span.reset(token)
+
+def traced(name=None):
+    """Decorator: Aufruf als Span aufzeichnen, wenn die Anfrage gesampelt ist"""
+    def decorator(function):
+        span_name = name or function.__name__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if _current_span.get() is None:
+                return function(*args, **kwargs)
+            with span(span_name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+@contextmanager
+def continue_trace(traceparent, name, request_id=None, **attributes):
+    """Trace in einem anderen Thread oder Prozess fortsetzen (z. B. PDF-Erstellung im Render-Pool)"""
+    parent = parse_traceparent(traceparent) if _exporters else None
+    if parent is None or not parent[2]:
+        yield None
+        return
+    trace = Trace(parent[0], request_id)
+    root = Span(trace, name, parent[1], attributes=attributes)
+    token = _current_span.set(root)
+    try:
+        yield root
+    except BaseException as e:
+        root.finish(e)
+        raise
+    else:
+        root.finish()
+    finally:
+        _current_span.reset(token)
+        export(trace)
+
+def export(trace):
+    for exporter in _exporters:
+        try:
+            exporter.export(trace.spans)
+        except Exception:
+            logger.exception('Trace %s konnte nicht exportiert werden', trace.trace_id)
+
+class JsonLinesExporter:
+    """Ein JSON-Objekt pro Span und Zeile; ein Trace wird mit einem Schreibaufruf angehängt"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def export(self, spans):
+        lines = ''.join(json.dumps(s.to_dict(), ensure_ascii=False, default=str) + '\n' for s in spans)
+        with self._lock, open(self.path, 'a', encoding='utf-8') as f:
+            f.write(lines)
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+def _otlp_attributes(attributes):
+    return [{'key': key, 'value': _otlp_value(value)} for key, value in attributes.items() if value is not None]
+
+class OtlpHttpExporter:
+    """Sendet Spans gesammelt im Hintergrund als OTLP/JSON an ``<endpoint>/v1/traces``
+
+    Ist die Warteschlange voll oder der Collector nicht erreichbar, werden
+    Spans verworfen statt die Anfragen zu bremsen.
+    """
+    KINDS = {'internal': 1, 'server': 2, 'client': 3}
+
+    def __init__(self, endpoint, service_name=DEFAULT_SERVICE_NAME):
+        endpoint = endpoint.rstrip('/')
+        self.url = endpoint if endpoint.endswith('/v1/traces') else endpoint + '/v1/traces'
+        self.service_name = service_name
+        self._lock = threading.Lock()
+        self._pid = None
+        self._queue = None
+
+    def _ensure_worker(self):
+        # Nach einem Fork (Gunicorn-Worker) braucht jeder Prozess einen eigenen Thread
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid != os.getpid():
+                self._queue = queue.Queue(maxsize=OTLP_QUEUE_SIZE)
+                threading.Thread(target=self._run, args=(self._queue,), name='otlp-exporter', daemon=True).start()
+                self._pid = os.getpid()
+
+    def export(self, spans):
+        self._ensure_worker()
+        for s in spans:
+            try:
+                self._queue.put_nowait(s)
+            except queue.Full:
+                return
+
+    def _run(self, spans_queue):
+        while True:
+            batch = [spans_queue.get()]
+            deadline = time.monotonic() + OTLP_FLUSH_INTERVAL
+            while len(batch) < OTLP_BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(spans_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._send(batch)
+            except Exception as e:
+                logger.warning('OTLP-Export an %s fehlgeschlagen (%d Spans verworfen): %s', self.url, len(batch), e)
+
+    def _send(self, spans):
+        body = {'resourceSpans': [{
+            'resource': {'attributes': _otlp_attributes({'service.name': self.service_name})},
+            'scopeSpans': [{
+                'scope': {'name': 'haral.tracing'},
+                'spans': [{
+                    'traceId': s.trace_id,
+                    'spanId': s.span_id,
+                    'parentSpanId': s.parent_id or '',
+                    'name': s.name,
+                    'kind': self.KINDS.get(s.kind, 1),
+                    'startTimeUnixNano': str(s.start),
+                    'endTimeUnixNano': str(s.end),
+                    'attributes': _otlp_attributes(dict(s.attributes, **{'request.id': s.trace.request_id})),
+                    'status': {'code': 2, 'message': s.error} if s.error else {}
+                } for s in spans]
+            }]
+        }]}
+        http_request = urllib.request.Request(
+            self.url, data=json.dumps(body, default=str).encode('utf-8'),
+            headers={'Content-Type': 'application/json'}, method='POST'
+        )
+        with urllib.request.urlopen(http_request, timeout=10) as response:
+            response.read()
+
+def _record_statement(conn, timing):
+    parent = _current_span.get()
+    if parent is None:
+        return
+    sql = Span(parent.trace, 'sql', parent.span_id, kind='client', attributes={
+        'db.system': conn.dialect.name,
+        'db.statement': statement_shape(timing.statement)[:MAX_STATEMENT_LENGTH],
+        'db.executemany': timing.executemany
+    })
+    if timing.rowcount is not None:
+        sql.set('db.rowcount', timing.rowcount)
+    sql.finish(timing.error)
+    # Gemessen hat der gemeinsame Engine-Hook; der Span übernimmt dessen Dauer
+    sql.start = sql.end - int(timing.seconds * 1e9)
+
+def _request_id():
+    incoming = request.headers.get('X-Request-ID', '')
+    return incoming if REQUEST_ID.match(incoming) else uuid.uuid4().hex
+
+def init_tracing(app, db):
+    """Request-ID, Sampling und Exporter einrichten (im App-Kontext aufrufen)"""
+    _exporters.clear()
+    if app.config.get('TRACE_EXPORT_FILE'):
+        _exporters.append(JsonLinesExporter(app.config['TRACE_EXPORT_FILE']))
+    if app.config.get('TRACE_OTLP_ENDPOINT'):
+        _exporters.append(OtlpHttpExporter(
+            app.config['TRACE_OTLP_ENDPOINT'], app.config.get('TRACE_SERVICE_NAME') or DEFAULT_SERVICE_NAME
+        ))
+    sample_rate = min(1.0, max(0.0, app.config.get('TRACE_SAMPLE_RATE', 0.0)))
+
+    if _exporters:
+        add_statement_listener(db, _record_statement)
+
+    @app.before_request
+    def start_request_trace():
+        g.request_id = _request_id()
+        if not _exporters:
+            return
+
+        parent = parse_traceparent(request.headers.get('traceparent'))
+        sampled = parent[2] if parent else random.random() < sample_rate
+        if not sampled:
+            return
+        trace = Trace(parent[0] if parent else None, g.request_id)
+        root = Span(trace, f'{request.method} {request.url_rule.rule if request.url_rule else request.path}',
+                    parent[1] if parent else None, kind='server', attributes={
+                        'http.method': request.method,
+                        'http.route': request.url_rule.rule if request.url_rule else None,
+                        'http.target': request.full_path.rstrip('?'),
+                        'flask.endpoint': request.endpoint
+                    })
+        g.trace_span = root
+        g.trace_token = _current_span.set(root)
+
+    @app.after_request
+    def add_trace_headers(response):
+        request_id = g.get('request_id')
+        if request_id:
+            response.headers['X-Request-ID'] = request_id
+        root = g.get('trace_span')
+        if root is not None:
+            root.set('http.status_code', response.status_code)
+            response.headers['traceparent'] = root.traceparent()
+        return response
+
+    @app.teardown_request
+    def finish_request_trace(exc):
+        root = g.pop('trace_span', None)
+        if root is None:
+            return
+        root.finish(exc)
+        try:
+            _current_span.reset(g.pop('trace_token'))
+        except ValueError:  # Teardown in einem anderen Kontext als before_request
+            _current_span.set(None)
+        export(root.trace)
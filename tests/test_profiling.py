@@ -0,0 +1,53 @@
+"""Profiling endpoints: replaying a request must not leak into the outer request"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+prometheus_client = pytest.importorskip('prometheus_client')
+
+@pytest.fixture(scope='module')
+def app(tmp_path_factory):
+    os.environ['DATABASE_URL'] = f"sqlite:///{tmp_path_factory.mktemp('db') / 'test.db'}"
+    os.environ.pop('PROMETHEUS_MULTIPROC_DIR', None)
+    from src.main import app, create_default_users
+    from src import db
+    with app.app_context():
+        db.create_all()
+        create_default_users()
+    return app
+
+@pytest.fixture
+def client(app):
+    client = app.test_client()
+    response = client.post('/api/auth/login', json={'username': 'admin', 'password': 'admin123'})
+    assert response.status_code == 200
+    return client
+
+def in_progress(endpoint):
+    return prometheus_client.REGISTRY.get_sample_value('http_requests_in_progress', {'endpoint': endpoint})
+
+def latency_count(endpoint):
+    return prometheus_client.REGISTRY.get_sample_value(
+        'http_request_duration_seconds_count', {'endpoint': endpoint, 'method': 'POST', 'status': '200'}
+    ) or 0
+
+def test_profile_request_keeps_outer_request_metrics(client):
+    observed = latency_count('profiling.profile_request')
+
+    response = client.post('/api/profiling/request', json={'method': 'GET', 'path': '/api/api/reports'})
+
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 200
+    assert in_progress('profiling.profile_request') == 0
+    assert in_progress('report.get_reports') == 0
+    assert latency_count('profiling.profile_request') == observed + 1
+
+def test_profile_request_keeps_outer_request_id(client):
+    response = client.post('/api/profiling/request', json={'method': 'GET', 'path': '/api/customers'},
+                           headers={'X-Request-ID': 'outer-request'})
+
+    assert response.status_code == 200
+    assert response.headers['X-Request-ID'] == 'outer-request'